@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.db_router.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -73,6 +74,15 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "backend.wsgi.application"
 
+# Served by an ASGI server (e.g. `uvicorn backend.asgi:application`) the
+# async composite endpoints under /api/async/ run their queries concurrently.
+ASGI_APPLICATION = "backend.asgi.application"
+
+# Broadcaster behind the /api/events/ change stream (see core/events.py).
+# The in-process one only reaches tills on the same worker process, so
+# run the ASGI server with a single worker while it is in use.
+GROCER_EVENT_BROKER = "core.events.InProcessBroadcaster"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -81,9 +91,25 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+    },
+    # Example read replica backed by a local SQLite copy. Refresh it with
+    # `python manage.py sync_replicas` and list it in DATABASE_REPLICAS.
+    # "replica1": {
+    #     "ENGINE": "django.db.backends.sqlite3",
+    #     "NAME": BASE_DIR / "db-replica1.sqlite3",
+    #     "TEST": {"MIRROR": "default"},
+    # },
 }
 
+# Safe (GET/HEAD) API reads are spread over these aliases; see core/db_router.py.
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ["core.db_router.ReplicaRouter"]
+
+# After a write, a client only reads from replicas synced since that write.
+# This is how long its write-time cookie lasts: an upper bound for replicas
+# that stop syncing, not how long it normally waits.
+REPLICA_PIN_SECONDS = 24 * 60 * 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -119,7 +145,14 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
-STATIC_URL = "static/"
+# "/static/" belongs to the React build (see FRONTEND_BUILD_DIR), so
+# Django's own static files (admin, DRF) live under a different prefix.
+STATIC_URL = "django-static/"
+
+# The React production build (`npm run build` in frontend/), served by
+# core.views.frontend. Run `python manage.py compress_frontend` after each
+# build to add the .br/.gz variants.
+FRONTEND_BUILD_DIR = BASE_DIR.parent / "frontend" / "build"
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -1,9 +1,14 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
+
+from core.views import frontend
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     # This line is crucial. It tells Django that any URL starting with "api/"
     # should be handled by the urls.py file inside our "core" app.
     path('api/', include('core.urls')),
-]
\ No newline at end of file
+    # Everything else is the React app: built files, or index.html so
+    # client-side routes like /customers/5 work on reload.
+    re_path(r'^(?!(api|admin)(/|$))(?P<path>.*)$', frontend),
+]
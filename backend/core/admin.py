@@ -1,11 +1,112 @@
 # core/admin.py
 
 from django.contrib import admin
-from .models import Product, ProductVariant, Customer, CreditSale, CreditSaleItem, Payment
+from .allocation import rebuild_customer, refresh_sale_total
+from .events import balance_changed
+from .models import (
+    Product, ProductVariant, Customer, CreditSale, CreditSaleItem, Payment, Job,
+    record_stock_adjustment,
+)
+
+
+def _resettle_customers(customer_ids):
+    """Replays allocations after an admin edit, as the API write paths do."""
+    for customer_id in customer_ids:
+        rebuild_customer(customer_id)
+        balance_changed(customer_id)
+
+
+def _resettle_sales(sale_ids):
+    sales = list(CreditSale.objects.filter(pk__in=sale_ids))
+    for sale in sales:
+        refresh_sale_total(sale)
+    _resettle_customers({sale.customer_id for sale in sales})
+
+
+class ProductVariantAdmin(admin.ModelAdmin):
+    def save_model(self, request, obj, form, change):
+        # Same bookkeeping as the variants API: hand-entered stock is a baseline
+        old_stock = form.initial.get('current_stock', 0) if change else 0
+        super().save_model(request, obj, form, change)
+        record_stock_adjustment(obj.pk, obj.current_stock - old_stock)
+
+
+class CreditSaleItemInline(admin.TabularInline):
+    model = CreditSaleItem
+    extra = 0
+
+
+class CreditSaleAdmin(admin.ModelAdmin):
+    # Totals and settlement follow from the items and payments
+    readonly_fields = ['total_amount', 'amount_due', 'settled']
+    inlines = [CreditSaleItemInline]
+
+    def save_related(self, request, form, formsets, change):
+        # Runs after the inline items are saved, so the total sees them
+        super().save_related(request, form, formsets, change)
+        sale = form.instance
+        refresh_sale_total(sale)
+        customer_ids = {sale.customer_id}
+        if change:
+            customer_ids.add(form.initial['customer'])
+        _resettle_customers(customer_ids)
+
+    def delete_model(self, request, obj):
+        customer_id = obj.customer_id
+        super().delete_model(request, obj)
+        _resettle_customers({customer_id})
+
+    def delete_queryset(self, request, queryset):
+        customer_ids = set(queryset.values_list('customer_id', flat=True))
+        super().delete_queryset(request, queryset)
+        _resettle_customers(customer_ids)
+
+
+class CreditSaleItemAdmin(admin.ModelAdmin):
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        sale_ids = {obj.sale_id}
+        if change:
+            sale_ids.add(form.initial['sale'])
+        _resettle_sales(sale_ids)
+
+    def delete_model(self, request, obj):
+        sale_id = obj.sale_id
+        super().delete_model(request, obj)
+        _resettle_sales({sale_id})
+
+    def delete_queryset(self, request, queryset):
+        sale_ids = set(queryset.values_list('sale_id', flat=True))
+        super().delete_queryset(request, queryset)
+        _resettle_sales(sale_ids)
+
+
+class PaymentAdmin(admin.ModelAdmin):
+    readonly_fields = ['unallocated']
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        customer_ids = {obj.customer_id}
+        if change:
+            customer_ids.add(form.initial['customer'])
+        _resettle_customers(customer_ids)
+
+    def delete_model(self, request, obj):
+        customer_id = obj.customer_id
+        super().delete_model(request, obj)
+        _resettle_customers({customer_id})
+
+    def delete_queryset(self, request, queryset):
+        customer_ids = set(queryset.values_list('customer_id', flat=True))
+        super().delete_queryset(request, queryset)
+        _resettle_customers(customer_ids)
+
 
 admin.site.register(Product)
-admin.site.register(ProductVariant)
+admin.site.register(ProductVariant, ProductVariantAdmin)
 admin.site.register(Customer)
-admin.site.register(CreditSale)
-admin.site.register(CreditSaleItem)
-admin.site.register(Payment)
\ No newline at end of file
+admin.site.register(CreditSale, CreditSaleAdmin)
+admin.site.register(CreditSaleItem, CreditSaleItemAdmin)
+admin.site.register(Payment, PaymentAdmin)
+# PaymentAllocation rows are derived from sales and payments; not edited by hand
+admin.site.register(Job)
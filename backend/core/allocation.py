@@ -0,0 +1,120 @@
+# core/allocation.py
+"""
+Links payments to the credit sales they pay off (oldest sale first).
+
+Every CreditSale stores its ``total_amount``, the ``amount_due`` still
+unpaid and a ``settled`` flag; every Payment stores the ``unallocated``
+part not yet applied to a sale. ``allocate_customer`` only looks at open
+sales and payments with credit left, so the normal sale/payment paths cost
+work proportional to what is still open, not to the customer's history.
+Edits and deletions fall back to ``rebuild_customer``, which replays the
+customer's history from scratch.
+
+Archived sales are always fully settled, so a customer's archived opening
+balance is exactly the part of their live payments that went to archived
+sales; the replay consumes it first.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import transaction
+
+from .models import CreditSale, CustomerOpeningBalance, Payment, PaymentAllocation
+
+CENTS = Decimal('0.01')
+
+
+def line_amount(quantity, price):
+    return (quantity * price).quantize(CENTS, rounding=ROUND_HALF_UP)
+
+
+def sale_total(sale):
+    """Total of a sale's items, rounded to paise."""
+    return sum(
+        (line_amount(item.quantity, item.price_at_sale) for item in sale.items.all()),
+        Decimal('0.00')
+    )
+
+
+def refresh_sale_total(sale):
+    """Stores a freshly (re)built sale's total; allocations are reset by the caller."""
+    sale.total_amount = sale_total(sale)
+    sale.amount_due = sale.total_amount
+    sale.settled = sale.amount_due <= 0
+    sale.save(update_fields=['total_amount', 'amount_due', 'settled'])
+
+
+def _match(sales, payments):
+    """
+    FIFO-matches open ``sales`` against ``payments`` with credit (both in
+    date order), updating them in place. Returns the new allocations.
+    """
+    allocations = []
+    payments = iter(payments)
+    payment = next(payments, None)
+    for sale in sales:
+        while sale.amount_due > 0 and payment is not None:
+            amount = min(sale.amount_due, payment.unallocated)
+            sale.amount_due -= amount
+            payment.unallocated -= amount
+            allocations.append(PaymentAllocation(sale=sale, payment=payment, amount=amount))
+            if payment.unallocated <= 0:
+                payment = next(payments, None)
+        sale.settled = sale.amount_due <= 0
+    return allocations
+
+
+@transaction.atomic
+def allocate_customer(customer_id):
+    """Applies any unallocated payment credit to the customer's open sales."""
+    payments = list(
+        Payment.objects.select_for_update()
+        .filter(customer_id=customer_id, unallocated__gt=0)
+        .order_by('payment_date', 'id')
+    )
+    if not payments:
+        return
+    sales = list(
+        CreditSale.objects.select_for_update()
+        .filter(customer_id=customer_id, settled=False)
+        .order_by('sale_date', 'id')
+    )
+    allocations = _match(sales, payments)
+    PaymentAllocation.objects.bulk_create(allocations)
+    CreditSale.objects.bulk_update(sales, ['amount_due', 'settled'])
+    Payment.objects.bulk_update(payments, ['unallocated'])
+
+
+@transaction.atomic
+def rebuild_customer(customer_id):
+    """Drops and replays every allocation for one customer."""
+    PaymentAllocation.objects.filter(payment__customer_id=customer_id).delete()
+    PaymentAllocation.objects.filter(sale__customer_id=customer_id).delete()
+    sales = list(
+        CreditSale.objects.select_for_update()
+        .filter(customer_id=customer_id)
+        .order_by('sale_date', 'id')
+    )
+    payments = list(
+        Payment.objects.select_for_update()
+        .filter(customer_id=customer_id)
+        .order_by('payment_date', 'id')
+    )
+    for sale in sales:
+        sale.amount_due = sale.total_amount
+    for payment in payments:
+        payment.unallocated = payment.amount
+
+    opening = CustomerOpeningBalance.objects.filter(customer_id=customer_id).first()
+    carried = opening.balance if opening else Decimal('0.00')
+    for payment in payments:
+        if carried <= 0:
+            break
+        used = min(carried, payment.unallocated)
+        payment.unallocated -= used
+        carried -= used
+
+    allocations = _match(sales, (p for p in payments if p.unallocated > 0))
+    PaymentAllocation.objects.bulk_create(allocations)
+    CreditSale.objects.bulk_update(sales, ['amount_due', 'settled'])
+    Payment.objects.bulk_update(payments, ['unallocated'])
@@ -0,0 +1,180 @@
+# core/db_router.py
+"""
+Sends read-only API traffic for the ``core`` app to read replicas.
+
+``ReplicaRoutingMiddleware`` marks a request as replica-safe when it uses a
+safe HTTP method; views can mark other read-only requests with
+``read_only_request``. Anything else (writes, management commands, admin,
+sessions) stays on ``default``.
+
+Read-your-writes: after a write the client gets a cookie holding the time
+of the write, and `manage.py sync_replicas` records when each replica was
+last refreshed (``mark_synced``). A client's reads only go to replicas
+whose last refresh started after its latest write, and to the primary
+until one has, so a till never reads a replica that is missing its own
+sale or payment.
+"""
+
+import contextvars
+import os
+import random
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+PRIMARY = 'default'
+PIN_COOKIE = 'grocer_read_primary'
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+PRIMARY_ONLY_PREFIXES = ('/admin/',)
+
+# How long a replica's recorded sync time is cached in this process.
+SYNC_TIME_CACHE_SECONDS = 1
+
+_read_from_replica = contextvars.ContextVar('read_from_replica', default=False)
+# Time of the client's latest write (from PIN_COOKIE), 0 if none.
+_written_at = contextvars.ContextVar('written_at', default=0.0)
+_sync_times = {}
+
+
+def _sync_marker(alias):
+    return f"{settings.DATABASES[alias]['NAME']}.synced"
+
+
+def mark_synced(alias, when):
+    """Records that replica ``alias`` holds every write made before ``when``."""
+    marker = _sync_marker(alias)
+    with open(f"{marker}.tmp", 'w') as f:
+        f.write(repr(when))
+    os.replace(f"{marker}.tmp", marker)
+    _sync_times.pop(alias, None)
+
+
+def synced_at(alias):
+    """When replica ``alias`` was last synced (0 if never), cached briefly."""
+    now = time.monotonic()
+    checked, value = _sync_times.get(alias, (None, 0.0))
+    if checked is None or now - checked > SYNC_TIME_CACHE_SECONDS:
+        try:
+            with open(_sync_marker(alias)) as f:
+                value = float(f.read())
+        except (OSError, ValueError):
+            value = 0.0
+        _sync_times[alias] = (now, value)
+    return value
+
+
+@contextmanager
+def use_primary():
+    """Forces reads in the enclosed block onto the primary database."""
+    token = _read_from_replica.set(False)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+@contextmanager
+def read_only_request(request):
+    """
+    Treats the enclosed part of an unsafe-method request as read-only, e.g.
+    a POST to the batch endpoint that only carries GETs: its reads may use
+    a replica that has the client's writes, and it does not pin the client.
+    """
+    request.replica_read_only = True
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+class ReplicaRouter:
+    route_app_labels = {'core'}
+
+    def db_for_read(self, model, **hints):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if replicas and _read_from_replica.get() and model._meta.app_label in self.route_app_labels:
+            written_at = _written_at.get()
+            fresh = [alias for alias in replicas if synced_at(alias) > written_at]
+            if fresh:
+                return random.choice(fresh)
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        # Anything read after a write in the same request must see it.
+        _read_from_replica.set(False)
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas are copies of the primary and are never migrated directly.
+        return db == PRIMARY
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self._enter(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self._exit(tokens)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        tokens = self._enter(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            self._exit(tokens)
+        return self._pin(request, response)
+
+    def _enter(self, request):
+        return (
+            _read_from_replica.set(self._read_only(request)),
+            _written_at.set(self._last_write(request)),
+        )
+
+    def _exit(self, tokens):
+        _read_from_replica.reset(tokens[0])
+        _written_at.reset(tokens[1])
+
+    def _last_write(self, request):
+        value = request.COOKIES.get(PIN_COOKIE)
+        if value is None:
+            return 0.0
+        try:
+            return float(value)
+        except ValueError:
+            return time.time()  # unreadable: assume the write was just now
+
+    def _read_only(self, request):
+        return (
+            request.method in SAFE_METHODS
+            # Admin pages edit what they show; keep them on the primary.
+            and not request.path_info.startswith(PRIMARY_ONLY_PREFIXES)
+        )
+
+    def _pin(self, request, response):
+        if request.method not in SAFE_METHODS and not getattr(request, 'replica_read_only', False):
+            # Taken after the view returned, i.e. after its transaction committed
+            response.set_cookie(
+                PIN_COOKIE, repr(time.time()),
+                max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 24 * 60 * 60),
+                httponly=True, samesite='Lax',
+            )
+        return response
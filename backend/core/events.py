@@ -0,0 +1,104 @@
+# core/events.py
+"""
+Change events pushed to connected tills over server-sent events.
+
+Write paths call ``publish_on_commit(...)``; the event reaches the
+broadcaster only once the surrounding transaction commits. The broadcaster
+class is configurable through ``settings.GROCER_EVENT_BROKER`` so the
+in-process one can be swapped for another implementation (e.g. a local
+stand-in broker shared by several worker processes) without touching the
+write paths or the stream view.
+"""
+
+import asyncio
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+class InProcessBroadcaster:
+    """
+    Fans events out to every subscriber in this process.
+
+    Only tills connected to the same process see an event, so this
+    broadcaster needs the server to run a single worker process (e.g.
+    ``uvicorn backend.asgi:application --workers 1``). With more workers,
+    configure a broker shared between them in GROCER_EVENT_BROKER.
+
+    Each subscriber owns a bounded asyncio queue on its own event loop;
+    ``publish`` may be called from any thread. A subscriber that falls
+    too far behind simply drops events and will resync on its next fetch.
+    """
+    queue_size = 256
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+            except RuntimeError:
+                # The subscriber's loop has already shut down.
+                self._discard((loop, queue))
+
+    @staticmethod
+    def _offer(queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+
+    def _discard(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    async def subscribe(self):
+        """Async iterator yielding events published after subscribing."""
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(maxsize=self.queue_size))
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            while True:
+                yield await subscriber[1].get()
+        finally:
+            self._discard(subscriber)
+
+
+_broadcaster = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster():
+    global _broadcaster
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                path = getattr(settings, 'GROCER_EVENT_BROKER', 'core.events.InProcessBroadcaster')
+                _broadcaster = import_string(path)()
+    return _broadcaster
+
+
+def publish_on_commit(event_type, **fields):
+    """Queues a compact ``{"type": ..., **fields}`` event for after commit."""
+    event = {'type': event_type, **fields}
+    transaction.on_commit(lambda: get_broadcaster().publish(event))
+
+
+# ----------------------------------------------------------------------
+# Event helpers used by the write paths
+# ----------------------------------------------------------------------
+
+def stock_changed(variant):
+    # Decimals go out as strings, like the money and quantity fields of the API
+    publish_on_commit('stock', variant=variant.pk, stock=str(variant.current_stock))
+
+
+def balance_changed(customer_id):
+    from .models import customer_balance
+    publish_on_commit('balance', customer=customer_id, balance=str(customer_balance(customer_id)))
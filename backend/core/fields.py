@@ -0,0 +1,60 @@
+# core/fields.py
+"""
+Fixed-point model fields: a ``Decimal`` in Python, a scaled integer in the
+database. Money is stored in paise and quantities in thousandths of a unit,
+so SQL sums are exact integer arithmetic.
+
+Expressions that combine these fields (``F('a') - F('b')``, ``Coalesce``)
+must be given ``output_field=MoneyField()`` / ``QuantityField()`` so the
+result is scaled back on the way out.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import models
+
+
+class FixedPointField(models.BigIntegerField):
+    decimal_places = 0
+
+    @property
+    def quantum(self):
+        return Decimal(1).scaleb(-self.decimal_places)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, Decimal):
+            return value
+        try:
+            return Decimal(str(value)).quantize(self.quantum, rounding=ROUND_HALF_UP)
+        except InvalidOperation:
+            raise ValidationError(f"'{value}' is not a number.", code='invalid')
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return Decimal(int(value)).scaleb(-self.decimal_places)
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        value = self.to_python(value)
+        return int(value.scaleb(self.decimal_places).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{
+            'form_class': forms.DecimalField,
+            'decimal_places': self.decimal_places,
+            **kwargs,
+        })
+
+
+class MoneyField(FixedPointField):
+    """Rupees with 2 decimal places, stored as integer paise."""
+    decimal_places = 2
+
+
+class QuantityField(FixedPointField):
+    """Stock quantities with 3 decimal places, stored as integer milli-units."""
+    decimal_places = 3
@@ -0,0 +1,157 @@
+# core/jobs.py
+"""
+Database-backed background jobs, run by `manage.py run_worker`.
+
+Register a handler with ``@job('name')`` and queue work with
+``enqueue('name', {...})``. A handler receives the job's payload dict and
+returns a JSON-serialisable result. Failed jobs are retried with
+exponential backoff until ``max_attempts`` is reached.
+"""
+
+import traceback
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Customer, Job
+
+REGISTRY = {}
+
+RETRY_BASE_SECONDS = 10
+# Workers refresh the heartbeat of their running jobs this often; a running
+# job whose heartbeat is older than STALE_AFTER belongs to a worker that
+# died, and is queued again. Long jobs are safe as long as their worker lives.
+HEARTBEAT_SECONDS = 30
+STALE_AFTER = timedelta(minutes=5)
+
+
+def job(kind):
+    def register(func):
+        REGISTRY[kind] = func
+        return func
+    return register
+
+
+def enqueue(kind, payload=None, priority=0, max_attempts=3):
+    if kind not in REGISTRY:
+        raise ValueError(f"Unknown job kind: {kind}")
+    return Job.objects.create(
+        kind=kind, payload=payload or {}, priority=priority, max_attempts=max_attempts
+    )
+
+
+def claim_next(worker_id):
+    """
+    Atomically takes the highest-priority due job. The conditional UPDATE
+    makes the claim safe between workers without row locks (SQLite has none).
+    """
+    now = timezone.now()
+    candidates = (
+        Job.objects.filter(status=Job.QUEUED, run_after__lte=now)
+        .order_by('-priority', 'run_after', 'id')
+        .values_list('id', flat=True)[:10]
+    )
+    for job_id in candidates:
+        claimed = Job.objects.filter(pk=job_id, status=Job.QUEUED).update(
+            status=Job.RUNNING, locked_by=worker_id, started_at=now, heartbeat_at=now,
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def heartbeat(worker_id):
+    """Marks every job this worker is running as still alive."""
+    return Job.objects.filter(status=Job.RUNNING, locked_by=worker_id).update(heartbeat_at=timezone.now())
+
+
+def requeue_stale():
+    """
+    Queues jobs whose worker died again, or fails them once they are out of
+    attempts, so a job that keeps killing its worker is not retried forever.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(status=Job.RUNNING, heartbeat_at__lt=now - STALE_AFTER)
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED, locked_by='', finished_at=now,
+        last_error='Worker stopped responding while running this job.',
+    )
+    return stale.update(status=Job.QUEUED, locked_by='')
+
+
+def run_job(job):
+    """Runs a claimed job and records its outcome."""
+    try:
+        result = REGISTRY[job.kind](job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = Job.QUEUED
+            job.run_after = timezone.now() + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+        else:
+            job.status = Job.FAILED
+            job.finished_at = timezone.now()
+        job.locked_by = ''
+        job.save(update_fields=['status', 'run_after', 'finished_at', 'locked_by', 'last_error'])
+    else:
+        job.status = Job.DONE
+        job.result = result
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'result', 'finished_at'])
+    finally:
+        close_old_connections()
+    return job
+
+
+# ----------------------------------------------------------------------
+# Built-in jobs
+# ----------------------------------------------------------------------
+
+@job('rebuild_allocations')
+def rebuild_allocations(payload):
+    """Replays payment allocations for ``payload['customers']`` (default: all)."""
+    from .allocation import rebuild_customer
+
+    customer_ids = payload.get('customers') or Customer.objects.values_list('id', flat=True)
+    count = 0
+    for customer_id in customer_ids:
+        rebuild_customer(customer_id)
+        count += 1
+    return {'customers': count}
+
+
+@job('generate_statements')
+def generate_statements(payload):
+    """Payload: ``{"month": "2025-09", "format": "html"}``."""
+    call_command(
+        'generate_statements',
+        month=payload['month'],
+        format=payload.get('format', 'csv'),
+        force=payload.get('force', False),
+    )
+    return {'month': payload['month']}
+
+
+@job('archive_history')
+def archive_history(payload):
+    """Payload: ``{"before": "2025-04-01"}``."""
+    call_command('archive_history', before=payload['before'])
+    return {'before': payload['before']}
+
+
+@job('check_ledger')
+def check_ledger(payload):
+    """Payload: ``{"repair": true}``. Fails (and is retried) on unrepaired drift."""
+    call_command('check_ledger', repair=payload.get('repair', False))
+    return {'repair': payload.get('repair', False)}
+
+
+@job('db_maintain')
+def db_maintain(payload):
+    """Backup and ANALYZE; takes no payload (--vacuum-into is command-line only)."""
+    call_command('db_maintain')
+    return {}
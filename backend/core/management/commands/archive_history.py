@@ -0,0 +1,146 @@
+# core/management/commands/archive_history.py
+
+from collections import defaultdict
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import (
+    CreditSale, CreditSaleItem, Payment, Purchase,
+    ArchivedCreditSale, ArchivedCreditSaleItem, ArchivedPayment, ArchivedPurchase,
+    CustomerOpeningBalance, VariantOpeningStock, mute_stock_signals,
+)
+
+
+class Command(BaseCommand):
+    """
+    Moves settled history older than --before out of the live tables, e.g.:
+
+        python manage.py archive_history --before 2025-04-01
+
+    - Settled credit sales (with their items) and the payments that only
+      paid for those sales go to the Archived* tables, and their totals
+      are added to each customer's CustomerOpeningBalance.
+    - Purchases go to ArchivedPurchase; purchased and sold quantities are
+      added to each variant's VariantOpeningStock.
+
+    Balances and stock checks combine the opening rows with the live
+    ones, so results do not change. Customers are processed in chunks,
+    one transaction per chunk.
+    """
+    help = "Archive settled sales, payments and purchases older than a cutoff date."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', required=True, help="Cutoff date, YYYY-MM-DD.")
+        parser.add_argument('--chunk-size', type=int, default=500, help="Customers per transaction.")
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        try:
+            cutoff = timezone.make_aware(datetime.strptime(options['before'], '%Y-%m-%d'))
+        except ValueError:
+            raise CommandError("--before must look like 2025-04-01")
+        self.cutoff = cutoff
+        self.now = timezone.now()
+
+        old_settled = CreditSale.objects.filter(settled=True, sale_date__lt=cutoff)
+        customer_ids = sorted(set(old_settled.values_list('customer_id', flat=True)))
+        if options['dry_run']:
+            self.stdout.write(
+                f"Would archive {old_settled.count()} sales for {len(customer_ids)} customers "
+                f"and {Purchase.objects.filter(purchase_date__lt=cutoff).count()} purchases."
+            )
+            return
+
+        size = options['chunk_size']
+        totals = defaultdict(int)
+        for i in range(0, len(customer_ids), size):
+            for key, count in self._archive_credit(customer_ids[i:i + size]).items():
+                totals[key] += count
+            self.stdout.write(f"[{min(i + size, len(customer_ids))}/{len(customer_ids)}] customers archived")
+        totals['purchases'] = self._archive_purchases()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {totals['sales']} sales, {totals['items']} sale items, "
+            f"{totals['payments']} payments and {totals['purchases']} purchases."
+        ))
+
+    @transaction.atomic
+    def _archive_credit(self, customer_ids):
+        sales = list(
+            CreditSale.objects.filter(customer_id__in=customer_ids, settled=True, sale_date__lt=self.cutoff)
+            .values('id', 'customer_id', 'sale_date', 'total_amount')
+        )
+        sale_ids = [sale['id'] for sale in sales]
+        items = list(
+            CreditSaleItem.objects.filter(sale_id__in=sale_ids)
+            .values('sale_id', 'variant_id', 'quantity', 'price_at_sale')
+        )
+        # Fully used payments whose every allocation went to a sale archived here
+        payments = list(
+            Payment.objects.filter(customer_id__in=customer_ids, payment_date__lt=self.cutoff, unallocated=0)
+            .exclude(allocations__sale__settled=False)
+            .exclude(allocations__sale__sale_date__gte=self.cutoff)
+            .values('id', 'customer_id', 'payment_date', 'amount')
+        )
+
+        ArchivedCreditSale.objects.bulk_create(ArchivedCreditSale(**sale) for sale in sales)
+        ArchivedCreditSaleItem.objects.bulk_create(ArchivedCreditSaleItem(**item) for item in items)
+        ArchivedPayment.objects.bulk_create(ArchivedPayment(**payment) for payment in payments)
+
+        sales_total = defaultdict(int)
+        for sale in sales:
+            sales_total[sale['customer_id']] += sale['total_amount']
+        payments_total = defaultdict(int)
+        for payment in payments:
+            payments_total[payment['customer_id']] += payment['amount']
+        self._add_openings(
+            CustomerOpeningBalance, 'customer_id', customer_ids,
+            {'sales_total': sales_total, 'payments_total': payments_total},
+        )
+
+        sold = defaultdict(int)
+        for item in items:
+            sold[item['variant_id']] += item['quantity']
+        self._add_openings(VariantOpeningStock, 'variant_id', list(sold), {'sold': sold})
+
+        CreditSale.objects.filter(id__in=sale_ids).delete()
+        Payment.objects.filter(id__in=[payment['id'] for payment in payments]).delete()
+        return {'sales': len(sales), 'items': len(items), 'payments': len(payments)}
+
+    @transaction.atomic
+    def _archive_purchases(self):
+        purchases = list(
+            Purchase.objects.filter(purchase_date__lt=self.cutoff)
+            .values('id', 'supplier_id', 'variant_id', 'quantity', 'purchase_price', 'purchase_date')
+        )
+        ArchivedPurchase.objects.bulk_create(ArchivedPurchase(**purchase) for purchase in purchases)
+
+        purchased = defaultdict(int)
+        for purchase in purchases:
+            purchased[purchase['variant_id']] += purchase['quantity']
+        self._add_openings(VariantOpeningStock, 'variant_id', list(purchased), {'purchased': purchased})
+
+        # Stock already reflects these purchases; deleting them must not undo it
+        with mute_stock_signals():
+            Purchase.objects.filter(id__in=[purchase['id'] for purchase in purchases]).delete()
+        return len(purchases)
+
+    def _add_openings(self, model, key, ids, increments):
+        """Adds ``increments[field][id]`` onto the opening row of each id."""
+        existing = {getattr(row, key): row for row in model.objects.filter(**{f'{key}__in': ids})}
+        created, updated = [], []
+        for pk in ids:
+            row = existing.get(pk)
+            if row is None:
+                row = model(**{key: pk})
+                created.append(row)
+            else:
+                updated.append(row)
+            for field, amounts in increments.items():
+                setattr(row, field, getattr(row, field) + amounts.get(pk, 0))
+            row.as_of = self.now
+        model.objects.bulk_create(created)
+        model.objects.bulk_update(updated, [*increments, 'as_of'])
@@ -0,0 +1,90 @@
+# core/management/commands/bench_composite.py
+
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Load-tests the composite endpoints on two running servers and compares
+    them side by side, e.g.:
+
+        gunicorn backend.wsgi:application --bind 127.0.0.1:8000 --workers 1 --threads 16
+        uvicorn backend.asgi:application --port 8001 --workers 1
+        python manage.py bench_composite --customer 1 --concurrency 16
+
+    The WSGI server is hit on the sync routes, the ASGI server on the
+    /api/async/ routes, with the same concurrency for both. For a fair
+    comparison, give both servers the same number of worker processes,
+    give gunicorn at least --concurrency threads, and set DEBUG = False for
+    both runs. Do not use `runserver` as the baseline: it is a development
+    server and does not represent a production WSGI setup.
+    """
+    help = "Compare latency and requests/sec of sync (WSGI) vs async (ASGI) composite endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wsgi-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--asgi-url', default='http://127.0.0.1:8001')
+        parser.add_argument('--customer', type=int, help="Customer id for the customer-detail endpoint.")
+        parser.add_argument('--concurrency', type=int, default=16)
+        parser.add_argument('--requests', type=int, default=400, help="Requests per endpoint per server.")
+
+    def handle(self, *args, **options):
+        endpoints = [('dashboard', 'api/dashboard/', 'api/async/dashboard/')]
+        if options['customer']:
+            pk = options['customer']
+            endpoints.append(
+                ('customer-detail', f'api/customer-detail/{pk}/', f'api/async/customer-detail/{pk}/')
+            )
+
+        self.stdout.write(
+            f"{'endpoint':<18}{'server':<7}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}"
+        )
+        for name, sync_path, async_path in endpoints:
+            for server, url in (
+                ('wsgi', f"{options['wsgi_url'].rstrip('/')}/{sync_path}"),
+                ('asgi', f"{options['asgi_url'].rstrip('/')}/{async_path}"),
+            ):
+                stats = self._run(url, options['concurrency'], options['requests'])
+                self.stdout.write(
+                    f"{name:<18}{server:<7}{stats['rps']:>9.1f}{stats['p50']:>9.1f}"
+                    f"{stats['p95']:>9.1f}{stats['p99']:>9.1f}{stats['errors']:>8}"
+                )
+
+    def _run(self, url, concurrency, total):
+        try:
+            urlopen(url, timeout=10).read()  # warm-up, and fail fast if the server is down
+        except URLError as exc:
+            raise CommandError(f"Cannot reach {url}: {exc}")
+
+        def one(_):
+            started = time.perf_counter()
+            try:
+                with urlopen(url, timeout=30) as response:
+                    response.read()
+                    ok = response.status == 200
+            except (URLError, OSError):
+                ok = False
+            return time.perf_counter() - started, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(one, range(total)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(duration * 1000 for duration, ok in results if ok)
+        if len(latencies) < 2:
+            raise CommandError(f"Too many failed requests against {url}")
+        cuts = statistics.quantiles(latencies, n=100)
+        return {
+            'rps': len(results) / elapsed,
+            'p50': cuts[49],
+            'p95': cuts[94],
+            'p99': cuts[98],
+            'errors': sum(1 for _, ok in results if not ok),
+        }
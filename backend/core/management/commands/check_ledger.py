@@ -0,0 +1,162 @@
+# core/management/commands/check_ledger.py
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, ExpressionWrapper, F, Q, Sum, Value
+from django.db.models.functions import Round
+
+from core.allocation import rebuild_customer
+from core.fields import MoneyField
+from core.models import (
+    ProductVariant, Purchase, CreditSale, CreditSaleItem, Payment, Customer,
+    CustomerOpeningBalance, VariantOpeningStock,
+)
+
+# quantity (milli-units) x price (paise) / 1000, rounded: the line total in
+# paise, computed by the database on the raw integer columns
+LINE_AMOUNT = ExpressionWrapper(
+    Round(F('quantity') * F('price_at_sale') / Value(1000.0)),
+    output_field=MoneyField()
+)
+
+
+def _sum_by(queryset, key, field):
+    rows = queryset.order_by().values(key).annotate(total=Sum(field))
+    return {row[key]: row['total'] for row in rows}
+
+
+def _id_chunks(model, size):
+    """Yields lists of primary keys in ascending order, ``size`` at a time."""
+    last = 0
+    while True:
+        ids = list(model.objects.filter(pk__gt=last).order_by('pk').values_list('pk', flat=True)[:size])
+        if not ids:
+            return
+        yield ids
+        last = ids[-1]
+
+
+class Command(BaseCommand):
+    """
+    Recomputes the ledger from the transaction tables and reports drift:
+
+    - stock: opening stock (archived history and hand-entered counts)
+      + purchases - sold quantities vs current_stock
+    - sale totals: sum of line amounts vs CreditSale.total_amount
+    - settlement: per customer, open amounts minus unallocated credit
+      must equal the balance; settled flags must match amount_due
+
+    Work is done in chunks of --chunk-size ids with grouped queries, so
+    memory stays bounded. With --repair, stock and totals are fixed with
+    bulk updates and drifting customers have their allocations replayed.
+    """
+    help = "Check (and optionally repair) stock, sale totals and settlement state."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--show', type=int, default=20, help="Mismatches to print per check.")
+
+    def handle(self, *args, **options):
+        self.repair = options['repair']
+        self.size = options['chunk_size']
+        self.show = options['show']
+
+        found = sum([
+            self._check('stock', ProductVariant, self._check_stock),
+            self._check('sale totals', CreditSale, self._check_sale_totals),
+            self._check('settlement', Customer, self._check_settlement),
+        ])
+
+        if found and not self.repair:
+            raise CommandError(f"{found} mismatches found; run with --repair to fix them.")
+        self.stdout.write(self.style.SUCCESS(
+            f"Repaired {found} mismatches." if found else "Ledger is consistent."
+        ))
+
+    def _check(self, name, model, check_chunk):
+        found = 0
+        for ids in _id_chunks(model, self.size):
+            with transaction.atomic():
+                mismatches = check_chunk(ids)
+            for line in mismatches[:max(self.show - found, 0)]:
+                self.stdout.write(f"  {name}: {line}")
+            found += len(mismatches)
+        self.stdout.write(f"{name}: {found} mismatches")
+        return found
+
+    def _check_stock(self, ids):
+        purchased = _sum_by(Purchase.objects.filter(variant_id__in=ids), 'variant_id', 'quantity')
+        sold = _sum_by(CreditSaleItem.objects.filter(variant_id__in=ids), 'variant_id', 'quantity')
+        opening = {row.variant_id: row for row in VariantOpeningStock.objects.filter(variant_id__in=ids)}
+
+        drifted = []
+        for variant in ProductVariant.objects.filter(id__in=ids).only('id', 'current_stock'):
+            expected = (purchased.get(variant.pk) or 0) - (sold.get(variant.pk) or 0)
+            if variant.pk in opening:
+                expected += opening[variant.pk].stock
+            if variant.current_stock != expected:
+                drifted.append((variant, expected))
+
+        report = [f"variant {v.pk}: stored {v.current_stock}, expected {expected}" for v, expected in drifted]
+        if self.repair and drifted:
+            for variant, expected in drifted:
+                variant.current_stock = expected
+            ProductVariant.objects.bulk_update([variant for variant, _ in drifted], ['current_stock'])
+        return report
+
+    def _check_sale_totals(self, ids):
+        totals = _sum_by(CreditSaleItem.objects.filter(sale_id__in=ids), 'sale_id', LINE_AMOUNT)
+
+        drifted = []
+        for sale in CreditSale.objects.filter(id__in=ids).only('id', 'customer_id', 'total_amount'):
+            expected = totals.get(sale.pk) or 0
+            if sale.total_amount != expected:
+                drifted.append((sale, expected))
+
+        report = [f"sale {s.pk}: stored {s.total_amount}, expected {expected}" for s, expected in drifted]
+        if self.repair and drifted:
+            for sale, expected in drifted:
+                sale.total_amount = expected
+            CreditSale.objects.bulk_update([sale for sale, _ in drifted], ['total_amount'])
+            # Settlement state follows from the totals and is replayed below
+            for customer_id in {sale.customer_id for sale, _ in drifted}:
+                rebuild_customer(customer_id)
+        return report
+
+    def _check_settlement(self, ids):
+        sales = {
+            row['customer_id']: row
+            for row in CreditSale.objects.filter(customer_id__in=ids).order_by().values('customer_id').annotate(
+                total=Sum('total_amount'),
+                due=Sum('amount_due'),
+                bad_flags=Count('id', filter=Q(settled=True, amount_due__gt=0) | Q(settled=False, amount_due__lte=0)),
+            )
+        }
+        payments = {
+            row['customer_id']: row
+            for row in Payment.objects.filter(customer_id__in=ids).order_by().values('customer_id').annotate(
+                total=Sum('amount'), unallocated=Sum('unallocated'),
+            )
+        }
+        opening = {row.customer_id: row.balance for row in CustomerOpeningBalance.objects.filter(customer_id__in=ids)}
+
+        drifted = []
+        for customer_id in ids:
+            sale_row = sales.get(customer_id, {})
+            payment_row = payments.get(customer_id, {})
+            balance = (
+                opening.get(customer_id, 0)
+                + (sale_row.get('total') or 0) - (payment_row.get('total') or 0)
+            )
+            settled_view = (sale_row.get('due') or 0) - (payment_row.get('unallocated') or 0)
+            if settled_view != balance or sale_row.get('bad_flags'):
+                drifted.append((customer_id, balance, settled_view))
+
+        if self.repair:
+            for customer_id, _, _ in drifted:
+                rebuild_customer(customer_id)
+        return [
+            f"customer {customer_id}: balance {balance}, open bills minus credit {settled_view}"
+            for customer_id, balance, settled_view in drifted
+        ]
@@ -0,0 +1,67 @@
+# core/management/commands/compress_frontend.py
+
+import gzip
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are written without it
+    brotli = None
+
+COMPRESSIBLE = {'.html', '.js', '.css', '.json', '.map', '.svg', '.txt', '.ico'}
+MIN_SIZE = 1024
+
+
+class Command(BaseCommand):
+    """
+    Writes .gz (and, if the `brotli` package is installed, .br) files next
+    to each text asset of the React build, e.g. after `npm run build`:
+
+        python manage.py compress_frontend
+
+    core.views.frontend picks the best variant the browser accepts, so
+    nothing is compressed per request. Variants newer than their source
+    are left alone, and ones that would not be smaller are not written.
+    """
+    help = "Precompress the React build for serving with gzip/brotli."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--build-dir', help="Default: settings.FRONTEND_BUILD_DIR.")
+
+    def handle(self, *args, **options):
+        build_dir = options['build_dir'] or settings.FRONTEND_BUILD_DIR
+        if not os.path.isdir(build_dir):
+            raise CommandError(f"{build_dir} does not exist; run `npm run build` in frontend/ first.")
+
+        codecs = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            codecs.append(('.br', lambda data: brotli.compress(data, quality=11)))
+        else:
+            self.stdout.write("brotli is not installed; writing gzip variants only.")
+
+        original = written = 0
+        for root, _, files in os.walk(build_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if os.path.splitext(name)[1] not in COMPRESSIBLE or os.path.getsize(path) < MIN_SIZE:
+                    continue
+                with open(path, 'rb') as f:
+                    data = f.read()
+                for suffix, compress in codecs:
+                    target = path + suffix
+                    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(path):
+                        continue
+                    compressed = compress(data)
+                    if len(compressed) >= len(data):
+                        continue
+                    with open(target, 'wb') as f:
+                        f.write(compressed)
+                    original += len(data)
+                    written += len(compressed)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Compressed {original / 1024:.0f} KB of assets into {written / 1024:.0f} KB of variants."
+        ))
@@ -0,0 +1,89 @@
+# core/management/commands/db_maintain.py
+
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from core.sqlite_tools import backup_to, storage_stats
+
+
+def _mb(size):
+    return f"{size / 1024 / 1024:.1f} MB"
+
+
+class Command(BaseCommand):
+    """
+    Routine upkeep for the SQLite database, safe to run while the shop is
+    open (e.g. nightly from cron or as a 'db_maintain' job):
+
+        python manage.py db_maintain
+        python manage.py db_maintain --vacuum-into /mnt/usb/grocer.sqlite3
+
+    1. Online backup into --backup-dir, copied --pages pages per step with
+       a --step-sleep pause between steps so writers are never blocked for
+       long. If concurrent writes keep restarting it, the copy falls back
+       to a single step (see core.sqlite_tools.copy_database).
+    2. ANALYZE and PRAGMA optimize, so the query planner has fresh stats.
+    3. Optionally VACUUM INTO a compacted copy. The live file is never
+       vacuumed in place, as that locks out writers for the whole run.
+    """
+    help = "Back up, analyze and optionally compact the SQLite database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backup-dir', help="Backup directory (default: backups/).")
+        parser.add_argument('--no-backup', action='store_true')
+        parser.add_argument('--pages', type=int, default=256, help="Pages copied per backup step.")
+        parser.add_argument('--step-sleep', type=float, default=0.05, help="Seconds between backup steps.")
+        parser.add_argument('--vacuum-into', help="Write a compacted copy of the database to this path.")
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        if settings.DATABASES['default']['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError("db_maintain only supports SQLite databases.")
+        vacuum_target = options['vacuum_into']
+        if vacuum_target and os.path.exists(vacuum_target):
+            raise CommandError(f"{vacuum_target} already exists.")
+        if options['pages'] <= 0:
+            raise CommandError("--pages must be positive.")
+
+        stats = storage_stats()
+        self.stdout.write(
+            f"Database: {_mb(stats['size'])}, {stats['page_count']} pages, "
+            f"{stats['freelist_count']} free ({stats['fragmentation']:.1%} fragmentation)"
+        )
+
+        if not options['no_backup']:
+            backup_dir = options['backup_dir'] or os.path.join(settings.BASE_DIR, 'backups')
+            os.makedirs(backup_dir, exist_ok=True)
+            target = os.path.join(backup_dir, f"db-{timezone.now():%Y%m%d-%H%M%S}.sqlite3")
+            started = time.monotonic()
+            restarts = backup_to(target, pages=options['pages'], sleep=options['step_sleep'], progress=self._progress)
+            self.stdout.write(
+                f"Backup: {target} ({_mb(os.path.getsize(target))}) in {time.monotonic() - started:.2f}s"
+                + (f", restarted {restarts}x by concurrent writes" if restarts else "")
+            )
+
+        started = time.monotonic()
+        with connections['default'].cursor() as cursor:
+            cursor.execute("ANALYZE")
+            cursor.execute("PRAGMA optimize")
+        self.stdout.write(f"Analyze: done in {time.monotonic() - started:.2f}s")
+
+        if vacuum_target:
+            started = time.monotonic()
+            with connections['default'].cursor() as cursor:
+                cursor.execute("VACUUM INTO %s", [vacuum_target])
+            self.stdout.write(
+                f"Vacuum: {vacuum_target} ({_mb(os.path.getsize(vacuum_target))}, "
+                f"was {_mb(stats['size'])}) in {time.monotonic() - started:.2f}s"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Maintenance complete."))
+
+    def _progress(self, status, remaining, total):
+        if self.verbosity > 1:
+            self.stdout.write(f"  backup: {total - remaining}/{total} pages")
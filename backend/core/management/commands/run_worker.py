@@ -0,0 +1,80 @@
+# core/management/commands/run_worker.py
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.jobs import HEARTBEAT_SECONDS, claim_next, heartbeat, requeue_stale, run_job
+
+
+class Command(BaseCommand):
+    """
+    Polls the Job table and runs up to --concurrency jobs at a time, e.g.:
+
+        python manage.py run_worker --concurrency 2
+
+    Several workers may run side by side; each job is claimed by exactly
+    one of them. While jobs run, a heartbeat thread keeps them marked as
+    alive; jobs whose worker stopped sending heartbeats are queued again.
+    With --once the worker exits when the queue is empty.
+    """
+    help = "Run background jobs from the database queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2)
+        parser.add_argument('--poll', type=float, default=2.0, help="Seconds to wait when idle.")
+        parser.add_argument('--once', action='store_true', help="Exit once no job is due.")
+
+    def handle(self, *args, **options):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        slots = threading.BoundedSemaphore(options['concurrency'])
+        requeued = requeue_stale()
+        if requeued:
+            self.stdout.write(f"Re-queued {requeued} stale jobs.")
+        self.stdout.write(f"Worker {worker_id} started ({options['concurrency']} slots).")
+
+        stopping = threading.Event()
+
+        def beat():
+            try:
+                while not stopping.wait(HEARTBEAT_SECONDS):
+                    # A missed beat (e.g. "database is locked" while a job
+                    # holds a write transaction) must not stop the next ones,
+                    # or the running jobs would be re-queued under us.
+                    try:
+                        heartbeat(worker_id)
+                    except Exception as exc:
+                        self.stderr.write(f"Heartbeat failed, retrying: {exc}")
+            finally:
+                connection.close()
+
+        threading.Thread(target=beat, name='job-heartbeat', daemon=True).start()
+
+        def work(job):
+            try:
+                job = run_job(job)
+                self.stdout.write(f"{job} after {job.attempts} attempt(s)")
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            try:
+                while True:
+                    slots.acquire()
+                    job = claim_next(worker_id)
+                    if job is not None:
+                        pool.submit(work, job)
+                        continue
+                    slots.release()
+                    if options['once']:
+                        break
+                    requeue_stale()
+                    time.sleep(options['poll'])
+            except KeyboardInterrupt:
+                self.stdout.write("Stopping; waiting for running jobs to finish.")
+        stopping.set()
@@ -0,0 +1,45 @@
+# core/management/commands/sync_replicas.py
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.db_router import mark_synced
+from core.sqlite_tools import backup_to
+
+
+class Command(BaseCommand):
+    """
+    Copies the primary SQLite database onto every SQLite alias listed in
+    DATABASE_REPLICAS, using SQLite's online backup API so the primary
+    stays writable meanwhile. With --interval it keeps re-syncing, which
+    gives a local stand-in for asynchronous replication (and its lag).
+    Each sync records its start time next to the replica, which is what
+    lets clients that wrote since then keep reading from the primary.
+    """
+    help = "Refresh local SQLite read replicas from the primary database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help="Keep syncing every N seconds.")
+
+    def handle(self, *args, **options):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if not replicas:
+            raise CommandError("DATABASE_REPLICAS is empty; nothing to sync.")
+        for alias in ['default', *replicas]:
+            if settings.DATABASES[alias]['ENGINE'] != 'django.db.backends.sqlite3':
+                raise CommandError(f"{alias} is not a SQLite database.")
+
+        while True:
+            for alias in replicas:
+                started = time.monotonic()
+                # Every write committed before the copy starts is in it
+                copy_started_at = time.time()
+                backup_to(settings.DATABASES[alias]['NAME'])
+                mark_synced(alias, copy_started_at)
+                self.stdout.write(f"{alias}: synced in {time.monotonic() - started:.2f}s")
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
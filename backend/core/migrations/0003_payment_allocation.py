@@ -0,0 +1,121 @@
+# Generated by Django 5.2.6 on 2026-10-19 02:56
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_settlement(apps, schema_editor):
+    """Stores sale totals and replays FIFO allocations for existing data."""
+    CreditSale = apps.get_model("core", "CreditSale")
+    Payment = apps.get_model("core", "Payment")
+    PaymentAllocation = apps.get_model("core", "PaymentAllocation")
+    cents = Decimal("0.01")
+
+    for customer_id in CreditSale.objects.values_list("customer_id", flat=True).distinct():
+        sales = list(
+            CreditSale.objects.filter(customer_id=customer_id)
+            .prefetch_related("items")
+            .order_by("sale_date", "id")
+        )
+        payments = list(
+            Payment.objects.filter(customer_id=customer_id).order_by("payment_date", "id")
+        )
+        for sale in sales:
+            sale.total_amount = sum(
+                (
+                    (Decimal(str(item.quantity)) * item.price_at_sale).quantize(
+                        cents, rounding=ROUND_HALF_UP
+                    )
+                    for item in sale.items.all()
+                ),
+                Decimal("0.00"),
+            )
+            sale.amount_due = sale.total_amount
+        for payment in payments:
+            payment.unallocated = payment.amount
+
+        allocations = []
+        open_payments = iter(payments)
+        payment = next(open_payments, None)
+        for sale in sales:
+            while sale.amount_due > 0 and payment is not None:
+                amount = min(sale.amount_due, payment.unallocated)
+                sale.amount_due -= amount
+                payment.unallocated -= amount
+                allocations.append(
+                    PaymentAllocation(sale=sale, payment=payment, amount=amount)
+                )
+                if payment.unallocated <= 0:
+                    payment = next(open_payments, None)
+            sale.settled = sale.amount_due <= 0
+
+        PaymentAllocation.objects.bulk_create(allocations)
+        CreditSale.objects.bulk_update(sales, ["total_amount", "amount_due", "settled"])
+        Payment.objects.bulk_update(payments, ["unallocated"])
+
+    # Customers with payments but no sales keep all of it as credit
+    Payment.objects.exclude(
+        customer_id__in=CreditSale.objects.values("customer_id")
+    ).update(unallocated=models.F("amount"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_supplier_purchase"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentAllocation",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=12)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="creditsale",
+            name="amount_due",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="creditsale",
+            name="settled",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="creditsale",
+            name="total_amount",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name="payment",
+            name="unallocated",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.AddIndex(
+            model_name="creditsale",
+            index=models.Index(condition=models.Q(("settled", False)), fields=["customer", "sale_date"], name="open_sale_customer_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creditsale",
+            index=models.Index(condition=models.Q(("settled", False)), fields=["sale_date"], name="open_sale_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(condition=models.Q(("unallocated__gt", 0)), fields=["customer", "payment_date"], name="payment_credit_idx"),
+        ),
+        migrations.AddField(
+            model_name="paymentallocation",
+            name="payment",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="allocations", to="core.payment"),
+        ),
+        migrations.AddField(
+            model_name="paymentallocation",
+            name="sale",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="allocations", to="core.creditsale"),
+        ),
+        migrations.RunPython(backfill_settlement, migrations.RunPython.noop),
+    ]
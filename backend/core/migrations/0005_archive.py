@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-19 02:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedCreditSale",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("customer_id", models.BigIntegerField(db_index=True)),
+                ("sale_date", models.DateTimeField()),
+                ("total_amount", models.DecimalField(decimal_places=2, max_digits=12)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedCreditSaleItem",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("sale_id", models.BigIntegerField(db_index=True)),
+                ("variant_id", models.BigIntegerField()),
+                ("quantity", models.FloatField()),
+                ("price_at_sale", models.DecimalField(decimal_places=2, max_digits=10)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedPayment",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("customer_id", models.BigIntegerField(db_index=True)),
+                ("payment_date", models.DateTimeField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedPurchase",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("supplier_id", models.BigIntegerField(null=True)),
+                ("variant_id", models.BigIntegerField(db_index=True)),
+                ("quantity", models.FloatField()),
+                ("purchase_price", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("purchase_date", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="CustomerOpeningBalance",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("sales_total", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("payments_total", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("as_of", models.DateTimeField()),
+                ("customer", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="opening", to="core.customer")),
+            ],
+        ),
+        migrations.CreateModel(
+            name="VariantOpeningStock",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("purchased", models.FloatField(default=0)),
+                ("sold", models.FloatField(default=0)),
+                ("as_of", models.DateTimeField()),
+                ("variant", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="opening", to="core.productvariant")),
+            ],
+        ),
+    ]
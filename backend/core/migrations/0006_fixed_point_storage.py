@@ -0,0 +1,506 @@
+# Generated by Django 5.2.6 on 2026-10-19 03:10
+
+from django.db import migrations, models
+from django.db.models import ExpressionWrapper, F, Value
+from django.db.models.functions import Cast, Round
+
+import core.fields
+
+# (model, field, scale) for every column moving to fixed-point integers:
+# money is stored in paise (x100), quantities in milli-units (x1000).
+CONVERTED_FIELDS = [
+    ("productvariant", "price", 100),
+    ("productvariant", "current_stock", 1000),
+    ("creditsale", "total_amount", 100),
+    ("creditsale", "amount_due", 100),
+    ("creditsaleitem", "quantity", 1000),
+    ("creditsaleitem", "price_at_sale", 100),
+    ("payment", "amount", 100),
+    ("payment", "unallocated", 100),
+    ("paymentallocation", "amount", 100),
+    ("purchase", "quantity", 1000),
+    ("purchase", "purchase_price", 100),
+    ("customeropeningbalance", "sales_total", 100),
+    ("customeropeningbalance", "payments_total", 100),
+    ("variantopeningstock", "purchased", 1000),
+    ("variantopeningstock", "sold", 1000),
+    ("archivedcreditsale", "total_amount", 100),
+    ("archivedcreditsaleitem", "quantity", 1000),
+    ("archivedcreditsaleitem", "price_at_sale", 100),
+    ("archivedpayment", "amount", 100),
+    ("archivedpurchase", "quantity", 1000),
+    ("archivedpurchase", "purchase_price", 100),
+]
+
+
+def to_fixed_point(apps, schema_editor):
+    """Copies each old column, scaled and rounded, into its integer twin."""
+    for model_name, field, scale in CONVERTED_FIELDS:
+        model = apps.get_model("core", model_name)
+        model.objects.update(
+            **{f"{field}_fixed": Cast(Round(F(field) * scale), models.BigIntegerField())}
+        )
+
+
+def from_fixed_point(apps, schema_editor):
+    """Reverse of to_fixed_point: scales each integer twin back into the old column."""
+    for model_name, field, scale in CONVERTED_FIELDS:
+        model = apps.get_model("core", model_name)
+        model.objects.update(
+            **{field: ExpressionWrapper(F(f"{field}_fixed") / Value(float(scale)), output_field=models.FloatField())}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_archive"),
+    ]
+
+    operations = [
+        # The partial index filters on a column that is being replaced
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payment_credit_idx",
+        ),
+        migrations.AddField(
+            model_name="productvariant",
+            name="price_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="productvariant",
+            name="current_stock_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="creditsale",
+            name="total_amount_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="creditsale",
+            name="amount_due_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="creditsaleitem",
+            name="quantity_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="creditsaleitem",
+            name="price_at_sale_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="payment",
+            name="amount_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="payment",
+            name="unallocated_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="paymentallocation",
+            name="amount_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="purchase",
+            name="quantity_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="purchase",
+            name="purchase_price_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="customeropeningbalance",
+            name="sales_total_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="customeropeningbalance",
+            name="payments_total_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="variantopeningstock",
+            name="purchased_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="variantopeningstock",
+            name="sold_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedcreditsale",
+            name="total_amount_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedcreditsaleitem",
+            name="quantity_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedcreditsaleitem",
+            name="price_at_sale_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedpayment",
+            name="amount_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedpurchase",
+            name="quantity_fixed",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedpurchase",
+            name="purchase_price_fixed",
+            field=core.fields.MoneyField(default=0),
+        ),
+        # State only, no schema change: gives the NOT NULL old columns a
+        # placeholder default so unapplying can re-add them before
+        # from_fixed_point fills them in.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="productvariant",
+                    name="price",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="creditsaleitem",
+                    name="quantity",
+                    field=models.FloatField(default=0),
+                ),
+                migrations.AlterField(
+                    model_name="creditsaleitem",
+                    name="price_at_sale",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="payment",
+                    name="amount",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="paymentallocation",
+                    name="amount",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                migrations.AlterField(
+                    model_name="purchase",
+                    name="quantity",
+                    field=models.FloatField(default=0),
+                ),
+                migrations.AlterField(
+                    model_name="purchase",
+                    name="purchase_price",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="archivedcreditsale",
+                    name="total_amount",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                migrations.AlterField(
+                    model_name="archivedcreditsaleitem",
+                    name="quantity",
+                    field=models.FloatField(default=0),
+                ),
+                migrations.AlterField(
+                    model_name="archivedcreditsaleitem",
+                    name="price_at_sale",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="archivedpayment",
+                    name="amount",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+                migrations.AlterField(
+                    model_name="archivedpurchase",
+                    name="quantity",
+                    field=models.FloatField(default=0),
+                ),
+                migrations.AlterField(
+                    model_name="archivedpurchase",
+                    name="purchase_price",
+                    field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+                ),
+            ],
+        ),
+        migrations.RunPython(to_fixed_point, from_fixed_point),
+        migrations.RemoveField(
+            model_name="productvariant",
+            name="price",
+        ),
+        migrations.RenameField(
+            model_name="productvariant",
+            old_name="price_fixed",
+            new_name="price",
+        ),
+        migrations.AlterField(
+            model_name="productvariant",
+            name="price",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="productvariant",
+            name="current_stock",
+        ),
+        migrations.RenameField(
+            model_name="productvariant",
+            old_name="current_stock_fixed",
+            new_name="current_stock",
+        ),
+        migrations.RemoveField(
+            model_name="creditsale",
+            name="total_amount",
+        ),
+        migrations.RenameField(
+            model_name="creditsale",
+            old_name="total_amount_fixed",
+            new_name="total_amount",
+        ),
+        migrations.RemoveField(
+            model_name="creditsale",
+            name="amount_due",
+        ),
+        migrations.RenameField(
+            model_name="creditsale",
+            old_name="amount_due_fixed",
+            new_name="amount_due",
+        ),
+        migrations.RemoveField(
+            model_name="creditsaleitem",
+            name="quantity",
+        ),
+        migrations.RenameField(
+            model_name="creditsaleitem",
+            old_name="quantity_fixed",
+            new_name="quantity",
+        ),
+        migrations.AlterField(
+            model_name="creditsaleitem",
+            name="quantity",
+            field=core.fields.QuantityField(),
+        ),
+        migrations.RemoveField(
+            model_name="creditsaleitem",
+            name="price_at_sale",
+        ),
+        migrations.RenameField(
+            model_name="creditsaleitem",
+            old_name="price_at_sale_fixed",
+            new_name="price_at_sale",
+        ),
+        migrations.AlterField(
+            model_name="creditsaleitem",
+            name="price_at_sale",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="payment",
+            name="amount",
+        ),
+        migrations.RenameField(
+            model_name="payment",
+            old_name="amount_fixed",
+            new_name="amount",
+        ),
+        migrations.AlterField(
+            model_name="payment",
+            name="amount",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="payment",
+            name="unallocated",
+        ),
+        migrations.RenameField(
+            model_name="payment",
+            old_name="unallocated_fixed",
+            new_name="unallocated",
+        ),
+        migrations.RemoveField(
+            model_name="paymentallocation",
+            name="amount",
+        ),
+        migrations.RenameField(
+            model_name="paymentallocation",
+            old_name="amount_fixed",
+            new_name="amount",
+        ),
+        migrations.AlterField(
+            model_name="paymentallocation",
+            name="amount",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="purchase",
+            name="quantity",
+        ),
+        migrations.RenameField(
+            model_name="purchase",
+            old_name="quantity_fixed",
+            new_name="quantity",
+        ),
+        migrations.AlterField(
+            model_name="purchase",
+            name="quantity",
+            field=core.fields.QuantityField(),
+        ),
+        migrations.RemoveField(
+            model_name="purchase",
+            name="purchase_price",
+        ),
+        migrations.RenameField(
+            model_name="purchase",
+            old_name="purchase_price_fixed",
+            new_name="purchase_price",
+        ),
+        migrations.AlterField(
+            model_name="purchase",
+            name="purchase_price",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="customeropeningbalance",
+            name="sales_total",
+        ),
+        migrations.RenameField(
+            model_name="customeropeningbalance",
+            old_name="sales_total_fixed",
+            new_name="sales_total",
+        ),
+        migrations.RemoveField(
+            model_name="customeropeningbalance",
+            name="payments_total",
+        ),
+        migrations.RenameField(
+            model_name="customeropeningbalance",
+            old_name="payments_total_fixed",
+            new_name="payments_total",
+        ),
+        migrations.RemoveField(
+            model_name="variantopeningstock",
+            name="purchased",
+        ),
+        migrations.RenameField(
+            model_name="variantopeningstock",
+            old_name="purchased_fixed",
+            new_name="purchased",
+        ),
+        migrations.RemoveField(
+            model_name="variantopeningstock",
+            name="sold",
+        ),
+        migrations.RenameField(
+            model_name="variantopeningstock",
+            old_name="sold_fixed",
+            new_name="sold",
+        ),
+        migrations.RemoveField(
+            model_name="archivedcreditsale",
+            name="total_amount",
+        ),
+        migrations.RenameField(
+            model_name="archivedcreditsale",
+            old_name="total_amount_fixed",
+            new_name="total_amount",
+        ),
+        migrations.AlterField(
+            model_name="archivedcreditsale",
+            name="total_amount",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="archivedcreditsaleitem",
+            name="quantity",
+        ),
+        migrations.RenameField(
+            model_name="archivedcreditsaleitem",
+            old_name="quantity_fixed",
+            new_name="quantity",
+        ),
+        migrations.AlterField(
+            model_name="archivedcreditsaleitem",
+            name="quantity",
+            field=core.fields.QuantityField(),
+        ),
+        migrations.RemoveField(
+            model_name="archivedcreditsaleitem",
+            name="price_at_sale",
+        ),
+        migrations.RenameField(
+            model_name="archivedcreditsaleitem",
+            old_name="price_at_sale_fixed",
+            new_name="price_at_sale",
+        ),
+        migrations.AlterField(
+            model_name="archivedcreditsaleitem",
+            name="price_at_sale",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="archivedpayment",
+            name="amount",
+        ),
+        migrations.RenameField(
+            model_name="archivedpayment",
+            old_name="amount_fixed",
+            new_name="amount",
+        ),
+        migrations.AlterField(
+            model_name="archivedpayment",
+            name="amount",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.RemoveField(
+            model_name="archivedpurchase",
+            name="quantity",
+        ),
+        migrations.RenameField(
+            model_name="archivedpurchase",
+            old_name="quantity_fixed",
+            new_name="quantity",
+        ),
+        migrations.AlterField(
+            model_name="archivedpurchase",
+            name="quantity",
+            field=core.fields.QuantityField(),
+        ),
+        migrations.RemoveField(
+            model_name="archivedpurchase",
+            name="purchase_price",
+        ),
+        migrations.RenameField(
+            model_name="archivedpurchase",
+            old_name="purchase_price_fixed",
+            new_name="purchase_price",
+        ),
+        migrations.AlterField(
+            model_name="archivedpurchase",
+            name="purchase_price",
+            field=core.fields.MoneyField(),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("unallocated__gt", 0)),
+                fields=["customer", "payment_date"],
+                name="payment_credit_idx",
+            ),
+        ),
+    ]
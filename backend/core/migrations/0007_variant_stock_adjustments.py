@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-19 03:16
+
+from django.db import migrations
+from django.db.models import Sum
+from django.utils import timezone
+
+import core.fields
+
+
+def backfill_adjustments(apps, schema_editor):
+    """
+    Existing stock counts were entered by hand, so whatever purchases and
+    sales do not explain is recorded as an adjustment.
+    """
+    ProductVariant = apps.get_model("core", "ProductVariant")
+    Purchase = apps.get_model("core", "Purchase")
+    CreditSaleItem = apps.get_model("core", "CreditSaleItem")
+    VariantOpeningStock = apps.get_model("core", "VariantOpeningStock")
+
+    def totals(model):
+        rows = model.objects.order_by().values("variant_id").annotate(total=Sum("quantity"))
+        return {row["variant_id"]: row["total"] for row in rows}
+
+    purchased, sold = totals(Purchase), totals(CreditSaleItem)
+    openings = {row.variant_id: row for row in VariantOpeningStock.objects.all()}
+    now = timezone.now()
+    for variant in ProductVariant.objects.all():
+        opening = openings.get(variant.pk) or VariantOpeningStock(variant_id=variant.pk, as_of=now)
+        explained = (
+            opening.purchased - opening.sold
+            + (purchased.get(variant.pk) or 0) - (sold.get(variant.pk) or 0)
+        )
+        if variant.current_stock != explained:
+            opening.adjusted = variant.current_stock - explained
+            opening.save()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_fixed_point_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="variantopeningstock",
+            name="adjusted",
+            field=core.fields.QuantityField(default=0),
+        ),
+        migrations.RunPython(backfill_adjustments, migrations.RunPython.noop),
+    ]
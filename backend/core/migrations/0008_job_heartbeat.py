@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 03:21
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_heartbeats(apps, schema_editor):
+    """Jobs already running count as last seen when they started."""
+    Job = apps.get_model("core", "Job")
+    Job.objects.filter(status="running").update(heartbeat_at=F("started_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_variant_stock_adjustments"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_heartbeats, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,20 @@
 # core/models.py
 
-from django.db import models
+import contextvars
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import Sum, F, ExpressionWrapper, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save
+from django.utils import timezone
 from django.dispatch import receiver
 from django.db.models.signals import post_delete
 
+from .events import stock_changed
+from .fields import MoneyField, QuantityField
+
 class Product(models.Model):
     """Represents a general product category, e.g., 'Parle-G Biscuit' or 'Basmati Rice'."""
     name = models.CharField(max_length=100, unique=True)
@@ -17,20 +27,48 @@ class ProductVariant(models.Model):
     """Represents a specific version of a product, e.g., '₹10 Pack'."""
     product = models.ForeignKey(Product, related_name='variants', on_delete=models.CASCADE)
     name = models.CharField(max_length=100)  # e.g., "₹10 Pack" or "25kg Bag"
-    price = models.DecimalField(max_digits=10, decimal_places=2)
+    price = MoneyField()
     UNIT_CHOICES = [('kg', 'Kilogram'), ('piece', 'Piece'), ('litre', 'Litre'), ('packet', 'Packet')]
     unit = models.CharField(max_length=10, choices=UNIT_CHOICES)
-    current_stock = models.FloatField(default=0)
+    current_stock = QuantityField(default=0)
 
     def __str__(self):
         return f"{self.product.name} ({self.name})"
 
+def _customer_total(model, field, opening_field):
+    """
+    Correlated per-customer SUM plus the archived opening total, so sales
+    and payments never cross-join. Integer (paise) arithmetic throughout.
+    """
+    live = Subquery(
+        model.objects.filter(customer=OuterRef('pk'))
+        .order_by().values('customer')
+        .annotate(total=Sum(field)).values('total')
+    )
+    return ExpressionWrapper(
+        Coalesce(live, 0) + Coalesce(F(f'opening__{opening_field}'), 0),
+        output_field=MoneyField()
+    )
+
+class CustomerQuerySet(models.QuerySet):
+    def with_balance(self):
+        """Annotates total_sales, total_payments and balance."""
+        # Archived history is folded into the customer's opening balance
+        return self.annotate(
+            total_sales=_customer_total(CreditSale, 'total_amount', 'sales_total'),
+            total_payments=_customer_total(Payment, 'amount', 'payments_total'),
+        ).annotate(
+            balance=ExpressionWrapper(F('total_sales') - F('total_payments'), output_field=MoneyField())
+        )
+
 class Customer(models.Model):
     """Represents a customer who can take items on credit."""
     name = models.CharField(max_length=100, unique=True)
     mobile = models.CharField(max_length=15, blank=True, null=True)
     address = models.TextField(blank=True, null=True)
 
+    objects = CustomerQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -38,6 +76,19 @@ class CreditSale(models.Model):
     """Represents a single credit sale transaction for a customer."""
     customer = models.ForeignKey(Customer, related_name='sales', on_delete=models.CASCADE)
     sale_date = models.DateTimeField(auto_now_add=True)
+    # Settlement state, maintained by core.allocation on every sale and payment
+    total_amount = MoneyField(default=0)
+    amount_due = MoneyField(default=0)
+    settled = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            # Open invoices, per customer and book-wide, oldest first
+            models.Index(fields=['customer', 'sale_date'], condition=models.Q(settled=False),
+                         name='open_sale_customer_idx'),
+            models.Index(fields=['sale_date'], condition=models.Q(settled=False),
+                         name='open_sale_date_idx'),
+        ]
 
     def __str__(self):
         return f"Sale for {self.customer.name} on {self.sale_date.strftime('%Y-%m-%d')}"
@@ -46,18 +97,32 @@ class CreditSaleItem(models.Model):
     """Represents a single item within a credit sale."""
     sale = models.ForeignKey(CreditSale, related_name='items', on_delete=models.CASCADE)
     variant = models.ForeignKey(ProductVariant, on_delete=models.PROTECT) # Protect from deleting a variant if it has been sold
-    quantity = models.FloatField()
-    price_at_sale = models.DecimalField(max_digits=10, decimal_places=2) # Record price at the time of sale
+    quantity = QuantityField()
+    price_at_sale = MoneyField() # Record price at the time of sale
 
 class Payment(models.Model):
     """Represents a payment received from a customer against their credit."""
     customer = models.ForeignKey(Customer, related_name='payments', on_delete=models.CASCADE)
     payment_date = models.DateTimeField(auto_now_add=True)
-    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    amount = MoneyField()
+    # Part of the payment not yet applied to a sale (customer credit)
+    unallocated = MoneyField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer', 'payment_date'], condition=models.Q(unallocated__gt=0),
+                         name='payment_credit_idx'),
+        ]
 
     def __str__(self):
         return f"Payment from {self.customer.name} of {self.amount}"
 
+class PaymentAllocation(models.Model):
+    """The part of a payment that was applied to a particular credit sale."""
+    payment = models.ForeignKey(Payment, related_name='allocations', on_delete=models.CASCADE)
+    sale = models.ForeignKey(CreditSale, related_name='allocations', on_delete=models.CASCADE)
+    amount = MoneyField()
+
 class Supplier(models.Model):
     """Represents a wholesaler or supplier."""
     name = models.CharField(max_length=100, unique=True)
@@ -72,27 +137,159 @@ class Purchase(models.Model):
     """Represents a single purchase of a product variant from a supplier."""
     supplier = models.ForeignKey(Supplier, on_delete=models.SET_NULL, null=True, blank=True)
     variant = models.ForeignKey(ProductVariant, related_name='purchases', on_delete=models.PROTECT)
-    quantity = models.FloatField()
-    purchase_price = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = QuantityField()
+    purchase_price = MoneyField()
     purchase_date = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Purchased {self.quantity} of {self.variant} on {self.purchase_date.strftime('%Y-%m-%d')}"
 
+class Job(models.Model):
+    """A unit of background work picked up by `manage.py run_worker`."""
+    QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+    STATUS_CHOICES = [(QUEUED, 'Queued'), (RUNNING, 'Running'), (DONE, 'Done'), (FAILED, 'Failed')]
+
+    kind = models.CharField(max_length=50)  # name registered in core.jobs
+    payload = models.JSONField(default=dict, blank=True)
+    priority = models.IntegerField(default=0)  # higher runs first
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)  # refreshed while running
+    finished_at = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # The worker's "next job" lookup
+            models.Index(fields=['-priority', 'run_after'], condition=models.Q(status='queued'),
+                         name='job_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+# ----------------------------------------------------------------------
+# ARCHIVED HISTORY (see `manage.py archive_history`)
+# ----------------------------------------------------------------------
+# Settled transactions older than a cutoff are moved out of the live tables
+# into the compact Archived* tables below (plain ids, no foreign keys), and
+# their totals are carried forward as opening balances.
+
+class CustomerOpeningBalance(models.Model):
+    """Totals of a customer's archived sales and payments."""
+    customer = models.OneToOneField(Customer, related_name='opening', on_delete=models.CASCADE)
+    sales_total = MoneyField(default=0)
+    payments_total = MoneyField(default=0)
+    as_of = models.DateTimeField()
+
+    @property
+    def balance(self):
+        return self.sales_total - self.payments_total
+
+class VariantOpeningStock(models.Model):
+    """
+    Stock a variant has that is not explained by live purchases and sales:
+    quantities from archived history, plus ``adjusted``, the net of counts
+    entered by hand (starting stock, stock-take corrections).
+    """
+    variant = models.OneToOneField(ProductVariant, related_name='opening', on_delete=models.CASCADE)
+    purchased = QuantityField(default=0)
+    sold = QuantityField(default=0)
+    adjusted = QuantityField(default=0)
+    as_of = models.DateTimeField()
+
+    @property
+    def stock(self):
+        return self.purchased - self.sold + self.adjusted
+
+
+def record_stock_adjustment(variant_id, delta):
+    """Adds a manual change of ``delta`` to a variant's opening stock."""
+    if not delta:
+        return
+    with transaction.atomic():
+        opening, _ = VariantOpeningStock.objects.select_for_update().get_or_create(
+            variant_id=variant_id, defaults={'as_of': timezone.now()}
+        )
+        opening.adjusted += delta
+        opening.save(update_fields=['adjusted'])
+
+class ArchivedCreditSale(models.Model):
+    id = models.BigIntegerField(primary_key=True)  # id of the original CreditSale
+    customer_id = models.BigIntegerField(db_index=True)
+    sale_date = models.DateTimeField()
+    total_amount = MoneyField()
+
+class ArchivedCreditSaleItem(models.Model):
+    sale_id = models.BigIntegerField(db_index=True)
+    variant_id = models.BigIntegerField()
+    quantity = QuantityField()
+    price_at_sale = MoneyField()
+
+class ArchivedPayment(models.Model):
+    id = models.BigIntegerField(primary_key=True)  # id of the original Payment
+    customer_id = models.BigIntegerField(db_index=True)
+    payment_date = models.DateTimeField()
+    amount = MoneyField()
+
+class ArchivedPurchase(models.Model):
+    id = models.BigIntegerField(primary_key=True)  # id of the original Purchase
+    supplier_id = models.BigIntegerField(null=True)
+    variant_id = models.BigIntegerField(db_index=True)
+    quantity = QuantityField()
+    purchase_price = MoneyField()
+    purchase_date = models.DateTimeField()
+
+# ----------------------------------------------------------------------
+# STOCK SIGNALS
+# ----------------------------------------------------------------------
+
+_stock_signals_muted = contextvars.ContextVar('stock_signals_muted', default=False)
+
+@contextmanager
+def mute_stock_signals():
+    """Deletes purchases without touching stock (used when archiving)."""
+    token = _stock_signals_muted.set(True)
+    try:
+        yield
+    finally:
+        _stock_signals_muted.reset(token)
+
 @receiver(post_save, sender=Purchase)
 def update_stock_on_purchase(sender, instance, created, **kwargs):
     """Signal to increase stock when a new purchase is saved."""
-    if created:
+    if created and not _stock_signals_muted.get():
         variant = instance.variant
-        variant.current_stock = float(variant.current_stock) + float(instance.quantity)
+        variant.current_stock += QuantityField().to_python(instance.quantity)
         variant.save()
+        stock_changed(variant)
 
 @receiver(post_delete, sender=Purchase)
 def update_stock_on_purchase_delete(sender, instance, **kwargs):
     """
     Decrements stock when a Purchase object is deleted.
     """
+    if _stock_signals_muted.get():
+        return
     variant = instance.variant
     # Ensure stock doesn't go negative, though this case is unlikely for deletion
-    variant.current_stock = float(variant.current_stock) - float(instance.quantity)
-    variant.save()
\ No newline at end of file
+    variant.current_stock -= QuantityField().to_python(instance.quantity)
+    variant.save()
+    stock_changed(variant)
+
+def customer_balance(customer_id):
+    """Total credit sales minus total payments for a single customer."""
+    total_sales = CreditSale.objects.filter(customer_id=customer_id).aggregate(
+        total=Sum('total_amount')
+    )['total'] or Decimal('0.0')
+    total_payments = Payment.objects.filter(customer_id=customer_id).aggregate(
+        total=Sum('amount')
+    )['total'] or Decimal('0.0')
+    opening = CustomerOpeningBalance.objects.filter(customer_id=customer_id).first()
+    return (opening.balance if opening else 0) + total_sales - total_payments
\ No newline at end of file
@@ -1,17 +1,51 @@
 # core/serializers.py
 
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import transaction
 from rest_framework import serializers
+from .allocation import allocate_customer, rebuild_customer, refresh_sale_total
+from .jobs import REGISTRY as JOB_REGISTRY
+from .events import publish_on_commit, stock_changed, balance_changed
 from .models import (
     Product, ProductVariant, Customer, CreditSale, CreditSaleItem,
-    Payment, Supplier, Purchase
+    Payment, Supplier, Purchase, Job, record_stock_adjustment
 )
 
+# ----------------------------------------------------------------------
+# FIXED-POINT FIELDS
+# ----------------------------------------------------------------------
+# MoneyField / QuantityField are integers in the database but Decimals in
+# Python, so they are declared explicitly instead of letting ModelSerializer
+# map them to IntegerField.
+
+QUANTITY_STEP = Decimal('0.001')
+
+
+def money_field(**kwargs):
+    return serializers.DecimalField(max_digits=14, decimal_places=2, **kwargs)
+
+
+class QuantityDecimalField(serializers.DecimalField):
+    """Rounds extra decimals away instead of rejecting them, as the old float field did."""
+
+    def validate_precision(self, value):
+        return super().validate_precision(value.quantize(QUANTITY_STEP, rounding=ROUND_HALF_UP))
+
+
+def quantity_field(**kwargs):
+    # Quantities stay JSON numbers, as they were when stored as floats
+    return QuantityDecimalField(max_digits=15, decimal_places=3, coerce_to_string=False, **kwargs)
+
+
 # ----------------------------------------------------------------------
 # PRODUCT & VARIANT SERIALIZERS
 # ----------------------------------------------------------------------
 
 class ProductVariantSerializer(serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name', read_only=True)
+    price = money_field()
+    current_stock = quantity_field(required=False)
 
     class Meta:
         model = ProductVariant
@@ -20,6 +54,21 @@ class ProductVariantSerializer(serializers.ModelSerializer):
             'product', 'product_name'
         ]
 
+    # Stock typed in by hand becomes part of the variant's opening stock,
+    # so `manage.py check_ledger` counts it instead of flagging it.
+    @transaction.atomic
+    def create(self, validated_data):
+        variant = super().create(validated_data)
+        record_stock_adjustment(variant.pk, variant.current_stock)
+        return variant
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        old_stock = instance.current_stock
+        variant = super().update(instance, validated_data)
+        record_stock_adjustment(variant.pk, variant.current_stock - old_stock)
+        return variant
+
 
 class ProductSerializer(serializers.ModelSerializer):
     variants = ProductVariantSerializer(many=True, read_only=True)
@@ -52,6 +101,8 @@ class CustomerSerializer(serializers.ModelSerializer):
 
 class CreditSaleItemSerializer(serializers.ModelSerializer):
     variant_name = serializers.CharField(source='variant.__str__', read_only=True)
+    quantity = quantity_field()
+    price_at_sale = money_field()
 
     class Meta:
         model = CreditSaleItem
@@ -61,14 +112,21 @@ class CreditSaleItemSerializer(serializers.ModelSerializer):
 class CreditSaleSerializer(serializers.ModelSerializer):
     items = CreditSaleItemSerializer(many=True)
     customer_name = serializers.CharField(source='customer.name', read_only=True)
+    total_amount = money_field(read_only=True)
+    amount_due = money_field(read_only=True)
 
     class Meta:
         model = CreditSale
-        fields = ['id', 'customer', 'customer_name', 'sale_date', 'items']
+        fields = [
+            'id', 'customer', 'customer_name', 'sale_date', 'items',
+            'total_amount', 'amount_due', 'settled',
+        ]
+        read_only_fields = ['settled']
 
     # ---------------------------------------------------------
     # CREATE METHOD (Existing)
     # ---------------------------------------------------------
+    @transaction.atomic
     def create(self, validated_data):
         items_data = validated_data.pop('items')
         sale = CreditSale.objects.create(**validated_data)
@@ -77,14 +135,23 @@ class CreditSaleSerializer(serializers.ModelSerializer):
             CreditSaleItem.objects.create(sale=sale, **item_data)
 
             variant = item_data['variant']
-            variant.current_stock -= float(item_data['quantity'])
+            variant.current_stock -= item_data['quantity']
             variant.save()
+            stock_changed(variant)
 
+        # Settle the new bill against any credit the customer already has
+        refresh_sale_total(sale)
+        allocate_customer(sale.customer_id)
+        sale.refresh_from_db(fields=['amount_due', 'settled'])
+
+        publish_on_commit('sale', sale=sale.pk, customer=sale.customer_id)
+        balance_changed(sale.customer_id)
         return sale
 
     # ---------------------------------------------------------
     # UPDATE METHOD (Required for editing sales)
     # ---------------------------------------------------------
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Handles full nested update:
@@ -92,10 +159,13 @@ class CreditSaleSerializer(serializers.ModelSerializer):
           - Deletes old items
           - Saves new sale items
           - Subtracts stock for new sale items
+          - Recomputes the total and replays payment allocations
         Ensures stock remains consistent.
         """
 
         new_items = validated_data.pop('items', None)
+        old_customer_id = instance.customer_id
+        touched_variants = {}
 
         # -----------------------
         # 1. REVERT OLD STOCK
@@ -104,8 +174,9 @@ class CreditSaleSerializer(serializers.ModelSerializer):
 
         for i in old_items:
             variant = i.variant
-            variant.current_stock += float(i.quantity)  # restore stock
+            variant.current_stock += i.quantity  # restore stock
             variant.save()
+            touched_variants[variant.pk] = variant
 
         # delete all old sale items
         old_items.delete()
@@ -125,8 +196,26 @@ class CreditSaleSerializer(serializers.ModelSerializer):
                 CreditSaleItem.objects.create(sale=instance, **item)
 
                 variant = item['variant']
-                variant.current_stock -= float(item['quantity'])
+                variant.current_stock -= item['quantity']
                 variant.save()
+                touched_variants[variant.pk] = variant
+
+        # -----------------------
+        # 4. RE-SETTLE AGAINST PAYMENTS
+        # -----------------------
+        refresh_sale_total(instance)
+        for customer_id in {old_customer_id, instance.customer_id}:
+            rebuild_customer(customer_id)
+        instance.refresh_from_db(fields=['amount_due', 'settled'])
+
+        # -----------------------
+        # 5. NOTIFY CONNECTED TILLS
+        # -----------------------
+        for variant in touched_variants.values():
+            stock_changed(variant)
+        publish_on_commit('sale', sale=instance.pk, customer=instance.customer_id)
+        for customer_id in {old_customer_id, instance.customer_id}:
+            balance_changed(customer_id)
 
         return instance
 
@@ -148,6 +237,8 @@ class SupplierSerializer(serializers.ModelSerializer):
 class PurchaseSerializer(serializers.ModelSerializer):
     supplier_name = serializers.CharField(source='supplier.name', read_only=True)
     variant_name = serializers.CharField(source='variant.__str__', read_only=True)
+    quantity = quantity_field()
+    purchase_price = money_field()
 
     class Meta:
         model = Purchase
@@ -167,7 +258,92 @@ class PurchaseSerializer(serializers.ModelSerializer):
 
 class PaymentSerializer(serializers.ModelSerializer):
     payment_date = serializers.DateTimeField(read_only=True)
+    amount = money_field()
+    unallocated = money_field(read_only=True)
 
     class Meta:
         model = Payment
-        fields = ['id', 'customer', 'payment_date', 'amount']
+        fields = ['id', 'customer', 'payment_date', 'amount', 'unallocated']
+
+
+# ----------------------------------------------------------------------
+# OPEN INVOICE SERIALIZER (unsettled sales, no nested items)
+# ----------------------------------------------------------------------
+
+class OpenInvoiceSerializer(serializers.ModelSerializer):
+    customer_name = serializers.CharField(source='customer.name', read_only=True)
+    total_amount = money_field(read_only=True)
+    amount_due = money_field(read_only=True)
+
+    class Meta:
+        model = CreditSale
+        fields = ['id', 'customer', 'customer_name', 'sale_date', 'total_amount', 'amount_due']
+
+
+# ----------------------------------------------------------------------
+# RECEIVABLES AGING ROW (read-only report row, one per customer)
+# ----------------------------------------------------------------------
+
+class AgingRowSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    total_due = serializers.DecimalField(max_digits=12, decimal_places=2)
+    days_0_30 = serializers.DecimalField(max_digits=12, decimal_places=2)
+    days_31_60 = serializers.DecimalField(max_digits=12, decimal_places=2)
+    days_61_90 = serializers.DecimalField(max_digits=12, decimal_places=2)
+    days_90_plus = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+# ----------------------------------------------------------------------
+# BACKGROUND JOB SERIALIZER
+# ----------------------------------------------------------------------
+
+class RebuildAllocationsPayload(serializers.Serializer):
+    customers = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+
+
+class GenerateStatementsPayload(serializers.Serializer):
+    month = serializers.RegexField(r'^\d{4}-(0[1-9]|1[0-2])$', error_messages={'invalid': "Use YYYY-MM."})
+    format = serializers.ChoiceField(choices=['csv', 'html'], required=False)
+    force = serializers.BooleanField(required=False)
+
+
+class CheckLedgerPayload(serializers.Serializer):
+    repair = serializers.BooleanField(required=False)
+
+
+# Job kinds that may be queued through the API, with the payload each
+# accepts. The rest (archive_history, db_maintain) are for operators only,
+# via their management commands or enqueue().
+API_JOB_PAYLOADS = {
+    'rebuild_allocations': RebuildAllocationsPayload,
+    'generate_statements': GenerateStatementsPayload,
+    'check_ledger': CheckLedgerPayload,
+}
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'kind', 'payload', 'priority', 'max_attempts',
+            'status', 'attempts', 'run_after', 'started_at', 'heartbeat_at', 'finished_at',
+            'result', 'last_error', 'created_at',
+        ]
+        read_only_fields = [
+            'status', 'attempts', 'run_after', 'started_at', 'heartbeat_at', 'finished_at',
+            'result', 'last_error', 'created_at',
+        ]
+
+    def validate_kind(self, value):
+        if value not in JOB_REGISTRY or value not in API_JOB_PAYLOADS:
+            raise serializers.ValidationError(f"Unknown job kind. Choose from: {', '.join(sorted(API_JOB_PAYLOADS))}")
+        return value
+
+    def validate(self, attrs):
+        # Only the known fields of the kind's payload are kept
+        payload = API_JOB_PAYLOADS[attrs['kind']](data=attrs.get('payload') or {})
+        if not payload.is_valid():
+            raise serializers.ValidationError({'payload': payload.errors})
+        attrs['payload'] = payload.validated_data
+        return attrs
\ No newline at end of file
@@ -0,0 +1,94 @@
+# core/sqlite_tools.py
+"""
+Helpers for the SQLite deployment, shared by `manage.py sync_replicas`
+and `manage.py db_maintain`.
+"""
+
+import os
+import sqlite3
+import time
+
+from django.db import connections
+
+
+# A stepped backup starts over whenever another connection writes to the
+# source. After this many restarts, or this many seconds, the rest is
+# copied in a single step.
+MAX_BACKUP_RESTARTS = 3
+MAX_BACKUP_SECONDS = 60
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+def copy_database(source, dest, pages=-1, sleep=0, progress=None, max_seconds=MAX_BACKUP_SECONDS):
+    """
+    Copies the sqlite3 connection ``source`` into ``dest`` with SQLite's
+    online backup API. ``pages`` > 0 copies that many pages per step and
+    sleeps ``sleep`` seconds between steps, so writers are only held up for
+    one step at a time. Any write from another connection, even an UPDATE
+    that leaves the page count alone, sends a stepped copy back to the
+    start; a step that does not get closer to the end counts as such a
+    restart. After MAX_BACKUP_RESTARTS of them (a busy till), or once
+    ``max_seconds`` have passed, the copy is redone in one step, which
+    briefly holds off writers but always finishes.
+
+    Returns the number of restarts seen.
+    """
+    restarts = 0
+    last_remaining = None
+    deadline = time.monotonic() + max_seconds
+
+    def step(status, remaining, total):
+        nonlocal restarts, last_remaining
+        if progress:
+            progress(status, remaining, total)
+        if last_remaining is not None and remaining >= last_remaining:
+            restarts += 1
+            if restarts > MAX_BACKUP_RESTARTS:
+                raise _BackupRestarted
+        if remaining and time.monotonic() > deadline:
+            raise _BackupRestarted
+        last_remaining = remaining
+        # sqlite3's own ``sleep`` only applies when the source is busy
+        if remaining and sleep:
+            time.sleep(sleep)
+
+    try:
+        source.backup(dest, pages=pages, progress=step)
+    except _BackupRestarted:
+        source.backup(dest)
+    return restarts
+
+
+def backup_to(target, alias='default', pages=-1, sleep=0, progress=None):
+    """
+    Copies database ``alias`` to the file ``target`` with ``copy_database``.
+    The copy is built beside ``target`` and swapped in atomically, so
+    readers of ``target`` never see a half-written file.
+
+    Returns the number of restarts seen.
+    """
+    tmp_path = f"{target}.tmp"
+    source = connections[alias]
+    source.ensure_connection()
+    dest = sqlite3.connect(tmp_path)
+    try:
+        restarts = copy_database(source.connection, dest, pages=pages, sleep=sleep, progress=progress)
+    finally:
+        dest.close()
+    os.replace(tmp_path, target)
+    return restarts
+
+
+def storage_stats(alias='default'):
+    """Returns file size, page counts and the free-page ratio of ``alias``."""
+    with connections[alias].cursor() as cursor:
+        stats = {}
+        for pragma in ('page_size', 'page_count', 'freelist_count'):
+            cursor.execute(f"PRAGMA {pragma}")
+            stats[pragma] = cursor.fetchone()[0]
+    stats['size'] = stats['page_size'] * stats['page_count']
+    stats['fragmentation'] = stats['freelist_count'] / stats['page_count'] if stats['page_count'] else 0.0
+    return stats
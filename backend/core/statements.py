@@ -0,0 +1,144 @@
+# core/statements.py
+"""
+Month-end customer statements.
+
+``render_partition`` is the unit of work handed to each worker process by
+``manage.py generate_statements``: it loads a whole partition of customers
+with a handful of bulk queries and writes one file per customer.
+"""
+
+import csv
+import io
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db import connections
+from django.db.models import Prefetch, Sum
+from django.template.loader import render_to_string
+
+from .allocation import line_amount
+from .models import Customer, CustomerOpeningBalance, CreditSale, CreditSaleItem, Payment
+
+
+@dataclass
+class StatementLine:
+    date: object
+    description: str
+    debit: Decimal = Decimal('0.00')
+    credit: Decimal = Decimal('0.00')
+    balance: Decimal = Decimal('0.00')
+
+
+@dataclass
+class Statement:
+    customer: Customer
+    opening_balance: Decimal
+    lines: list = field(default_factory=list)
+
+    @property
+    def closing_balance(self):
+        return self.lines[-1].balance if self.lines else self.opening_balance
+
+
+def statement_path(out_dir, customer_id, fmt):
+    return os.path.join(out_dir, f"customer-{customer_id}.{fmt}")
+
+
+def _totals_before(model, date_field, amount_field, customer_ids, start):
+    rows = (
+        model.objects.filter(customer_id__in=customer_ids, **{f'{date_field}__lt': start})
+        .order_by().values('customer_id').annotate(total=Sum(amount_field))
+    )
+    return {row['customer_id']: row['total'] for row in rows}
+
+
+def build_statements(customer_ids, start, end):
+    """Statements for ``customer_ids`` covering ``start <= date < end``."""
+    customers = Customer.objects.filter(id__in=customer_ids).order_by('id')
+    sales_before = _totals_before(CreditSale, 'sale_date', 'total_amount', customer_ids, start)
+    payments_before = _totals_before(Payment, 'payment_date', 'amount', customer_ids, start)
+    # Archived history; statements for months before the archive cutoff
+    # therefore only list the transactions still in the live tables.
+    archived = {
+        opening.customer_id: opening.balance
+        for opening in CustomerOpeningBalance.objects.filter(customer_id__in=customer_ids)
+    }
+
+    sales = (
+        CreditSale.objects.filter(customer_id__in=customer_ids, sale_date__gte=start, sale_date__lt=end)
+        .prefetch_related(Prefetch('items', queryset=CreditSaleItem.objects.select_related('variant__product')))
+    )
+    payments = Payment.objects.filter(
+        customer_id__in=customer_ids, payment_date__gte=start, payment_date__lt=end
+    )
+
+    entries = defaultdict(list)
+    for sale in sales:
+        for item in sale.items.all():
+            entries[sale.customer_id].append(StatementLine(
+                date=sale.sale_date,
+                description=f"Bill #{sale.pk}: {item.variant} x {item.quantity.normalize():f} @ {item.price_at_sale}",
+                debit=line_amount(item.quantity, item.price_at_sale),
+            ))
+    for payment in payments:
+        entries[payment.customer_id].append(StatementLine(
+            date=payment.payment_date,
+            description=f"Payment #{payment.pk}",
+            credit=payment.amount,
+        ))
+
+    statements = []
+    for customer in customers:
+        opening = (
+            archived.get(customer.pk, Decimal('0.00'))
+            + (sales_before.get(customer.pk) or Decimal('0.00'))
+            - (payments_before.get(customer.pk) or Decimal('0.00'))
+        )
+        statement = Statement(customer=customer, opening_balance=opening)
+        balance = opening
+        for line in sorted(entries[customer.pk], key=lambda line: line.date):
+            balance += line.debit - line.credit
+            line.balance = balance
+            statement.lines.append(line)
+        statements.append(statement)
+    return statements
+
+
+def render_csv(statement, month):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['Statement', statement.customer.name, month])
+    writer.writerow(['Date', 'Description', 'Debit', 'Credit', 'Balance'])
+    writer.writerow(['', 'Opening balance', '', '', statement.opening_balance])
+    for line in statement.lines:
+        writer.writerow([
+            line.date.date().isoformat(), line.description,
+            line.debit or '', line.credit or '', line.balance,
+        ])
+    writer.writerow(['', 'Closing balance', '', '', statement.closing_balance])
+    return out.getvalue()
+
+
+def render_html(statement, month):
+    return render_to_string('core/statement.html', {'statement': statement, 'month': month})
+
+
+def _write_atomic(path, content):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as fh:
+        fh.write(content)
+    os.replace(tmp_path, path)
+
+
+def render_partition(customer_ids, start, end, month, out_dir, fmt):
+    """Worker entry point. Returns the number of statements written."""
+    try:
+        render = render_csv if fmt == 'csv' else render_html
+        statements = build_statements(customer_ids, start, end)
+        for statement in statements:
+            _write_atomic(statement_path(out_dir, statement.customer.pk, fmt), render(statement, month))
+        return len(statements)
+    finally:
+        connections.close_all()
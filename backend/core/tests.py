@@ -1,3 +1,222 @@
-from django.test import TestCase
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from decimal import Decimal
 
-# Create your tests here.
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from core.allocation import rebuild_customer
+from core.fields import MoneyField, QuantityField
+from core.models import CreditSale, Customer, Payment, PaymentAllocation, Product, ProductVariant
+from core.serializers import quantity_field
+from core.sqlite_tools import MAX_BACKUP_RESTARTS, copy_database
+
+
+class CopyDatabaseTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'source.sqlite3')
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, body TEXT)")
+            conn.executemany("INSERT INTO item (body) VALUES (?)", [('x' * 500,) for _ in range(200)])
+        conn.close()
+
+    def test_update_only_writer_falls_back_to_single_step(self):
+        # UPDATEs leave the page count alone, so every restart reports the
+        # same number of remaining pages as the step before it
+        stop = threading.Event()
+        updates = 0
+
+        def writer():
+            nonlocal updates
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            try:
+                while not stop.is_set():
+                    conn.execute("UPDATE item SET body = ? WHERE id = 1", (str(updates),))
+                    updates += 1
+                    time.sleep(0.001)
+            finally:
+                conn.close()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        source = sqlite3.connect(self.path, check_same_thread=False)
+        dest = sqlite3.connect(':memory:')
+        try:
+            while not updates:
+                time.sleep(0.001)
+            restarts = copy_database(source, dest, pages=1, sleep=0.01, max_seconds=30)
+        finally:
+            stop.set()
+            thread.join()
+            source.close()
+
+        self.assertGreater(restarts, MAX_BACKUP_RESTARTS)
+        self.assertEqual(dest.execute("SELECT COUNT(*) FROM item").fetchone()[0], 200)
+        self.assertEqual(dest.execute("PRAGMA integrity_check").fetchone()[0], 'ok')
+        dest.close()
+
+    def test_gives_up_stepping_after_max_seconds(self):
+        source = sqlite3.connect(self.path)
+        dest = sqlite3.connect(':memory:')
+        steps = []
+        restarts = copy_database(
+            source, dest, pages=1, sleep=0.01, max_seconds=0,
+            progress=lambda status, remaining, total: steps.append(remaining),
+        )
+        self.assertEqual(restarts, 0)
+        self.assertEqual(len(steps), 1)
+        self.assertEqual(dest.execute("SELECT COUNT(*) FROM item").fetchone()[0], 200)
+        source.close()
+        dest.close()
+
+
+class FixedPointFieldTests(SimpleTestCase):
+
+    def test_rounds_half_up_to_the_stored_unit(self):
+        self.assertEqual(MoneyField().get_prep_value(Decimal('10.005')), 1001)
+        self.assertEqual(MoneyField().get_prep_value(Decimal('-10.005')), -1001)
+        self.assertEqual(MoneyField().get_prep_value('0.014'), 1)
+        self.assertEqual(QuantityField().get_prep_value(Decimal('1.2345')), 1235)
+
+    def test_floats_go_through_their_shortest_repr(self):
+        # 0.1 + 0.2 is 0.30000000000000004; it must not become 0.301
+        self.assertEqual(QuantityField().get_prep_value(0.1 + 0.2), 300)
+        self.assertEqual(MoneyField().get_prep_value(19.99), 1999)
+
+    def test_reads_back_as_scaled_decimal(self):
+        self.assertEqual(MoneyField().from_db_value(1999, None, connection), Decimal('19.99'))
+        self.assertEqual(QuantityField().from_db_value(-1500, None, connection), Decimal('-1.500'))
+
+
+class QuantityDecimalFieldTests(SimpleTestCase):
+
+    def test_rounds_extra_decimals_half_up(self):
+        field = quantity_field()
+        self.assertEqual(field.run_validation('1.23456'), Decimal('1.235'))
+        self.assertEqual(field.run_validation('0.0005'), Decimal('0.001'))
+        self.assertEqual(field.run_validation(2.5), Decimal('2.500'))
+
+    def test_stays_a_json_number(self):
+        self.assertEqual(quantity_field().to_representation(Decimal('1.250')), Decimal('1.250'))
+
+
+class FixedPointMigrationTests(TransactionTestCase):
+    """Float and decimal data written before 0006 survives the conversion."""
+
+    before = [('core', '0005_archive')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.after = executor.loader.graph.leaf_nodes('core')
+        executor.migrate(self.before)
+        self.addCleanup(lambda: MigrationExecutor(connection).migrate(self.after))
+
+    def test_converts_float_and_decimal_columns(self):
+        apps = MigrationExecutor(connection).loader.project_state(self.before).apps
+        Product = apps.get_model('core', 'Product')
+        Variant = apps.get_model('core', 'ProductVariant')
+        product = Product.objects.create(name='Sugar')
+        variant = Variant.objects.create(
+            product=product, name='Loose', unit='kg', price=Decimal('42.50'), current_stock=0.1 + 0.2,
+        )
+        other = Variant.objects.create(
+            product=product, name='1kg', unit='packet', price=Decimal('45.00'), current_stock=2.0005,
+        )
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.after)
+
+        variant = ProductVariant.objects.get(pk=variant.pk)
+        self.assertEqual(variant.current_stock, Decimal('0.300'))
+        self.assertEqual(variant.price, Decimal('42.50'))
+        self.assertEqual(ProductVariant.objects.get(pk=other.pk).current_stock, Decimal('2.001'))
+
+
+class AllocationTests(TestCase):
+    """Payments settle the oldest open sales first, through the API write paths."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.asha = Customer.objects.create(name='Asha')
+        self.ravi = Customer.objects.create(name='Ravi')
+        product = Product.objects.create(name='Rice')
+        self.variant = ProductVariant.objects.create(
+            product=product, name='1kg', unit='kg', price=Decimal('50.00'), current_stock=Decimal('100'),
+        )
+
+    def sell(self, customer, quantity, price='50.00'):
+        response = self.client.post('/api/sales/', {
+            'customer': customer.pk,
+            'items': [{'variant': self.variant.pk, 'quantity': quantity, 'price_at_sale': price}],
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return CreditSale.objects.get(pk=response.data['id'])
+
+    def pay(self, customer, amount):
+        response = self.client.post('/api/payments/', {'customer': customer.pk, 'amount': amount}, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return Payment.objects.get(pk=response.data['id'])
+
+    def assertSettlement(self, obj, **expected):
+        obj.refresh_from_db()
+        self.assertEqual({field: getattr(obj, field) for field in expected}, expected)
+
+    def test_partial_payment_leaves_the_rest_due(self):
+        first, second = self.sell(self.asha, 2), self.sell(self.asha, 1)
+        payment = self.pay(self.asha, '120.00')
+
+        self.assertSettlement(first, amount_due=Decimal('0.00'), settled=True)
+        self.assertSettlement(second, amount_due=Decimal('30.00'), settled=False)
+        self.assertSettlement(payment, unallocated=Decimal('0.00'))
+        self.assertEqual(PaymentAllocation.objects.filter(payment=payment).count(), 2)
+
+    def test_overpayment_becomes_credit_for_the_next_sale(self):
+        first = self.sell(self.asha, 1)
+        payment = self.pay(self.asha, '80.00')
+        self.assertSettlement(first, settled=True)
+        self.assertSettlement(payment, unallocated=Decimal('30.00'))
+
+        second = self.sell(self.asha, 1)
+        self.assertSettlement(second, amount_due=Decimal('20.00'), settled=False)
+        self.assertSettlement(payment, unallocated=Decimal('0.00'))
+
+    def test_moving_a_sale_to_another_customer_resettles_both(self):
+        sale = self.sell(self.asha, 1)
+        asha_payment = self.pay(self.asha, '50.00')
+        ravi_payment = self.pay(self.ravi, '20.00')
+        self.assertSettlement(sale, settled=True)
+
+        response = self.client.put(f'/api/sales/{sale.pk}/', {
+            'customer': self.ravi.pk,
+            'items': [{'variant': self.variant.pk, 'quantity': 1, 'price_at_sale': '50.00'}],
+        }, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.assertSettlement(sale, amount_due=Decimal('30.00'), settled=False)
+        self.assertSettlement(asha_payment, unallocated=Decimal('50.00'))
+        self.assertSettlement(ravi_payment, unallocated=Decimal('0.00'))
+        self.assertFalse(PaymentAllocation.objects.filter(payment=asha_payment).exists())
+
+    def test_deleting_a_sale_frees_its_payment_and_rebuild_agrees(self):
+        first, second = self.sell(self.asha, 1), self.sell(self.asha, 1)
+        payment = self.pay(self.asha, '70.00')
+        self.assertSettlement(second, amount_due=Decimal('30.00'))
+
+        response = self.client.delete(f'/api/sales/{first.pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertSettlement(second, amount_due=Decimal('0.00'), settled=True)
+        self.assertSettlement(payment, unallocated=Decimal('20.00'))
+
+        # A replay from scratch lands on the same state
+        rebuild_customer(self.asha.pk)
+        self.assertSettlement(second, amount_due=Decimal('0.00'), settled=True)
+        self.assertSettlement(payment, unallocated=Decimal('20.00'))
+        self.assertEqual(PaymentAllocation.objects.get().amount, Decimal('50.00'))
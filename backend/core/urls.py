@@ -2,8 +2,10 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     ProductViewSet, ProductVariantViewSet, CustomerViewSet, CreditSaleViewSet,
-    SupplierViewSet, PurchaseViewSet, PaymentViewSet, dashboard_stats, customer_detail_data,
-    AllCustomersListView, AllProductsListView
+    SupplierViewSet, PurchaseViewSet, PaymentViewSet, JobViewSet, dashboard_stats, customer_detail_data,
+    dashboard_stats_async, customer_detail_data_async, event_stream, batch,
+    AllCustomersListView, AllProductsListView, OpenInvoiceListView,
+    AgingReportView
 )
 
 router = DefaultRouter()
@@ -14,12 +16,19 @@ router.register(r'sales', CreditSaleViewSet, basename='sale')  # Added basename
 router.register(r'suppliers', SupplierViewSet, basename='supplier')  # Added basename for clarity
 router.register(r'purchases', PurchaseViewSet, basename='purchase')  # Added basename for clarity
 router.register(r'payments', PaymentViewSet, basename='payment')  # Added basename for clarity
+router.register(r'jobs', JobViewSet, basename='job')
 
 # The order of this list is important.
 urlpatterns = [
     # Custom paths should be listed FIRST.
     path('dashboard/', dashboard_stats, name='dashboard-stats'),
     path('customer-detail/<int:pk>/', customer_detail_data, name='customer-detail-data'),
+    path('async/dashboard/', dashboard_stats_async, name='dashboard-stats-async'),
+    path('async/customer-detail/<int:pk>/', customer_detail_data_async, name='customer-detail-data-async'),
+    path('events/', event_stream, name='event-stream'),
+    path('batch/', batch, name='batch'),
+    path('reports/aging/', AgingReportView.as_view(), name='aging-report'),
+    path('open-invoices/', OpenInvoiceListView.as_view(), name='open-invoices'),
     path('customers/all/', AllCustomersListView.as_view(), name='all-customers'),
     path('products/all/', AllProductsListView.as_view(), name='all-products'),
 
@@ -1,20 +1,49 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import io
+import json
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from decimal import Decimal
-from rest_framework import viewsets, filters
+from asgiref.sync import iscoroutinefunction
+from rest_framework import viewsets, filters, generics, mixins
 from rest_framework.decorators import api_view
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
-from django.db.models import Sum, F, DecimalField
-from django.db.models.functions import Coalesce
-
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections, transaction
+from django.db.models import Sum, Q
+from django.http import (
+    FileResponse, Http404, HttpRequest, HttpResponseNotModified, JsonResponse,
+    QueryDict, StreamingHttpResponse
+)
+from django.urls import Resolver404, resolve
+from django.utils import timezone
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.decorators.http import require_GET, require_safe
+from django.views.static import was_modified_since
+
+from .allocation import allocate_customer, rebuild_customer
+from .db_router import read_only_request
+from .events import get_broadcaster, publish_on_commit, balance_changed
 from .models import (
     Product, ProductVariant, Customer, CreditSale,
-    Supplier, Purchase, Payment
+    Supplier, Purchase, Payment, Job, CustomerOpeningBalance
 )
 from .serializers import (
     ProductSerializer, ProductVariantSerializer, CustomerSerializer,
     CreditSaleSerializer, SupplierSerializer, PurchaseSerializer,
-    PaymentSerializer
+    PaymentSerializer, OpenInvoiceSerializer, AgingRowSerializer,
+    JobSerializer
 )
 
 # ----------------------------------------------------------------------
@@ -26,6 +55,16 @@ class StandardPagination(PageNumberPagination):
     max_page_size = 100
     page_size_query_param = "page_size"
 
+
+class StableOrderingFilter(filters.OrderingFilter):
+    """Ends every ordering with ``id``, so rows that tie keep their page."""
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view) or [])
+        if not {'id', '-id'} & set(ordering):
+            ordering.append('id')
+        return ordering
+
 # ----------------------------------------------------------------------
 # PRODUCT CRUD
 # ----------------------------------------------------------------------
@@ -54,25 +93,8 @@ class CustomerViewSet(viewsets.ModelViewSet):
     ordering = ['name']
 
     def get_queryset(self):
-        # Annotate totals for server-side balance calculation
-        qs = Customer.objects.annotate(
-            total_sales=Coalesce(
-                Sum(
-                    F('sales__items__quantity') *
-                    F('sales__items__price_at_sale'),
-                    output_field=DecimalField()
-                ),
-                Decimal('0.00')
-            ),
-            total_payments=Coalesce(
-                Sum('payments__amount'),
-                Decimal('0.00')
-            )
-        ).annotate(
-            balance=F('total_sales') - F('total_payments')
-        ).order_by('name')
-
-        return qs
+        # Balance comes from the stored sale totals (see core.allocation)
+        return Customer.objects.with_balance().order_by('name')
 
 
 # ----------------------------------------------------------------------
@@ -83,6 +105,81 @@ class CreditSaleViewSet(viewsets.ModelViewSet):
     queryset = CreditSale.objects.all()
     serializer_class = CreditSaleSerializer
 
+    def perform_destroy(self, instance):
+        customer_id = instance.customer_id
+        with transaction.atomic():
+            instance.delete()
+            rebuild_customer(customer_id)
+        balance_changed(customer_id)
+
+
+class OpenInvoiceListView(generics.ListAPIView):
+    """
+    Unsettled credit sales, oldest first, optionally for one customer
+    (``?customer=<id>``). The first row is the oldest unpaid bill.
+    """
+    serializer_class = OpenInvoiceSerializer
+    pagination_class = StandardPagination
+
+    def list(self, request, *args, **kwargs):
+        customer = request.query_params.get('customer')
+        if customer and not customer.isdigit():
+            return Response({"error": "customer must be a customer id"}, status=400)
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        qs = CreditSale.objects.filter(settled=False).select_related('customer')
+        customer = self.request.query_params.get('customer')
+        if customer:
+            qs = qs.filter(customer_id=customer)
+        return qs.order_by('sale_date', 'id')
+
+
+# ----------------------------------------------------------------------
+# RECEIVABLES AGING REPORT
+# ----------------------------------------------------------------------
+
+AGING_BUCKETS = [
+    # (field, newer than N days, up to M days old)
+    ('days_0_30', None, 30),
+    ('days_31_60', 30, 60),
+    ('days_61_90', 60, 90),
+    ('days_90_plus', 90, None),
+]
+
+
+class AgingReportView(generics.ListAPIView):
+    """
+    Outstanding credit per customer split into age bands by sale date.
+    One grouped query over the open (unsettled) sales only; sortable by
+    any band via ``?ordering=-days_61_90``.
+    """
+    serializer_class = AgingRowSerializer
+    pagination_class = StandardPagination
+    filter_backends = [filters.SearchFilter, StableOrderingFilter]
+    search_fields = ['^name']
+    ordering_fields = ['name', 'total_due'] + [field for field, _, _ in AGING_BUCKETS]
+    ordering = ['-total_due', 'name']
+
+    def get_queryset(self):
+        now = timezone.now()
+        buckets = {}
+        for field, newer_than, older_than in AGING_BUCKETS:
+            age = Q()
+            if newer_than is not None:
+                age &= Q(sales__sale_date__lte=now - timedelta(days=newer_than))
+            if older_than is not None:
+                age &= Q(sales__sale_date__gt=now - timedelta(days=older_than))
+            buckets[field] = Sum('sales__amount_due', filter=age, default=0)
+
+        # Filtering before annotating keeps every SUM on the same join of
+        # open sales, which the partial open-sale index serves.
+        return (
+            Customer.objects.filter(sales__settled=False)
+            .annotate(total_due=Sum('sales__amount_due'), **buckets)
+            .values('id', 'name', 'total_due', *buckets)
+        )
+
 
 # ----------------------------------------------------------------------
 # SUPPLIER & PURCHASE CRUD
@@ -106,54 +203,154 @@ class PaymentViewSet(viewsets.ModelViewSet):
     queryset = Payment.objects.all()
     serializer_class = PaymentSerializer
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            payment = serializer.save(unallocated=serializer.validated_data['amount'])
+            allocate_customer(payment.customer_id)
+            payment.refresh_from_db(fields=['unallocated'])
+        publish_on_commit('payment', payment=payment.pk, customer=payment.customer_id)
+        balance_changed(payment.customer_id)
+
+    def perform_update(self, serializer):
+        old_customer_id = serializer.instance.customer_id
+        with transaction.atomic():
+            payment = serializer.save()
+            for customer_id in {old_customer_id, payment.customer_id}:
+                rebuild_customer(customer_id)
+            payment.refresh_from_db(fields=['unallocated'])
+        publish_on_commit('payment', payment=payment.pk, customer=payment.customer_id)
+        for customer_id in {old_customer_id, payment.customer_id}:
+            balance_changed(customer_id)
+
+    def perform_destroy(self, instance):
+        customer_id = instance.customer_id
+        with transaction.atomic():
+            instance.delete()
+            rebuild_customer(customer_id)
+        balance_changed(customer_id)
+
 
 # ----------------------------------------------------------------------
-# DASHBOARD STATS (UNCHANGED)
+# BACKGROUND JOBS (queue + status; run by `manage.py run_worker`)
 # ----------------------------------------------------------------------
 
-@api_view(['GET'])
-def dashboard_stats(request):
-    low_stock_variants = ProductVariant.objects.order_by('current_stock')[:3]
-
-    annotated_customers = Customer.objects.annotate(
-        total_sales=Coalesce(
-            Sum(
-                F('sales__items__quantity') *
-                F('sales__items__price_at_sale'),
-                output_field=DecimalField()
-            ),
-            Decimal('0.0')
-        ),
-        total_payments=Coalesce(
-            Sum('payments__amount'),
-            Decimal('0.0')
-        )
-    ).annotate(
-        balance=F('total_sales') - F('total_payments')
+class JobViewSet(mixins.CreateModelMixin, mixins.ListModelMixin,
+                 mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    queryset = Job.objects.all().order_by('-created_at')
+    serializer_class = JobSerializer
+    pagination_class = StandardPagination
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['created_at', 'priority', 'status']
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        status = self.request.query_params.get('status')
+        return qs.filter(status=status) if status else qs
+
+
+# ----------------------------------------------------------------------
+# DASHBOARD STATS
+# ----------------------------------------------------------------------
+# Each dashboard block is an independent query, so the pieces are kept as
+# plain functions: the sync view runs them in turn, the async view below
+# fans them out over the query pool.
+
+def _low_stock_items():
+    low_stock_variants = ProductVariant.objects.select_related('product').order_by('current_stock')[:3]
+    return ProductVariantSerializer(low_stock_variants, many=True).data
+
+
+def _top_customers_by_credit():
+    top_customers = Customer.objects.with_balance().order_by('-balance')[:3]
+    return [{'name': c.name, 'balance': c.balance} for c in top_customers]
+
+
+def _total_outstanding_credit():
+    total_sales = CreditSale.objects.aggregate(total=Sum('total_amount'))['total'] or 0
+    total_payments = Payment.objects.aggregate(total=Sum('amount'))['total'] or 0
+    opening = CustomerOpeningBalance.objects.aggregate(
+        sales=Sum('sales_total'), payments=Sum('payments_total')
     )
+    return (opening['sales'] or 0) - (opening['payments'] or 0) + total_sales - total_payments
+
+
+def _total_product_variants():
+    return ProductVariant.objects.count()
+
+
+def _total_customers():
+    return Customer.objects.count()
+
 
-    top_customers = annotated_customers.order_by('-balance')[:3]
-    total_outstanding_credit = annotated_customers.aggregate(
-        total_due=Sum('balance')
-    )['total_due'] or 0
+DASHBOARD_SECTIONS = {
+    'low_stock_items': _low_stock_items,
+    'top_customers_by_credit': _top_customers_by_credit,
+    'total_outstanding_credit': _total_outstanding_credit,
+    'total_product_variants': _total_product_variants,
+    'total_customers': _total_customers,
+}
 
-    low_stock_serializer = ProductVariantSerializer(low_stock_variants, many=True)
 
-    return Response({
-        'low_stock_items': low_stock_serializer.data,
-        'top_customers_by_credit': [
-            {'name': c.name, 'balance': c.balance} for c in top_customers
-        ],
-        'total_outstanding_credit': total_outstanding_credit,
-        'total_product_variants': ProductVariant.objects.count(),
-        'total_customers': Customer.objects.count(),
-    })
+@api_view(['GET'])
+def dashboard_stats(request):
+    return Response({key: section() for key, section in DASHBOARD_SECTIONS.items()})
 
 
 # ----------------------------------------------------------------------
-# CUSTOMER DETAIL (UNCHANGED)
+# CUSTOMER DETAIL
 # ----------------------------------------------------------------------
 
+def _customer_sales(pk):
+    return CreditSale.objects.filter(customer_id=pk).order_by('-sale_date')
+
+
+def _customer_payments(pk):
+    return Payment.objects.filter(customer_id=pk).order_by('-payment_date')
+
+
+def _customer_total_sales(pk):
+    return _customer_sales(pk).aggregate(
+        total=Sum('total_amount')
+    )['total'] or Decimal('0.0')
+
+
+def _customer_total_payments(pk):
+    return _customer_payments(pk).aggregate(
+        total=Sum('amount')
+    )['total'] or Decimal('0.0')
+
+
+def _customer_opening_balance(pk):
+    opening = CustomerOpeningBalance.objects.filter(customer_id=pk).first()
+    return opening.balance if opening else Decimal('0.00')
+
+
+def _customer_sections(pk):
+    """
+    Independent pieces of the customer detail payload, keyed by the
+    response field they produce. The customer record itself is fetched
+    separately so a missing customer can short-circuit to a 404.
+    """
+    return {
+        'sales': lambda: CreditSaleSerializer(_customer_sales(pk), many=True).data,
+        'payments': lambda: PaymentSerializer(_customer_payments(pk), many=True).data,
+        'total_sales': lambda: _customer_total_sales(pk),
+        'total_payments': lambda: _customer_total_payments(pk),
+        'opening_balance': lambda: _customer_opening_balance(pk),
+    }
+
+
+def _customer_detail_payload(customer_data, sections):
+    return {
+        "customer": customer_data,
+        "sales": sections['sales'],
+        "payments": sections['payments'],
+        # Archived (settled) history is carried in the opening balance
+        "opening_balance": sections['opening_balance'],
+        "balance": sections['opening_balance'] + sections['total_sales'] - sections['total_payments'],
+    }
+
+
 @api_view(['GET'])
 def customer_detail_data(request, pk):
     """
@@ -165,34 +362,226 @@ def customer_detail_data(request, pk):
     except Customer.DoesNotExist:
         return Response({"error": "Customer not found"}, status=404)
 
-    sales = CreditSale.objects.filter(customer=customer).order_by('-sale_date')
-    payments = Payment.objects.filter(customer=customer).order_by('-payment_date')
+    sections = {key: section() for key, section in _customer_sections(pk).items()}
+    return Response(_customer_detail_payload(CustomerSerializer(customer).data, sections))
+
+
+# ----------------------------------------------------------------------
+# ASYNC COMPOSITE ENDPOINTS (served under ASGI)
+# ----------------------------------------------------------------------
+# Same payloads as the views above, but the independent queries run
+# concurrently on a bounded thread pool. Every pool thread gets its own
+# DB connection, which is released again once the query is done.
+
+QUERY_POOL_SIZE = 4
+_query_pool = ThreadPoolExecutor(max_workers=QUERY_POOL_SIZE, thread_name_prefix='grocer-query')
+
+
+def _with_own_connection(func):
+    def run():
+        try:
+            return func()
+        finally:
+            close_old_connections()
+    return run
+
+
+def _pool_task(func):
+    """Wraps ``func`` to run on the query pool in a copy of the caller's context."""
+    return functools.partial(contextvars.copy_context().run, _with_own_connection(func))
+
+
+async def run_concurrently(funcs):
+    """
+    Runs each zero-argument callable in ``funcs`` (a dict) on the query
+    pool and returns a dict with the same keys mapped to their results.
+    """
+    loop = asyncio.get_running_loop()
+    keys = list(funcs)
+    results = await asyncio.gather(*(
+        loop.run_in_executor(_query_pool, _pool_task(funcs[key])) for key in keys
+    ))
+    return dict(zip(keys, results))
+
+
+def run_in_pool(funcs):
+    """Blocking counterpart of ``run_concurrently`` for sync views."""
+    futures = {key: _query_pool.submit(_pool_task(func)) for key, func in funcs.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
+def _json(data, status=200):
+    return JsonResponse(data, status=status, encoder=JSONEncoder, safe=False)
+
+
+@require_GET
+async def dashboard_stats_async(request):
+    return _json(await run_concurrently(DASHBOARD_SECTIONS))
+
+
+@require_GET
+async def customer_detail_data_async(request, pk):
+    def customer_data():
+        customer = Customer.objects.filter(pk=pk).first()
+        return CustomerSerializer(customer).data if customer else None
+
+    sections = _customer_sections(pk)
+    sections['customer'] = customer_data
+    results = await run_concurrently(sections)
+    if results['customer'] is None:
+        return _json({"error": "Customer not found"}, status=404)
+    return _json(_customer_detail_payload(results['customer'], results))
+
+
+# ----------------------------------------------------------------------
+# LIVE CHANGE EVENTS (server-sent events, ASGI only)
+# ----------------------------------------------------------------------
 
-    # Serialize
-    customer_data = CustomerSerializer(customer).data
-    sales_data = CreditSaleSerializer(sales, many=True).data
-    payments_data = PaymentSerializer(payments, many=True).data
+SSE_KEEPALIVE_SECONDS = 15
 
-    # Compute balance
-    total_sales = sales.aggregate(
-        total=Sum(
-            F('items__quantity') * F('items__price_at_sale'),
-            output_field=DecimalField()
+
+async def _event_stream():
+    events = get_broadcaster().subscribe()
+    next_event = None
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(events))
+            done, _ = await asyncio.wait({next_event}, timeout=SSE_KEEPALIVE_SECONDS)
+            if not done:
+                # Comment line; keeps proxies from closing an idle stream.
+                yield ": keepalive\n\n"
+                continue
+            event = next_event.result()
+            next_event = None
+            yield f"event: {event['type']}\ndata: {json.dumps(event, cls=JSONEncoder)}\n\n"
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            try:
+                await next_event
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+        await events.aclose()
+
+
+@require_GET
+async def event_stream(request):
+    """
+    Streams compact change events (stock, balance, sale, payment) so that
+    every open till can patch its local state instead of refetching lists.
+    """
+    if not isinstance(request, ASGIRequest):
+        # A WSGI worker would block forever draining the endless stream
+        return JsonResponse(
+            {"error": "Live events need the ASGI server (uvicorn backend.asgi:application)."},
+            status=501,
         )
-    )['total'] or Decimal('0.0')
+    response = StreamingHttpResponse(_event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
 
-    total_payments = payments.aggregate(
-        total=Sum('amount')
-    )['total'] or Decimal('0.0')
 
-    balance = total_sales - total_payments
+# ----------------------------------------------------------------------
+# BATCH (several API calls in one round trip)
+# ----------------------------------------------------------------------
+
+BATCH_MAX_REQUESTS = 20
+BATCH_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+# Routes that cannot be replayed as a sync sub-request.
+BATCH_EXCLUDED_ROUTES = {'batch', 'event-stream'}
 
-    return Response({
-        "customer": customer_data,
-        "sales": sales_data,
-        "payments": payments_data,
-        "balance": balance
-    })
+
+def _build_subrequest(request, method, path, body):
+    """
+    Builds an in-process request for ``/api/<path>`` that reuses the
+    outer request's headers, cookies, session and user.
+    """
+    outer = request._request
+    path, _, query = path.lstrip('/').partition('?')
+    raw = json.dumps(body).encode() if body is not None else b''
+
+    sub = HttpRequest()
+    sub.method = method
+    sub.path = sub.path_info = f'/api/{path}'
+    sub.META = {
+        **outer.META,
+        'REQUEST_METHOD': method,
+        'PATH_INFO': sub.path_info,
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(raw)),
+    }
+    sub.GET = QueryDict(query)
+    sub.COOKIES = outer.COOKIES
+    sub._stream = io.BytesIO(raw)
+    sub._read_started = False
+    for attr in ('user', 'session'):
+        if hasattr(outer, attr):
+            setattr(sub, attr, getattr(outer, attr))
+    return sub
+
+
+def _run_subrequest(request, spec):
+    method = str(spec.get('method', 'GET')).upper()
+    path = spec.get('path')
+    if method not in BATCH_METHODS or not isinstance(path, str):
+        return {'status': 400, 'body': {'error': 'Each request needs a "path" and a valid "method".'}}
+
+    sub = _build_subrequest(request, method, path, spec.get('body'))
+    try:
+        match = resolve(sub.path_info)
+    except Resolver404:
+        return {'status': 404, 'body': {'error': 'Not found'}}
+    if match.url_name in BATCH_EXCLUDED_ROUTES or iscoroutinefunction(match.func):
+        return {'status': 400, 'body': {'error': f'{path} cannot be batched'}}
+
+    response = match.func(sub, *match.args, **match.kwargs)
+    if hasattr(response, 'data'):
+        # DRF response: hand the data straight to the outer renderer.
+        return {'status': response.status_code, 'body': response.data}
+    content = response.content.decode() if response.content else None
+    if content and response.get('Content-Type', '').startswith('application/json'):
+        content = json.loads(content)
+    return {'status': response.status_code, 'body': content}
+
+
+@api_view(['POST'])
+def batch(request):
+    """
+    Runs several API calls in one round trip. Body::
+
+        {"parallel": true,
+         "requests": [{"method": "GET", "path": "customers/all/"},
+                      {"method": "GET", "path": "variants/"}]}
+
+    Responses come back in request order as ``{"status", "body"}``.
+    Sub-requests run one after another on this request's DB connection;
+    with ``parallel`` set and only GETs in the batch, they run on the
+    query pool instead. A batch of only GETs reads from replicas like a
+    plain GET does.
+    """
+    specs = request.data.get('requests') if isinstance(request.data, dict) else None
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+        return Response({"error": '"requests" must be a list of objects'}, status=400)
+    if len(specs) > BATCH_MAX_REQUESTS:
+        return Response({"error": f"At most {BATCH_MAX_REQUESTS} requests per batch"}, status=400)
+
+    read_only = all(str(spec.get('method', 'GET')).upper() == 'GET' for spec in specs)
+    # A batch of GETs is a read, even though it arrives as a POST
+    with read_only_request(request._request) if read_only else contextlib.nullcontext():
+        if request.data.get('parallel') and read_only:
+            results = run_in_pool({
+                index: functools.partial(_run_subrequest, request, spec)
+                for index, spec in enumerate(specs)
+            })
+            responses = [results[index] for index in range(len(specs))]
+        else:
+            responses = [_run_subrequest(request, spec) for spec in specs]
+
+    return Response({'responses': responses})
 
 
 # ----------------------------------------------------------------------
@@ -215,3 +604,69 @@ class AllCustomersListView(APIView):
         customers = Customer.objects.all().order_by('name')
         serializer = CustomerSerializer(customers, many=True)
         return Response(serializer.data)
+
+
+# ----------------------------------------------------------------------
+# FRONTEND (the React production build)
+# ----------------------------------------------------------------------
+
+# Precompressed variants written by `manage.py compress_frontend`, best first
+PRECOMPRESSED = [('br', '.br'), ('gzip', '.gz')]
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+
+def _accepted_encodings(request):
+    """Codings in the Accept-Encoding header, minus any refused with q=0."""
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = part.partition(';')
+        name, _, quality = params.strip().partition('=')
+        try:
+            refused = name.strip() == 'q' and float(quality) == 0
+        except ValueError:
+            refused = False
+        if not refused:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+@require_safe
+def frontend(request, path=''):
+    """
+    Serves files from FRONTEND_BUILD_DIR, and index.html for every other
+    path so client-side routes survive a reload. Files under static/ carry
+    a content hash in their name and are cached forever; everything else
+    is revalidated on each load so a new build shows up straight away.
+    """
+    try:
+        full_path = safe_join(settings.FRONTEND_BUILD_DIR, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        if path.startswith('static/'):
+            raise Http404
+        full_path = os.path.join(settings.FRONTEND_BUILD_DIR, 'index.html')
+        if not os.path.isfile(full_path):
+            raise Http404("Frontend build not found; see Deployment in frontend/README.md.")
+
+    stat = os.stat(full_path)
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime):
+        return HttpResponseNotModified()
+
+    content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+    served_path, encoding = full_path, None
+    accepted = _accepted_encodings(request)
+    for coding, suffix in PRECOMPRESSED:
+        if coding in accepted and os.path.isfile(full_path + suffix):
+            served_path, encoding = full_path + suffix, coding
+            break
+
+    response = FileResponse(open(served_path, 'rb'), content_type=content_type)
+    response.headers.pop('Content-Disposition', None)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Vary'] = 'Accept-Encoding'
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    is_hashed = os.path.relpath(full_path, settings.FRONTEND_BUILD_DIR).startswith('static' + os.sep)
+    response['Cache-Control'] = IMMUTABLE_CACHE if is_hashed else 'no-cache'
+    return response
@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[118],{3118:(e,n,r)=>{r.r(n),r.d(n,{default:()=>u});r(5043);var s=r(5352),t=r(3969),i=r(5895),d=r(998),c=r(1244),h=r(6128),l=r(5315),o=r(2394),a=r(8403),x=r(6185),j=r(579);const u=function(e){let{filteredProducts:n,filteredCustomers:r}=e;return(0,j.jsxs)(t.A,{children:[(0,j.jsx)(i.A,{variant:"h2",gutterBottom:!0,children:"\ud83d\udd0d Search Results"}),(0,j.jsxs)(d.A,{container:!0,spacing:3,children:[(0,j.jsx)(d.A,{item:!0,xs:12,md:6,children:(0,j.jsx)(c.A,{children:(0,j.jsxs)(h.A,{children:[(0,j.jsx)(i.A,{variant:"h3",gutterBottom:!0,children:"Matching Customers"}),r.length>0?(0,j.jsx)(l.A,{children:r.map(e=>(0,j.jsx)(o.Ay,{disablePadding:!0,children:(0,j.jsx)(a.A,{component:s.N_,to:"/customer/".concat(e.id),children:(0,j.jsx)(x.A,{primary:e.name})})},e.id))}):(0,j.jsx)(i.A,{children:"No customers found."})]})})}),(0,j.jsx)(d.A,{item:!0,xs:12,md:6,children:(0,j.jsx)(c.A,{children:(0,j.jsxs)(h.A,{children:[(0,j.jsx)(i.A,{variant:"h3",gutterBottom:!0,children:"Matching Products"}),n.length>0?(0,j.jsx)(l.A,{children:n.map(e=>(0,j.jsx)(o.Ay,{children:(0,j.jsx)(x.A,{primary:e.name})},e.id))}):(0,j.jsx)(i.A,{children:"No products found."})]})})})]})]})}}}]);
-//# sourceMappingURL=118.4a4b5da8.chunk.js.map
\ No newline at end of file
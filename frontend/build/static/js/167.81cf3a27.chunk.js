@@ -1,3 +0,0 @@
-/*! For license information please see 167.81cf3a27.chunk.js.LICENSE.txt */
-(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[167],{1497:(e,t,o)=>{"use strict";var n=o(3218);function r(){}function l(){}l.resetWarningCache=r,e.exports=function(){function e(e,t,o,r,l,i){if(i!==n){var a=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw a.name="Invariant Violation",a}}function t(){return e}e.isRequired=e;var o={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:l,resetWarningCache:r};return o.PropTypes=o,o}},1773:(e,t,o)=>{"use strict";o.d(t,{A:()=>l});var n=o(9992),r=o(579);const l=(0,n.A)((0,r.jsx)("path",{d:"M3 17.25V21h3.75L17.81 9.94l-3.75-3.75zM20.71 7.04c.39-.39.39-1.02 0-1.41l-2.34-2.34a.996.996 0 0 0-1.41 0l-1.83 1.83 3.75 3.75z"}),"Edit")},2330:(e,t,o)=>{"use strict";var n=o(5043);var r="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t},l=n.useState,i=n.useEffect,a=n.useLayoutEffect,s=n.useDebugValue;function c(e){var t=e.getSnapshot;e=e.value;try{var o=t();return!r(e,o)}catch(n){return!0}}var u="undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement?function(e,t){return t()}:function(e,t){var o=t(),n=l({inst:{value:o,getSnapshot:t}}),r=n[0].inst,u=n[1];return a(function(){r.value=o,r.getSnapshot=t,c(r)&&u({inst:r})},[e,o,t]),i(function(){return c(r)&&u({inst:r}),e(function(){c(r)&&u({inst:r})})},[e]),s(o),o};t.useSyncExternalStore=void 0!==n.useSyncExternalStore?n.useSyncExternalStore:u},3218:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},5173:(e,t,o)=>{e.exports=o(1497)()},6347:(e,t,o)=>{"use strict";o.d(t,{z:()=>$v});var n=o(8168),r=o(5043),l=o(5173);const i=parseInt(r.version,10),a=e=>{if(i>=19){var t;const o=t=>{var o;return e(t,null!==(o=t.ref)&&void 0!==o?o:null)};return o.displayName=null!==(t=e.displayName)&&void 0!==t?t:e.name,o}return r.forwardRef(e)};var s=o(8587),c=o(8387),u=o(1767),d=o(3635),p=o(1807);const f=Object.is;function g(e,t){if(e===t)return!0;if(!(e instanceof Object)||!(t instanceof Object))return!1;let o=0,n=0;for(const r in e){if(o+=1,!f(e[r],t[r]))return!1;if(!(r in t))return!1}for(const r in t)n+=1;return o===n}function h(e){return r.memo(e,g)}var m=o(8128),v=o(6061),b=o(9857);function w(e){return(0,v.Ay)("MuiDataGrid",e)}const C=(0,b.A)("MuiDataGrid",["aiAssistantPanel","aiAssistantPanelHeader","aiAssistantPanelTitleContainer","aiAssistantPanelTitle","aiAssistantPanelBody","aiAssistantPanelEmptyText","aiAssistantPanelFooter","aiAssistantPanelConversation","aiAssistantPanelConversationList","aiAssistantPanelConversationTitle","aiAssistantPanelSuggestions","aiAssistantPanelSuggestionsList","aiAssistantPanelSuggestionsItem","aiAssistantPanelSuggestionsLabel","actionsCell","aggregationColumnHeader","aggregationColumnHeader--alignLeft","aggregationColumnHeader--alignCenter","aggregationColumnHeader--alignRight","aggregationColumnHeaderLabel","aggregationRowOverlayWrapper","autoHeight","autosizing","mainContent","withSidePanel","booleanCell","cell--editable","cell--editing","cell--flex","cell--textCenter","cell--textLeft","cell--textRight","cell--rangeTop","cell--rangeBottom","cell--rangeLeft","cell--rangeRight","cell--pinnedLeft","cell--pinnedRight","cell--selectionMode","cell","cellCheckbox","cellEmpty","cellSkeleton","cellOffsetLeft","checkboxInput","collapsible","collapsibleTrigger","collapsibleIcon","collapsiblePanel","columnHeader","columnHeader--alignCenter","columnHeader--alignLeft","columnHeader--alignRight","columnHeader--dragging","columnHeader--moving","columnHeader--numeric","columnHeader--sortable","columnHeader--sorted","columnHeader--filtered","columnHeader--pinnedLeft","columnHeader--pinnedRight","columnHeader--last","columnHeader--lastUnpinned","columnHeader--siblingFocused","columnHeader--filter","columnHeaderFilterInput","columnHeaderFilterOperatorLabel","columnHeaderCheckbox","columnHeaderDraggableContainer","columnHeaderTitle","columnHeaderTitleContainer","columnHeaderTitleContainerContent","columnHeader--filledGroup","columnHeader--emptyGroup","columnHeaders","columnSeparator--resizable","columnSeparator--resizing","columnSeparator--sideLeft","columnSeparator--sideRight","columnSeparator","columnsManagement","columnsManagementRow","columnsManagementHeader","columnsManagementSearchInput","columnsManagementFooter","columnsManagementScrollArea","columnsManagementEmptyText","container--top","container--bottom","detailPanel","detailPanelToggleCell","detailPanelToggleCell--expanded","footerCell","panel","panelHeader","panelWrapper","panelContent","panelFooter","paper","editBooleanCell","editInputCell","filler","filler--borderBottom","filler--pinnedLeft","filler--pinnedRight","filterForm","filterFormDeleteIcon","filterFormLogicOperatorInput","filterFormColumnInput","filterFormOperatorInput","filterFormValueInput","filterIcon","footerContainer","headerFilterRow","iconButtonContainer","iconSeparator","main","main--hasPinnedRight","main--hiddenContent","menu","menuIcon","menuIconButton","menuOpen","menuList","overlay","overlayWrapper","overlayWrapperInner","root","root--densityStandard","root--densityComfortable","root--densityCompact","root--disableUserSelection","root--noToolbar","row","row--editable","row--editing","row--firstVisible","row--lastVisible","row--dragging","row--dropAbove","row--dropBelow","row--beingDragged","row--dynamicHeight","row--detailPanelExpanded","row--borderBottom","rowReorderCellPlaceholder","rowCount","rowReorderCellContainer","rowReorderCell","rowReorderCell--draggable","rowReorderIcon","rowSkeleton","scrollArea--left","scrollArea--right","scrollArea--up","scrollArea--down","scrollArea","scrollbar","scrollbar--vertical","scrollbar--horizontal","scrollbarFiller","scrollbarFiller--header","scrollbarFiller--borderTop","scrollbarFiller--borderBottom","scrollbarFiller--pinnedRight","selectedRowCount","sortButton","sortIcon","shadowScrollArea","sidebar","sidebarHeader","toolbarContainer","toolbar","toolbarLabel","toolbarDivider","toolbarFilterList","toolbarQuickFilter","toolbarQuickFilterTrigger","toolbarQuickFilterControl","virtualScroller","virtualScroller--hasScrollX","virtualScrollerContent","virtualScrollerContent--overflowed","virtualScrollerRenderZone","withVerticalBorder","withBorderColor","cell--withRightBorder","cell--withLeftBorder","columnHeader--withRightBorder","columnHeader--withLeftBorder","treeDataGroupingCell","treeDataGroupingCellToggle","treeDataGroupingCellLoadingContainer","groupingCriteriaCell","groupingCriteriaCellToggle","groupingCriteriaCellLoadingContainer","pinnedRows","pinnedRows--top","pinnedRows--bottom","pivotPanelAvailableFields","pivotPanelField","pivotPanelField--sorted","pivotPanelFieldActionContainer","pivotPanelFieldCheckbox","pivotPanelFieldDragIcon","pivotPanelFieldList","pivotPanelFieldName","pivotPanelHeader","pivotPanelPlaceholder","pivotPanelScrollArea","pivotPanelSearchContainer","pivotPanelSection","pivotPanelSectionTitle","pivotPanelSections","pivotPanelSwitch","pivotPanelSwitchLabel","prompt","promptContent","promptText","promptFeedback","promptChangeList","promptChangesToggle","promptChangesToggleIcon","promptIcon","promptIconContainer","promptError","promptAction"]),y={values:{xs:0,sm:600,md:900,lg:1200,xl:1536},up:e=>{const t=y.values,o="number"===typeof t[e]?t[e]:e;return"@media (min-width:".concat(o,"px)")}},A={spacingUnit:"--DataGrid-t-spacing-unit",colors:{border:{base:"--DataGrid-t-color-border-base"},foreground:{base:"--DataGrid-t-color-foreground-base",muted:"--DataGrid-t-color-foreground-muted",accent:"--DataGrid-t-color-foreground-accent",disabled:"--DataGrid-t-color-foreground-disabled",error:"--DataGrid-t-color-foreground-error"},background:{base:"--DataGrid-t-color-background-base",overlay:"--DataGrid-t-color-background-overlay",backdrop:"--DataGrid-t-color-background-backdrop"},interactive:{hover:"--DataGrid-t-color-interactive-hover",hoverOpacity:"--DataGrid-t-color-interactive-hover-opacity",focus:"--DataGrid-t-color-interactive-focus",focusOpacity:"--DataGrid-t-color-interactive-focus-opacity",disabled:"--DataGrid-t-color-interactive-disabled",disabledOpacity:"--DataGrid-t-color-interactive-disabled-opacity",selected:"--DataGrid-t-color-interactive-selected",selectedOpacity:"--DataGrid-t-color-interactive-selected-opacity"}},header:{background:{base:"--DataGrid-t-header-background-base"}},cell:{background:{pinned:"--DataGrid-t-cell-background-pinned"}},radius:{base:"--DataGrid-t-radius-base"},typography:{font:{body:"--DataGrid-t-typography-font-body",small:"--DataGrid-t-typography-font-small",large:"--DataGrid-t-typography-font-large"},fontFamily:{base:"--DataGrid-t-typography-font-family-base"},fontWeight:{light:"--DataGrid-t-typography-font-weight-light",regular:"--DataGrid-t-typography-font-weight-regular",medium:"--DataGrid-t-typography-font-weight-medium",bold:"--DataGrid-t-typography-font-weight-bold"}},transitions:{easing:{easeIn:"--DataGrid-t-transition-easing-ease-in",easeOut:"--DataGrid-t-transition-easing-ease-out",easeInOut:"--DataGrid-t-transition-easing-ease-in-out"},duration:{short:"--DataGrid-t-transition-duration-short",base:"--DataGrid-t-transition-duration-base",long:"--DataGrid-t-transition-duration-long"}},shadows:{base:"--DataGrid-t-shadow-base",overlay:"--DataGrid-t-shadow-overlay"},zIndex:{panel:"--DataGrid-t-z-index-panel",menu:"--DataGrid-t-z-index-menu"}},x=function e(t){if("string"===typeof t)return"var(".concat(t,")");const o={};for(const n in t)Object.hasOwn(t,n)&&(o[n]=e(t[n]));return o}(A),S=(0,n.A)({breakpoints:y,spacing:function(e,t,o,n){if(void 0===e)return R(1);if(void 0===t)return R(e);if(void 0===o)return R(e)+" "+R(t);if(void 0===n)return R(e)+" "+R(t)+" "+R(o);return R(e)+" "+R(t)+" "+R(o)+" "+R(n)},transition:function(e,t){const{duration:o=S.transitions.duration.base,easing:n=S.transitions.easing.easeInOut,delay:r=0}=null!==t&&void 0!==t?t:{};return e.map(e=>"".concat(e," ").concat(o," ").concat(n," ").concat(r,"ms")).join(", ")},keys:A},x);function R(e){return 0===e?"0":"calc(var(--DataGrid-t-spacing-unit) * ".concat(e,")")}var M=o(9461),I=o(7307);const P=Object.is,k=g,E=(e,t)=>e===t||e.length===t.length&&e.every((e,o)=>e===t[o]),F=()=>({state:null,equals:null,selector:null,args:void 0}),T=[],H=()=>null;function D(e,t){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:P;const l=(0,I.A)(F),i=null!==l.current.selector,[a,s]=r.useState(i?null:t(e,o));l.current.state=a,l.current.equals=n,l.current.selector=t;const c=l.current.args;if(l.current.args=o,i&&!((e,t)=>{let o=Object.is;return t instanceof Array?o=E:t instanceof Object&&(o=k),o(e,t)})(c,o)){const t=l.current.selector(e,l.current.args);l.current.equals(l.current.state,t)||(l.current.state=t,s(t))}const u=r.useCallback(()=>(l.current.subscription||(l.current.subscription=e.current.store.subscribe(()=>{const t=l.current.selector(e,l.current.args);l.current.equals(l.current.state,t)||(l.current.state=t,s(t))})),null),T),d=r.useCallback(()=>(l.current.subscription||u(),()=>{l.current.subscription&&(l.current.subscription(),l.current.subscription=void 0)}),T);return(0,M.useSyncExternalStore)(d,u,H),a}const O=r.createContext(void 0);function z(){const e=r.useContext(O);if(void 0===e)throw new Error(["MUI X: Could not find the Data Grid private context.","It looks like you rendered your component outside of a DataGrid, DataGridPro or DataGridPremium parent component.","This can also happen if you are bundling multiple versions of the Data Grid."].join("\n"));return e}const L={width:3,rx:1.5,x:10.5},j=e=>e.current.state.dimensions.hasScrollX&&(!e.current.state.dimensions.hasScrollY||0===e.current.state.dimensions.scrollbarSize),N=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"Root",overridesResolver:(e,t)=>[t.root,{["&.".concat(C.autoHeight)]:t.autoHeight},{["&.".concat(C.autosizing)]:t.autosizing},{["&.".concat(C["root--densityStandard"])]:t["root--densityStandard"]},{["&.".concat(C["root--densityComfortable"])]:t["root--densityComfortable"]},{["&.".concat(C["root--densityCompact"])]:t["root--densityCompact"]},{["&.".concat(C["root--disableUserSelection"])]:t["root--disableUserSelection"]},{["&.".concat(C["root--noToolbar"])]:t["root--noToolbar"]},{["&.".concat(C.withVerticalBorder)]:t.withVerticalBorder},{["& .".concat(C.actionsCell)]:t.actionsCell},{["& .".concat(C.booleanCell)]:t.booleanCell},{["& .".concat(C.cell)]:t.cell},{["& .".concat(C["cell--editable"])]:t["cell--editable"]},{["& .".concat(C["cell--editing"])]:t["cell--editing"]},{["& .".concat(C["cell--flex"])]:t["cell--flex"]},{["& .".concat(C["cell--pinnedLeft"])]:t["cell--pinnedLeft"]},{["& .".concat(C["cell--pinnedRight"])]:t["cell--pinnedRight"]},{["& .".concat(C["cell--rangeBottom"])]:t["cell--rangeBottom"]},{["& .".concat(C["cell--rangeLeft"])]:t["cell--rangeLeft"]},{["& .".concat(C["cell--rangeRight"])]:t["cell--rangeRight"]},{["& .".concat(C["cell--rangeTop"])]:t["cell--rangeTop"]},{["& .".concat(C["cell--selectionMode"])]:t["cell--selectionMode"]},{["& .".concat(C["cell--textCenter"])]:t["cell--textCenter"]},{["& .".concat(C["cell--textLeft"])]:t["cell--textLeft"]},{["& .".concat(C["cell--textRight"])]:t["cell--textRight"]},{["& .".concat(C["cell--withLeftBorder"])]:t["cell--withLeftBorder"]},{["& .".concat(C["cell--withRightBorder"])]:t["cell--withRightBorder"]},{["& .".concat(C.cellCheckbox)]:t.cellCheckbox},{["& .".concat(C.cellEmpty)]:t.cellEmpty},{["& .".concat(C.cellOffsetLeft)]:t.cellOffsetLeft},{["& .".concat(C.cellSkeleton)]:t.cellSkeleton},{["& .".concat(C.checkboxInput)]:t.checkboxInput},{["& .".concat(C.columnHeader)]:t.columnHeader},{["& .".concat(C["columnHeader--alignCenter"])]:t["columnHeader--alignCenter"]},{["& .".concat(C["columnHeader--alignLeft"])]:t["columnHeader--alignLeft"]},{["& .".concat(C["columnHeader--alignRight"])]:t["columnHeader--alignRight"]},{["& .".concat(C["columnHeader--dragging"])]:t["columnHeader--dragging"]},{["& .".concat(C["columnHeader--emptyGroup"])]:t["columnHeader--emptyGroup"]},{["& .".concat(C["columnHeader--filledGroup"])]:t["columnHeader--filledGroup"]},{["& .".concat(C["columnHeader--filtered"])]:t["columnHeader--filtered"]},{["& .".concat(C["columnHeader--last"])]:t["columnHeader--last"]},{["& .".concat(C["columnHeader--lastUnpinned"])]:t["columnHeader--lastUnpinned"]},{["& .".concat(C["columnHeader--moving"])]:t["columnHeader--moving"]},{["& .".concat(C["columnHeader--numeric"])]:t["columnHeader--numeric"]},{["& .".concat(C["columnHeader--pinnedLeft"])]:t["columnHeader--pinnedLeft"]},{["& .".concat(C["columnHeader--pinnedRight"])]:t["columnHeader--pinnedRight"]},{["& .".concat(C["columnHeader--siblingFocused"])]:t["columnHeader--siblingFocused"]},{["& .".concat(C["columnHeader--sortable"])]:t["columnHeader--sortable"]},{["& .".concat(C["columnHeader--sorted"])]:t["columnHeader--sorted"]},{["& .".concat(C["columnHeader--withLeftBorder"])]:t["columnHeader--withLeftBorder"]},{["& .".concat(C["columnHeader--withRightBorder"])]:t["columnHeader--withRightBorder"]},{["& .".concat(C.columnHeaderCheckbox)]:t.columnHeaderCheckbox},{["& .".concat(C.columnHeaderDraggableContainer)]:t.columnHeaderDraggableContainer},{["& .".concat(C.columnHeaderTitleContainer)]:t.columnHeaderTitleContainer},{["& .".concat(C.columnHeaderTitleContainerContent)]:t.columnHeaderTitleContainerContent},{["& .".concat(C.columnSeparator)]:t.columnSeparator},{["& .".concat(C["columnSeparator--resizable"])]:t["columnSeparator--resizable"]},{["& .".concat(C["columnSeparator--resizing"])]:t["columnSeparator--resizing"]},{["& .".concat(C["columnSeparator--sideLeft"])]:t["columnSeparator--sideLeft"]},{["& .".concat(C["columnSeparator--sideRight"])]:t["columnSeparator--sideRight"]},{["& .".concat(C["container--bottom"])]:t["container--bottom"]},{["& .".concat(C["container--top"])]:t["container--top"]},{["& .".concat(C.detailPanelToggleCell)]:t.detailPanelToggleCell},{["& .".concat(C["detailPanelToggleCell--expanded"])]:t["detailPanelToggleCell--expanded"]},{["& .".concat(C.editBooleanCell)]:t.editBooleanCell},{["& .".concat(C.filterIcon)]:t.filterIcon},{["& .".concat(C["filler--borderBottom"])]:t["filler--borderBottom"]},{["& .".concat(C["filler--pinnedLeft"])]:t["filler--pinnedLeft"]},{["& .".concat(C["filler--pinnedRight"])]:t["filler--pinnedRight"]},{["& .".concat(C.groupingCriteriaCell)]:t.groupingCriteriaCell},{["& .".concat(C.groupingCriteriaCellLoadingContainer)]:t.groupingCriteriaCellLoadingContainer},{["& .".concat(C.groupingCriteriaCellToggle)]:t.groupingCriteriaCellToggle},{["& .".concat(C.headerFilterRow)]:t.headerFilterRow},{["& .".concat(C.iconSeparator)]:t.iconSeparator},{["& .".concat(C.menuIcon)]:t.menuIcon},{["& .".concat(C.menuIconButton)]:t.menuIconButton},{["& .".concat(C.menuList)]:t.menuList},{["& .".concat(C.menuOpen)]:t.menuOpen},{["& .".concat(C.overlayWrapperInner)]:t.overlayWrapperInner},{["& .".concat(C.pinnedRows)]:t.pinnedRows},{["& .".concat(C["pinnedRows--bottom"])]:t["pinnedRows--bottom"]},{["& .".concat(C["pinnedRows--top"])]:t["pinnedRows--top"]},{["& .".concat(C.row)]:t.row},{["& .".concat(C["row--borderBottom"])]:t["row--borderBottom"]},{["& .".concat(C["row--detailPanelExpanded"])]:t["row--detailPanelExpanded"]},{["& .".concat(C["row--dragging"])]:t["row--dragging"]},{["& .".concat(C["row--dynamicHeight"])]:t["row--dynamicHeight"]},{["& .".concat(C["row--editable"])]:t["row--editable"]},{["& .".concat(C["row--editing"])]:t["row--editing"]},{["& .".concat(C["row--firstVisible"])]:t["row--firstVisible"]},{["& .".concat(C["row--lastVisible"])]:t["row--lastVisible"]},{["& .".concat(C.rowReorderCell)]:t.rowReorderCell},{["& .".concat(C["rowReorderCell--draggable"])]:t["rowReorderCell--draggable"]},{["& .".concat(C.rowReorderCellContainer)]:t.rowReorderCellContainer},{["& .".concat(C.rowReorderCellPlaceholder)]:t.rowReorderCellPlaceholder},{["& .".concat(C.rowSkeleton)]:t.rowSkeleton},{["& .".concat(C.scrollbar)]:t.scrollbar},{["& .".concat(C["scrollbar--horizontal"])]:t["scrollbar--horizontal"]},{["& .".concat(C["scrollbar--vertical"])]:t["scrollbar--vertical"]},{["& .".concat(C.scrollbarFiller)]:t.scrollbarFiller},{["& .".concat(C["scrollbarFiller--borderBottom"])]:t["scrollbarFiller--borderBottom"]},{["& .".concat(C["scrollbarFiller--borderTop"])]:t["scrollbarFiller--borderTop"]},{["& .".concat(C["scrollbarFiller--header"])]:t["scrollbarFiller--header"]},{["& .".concat(C["scrollbarFiller--pinnedRight"])]:t["scrollbarFiller--pinnedRight"]},{["& .".concat(C.sortIcon)]:t.sortIcon},{["& .".concat(C.treeDataGroupingCell)]:t.treeDataGroupingCell},{["& .".concat(C.treeDataGroupingCellLoadingContainer)]:t.treeDataGroupingCellLoadingContainer},{["& .".concat(C.treeDataGroupingCellToggle)]:t.treeDataGroupingCellToggle},{["& .".concat(C.withBorderColor)]:t.withBorderColor},{["& .".concat(C["row--dropAbove"])]:t["row--dropAbove"]},{["& .".concat(C["row--dropBelow"])]:t["row--dropBelow"]},{["& .".concat(C["row--beingDragged"])]:t["row--beingDragged"]}]})(()=>{const e=D(z(),j),t=S.colors.background.base,o=S.header.background.base,n=S.cell.background.pinned,r=B(S.colors.interactive.hover,1);const l=S.colors.interactive.hoverOpacity,i=S.colors.interactive.selected,a=S.colors.interactive.selectedOpacity,s=i,c="calc(".concat(a," + ").concat(l,")"),u=V(t,r,l),d=V(t,i,a),p=V(t,s,c),f=V(n,r,l),g=V(n,i,a),h=V(n,s,c),m=e=>({["& .".concat(C["cell--pinnedLeft"],", & .").concat(C["cell--pinnedRight"])]:{backgroundColor:e,"&.Mui-selected":{backgroundColor:V(e,d,a),"&:hover":{backgroundColor:V(e,p,c)}}}}),v=m(f),b=m(g),w=m(h),y={backgroundColor:d,"&:hover":{backgroundColor:p,"@media (hover: none)":{backgroundColor:d}}};return{"--unstable_DataGrid-radius":S.radius.base,"--unstable_DataGrid-headWeight":S.typography.fontWeight.medium,"--DataGrid-rowBorderColor":S.colors.border.base,"--DataGrid-cellOffsetMultiplier":2,"--DataGrid-width":"0px","--DataGrid-hasScrollX":"0","--DataGrid-hasScrollY":"0","--DataGrid-scrollbarSize":"10px","--DataGrid-rowWidth":"0px","--DataGrid-columnsTotalWidth":"0px","--DataGrid-leftPinnedWidth":"0px","--DataGrid-rightPinnedWidth":"0px","--DataGrid-headerHeight":"0px","--DataGrid-headersTotalHeight":"0px","--DataGrid-topContainerHeight":"0px","--DataGrid-bottomContainerHeight":"0px",flex:1,boxSizing:"border-box",position:"relative",borderWidth:"1px",borderStyle:"solid",borderColor:S.colors.border.base,borderRadius:"var(--unstable_DataGrid-radius)",backgroundColor:S.colors.background.base,color:S.colors.foreground.base,font:S.typography.font.body,outline:"none",height:"100%",display:"flex",minWidth:0,minHeight:0,flexDirection:"column",overflow:"hidden",overflowAnchor:"none",transform:"translate(0, 0)",[".".concat(C.main," > *:first-child").concat("/* emotion-disable-server-rendering-unsafe-selector-warning-please-do-not-use-this-the-warning-exists-for-a-reason */")]:{borderTopLeftRadius:"var(--unstable_DataGrid-radius)",borderTopRightRadius:"var(--unstable_DataGrid-radius)"},["&.".concat(C.autoHeight)]:{height:"auto"},["&.".concat(C.autosizing)]:{["& .".concat(C.columnHeaderTitleContainerContent," > *")]:{overflow:"visible !important"},"@media (hover: hover)":{["& .".concat(C.menuIcon)]:{width:"0 !important",visibility:"hidden !important"}},["& .".concat(C.cell)]:{overflow:"visible !important",whiteSpace:"nowrap",minWidth:"max-content !important",maxWidth:"max-content !important"},["& .".concat(C.groupingCriteriaCell)]:{width:"unset"},["& .".concat(C.treeDataGroupingCell)]:{width:"unset"}},["&.".concat(C.withSidePanel)]:{flexDirection:"row"},["& .".concat(C.mainContent)]:{display:"flex",flexDirection:"column",overflow:"hidden",flex:1},["& .".concat(C.columnHeader,", & .").concat(C.cell)]:{WebkitTapHighlightColor:"transparent",padding:"0 10px",boxSizing:"border-box"},["& .".concat(C.columnHeader,":focus-within, & .").concat(C.cell,":focus-within")]:{outline:"solid ".concat(B(S.colors.interactive.focus,.5)," ").concat(1,"px"),outlineOffset:-1},["& .".concat(C.columnHeader,":focus, & .").concat(C.cell,":focus")]:{outline:"solid ".concat(S.colors.interactive.focus," ").concat(1,"px"),outlineOffset:-1},["& .".concat(C.columnHeader,":focus,\n      & .").concat(C["columnHeader--withLeftBorder"],",\n      & .").concat(C["columnHeader--withRightBorder"],",\n      & .").concat(C["columnHeader--siblingFocused"],",\n      & .").concat(C["virtualScroller--hasScrollX"]," .").concat(C["columnHeader--lastUnpinned"],",\n      & .").concat(C["virtualScroller--hasScrollX"]," .").concat(C["columnHeader--last"],"\n      ")]:{["& .".concat(C.columnSeparator)]:{opacity:0},"@media (hover: none)":{["& .".concat(C["columnSeparator--resizable"])]:{opacity:1}},["& .".concat(C["columnSeparator--resizable"],":hover")]:{opacity:1}},["&.".concat(C["root--noToolbar"],' [aria-rowindex="1"] [aria-colindex="1"]')]:{borderTopLeftRadius:"calc(var(--unstable_DataGrid-radius) - 1px)"},["&.".concat(C["root--noToolbar"],' [aria-rowindex="1"] .').concat(C["columnHeader--last"])]:{borderTopRightRadius:e?"calc(var(--unstable_DataGrid-radius) - 1px)":void 0},["& .".concat(C.columnHeaderCheckbox,", & .").concat(C.cellCheckbox)]:{padding:0,justifyContent:"center",alignItems:"center"},["& .".concat(C.columnHeader)]:{position:"relative",display:"flex",alignItems:"center",backgroundColor:o},["& .".concat(C["columnHeader--filter"])]:{paddingTop:8,paddingBottom:8,paddingRight:5,minHeight:"min-content",overflow:"hidden"},["& .".concat(C["virtualScroller--hasScrollX"]," .").concat(C["columnHeader--last"])]:{overflow:"hidden"},["& .".concat(C["pivotPanelField--sorted"]," .").concat(C.iconButtonContainer,",\n      & .").concat(C["columnHeader--sorted"]," .").concat(C.iconButtonContainer,",\n      & .").concat(C["columnHeader--filtered"]," .").concat(C.iconButtonContainer)]:{visibility:"visible",width:"auto"},["& .".concat(C.pivotPanelField,":not(.").concat(C["pivotPanelField--sorted"],") .").concat(C.sortButton,",\n      & .").concat(C.columnHeader,":not(.").concat(C["columnHeader--sorted"],") .").concat(C.sortButton)]:{opacity:0,transition:S.transition(["opacity"],{duration:S.transitions.duration.short})},["& .".concat(C.columnHeaderTitleContainer)]:{display:"flex",alignItems:"center",gap:S.spacing(.25),minWidth:0,flex:1,whiteSpace:"nowrap",overflow:"hidden"},["& .".concat(C.columnHeaderTitleContainerContent)]:{overflow:"hidden",display:"flex",alignItems:"center"},["& .".concat(C["columnHeader--filledGroup"]," .").concat(C.columnHeaderTitleContainer)]:{borderBottomWidth:"1px",borderBottomStyle:"solid",boxSizing:"border-box"},["& .".concat(C.sortIcon,", & .").concat(C.filterIcon)]:{fontSize:"inherit"},["& .".concat(C["columnHeader--sortable"])]:{cursor:"pointer"},["& .".concat(C["columnHeader--alignCenter"]," .").concat(C.columnHeaderTitleContainer)]:{justifyContent:"center"},["& .".concat(C["columnHeader--alignRight"]," .").concat(C.columnHeaderDraggableContainer,", & .").concat(C["columnHeader--alignRight"]," .").concat(C.columnHeaderTitleContainer)]:{flexDirection:"row-reverse"},["& .".concat(C["columnHeader--alignCenter"]," .").concat(C.menuIcon)]:{marginLeft:"auto"},["& .".concat(C["columnHeader--alignRight"]," .").concat(C.menuIcon)]:{marginRight:"auto",marginLeft:-5},["& .".concat(C["columnHeader--moving"])]:{backgroundColor:u},["& .".concat(C["columnHeader--pinnedLeft"],", & .").concat(C["columnHeader--pinnedRight"])]:{position:"sticky",zIndex:40,background:S.header.background.base},["& .".concat(C.columnSeparator)]:{position:"absolute",overflow:"hidden",zIndex:30,display:"flex",flexDirection:"column",justifyContent:"center",alignItems:"center",maxWidth:10,color:S.colors.border.base},["& .".concat(C.columnHeaders)]:{width:"var(--DataGrid-rowWidth)",backgroundColor:o},"@media (hover: hover)":{["& .".concat(C.columnHeader,":hover")]:{["& .".concat(C.menuIcon)]:{width:"auto",visibility:"visible"},["& .".concat(C.iconButtonContainer)]:{visibility:"visible",width:"auto"}},["& .".concat(C.columnHeader,":not(.").concat(C["columnHeader--sorted"],"):hover .").concat(C.sortButton,",\n        & .").concat(C.pivotPanelField,":not(.").concat(C["pivotPanelField--sorted"],"):hover .").concat(C.sortButton,",\n        & .").concat(C.pivotPanelField,":not(.").concat(C["pivotPanelField--sorted"],") .").concat(C.sortButton,":focus-visible")]:{opacity:.5}},"@media (hover: none)":{["& .".concat(C.columnHeader," .").concat(C.menuIcon)]:{width:"auto",visibility:"visible"},["& .".concat(C.columnHeader,":focus,\n        & .").concat(C["columnHeader--siblingFocused"])]:{[".".concat(C["columnSeparator--resizable"])]:{color:S.colors.foreground.accent}},["& .".concat(C.pivotPanelField,":not(.").concat(C["pivotPanelField--sorted"],") .").concat(C.sortButton)]:{opacity:.5}},["& .".concat(C["columnHeader--withLeftBorder"]," .").concat(C["columnSeparator--sideLeft"],":not(.").concat(C["columnSeparator--resizable"],"), & .").concat(C["columnHeader--withRightBorder"]," .").concat(C["columnSeparator--sideRight"],":not(.").concat(C["columnSeparator--resizable"],")")]:{display:"none"},["& .".concat(C["columnSeparator--sideLeft"])]:{left:-5},["& .".concat(C["columnSeparator--sideRight"])]:{right:-5},["& .".concat(C["columnHeader--withRightBorder"]," .").concat(C["columnSeparator--sideLeft"])]:{left:-5.5},["& .".concat(C["columnHeader--withRightBorder"]," .").concat(C["columnSeparator--sideRight"])]:{right:-5.5},["& .".concat(C["columnSeparator--resizable"])]:{cursor:"col-resize",touchAction:"none",["&.".concat(C["columnSeparator--resizing"])]:{color:S.colors.foreground.accent},"@media (hover: none)":{["& .".concat(C.iconSeparator," rect")]:L},"@media (hover: hover)":{"&:hover":{color:S.colors.foreground.accent,["& .".concat(C.iconSeparator," rect")]:L}},"& svg":{pointerEvents:"none"}},["& .".concat(C.iconSeparator)]:{color:"inherit",transition:S.transition(["color","width"],{duration:S.transitions.duration.short})},["& .".concat(C.menuIcon)]:{width:0,visibility:"hidden",fontSize:20,marginRight:-5,display:"flex",alignItems:"center"},[".".concat(C.menuOpen)]:{visibility:"visible",width:"auto"},["& .".concat(C.headerFilterRow)]:{["& .".concat(C.columnHeader)]:{boxSizing:"border-box",borderBottom:"1px solid var(--DataGrid-rowBorderColor)"}},["& .".concat(C["row--borderBottom"]," .").concat(C.columnHeader,",\n      & .").concat(C["row--borderBottom"]," .").concat(C.filler,",\n      & .").concat(C["row--borderBottom"]," .").concat(C.scrollbarFiller)]:{borderBottom:"1px solid var(--DataGrid-rowBorderColor)"},["& .".concat(C["row--borderBottom"]," .").concat(C.cell)]:{borderBottom:"1px solid var(--rowBorderColor)"},[".".concat(C.row)]:{display:"flex",width:"var(--DataGrid-rowWidth)",breakInside:"avoid","--rowBorderColor":"var(--DataGrid-rowBorderColor)",["&.".concat(C["row--firstVisible"])]:{"--rowBorderColor":"transparent"},"&:hover":{backgroundColor:u,"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(C.rowSkeleton,":hover")]:{backgroundColor:"transparent"},"&.Mui-selected":y},["& .".concat(C.cell)]:{flex:"0 0 auto",height:"var(--height)",width:"var(--width)",lineHeight:"calc(var(--height) - 1px)",boxSizing:"border-box",borderTop:"1px solid var(--rowBorderColor)",overflow:"hidden",whiteSpace:"nowrap",textOverflow:"ellipsis","&.Mui-selected":y},["& .".concat(C["virtualScrollerContent--overflowed"]," .").concat(C["row--lastVisible"]," .").concat(C.cell)]:{borderTopColor:"transparent"},["& .".concat(C.pinnedRows," .").concat(C.row,", .").concat(C.aggregationRowOverlayWrapper," .").concat(C.row)]:{backgroundColor:n,"&:hover":{backgroundColor:f}},["& .".concat(C["pinnedRows--top"]," :first-of-type")]:{["& .".concat(C.cell,", .").concat(C.scrollbarFiller)]:{borderTop:"none"}},["&.".concat(C["root--disableUserSelection"])]:{userSelect:"none"},["& .".concat(C["row--dynamicHeight"]," > .").concat(C.cell)]:{whiteSpace:"initial",lineHeight:"inherit"},["& .".concat(C.cellEmpty)]:{flex:1,padding:0,height:"unset"},["& .".concat(C.cell,".").concat(C["cell--selectionMode"])]:{cursor:"default"},["& .".concat(C.cell,".").concat(C["cell--editing"])]:{padding:1,display:"flex",boxShadow:S.shadows.base,backgroundColor:S.colors.background.overlay,"&:focus-within":{outline:"".concat(1,"px solid ").concat(S.colors.interactive.focus),outlineOffset:-1}},["& .".concat(C["cell--editing"])]:{"& .MuiInputBase-root":{height:"100%"}},["& .".concat(C["row--editing"])]:{boxShadow:S.shadows.base},["& .".concat(C["row--editing"]," .").concat(C.cell)]:{boxShadow:"none",backgroundColor:S.colors.background.overlay},["& .".concat(C.editBooleanCell)]:{display:"flex",height:"100%",width:"100%",alignItems:"center",justifyContent:"center"},["& .".concat(C.booleanCell,'[data-value="true"]')]:{color:S.colors.foreground.muted},["& .".concat(C.booleanCell,'[data-value="false"]')]:{color:S.colors.foreground.disabled},["& .".concat(C.actionsCell)]:{display:"inline-flex",alignItems:"center",gridGap:S.spacing(1)},["& .".concat(C.rowReorderCell)]:{display:"inline-flex",flex:1,alignItems:"center",justifyContent:"center",opacity:S.colors.interactive.disabledOpacity},["& .".concat(C["rowReorderCell--draggable"])]:{cursor:"grab",opacity:1},["& .".concat(C.rowReorderCellContainer)]:{padding:0,display:"flex",alignItems:"stretch"},[".".concat(C.withBorderColor)]:{borderColor:S.colors.border.base},["& .".concat(C["cell--withLeftBorder"],", & .").concat(C["columnHeader--withLeftBorder"])]:{borderLeftColor:"var(--DataGrid-rowBorderColor)",borderLeftWidth:"1px",borderLeftStyle:"solid"},["& .".concat(C["cell--withRightBorder"],", & .").concat(C["columnHeader--withRightBorder"])]:{borderRightColor:"var(--DataGrid-rowBorderColor)",borderRightWidth:"1px",borderRightStyle:"solid"},["& .".concat(C["cell--flex"])]:{display:"flex",alignItems:"center",lineHeight:"inherit"},["& .".concat(C["cell--textLeft"])]:{textAlign:"left",justifyContent:"flex-start"},["& .".concat(C["cell--textRight"])]:{textAlign:"right",justifyContent:"flex-end"},["& .".concat(C["cell--textCenter"])]:{textAlign:"center",justifyContent:"center"},["& .".concat(C["cell--pinnedLeft"],", & .").concat(C["cell--pinnedRight"])]:{position:"sticky",zIndex:30,background:S.cell.background.pinned,"&.Mui-selected":{backgroundColor:g}},["& .".concat(C.row)]:{"&:hover":v,"&.Mui-selected":b,"&.Mui-selected:hover":w},["& .".concat(C.cellOffsetLeft)]:{flex:"0 0 auto",display:"inline-block"},["& .".concat(C.cellSkeleton)]:{flex:"0 0 auto",height:"100%",display:"inline-flex",alignItems:"center"},["& .".concat(C.columnHeaderDraggableContainer)]:{display:"flex",width:"100%",height:"100%"},["& .".concat(C.rowReorderCellPlaceholder)]:{display:"none"},["& .".concat(C["columnHeader--dragging"])]:{background:S.colors.background.overlay,padding:"0 12px",borderRadius:"var(--unstable_DataGrid-radius)",opacity:S.colors.interactive.disabledOpacity},["& .".concat(C["row--dragging"])]:{background:S.colors.background.overlay,padding:"0 12px",borderRadius:"var(--unstable_DataGrid-radius)",border:"1px solid var(--DataGrid-rowBorderColor)",color:S.colors.foreground.base,transform:"translateZ(0)",["& .".concat(C.rowReorderCellPlaceholder)]:{padding:"0 6px",display:"flex"}},["& .".concat(C.treeDataGroupingCell)]:{display:"flex",alignItems:"center",width:"100%"},["& .".concat(C.treeDataGroupingCellToggle)]:{flex:"0 0 28px",alignSelf:"stretch",marginRight:S.spacing(2)},["& .".concat(C.treeDataGroupingCellLoadingContainer,", .").concat(C.groupingCriteriaCellLoadingContainer)]:{display:"flex",alignItems:"center",justifyContent:"center",height:"100%"},["& .".concat(C.groupingCriteriaCell)]:{display:"flex",alignItems:"center",width:"100%"},["& .".concat(C.groupingCriteriaCellToggle)]:{flex:"0 0 28px",alignSelf:"stretch",marginRight:S.spacing(2)},["& .".concat(C.columnHeaders," .").concat(C.scrollbarFiller)]:{backgroundColor:o},[".".concat(C.scrollbarFiller)]:{minWidth:"calc(var(--DataGrid-hasScrollY) * var(--DataGrid-scrollbarSize))",alignSelf:"stretch",["&.".concat(C["scrollbarFiller--borderTop"])]:{borderTop:"1px solid var(--DataGrid-rowBorderColor)"},["&.".concat(C["scrollbarFiller--borderBottom"])]:{borderBottom:"1px solid var(--DataGrid-rowBorderColor)"},["&.".concat(C["scrollbarFiller--pinnedRight"])]:{backgroundColor:S.cell.background.pinned,position:"sticky",zIndex:40,right:0}},["& .".concat(C.filler)]:{flex:"1 0 auto"},["& .".concat(C["filler--borderBottom"])]:{borderBottom:"1px solid var(--DataGrid-rowBorderColor)"},["& .".concat(C.columnHeaders," .").concat(C.filler)]:{backgroundColor:o},["& .".concat(C["main--hiddenContent"])]:{["& .".concat(C.virtualScrollerContent)]:{position:"fixed",visibility:"hidden"},["& .".concat(C["scrollbar--vertical"],", & .").concat(C.pinnedRows,", & .").concat(C.virtualScroller," > .").concat(C.filler)]:{display:"none"}},["& .".concat(C["row--dropAbove"])]:{position:"relative","&::before":{pointerEvents:"none",content:'""',position:"absolute",top:0,left:0,width:"100%",height:"2px",backgroundColor:S.colors.interactive.selected}},["& .".concat(C["row--dropBelow"])]:{position:"relative","&::after":{zIndex:100,pointerEvents:"none",content:'""',position:"absolute",bottom:"-2px",left:0,width:"100%",height:"2px",backgroundColor:S.colors.interactive.selected},["&.".concat(C["row--lastVisible"])]:{"&::after":{bottom:"calc(var(--DataGrid-hasScrollY) * 0px + (1 - var(--DataGrid-hasScrollY)) * -2px)"}}},["& .".concat(C["row--beingDragged"])]:{color:S.colors.foreground.disabled,"&:hover":{backgroundColor:"transparent"}}}});function B(e,t){return"rgba(from ".concat(e," r g b / ").concat(t,")")}function V(e,t,o){return"color-mix(in srgb,".concat(e,", ").concat(t," calc(").concat(o," * 100%))")}const G=r.createContext(void 0);const W=()=>{const e=r.useContext(G);if(!e)throw new Error("MUI X: useGridRootProps should only be used inside the DataGrid, DataGridPro or DataGridPremium component.");return e},U=r.createContext(void 0);const K=()=>{const e=r.useContext(U);if(void 0===e)throw new Error(["MUI X: Could not find the Data Grid configuration context.","It looks like you rendered your component outside of a DataGrid, DataGridPro or DataGridPremium parent component.","This can also happen if you are bundling multiple versions of the Data Grid."].join("\n"));return e};var q=o(579);const _=r.createContext({className:"unset",tag:(0,q.jsx)("style",{href:"/unset"})});function X(){return r.useContext(_).className}function Y(e){const t=K(),o=W(),n=t.hooks.useCSSVariables(),l=r.useMemo(()=>{const e="".concat("MuiDataGridVariables","-").concat(n.id),t=".".concat(e,"{").concat(function(e){let t="";for(const o in e)Object.hasOwn(e,o)&&void 0!==e[o]&&(t+="".concat(o,":").concat(e[o],";"));return t}(n.variables),"}");return{className:e,tag:(0,q.jsx)("style",{href:"/".concat(e),nonce:o.nonce,children:t})}},[o.nonce,n]);return(0,q.jsx)(_.Provider,{value:l,children:e.children})}var Q=o(4467),$=o(9379),Z=Symbol("NOT_FOUND");function J(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"expected a function, instead received ".concat(typeof e);if("function"!==typeof e)throw new TypeError(t)}var ee=e=>Array.isArray(e)?e:[e];function te(e){const t=Array.isArray(e[0])?e[0]:e;return function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"expected all items to be functions, instead received the following types: ";if(!e.every(e=>"function"===typeof e)){const o=e.map(e=>"function"===typeof e?"function ".concat(e.name||"unnamed","()"):typeof e).join(", ");throw new TypeError("".concat(t,"[").concat(o,"]"))}}(t,"createSelector expects all input-selectors to be functions, but received the following types: "),t}Symbol(),Object.getPrototypeOf({});var oe=(e,t)=>e===t;function ne(e){return function(t,o){if(null===t||null===o||t.length!==o.length)return!1;const{length:n}=t;for(let r=0;r<n;r++)if(!e(t[r],o[r]))return!1;return!0}}function re(e,t){const o="object"===typeof t?t:{equalityCheck:t},{equalityCheck:n=oe,maxSize:r=1,resultEqualityCheck:l}=o,i=ne(n);let a=0;const s=r<=1?function(e){let t;return{get:o=>t&&e(t.key,o)?t.value:Z,put(e,o){t={key:e,value:o}},getEntries:()=>t?[t]:[],clear(){t=void 0}}}(i):function(e,t){let o=[];function n(e){const n=o.findIndex(o=>t(e,o.key));if(n>-1){const e=o[n];return n>0&&(o.splice(n,1),o.unshift(e)),e.value}return Z}return{get:n,put:function(t,r){n(t)===Z&&(o.unshift({key:t,value:r}),o.length>e&&o.pop())},getEntries:function(){return o},clear:function(){o=[]}}}(r,i);function c(){let t=s.get(arguments);if(t===Z){if(t=e.apply(null,arguments),a++,l){const e=s.getEntries().find(e=>l(e.value,t));e&&(t=e.value,0!==a&&a--)}s.put(arguments,t)}return t}return c.clearCache=()=>{s.clear(),c.resetResultsCount()},c.resultsCount=()=>a,c.resetResultsCount=()=>{a=0},c}var le="undefined"!==typeof WeakRef?WeakRef:class{constructor(e){this.value=e}deref(){return this.value}};function ie(){return{s:0,v:void 0,o:null,p:null}}function ae(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},o={s:0,v:void 0,o:null,p:null};const{resultEqualityCheck:n}=t;let r,l=0;function i(){let t=o;const{length:i}=arguments;for(let e=0,o=i;e<o;e++){const o=arguments[e];if("function"===typeof o||"object"===typeof o&&null!==o){let e=t.o;null===e&&(t.o=e=new WeakMap);const n=e.get(o);void 0===n?(t=ie(),e.set(o,t)):t=n}else{let e=t.p;null===e&&(t.p=e=new Map);const n=e.get(o);void 0===n?(t=ie(),e.set(o,t)):t=n}}const a=t;let s;if(1===t.s)s=t.v;else if(s=e.apply(null,arguments),l++,n){var c,u,d;const e=null!==(c=null===(u=r)||void 0===u||null===(d=u.deref)||void 0===d?void 0:d.call(u))&&void 0!==c?c:r;null!=e&&n(e,s)&&(s=e,0!==l&&l--);r="object"===typeof s&&null!==s||"function"===typeof s?new le(s):s}return a.s=1,a.v=s,s}return i.clearCache=()=>{o={s:0,v:void 0,o:null,p:null},i.resetResultsCount()},i.resultsCount=()=>l,i.resetResultsCount=()=>{l=0},i}function se(e){for(var t=arguments.length,o=new Array(t>1?t-1:0),n=1;n<t;n++)o[n-1]=arguments[n];const r="function"===typeof e?{memoize:e,memoizeOptions:o}:e,l=function(){for(var e=arguments.length,t=new Array(e),o=0;o<e;o++)t[o]=arguments[o];let n,l=0,i=0,a={},s=t.pop();"object"===typeof s&&(a=s,s=t.pop()),J(s,"createSelector expects an output function after the inputs, but received: [".concat(typeof s,"]"));const c=(0,$.A)((0,$.A)({},r),a),{memoize:u,memoizeOptions:d=[],argsMemoize:p=ae,argsMemoizeOptions:f=[],devModeChecks:g={}}=c,h=ee(d),m=ee(f),v=te(t),b=u(function(){return l++,s.apply(null,arguments)},...h);const w=p(function(){i++;const e=function(e,t){const o=[],{length:n}=e;for(let r=0;r<n;r++)o.push(e[r].apply(null,t));return o}(v,arguments);return n=b.apply(null,e),n},...m);return Object.assign(w,{resultFunc:s,memoizedResultFunc:b,dependencies:v,dependencyRecomputations:()=>i,resetDependencyRecomputations:()=>{i=0},lastResult:()=>n,recomputations:()=>l,resetRecomputations:()=>{l=0},memoize:u,argsMemoize:p})};return Object.assign(l,{withTypes:()=>l}),l}var ce=se(ae),ue=Object.assign(function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:ce;!function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"expected an object, instead received ".concat(typeof e);if("object"!==typeof e)throw new TypeError(t)}(e,"createStructuredSelector expects first argument to be an object where each property is a selector, instead received a ".concat(typeof e));const o=Object.keys(e),n=t(o.map(t=>e[t]),function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce((e,t,n)=>(e[o[n]]=t,e),{})});return n},{withTypes:()=>ue});const de=se({memoize:re,memoizeOptions:{maxSize:1,equalityCheck:Object.is}}),pe=function(e,t,o,n,r,l){if((arguments.length<=6?0:arguments.length-6)>0)throw new Error("Unsupported number of selectors");let i;if(e&&t&&o&&n&&r&&l)i=(i,a,s,c)=>{const u=e(i,a,s,c),d=t(i,a,s,c),p=o(i,a,s,c),f=n(i,a,s,c),g=r(i,a,s,c);return l(u,d,p,f,g,a,s,c)};else if(e&&t&&o&&n&&r)i=(l,i,a,s)=>{const c=e(l,i,a,s),u=t(l,i,a,s),d=o(l,i,a,s),p=n(l,i,a,s);return r(c,u,d,p,i,a,s)};else if(e&&t&&o&&n)i=(r,l,i,a)=>{const s=e(r,l,i,a),c=t(r,l,i,a),u=o(r,l,i,a);return n(s,c,u,l,i,a)};else if(e&&t&&o)i=(n,r,l,i)=>{const a=e(n,r,l,i),s=t(n,r,l,i);return o(a,s,r,l,i)};else if(e&&t)i=(o,n,r,l)=>{const i=e(o,n,r,l);return t(i,n,r,l)};else{if(!e)throw new Error("Missing arguments");i=e}return i},fe=function(){for(var e=arguments.length,t=new Array(e),o=0;o<e;o++)t[o]=arguments[o];const n=new WeakMap;let r=1;const l=t[t.length-1],i=t.length-1||1,a=Math.max(l.length-i,0);if(a>3)throw new Error("Unsupported number of arguments");return(e,o,i,s)=>{let c=e.__cacheKey__;c||(c={id:r},e.__cacheKey__=c,r+=1);let u=n.get(c);if(!u){const e=1===t.length?[e=>e,l]:t;let o=t;const r=[void 0,void 0,void 0];switch(a){case 0:break;case 1:o=[...e.slice(0,-1),()=>r[0],l];break;case 2:o=[...e.slice(0,-1),()=>r[0],()=>r[1],l];break;case 3:o=[...e.slice(0,-1),()=>r[0],()=>r[1],()=>r[2],l];break;default:throw new Error("Unsupported number of arguments")}u=de(...o),u.selectorArgs=r,n.set(c,u)}switch(a){case 3:u.selectorArgs[2]=s;case 2:u.selectorArgs[1]=i;case 1:u.selectorArgs[0]=o}switch(a){case 0:return u(e);case 1:return u(e,o);case 2:return u(e,o,i);case 3:return u(e,o,i,s);default:throw new Error("unreachable")}}},ge=function(){const e=pe(...arguments);return(t,o,n,r)=>e(ve(t),o,n,r)},he=function(){const e=fe(...arguments);return(t,o,n,r)=>e(ve(t),o,n,r)},me=e=>(t,o)=>e(ve(t),o);function ve(e){return"current"in e?e.current.state:e}const be={compact:.7,comfortable:1.3,standard:1},we=me(e=>e.density),Ce=ge(we,e=>be[e]),ye=()=>()=>{},Ae=()=>!1,xe=()=>!0;let Se=function(e){return e.LEFT="left",e.RIGHT="right",e}({});const Re={left:[],right:[]},Me=me(e=>e.isRtl),Ie=me(e=>{var t;return null!==(t=e.props.listView)&&void 0!==t&&t}),Pe=me(e=>e.listViewColumn),ke=me(e=>e.columns),Ee=ge(ke,e=>e.orderedFields),Fe=ge(ke,e=>e.lookup),Te=he(Ee,Fe,(e,t)=>e.map(e=>t[e])),He=ge(ke,e=>e.columnVisibilityModel),De=ge(ke,e=>e.initialColumnVisibilityModel),Oe=he(Te,He,Ie,Pe,(e,t,o,n)=>o&&n?[n]:e.filter(e=>!1!==t[e.field])),ze=he(Oe,e=>e.map(e=>e.field)),Le=me(e=>e.pinnedColumns),je=(he(Le,Ee,Me,(e,t,o)=>Ne(e,t,o)),he(ke,Le,ze,Me,Ie,(e,t,o,n,r)=>{if(r)return Re;const l=Ne(t,o,n);return{left:l.left.map(t=>e.lookup[t]),right:l.right.map(t=>e.lookup[t])}}));function Ne(e,t,o){var n,r;if(!Array.isArray(e.left)&&!Array.isArray(e.right))return Re;if(0===(null===(n=e.left)||void 0===n?void 0:n.length)&&0===(null===(r=e.right)||void 0===r?void 0:r.length))return Re;const l=(e,t)=>Array.isArray(e)?e.filter(e=>t.includes(e)):[],i=l(e.left,t),a=t.filter(e=>!i.includes(e)),s=l(e.right,a);return o?{left:s,right:i}:{left:i,right:s}}const Be=he(Oe,e=>{const t=[];let o=0;for(let n=0;n<e.length;n+=1)t.push(o),o+=e[n].computedWidth;return t}),Ve=he(Te,e=>e.filter(e=>e.filterable)),Ge=he(Te,e=>e.reduce((e,t)=>(t.filterable&&(e[t.field]=t),e),{})),We=he(Te,e=>e.some(e=>void 0!==e.colSpan)),Ue=me(e=>e.preferencePanel),Ke=ge(Ue,(e,t)=>!(!e.open||e.labelId!==t));var qe=function(e){return e.filters="filters",e.columns="columns",e.aiAssistant="aiAssistant",e}(qe||{});const _e=r.createContext(void 0);function Xe(){const e=r.useContext(_e);if(void 0===e)throw new Error(["MUI X: Could not find the Data Grid context.","It looks like you rendered your component outside of a DataGrid, DataGridPro or DataGridPremium parent component.","This can also happen if you are bundling multiple versions of the Data Grid."].join("\n"));return e}const Ye=r.createContext(void 0);function Qe(){const e=r.useContext(Ye);if(void 0===e)throw new Error("MUI X: Missing context.");return e}function $e(e){let{children:t}=e;const o=r.useRef(null),n=r.useRef(null),l=r.useRef(null),i=r.useMemo(()=>({columnsPanelTriggerRef:o,filterPanelTriggerRef:n,aiAssistantPanelTriggerRef:l}),[]);return(0,q.jsx)(Ye.Provider,{value:i,children:t})}function Ze(){var e,t;const o=Xe(),r=D(o,Te),l=W(),i=D(o,Ue),{columnsPanelTriggerRef:a,filterPanelTriggerRef:s,aiAssistantPanelTriggerRef:c}=Qe(),u=o.current.unstable_applyPipeProcessors("preferencePanel",null,null!==(e=i.openedPanelValue)&&void 0!==e?e:qe.filters);let d=null;switch(i.openedPanelValue){case qe.filters:d=s.current;break;case qe.columns:d=a.current;break;case qe.aiAssistant:d=c.current}return(0,q.jsx)(l.slots.panel,(0,n.A)({id:i.panelId,open:r.length>0&&i.open,"aria-labelledby":i.labelId,target:d,onClose:()=>o.current.hidePreferences()},null===(t=l.slotProps)||void 0===t?void 0:t.panel,{children:u}))}function Je(){var e;const t=W();return(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(Ze,{}),t.showToolbar&&(0,q.jsx)(t.slots.toolbar,(0,n.A)({},null===(e=t.slotProps)||void 0===e?void 0:e.toolbar))]})}var et=o(883);const tt=me(e=>e.dimensions),ot=ge(tt,e=>e.columnsTotalWidth),nt=ge(tt,e=>e.rowHeight),rt=(ge(tt,e=>e.contentSize.height),ge(tt,e=>e.hasScrollX)),lt=ge(tt,e=>e.hasScrollY),it=ge(tt,e=>e.columnsTotalWidth<e.viewportOuterSize.width),at=ge(tt,e=>e.headerHeight),st=ge(tt,e=>e.groupHeaderHeight),ct=(ge(tt,e=>e.headerFilterHeight),ge(tt,e=>e.hasScrollX?e.scrollbarSize:0)),ut=ge(tt,e=>e.hasScrollY?e.scrollbarSize:0),dt=ge(tt,ct,(e,t)=>{const o=e.viewportOuterSize.height-e.minimumSize.height>0;return!(0===t&&!o)}),pt=me(e=>e.rows),ft=ge(pt,e=>e.totalRowCount),gt=ge(pt,e=>e.loading),ht=ge(pt,e=>e.totalTopLevelRowCount),mt=ge(pt,e=>e.dataRowIdToModelLookup),vt=(ge(mt,(e,t)=>e[t]),ge(pt,e=>e.tree)),bt=ge(vt,(e,t)=>e[t]),wt=ge(pt,e=>e.groupsToFetch),Ct=ge(pt,e=>e.groupingName),yt=ge(pt,e=>e.treeDepths),At=he(pt,e=>{var t;const o=Object.entries(e.treeDepths);return 0===o.length?1:(null!==(t=o.filter(e=>{let[,t]=e;return t>0}).map(e=>{let[t]=e;return Number(t)}).sort((e,t)=>t-e)[0])&&void 0!==t?t:0)+1}),xt=ge(pt,e=>e.dataRowIds),St=he(xt,mt,(e,t)=>e.reduce((e,o)=>t[o]?(e.push(t[o]),e):e,[])),Rt=he(ge(pt,e=>null===e||void 0===e?void 0:e.additionalRowGroups),e=>{var t,o,n,r;const l=null===e||void 0===e?void 0:e.pinnedRows;return{bottom:null!==(t=null===l||void 0===l||null===(o=l.bottom)||void 0===o?void 0:o.map(e=>{var t;return{id:e.id,model:null!==(t=e.model)&&void 0!==t?t:{}}}))&&void 0!==t?t:[],top:null!==(n=null===l||void 0===l||null===(r=l.top)||void 0===r?void 0:r.map(e=>{var t;return{id:e.id,model:null!==(t=e.model)&&void 0!==t?t:{}}}))&&void 0!==n?n:[]}}),Mt=ge(Rt,e=>{var t,o;return((null===e||void 0===e||null===(t=e.top)||void 0===t?void 0:t.length)||0)+((null===e||void 0===e||null===(o=e.bottom)||void 0===o?void 0:o.length)||0)});var It=o(1039);class Pt{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1e3;(0,Q.A)(this,"timeouts",new Map),(0,Q.A)(this,"cleanupTimeout",1e3),this.cleanupTimeout=e}register(e,t,o){this.timeouts||(this.timeouts=new Map);const n=setTimeout(()=>{"function"===typeof t&&t(),this.timeouts.delete(o.cleanupToken)},this.cleanupTimeout);this.timeouts.set(o.cleanupToken,n)}unregister(e){const t=this.timeouts.get(e.cleanupToken);t&&(this.timeouts.delete(e.cleanupToken),clearTimeout(t))}reset(){this.timeouts&&(this.timeouts.forEach((e,t)=>{this.unregister({cleanupToken:t})}),this.timeouts=void 0)}}class kt{constructor(){(0,Q.A)(this,"registry",new FinalizationRegistry(e=>{"function"===typeof e&&e()}))}register(e,t,o){this.registry.register(e,t,o)}unregister(e){this.registry.unregister(e)}reset(){}}class Et{static create(){return new Et}}const Ft={current:zt()};let Tt=0;function Ht(e,t,o,n){const l=r.useState(Et.create)[0],i=r.useRef(null),a=r.useRef(null);a.current=o;const s=r.useRef(null);if(!i.current&&a.current){const o=(e,t,o)=>{var n;t.defaultMuiPrevented||(null===(n=a.current)||void 0===n||n.call(a,e,t,o))};i.current=e.current.subscribeEvent(t,o,n),Tt+=1,s.current={cleanupToken:Tt},Ft.current.register(l,()=>{var e;null===(e=i.current)||void 0===e||e.call(i),i.current=null,s.current=null},s.current)}else!a.current&&i.current&&(i.current(),i.current=null,s.current&&(Ft.current.unregister(s.current),s.current=null));r.useEffect(()=>{if(!i.current&&a.current){const o=(e,t,o)=>{var n;t.defaultMuiPrevented||(null===(n=a.current)||void 0===n||n.call(a,e,t,o))};i.current=e.current.subscribeEvent(t,o,n)}return s.current&&Ft.current&&(Ft.current.unregister(s.current),s.current=null),()=>{var e;null===(e=i.current)||void 0===e||e.call(i),i.current=null}},[e,t,n])}const Dt={isFirst:!0};function Ot(e,t,o){Ht(e,t,o,Dt)}function zt(){return"undefined"!==typeof FinalizationRegistry?new kt:new Pt}var Lt=o(3115),jt=o(4599),Nt=o(6509);function Bt(e){throw new Error("Failed assertion: should not be rendered")}const Vt=["id","value","formattedValue","api","field","row","rowNode","colDef","cellMode","isEditable","tabIndex","hasFocus","isValidating","debounceMs","isProcessingProps","onValueChange","slotProps"],Gt=(0,m.Ay)(Bt,{name:"MuiDataGrid",slot:"EditInputCell"})({font:S.typography.font.body,padding:"1px 0","& input":{padding:"0 16px",height:"100%"}}),Wt=a((e,t)=>{const o=W(),{id:l,value:i,field:a,colDef:c,hasFocus:u,debounceMs:d=200,isProcessingProps:f,onValueChange:g,slotProps:h}=e,m=(0,s.A)(e,Vt),v=Xe(),b=r.useRef(null),[C,y]=r.useState(i),A=(e=>{const{classes:t}=e;return(0,p.A)({root:["editInputCell"]},w,t)})(o),x=r.useCallback(async e=>{const t=e.target.value,o=v.current.getColumn(a);let n=t;o.valueParser&&(n=o.valueParser(t,v.current.getRow(l),o,v)),y(n),v.current.setEditCellValue({id:l,field:a,value:n,debounceMs:d,unstable_skipValueParser:!0},e),g&&await g(e,t)},[v,d,a,l,g]),S=v.current.unstable_getEditCellMeta(l,a);return r.useEffect(()=>{"debouncedSetEditCellValue"!==(null===S||void 0===S?void 0:S.changeReason)&&y(i)},[S,i]),(0,Nt.A)(()=>{u&&b.current.focus()},[u]),(0,q.jsx)(Gt,(0,n.A)({as:o.slots.baseInput,inputRef:b,className:A.root,ownerState:o,fullWidth:!0,type:"number"===c.type?c.type:"text",value:null!==C&&void 0!==C?C:"",onChange:x,endAdornment:f?(0,q.jsx)(o.slots.loadIcon,{fontSize:"small",color:"action"}):void 0},m,null===h||void 0===h?void 0:h.root,{ref:t}))});const Ut=(e,t)=>t&&e.length>1?[e[0]]:e,Kt=(e,t)=>o=>(0,n.A)({},o,{sorting:(0,n.A)({},o.sorting,{sortModel:Ut(e,t)})}),qt=(e,t)=>{const o=e.map(e=>((e,t)=>{const o=t.current.getColumn(e.field);if(!o||null===e.sort)return null;let n;return n=o.getSortComparator?o.getSortComparator(e.sort):"desc"===e.sort?function(){return-1*o.sortComparator(...arguments)}:o.sortComparator,n?{getSortCellParams:e=>({id:e,field:o.field,rowNode:bt(t,e),value:t.current.getCellValue(e,o.field),api:t.current}),comparator:n}:null})(e,t)).filter(e=>!!e);return 0===o.length?null:e=>e.map(e=>({node:e,params:o.map(t=>t.getSortCellParams(e.id))})).sort((e,t)=>{return n=e,r=t,o.reduce((e,t,o)=>{if(0!==e)return e;const l=n.params[o],i=r.params[o];return t.comparator(l.value,i.value,l,i)},0);var n,r}).map(e=>e.node.id)},_t=(e,t)=>{const o=e.indexOf(t);return t&&-1!==o&&o+1!==e.length?e[o+1]:e[0]},Xt=(e,t)=>null==e&&null!=t?-1:null==t&&null!=e?1:null==e&&null==t?0:null,Yt=new Intl.Collator,Qt=(e,t)=>{const o=Xt(e,t);return null!==o?o:Number(e)-Number(t)},$t=(e,t)=>{const o=Xt(e,t);return null!==o?o:e>t?1:e<t?-1:0};var Zt=o(713);const Jt=["item","applyValue","type","apiRef","focusElementRef","tabIndex","disabled","isFilterActive","slotProps","clearButton","headerFilterMenu"];function eo(e){var t,o,l;const{item:i,applyValue:a,type:c,apiRef:u,focusElementRef:d,tabIndex:p,disabled:f,slotProps:g,clearButton:h,headerFilterMenu:m}=e,v=(0,s.A)(e,Jt),b=null===g||void 0===g?void 0:g.root,w=(0,Lt.A)(),[C,y]=r.useState(to(i.value)),[A,x]=r.useState(!1),S=(0,Zt.A)(),R=W(),M=r.useCallback(e=>{const t=to(e.target.value);y(t),x(!0),w.start(R.filterDebounceMs,()=>{const e=(0,n.A)({},i,{value:"number"!==c||Number.isNaN(Number(t))?t:Number(t),fromInput:S});a(e),x(!1)})},[w,R.filterDebounceMs,i,c,S,a]);return r.useEffect(()=>{i.fromInput===S&&null!=i.value||y(to(i.value))},[S,i]),(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(R.slots.baseTextField,(0,n.A)({id:S,label:u.current.getLocaleText("filterPanelInputLabel"),placeholder:u.current.getLocaleText("filterPanelInputPlaceholder"),value:null!==C&&void 0!==C?C:"",onChange:M,type:c||"text",disabled:f,slotProps:(0,n.A)({},null===b||void 0===b?void 0:b.slotProps,{input:(0,n.A)({endAdornment:A?(0,q.jsx)(R.slots.loadIcon,{fontSize:"small",color:"action"}):null},null===b||void 0===b||null===(t=b.slotProps)||void 0===t?void 0:t.input),htmlInput:(0,n.A)({tabIndex:p},null===b||void 0===b||null===(o=b.slotProps)||void 0===o?void 0:o.htmlInput)}),inputRef:d},null===(l=R.slotProps)||void 0===l?void 0:l.baseTextField,v,b)),m,h]})}function to(e){if(null!=e&&""!==e)return String(e)}function oo(e){return"object"===typeof e&&null!==e}function no(e){return e.replace(/[-[\]{}()*+?.,\\^$|#\s]/g,"\\$&")}const ro=(e,t,o)=>Math.max(t,Math.min(o,e));function lo(e){return"function"===typeof structuredClone?structuredClone(e):JSON.parse(JSON.stringify(e))}const io=(e,t)=>o=>{e&&t(o)};function ao(e){const{item:t,applyValue:o,type:l,apiRef:i,focusElementRef:a,slotProps:s}=e,c=(0,Zt.A)(),[u,d]=r.useState([]),[p,f]=r.useState(t.value||[]),g=W();r.useEffect(()=>{var e;const o=null!==(e=t.value)&&void 0!==e?e:[];f(o.map(String))},[t.value]);const h=r.useCallback((e,r)=>{f(r.map(String)),o((0,n.A)({},t,{value:[...r.map(e=>"number"===l?Number(e):e)]}))},[o,t,l]),m=r.useCallback((e,t)=>{d(""===t?[]:[t])},[d]),v=g.slots.baseAutocomplete;return(0,q.jsx)(v,(0,n.A)({multiple:!0,freeSolo:!0,options:u,id:c,value:p,onChange:h,onInputChange:m,label:i.current.getLocaleText("filterPanelInputLabel"),placeholder:i.current.getLocaleText("filterPanelInputPlaceholder"),slotProps:{textField:{type:l||"text",inputRef:a}}},null===s||void 0===s?void 0:s.root))}var so=function(e){return e.And="and",e.Or="or",e}(so||{});const co={filteredRowsLookup:{},filteredChildrenCountLookup:{},filteredDescendantCountLookup:{}},uo=()=>({items:[],logicOperator:so.And,quickFilterValues:[],quickFilterLogicOperator:so.And});function po(e){return{current:e.current.getPublicApi()}}let fo;const go=(e,t)=>{const o=(0,n.A)({},e);if(null==o.id&&(o.id=Math.round(1e5*Math.random())),null==o.operator){const e=Fe(t)[o.field];o.operator=e&&e.filterOperators[0].value}return o},ho=(e,t,o)=>{const r=e.items.length>1;let l;l=r&&t?[e.items[0]]:e.items;const i=r&&l.some(e=>null==e.id);return l.some(e=>null==e.operator)||i?(0,n.A)({},e,{items:l.map(e=>go(e,o))}):e.items!==l?(0,n.A)({},e,{items:l}):e},mo=(e,t,o)=>r=>(0,n.A)({},r,{filterModel:ho(e,t,o)}),vo=e=>"string"===typeof e?e.normalize("NFD").replace(/[\u0300-\u036f]/g,""):e,bo=(e,t)=>{if(!e.field||!e.operator)return null;const o=t.current.getColumn(e.field);if(!o)return null;let r;if(o.valueParser){var l;const n=o.valueParser;r=Array.isArray(e.value)?null===(l=e.value)||void 0===l?void 0:l.map(e=>n(e,void 0,o,t)):n(e.value,void 0,o,t)}else r=e.value;const{ignoreDiacritics:i}=t.current.rootProps;i&&(r=vo(r));const a=(0,n.A)({},e,{value:r}),s=o.filterOperators;if(null===s||void 0===s||!s.length)throw new Error("MUI X: No filter operators found for column '".concat(o.field,"'."));const c=s.find(e=>e.value===a.operator);if(!c)throw new Error("MUI X: No filter operator found for column '".concat(o.field,"' and operator value '").concat(a.operator,"'."));const u=po(t),d=c.getApplyFilterFn(a,o);return"function"!==typeof d?null:{item:a,fn:e=>{let n=t.current.getRowValue(e,o);return i&&(n=vo(n)),d(n,e,o,u)}}};let wo=1;const Co=(e,t,o)=>{const{items:n}=e,r=n.map(e=>bo(e,t)).filter(e=>!!e);if(0===r.length)return null;if(o||!function(){if(void 0!==fo)return fo;try{fo=new Function("return true")()}catch(e){fo=!1}return fo}())return(e,t)=>{const o={};for(let n=0;n<r.length;n+=1){const l=r[n];t&&!t(l.item.field)||(o[l.item.id]=l.fn(e))}return o};const l=new Function("appliers","row","shouldApplyFilter",'"use strict";\n'.concat(r.map((e,t)=>"const shouldApply".concat(t," = !shouldApplyFilter || shouldApplyFilter(").concat(JSON.stringify(e.item.field),");")).join("\n"),"\n\nconst result$$ = {\n").concat(r.map((e,t)=>"  ".concat(JSON.stringify(String(e.item.id)),": !shouldApply").concat(t," ? false : appliers[").concat(t,"].fn(row),")).join("\n"),"\n};\n\nreturn result$$;").replaceAll("$$",String(wo)));wo+=1;return(e,t)=>l(r,e,t)},yo=e=>{var t;return null===(t=e.quickFilterExcludeHiddenColumns)||void 0===t||t},Ao=(e,t,o)=>{const n=Co(e,t,o),r=((e,t)=>{var o,n;const r=null!==(o=null===(n=e.quickFilterValues)||void 0===n?void 0:n.filter(Boolean))&&void 0!==o?o:[];if(0===r.length)return null;const l=Ee(t),i=He(t);let a;a=yo(e)?l.filter(e=>!1!==i[e]):l;const s=[],{ignoreDiacritics:c}=t.current.rootProps,u=po(t);return a.forEach(e=>{const o=t.current.getColumn(e),n=null===o||void 0===o?void 0:o.getApplyQuickFilterFn;n&&s.push({column:o,appliers:r.map(e=>{const t=c?vo(e):e;return{fn:n(t,o,u)}})})}),function(e,o){const n={};e:for(let l=0;l<r.length;l+=1){const i=r[l];for(let r=0;r<s.length;r+=1){const{column:a,appliers:d}=s[r],{field:p}=a;if(o&&!o(p))continue;const f=d[l];let g=t.current.getRowValue(e,a);if(null!==f.fn&&(c&&(g=vo(g)),f.fn(g,e,a,u))){n[i]=!0;continue e}}n[i]=!1}return n}})(e,t);return function(e,t,o){var l,i;o.passingFilterItems=null!==(l=null===n||void 0===n?void 0:n(e,t))&&void 0!==l?l:null,o.passingQuickFilterValues=null!==(i=null===r||void 0===r?void 0:r(e,t))&&void 0!==i?i:null}},xo=e=>null!=e,So=(e,t,o,n,r)=>{const l=((e,t,o)=>(e.cleanedFilterItems||(e.cleanedFilterItems=o.filter(e=>null!==bo(e,t))),e.cleanedFilterItems))(r,n,o.items),i=e.filter(xo),a=t.filter(xo);if(i.length>0){var s;const e=e=>i.some(t=>t[e.id]);if((null!==(s=o.logicOperator)&&void 0!==s?s:uo().logicOperator)===so.And){if(!l.every(e))return!1}else{if(!l.some(e))return!1}}if(a.length>0&&null!=o.quickFilterValues){var c;const e=e=>a.some(t=>t[e]);if((null!==(c=o.quickFilterLogicOperator)&&void 0!==c?c:uo().quickFilterLogicOperator)===so.And){if(!o.quickFilterValues.every(e))return!1}else{if(!o.quickFilterValues.some(e))return!1}}return!0},Ro=(e,t)=>o=>{if(!o.value)return null;const n=e?o.value:o.value.trim(),r=new RegExp(no(n),"i");return e=>{if(null==e)return t;const o=r.test(String(e));return t?!o:o}},Mo=(e,t)=>o=>{if(!o.value)return null;const n=e?o.value:o.value.trim(),r=new Intl.Collator(void 0,{sensitivity:"base",usage:"search"});return e=>{if(null==e)return t;const o=0===r.compare(n,e.toString());return t?!o:o}},Io=e=>()=>t=>{const o=""===t||null==t;return e?!o:o},Po={width:100,minWidth:50,maxWidth:1/0,hideable:!0,sortable:!0,resizable:!0,filterable:!0,groupable:!0,pinnable:!0,aggregable:!0,editable:!1,sortComparator:(e,t)=>{const o=Xt(e,t);return null!==o?o:"string"===typeof e?Yt.compare(e.toString(),t.toString()):e-t},type:"string",align:"left",filterOperators:function(){let e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return[{value:"contains",getApplyFilterFn:Ro(e,!1),InputComponent:eo},{value:"doesNotContain",getApplyFilterFn:Ro(e,!0),InputComponent:eo},{value:"equals",getApplyFilterFn:Mo(e,!1),InputComponent:eo},{value:"doesNotEqual",getApplyFilterFn:Mo(e,!0),InputComponent:eo},{value:"startsWith",getApplyFilterFn:t=>{if(!t.value)return null;const o=e?t.value:t.value.trim(),n=new RegExp("^".concat(no(o),".*$"),"i");return e=>null!=e&&n.test(e.toString())},InputComponent:eo},{value:"endsWith",getApplyFilterFn:t=>{if(!t.value)return null;const o=e?t.value:t.value.trim(),n=new RegExp(".*".concat(no(o),"$"),"i");return e=>null!=e&&n.test(e.toString())},InputComponent:eo},{value:"isEmpty",getApplyFilterFn:Io(!1),requiresFilterValue:!1},{value:"isNotEmpty",getApplyFilterFn:Io(!0),requiresFilterValue:!1},{value:"isAnyOf",getApplyFilterFn:t=>{if(!Array.isArray(t.value)||0===t.value.length)return null;const o=e?t.value:t.value.map(e=>e.trim()),n=new Intl.Collator(void 0,{sensitivity:"base",usage:"search"});return e=>null!=e&&o.some(t=>0===n.compare(t,e.toString()||""))},InputComponent:ao}]}(),renderEditCell:e=>(0,q.jsx)(Wt,(0,n.A)({},e)),getApplyQuickFilterFn:e=>{if(!e)return null;const t=new RegExp(no(e),"i");return(e,o,n,r)=>{let l=r.current.getRowFormattedValue(o,n);return r.current.ignoreDiacritics&&(l=vo(l)),null!=l&&t.test(l.toString())}}},ko=e=>null==e?null:Number(e),Eo=(0,n.A)({},Po,{type:"number",align:"right",headerAlign:"right",sortComparator:Qt,valueParser:e=>""===e?null:Number(e),valueFormatter:e=>function(e){return"number"===typeof e&&!Number.isNaN(e)}(e)?e.toLocaleString():e||"",filterOperators:[{value:"=",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>ko(t)===e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:"!=",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>ko(t)!==e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:">",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>null!=t&&ko(t)>e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:">=",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>null!=t&&ko(t)>=e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:"<",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>null!=t&&ko(t)<e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:"<=",getApplyFilterFn:e=>null==e.value||Number.isNaN(e.value)?null:t=>null!=t&&ko(t)<=e.value,InputComponent:eo,InputComponentProps:{type:"number"}},{value:"isEmpty",getApplyFilterFn:()=>e=>null==e,requiresFilterValue:!1},{value:"isNotEmpty",getApplyFilterFn:()=>e=>null!=e,requiresFilterValue:!1},{value:"isAnyOf",getApplyFilterFn:e=>Array.isArray(e.value)&&0!==e.value.length?t=>null!=t&&e.value.includes(Number(t)):null,InputComponent:ao,InputComponentProps:{type:"number"}}],getApplyQuickFilterFn:e=>null==e||Number.isNaN(e)||""===e?null:t=>ko(t)===ko(e)}),Fo=["item","applyValue","type","apiRef","focusElementRef","slotProps","isFilterActive","headerFilterMenu","clearButton","tabIndex","disabled"];function To(e,t){if(null==e)return"";const o=new Date(e);return Number.isNaN(o.getTime())?"":"date"===t?o.toISOString().substring(0,10):"datetime-local"===t?(o.setMinutes(o.getMinutes()-o.getTimezoneOffset()),o.toISOString().substring(0,19)):o.toISOString().substring(0,10)}function Ho(e){var t;const{item:o,applyValue:l,type:i,apiRef:a,focusElementRef:c,slotProps:u,headerFilterMenu:d,clearButton:p,tabIndex:f,disabled:g}=e,h=(0,s.A)(e,Fo),m=null===u||void 0===u?void 0:u.root.slotProps,v=(0,Lt.A)(),[b,w]=r.useState(()=>To(o.value,i)),[C,y]=r.useState(!1),A=(0,Zt.A)(),x=W(),S=r.useCallback(e=>{v.clear();const t=e.target.value;w(t),y(!0),v.start(x.filterDebounceMs,()=>{const e=new Date(t);l((0,n.A)({},o,{value:Number.isNaN(e.getTime())?void 0:e})),y(!1)})},[l,o,x.filterDebounceMs,v]);return r.useEffect(()=>{const e=To(o.value,i);w(e)},[o.value,i]),(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(x.slots.baseTextField,(0,n.A)({fullWidth:!0,id:A,label:a.current.getLocaleText("filterPanelInputLabel"),placeholder:a.current.getLocaleText("filterPanelInputPlaceholder"),value:b,onChange:S,type:i||"text",disabled:g,inputRef:c,slotProps:(0,n.A)({},m,{input:(0,n.A)({endAdornment:C?(0,q.jsx)(x.slots.loadIcon,{fontSize:"small",color:"action"}):null},null===m||void 0===m?void 0:m.input),htmlInput:(0,n.A)({max:"datetime-local"===i?"9999-12-31T23:59":"9999-12-31",tabIndex:f},null===m||void 0===m?void 0:m.htmlInput)})},null===(t=x.slotProps)||void 0===t?void 0:t.baseTextField,h,null===u||void 0===u?void 0:u.root)),d,p]})}function Do(e,t,o,n){if(!e.value)return null;const r=new Date(e.value);o?r.setSeconds(0,0):(r.setMinutes(r.getMinutes()+r.getTimezoneOffset()),r.setHours(0,0,0,0));const l=r.getTime();return e=>{if(!e)return!1;if(n)return t(e.getTime(),l);const r=new Date(e);return o?r.setSeconds(0,0):r.setHours(0,0,0,0),t(r.getTime(),l)}}const Oo=e=>[{value:"is",getApplyFilterFn:t=>Do(t,(e,t)=>e===t,e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"not",getApplyFilterFn:t=>Do(t,(e,t)=>e!==t,e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"after",getApplyFilterFn:t=>Do(t,(e,t)=>e>t,e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"onOrAfter",getApplyFilterFn:t=>Do(t,(e,t)=>e>=t,e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"before",getApplyFilterFn:t=>Do(t,(e,t)=>e<t,e,!e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"onOrBefore",getApplyFilterFn:t=>Do(t,(e,t)=>e<=t,e),InputComponent:Ho,InputComponentProps:{type:e?"datetime-local":"date"}},{value:"isEmpty",getApplyFilterFn:()=>e=>null==e,requiresFilterValue:!1},{value:"isNotEmpty",getApplyFilterFn:()=>e=>null!=e,requiresFilterValue:!1}],zo=["id","value","formattedValue","api","field","row","rowNode","colDef","cellMode","isEditable","tabIndex","hasFocus","inputProps","isValidating","isProcessingProps","onValueChange","slotProps"],Lo=(0,m.Ay)(Bt)({fontSize:"inherit"});function jo(e){var t;const{id:o,value:l,field:i,colDef:a,hasFocus:c,onValueChange:u,slotProps:d}=e,f=(0,s.A)(e,zo),g="dateTime"===a.type,h=Xe(),m=r.useRef(null),v=r.useMemo(()=>{let e,t;if(e=null==l?null:l instanceof Date?l:new Date((null!==l&&void 0!==l?l:"").toString()),null==e||Number.isNaN(e.getTime()))t="";else{t=new Date(e.getTime()-60*e.getTimezoneOffset()*1e3).toISOString().substr(0,g?16:10)}return{parsed:e,formatted:t}},[l,g]),[b,C]=r.useState(v),y=W(),A=(e=>{const{classes:t}=e;return(0,p.A)({root:["editInputCell"]},w,t)})({classes:y.classes}),x=r.useCallback(e=>{if(""===e)return null;const[t,o]=e.split("T"),[n,r,l]=t.split("-"),i=new Date;if(i.setFullYear(Number(n),Number(r)-1,Number(l)),i.setHours(0,0,0,0),o){const[e,t]=o.split(":");i.setHours(Number(e),Number(t),0,0)}return i},[]),S=r.useCallback(async e=>{const t=e.target.value,n=x(t);u&&await u(e,n),C({parsed:n,formatted:t}),h.current.setEditCellValue({id:o,field:i,value:n},e)},[h,i,o,u,x]);return r.useEffect(()=>{C(e=>{var t,o;return v.parsed!==e.parsed&&(null===(t=v.parsed)||void 0===t?void 0:t.getTime())!==(null===(o=e.parsed)||void 0===o?void 0:o.getTime())?v:e})},[v]),(0,Nt.A)(()=>{c&&m.current.focus()},[c]),(0,q.jsx)(Lo,(0,n.A)({as:y.slots.baseInput,inputRef:m,fullWidth:!0,className:A.root,type:g?"datetime-local":"date",value:b.formatted,onChange:S},f,null===d||void 0===d?void 0:d.root,{slotProps:{htmlInput:(0,n.A)({max:g?"9999-12-31T23:59":"9999-12-31"},null===d||void 0===d||null===(t=d.root)||void 0===t||null===(t=t.slotProps)||void 0===t?void 0:t.htmlInput)}}))}const No=e=>(0,q.jsx)(jo,(0,n.A)({},e));const Bo="auto-generated-group-node-root",Vo=Symbol("mui.id_autogenerated");const Go=(e,t,o)=>{const n=t?t(e):e.id;return function(e,t){if(null==e)throw new Error(["MUI X: The Data Grid component requires all rows to have a unique `id` property.","Alternatively, you can use the `getRowId` prop to specify a custom id for each row.",arguments.length>2&&void 0!==arguments[2]?arguments[2]:"A row was provided without id in the rows prop:",JSON.stringify(t)].join("\n"))}(n,e,o),n},Wo=e=>{let{rows:t,getRowId:o,loading:n,rowCount:r}=e;const l={type:"full",rows:[]},i={};for(let a=0;a<t.length;a+=1){const e=t[a],n=Go(e,o);i[n]=e,l.rows.push(n)}return{rowsBeforePartialUpdates:t,loadingPropBeforePartialUpdates:n,rowCountPropBeforePartialUpdates:r,updates:l,dataRowIdToModelLookup:i}},Uo=e=>{let{tree:t,rowCountProp:o=0}=e;const n=t[Bo];return Math.max(o,n.children.length+(null==n.footerId?0:1))},Ko=e=>{let{apiRef:t,rowCountProp:o=0,loadingProp:r,previousTree:l,previousTreeDepths:i,previousGroupsToFetch:a}=e;const s=t.current.caches.rows,{tree:c,treeDepths:u,dataRowIds:d,groupingName:p,groupsToFetch:f=[]}=t.current.applyStrategyProcessor("rowTreeCreation",{previousTree:l,previousTreeDepths:i,updates:s.updates,dataRowIdToModelLookup:s.dataRowIdToModelLookup,previousGroupsToFetch:a}),g=t.current.unstable_applyPipeProcessors("hydrateRows",{tree:c,treeDepths:u,dataRowIds:d,dataRowIdToModelLookup:s.dataRowIdToModelLookup});return t.current.caches.rows.updates={type:"partial",actions:{insert:[],modify:[],remove:[]},idToActionLookup:{}},(0,n.A)({},g,{totalRowCount:Math.max(o,g.dataRowIds.length),totalTopLevelRowCount:Uo({tree:g.tree,rowCountProp:o}),groupingName:p,loading:r,groupsToFetch:f})},qo=e=>Vo in e,_o=e=>"skeletonRow"===e.type||"footer"===e.type||"group"===e.type&&e.isAutoGenerated||"pinnedRow"===e.type&&e.isAutoGenerated,Xo=(e,t,o,n)=>{const r=e[t];if("group"!==r.type)return[];const l=[];for(let i=0;i<r.children.length;i+=1){const t=r.children[i];if(o&&_o(e[t])||l.push(t),n)continue;const a=Xo(e,t,o,n);for(let e=0;e<a.length;e+=1)l.push(a[e])}return o||null==r.footerId||l.push(r.footerId),l},Yo=e=>{var t,o,r;let{previousCache:l,getRowId:i,updates:a,groupKeys:s}=e;if("full"===l.updates.type)throw new Error("MUI X: Unable to prepare a partial update if a full update is not applied yet.");const c=new Map;a.forEach(e=>{const t=Go(e,i,"A row was provided without id when calling updateRows():");c.has(t)?c.set(t,(0,n.A)({},c.get(t),e)):c.set(t,e)});const u={type:"partial",actions:{insert:[...null!==(t=l.updates.actions.insert)&&void 0!==t?t:[]],modify:[...null!==(o=l.updates.actions.modify)&&void 0!==o?o:[]],remove:[...null!==(r=l.updates.actions.remove)&&void 0!==r?r:[]]},idToActionLookup:(0,n.A)({},l.updates.idToActionLookup),groupKeys:s},d=(0,n.A)({},l.dataRowIdToModelLookup),p={insert:{},modify:{},remove:{}};c.forEach((e,t)=>{const o=u.idToActionLookup[t];if("delete"===e._action){if("remove"===o||!d[t])return;return null!=o&&(p[o][t]=!0),u.actions.remove.push(t),void delete d[t]}const r=d[t];if(r)return"remove"===o?(p.remove[t]=!0,u.actions.modify.push(t)):null==o&&u.actions.modify.push(t),void(d[t]=(0,n.A)({},r,e));"remove"===o?(p.remove[t]=!0,u.actions.insert.push(t)):null==o&&u.actions.insert.push(t),d[t]=e});const f=Object.keys(p);for(let n=0;n<f.length;n+=1){const e=f[n],t=p[e];Object.keys(t).length>0&&(u.actions[e]=u.actions[e].filter(e=>!t[e]))}return{dataRowIdToModelLookup:d,updates:u,rowsBeforePartialUpdates:l.rowsBeforePartialUpdates,loadingPropBeforePartialUpdates:l.loadingPropBeforePartialUpdates,rowCountPropBeforePartialUpdates:l.rowCountPropBeforePartialUpdates}},Qo="var(--DataGrid-overlayHeight, calc(var(--height) * 2))";function $o(e,t,o){const r=[];return t.forEach(t=>{const l=Go(t,o,"A row was provided without id when calling updateRows():"),i=bt(e,l);if("pinnedRow"===(null===i||void 0===i?void 0:i.type)){const o=e.current.caches.pinnedRows,r=o.idLookup[l];r&&(o.idLookup[l]=(0,n.A)({},r,t))}else r.push(t)}),r}const Zo=(e,t,o)=>"number"===typeof e&&e>0?e:t,Jo=(["MUI X: The `rowHeight` prop should be a number greater than 0.","The default value will be used instead."].join("\n"),["MUI X: The `getRowHeight` prop should return a number greater than 0 or 'auto'.","The default value will be used instead."].join("\n"),me((e,t)=>Vo in t?t[Vo]:e.props.getRowId?e.props.getRowId(t):t.id));function en(e){let{value:t,columnType:o,rowId:n,field:r}=e;if(!(t instanceof Date))throw new Error(["MUI X: `".concat(o,"` column type only accepts `Date` objects as values."),"Use `valueGetter` to transform the value into a `Date` object.","Row ID: ".concat(n,', field: "').concat(r,'".')].join("\n"))}const tn=(0,n.A)({},Po,{type:"date",sortComparator:$t,valueFormatter:(e,t,o,n)=>{if(!e)return"";const r=Jo(n,t);return!qo(t)||e instanceof Date?(en({value:e,columnType:"date",rowId:r,field:o.field}),e.toLocaleDateString()):e},filterOperators:Oo(),renderEditCell:No,pastedValueParser:e=>new Date(e)}),on=(0,n.A)({},Po,{type:"dateTime",sortComparator:$t,valueFormatter:(e,t,o,n)=>{if(!e)return"";const r=Jo(n,t);return!qo(t)||e instanceof Date?(en({value:e,columnType:"dateTime",rowId:r,field:o.field}),e.toLocaleString()):e},filterOperators:Oo(!0),renderEditCell:No,pastedValueParser:e=>new Date(e)}),nn="__row_group_by_columns_group__",rn="__detail_panel_toggle__";let ln=function(e){return e[e.NONE=0]="NONE",e[e.LEFT=1]="LEFT",e[e.RIGHT=2]="RIGHT",e[e.VIRTUAL=3]="VIRTUAL",e}({});const an=["id","value","formattedValue","api","field","row","rowNode","colDef","cellMode","isEditable","hasFocus","tabIndex","hideDescendantCount"];function sn(e){const{value:t,rowNode:o}=e,l=(0,s.A)(e,an),i=Xe(),a=W(),c=(e=>{const{classes:t}=e;return(0,p.A)({root:["booleanCell"]},w,t)})({classes:a.classes}),u=D(i,At)>0&&"group"===o.type&&!1===a.treeData,d=r.useMemo(()=>t?a.slots.booleanCellTrueIcon:a.slots.booleanCellFalseIcon,[a.slots.booleanCellFalseIcon,a.slots.booleanCellTrueIcon,t]);return u&&void 0===t?null:(0,q.jsx)(d,(0,n.A)({fontSize:"small",className:c.root,titleAccess:i.current.getLocaleText(t?"booleanCellTrueLabel":"booleanCellFalseLabel"),"data-value":Boolean(t)},l))}const cn=r.memo(sn);const un=["id","value","formattedValue","api","field","row","rowNode","colDef","cellMode","isEditable","tabIndex","className","hasFocus","isValidating","isProcessingProps","error","onValueChange"];function dn(e){var t;const{id:o,value:l,field:i,className:a,hasFocus:u,onValueChange:d}=e,f=(0,s.A)(e,un),g=Xe(),h=r.useRef(null),m=(0,Zt.A)(),[v,b]=r.useState(l),C=W(),y=(e=>{const{classes:t}=e;return(0,p.A)({root:["editBooleanCell"]},w,t)})({classes:C.classes}),A=r.useCallback(async e=>{const t=e.target.checked;d&&await d(e,t),b(t),await g.current.setEditCellValue({id:o,field:i,value:t},e)},[g,i,o,d]);return r.useEffect(()=>{b(l)},[l]),(0,Nt.A)(()=>{u&&h.current.focus()},[u]),(0,q.jsx)("label",(0,n.A)({htmlFor:m,className:(0,c.A)(y.root,a)},f,{children:(0,q.jsx)(C.slots.baseCheckbox,(0,n.A)({id:m,inputRef:h,checked:Boolean(v),onChange:A,size:"small"},null===(t=C.slotProps)||void 0===t?void 0:t.baseCheckbox))}))}const pn=["item","applyValue","apiRef","focusElementRef","isFilterActive","headerFilterMenu","clearButton","tabIndex","slotProps"];function fn(e){var t,o,l,i;const{item:a,applyValue:c,apiRef:u,focusElementRef:d,headerFilterMenu:p,clearButton:f,tabIndex:g,slotProps:h}=e,m=(0,s.A)(e,pn),[v,b]=r.useState(gn(a.value)),w=W(),C=(0,Zt.A)(),y=(0,Zt.A)(),A=(null===(t=w.slotProps)||void 0===t?void 0:t.baseSelect)||{},x=null!==(o=A.native)&&void 0!==o&&o,S=(null===(l=w.slotProps)||void 0===l?void 0:l.baseSelectOption)||{},R=r.useCallback(e=>{const t=gn(e.target.value);b(t),c((0,n.A)({},a,{value:t}))},[c,a]);r.useEffect(()=>{b(gn(a.value))},[a.value]);const M=null!==(i=null===h||void 0===h?void 0:h.root.label)&&void 0!==i?i:u.current.getLocaleText("filterPanelInputLabel"),I=null===h||void 0===h?void 0:h.root.slotProps;return(0,q.jsxs)(r.Fragment,{children:[(0,q.jsxs)(w.slots.baseSelect,(0,n.A)({fullWidth:!0,labelId:C,id:y,label:M,value:void 0===v?"":String(v),onChange:R,native:x,slotProps:{htmlInput:(0,n.A)({ref:d,tabIndex:g},null===I||void 0===I?void 0:I.htmlInput)}},A,m,null===h||void 0===h?void 0:h.root,{children:[(0,q.jsx)(w.slots.baseSelectOption,(0,n.A)({},S,{native:x,value:"",children:u.current.getLocaleText("filterValueAny")})),(0,q.jsx)(w.slots.baseSelectOption,(0,n.A)({},S,{native:x,value:"true",children:u.current.getLocaleText("filterValueTrue")})),(0,q.jsx)(w.slots.baseSelectOption,(0,n.A)({},S,{native:x,value:"false",children:u.current.getLocaleText("filterValueFalse")}))]})),p,f]})}function gn(e){return"true"===String(e).toLowerCase()||"false"!==String(e).toLowerCase()&&void 0}const hn=(0,n.A)({},Po,{type:"boolean",display:"flex",align:"center",headerAlign:"center",renderCell:e=>e.field!==nn&&_o(e.rowNode)?"":(0,q.jsx)(cn,(0,n.A)({},e)),renderEditCell:e=>(0,q.jsx)(dn,(0,n.A)({},e)),sortComparator:Qt,valueFormatter:(e,t,o,n)=>e?n.current.getLocaleText("booleanCellTrueLabel"):n.current.getLocaleText("booleanCellFalseLabel"),filterOperators:[{value:"is",getApplyFilterFn:e=>{const t=gn(e.value);return void 0===t?null:e=>Boolean(e)===t},InputComponent:fn}],getApplyQuickFilterFn:()=>null,aggregable:!1,pastedValueParser:e=>(e=>{switch(e.toLowerCase().trim()){case"true":case"yes":case"1":return!0;case"false":case"no":case"0":case"null":case"undefined":return!1;default:return}})(e)});var mn=function(e){return e.enterKeyDown="enterKeyDown",e.cellDoubleClick="cellDoubleClick",e.printableKeyDown="printableKeyDown",e.deleteKeyDown="deleteKeyDown",e.pasteKeyDown="pasteKeyDown",e}(mn||{}),vn=function(e){return e.cellFocusOut="cellFocusOut",e.escapeKeyDown="escapeKeyDown",e.enterKeyDown="enterKeyDown",e.tabKeyDown="tabKeyDown",e.shiftTabKeyDown="shiftTabKeyDown",e}(vn||{}),bn=function(e){return e.Cell="cell",e.Row="row",e}(bn||{}),wn=function(e){return e.Edit="edit",e.View="view",e}(wn||{}),Cn=function(e){return e.Edit="edit",e.View="view",e}(Cn||{});function yn(e){return"singleSelect"===(null===e||void 0===e?void 0:e.type)}function An(e,t){if(e)return"function"===typeof e.valueOptions?e.valueOptions((0,n.A)({field:e.field},t)):e.valueOptions}function xn(e,t,o){if(void 0===t)return;const n=t.find(t=>{const n=o(t);return String(n)===String(e)});return o(n)}const Sn=["id","value","formattedValue","api","field","row","rowNode","colDef","cellMode","isEditable","tabIndex","className","hasFocus","isValidating","isProcessingProps","error","onValueChange","initialOpen","slotProps"];function Rn(e){var t,o,l;const i=W(),{id:a,value:c,field:u,row:d,colDef:p,hasFocus:f,error:g,onValueChange:h,initialOpen:m=i.editMode===bn.Cell,slotProps:v}=e,b=(0,s.A)(e,Sn),w=Xe(),C=r.useRef(null),y=r.useRef(null),[A,x]=r.useState(m),S=null!==(o=((null===(t=i.slotProps)||void 0===t?void 0:t.baseSelect)||{}).native)&&void 0!==o&&o;if((0,Nt.A)(()=>{var e;f&&(null===(e=y.current)||void 0===e||e.focus())},[f]),!yn(p))return null;const R=An(p,{id:a,row:d});if(!R)return null;const M=p.getOptionValue,I=p.getOptionLabel;return R&&p?(0,q.jsx)(i.slots.baseSelect,(0,n.A)({ref:C,value:c,onChange:async e=>{if(!yn(p)||!R)return;x(!1);const t=xn(e.target.value,R,M);h&&await h(e,t),await w.current.setEditCellValue({id:a,field:u,value:t},e)},open:A,onOpen:e=>{(function(e){return"key"in e&&!!e.key})(e)&&"Enter"===e.key||x(!0)},onClose:(e,t)=>{if(i.editMode!==bn.Row){if("backdropClick"===t||"Escape"===e.key){const t=w.current.getCellParams(a,u);w.current.publishEvent("cellEditStop",(0,n.A)({},t,{reason:"Escape"===e.key?vn.escapeKeyDown:vn.cellFocusOut}))}}else x(!1)},error:g,native:S,fullWidth:!0,slotProps:{htmlInput:{ref:y}}},b,null===v||void 0===v?void 0:v.root,null===(l=i.slotProps)||void 0===l?void 0:l.baseSelect,{children:R.map(e=>{var t;const o=M(e);return(0,r.createElement)(i.slots.baseSelectOption,(0,n.A)({},(null===(t=i.slotProps)||void 0===t?void 0:t.baseSelectOption)||{},{native:S,key:o,value:o}),I(e))})})):null}const Mn=["item","applyValue","type","apiRef","focusElementRef","tabIndex","isFilterActive","clearButton","headerFilterMenu","slotProps"],In=e=>{let{column:t,OptionComponent:o,getOptionLabel:l,getOptionValue:i,isSelectNative:a,baseSelectOptionProps:s}=e;return["",...An(t)||[]].map(e=>{const t=i(e);let c=l(e);return""===c&&(c="\u2003"),(0,r.createElement)(o,(0,n.A)({},s,{native:a,key:t,value:t}),c)})};function Pn(e){var t,o,l,i,a,c,u,d;const{item:p,applyValue:f,type:g,apiRef:h,focusElementRef:m,tabIndex:v,clearButton:b,headerFilterMenu:w,slotProps:C}=e,y=(0,s.A)(e,Mn),A=null!==(t=p.value)&&void 0!==t?t:"",x=(0,Zt.A)(),S=(0,Zt.A)(),R=W(),M=null!==(o=null===(l=R.slotProps)||void 0===l||null===(l=l.baseSelect)||void 0===l?void 0:l.native)&&void 0!==o&&o,I=h.current.getColumn(p.field),P=I.getOptionValue,k=I.getOptionLabel,E=r.useMemo(()=>An(I),[I]),F=r.useCallback(e=>{let t=e.target.value;t=xn(t,E,P),f((0,n.A)({},p,{value:t}))},[E,P,f,p]);if(!I||!yn(I))return null;const T=null!==(i=null===C||void 0===C?void 0:C.root.label)&&void 0!==i?i:h.current.getLocaleText("filterPanelInputLabel");return(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(R.slots.baseSelect,(0,n.A)({fullWidth:!0,id:x,label:T,labelId:S,value:A,onChange:F,slotProps:{htmlInput:(0,n.A)({tabIndex:v,ref:m,type:g||"text",placeholder:null!==(a=null===C||void 0===C?void 0:C.root.placeholder)&&void 0!==a?a:h.current.getLocaleText("filterPanelInputPlaceholder")},null===C||void 0===C||null===(c=C.root.slotProps)||void 0===c?void 0:c.htmlInput)},native:M},null===(u=R.slotProps)||void 0===u?void 0:u.baseSelect,y,null===C||void 0===C?void 0:C.root,{children:In({column:I,OptionComponent:R.slots.baseSelectOption,getOptionLabel:k,getOptionValue:P,isSelectNative:M,baseSelectOptionProps:null===(d=R.slotProps)||void 0===d?void 0:d.baseSelectOption})})),w,b]})}const kn=["item","applyValue","type","apiRef","focusElementRef","slotProps"];function En(e){const{item:t,applyValue:o,type:l,apiRef:i,focusElementRef:a,slotProps:c}=e,u=(0,s.A)(e,kn),d=(0,Zt.A)(),p=W(),f=i.current.getColumn(t.field),g=f.getOptionValue,h=f.getOptionLabel,m=r.useCallback((e,t)=>g(e)===g(t),[g]),v=r.useMemo(()=>An(f)||[],[f]),b=r.useMemo(()=>Array.isArray(t.value)?t.value.reduce((e,t)=>{const o=v.find(e=>g(e)===t);return null!=o&&e.push(o),e},[]):[],[g,t.value,v]),w=r.useCallback((e,r)=>{o((0,n.A)({},t,{value:r.map(g)}))},[o,t,g]);if(!f||!yn(f))return null;const C=p.slots.baseAutocomplete;return(0,q.jsx)(C,(0,n.A)({multiple:!0,options:v,isOptionEqualToValue:m,id:d,value:b,onChange:w,getOptionLabel:h,label:i.current.getLocaleText("filterPanelInputLabel"),placeholder:i.current.getLocaleText("filterPanelInputPlaceholder"),slotProps:{textField:{type:l||"text",inputRef:a}}},u,null===c||void 0===c?void 0:c.root))}const Fn=e=>null!=e&&oo(e)?e.value:e,Tn=(0,n.A)({},Po,{type:"singleSelect",getOptionLabel:e=>oo(e)?e.label:String(e),getOptionValue:e=>oo(e)?e.value:e,valueFormatter(e,t,o,n){const r=Jo(n,t);if(!yn(o))return"";const l=An(o,{id:r,row:t});if(null==e)return"";if(!l)return e;if("object"!==typeof l[0])return o.getOptionLabel(e);const i=l.find(t=>o.getOptionValue(t)===e);return i?o.getOptionLabel(i):""},renderEditCell:e=>(0,q.jsx)(Rn,(0,n.A)({},e)),filterOperators:[{value:"is",getApplyFilterFn:e=>null==e.value||""===e.value?null:t=>Fn(t)===Fn(e.value),InputComponent:Pn},{value:"not",getApplyFilterFn:e=>null==e.value||""===e.value?null:t=>Fn(t)!==Fn(e.value),InputComponent:Pn},{value:"isAnyOf",getApplyFilterFn:e=>{if(!Array.isArray(e.value)||0===e.value.length)return null;const t=e.value.map(Fn);return e=>t.includes(Fn(e))},InputComponent:En}],pastedValueParser:(e,t,o)=>{const n=o,r=An(n)||[],l=n.getOptionValue;if(r.find(t=>l(t)===e))return e}});var Hn=o(2432);function Dn(e){return 1===e.key.length&&!e.ctrlKey&&!e.metaKey}const On=e=>0===e.indexOf("Arrow")||0===e.indexOf("Page")||" "===e||"Home"===e||"End"===e,zn=e=>"Tab"===e||"Escape"===e;function Ln(e){return(e.ctrlKey||e.metaKey)&&"V"===String.fromCharCode(e.keyCode)&&!e.shiftKey&&!e.altKey}const jn=["open","target","onClose","children","position","className","onExited"],Nn=(0,m.Ay)(Bt,{name:"MuiDataGrid",slot:"Menu"})({zIndex:S.zIndex.menu,["& .".concat(C.menuList)]:{outline:0}});function Bn(e){var t;const{open:o,target:l,onClose:i,children:a,position:u,className:d,onExited:f}=e,g=(0,s.A)(e,jn),h=Xe(),m=W(),v=(e=>{const{classes:t}=e;return(0,p.A)({root:["menu"]},w,t)})(m),b=X(),C=r.useRef(null);(0,Nt.A)(()=>{var e,t;o?C.current=document.activeElement instanceof HTMLElement?document.activeElement:null:(null===(e=C.current)||void 0===e||null===(t=e.focus)||void 0===t||t.call(e),C.current=null)},[o]),r.useEffect(()=>{const e=o?"menuOpen":"menuClose";h.current.publishEvent(e,{target:l})},[h,o,l]);return(0,q.jsx)(Nn,(0,n.A)({as:m.slots.basePopper,className:(0,c.A)(v.root,d,b),ownerState:m,open:o,target:l,transition:!0,placement:u,onClickAway:e=>{e.target&&(l===e.target||null!==l&&void 0!==l&&l.contains(e.target))||i(e)},onExited:f,clickAwayMouseEvent:"onMouseDown",onKeyDown:e=>{zn(e.key)&&i(e)}},g,null===(t=m.slotProps)||void 0===t?void 0:t.basePopper,{children:a}))}const Vn=["api","colDef","id","hasFocus","isEditable","field","value","formattedValue","row","rowNode","cellMode","tabIndex","position","focusElementRef"];function Gn(e){var t;const{colDef:o,id:l,hasFocus:i,tabIndex:a,position:c="bottom-end",focusElementRef:u}=e,d=(0,s.A)(e,Vn),[p,f]=r.useState(-1),[g,h]=r.useState(!1),m=Xe(),v=r.useRef(null),b=r.useRef(null),w=r.useRef(!1),y=r.useRef({}),A=(0,Hn.I)(),x=(0,Zt.A)(),S=(0,Zt.A)(),R=W();if(!(e=>"function"===typeof e.getActions)(o))throw new Error("MUI X: Missing the `getActions` property in the `GridColDef`.");const M=o.getActions(m.current.getRowParams(l)),I=M.filter(e=>!e.props.showInMenu),P=M.filter(e=>e.props.showInMenu),k=I.length+(P.length?1:0);r.useLayoutEffect(()=>{i||Object.entries(y.current).forEach(e=>{let[t,o]=e;null===o||void 0===o||o.stop({},()=>{delete y.current[t]})})},[i]),r.useEffect(()=>{if(p<0||!v.current)return;if(p>=v.current.children.length)return;v.current.children[p].focus({preventScroll:!0})},[p]),r.useEffect(()=>{i||(f(-1),w.current=!1)},[i]),r.useImperativeHandle(u,()=>({focus(){if(!w.current){const e=M.findIndex(e=>!e.props.disabled);f(e)}}}),[M]),r.useEffect(()=>{p>=k&&f(k-1)},[p,k]);const E=()=>{h(!1)},F=e=>t=>{y.current[e]=t},T=(e,t)=>o=>{f(e),w.current=!0,t&&t(o)},H=k>0?{role:"menu",onKeyDown:e=>{if(k<=1)return;const t=(e,o)=>{var n;if(e<0||e>M.length)return e;const r=("left"===o?-1:1)*(A?-1:1);return null!==(n=M[e+r])&&void 0!==n&&n.props.disabled?t(e+r,o):e+r};let o=p;"ArrowRight"===e.key?o=t(p,"right"):"ArrowLeft"===e.key&&(o=t(p,"left")),o<0||o>=k||o!==p&&(e.preventDefault(),e.stopPropagation(),f(o))}}:void 0;return(0,q.jsxs)("div",(0,n.A)({ref:v,tabIndex:-1,className:C.actionsCell},H,d,{children:[I.map((e,t)=>r.cloneElement(e,{key:t,touchRippleRef:F(t),onClick:T(t,e.props.onClick),tabIndex:p===t?a:-1})),P.length>0&&S&&(0,q.jsx)(R.slots.baseIconButton,(0,n.A)({ref:b,id:S,"aria-label":m.current.getLocaleText("actionsCellMore"),"aria-haspopup":"menu","aria-expanded":g,"aria-controls":g?x:void 0,role:"menuitem",size:"small",onClick:e=>{e.stopPropagation(),e.preventDefault(),g?E():(h(!0),f(k-1),w.current=!0)},touchRippleRef:F(S),tabIndex:p===I.length?a:-1},null===(t=R.slotProps)||void 0===t?void 0:t.baseIconButton,{children:(0,q.jsx)(R.slots.moreActionsIcon,{fontSize:"small"})})),P.length>0&&(0,q.jsx)(Bn,{open:g,target:b.current,position:c,onClose:E,children:(0,q.jsx)(R.slots.baseMenuList,{id:x,className:C.menuList,"aria-labelledby":S,autoFocusItem:!0,children:P.map((e,t)=>r.cloneElement(e,{key:t,closeMenu:E}))})})]}))}const Wn="actions",Un=(0,n.A)({},Po,{sortable:!1,filterable:!1,aggregable:!1,width:100,display:"flex",align:"center",headerAlign:"center",headerName:"",disableColumnMenu:!0,disableExport:!0,renderCell:e=>(0,q.jsx)(Gn,(0,n.A)({},e)),getApplyQuickFilterFn:()=>null}),Kn=me(e=>e.headerFiltering),qn=ge(Kn,e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.enabled)&&void 0!==t&&t}),_n=ge(Kn,e=>e.editing),Xn=ge(Kn,e=>e.menuOpen),Yn=me(e=>e.columnGrouping),Qn=he(Yn,e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.unwrappedGroupingModel)&&void 0!==t?t:{}}),$n=he(Yn,e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.lookup)&&void 0!==t?t:{}}),Zn=he(Yn,e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.headerStructure)&&void 0!==t?t:[]}),Jn=ge(Yn,e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.maxDepth)&&void 0!==t?t:0}),er=["maxWidth","minWidth","width","flex"],tr={string:Po,number:Eo,date:tn,dateTime:on,boolean:hn,singleSelect:Tn,[Wn]:Un,custom:Po};const or=(e,t)=>{const o={};let r=0,l=0;const i=[];e.orderedFields.forEach(t=>{let a=e.lookup[t],s=0,c=!1;!1!==e.columnVisibilityModel[t]&&(a.flex&&a.flex>0?(r+=a.flex,c=!0):s=ro(a.width||Po.width,a.minWidth||Po.minWidth,a.maxWidth||Po.maxWidth),l+=s),a.computedWidth!==s&&(a=(0,n.A)({},a,{computedWidth:s})),c&&i.push(a),o[t]=a});const a=void 0===t?0:t.viewportOuterSize.width-(t.hasScrollY?t.scrollbarSize:0),s=Math.max(a-l,0);if(r>0&&a>0){const e=function(e){let{initialFreeSpace:t,totalFlexUnits:o,flexColumns:n}=e;const r=new Set(n.map(e=>e.field)),l={all:{},frozenFields:[],freeze:e=>{const t=l.all[e];t&&!0!==t.frozen&&(l.all[e].frozen=!0,l.frozenFields.push(e))}};return function e(){if(l.frozenFields.length===r.size)return;const i={min:{},max:{}};let a=t,s=o,c=0;l.frozenFields.forEach(e=>{a-=l.all[e].computedWidth,s-=l.all[e].flex});for(let t=0;t<n.length;t+=1){const e=n[t];if(l.all[e.field]&&!0===l.all[e.field].frozen)continue;let o=a/s*e.flex;o<e.minWidth?(c+=e.minWidth-o,o=e.minWidth,i.min[e.field]=!0):o>e.maxWidth&&(c+=e.maxWidth-o,o=e.maxWidth,i.max[e.field]=!0),l.all[e.field]={frozen:!1,computedWidth:o,flex:e.flex}}c<0?Object.keys(i.max).forEach(e=>{l.freeze(e)}):c>0?Object.keys(i.min).forEach(e=>{l.freeze(e)}):n.forEach(e=>{let{field:t}=e;l.freeze(t)}),e()}(),l.all}({initialFreeSpace:s,totalFlexUnits:r,flexColumns:i});Object.keys(e).forEach(t=>{o[t]=(0,n.A)({},o[t],{computedWidth:e[t].computedWidth})})}return(0,n.A)({},e,{lookup:o})};function nr(e){let t=tr.string;return e&&tr[e]&&(t=tr[e]),t}const rr=e=>{var t,o,r;let{apiRef:l,columnsToUpsert:i,initialState:a,columnVisibilityModel:s=He(l),keepOnlyColumnsToUpsert:c=!1,updateInitialVisibilityModel:u=!1}=e;const d=!l.current.state.columns;let p;if(d)p={orderedFields:[],lookup:{},columnVisibilityModel:s,initialColumnVisibilityModel:s};else{const e=ke(l);p={orderedFields:c?[]:[...e.orderedFields],lookup:(0,n.A)({},e.lookup),columnVisibilityModel:s,initialColumnVisibilityModel:u?s:e.initialColumnVisibilityModel}}const f={};if(c&&!d)for(const n in p.lookup)Object.prototype.hasOwnProperty.call(p.lookup,n)&&(f[n]=!1);const g={};i.forEach(e=>{const{field:t}=e;g[t]=!0,f[t]=!0;let o=p.lookup[t];null==o?(o=(0,n.A)({},nr(e.type),{field:t,hasBeenResized:!1}),p.orderedFields.push(t)):c&&p.orderedFields.push(t),o&&o.type!==e.type&&(o=(0,n.A)({},nr(e.type),{field:t}));let r=o.hasBeenResized;er.forEach(t=>{void 0!==e[t]&&(r=!0,-1===e[t]&&(e[t]=1/0))}),p.lookup[t]=(0,jt.A)(o,(0,n.A)({},nr(e.type),e,{hasBeenResized:r}))}),c&&!d&&Object.keys(p.lookup).forEach(e=>{f[e]||delete p.lookup[e]});const h=((e,t)=>{if(!t)return e;const{orderedFields:o=[],dimensions:r={}}=t,l=Object.keys(r);if(0===l.length&&0===o.length)return e;const i={},a=[];for(let n=0;n<o.length;n+=1){const t=o[n];e.lookup[t]&&(i[t]=!0,a.push(t))}const s=0===a.length?e.orderedFields:[...a,...e.orderedFields.filter(e=>!i[e])],c=(0,n.A)({},e.lookup);for(let u=0;u<l.length;u+=1){const e=l[u],t=(0,n.A)({},c[e],{hasBeenResized:!0});Object.entries(r[e]).forEach(e=>{let[o,n]=e;t[o]=-1===n?1/0:n}),c[e]=t}return(0,n.A)({},e,{orderedFields:s,lookup:c})})(l.current.unstable_applyPipeProcessors("hydrateColumns",p),a);return or(h,null!==(t=null===(o=(r=l.current).getRootDimensions)||void 0===o?void 0:o.call(r))&&void 0!==t?t:void 0)};function lr(e,t){var o,n;if(t.listView)return 0;const r=Ce(e),l=Jn(e),i=qn(e);return Math.floor(t.columnHeaderHeight*r)+Math.floor((null!==(o=t.columnGroupHeaderHeight)&&void 0!==o?o:t.columnHeaderHeight)*r)*l+(i?Math.floor((null!==(n=t.headerFilterHeight)&&void 0!==n?n:t.columnHeaderHeight)*r):0)}const ir=me(e=>e.rowsMeta),ar=(0,et.A)("div",{name:"MuiDataGrid",slot:"ScrollArea",overridesResolver:(e,t)=>[{["&.".concat(C["scrollArea--left"])]:t["scrollArea--left"]},{["&.".concat(C["scrollArea--right"])]:t["scrollArea--right"]},{["&.".concat(C["scrollArea--up"])]:t["scrollArea--up"]},{["&.".concat(C["scrollArea--down"])]:t["scrollArea--down"]},t.scrollArea]})(()=>({position:"absolute",zIndex:101,["&.".concat(C["scrollArea--left"])]:{top:0,left:0,width:20,bottom:0},["&.".concat(C["scrollArea--right"])]:{top:0,right:0,width:20,bottom:0},["&.".concat(C["scrollArea--up"])]:{top:0,left:0,right:0,height:20},["&.".concat(C["scrollArea--down"])]:{bottom:0,left:0,right:0,height:20}})),sr=ge(tt,(e,t)=>"left"===t?e.leftPinnedWidth:"right"===t?e.rightPinnedWidth+(e.hasScrollX?e.scrollbarSize:0):0);function cr(e){const{scrollDirection:t,scrollPosition:o}=e,l=r.useRef(null),i=Xe(),a=(0,Lt.A)(),s=D(i,Ce),c=D(i,ot),u=D(i,sr,t),d=W(),p=lr(i,d),f=Math.floor(d.columnHeaderHeight*s),g=(0,n.A)({height:f,top:p-f},"left"===t?{left:u}:{},"right"===t?{right:u}:{}),h=(0,It.A)(e=>{let n;if(e.preventDefault(),"left"===t)n=e.clientX-l.current.getBoundingClientRect().right;else{if("right"!==t)throw new Error("MUI X: Wrong drag direction");n=Math.max(1,e.clientX-l.current.getBoundingClientRect().left)}n=1.5*(n-1)+1,a.start(0,()=>{i.current.scroll({left:o.current.left+n,top:o.current.top})})});return(0,q.jsx)(dr,(0,n.A)({},e,{ref:l,getCanScrollMore:()=>{const e=tt(i);if("left"===t)return o.current.left>0;if("right"===t){const t=c-e.viewportInnerSize.width;return o.current.left<t}return!1},style:g,handleDragOver:h}))}function ur(e){const{scrollDirection:t,scrollPosition:o}=e,l=r.useRef(null),i=Xe(),a=(0,Lt.A)(),s=D(i,ir),c=W(),u=lr(i,c),d={top:"up"===t?u:void 0,bottom:"down"===t?0:void 0},p=(0,It.A)(e=>{let n;if(e.preventDefault(),"up"===t)n=e.clientY-l.current.getBoundingClientRect().bottom;else{if("down"!==t)throw new Error("MUI X: Wrong drag direction");n=Math.max(1,e.clientY-l.current.getBoundingClientRect().top)}n=1.5*(n-1)+1,a.start(0,()=>{i.current.scroll({left:o.current.left,top:o.current.top+n})})});return(0,q.jsx)(dr,(0,n.A)({},e,{ref:l,getCanScrollMore:()=>{const e=tt(i);if("up"===t)return o.current.top>0;if("down"===t){const t=(s.currentPageTotalHeight||0)-e.viewportInnerSize.height-(e.hasScrollX?e.scrollbarSize:0);return o.current.top<t}return!1},style:d,handleDragOver:p}))}const dr=a(function(e,t){const{scrollDirection:o,getCanScrollMore:l,style:i,handleDragOver:a}=e,s=Xe(),[c,u]=r.useState(l),d=W(),f=(0,n.A)({},d,{scrollDirection:o}),g=(e=>{const{scrollDirection:t,classes:o}=e,n={root:["scrollArea","scrollArea--".concat(t)]};return(0,p.A)(n,w,o)})(f);return Ht(s,"scrollPositionChange",()=>{u(l)}),c?(0,q.jsx)(ar,{ref:t,className:g.root,ownerState:f,onDragOver:a,style:i}):null});const pr=h(function(e){const t=Xe(),[o,l]=r.useState("none");return Ht(t,"columnHeaderDragStart",()=>l("horizontal")),Ht(t,"columnHeaderDragEnd",()=>l("none")),Ht(t,"rowDragStart",()=>l("vertical")),Ht(t,"rowDragEnd",()=>l("none")),"none"===o?null:"horizontal"===o?(0,q.jsx)(cr,(0,n.A)({},e)):(0,q.jsx)(ur,(0,n.A)({},e))});function fr(e){for(const t in e)return!1;return!0}const gr=me(e=>e.sorting),hr=ge(gr,e=>e.sortedRows),mr=he(hr,mt,vt,(e,t,o)=>e.reduce((e,n)=>{const r=t[n];if(r)e.push({id:n,model:r});else{const t=o[n];t&&_o(t)&&e.push({id:n,model:{[Vo]:n}})}return e},[])),vr=ge(gr,e=>e.sortModel),br=he(vr,e=>e.reduce((t,o,n)=>(t[o.field]={sortDirection:o.sort,sortIndex:e.length>1?n+1:void 0},t),{})),wr=(he(hr,e=>e.reduce((e,t,o)=>(e[t]=o,e),Object.create(null))),me(e=>e.filter)),Cr=ge(wr,e=>e.filterModel),yr=ge(Cr,e=>e.quickFilterValues),Ar=me(e=>e.visibleRowsLookup),xr=ge(wr,e=>e.filteredRowsLookup),Sr=(ge(wr,e=>e.filteredChildrenCountLookup),ge(wr,e=>e.filteredDescendantCountLookup),he(Ar,mr,(e,t)=>fr(e)?t:t.filter(t=>!1!==e[t.id]))),Rr=he(Sr,e=>e.map(e=>e.id)),Mr=he(xr,mr,(e,t)=>fr(e)?t:t.filter(t=>!1!==e[t.id])),Ir=he(Mr,e=>e.map(e=>e.id)),Pr=(he(Rr,vt,(e,t)=>{const o={};let n=0;return e.reduce((e,r)=>{const l=t[r];return o[l.depth]||(o[l.depth]=0),l.depth>n&&(o[l.depth]=0),n=l.depth,o[l.depth]+=1,e[r]=o[l.depth],e},{})}),he(Sr,vt,At,(e,t,o)=>o<2?e:e.filter(e=>{var o;return 0===(null===(o=t[e.id])||void 0===o?void 0:o.depth)}))),kr=ge(Sr,e=>e.length),Er=ge(Pr,e=>e.length),Fr=ge(Mr,e=>e.length),Tr=(ge(Fr,Er,(e,t)=>e-t),he(Cr,Fe,(e,t)=>{var o;return null===(o=e.items)||void 0===o?void 0:o.filter(e=>{var o,n;if(!e.field)return!1;const r=t[e.field];if(null===r||void 0===r||!r.filterOperators||0===(null===r||void 0===r||null===(o=r.filterOperators)||void 0===o?void 0:o.length))return!1;const l=r.filterOperators.find(t=>t.value===e.operator);return!!l&&(!l.InputComponent||null!=e.value&&""!==(null===(n=e.value)||void 0===n?void 0:n.toString()))})})),Hr=he(Tr,e=>e.reduce((e,t)=>(e[t.field]?e[t.field].push(t):e[t.field]=[t],e),{})),Dr=(he(Rr,e=>e.reduce((e,t,o)=>(e[t]=o,e),Object.create(null))),(0,et.A)("div",{name:"MuiDataGrid",slot:"OverlayWrapper",shouldForwardProp:e=>"overlayType"!==e&&"loadingOverlayVariant"!==e&&"right"!==e})(e=>{let{overlayType:t,loadingOverlayVariant:o,right:n}=e;return"skeleton"!==o?{position:"sticky",top:"var(--DataGrid-headersTotalHeight)",left:0,right:"".concat(n,"px"),width:0,height:0,zIndex:"loadingOverlay"===t?5:4}:{}})),Or=(0,et.A)("div",{name:"MuiDataGrid",slot:"OverlayWrapperInner",shouldForwardProp:e=>"overlayType"!==e&&"loadingOverlayVariant"!==e})({});function zr(e){const t=Xe(),o=W(),r=D(t,tt);let l=Math.max(r.viewportOuterSize.height-r.topContainerHeight-r.bottomContainerHeight-(r.hasScrollX?r.scrollbarSize:0),0);0===l&&(l=Qo);const i=(e=>{const{classes:t}=e;return(0,p.A)({root:["overlayWrapper"],inner:["overlayWrapperInner"]},w,t)})((0,n.A)({},e,{classes:o.classes}));return(0,q.jsx)(Dr,(0,n.A)({className:i.root},e,{right:r.columnsTotalWidth-r.viewportOuterSize.width,children:(0,q.jsx)(Or,(0,n.A)({className:i.inner,style:{height:l,width:r.viewportOuterSize.width}},e))}))}const Lr=me(e=>e.pivoting),jr=ge(Lr,e=>null===e||void 0===e?void 0:e.active),Nr=new Map,Br=ge(Lr,e=>(null===e||void 0===e?void 0:e.initialColumns)||Nr),Vr=me(e=>e.focus),Gr=ge(Vr,e=>e.cell),Wr=ge(Vr,e=>e.columnHeader),Ur=(ge(Vr,e=>e.columnHeaderFilter),ge(Vr,e=>e.columnGroupHeader)),Kr=me(e=>e.tabIndex),qr=ge(Kr,e=>e.cell),_r=ge(Kr,e=>e.columnHeader),Xr=(ge(Kr,e=>e.columnHeaderFilter),ge(Kr,e=>e.columnGroupHeader)),Yr=me(e=>e.columnMenu);const Qr=h(function(){var e;const t=z(),o=W(),r=D(t,Oe),l=D(t,Hr),i=D(t,br),a=D(t,_r),s=D(t,()=>null===qr(t)),c=D(t,Xr),u=D(t,Wr),d=D(t,Ur),p=D(t,Jn),f=D(t,Yr),g=D(t,He),h=D(t,Zn),m=!(null===c&&null===a&&s),v=t.current.columnHeadersContainerRef;return(0,q.jsx)(o.slots.columnHeaders,(0,n.A)({ref:v,visibleColumns:r,filterColumnLookup:l,sortColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:c,columnHeaderFocus:u,columnGroupHeaderFocus:d,headerGroupingMaxDepth:p,columnMenuState:f,columnVisibility:g,columnGroupsHeaderStructure:h,hasOtherElementInTabSequence:m},null===(e=o.slotProps)||void 0===e?void 0:e.columnHeaders))}),$r=(0,et.A)("div")({position:"absolute",top:"var(--DataGrid-headersTotalHeight)",left:0,width:"calc(100% - (var(--DataGrid-hasScrollY) * var(--DataGrid-scrollbarSize)))"}),Zr=(0,et.A)("div",{name:"MuiDataGrid",slot:"Main",overridesResolver:(e,t)=>{const{ownerState:o,loadingOverlayVariant:n,overlayType:r}=e,l="skeleton"===n||"noColumnsOverlay"===r;return[t.main,o.hasPinnedRight&&t["main--hasPinnedRight"],l&&t["main--hiddenContent"]]}})({flexGrow:1,position:"relative",overflow:"hidden",display:"flex",flexDirection:"column"}),Jr=a((e,t)=>{var o;const{ownerState:r}=e,l=W(),i=K().hooks.useGridAriaAttributes();return(0,q.jsxs)(Zr,(0,n.A)({ownerState:r,className:e.className,tabIndex:-1},i,null===(o=l.slotProps)||void 0===o?void 0:o.main,{ref:t,children:[(0,q.jsx)($r,{role:"presentation","data-id":"gridPanelAnchor"}),e.children]}))});const el=(0,et.A)("div")({position:"sticky",zIndex:40,top:0});function tl(e){const t=(0,p.A)({root:["topContainer"]},w,{});return(0,q.jsx)(el,(0,n.A)({},e,{className:(0,c.A)(t.root,C["container--top"]),role:"presentation"}))}const ol=(0,et.A)("div",{name:"MuiDataGrid",slot:"VirtualScrollerContent",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.virtualScrollerContent,o.overflowedContent&&t["virtualScrollerContent--overflowed"]]}})({}),nl=a(function(e,t){var o;const r=W(),l=!r.autoHeight&&"auto"===(null===(o=e.style)||void 0===o?void 0:o.minHeight),i=((e,t)=>{const{classes:o}=e,n={root:["virtualScrollerContent",t&&"virtualScrollerContent--overflowed"]};return(0,p.A)(n,w,o)})(r,l),a={classes:r.classes,overflowedContent:l};return(0,q.jsx)(ol,(0,n.A)({},e,{ownerState:a,className:(0,c.A)(i.root,e.className),ref:t}))});const rl=(0,et.A)("div")({display:"flex",flexDirection:"row",width:"var(--DataGrid-rowWidth)",boxSizing:"border-box"}),ll=(0,et.A)("div")({position:"sticky",height:"100%",boxSizing:"border-box",borderTop:"1px solid var(--rowBorderColor)",backgroundColor:S.cell.background.pinned}),il=(0,et.A)(ll)({left:0,borderRight:"1px solid var(--rowBorderColor)"}),al=(0,et.A)(ll)({right:0,borderLeft:"1px solid var(--rowBorderColor)"}),sl=(0,et.A)("div")({flexGrow:1,borderTop:"1px solid var(--rowBorderColor)"});const cl=h(function(e){let{rowsLength:t}=e;const o=Xe(),{viewportOuterSize:n,minimumSize:r,hasScrollX:l,hasScrollY:i,scrollbarSize:a,leftPinnedWidth:s,rightPinnedWidth:c}=D(o,tt),u=l?a:0,d=n.height-r.height>0;return 0!==u||d?(0,q.jsxs)(rl,{className:C.filler,role:"presentation",style:{height:u,"--rowBorderColor":0===t?"transparent":"var(--DataGrid-rowBorderColor)"},children:[s>0&&(0,q.jsx)(il,{className:C["filler--pinnedLeft"],style:{width:s}}),(0,q.jsx)(sl,{}),c>0&&(0,q.jsx)(al,{className:C["filler--pinnedRight"],style:{width:c+(i?a:0)}})]}):null}),ul=["className"],dl=(0,et.A)("div",{name:"MuiDataGrid",slot:"VirtualScrollerRenderZone"})({position:"absolute",display:"flex",flexDirection:"column"}),pl=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,ul),l=z(),i=W(),a=(e=>{const{classes:t}=e;return(0,p.A)({root:["virtualScrollerRenderZone"]},w,t)})(i),u=l.current.virtualizer.api.useVirtualization().getters.getOffsetTop();return(0,q.jsx)(dl,(0,n.A)({className:(0,c.A)(a.root,o),ownerState:i,style:{transform:"translate3d(0, ".concat(u,"px, 0)")}},r,{ref:t}))});var fl=o(6865);const gl=(0,et.A)("div")({position:"absolute",display:"inline-block",zIndex:60,"&:hover":{zIndex:70},"--size":"calc(max(var(--DataGrid-scrollbarSize), 14px))"}),hl=(0,et.A)(gl)({width:"var(--size)",height:"calc(var(--DataGrid-hasScrollY) * (100% - var(--DataGrid-topContainerHeight) - var(--DataGrid-bottomContainerHeight) - var(--DataGrid-hasScrollX) * var(--DataGrid-scrollbarSize)))",overflowY:"auto",overflowX:"hidden",outline:0,"& > div":{width:"var(--size)"},top:"var(--DataGrid-topContainerHeight)",right:"0px"}),ml=(0,et.A)(gl)({width:"100%",height:"var(--size)",overflowY:"hidden",overflowX:"auto",outline:0,"& > div":{height:"var(--size)"},bottom:"0px"}),vl=a(function(e,t){const o=z(),n=W(),l=r.useRef(!1),i=r.useRef(0),a=r.useRef(null),s=r.useRef(null),c=((e,t)=>{const{classes:o}=e,n={root:["scrollbar","scrollbar--".concat(t)],content:["scrollbarContent"]};return(0,p.A)(n,w,o)})(n,e.position),d=D(o,tt),f="vertical"===e.position?"height":"width",g="vertical"===e.position?"scrollTop":"scrollLeft",h="vertical"===e.position?"top":"left",m="vertical"===e.position?d.hasScrollX:d.hasScrollY,v=d.minimumSize[f]+(m?d.scrollbarSize:0),b=("vertical"===e.position?d.viewportInnerSize.height:d.viewportOuterSize.width)*(v/d.viewportOuterSize[f]),C=(0,It.A)(()=>{const t=a.current,o=e.scrollPosition.current;if(!t)return;if(o[h]===i.current)return;if(i.current=o[h],l.current)return void(l.current=!1);l.current=!0;const n=o[h]/v;t[g]=n*b}),y=(0,It.A)(()=>{const e=o.current.virtualScrollerRef.current,t=a.current;if(!t)return;if(l.current)return void(l.current=!1);l.current=!0;const n=t[g]/b;e[g]=n*v});(0,fl.A)(()=>{const e=o.current.virtualScrollerRef.current,t=a.current,n={passive:!0};return e.addEventListener("scroll",C,n),t.addEventListener("scroll",y,n),()=>{e.removeEventListener("scroll",C,n),t.removeEventListener("scroll",y,n)}}),r.useEffect(()=>{s.current.style.setProperty(f,"".concat(b,"px"))},[b,f]);const A="vertical"===e.position?hl:ml;return(0,q.jsx)(A,{ref:(0,u.A)(t,a),className:c.root,style:"vertical"===e.position&&n.listView?{height:"100%",top:0}:void 0,tabIndex:-1,"aria-hidden":"true",onFocus:e=>{e.target.blur()},children:(0,q.jsx)("div",{ref:s,className:c.content})})});const bl=(0,et.A)("div",{name:"MuiDataGrid",slot:"VirtualScroller",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.virtualScroller,o.hasScrollX&&t["virtualScroller--hasScrollX"]]}})({position:"relative",height:"100%",flexGrow:1,overflow:"scroll",scrollbarWidth:"none",display:"flex",flexDirection:"column","&::-webkit-scrollbar":{display:"none"},"@media print":{overflow:"hidden"},zIndex:0}),wl=e=>e.current.state.dimensions.rightPinnedWidth>0;function Cl(e){const t=z(),o=W(),r=D(t,lt),l=D(t,rt),i=D(t,wl),a=D(t,dt),{getOverlay:s,overlaysProps:c}=(()=>{const e=Xe(),t=W(),o=D(e,ft),r=D(e,kr),l=D(e,Mt),i=D(e,Oe),a=0===o&&0===l,s=D(e,gt),c=D(e,jr),u=!s&&a,d=!s&&o>0&&0===r,p=!s&&0===i.length;let f=null,g=null;var h,m;u&&(f="noRowsOverlay"),p&&(f="noColumnsOverlay"),u&&c&&(f="emptyPivotOverlay"),d&&(f="noResultsOverlay"),s&&(f="loadingOverlay",g=null!==(h=null===(m=t.slotProps)||void 0===m||null===(m=m.loadingOverlay)||void 0===m?void 0:m[a?"noRowsVariant":"variant"])&&void 0!==h?h:a?"skeleton":"linear-progress");const v={overlayType:f,loadingOverlayVariant:g};return{getOverlay:()=>{var e,o;if(!f)return null;const r=null===(e=t.slots)||void 0===e?void 0:e[f],l=null===(o=t.slotProps)||void 0===o?void 0:o[f];return(0,q.jsx)(zr,(0,n.A)({},v,{children:(0,q.jsx)(r,(0,n.A)({},l))}))},overlaysProps:v}})(),u=(0,n.A)({classes:o.classes,hasScrollX:l,hasPinnedRight:i},c),d=(e=>{const{classes:t,hasScrollX:o,hasPinnedRight:n,loadingOverlayVariant:r,overlayType:l}=e,i={root:["main",n&&"main--hasPinnedRight",("skeleton"===r||"noColumnsOverlay"===l)&&"main--hiddenContent"],scroller:["virtualScroller",o&&"virtualScroller--hasScrollX"]};return(0,p.A)(i,w,t)})(u),f=t.current.virtualizer.api.useVirtualization().getters,{getContainerProps:g,getScrollerProps:h,getContentProps:m,getScrollbarVerticalProps:v,getScrollbarHorizontalProps:b,getRows:C,getScrollAreaProps:y}=f,A=C(void 0,vt(t));return(0,q.jsxs)(Jr,(0,n.A)({className:d.root},g(),{ownerState:u,children:[(0,q.jsx)(pr,(0,n.A)({scrollDirection:"left"},y())),(0,q.jsx)(pr,(0,n.A)({scrollDirection:"right"},y())),(0,q.jsx)(pr,(0,n.A)({scrollDirection:"up"},y())),(0,q.jsx)(pr,(0,n.A)({scrollDirection:"down"},y())),(0,q.jsxs)(bl,(0,n.A)({className:d.scroller},h(),{ownerState:u,children:[(0,q.jsxs)(tl,{children:[!o.listView&&(0,q.jsx)(Qr,{}),(0,q.jsx)(o.slots.pinnedRows,{position:"top",virtualScroller:f})]}),s(),(0,q.jsx)(nl,(0,n.A)({},m(),{children:(0,q.jsxs)(pl,{role:"rowgroup",children:[A,(0,q.jsx)(o.slots.detailPanels,{virtualScroller:f})]})})),a&&(0,q.jsx)(cl,{rowsLength:A.length}),(0,q.jsx)(o.slots.bottomContainer,{children:(0,q.jsx)(o.slots.pinnedRows,{position:"bottom",virtualScroller:f})})]})),l&&!o.listView&&(0,q.jsx)(vl,(0,n.A)({position:"horizontal"},b())),r&&(0,q.jsx)(vl,(0,n.A)({position:"vertical"},v())),e.children]}))}function yl(){var e;const t=W();return t.hideFooter?null:(0,q.jsx)(t.slots.footer,(0,n.A)({},null===(e=t.slotProps)||void 0===e?void 0:e.footer))}const Al=["className","children","sidePanel"],xl=a(function(e,t){const o=W(),{className:l,children:i,sidePanel:a}=e,f=(0,s.A)(e,Al),g=z(),h=D(g,we),m=g.current.rootElementRef,v=r.useCallback(e=>{null!==e&&g.current.publishEvent("rootMount",e)},[g]),b=(0,u.A)(m,t,v),y=o,A=((e,t)=>{const{autoHeight:o,classes:n,showCellVerticalBorder:r}=e,l={root:["root",o&&"autoHeight","root--density".concat((0,d.A)(t)),null===e.slots.toolbar&&"root--noToolbar","withBorderColor",r&&"withVerticalBorder"]};return(0,p.A)(l,w,n)})(y,h),x=r.useContext(_);return(0,M.useSyncExternalStore)(ye,Ae,xe)?null:(0,q.jsxs)(N,(0,n.A)({className:(0,c.A)(A.root,l,x.className,a&&C.withSidePanel),ownerState:y},f,{ref:b,children:[(0,q.jsxs)("div",{className:C.mainContent,role:"presentation",children:[(0,q.jsx)(Je,{}),(0,q.jsx)(Cl,{children:i}),(0,q.jsx)(yl,{})]}),a,x.tag]}))});const Sl=h(xl);let Rl=function(e){return e.DataGrid="DataGrid",e.DataGridPro="DataGridPro",e.DataGridPremium="DataGridPremium",e}({});class Ml{constructor(e){this.data=e.ids}has(e){return this.data.has(e)}select(e){this.data.add(e)}unselect(e){this.data.delete(e)}}class Il{constructor(e){this.data=e.ids}has(e){return!this.data.has(e)}select(e){this.data.delete(e)}unselect(e){this.data.add(e)}}const Pl=e=>"include"===e.type?new Ml(e):new Il(e),kl=me(e=>e.rowSelection),El=he(kl,Pl),Fl=ge(kl,Fr,(e,t)=>"include"===e.type?e.ids.size:t-e.ids.size),Tl=he(kl,mt,xt,(e,t,o)=>{const n=new Map;if("include"===e.type)for(const r of e.ids)n.set(r,t[r]);else for(let r=0;r<o.length;r+=1){const l=o[r];e.ids.has(l)||n.set(l,t[l])}return n});function Hl(e,t){const o=vt(e),n=hr(e),r=xr(e),l=o[t];if(!l||"group"!==l.type)return[];const i=[];for(let s=n.findIndex(e=>e===t)+1;s<n.length&&(null===(a=o[n[s]])||void 0===a?void 0:a.depth)>l.depth;s+=1){var a;const t=n[s];!1!==r[t]&&e.current.isRowSelectable(t)&&i.push(t)}return i}const Dl=ge(vt,xr,El,(e,t,o,n)=>{let{groupId:r,autoSelectParents:l}=n;const i=e[r];if(!i||"group"!==i.type||o.has(r))return{isIndeterminate:!1,isChecked:o.has(r)};let a=!1,s=!1;const c=n=>{if(!1===t[n]||a&&s)return;const r=e[n];"group"===(null===r||void 0===r?void 0:r.type)&&r.children.forEach(c),o.has(n)?a=!0:s=!0};return c(r),{isIndeterminate:a&&s,isChecked:!!l&&(a&&!s)}});function Ol(e){return e.signature===Rl.DataGrid?e.checkboxSelection&&!0!==e.disableMultipleRowSelection:!e.disableMultipleRowSelection}const zl=function(e,t,o,n,r,l){let i=arguments.length>6&&void 0!==arguments[6]?arguments[6]:El(e);const a=xr(e),s=new Set([]);if((n||r)&&!1!==a[o]){if(n){const n=t[o];if("group"===(null===n||void 0===n?void 0:n.type)){Hl(e,o).forEach(e=>{l(e),s.add(e)})}}if(r){const n=e=>{if(!i.has(e)&&!s.has(e))return!1;const o=t[e];return!!o&&("group"!==o.type||o.children.every(n))},r=o=>{const i=((e,t,o)=>{const n=e[o];if(!n)return[];const r=n.parent;return null==r?[]:e[r].children.filter(e=>e!==o&&!1!==t[e])})(t,a,o);if(0===i.length||i.every(n)){const n=t[o],i=null===n||void 0===n?void 0:n.parent;null!=i&&i!==Bo&&e.current.isRowSelectable(i)&&(l(i),s.add(i),r(i))}},c=t[o];if(!c||c.parent===Bo)return;r(o)}}},Ll=(e,t,o,n,r,l)=>{const i=El(e);if(r||n){if(r){const e=((e,t)=>{const o=[];let n=t;for(;null!=n&&n!==Bo;){const t=e[n];if(!t)return o;o.push(n),n=t.parent}return o})(t,o);e.forEach(e=>{i.has(e)&&l(e)})}if(n){const n=t[o];if("group"===(null===n||void 0===n?void 0:n.type)){Hl(e,o).forEach(e=>{l(e)})}}}};function jl(e){let{privateApiRef:t,configuration:o,props:n,children:l}=e;const i=r.useRef(t.current.getPublicApi());return(0,q.jsx)(U.Provider,{value:o,children:(0,q.jsx)(G.Provider,{value:n,children:(0,q.jsx)(O.Provider,{value:t,children:(0,q.jsx)(_e.Provider,{value:i,children:(0,q.jsx)($e,{children:(0,q.jsx)(Y,{children:l})})})})})})}function Nl(e,t,o){const n=r.useRef(!0);(0,Nt.A)(()=>{n.current=!1,e.current.register(o,t)},[e,o,t]),n.current&&e.current.register(o,t)}const Bl=function(){try{const e="__some_random_key_you_are_not_going_to_use__";return window.localStorage.setItem(e,e),window.localStorage.removeItem(e),!0}catch(e){return!1}}()&&null!=window.localStorage.getItem("DEBUG"),Vl=()=>{},Gl={debug:Vl,info:Vl,warn:Vl,error:Vl},Wl=["debug","info","warn","error"];function Ul(e,t){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:console;const n=Wl.indexOf(t);if(-1===n)throw new Error("MUI X: Log level ".concat(t," not recognized."));const r=Wl.reduce((t,r,l)=>(t[r]=l>=n?function(){for(var t=arguments.length,n=new Array(t),l=0;l<t;l++)n[l]=arguments[l];const[i,...a]=n;o[r]("MUI X: ".concat(e," - ").concat(i),...a)}:Vl,t),{});return r}var Kl=o(9526);let ql=function(e){return e.DataSource="dataSource",e.RowTree="rowTree",e}({});const _l="none",Xl={dataSourceRowsUpdate:ql.DataSource,rowTreeCreation:ql.RowTree,filtering:ql.RowTree,sorting:ql.RowTree,visibleRowsLookupCreation:ql.RowTree},Yl=(e,t)=>(0,n.A)({},e,{props:{listView:t.listView,getRowId:t.getRowId}}),Ql=(e,t)=>{(e=>{const t=r.useRef(null),o=r.useRef(null),n=r.useRef(null),l=r.useRef(null),i=r.useRef(null),a=r.useRef(null);e.current.register("public",{rootElementRef:t}),e.current.register("private",{mainElementRef:o,virtualScrollerRef:n,virtualScrollbarVerticalRef:l,virtualScrollbarHorizontalRef:i,columnHeadersContainerRef:a})})(e),((e,t)=>{r.useEffect(()=>{e.current.setState(e=>(0,n.A)({},e,{props:{listView:t.listView,getRowId:t.getRowId}}))},[e,t.listView,t.getRowId])})(e,t),(e=>{const t=(0,Hn.I)();void 0===e.current.state.isRtl&&(e.current.state.isRtl=t);const o=r.useRef(!0);r.useEffect(()=>{o.current?o.current=!1:e.current.setState(e=>(0,n.A)({},e,{isRtl:t}))},[e,t])})(e),((e,t)=>{Nl(e,{getLogger:r.useCallback(e=>Bl?Ul(e,"debug",t.logger):t.logLevel?Ul(e,t.logLevel.toString(),t.logger):Gl,[t.logLevel,t.logger])},"private")})(e,t),(e=>{const t=r.useRef({}),o=r.useCallback(e=>{t.current[e.stateId]=e},[]),l=r.useCallback((o,n)=>{let r;if(r="function"===typeof o?o(e.current.state):o,e.current.state===r)return!1;const l={current:{state:r}};let i=!1;const a=[];if(Object.keys(t.current).forEach(o=>{const n=t.current[o],r=n.stateSelector(e),s=n.stateSelector(l);s!==r&&(a.push({stateId:n.stateId,hasPropChanged:s!==n.propModel}),void 0!==n.propModel&&s!==n.propModel&&(i=!0))}),a.length>1)throw new Error("You're not allowed to update several sub-state in one transaction. You already updated ".concat(a[0].stateId,", therefore, you're not allowed to update ").concat(a.map(e=>e.stateId).join(", ")," in the same transaction."));if(i||(e.current.state=r,e.current.publishEvent("stateChange",r),e.current.store.update(r)),1===a.length){const{stateId:o,hasPropChanged:r}=a[0],s=t.current[o],c=s.stateSelector(l);s.propOnChange&&r&&s.propOnChange(c,{reason:n,api:e.current}),i||e.current.publishEvent(s.changeEvent,c,{reason:n})}return!i},[e]),i={updateControlState:r.useCallback((t,o,r)=>e.current.setState(e=>(0,n.A)({},e,{[t]:o(e[t])}),r),[e]),registerControlState:o};Nl(e,{setState:l},"public"),Nl(e,i,"private")})(e),(e=>{const t=r.useRef({}),o=r.useRef(!1),n=r.useCallback(e=>{!o.current&&e&&(o.current=!0,Object.values(e.appliers).forEach(e=>{e()}),o.current=!1)},[]),l=r.useCallback((e,o,n)=>{t.current[e]||(t.current[e]={processors:new Map,processorsAsArray:[],appliers:{},processorsUpdated:!1});const r=t.current[e];return r.processors.get(o)!==n&&(r.processors.set(o,n),r.processorsAsArray=Array.from(t.current[e].processors.values()).filter(e=>null!==e),r.processorsUpdated=!0),()=>{t.current[e].processors.set(o,null),t.current[e].processorsAsArray=Array.from(t.current[e].processors.values()).filter(e=>null!==e)}},[]),i=r.useCallback((e,o,n)=>(t.current[e]||(t.current[e]={processors:new Map,processorsAsArray:[],appliers:{},processorsUpdated:!1}),t.current[e].appliers[o]=n,()=>{const n=t.current[e].appliers,r=(0,s.A)(n,[o].map(Kl.A));t.current[e].appliers=r}),[]),a=r.useCallback(e=>{n(t.current[e])},[n]),c=r.useCallback(()=>{for(const e in t.current){if(!Object.prototype.hasOwnProperty.call(t.current,e))continue;const o=t.current[e];o.processorsUpdated&&(o.processorsUpdated=!1,n(o))}},[n]),u={unstable_applyPipeProcessors:r.useCallback(function(){for(var e=arguments.length,o=new Array(e),n=0;n<e;n++)o[n]=arguments[n];const[r,l,i]=o;if(!t.current[r])return l;const a=t.current[r].processorsAsArray;let s=l;for(let t=0;t<a.length;t+=1)s=a[t](s,i);return s},[])};Nl(e,{registerPipeProcessor:l,registerPipeApplier:i,requestPipeProcessorsApplication:a,runAppliersForPendingProcessors:c},"private"),Nl(e,u,"public")})(e),(e=>{const t=r.useRef(new Map),o=r.useRef({}),n=r.useCallback((t,n,r)=>{const l=()=>{const e=o.current[n],r=(0,s.A)(e,[t].map(Kl.A));o.current[n]=r};o.current[n]||(o.current[n]={});const i=o.current[n],a=i[t];return i[t]=r,a&&a!==r?(t===e.current.getActiveStrategy(Xl[n])&&e.current.publishEvent("activeStrategyProcessorChange",n),l):l},[e]),l=r.useCallback((t,n)=>{const r=e.current.getActiveStrategy(Xl[t]);if(null==r)throw new Error("Can't apply a strategy processor before defining an active strategy");const l=o.current[t];if(!l||!l[r])throw new Error('No processor found for processor "'.concat(t,'" on strategy "').concat(r,'"'));return(0,l[r])(n)},[e]),i=r.useCallback(e=>{var o;const n=Array.from(t.current.entries()).find(t=>{let[,o]=t;return o.group===e&&o.isAvailable()});return null!==(o=null===n||void 0===n?void 0:n[0])&&void 0!==o?o:_l},[]),a=r.useCallback((o,n,r)=>{t.current.set(n,{group:o,isAvailable:r}),e.current.publishEvent("strategyAvailabilityChange")},[e]);Nl(e,{registerStrategyProcessor:n,applyStrategyProcessor:l,getActiveStrategy:i,setStrategyAvailability:a},"private")})(e),((e,t)=>{const o=r.useCallback(e=>{if(null==t.localeText[e])throw new Error("Missing translation for key ".concat(e,"."));return t.localeText[e]},[t.localeText]);e.current.register("public",{getLocaleText:o})})(e,t),e.current.register("private",{rootProps:t})};function $l(e,t){return Math.round(e*10**t)/10**t}const Zl=()=>{};function Jl(e,t,o){const n=(0,I.A)(ei,{store:e,selector:t}).current;n.effect=o,(0,fl.A)(n.onMount)}function ei(e){const{store:t,selector:o}=e;let n=o(t.state);const r={effect:Zl,dispose:null,subscribe:()=>{var e;null!==(e=r.dispose)&&void 0!==e||(r.dispose=t.subscribe(e=>{const t=o(e);r.effect(n,t),n=t}))},onMount:()=>(r.subscribe(),()=>{var e;null===(e=r.dispose)||void 0===e||e.call(r),r.dispose=null})};return r.subscribe(),r}class ti{static create(e){return new ti(e)}constructor(e){(0,Q.A)(this,"subscribe",e=>(this.listeners.add(e),()=>{this.listeners.delete(e)})),(0,Q.A)(this,"getSnapshot",()=>this.state),this.state=e,this.listeners=new Set,this.updateTick=0}setState(e){this.state=e,this.updateTick+=1;const t=this.updateTick,o=this.listeners.values();let n;for(;n=o.next(),!n.done;){if(t!==this.updateTick)return;(0,n.value)(e)}}update(e){for(const t in e)if(!Object.is(this.state[t],e[t]))return void this.setState((0,n.A)({},this.state,e))}set(e,t){Object.is(this.state[e],t)||this.setState((0,n.A)({},this.state,{[e]:t}))}}const oi={initialize:function(e){return{colspanMap:new Map}},use:function(e,t,o){var n;const r=null===(n=t.colspan)||void 0===n?void 0:n.getColspan,l=(0,It.A)(r?(t,o,n,l)=>{for(let i=o;i<n;i+=1){const a=ni(e.state.colspanMap,i,t,o,n,l,r);a.colSpan>1&&(i+=a.colSpan-1)}}:()=>{});return o.calculateColSpan=l,{resetColSpan:()=>{e.state.colspanMap=new Map},getCellColSpanInfo:(t,o)=>{var n;return null===(n=e.state.colspanMap.get(t))||void 0===n?void 0:n[o]},calculateColSpan:l}},selectors:{}};function ni(e,t,o,n,r,l,i){const a=l.length,s=l[t],c=i(o,s,t);if(!c||1===c)return ri(e,o,t,{spannedByColSpan:!1,cellProps:{colSpan:1,width:s.computedWidth}}),{colSpan:1};let u=s.computedWidth;for(let d=1;d<c;d+=1){const i=t+d;if(i>=n&&i<r){u+=l[i].computedWidth,ri(e,o,t+d,{spannedByColSpan:!0,rightVisibleCellIndex:Math.min(t+c,a-1),leftVisibleCellIndex:t})}ri(e,o,t,{spannedByColSpan:!1,cellProps:{colSpan:c,width:u}})}return{colSpan:c}}function ri(e,t,o,n){let r=e.get(t);r||(r={},e.set(t,r)),r[o]=n}var li=o(7449);function ii(e,t){if(e===t)return!0;if(e&&t&&"object"===typeof e&&"object"===typeof t){if(e.constructor!==t.constructor)return!1;if(Array.isArray(e)){const o=e.length;if(o!==t.length)return!1;for(let n=0;n<o;n+=1)if(!ii(e[n],t[n]))return!1;return!0}if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;const o=Array.from(e.entries());for(let e=0;e<o.length;e+=1)if(!t.has(o[e][0]))return!1;for(let e=0;e<o.length;e+=1){const n=o[e];if(!ii(n[1],t.get(n[0])))return!1}return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;const o=Array.from(e.entries());for(let e=0;e<o.length;e+=1)if(!t.has(o[e][0]))return!1;return!0}if(ArrayBuffer.isView(e)&&ArrayBuffer.isView(t)){const o=e.length;if(o!==t.length)return!1;for(let n=0;n<o;n+=1)if(e[n]!==t[n])return!1;return!0}if(e.constructor===RegExp)return e.source===t.source&&e.flags===t.flags;if(e.valueOf!==Object.prototype.valueOf)return e.valueOf()===t.valueOf();if(e.toString!==Object.prototype.toString)return e.toString()===t.toString();const o=Object.keys(e),n=o.length;if(n!==Object.keys(t).length)return!1;for(let e=0;e<n;e+=1)if(!Object.prototype.hasOwnProperty.call(t,o[e]))return!1;for(let r=0;r<n;r+=1){const n=o[r];if(!ii(e[n],t[n]))return!1}return!0}return e!==e&&t!==t}var ai=o(8443);function si(e,t,o,n,r){return(0,ai.useSyncExternalStoreWithSelector)(e.subscribe,e.getSnapshot,e.getSnapshot,e=>t(e,o,n,r))}const ci={EMPTY:{width:0,height:0},equals:(e,t)=>e.width===t.width&&e.height===t.height},ui={EMPTY:{top:[],bottom:[]}},di={EMPTY:{left:[],right:[]}};let pi=function(e){return e[e.NONE=0]="NONE",e[e.UP=1]="UP",e[e.DOWN=2]="DOWN",e[e.LEFT=3]="LEFT",e[e.RIGHT=4]="RIGHT",e}({});(pi||(pi={})).forDelta=function(e,t){return 0===e&&0===t?pi.NONE:Math.abs(t)>=Math.abs(e)?t>0?pi.DOWN:pi.UP:e>0?pi.RIGHT:pi.LEFT};const fi={isReady:!1,root:ci.EMPTY,viewportOuterSize:ci.EMPTY,viewportInnerSize:ci.EMPTY,contentSize:ci.EMPTY,minimumSize:ci.EMPTY,hasScrollX:!1,hasScrollY:!1,scrollbarSize:0,rowWidth:0,rowHeight:0,columnsTotalWidth:0,leftPinnedWidth:0,rightPinnedWidth:0,topContainerHeight:0,bottomContainerHeight:0},gi={rootSize:e=>e.rootSize,dimensions:e=>e.dimensions,rowHeight:e=>e.dimensions.rowHeight,contentHeight:e=>e.dimensions.contentSize.height,rowsMeta:e=>e.rowsMeta,columnPositions:fe((e,t)=>{const o=[];let n=0;for(let r=0;r<t.length;r+=1)o.push(n),n+=t[r].computedWidth;return o}),needsHorizontalScrollbar:e=>e.dimensions.viewportOuterSize.width>0&&e.dimensions.columnsTotalWidth>e.dimensions.viewportOuterSize.width},hi={initialize:function(e){const t=(0,n.A)({},fi,e.dimensions),{rowCount:o}=e,{rowHeight:r}=t,l={currentPageTotalHeight:o*r,positions:Array.from({length:o},(e,t)=>t*r),pinnedTopRowsTotalHeight:0,pinnedBottomRowsTotalHeight:0},i=new Map;return{rootSize:ci.EMPTY,dimensions:t,rowsMeta:l,rowHeights:i}},use:function(e,t,o){const n=r.useRef(!0),{refs:l,dimensions:{rowHeight:i,columnsTotalWidth:a,leftPinnedWidth:s,rightPinnedWidth:c,topPinnedHeight:u,bottomPinnedHeight:d},onResize:p}=t,f=l.container.current,g=r.useCallback(()=>{if(n.current)return;const o=gi.rootSize(e.state),r=gi.rowsMeta(e.state),l=function(e,t){if(void 0!==t)return t;if(null===e)return 0;const o=mi.get(e);if(void 0!==o)return o;const n=(0,li.A)(e).createElement("div");n.style.width="99px",n.style.height="99px",n.style.position="absolute",n.style.overflow="scroll",n.className="scrollDiv",e.appendChild(n);const r=n.offsetWidth-n.clientWidth;return e.removeChild(n),mi.set(e,r),r}(f,t.dimensions.scrollbarSize),g=u+r.pinnedTopRowsTotalHeight,h=d+r.pinnedBottomRowsTotalHeight,m={width:a,height:$l(r.currentPageTotalHeight,1)};let v,b,w=!1,C=!1;if(t.autoHeight)C=!1,w=Math.round(a)>Math.round(o.width),v={width:o.width,height:g+h+m.height},b={width:Math.max(0,v.width-(C?l:0)),height:Math.max(0,v.height-(w?l:0))};else{v={width:o.width,height:o.height},b={width:Math.max(0,v.width),height:Math.max(0,v.height-g-h)};const e=m,t=b,n=e.width>t.width,r=e.height>t.height;(n||r)&&(C=r,w=e.width+(C?l:0)>t.width,w&&(C=e.height+l>t.height)),C&&(b.width-=l),w&&(b.height-=l)}const y=Math.max(v.width,a+(C?l:0)),A={isReady:!0,root:o,viewportOuterSize:v,viewportInnerSize:b,contentSize:m,minimumSize:{width:a,height:g+m.height+h},hasScrollX:w,hasScrollY:C,scrollbarSize:l,rowWidth:y,rowHeight:i,columnsTotalWidth:a,leftPinnedWidth:s,rightPinnedWidth:c,topContainerHeight:g,bottomContainerHeight:h};ii(e.state.dimensions,A)||(e.update({dimensions:A}),null===p||void 0===p||p(A.root))},[e,f,t.dimensions.scrollbarSize,t.autoHeight,p,i,a,s,c,u,d]),{resizeThrottleMs:h}=t,m=(0,It.A)(g),v=r.useMemo(()=>h>0?function(e){let t,o,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:166;const r=()=>{t=void 0,e(...o)};function l(){for(var e=arguments.length,l=new Array(e),i=0;i<e;i++)l[i]=arguments[i];o=l,void 0===t&&(t=setTimeout(r,n))}return l.clear=()=>{clearTimeout(t),t=void 0},l}(m,h):void 0,[h,m]);r.useEffect(()=>null===v||void 0===v?void 0:v.clear,[v]);const b=(0,It.A)(t=>{e.state.rootSize=t,n.current||!v?(n.current=!1,g()):v()});(0,Nt.A)(()=>function(e,t,o){if(!e)return;const n=e.getBoundingClientRect(),r={width:$l(n.width,1),height:$l(n.height,1)};t.state.rootSize!==ci.EMPTY&&ci.equals(r,t.state.rootSize)||o(r);if("undefined"===typeof ResizeObserver)return;const l=new ResizeObserver(e=>{let[n]=e;if(!n)return;const r={width:$l(n.contentRect.width,1),height:$l(n.contentRect.height,1)};ci.equals(r,t.state.rootSize)||o(r)});return l.observe(e),()=>{l.disconnect()}}(f,e,b),[f,e,b]),(0,Nt.A)(g,[g]);const w=function(e,t,o){const n=e.state.rowHeights,{rows:l,getRowHeight:i,getRowSpacing:a,getEstimatedRowHeight:s}=t,c=r.useRef(-1),u=r.useRef(!1),d=r.useRef(!1),p=t.pinnedRows,f=si(e,gi.rowHeight),g=(0,It.A)(t=>{let o=n.get(t);return void 0===o&&(o={content:e.state.dimensions.rowHeight,spacingTop:0,spacingBottom:0,detail:0,autoHeight:!1,needsFirstMeasurement:!0},n.set(t,o)),o}),{applyRowHeight:h}=t,m=r.useCallback(t=>{const o=gi.dimensions(e.state),n=o.rowHeight,r=g(t.id);if(i){const e=i(t);if("auto"===e){if(r.needsFirstMeasurement){const e=s?s(t):n;r.content=null!==e&&void 0!==e?e:n}u.current=!0,r.autoHeight=!0}else r.content=null!==e&&void 0!==e?e:o.rowHeight,r.needsFirstMeasurement=!1,r.autoHeight=!1}else r.content=n,r.needsFirstMeasurement=!1;if(a){var l,c;const e=a(t);r.spacingTop=null!==(l=e.top)&&void 0!==l?l:0,r.spacingBottom=null!==(c=e.bottom)&&void 0!==c?c:0}else r.spacingTop=0,r.spacingBottom=0;return null===h||void 0===h||h(r,t),r},[e,i,g,s,f,a,h]),v=r.useCallback(()=>{var t,n;u.current=!1;const r=null!==(t=null===p||void 0===p?void 0:p.top.reduce((e,t)=>{const o=m(t);return e+o.content+o.spacingTop+o.spacingBottom+o.detail},0))&&void 0!==t?t:0,i=null!==(n=null===p||void 0===p?void 0:p.bottom.reduce((e,t)=>{const o=m(t);return e+o.content+o.spacingTop+o.spacingBottom+o.detail},0))&&void 0!==n?n:0,a=[],s=l.reduce((e,t)=>{a.push(e);const o=m(t);return e+(o.content+o.spacingTop+o.spacingBottom+o.detail)},0);u.current||(c.current=1/0);const f=r!==e.state.rowsMeta.pinnedTopRowsTotalHeight||i!==e.state.rowsMeta.pinnedBottomRowsTotalHeight||s!==e.state.rowsMeta.currentPageTotalHeight,g={currentPageTotalHeight:s,positions:a,pinnedTopRowsTotalHeight:r,pinnedBottomRowsTotalHeight:i};e.set("rowsMeta",g),f&&o(),d.current=!0},[e,p,l,m,o]),b=(0,It.A)(v),w=t=>{var o,r;return null!==(o=null===(r=n.get(t))||void 0===r?void 0:r.content)&&void 0!==o?o:gi.rowHeight(e.state)},C=(e,t)=>{const o=g(e),n=o.content!==t;o.needsFirstMeasurement=!1,o.content=t,d.current&&(d.current=!n)},y=e=>{var t,o;return null!==(t=null===(o=n.get(e))||void 0===o?void 0:o.autoHeight)&&void 0!==t&&t},A=()=>c.current,x=e=>{u.current&&e>c.current&&(c.current=e)},S=()=>{n.clear(),v()},R=(0,I.A)(()=>"undefined"===typeof ResizeObserver?void 0:new ResizeObserver(e=>{for(let n=0;n<e.length;n+=1){var o;const r=e[n],l=r.borderBoxSize&&r.borderBoxSize.length>0?r.borderBoxSize[0].blockSize:r.contentRect.height,i=r.target.__mui_id;if((null===(o=t.focusedVirtualCell)||void 0===o||null===(o=o.call(t))||void 0===o?void 0:o.id)===i&&0===l)return;C(i,l)}d.current||requestAnimationFrame(()=>{b()})})).current,M=(e,t)=>(e.__mui_id=t,null===R||void 0===R||R.observe(e),()=>null===R||void 0===R?void 0:R.unobserve(e));return(0,Nt.A)(()=>{v()},[v]),{getRowHeight:w,setLastMeasuredRowIndex:x,storeRowHeightMeasurement:C,hydrateRowsMeta:v,observeRowHeight:M,rowHasAutoHeight:y,getRowHeightEntry:g,getLastMeasuredRowIndex:A,resetRowHeights:S}}(e,t,g);return{updateDimensions:g,debouncedUpdateDimensions:v,rowsMeta:w}},selectors:gi};const mi=new WeakMap;var vi=o(7950);const bi=("undefined"!==typeof navigator?navigator.userAgent.toLowerCase():"empty").includes("firefox"),wi="undefined"!==typeof window&&/jsdom|HappyDOM/.test(window.navigator.userAgent),Ci=()=>{};function yi(e){const t=r.useRef(!0);t.current&&(t.current=!1,e())}const Ai=(e,t,o)=>Math.max(t,Math.min(o,e)),xi={top:0,left:0},Si=Object.freeze(new Map),Ri={firstRowIndex:0,lastRowIndex:0,firstColumnIndex:0,lastColumnIndex:0},Mi={renderContext:pe(e=>e.virtualization.renderContext),enabledForRows:pe(e=>e.virtualization.enabledForRows),enabledForColumns:pe(e=>e.virtualization.enabledForColumns)},Ii={initialize:function(e){var t;return{virtualization:(0,n.A)({enabled:!wi,enabledForRows:!wi,enabledForColumns:!wi,renderContext:Ri},null===(t=e.initialState)||void 0===t?void 0:t.virtualization),getters:null}},use:function(e,t,o){var l;const{refs:i,dimensions:{rowHeight:a,columnsTotalWidth:s},virtualization:{isRtl:c=!1,rowBufferPx:u=150,columnBufferPx:d=150},colspan:p,initialState:f,rows:g,range:h,columns:m,pinnedRows:v=ui.EMPTY,pinnedColumns:b=di.EMPTY,minimalContentHeight:w,autoHeight:C,onWheel:y,onTouchMove:A,onRenderContextChange:x,onScrollChange:S,scrollReset:R,renderRow:M,renderInfiniteLoadingTrigger:P}=t,k=si(e,hi.selectors.needsHorizontalScrollbar),E=v.bottom.length>0,[F,T]=r.useState(Si),[,H]=r.useState(0),D=r.useRef(!1),O=si(e,Mi.renderContext),z=si(e,Mi.enabledForRows),L=si(e,Mi.enabledForColumns),j=si(e,hi.selectors.rowsMeta),N=si(e,hi.selectors.contentHeight),B=r.useRef(null!==(l=null===f||void 0===f?void 0:f.scroll)&&void 0!==l?l:xi),V=r.useRef(!1),G=r.useRef(xi),W=r.useRef(Ri),U=(0,Lt.A)(),K=r.useRef(void 0),q=(0,I.A)(()=>function(e,t,o,n,r){return{direction:pi.NONE,buffer:Oi(e,pi.NONE,t,o,n,r)}}(c,u,d,15*a,300)).current,_=r.useCallback(t=>{Hi(t,e.state.virtualization.renderContext)||e.set("virtualization",(0,n.A)({},e.state.virtualization,{renderContext:t}));const o=hi.selectors.dimensions(e.state).isReady,r=t.firstRowIndex!==W.current.firstRowIndex||t.lastRowIndex!==W.current.lastRowIndex;o&&r&&(W.current=t,null===x||void 0===x||x(t)),G.current=B.current},[e,x]),X=(0,It.A)(()=>{const n=i.scroller.current;if(!n)return;const r=hi.selectors.dimensions(e.state),l=Math.ceil(r.minimumSize.height-r.viewportOuterSize.height),s=Math.ceil(r.minimumSize.width-r.viewportInnerSize.width),p={top:Ai(n.scrollTop,0,l),left:c?Ai(n.scrollLeft,-s,0):Ai(n.scrollLeft,0,s)},f=p.left-B.current.left,g=p.top-B.current.top,h=0!==f||0!==g;B.current=p;const m=h?pi.forDelta(f,g):pi.NONE,v=Math.abs(B.current.top-G.current.top),b=Math.abs(B.current.left-G.current.left),w=v>=a||b>=50,C=q.direction!==m;if(!(w||C))return O;if(C)switch(m){case pi.NONE:case pi.LEFT:case pi.RIGHT:K.current=void 0;break;default:K.current=O}q.direction=m,q.buffer=Oi(c,m,u,d,15*a,300);const y=ki(Pi(e,t,o,z,L),B.current,q);return Hi(y,O)||(vi.flushSync(()=>{_(y)}),U.start(1e3,X)),y}),Y=(0,It.A)(()=>{if(!hi.selectors.dimensions(e.state).isReady&&(z||L))return;const n=ki(Pi(e,t,o,z,L),B.current,q);K.current=void 0,_(n)}),Q=(0,It.A)(()=>{if(V.current)return void(V.current=!1);const e=X();e&&(null===S||void 0===S||S(B.current,e))}),$=r.useMemo(()=>({overflowX:k?void 0:"hidden",overflowY:C?"hidden":void 0}),[k,C]),Z=r.useMemo(()=>{const e={width:k?s:"auto",flexBasis:N,flexShrink:0};return 0===e.flexBasis&&(e.flexBasis=w),e},[s,N,k,w]),J=r.useRef(null),ee=r.useCallback(e=>{var t;e&&(null===(t=J.current)||void 0===t||t.call(J,s,N))},[s,N]);(0,Nt.A)(()=>{D.current&&Y()},[L,z,Y]),(0,Nt.A)(()=>{i.scroller.current&&(i.scroller.current.scrollLeft=0)},[i.scroller,R]),((e,t)=>{const o=r.useRef(!1);(0,Nt.A)(()=>o.current||!e?Ci:(o.current=!0,t()),[o.current||e])})(O!==Ri,()=>{if(null===S||void 0===S||S(B.current,O),D.current=!0,null!==f&&void 0!==f&&f.scroll&&i.scroller.current){const e=i.scroller.current,{top:t,left:o}=f.scroll,n={top:!(t>0),left:!(o>0)};!n.left&&s&&(e.scrollLeft=o,n.left=!0,V.current=!0),!n.top&&N&&(e.scrollTop=t,V.current=!0),n.top&&n.left||(J.current=(r,l)=>{!n.left&&r&&(e.scrollLeft=o,n.left=!0,V.current=!0),!n.top&&l&&(e.scrollTop=t,n.top=!0,V.current=!0),n.left&&n.top&&(J.current=null)})}}),Jl(e,hi.selectors.dimensions,Y);const te=e=>t=>{t&&i[e].current!==t&&(i[e].current=t,H(e=>e+1))},oe={setPanels:T,getOffsetTop:()=>{var e;return null!==(e=j.positions[O.firstRowIndex])&&void 0!==e?e:0},getRows:function(){var n,r;let l=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},i=arguments.length>1?arguments[1]:void 0;if(!l.rows&&!h)return[];let a=O;l.renderContext&&(a=l.renderContext,a.firstColumnIndex=O.firstColumnIndex,a.lastColumnIndex=O.lastColumnIndex);const c=!E&&void 0===l.position||E&&"bottom"===l.position,u=void 0!==l.position;let d;switch(l.position){case"top":d=0;break;case"bottom":d=v.top.length+g.length;break;default:d=v.top.length}const f=null!==(n=l.rows)&&void 0!==n?n:g,w=a.firstRowIndex,C=Math.min(a.lastRowIndex,f.length),y=l.rows?zi(0,l.rows.length):zi(w,C);let A=-1;const x=null===(r=t.focusedVirtualCell)||void 0===r?void 0:r.call(t);!u&&x&&(x.rowIndex<w&&(y.unshift(x.rowIndex),A=x.rowIndex),x.rowIndex>C&&(y.push(x.rowIndex),A=x.rowIndex));const S=[],R=hi.selectors.columnPositions(e.state,m);return y.forEach(e=>{const{id:t,model:n}=f[e];if(i&&!i[t])return;const r=((null===h||void 0===h?void 0:h.firstRowIndex)||0)+d+e;if(null!==p&&void 0!==p&&p.enabled){const e=b.left.length,n=m.length-b.right.length;o.calculateColSpan(t,e,n,m),b.left.length>0&&o.calculateColSpan(t,0,b.left.length,m),b.right.length>0&&o.calculateColSpan(t,m.length-b.right.length,m.length,m)}const v=o.rowsMeta.rowHasAutoHeight(t)?"auto":o.rowsMeta.getRowHeight(t);let w=!1;void 0===l.position&&(w=0===e);let C=!1;const y=e===f.length-1;c&&(u?C=y:e===g.length-1&&(C=!0));let I=a;K.current&&e>=K.current.firstRowIndex&&e<K.current.lastRowIndex&&(I=K.current);const k=e===A,E=(null===x||void 0===x?void 0:x.rowIndex)===r,T=Di(R,I,b.left.length),H=y&&"top"===l.position,D=I.firstColumnIndex,O=I.lastColumnIndex;if(S.push(M({id:t,model:n,rowIndex:r,offsetLeft:T,columnsTotalWidth:s,baseRowHeight:v,firstColumnIndex:D,lastColumnIndex:O,focusedColumnIndex:E?x.columnIndex:void 0,isFirstVisible:w,isLastVisible:C,isVirtualFocusRow:k,showBottomBorder:H})),k)return;const z=F.get(t);z&&S.push(z),void 0===l.position&&y&&S.push(P(t))}),S},getContainerProps:()=>({ref:te("container")}),getScrollerProps:()=>({ref:te("scroller"),onScroll:Q,onWheel:y,onTouchMove:A,style:$,role:"presentation",tabIndex:bi?-1:void 0}),getContentProps:()=>({ref:ee,style:Z,role:"presentation"}),getScrollbarVerticalProps:()=>({ref:te("scrollbarVertical"),scrollPosition:B}),getScrollbarHorizontalProps:()=>({ref:te("scrollbarHorizontal"),scrollPosition:B}),getScrollAreaProps:()=>({scrollPosition:B})};yi(()=>{e.state=(0,n.A)({},e.state,{getters:oe})}),r.useEffect(()=>{e.update({getters:oe})},Object.values(oe));return{getters:oe,useVirtualization:()=>si(e,e=>e),setPanels:T,forceUpdateRenderContext:Y,getCellColSpanInfo:()=>{throw new Error("Unimplemented: colspan feature is required")},calculateColSpan:()=>{throw new Error("Unimplemented: colspan feature is required")},getHiddenCellsOrigin:()=>{throw new Error("Unimplemented: rowspan feature is required")}}},selectors:Mi};function Pi(e,t,o,n,r){var l,i;const a=hi.selectors.dimensions(e.state),s=t.rows,c=t.range,u=t.columns,d=o.getHiddenCellsOrigin(),p=null===(l=t.rows.at(-1))||void 0===l?void 0:l.id,f=u.at(-1);return{api:o,enabledForRows:n,enabledForColumns:r,autoHeight:t.autoHeight,rowBufferPx:t.virtualization.rowBufferPx,columnBufferPx:t.virtualization.columnBufferPx,leftPinnedWidth:a.leftPinnedWidth,columnsTotalWidth:a.columnsTotalWidth,viewportInnerWidth:a.viewportInnerSize.width,viewportInnerHeight:a.viewportInnerSize.height,lastRowHeight:void 0!==p?o.rowsMeta.getRowHeight(p):0,lastColumnWidth:null!==(i=null===f||void 0===f?void 0:f.computedWidth)&&void 0!==i?i:0,rowsMeta:hi.selectors.rowsMeta(e.state),columnPositions:hi.selectors.columnPositions(e.state,t.columns),rows:s,range:c,pinnedColumns:t.pinnedColumns,columns:u,hiddenCellsOriginMap:d,virtualizeColumnsWithAutoRowHeight:t.virtualizeColumnsWithAutoRowHeight}}function ki(e,t,o){const n={firstRowIndex:0,lastRowIndex:e.rows.length,firstColumnIndex:0,lastColumnIndex:e.columns.length},{top:r,left:l}=t,i=Math.abs(l)+e.leftPinnedWidth;if(e.enabledForRows){let t=Math.min(Ei(e,r,{atStart:!0,lastPosition:e.rowsMeta.positions[e.rowsMeta.positions.length-1]+e.lastRowHeight}),e.rowsMeta.positions.length-1);const o=e.hiddenCellsOriginMap[t];if(o){const e=Math.min(...Object.values(o));t=Math.min(t,e)}const l=e.autoHeight?t+e.rows.length:Ei(e,r+e.viewportInnerHeight);n.firstRowIndex=t,n.lastRowIndex=l}if(e.enabledForColumns){let t=0,r=e.columnPositions.length,l=!1;const[a,s]=Ti({firstIndex:n.firstRowIndex,lastIndex:n.lastRowIndex,minFirstIndex:0,maxLastIndex:e.rows.length,bufferBefore:o.buffer.rowBefore,bufferAfter:o.buffer.rowAfter,positions:e.rowsMeta.positions,lastSize:e.lastRowHeight});if(!e.virtualizeColumnsWithAutoRowHeight)for(let o=a;o<s&&!l;o+=1){const t=e.rows[o];l=e.api.rowsMeta.rowHasAutoHeight(t.id)}l&&!e.virtualizeColumnsWithAutoRowHeight||(t=Fi(i,e.columnPositions,{atStart:!0,lastPosition:e.columnsTotalWidth}),r=Fi(i+e.viewportInnerWidth,e.columnPositions)),n.firstColumnIndex=t,n.lastColumnIndex=r}const a=function(e,t,o){var n,r,l,i;const[a,s]=Ti({firstIndex:t.firstRowIndex,lastIndex:t.lastRowIndex,minFirstIndex:0,maxLastIndex:e.rows.length,bufferBefore:o.buffer.rowBefore,bufferAfter:o.buffer.rowAfter,positions:e.rowsMeta.positions,lastSize:e.lastRowHeight}),[c,u]=Ti({firstIndex:t.firstColumnIndex,lastIndex:t.lastColumnIndex,minFirstIndex:null!==(n=null===(r=e.pinnedColumns)||void 0===r?void 0:r.left.length)&&void 0!==n?n:0,maxLastIndex:e.columns.length-(null!==(l=null===(i=e.pinnedColumns)||void 0===i?void 0:i.right.length)&&void 0!==l?l:0),bufferBefore:o.buffer.columnBefore,bufferAfter:o.buffer.columnAfter,positions:e.columnPositions,lastSize:e.lastColumnWidth}),d=function(e){let{api:t,firstColumnToRender:o,firstRowToRender:n,lastRowToRender:r,visibleRows:l}=e,i=o,a=!1;for(;!a&&i>=0;){a=!0;for(let e=n;e<r;e+=1){if(l[e]){const o=l[e].id,n=t.getCellColSpanInfo(o,i);if(n&&n.spannedByColSpan&&n.leftVisibleCellIndex<i){i=n.leftVisibleCellIndex,a=!1;break}}}}return i}({api:e.api,firstColumnToRender:c,firstRowToRender:a,lastRowToRender:s,visibleRows:e.rows});return{firstRowIndex:a,lastRowIndex:s,firstColumnIndex:d,lastColumnIndex:u}}(e,n,o);return a}function Ei(e,t,o){var n,r;const l=e.api.rowsMeta.getLastMeasuredRowIndex();let i=l===1/0;null!==(n=e.range)&&void 0!==n&&n.lastRowIndex&&!i&&(i=l>=e.range.lastRowIndex);const a=Ai(l-((null===(r=e.range)||void 0===r?void 0:r.firstRowIndex)||0),0,e.rowsMeta.positions.length);return i||e.rowsMeta.positions[a]>=t?Fi(t,e.rowsMeta.positions,o):function(e,t,o){let n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:void 0,r=1;for(;o<t.length&&Math.abs(t[o])<e;)o+=r,r*=2;return Fi(e,t,n,Math.floor(o/2),Math.min(o,t.length))}(t,e.rowsMeta.positions,a,o)}function Fi(e,t){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,r=arguments.length>4&&void 0!==arguments[4]?arguments[4]:t.length;if(t.length<=0)return-1;if(n>=r)return n;const l=n+Math.floor((r-n)/2),i=t[l];let a;if(null!==o&&void 0!==o&&o.atStart){a=e-((l===t.length-1?o.lastPosition:t[l+1])-i)<i}else a=e<=i;return a?Fi(e,t,o,n,l):Fi(e,t,o,l+1,r)}function Ti(e){let{firstIndex:t,lastIndex:o,bufferBefore:n,bufferAfter:r,minFirstIndex:l,maxLastIndex:i,positions:a,lastSize:s}=e;const c=a[t]-n,u=a[o]+r,d=Fi(c,a,{atStart:!0,lastPosition:a[a.length-1]+s}),p=Fi(u,a);return[Ai(d,l,i),Ai(p,l,i)]}function Hi(e,t){return e===t||e.firstRowIndex===t.firstRowIndex&&e.lastRowIndex===t.lastRowIndex&&e.firstColumnIndex===t.firstColumnIndex&&e.lastColumnIndex===t.lastColumnIndex}function Di(e,t,o){var n,r;const l=(null!==(n=e[t.firstColumnIndex])&&void 0!==n?n:0)-(null!==(r=e[o])&&void 0!==r?r:0);return Math.abs(l)}function Oi(e,t,o,n,r,l){if(e)switch(t){case pi.LEFT:t=pi.RIGHT;break;case pi.RIGHT:t=pi.LEFT}switch(t){case pi.NONE:return{rowAfter:o,rowBefore:o,columnAfter:n,columnBefore:n};case pi.LEFT:return{rowAfter:0,rowBefore:0,columnAfter:0,columnBefore:l};case pi.RIGHT:return{rowAfter:0,rowBefore:0,columnAfter:l,columnBefore:0};case pi.UP:return{rowAfter:0,rowBefore:r,columnAfter:0,columnBefore:0};case pi.DOWN:return{rowAfter:r,rowBefore:0,columnAfter:0,columnBefore:0};default:throw new Error("unreachable")}}function zi(e,t){return Array.from({length:t-e}).map((t,o)=>e+o)}const Li={initialize:function(e){return{}},use:function(e,t,o){return{getViewportPageSize:()=>{const o=hi.selectors.dimensions(e.state);if(!o.isReady)return 0;if(t.getRowHeight){const o=Ii.selectors.renderContext(e.state),n=o.lastRowIndex-o.firstRowIndex;return Math.min(n-1,t.rows.length)}const n=Math.floor(o.viewportInnerSize.height/o.rowHeight);return Math.min(n,t.rows.length)}}},selectors:{}};const ji={firstRowIndex:0,lastRowIndex:0},Ni={spannedCells:{},hiddenCells:{},hiddenCellOriginMap:{}},Bi={state:e=>e.rowSpanning,hiddenCells:e=>e.rowSpanning.caches.hiddenCells,spannedCells:e=>e.rowSpanning.caches.spannedCells,hiddenCellsOriginMap:e=>e.rowSpanning.caches.hiddenCellOriginMap},Vi={initialize:function(e){var t,o;return{rowSpanning:null!==(t=null===(o=e.initialState)||void 0===o?void 0:o.rowSpanning)&&void 0!==t?t:{caches:Ni,processedRange:ji}}},use:function(e,t,o){return{getHiddenCellsOrigin:()=>Bi.hiddenCellsOriginMap(e.state)}},selectors:Bi};const Gi=[hi,Ii,oi,Vi,Li],Wi=(e,t,o)=>t>0&&e>0?Math.ceil(e/t):-1===e?o+2:0,Ui=e=>({page:0,pageSize:e?0:100}),Ki=(e,t)=>{if(t===Rl.DataGrid&&e>100)throw new Error(["MUI X: `pageSize` cannot exceed 100 in the MIT version of the DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock this feature."].join("\n"))},qi=me(e=>e.pagination),_i=ge(qi,e=>e.enabled&&"client"===e.paginationMode),Xi=ge(qi,e=>e.paginationModel),Yi=ge(qi,e=>e.rowCount),Qi=ge(qi,e=>e.meta),$i=ge(Xi,e=>e.page),Zi=ge(Xi,e=>e.pageSize),Ji=ge(Xi,Yi,(e,t)=>Wi(t,e.pageSize,e.page)),ea=he(_i,Xi,vt,At,Sr,Pr,(e,t,o,n,r,l)=>{if(!e)return null;const i=l.length,a=Math.min(t.pageSize*t.page,i-1),s=-1===t.pageSize?i-1:Math.min(a+t.pageSize-1,i-1);if(-1===a||-1===s)return null;if(n<2)return{firstRowIndex:a,lastRowIndex:s};const c=l[a],u=s-a+1,d=r.findIndex(e=>e.id===c.id);let p=d,f=0;for(;p<r.length&&f<=u;){var g;const e=null===(g=o[r[p].id])||void 0===g?void 0:g.depth;void 0===e?p+=1:((f<u||e>0)&&(p+=1),0===e&&(f+=1))}return{firstRowIndex:d,lastRowIndex:p-1}}),ta=he(Sr,ea,(e,t)=>t?e.slice(t.firstRowIndex,t.lastRowIndex+1):[]),oa=he(Rr,ea,(e,t)=>t?e.slice(t.firstRowIndex,t.lastRowIndex+1):[]),na=he(_i,ea,ta,Sr,(e,t,o,n)=>e?{rows:o,range:t,rowIdToIndexMap:o.reduce((e,t,o)=>(e.set(t.id,o),e),new Map)}:{rows:n,range:0===n.length?null:{firstRowIndex:0,lastRowIndex:n.length-1},rowIdToIndexMap:n.reduce((e,t,o)=>(e.set(t.id,o),e),new Map)}),ra=(e,t)=>na(e),la=(e,t)=>D(e,na),ia=me(e=>e.virtualization),aa=(ge(ia,e=>e.enabled),ge(ia,e=>e.enabledForColumns)),sa=(ge(ia,e=>e.enabledForRows),ge(ia,e=>e.renderContext)),ca=he(me(e=>e.virtualization.renderContext.firstColumnIndex),me(e=>e.virtualization.renderContext.lastColumnIndex),(e,t)=>({firstColumnIndex:e,lastColumnIndex:t})),ua=he(ge(Gr,sa,na,Oe,(e,t,o,n)=>{if(!e)return!1;const r=o.rowIdToIndexMap.get(e.id),l=n.slice(t.firstColumnIndex,t.lastColumnIndex).findIndex(t=>t.field===e.field);return!(void 0!==r&&-1!==l&&r>=t.firstRowIndex&&r<=t.lastRowIndex)}),Oe,na,Gr,(e,t,o,r)=>{if(!e)return null;const l=o.rowIdToIndexMap.get(r.id);if(void 0===l)return null;const i=t.findIndex(e=>e.field===r.field);return-1===i?null:(0,n.A)({},r,{rowIndex:l,columnIndex:i})}),da={autoHeight:!1,autoPageSize:!1,autosizeOnMount:!1,checkboxSelection:!1,checkboxSelectionVisibleOnly:!1,clipboardCopyCellDelimiter:"\t",columnBufferPx:150,columnFilterDebounceMs:150,columnHeaderHeight:56,disableAutosize:!1,disableColumnFilter:!1,disableColumnMenu:!1,disableColumnReorder:!1,disableColumnResize:!1,disableColumnSelector:!1,disableColumnSorting:!1,disableDensitySelector:!1,disableEval:!1,disableMultipleColumnsFiltering:!1,disableMultipleColumnsSorting:!1,disableMultipleRowSelection:!1,disableRowSelectionOnClick:!1,disableRowSelectionExcludeModel:!1,disableVirtualization:!1,editMode:bn.Cell,filterDebounceMs:150,filterMode:"client",hideFooter:!1,hideFooterPagination:!1,hideFooterRowCount:!1,hideFooterSelectedRowCount:!1,ignoreDiacritics:!1,ignoreValueFormatterDuringExport:!1,keepColumnPositionIfDraggedOutside:!1,keepNonExistentRowsSelected:!1,loading:!1,logger:console,logLevel:"error",pageSizeOptions:[25,50,100],pagination:!1,paginationMode:"client",resizeThrottleMs:60,rowBufferPx:150,rowHeight:52,rows:[],rowSelection:!0,rowSpacingType:"margin",rowSpanning:!1,showCellVerticalBorder:!1,showColumnVerticalBorder:!1,showToolbar:!1,sortingMode:"client",sortingOrder:["asc","desc",null],throttleRowsMs:0,virtualizeColumnsWithAutoRowHeight:!1};function pa(e){return e}const fa=ge(Oe,Be,(e,t)=>{const o=e.length;return 0===o?0:$l(t[o-1]+e[o-1].computedWidth,1)}),ga=()=>re((e,t,o,r,l)=>(0,n.A)({},e,{headerHeight:t,groupHeaderHeight:o,headerFilterHeight:r,headersTotalHeight:l}),{maxSize:1});function ha(e,t){var o,l,i;const a=(0,Hn.I)(),{listView:s}=t,c=D(e,Oe),u=D(e,Rt),d=je(e),p=D(e,El),f=la(e),g=D(e,We),h=D(e,ut),m=D(e,it),{autoHeight:v}=t,b=s,w=D(e,Ce),C=Zo(t.rowHeight,da.rowHeight),y=Math.floor(C*w),A=Math.floor(t.columnHeaderHeight*w),x=Math.floor((null!==(o=t.columnGroupHeaderHeight)&&void 0!==o?o:t.columnHeaderHeight)*w),S=Math.floor((null!==(l=t.headerFilterHeight)&&void 0!==l?l:t.columnHeaderHeight)*w),R=D(e,fa),M=lr(e,t),P=d.left.reduce((e,t)=>e+t.computedWidth,0),k=d.right.reduce((e,t)=>e+t.computedWidth,0),E={rowHeight:y,headerHeight:A,columnsTotalWidth:R,leftPinnedWidth:P,rightPinnedWidth:k,topPinnedHeight:M,bottomPinnedHeight:0,scrollbarSize:t.scrollbarSize},F=(0,I.A)(ga).current,T=D(e,ft),H=D(e,qi),O=Math.min(H.enabled?H.paginationModel.pageSize:T,T),{getRowHeight:z,getEstimatedRowHeight:L,getRowSpacing:j}=t,N=D(e,ua),B=(e=>{const t=(0,I.A)(()=>new ti(Gi.map(t=>t.initialize(e)).reduce((e,t)=>Object.assign(e,t),{}))).current,o={};for(const n of Gi)Object.assign(o,n.use(t,e,o));return{store:t,api:o}})({refs:{container:e.current.mainElementRef,scroller:e.current.virtualScrollerRef,scrollbarVertical:e.current.virtualScrollbarVerticalRef,scrollbarHorizontal:e.current.virtualScrollbarHorizontalRef},dimensions:E,virtualization:{isRtl:a,rowBufferPx:t.rowBufferPx,columnBufferPx:t.columnBufferPx},colspan:{enabled:g,getColspan:(t,o)=>{var n;if("function"===typeof o.colSpan){var r;const n=e.current.getRow(t),l=e.current.getRowValue(n,o);return null!==(r=o.colSpan(l,n,o,e))&&void 0!==r?r:0}return null!==(n=o.colSpan)&&void 0!==n?n:1}},initialState:{scroll:null===(i=t.initialState)||void 0===i?void 0:i.scroll,rowSpanning:e.current.state.rowSpanning,virtualization:e.current.state.virtualization},rows:f.rows,range:f.range,rowCount:O,columns:c,pinnedRows:u,pinnedColumns:d,autoHeight:v,minimalContentHeight:Qo,getRowHeight:r.useMemo(()=>{if(z)return e=>z((0,n.A)({},e,{densityFactor:w}))},[z,w]),getEstimatedRowHeight:r.useMemo(()=>L?e=>L((0,n.A)({},e,{densityFactor:w})):void 0,[L,w]),getRowSpacing:r.useMemo(()=>j?t=>{var o;const r=null!==(o=f.rowIdToIndexMap.get(t.id))&&void 0!==o?o:-1,l={isFirstVisible:0===r,isLastVisible:r===f.rows.length-1,indexRelativeToCurrentPage:r};return j((0,n.A)({},t,l,{indexRelativeToCurrentPage:e.current.getRowIndexRelativeToVisibleRows(t.id)}))}:void 0,[e,j,f.rows,f.rowIdToIndexMap]),applyRowHeight:(0,It.A)((t,o)=>e.current.unstable_applyPipeProcessors("rowHeight",t,o)),virtualizeColumnsWithAutoRowHeight:t.virtualizeColumnsWithAutoRowHeight,focusedVirtualCell:(0,It.A)(()=>N),resizeThrottleMs:t.resizeThrottleMs,onResize:(0,It.A)(t=>e.current.publishEvent("resize",t)),onWheel:(0,It.A)(t=>{e.current.publishEvent("virtualScrollerWheel",{},t)}),onTouchMove:(0,It.A)(t=>{e.current.publishEvent("virtualScrollerTouchMove",{},t)}),onRenderContextChange:(0,It.A)(t=>{e.current.publishEvent("renderedRowsIntervalChange",t)}),onScrollChange:(t,o)=>{e.current.publishEvent("scrollPositionChange",{top:t.top,left:t.left,renderContext:o})},scrollReset:b,renderRow:o=>{var r,l;return(0,q.jsx)(t.slots.row,(0,n.A)({row:o.model,rowId:o.id,index:o.rowIndex,selected:(l=o.id,p.has(l)&&e.current.isRowSelectable(l)),offsetLeft:o.offsetLeft,columnsTotalWidth:R,rowHeight:o.baseRowHeight,pinnedColumns:d,visibleColumns:c,firstColumnIndex:o.firstColumnIndex,lastColumnIndex:o.lastColumnIndex,focusedColumnIndex:o.focusedColumnIndex,isFirstVisible:o.isFirstVisible,isLastVisible:o.isLastVisible,isNotVisible:o.isVirtualFocusRow,showBottomBorder:o.showBottomBorder,scrollbarWidth:h,gridHasFiller:m},null===(r=t.slotProps)||void 0===r?void 0:r.row),o.id)},renderInfiniteLoadingTrigger:t=>{var o,n;return null===(o=(n=e.current).getInfiniteLoadingTriggerElement)||void 0===o?void 0:o.call(n,{lastRowId:t})}});yi(()=>{e.current.store.state.dimensions=F(B.store.state.dimensions,A,x,S,M),e.current.store.state.rowsMeta=B.store.state.rowsMeta,e.current.store.state.virtualization=B.store.state.virtualization}),Jl(B.store,hi.selectors.dimensions,(t,o)=>{e.current.setState(e=>(0,n.A)({},e,{dimensions:F(o,A,x,S,M)}))}),Jl(B.store,pa,(t,o)=>{o.rowsMeta!==e.current.state.rowsMeta&&e.current.setState(e=>(0,n.A)({},e,{rowsMeta:o.rowsMeta})),o.virtualization!==e.current.state.virtualization&&e.current.setState(e=>(0,n.A)({},e,{virtualization:o.virtualization}))}),e.current.register("private",{virtualizer:B})}const ma=(e,t,o,n)=>{const l=r.useRef(n),i=r.useRef(!1);n!==l.current&&(i.current=!1,l.current=n),i.current||(t.current.state=e(t.current.state,o,t),i.current=!0)};function va(e,t){const o=r.useRef(null);if(o.current)return o.current;const n=e.current.getLogger(t);return o.current=n,n}const ba=(e,t,o,n,r)=>{const l=va(e,"useNativeEventListener");Ot(e,"rootMount",()=>{const e=t();if(e&&o)return l.debug("Binding native ".concat(o," event")),e.addEventListener(o,n,r),()=>{l.debug("Clearing native ".concat(o," event")),e.removeEventListener(o,n,r)}})},wa=["field","id","formattedValue","row","rowNode","colDef","isEditable","cellMode","hasFocus","tabIndex","api"],Ca=a(function(e,t){var o,l,i;const{field:a,id:c,rowNode:u,tabIndex:d}=e,f=(0,s.A)(e,wa),g=Xe(),h=W(),m=(e=>{const{classes:t}=e;return(0,p.A)({root:["checkboxInput"]},w,t)})({classes:h.classes});r.useLayoutEffect(()=>{if(0===d){const e=g.current.getCellElement(c,a);e&&(e.tabIndex=-1)}},[g,d,c,a]);const v=r.useCallback(e=>{" "===e.key&&e.stopPropagation()},[]),b=g.current.isRowSelectable(c),{isIndeterminate:C,isChecked:y}=D(g,Dl,{groupId:c,autoSelectParents:null!==(o=null===(l=h.rowSelectionPropagation)||void 0===l?void 0:l.parents)&&void 0!==o&&o});if("footer"===u.type||"pinnedRow"===u.type)return null;const A=g.current.getLocaleText(y&&!C?"checkboxSelectionUnselectRow":"checkboxSelectionSelectRow");return(0,q.jsx)(h.slots.baseCheckbox,(0,n.A)({tabIndex:d,checked:y&&!C,onChange:e=>{const t={value:e.target.checked,id:c};g.current.publishEvent("rowSelectionCheckboxChange",t,e)},className:m.root,slotProps:{htmlInput:{"aria-label":A,name:"select_row"}},onKeyDown:v,indeterminate:C,disabled:!b},null===(i=h.slotProps)||void 0===i?void 0:i.baseCheckbox,f,{ref:t}))});const ya=Ca,Aa=["field","colDef"],xa=a(function(e,t){var o;const l=(0,s.A)(e,Aa),[,i]=r.useState(!1),a=Xe(),c=W(),u=(e=>{const{classes:t}=e;return(0,p.A)({root:["checkboxInput"]},w,t)})({classes:c.classes}),d=D(a,_r),f=D(a,kl),g=D(a,Rr),h=D(a,oa),m=r.useMemo(()=>{const e=c.isRowSelectable;if("function"!==typeof e)return f;if("exclude"===f.type)return f;const t={type:"include",ids:new Set};for(const o of f.ids)c.keepNonExistentRowsSelected&&t.ids.add(o),a.current.getRow(o)&&e(a.current.getRowParams(o))&&t.ids.add(o);return t},[a,c.isRowSelectable,c.keepNonExistentRowsSelected,f]),v=r.useMemo(()=>{const e=c.pagination&&c.checkboxSelectionVisibleOnly&&"server"!==c.paginationMode?h:g,t=new Set;for(let o=0;o<e.length;o+=1){const n=e[o];a.current.getRow(n)&&(a.current.isRowSelectable(n)&&t.add(n))}return t},[a,c.pagination,c.paginationMode,c.checkboxSelectionVisibleOnly,h,g]),b=r.useMemo(()=>{const e=Pl(m);let t=0;for(const o of v)e.has(o)&&(t+=1);return t},[m,v]),C=r.useMemo(()=>{if(0===b)return!1;const e=Pl(m);for(const t of v)if(!e.has(t))return!0;return!1},[b,m,v]),y=b>0,A=null!==d&&d.field===e.field?0:-1;r.useLayoutEffect(()=>{const t=a.current.getColumnHeaderElement(e.field);0===A&&t&&(t.tabIndex=-1)},[A,a,e.field]);const x=r.useCallback(e=>{" "===e.key&&a.current.publishEvent("headerSelectionCheckboxChange",{value:!y})},[a,y]),S=r.useCallback(()=>{i(e=>!e)},[]);r.useEffect(()=>a.current.subscribeEvent("rowSelectionChange",S),[a,S]);const R=a.current.getLocaleText(y&&!C?"checkboxSelectionUnselectAllRows":"checkboxSelectionSelectAllRows");return(0,q.jsx)(c.slots.baseCheckbox,(0,n.A)({indeterminate:C,checked:y&&!C,onChange:e=>{const t={value:e.target.checked};a.current.publishEvent("headerSelectionCheckboxChange",t)},className:u.root,slotProps:{htmlInput:{"aria-label":R,name:"select_all_rows"}},tabIndex:A,onKeyDown:x,disabled:!Ol(c)},null===(o=c.slotProps)||void 0===o?void 0:o.baseCheckbox,l,{ref:t}))});const Sa="__check__",Ra=(0,n.A)({},hn,{type:"custom",field:Sa,width:50,resizable:!1,sortable:!1,filterable:!1,aggregable:!1,disableColumnMenu:!0,disableReorder:!0,disableExport:!0,getApplyQuickFilterFn:()=>null,display:"flex",valueGetter:(e,t,o,n)=>{const r=Jo(n,t);return n.current.isRowSelected(r)},rowSpanValueGetter:(e,t,o,n)=>Jo(n,t),renderHeader:e=>(0,q.jsx)(xa,(0,n.A)({},e)),renderCell:e=>(0,q.jsx)(ya,(0,n.A)({},e))});function Ma(e,t){if(null===e||void 0===e)return"";const o="string"===typeof e?e:"".concat(e);if(t.shouldAppendQuotes||t.escapeFormulas){const e=o.replace(/"/g,'""');return t.escapeFormulas&&["=","+","-","@","\t","\r"].includes(e[0])?"\"'".concat(e,'"'):[t.delimiter,"\n","\r",'"'].some(e=>o.includes(e))?'"'.concat(e,'"'):e}return o}const Ia=(e,t)=>{const{csvOptions:o,ignoreValueFormatter:n}=t;let r;if(n){var l;const t=e.colDef.type;if("number"===t)r=String(e.value);else if("date"===t||"dateTime"===t){var i;r=null===(i=e.value)||void 0===i?void 0:i.toISOString()}else r="function"===typeof(null===(l=e.value)||void 0===l?void 0:l.toString)?e.value.toString():e.value}else r=e.formattedValue;return Ma(r,o)};class Pa{constructor(e){(0,Q.A)(this,"rowString",""),(0,Q.A)(this,"isEmpty",!0),this.options=e}addValue(e){this.isEmpty||(this.rowString+=this.options.csvOptions.delimiter),"function"===typeof this.options.sanitizeCellValue?this.rowString+=this.options.sanitizeCellValue(e,this.options.csvOptions):this.rowString+=e,this.isEmpty=!1}getRowString(){return this.rowString}}function ka(e){const{columns:t,rowIds:o,csvOptions:n,ignoreValueFormatter:r,apiRef:l}=e,i=o.reduce((e,o)=>"".concat(e).concat((e=>{let{id:t,columns:o,getCellParams:n,csvOptions:r,ignoreValueFormatter:l}=e;const i=new Pa({csvOptions:r});return o.forEach(e=>{const o=n(t,e.field);i.addValue(Ia(o,{ignoreValueFormatter:l,csvOptions:r}))}),i.getRowString()})({id:o,columns:t,getCellParams:l.current.getCellParams,ignoreValueFormatter:r,csvOptions:n}),"\r\n"),"").trim();if(!n.includeHeaders)return i;const a=t.filter(e=>e.field!==Ra.field),s=[];if(n.includeColumnGroupsHeaders){const e=l.current.getAllGroupDetails();let t=0;const o=a.reduce((e,o)=>{const n=l.current.getColumnGroupPath(o.field);return e[o.field]=n,t=Math.max(t,n.length),e},{});for(let r=0;r<t;r+=1){const t=new Pa({csvOptions:n,sanitizeCellValue:Ma});s.push(t),a.forEach(n=>{const l=(o[n.field]||[])[r],i=e[l];t.addValue(i?i.headerName||i.groupId:"")})}}const c=new Pa({csvOptions:n,sanitizeCellValue:Ma});a.forEach(e=>{c.addValue(e.headerName||e.field)}),s.push(c);const u="".concat(s.map(e=>e.getRowString()).join("\r\n"),"\r\n");return"".concat(u).concat(i).trim()}function Ea(e){const t=document.createElement("span");t.style.whiteSpace="pre",t.style.userSelect="all",t.style.opacity="0px",t.textContent=e,document.body.appendChild(t);const o=document.createRange();o.selectNode(t);const n=window.getSelection();n.removeAllRanges(),n.addRange(o);try{document.execCommand("copy")}finally{document.body.removeChild(t)}}const Fa=(e,t)=>{const o=t.ignoreValueFormatterDuringExport,n=("object"===typeof o?null===o||void 0===o?void 0:o.clipboardExport:o)||!1,l=t.clipboardCopyCellDelimiter,i=r.useCallback(t=>{if(!function(e){return(e.ctrlKey||e.metaKey)&&"C"===String.fromCharCode(e.keyCode)&&!e.shiftKey&&!e.altKey}(t))return;if(function(e){var t;return!(null===(t=window.getSelection())||void 0===t||!t.toString())||!!(e&&(e.selectionEnd||0)-(e.selectionStart||0)>0)}(t.target))return;let o="";if(Fl(e)>0)o=e.current.getDataAsCsv({includeHeaders:!1,delimiter:l,shouldAppendQuotes:!1,escapeFormulas:!1});else{const t=Gr(e);if(t){const r=e.current.getCellParams(t.id,t.field);o=Ia(r,{csvOptions:{delimiter:l,shouldAppendQuotes:!1,escapeFormulas:!1},ignoreValueFormatter:n})}}var r;o=e.current.unstable_applyPipeProcessors("clipboardCopy",o),o&&(r=o,navigator.clipboard?navigator.clipboard.writeText(r).catch(()=>{Ea(r)}):Ea(r),e.current.publishEvent("clipboardCopy",o))},[e,n,l]);ba(e,()=>e.current.rootElementRef.current,"keydown",i),Ot(e,"clipboardCopy",t.onClipboardCopy)},Ta=e=>(0,n.A)({},e,{columnMenu:{open:!1}}),Ha=function(e,t,o){let n=!(arguments.length>3&&void 0!==arguments[3])||arguments[3];const l=r.useRef(null),i=r.useRef("mui-".concat(Math.round(1e9*Math.random()))),a=r.useCallback(()=>{l.current=e.current.registerPipeProcessor(t,i.current,o)},[e,o,t]);yi(()=>{n&&a()});const s=r.useRef(!0);r.useEffect(()=>(s.current?s.current=!1:n&&a(),()=>{l.current&&(l.current(),l.current=null)}),[a,n])},Da=(e,t,o)=>{const n=r.useRef(null),l=r.useRef("mui-".concat(Math.round(1e9*Math.random()))),i=r.useCallback(()=>{n.current=e.current.registerPipeApplier(t,l.current,o)},[e,o,t]);yi(()=>{i()});const a=r.useRef(!0);r.useEffect(()=>(a.current?a.current=!1:i(),()=>{n.current&&(n.current(),n.current=null)}),[i])},Oa=(e,t,o)=>{var r,l,i,a,s;o.current.caches.columns={lastColumnsProp:t.columns};const c=rr({apiRef:o,columnsToUpsert:t.columns,initialState:null===(r=t.initialState)||void 0===r?void 0:r.columns,columnVisibilityModel:null!==(l=null!==(i=t.columnVisibilityModel)&&void 0!==i?i:null===(a=t.initialState)||void 0===a||null===(a=a.columns)||void 0===a?void 0:a.columnVisibilityModel)&&void 0!==l?l:{},keepOnlyColumnsToUpsert:!0});return(0,n.A)({},e,{columns:c,pinnedColumns:null!==(s=e.pinnedColumns)&&void 0!==s?s:Re})};function za(e,t){var o,l;const i=va(e,"useGridColumns");e.current.registerControlState({stateId:"visibleColumns",propModel:t.columnVisibilityModel,propOnChange:t.onColumnVisibilityModelChange,stateSelector:He,changeEvent:"columnVisibilityModelChange"});const a=r.useCallback(t=>{i.debug("Updating columns state."),e.current.setState(function(e){return t=>(0,n.A)({},t,{columns:e})}(t)),e.current.publishEvent("columnsChange",t.orderedFields)},[i,e]),s=r.useCallback(t=>Fe(e)[t],[e]),c=r.useCallback(()=>Te(e),[e]),u=r.useCallback(()=>Oe(e),[e]),d=r.useCallback(function(t){return(!(arguments.length>1&&void 0!==arguments[1])||arguments[1]?Oe(e):Te(e)).findIndex(e=>e.field===t)},[e]),p=r.useCallback(t=>{const o=d(t);return Be(e)[o]},[e,d]),f=r.useCallback(t=>{var o,r;He(e)!==t&&(e.current.setState(o=>(0,n.A)({},o,{columns:rr({apiRef:e,columnsToUpsert:[],initialState:void 0,columnVisibilityModel:t,keepOnlyColumnsToUpsert:!1})})),null===(o=(r=e.current).updateRenderContext)||void 0===o||o.call(r))},[e]),g=r.useCallback(t=>{if(jr(e))return void e.current.updateNonPivotColumns(t);const o=rr({apiRef:e,columnsToUpsert:t,initialState:void 0,keepOnlyColumnsToUpsert:!1,updateInitialVisibilityModel:!0});a(o)},[e,a]),h=r.useCallback((t,o)=>{var r;const l=He(e);if(o!==(null===(r=l[t])||void 0===r||r)){const r=(0,n.A)({},l,{[t]:o});e.current.setColumnVisibilityModel(r)}},[e]),m=r.useCallback(t=>Ee(e).findIndex(e=>e===t),[e]),v=r.useCallback((t,o)=>{const r=Ee(e),l=m(t);if(l===o)return;i.debug("Moving column ".concat(t," to index ").concat(o));const s=[...r],c=s.splice(l,1)[0];s.splice(o,0,c),a((0,n.A)({},ke(e),{orderedFields:s}));const u={column:e.current.getColumn(t),targetIndex:e.current.getColumnIndexRelativeToVisibleColumns(t),oldIndex:l};e.current.publishEvent("columnIndexChange",u)},[e,i,a,m]),b=r.useCallback((t,o)=>{i.debug("Updating column ".concat(t," width to ").concat(o));const r=ke(e),l=r.lookup[t],s=(0,n.A)({},l,{width:o,hasBeenResized:!0});a(or((0,n.A)({},r,{lookup:(0,n.A)({},r.lookup,{[t]:s})}),e.current.getRootDimensions())),e.current.publishEvent("columnWidthChange",{element:e.current.getColumnHeaderElement(t),colDef:s,width:o})},[e,i,a]),w={setColumnIndex:v};Nl(e,{getColumn:s,getAllColumns:c,getColumnIndex:d,getColumnPosition:p,getVisibleColumns:u,getColumnIndexRelativeToVisibleColumns:m,updateColumns:g,setColumnVisibilityModel:f,setColumnVisibility:h,setColumnWidth:b},"public"),Nl(e,w,t.signature===Rl.DataGrid?"private":"public");const C=r.useCallback((o,r)=>{var l,i;const a={},s=He(e);(!r.exportOnlyDirtyModels||null!=t.columnVisibilityModel||Object.keys(null!==(l=null===(i=t.initialState)||void 0===i||null===(i=i.columns)||void 0===i?void 0:i.columnVisibilityModel)&&void 0!==l?l:{}).length>0||Object.keys(s).length>0)&&(a.columnVisibilityModel=s),a.orderedFields=Ee(e);const c=Te(e),u={};return c.forEach(e=>{if(e.hasBeenResized){const t={};er.forEach(o=>{let n=e[o];n===1/0&&(n=-1),t[o]=n}),u[e.field]=t}}),Object.keys(u).length>0&&(a.dimensions=u),(0,n.A)({},o,{columns:a})},[e,t.columnVisibilityModel,null===(o=t.initialState)||void 0===o?void 0:o.columns]),y=r.useCallback((t,o)=>{const r=o.stateToRestore.columns,l=null===r||void 0===r?void 0:r.columnVisibilityModel;if(null==r)return t;const i=rr({apiRef:e,columnsToUpsert:[],initialState:r,columnVisibilityModel:l,keepOnlyColumnsToUpsert:!1});return null!=r&&e.current.setState(e=>(0,n.A)({},e,{columns:(0,n.A)({},e.columns,{lookup:i.lookup,orderedFields:i.orderedFields,initialColumnVisibilityModel:i.initialColumnVisibilityModel})})),null!=l&&e.current.setState(e=>(0,n.A)({},e,{columns:(0,n.A)({},e.columns,{columnVisibilityModel:l})})),null!=r&&e.current.publishEvent("columnsChange",i.orderedFields),t},[e]),A=r.useCallback((e,o)=>{if(o===qe.columns){var r;const e=t.slots.columnsPanel;return(0,q.jsx)(e,(0,n.A)({},null===(r=t.slotProps)||void 0===r?void 0:r.columnsPanel))}return e},[t.slots.columnsPanel,null===(l=t.slotProps)||void 0===l?void 0:l.columnsPanel]),x=r.useCallback(o=>{const n=jr(e);return t.disableColumnSelector||n?o:[...o,"columnMenuColumnsItem"]},[t.disableColumnSelector,e]);Ha(e,"columnMenu",x),Ha(e,"exportState",C),Ha(e,"restoreState",y),Ha(e,"preferencePanel",A);const S=r.useRef(null);Ht(e,"viewportInnerSizeChange",t=>{if(S.current!==t.width){S.current=t.width;if(!Oe(e).some(e=>e.flex&&e.flex>0))return;a(or(ke(e),e.current.getRootDimensions()))}});const R=r.useCallback(()=>{i.info("Columns pipe processing have changed, regenerating the columns");const t=rr({apiRef:e,columnsToUpsert:[],initialState:void 0,keepOnlyColumnsToUpsert:!1});a(t)},[e,i,a]);Da(e,"hydrateColumns",R),r.useEffect(()=>{if(e.current.caches.columns.lastColumnsProp===t.columns)return;e.current.caches.columns.lastColumnsProp=t.columns,i.info("GridColumns have changed, new length ".concat(t.columns.length));const o=rr({apiRef:e,initialState:void 0,columnsToUpsert:t.columns,keepOnlyColumnsToUpsert:!0,updateInitialVisibilityModel:!0,columnVisibilityModel:t.columnVisibilityModel});a(o)},[i,e,a,t.columns,t.columnVisibilityModel]),r.useEffect(()=>{void 0!==t.columnVisibilityModel&&e.current.setColumnVisibilityModel(t.columnVisibilityModel)},[e,i,t.columnVisibilityModel])}const La=(e,t)=>{var o,r,l;return(0,n.A)({},e,{density:null!==(o=null!==(r=null===(l=t.initialState)||void 0===l?void 0:l.density)&&void 0!==r?r:t.density)&&void 0!==o?o:"standard"})};const ja=e=>{let{apiRef:t,options:o}=e;const n=Te(t);if(o.fields)return o.fields.reduce((e,t)=>{const o=n.find(e=>e.field===t);return o&&e.push(o),e},[]);return(o.allColumns?n:Oe(t)).filter(e=>!0!==e.disableExport)},Na=e=>{var t,o;let{apiRef:n}=e;const r=Ir(n),l=vt(n),i=Fl(n),a=r.filter(e=>"footer"!==l[e].type),s=Rt(n),c=(null===s||void 0===s||null===(t=s.top)||void 0===t?void 0:t.map(e=>e.id))||[],u=(null===s||void 0===s||null===(o=s.bottom)||void 0===o?void 0:o.map(e=>e.id))||[];if(a.unshift(...c),a.push(...u),i>0){const e=Tl(n);return a.filter(t=>e.has(t))}return a},Ba=a(function(e,t){var o,l;const{children:i,slotProps:a={}}=e,s=a.button||{},c=a.tooltip||{},d=Xe(),p=W(),f=(0,Zt.A)(),g=(0,Zt.A)(),[h,m]=r.useState(!1),v=r.useRef(null),b=(0,u.A)(t,v),w=()=>m(!1);return null==i?null:(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(p.slots.baseTooltip,(0,n.A)({title:d.current.getLocaleText("toolbarExportLabel"),enterDelay:1e3},null===(o=p.slotProps)||void 0===o?void 0:o.baseTooltip,c,{children:(0,q.jsx)(p.slots.baseButton,(0,n.A)({size:"small",startIcon:(0,q.jsx)(p.slots.exportIcon,{}),"aria-expanded":h,"aria-label":d.current.getLocaleText("toolbarExportLabel"),"aria-haspopup":"menu","aria-controls":h?g:void 0,id:f},null===(l=p.slotProps)||void 0===l?void 0:l.baseButton,s,{onClick:e=>{var t;m(e=>!e),null===(t=s.onClick)||void 0===t||t.call(s,e)},ref:b,children:d.current.getLocaleText("toolbarExport")}))})),(0,q.jsx)(Bn,{open:h,target:v.current,onClose:w,position:"bottom-end",children:(0,q.jsx)(p.slots.baseMenuList,{id:g,className:C.menuList,"aria-labelledby":f,autoFocusItem:h,children:r.Children.map(i,e=>r.isValidElement(e)?r.cloneElement(e,{hideMenu:w}):e)})})]})});const Va=["hideMenu","options"],Ga=["hideMenu","options"],Wa=["csvOptions","printOptions","excelOptions"];function Ua(e){const t=Xe(),o=W(),{hideMenu:r,options:l}=e,i=(0,s.A)(e,Va);return(0,q.jsx)(o.slots.baseMenuItem,(0,n.A)({onClick:()=>{t.current.exportDataAsCsv(l),null===r||void 0===r||r()}},i,{children:t.current.getLocaleText("toolbarExportCSV")}))}function Ka(e){const t=Xe(),o=W(),{hideMenu:r,options:l}=e,i=(0,s.A)(e,Ga);return(0,q.jsx)(o.slots.baseMenuItem,(0,n.A)({onClick:()=>{t.current.exportDataAsPrint(l),null===r||void 0===r||r()}},i,{children:t.current.getLocaleText("toolbarExportPrint")}))}a(function(e,t){const o=e,{csvOptions:l={},printOptions:i={},excelOptions:a}=o,c=(0,s.A)(o,Wa),u=Xe().current.unstable_applyPipeProcessors("exportMenu",[],{excelOptions:a,csvOptions:l,printOptions:i}).sort((e,t)=>e.componentName>t.componentName?1:-1);return 0===u.length?null:(0,q.jsx)(Ba,(0,n.A)({},c,{ref:t,children:u.map((e,t)=>r.cloneElement(e.component,{key:t}))}))});const qa=(e,t)=>{const o=va(e,"useGridCsvExport"),n=t.ignoreValueFormatterDuringExport,l=("object"===typeof n?null===n||void 0===n?void 0:n.csvExport:n)||!1,i=r.useCallback(function(){var t,n,r,i,a;let s=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};o.debug("Get data as CSV");return ka({columns:ja({apiRef:e,options:s}),rowIds:(null!==(t=s.getRowsToExport)&&void 0!==t?t:Na)({apiRef:e}),csvOptions:{delimiter:s.delimiter||",",shouldAppendQuotes:null===(n=s.shouldAppendQuotes)||void 0===n||n,includeHeaders:null===(r=s.includeHeaders)||void 0===r||r,includeColumnGroupsHeaders:null===(i=s.includeColumnGroupsHeaders)||void 0===i||i,escapeFormulas:null===(a=s.escapeFormulas)||void 0===a||a},ignoreValueFormatter:l,apiRef:e})},[o,e,l]),a=r.useCallback(e=>{o.debug("Export data as CSV");const t=i(e);!function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"csv",o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:document.title||"untitled";const n="".concat(o,".").concat(t);if("download"in HTMLAnchorElement.prototype){const t=URL.createObjectURL(e),o=document.createElement("a");return o.href=t,o.download=n,o.click(),void setTimeout(()=>{URL.revokeObjectURL(t)})}throw new Error("MUI X: exportAs not supported.")}(new Blob([null!==e&&void 0!==e&&e.utf8WithBom?new Uint8Array([239,187,191]):"",t],{type:"text/csv"}),"csv",null===e||void 0===e?void 0:e.fileName)},[o,i]);Nl(e,{getDataAsCsv:i,exportDataAsCsv:a},"public");const s=r.useCallback((e,t)=>{var o;return null!==(o=t.csvOptions)&&void 0!==o&&o.disableToolbarButton?e:[...e,{component:(0,q.jsx)(Ua,{options:t.csvOptions}),componentName:"csvExport"}]},[]);Ha(e,"exportMenu",s)};const _a=(e,t,o)=>{var r,l;let i=e.paginationModel;const a=e.rowCount,s=null!==(r=null===o||void 0===o?void 0:o.pageSize)&&void 0!==r?r:i.pageSize,c=null!==(l=null===o||void 0===o?void 0:o.page)&&void 0!==l?l:i.page,u=Wi(a,s,c);!o||(null===o||void 0===o?void 0:o.page)===i.page&&(null===o||void 0===o?void 0:o.pageSize)===i.pageSize||(i=o);const d=-1===s?0:function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return 0===t?e:Math.max(Math.min(e,t-1),0)}(i.page,u);return d!==i.page&&(i=(0,n.A)({},i,{page:d})),Ki(i.pageSize,t),i};const Xa=(e,t)=>{const o=null!==e.current.rootElementRef.current,l=va(e,"useGridPrintExport"),i=r.useRef(null),a=r.useRef(null),s=r.useRef({}),c=r.useRef([]),u=r.useRef(null);r.useEffect(()=>{i.current=(0,li.A)(e.current.rootElementRef.current)},[e,o]);const d=r.useCallback((t,o,n)=>new Promise(r=>{const l=ja({apiRef:e,options:{fields:t,allColumns:o}}).map(e=>e.field),i=Te(e),a={};i.forEach(e=>{a[e.field]=l.includes(e.field)}),n&&(a[Ra.field]=!0),e.current.setColumnVisibilityModel(a),r()}),[e]),p=r.useCallback(t=>{const o=t({apiRef:e}).reduce((t,o)=>{const n=e.current.getRow(o);return n[Vo]||t.push(n),t},[]);e.current.setRows(o)},[e]),f=r.useCallback((o,r)=>{var l,a;const s=(0,n.A)({copyStyles:!0,hideToolbar:!1,hideFooter:!1,includeCheckboxes:!1},r),c=o.contentDocument;if(!c)return;const u=ir(e),d=e.current.rootElementRef.current,p=d.cloneNode(!0);p.querySelector(".".concat(C.main)).style.overflow="visible",p.style.contain="size";let f=(null===(l=d.querySelector(".".concat(C.toolbar)))||void 0===l?void 0:l.offsetHeight)||0,g=(null===(a=d.querySelector(".".concat(C.footerContainer)))||void 0===a?void 0:a.offsetHeight)||0;const h=p.querySelector(".".concat(C.footerContainer));var m;s.hideToolbar&&(null===(m=p.querySelector(".".concat(C.toolbar)))||void 0===m||m.remove(),f=0);s.hideFooter&&h&&(h.remove(),g=0);const v=u.currentPageTotalHeight+lr(e,t)+f+g;p.style.height="".concat(v,"px"),p.style.boxSizing="content-box",!s.hideFooter&&h&&(h.style.position="absolute",h.style.width="100%",h.style.top="".concat(v-g,"px"));const b=document.createElement("div");b.appendChild(p),c.body.style.marginTop="0px",c.body.innerHTML=b.innerHTML;const w="function"===typeof s.pageStyle?s.pageStyle():s.pageStyle;if("string"===typeof w){const e=c.createElement("style");e.appendChild(c.createTextNode(w)),c.head.appendChild(e)}s.bodyClassName&&c.body.classList.add(...s.bodyClassName.split(" "));let y=[];if(s.copyStyles){const e=d.getRootNode();y=function(e,t){const o=[],n=t.querySelectorAll("style, link[rel='stylesheet']");for(let r=0;r<n.length;r+=1){const t=n[r];if("STYLE"===t.tagName){const o=e.createElement(t.tagName),n=t.sheet;if(n){let t="";for(let e=0;e<n.cssRules.length;e+=1)"string"===typeof n.cssRules[e].cssText&&(t+="".concat(n.cssRules[e].cssText,"\r\n"));o.appendChild(e.createTextNode(t)),e.head.appendChild(o)}}else if(t.getAttribute("href")){const n=e.createElement(t.tagName);for(let e=0;e<t.attributes.length;e+=1){const o=t.attributes[e];o&&n.setAttribute(o.nodeName,o.nodeValue||"")}o.push(new Promise(e=>{n.addEventListener("load",()=>e())})),e.head.appendChild(n)}}return o}(c,"ShadowRoot"===e.constructor.name?e:i.current)}Promise.all(y).then(()=>{o.contentWindow.print()})},[e,i,t]),g=r.useCallback(t=>{var o;i.current.body.removeChild(t),e.current.restoreState(a.current||{}),null!==(o=a.current)&&void 0!==o&&null!==(o=o.columns)&&void 0!==o&&o.columnVisibilityModel||e.current.setColumnVisibilityModel(s.current),e.current.setState(e=>(0,n.A)({},e,{virtualization:u.current})),e.current.setRows(c.current),a.current=null,s.current={},c.current=[]},[e]),h=r.useCallback(async o=>{var r;if(l.debug("Export data as Print"),!e.current.rootElementRef.current)throw new Error("MUI X: No grid root element available.");if(a.current=e.current.exportState(),s.current=He(e),c.current=e.current.getSortedRows().filter(e=>!e[Vo]),t.pagination){const t={page:0,pageSize:kr(e)};e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationModel:_a(e.pagination,"DataGridPro",t)})}))}u.current=e.current.state.virtualization,e.current.unstable_setVirtualization(!1),await d(null===o||void 0===o?void 0:o.fields,null===o||void 0===o?void 0:o.allColumns,null===o||void 0===o?void 0:o.includeCheckboxes),p(null!==(r=null===o||void 0===o?void 0:o.getRowsToExport)&&void 0!==r?r:Na),await new Promise(e=>{requestAnimationFrame(()=>{e()})});const h=function(e){const t=document.createElement("iframe");return t.style.position="absolute",t.style.width="0px",t.style.height="0px",t.title=e||document.title,t}(null===o||void 0===o?void 0:o.fileName);h.onload=()=>{f(h,o);h.contentWindow.matchMedia("print").addEventListener("change",e=>{!1===e.matches&&g(h)})},i.current.body.appendChild(h)},[t,l,e,f,g,d,p]);Nl(e,{exportDataAsPrint:h},"public");const m=r.useCallback((e,t)=>{var o;return null!==(o=t.printOptions)&&void 0!==o&&o.disableToolbarButton?e:[...e,{component:(0,q.jsx)(Ka,{options:t.printOptions}),componentName:"printExport"}]},[]);Ha(e,"exportMenu",m)},Ya=(e,t,o,n)=>{const l=r.useCallback(()=>{e.current.registerStrategyProcessor(t,o,n)},[e,n,o,t]);yi(()=>{l()});const i=r.useRef(!0);r.useEffect(()=>{i.current?i.current=!1:l()},[l])},Qa=(e,t,o)=>{var r,l,i;const a=null!==(r=null!==(l=t.filterModel)&&void 0!==l?l:null===(i=t.initialState)||void 0===i||null===(i=i.filter)||void 0===i?void 0:i.filterModel)&&void 0!==r?r:uo();return(0,n.A)({},e,{filter:(0,n.A)({filterModel:ho(a,t.disableMultipleColumnsFiltering,o)},co),visibleRowsLookup:{}})},$a=e=>e.filteredRowsLookup;function Za(e,t){return e.current.applyStrategyProcessor("visibleRowsLookupCreation",{tree:t.rows.tree,filteredRowsLookup:t.filter.filteredRowsLookup})}function Ja(){return re(Object.values)}const es=e=>(0,n.A)({},e,{focus:{cell:null,columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null},tabIndex:{cell:null,columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null}});function ts(e,t){return e.closest(".".concat(t))}function os(e){return e.replace(/["\\]/g,"\\$&")}function ns(e){return".".concat(C.row,'[data-id="').concat(os(String(e)),'"]')}function rs(e){return 1===e.target.nodeType&&!e.currentTarget.contains(e.target)}function ls(e,t){return e.rootElementRef.current.querySelector(".".concat(C[t]))}const is=e=>{let{api:t,colIndex:o,position:n,filterFn:r}=e;if(null===o)return[];const l=[];return ss(t).forEach(e=>{e.getAttribute("data-id")&&e.querySelectorAll(".".concat(C["left"===n?"cell--pinnedLeft":"cell--pinnedRight"])).forEach(e=>{const t=cs(e);null!==t&&r(t)&&l.push(e)})}),l};const as=e=>{var t;let{api:o,colIndex:n,position:r,filterFn:l}=e;if(null===(t=o.columnHeadersContainerRef)||void 0===t||!t.current)return[];if(null===n)return[];const i=[];return o.columnHeadersContainerRef.current.querySelectorAll(".".concat(C["left"===r?"columnHeader--pinnedLeft":"columnHeader--pinnedRight"])).forEach(e=>{const t=cs(e);null!==t&&l(t,e)&&i.push(e)}),i};function ss(e){return e.virtualScrollerRef.current.querySelectorAll(":scope > div > div > .".concat(C.row))}function cs(e){const t=e.getAttribute("aria-colindex");return t?Number(t)-1:null}const us=e=>{let{currentColIndex:t,firstColIndex:o,lastColIndex:n,isRtl:r}=e;if(r){if(t<n)return t+1}else if(!r&&t>o)return t-1;return null},ds=e=>{let{currentColIndex:t,firstColIndex:o,lastColIndex:n,isRtl:r}=e;if(r){if(t>o)return t-1}else if(!r&&t<n)return t+1;return null};const ps=he(na,Rt,(e,t)=>(t.top||[]).concat(e.rows,t.bottom||[])),fs=(e,t)=>{const o=va(e,"useGridKeyboardNavigation"),n=(0,Hn.I)(),l=r.useCallback(()=>ps(e),[e]),i="DataGrid"!==t.signature&&t.headerFilters,a=r.useCallback(function(t,n){let r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"left",l=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"up";const i=Sr(e),a=e.current.unstable_getCellColSpanInfo(n,t);a&&a.spannedByColSpan&&("left"===r?t=a.leftVisibleCellIndex:"right"===r&&(t=a.rightVisibleCellIndex));const s=ze(e)[t],c=function(e,t,o,n){var r;const l=Vi.selectors.hiddenCells(e.current.virtualizer.store.state);if(null===(r=l[t])||void 0===r||!r[o])return t;const i=Ir(e);let a=i.indexOf(t)+("down"===n?1:-1);for(;a>=0&&a<i.length;){var s;const e=i[a];if(null===(s=l[e])||void 0===s||!s[o])return e;a+="down"===n?1:-1}return t}(e,n,t,l),u=i.findIndex(e=>e.id===c);o.debug("Navigating to cell row ".concat(u,", col ").concat(t)),e.current.scrollToIndexes({colIndex:t,rowIndex:u}),e.current.setCellFocus(c,s)},[e,o]),s=r.useCallback((t,n)=>{o.debug("Navigating to header col ".concat(t)),e.current.scrollToIndexes({colIndex:t});const r=e.current.getVisibleColumns()[t].field;e.current.setColumnHeaderFocus(r,n)},[e,o]),c=r.useCallback((t,n)=>{o.debug("Navigating to header filter col ".concat(t)),e.current.scrollToIndexes({colIndex:t});const r=e.current.getVisibleColumns()[t].field;e.current.setColumnHeaderFilterFocus(r,n)},[e,o]),u=r.useCallback((t,n,r)=>{o.debug("Navigating to header col ".concat(t)),e.current.scrollToIndexes({colIndex:t});const{field:l}=e.current.getVisibleColumns()[t];e.current.setColumnGroupHeaderFocus(l,n,r)},[e,o]),d=r.useCallback(e=>{var t;return null===(t=l()[e])||void 0===t?void 0:t.id},[l]),p=r.useCallback((t,o)=>{const r=o.currentTarget.querySelector(".".concat(C.columnHeaderTitleContainerContent));if(!!r&&r.contains(o.target)&&t.field!==Ra.field)return;const p=l(),f=e.current.getViewportPageSize(),g=t.field?e.current.getColumnIndex(t.field):0,h=p.length>0?0:null,m=p.length-1,v=Oe(e).length-1,b=Jn(e);let w=!0;switch(o.key){case"ArrowDown":i?c(g,o):null!==h&&a(g,d(h));break;case"ArrowRight":{const e=ds({currentColIndex:g,firstColIndex:0,lastColIndex:v,isRtl:n});null!==e&&s(e,o);break}case"ArrowLeft":{const e=us({currentColIndex:g,firstColIndex:0,lastColIndex:v,isRtl:n});null!==e&&s(e,o);break}case"ArrowUp":b>0&&u(g,b-1,o);break;case"PageDown":null!==h&&null!==m&&a(g,d(Math.min(h+f,m)));break;case"Home":s(0,o);break;case"End":s(v,o);break;case"Enter":(o.ctrlKey||o.metaKey)&&e.current.toggleColumnMenu(t.field);break;case" ":break;default:w=!1}w&&o.preventDefault()},[e,l,i,c,a,d,n,s,u]),f=r.useCallback((t,o)=>{const r=_n(e)===t.field,i=Xn(e)===t.field;if(r||i||!On(o.key))return;const u=l(),p=e.current.getViewportPageSize(),f=t.field?e.current.getColumnIndex(t.field):0,g=u.length-1,h=Oe(e).length-1;let m=!0;switch(o.key){case"ArrowDown":{const e=d(0);null!=e&&a(f,e);break}case"ArrowRight":{const e=ds({currentColIndex:f,firstColIndex:0,lastColIndex:h,isRtl:n});null!==e&&c(e,o);break}case"ArrowLeft":{const r=us({currentColIndex:f,firstColIndex:0,lastColIndex:h,isRtl:n});null!==r?c(r,o):e.current.setColumnHeaderFilterFocus(t.field,o);break}case"ArrowUp":s(f,o);break;case"PageDown":null!==g&&a(f,d(Math.min(0+p,g)));break;case"Home":c(0,o);break;case"End":c(h,o);break;case" ":break;default:m=!1}m&&o.preventDefault()},[e,l,c,n,s,a,d]),g=r.useCallback((t,o)=>{const n=Ur(e);if(null===n)return;const{field:r,depth:i}=n,{fields:c,depth:p,maxDepth:f}=t,g=l(),h=e.current.getViewportPageSize(),m=e.current.getColumnIndex(r),v=r?e.current.getColumnIndex(r):0,b=g.length-1,w=Oe(e).length-1;let C=!0;switch(o.key){case"ArrowDown":p===f-1?s(m,o):u(m,i+1,o);break;case"ArrowUp":p>0&&u(m,i-1,o);break;case"ArrowRight":{const e=c.length-c.indexOf(r)-1;m+e+1<=w&&u(m+e+1,i,o);break}case"ArrowLeft":{const e=c.indexOf(r);m-e-1>=0&&u(m-e-1,i,o);break}case"PageDown":null!==b&&a(v,d(Math.min(0+h,b)));break;case"Home":u(0,i,o);break;case"End":u(w,i,o);break;case" ":break;default:C=!1}C&&o.preventDefault()},[e,l,s,u,a,d]),h=r.useCallback((t,o)=>{if(rs(o))return;const r=e.current.getCellParams(t.id,t.field);if(r.cellMode===wn.Edit||!On(o.key))return;if(!e.current.unstable_applyPipeProcessors("canUpdateFocus",!0,{event:o,cell:r}))return;const u=l();if(0===u.length)return;const p=e.current.getViewportPageSize(),f=t.field?e.current.getColumnIndex(t.field):0,g=u.findIndex(e=>e.id===t.id),h=u.length-1,m=Oe(e).length-1;let v=!0;switch(o.key){case"ArrowDown":g<h&&a(f,d(g+1),n?"right":"left","down");break;case"ArrowUp":g>0?a(f,d(g-1)):i?c(f,o):s(f,o);break;case"ArrowRight":{const e=ds({currentColIndex:f,firstColIndex:0,lastColIndex:m,isRtl:n});null!==e&&a(e,d(g),n?"left":"right");break}case"ArrowLeft":{const e=us({currentColIndex:f,firstColIndex:0,lastColIndex:m,isRtl:n});null!==e&&a(e,d(g),n?"right":"left");break}case"Tab":o.shiftKey&&f>0?a(f-1,d(g),"left"):!o.shiftKey&&f<m&&a(f+1,d(g),"right");break;case" ":{if(t.field===rn)break;const e=t.colDef;if(e&&("__tree_data_group__"===e.field||(e=>e===nn||null!==(e=>{const t=e.match(/^__row_group_by_columns_group_(.*)__$/);return t?t[1]:null})(e))(e.field)))break;!o.shiftKey&&g<h&&a(f,d(Math.min(g+p,h)));break}case"PageDown":g<h&&a(f,d(Math.min(g+p,h)));break;case"PageUp":{const e=Math.max(g-p,0);e!==g&&e>=0?a(f,d(e)):s(f,o);break}case"Home":o.ctrlKey||o.metaKey||o.shiftKey?a(0,d(0)):a(0,d(g));break;case"End":o.ctrlKey||o.metaKey||o.shiftKey?a(m,d(h)):a(m,d(g));break;default:v=!1}v&&o.preventDefault()},[e,l,n,a,d,i,c,s]),m=r.useCallback((e,t)=>{let{event:o}=t;return" "!==o.key&&e},[]);Ha(e,"canStartEditing",m),Ht(e,"columnHeaderKeyDown",p),Ht(e,"headerFilterKeyDown",f),Ht(e,"columnGroupHeaderKeyDown",g),Ht(e,"cellKeyDown",h)},gs=(e,t)=>{var o,r,l,i,a,s,c,u,d;const p=(0,n.A)({},Ui(t.autoPageSize),null!==(o=t.paginationModel)&&void 0!==o?o:null===(r=t.initialState)||void 0===r||null===(r=r.pagination)||void 0===r?void 0:r.paginationModel);Ki(p.pageSize,t.signature);const f=null!==(l=null!==(i=t.rowCount)&&void 0!==i?i:null===(a=t.initialState)||void 0===a||null===(a=a.pagination)||void 0===a?void 0:a.rowCount)&&void 0!==l?l:"client"===t.paginationMode?null===(s=e.rows)||void 0===s?void 0:s.totalRowCount:void 0,g=null!==(c=null!==(u=t.paginationMeta)&&void 0!==u?u:null===(d=t.initialState)||void 0===d||null===(d=d.pagination)||void 0===d?void 0:d.meta)&&void 0!==c?c:{};return(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationModel:p,rowCount:f,meta:g,enabled:!0===t.pagination,paginationMode:t.paginationMode})})},hs=(e,t)=>{((e,t)=>{var o;const l=va(e,"useGridPaginationMeta"),i=D(e,Qi);e.current.registerControlState({stateId:"paginationMeta",propModel:t.paginationMeta,propOnChange:t.onPaginationMetaChange,stateSelector:Qi,changeEvent:"paginationMetaChange"});const a=r.useCallback(t=>{i!==t&&(l.debug("Setting 'paginationMeta' to",t),e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{meta:t})})))},[e,l,i]);Nl(e,{setPaginationMeta:a},"public");const s=r.useCallback((o,r)=>{var l;const i=Qi(e);return r.exportOnlyDirtyModels&&null==t.paginationMeta&&null==(null===(l=t.initialState)||void 0===l||null===(l=l.pagination)||void 0===l?void 0:l.meta)?o:(0,n.A)({},o,{pagination:(0,n.A)({},o.pagination,{meta:i})})},[e,t.paginationMeta,null===(o=t.initialState)||void 0===o||null===(o=o.pagination)||void 0===o?void 0:o.meta]),c=r.useCallback((t,o)=>{var r;const l=null!==(r=o.stateToRestore.pagination)&&void 0!==r&&r.meta?o.stateToRestore.pagination.meta:Qi(e);return e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{meta:l})})),t},[e]);Ha(e,"exportState",s),Ha(e,"restoreState",c),r.useEffect(()=>{t.paginationMeta&&e.current.setPaginationMeta(t.paginationMeta)},[e,t.paginationMeta])})(e,t),((e,t)=>{var o;const l=va(e,"useGridPaginationModel"),i=D(e,Ce),a=r.useRef(Cr(e)),s=Math.floor(t.rowHeight*i);e.current.registerControlState({stateId:"paginationModel",propModel:t.paginationModel,propOnChange:t.onPaginationModelChange,stateSelector:Xi,changeEvent:"paginationModelChange"});const c=r.useCallback(t=>{const o=Xi(e);t!==o.page&&(l.debug("Setting page to ".concat(t)),e.current.setPaginationModel({page:t,pageSize:o.pageSize}))},[e,l]),u=r.useCallback(t=>{const o=Xi(e);t!==o.pageSize&&(l.debug("Setting page size to ".concat(t)),e.current.setPaginationModel({pageSize:t,page:o.page}))},[e,l]),d=r.useCallback(o=>{const r=Xi(e);o!==r&&(l.debug("Setting 'paginationModel' to",o),e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationModel:_a(e.pagination,t.signature,o)})}),"setPaginationModel"))},[e,l,t.signature]);Nl(e,{setPage:c,setPageSize:u,setPaginationModel:d},"public");const p=r.useCallback((o,r)=>{var l;const i=Xi(e);return!r.exportOnlyDirtyModels||null!=t.paginationModel||null!=(null===(l=t.initialState)||void 0===l||null===(l=l.pagination)||void 0===l?void 0:l.paginationModel)||0!==i.page&&i.pageSize!==(t.autoPageSize?0:100)?(0,n.A)({},o,{pagination:(0,n.A)({},o.pagination,{paginationModel:i})}):o},[e,t.paginationModel,null===(o=t.initialState)||void 0===o||null===(o=o.pagination)||void 0===o?void 0:o.paginationModel,t.autoPageSize]),f=r.useCallback((o,r)=>{var l,i;const a=null!==(l=r.stateToRestore.pagination)&&void 0!==l&&l.paginationModel?(0,n.A)({},Ui(t.autoPageSize),null===(i=r.stateToRestore.pagination)||void 0===i?void 0:i.paginationModel):Xi(e);return e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationModel:_a(e.pagination,t.signature,a)})}),"stateRestorePreProcessing"),o},[e,t.autoPageSize,t.signature]);Ha(e,"exportState",p),Ha(e,"restoreState",f);const g=r.useCallback(()=>{if(!t.autoPageSize)return;const o=e.current.getRootDimensions(),n=Math.max(1,Math.floor(o.viewportInnerSize.height/s));e.current.setPageSize(n)},[e,t.autoPageSize,s]),h=r.useCallback(t=>{if(null==t)return;const o=Xi(e);if(0===o.page)return;const n=Ji(e);o.page>n-1&&e.current.setPage(Math.max(0,n-1))},[e]),m=r.useCallback(()=>{0!==Xi(e).page&&e.current.setPage(0),0!==e.current.getScrollPosition().top&&e.current.scroll({top:0})},[e]),v=r.useCallback(t=>{const o=(0,n.A)({},t,{items:Tr(e)});ii(o,a.current)||(a.current=o,m())},[e,m]);Ht(e,"viewportInnerSizeChange",g),Ht(e,"paginationModelChange",()=>{var t;const o=Xi(e);null!==(t=e.current.virtualScrollerRef)&&void 0!==t&&t.current&&e.current.scrollToIndexes({rowIndex:o.page*o.pageSize})}),Ht(e,"rowCountChange",h),Ht(e,"sortModelChange",m),Ht(e,"filterModelChange",v);const b=r.useRef(!0);r.useEffect(()=>{b.current?b.current=!1:t.pagination&&e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationModel:_a(e.pagination,t.signature,t.paginationModel)})}))},[e,t.paginationModel,t.signature,t.pagination]),r.useEffect(()=>{e.current.setState(e=>{const o=!0===t.pagination;return e.pagination.paginationMode===t.paginationMode&&e.pagination.enabled===o?e:(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{paginationMode:t.paginationMode,enabled:o})})})},[e,t.paginationMode,t.pagination]),r.useEffect(g,[g])})(e,t),((e,t)=>{var o;const l=va(e,"useGridRowCount"),i=D(e,Er),a=D(e,Yi),s=D(e,Qi),c=D(e,Xi),u=(0,I.A)(()=>Xi(e).pageSize);e.current.registerControlState({stateId:"paginationRowCount",propModel:t.rowCount,propOnChange:t.onRowCountChange,stateSelector:Yi,changeEvent:"rowCountChange"});const d=r.useCallback(t=>{a!==t&&(l.debug("Setting 'rowCount' to",t),e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{rowCount:t})})))},[e,l,a]);Nl(e,{setRowCount:d},"public");const p=r.useCallback((o,r)=>{var l;const i=Yi(e);return r.exportOnlyDirtyModels&&null==t.rowCount&&null==(null===(l=t.initialState)||void 0===l||null===(l=l.pagination)||void 0===l?void 0:l.rowCount)?o:(0,n.A)({},o,{pagination:(0,n.A)({},o.pagination,{rowCount:i})})},[e,t.rowCount,null===(o=t.initialState)||void 0===o||null===(o=o.pagination)||void 0===o?void 0:o.rowCount]),f=r.useCallback((t,o)=>{var r;const l=null!==(r=o.stateToRestore.pagination)&&void 0!==r&&r.rowCount?o.stateToRestore.pagination.rowCount:Yi(e);return e.current.setState(e=>(0,n.A)({},e,{pagination:(0,n.A)({},e.pagination,{rowCount:l})})),t},[e]);Ha(e,"exportState",p),Ha(e,"restoreState",f);const g=r.useCallback(o=>{"client"!==t.paginationMode&&u.current&&o.pageSize!==u.current&&(u.current=o.pageSize,-1===a&&e.current.setPage(0))},[t.paginationMode,u,a,e]);Ht(e,"paginationModelChange",g),r.useEffect(()=>{"client"===t.paginationMode?e.current.setRowCount(i):null!=t.rowCount&&e.current.setRowCount(t.rowCount)},[e,t.paginationMode,i,t.rowCount]);const h=!1===s.hasNextPage;r.useEffect(()=>{h&&-1===a&&e.current.setRowCount(c.pageSize*c.page+i)},[e,i,h,a,c])})(e,t)},ms=(e,t)=>{var o,r;return(0,n.A)({},e,{preferencePanel:null!==(o=null===(r=t.initialState)||void 0===r?void 0:r.preferencePanel)&&void 0!==o?o:{open:!1}})},vs=me(e=>e.editRows),bs=ge(vs,(e,t)=>{let{rowId:o,editMode:n}=t;return n===bn.Row&&Boolean(e[o])}),ws=ge(vs,(e,t)=>{var o,n;let{rowId:r,field:l}=t;return null!==(o=null===(n=e[r])||void 0===n?void 0:n[l])&&void 0!==o?o:null}),Cs=e=>{switch(e.type){case"boolean":return!1;case"date":case"dateTime":case"number":return;case"singleSelect":return null;default:return""}},ys=["id","field"],As=["id","field"];var xs=function(e){return e.enterKeyDown="enterKeyDown",e.cellDoubleClick="cellDoubleClick",e.printableKeyDown="printableKeyDown",e.deleteKeyDown="deleteKeyDown",e}(xs||{}),Ss=function(e){return e.rowFocusOut="rowFocusOut",e.escapeKeyDown="escapeKeyDown",e.enterKeyDown="enterKeyDown",e.tabKeyDown="tabKeyDown",e.shiftTabKeyDown="shiftTabKeyDown",e}(Ss||{});const Rs=["id"],Ms=["id"],Is=e=>(0,n.A)({},e,{editRows:{}}),Ps=(e,t)=>{((e,t)=>{const[o,l]=r.useState({}),i=r.useRef(o),a=r.useRef({}),{processRowUpdate:c,onProcessRowUpdateError:u,cellModesModel:d,onCellModesModelChange:p}=t,f=e=>function(){t.editMode===bn.Cell&&e(...arguments)},g=r.useCallback((t,o)=>{const n=e.current.getCellParams(t,o);if(!e.current.isCellEditable(n))throw new Error("MUI X: The cell with id=".concat(t," and field=").concat(o," is not editable."))},[e]),h=r.useCallback((t,o,n)=>{if(e.current.getCellMode(t,o)!==n)throw new Error("MUI X: The cell with id=".concat(t," and field=").concat(o," is not in ").concat(n," mode."))},[e]),m=r.useCallback((t,o)=>{if(!t.isEditable)return;if(t.cellMode===wn.Edit)return;const r=(0,n.A)({},t,{reason:mn.cellDoubleClick});e.current.publishEvent("cellEditStart",r,o)},[e]),v=r.useCallback((t,o)=>{if(t.cellMode===wn.View)return;if(e.current.getCellMode(t.id,t.field)===wn.View)return;const r=(0,n.A)({},t,{reason:vn.cellFocusOut});e.current.publishEvent("cellEditStop",r,o)},[e]),b=r.useCallback((t,o)=>{if(t.cellMode===wn.Edit){if(229===o.which)return;let r;if("Escape"===o.key?r=vn.escapeKeyDown:"Enter"===o.key?r=vn.enterKeyDown:"Tab"===o.key&&(r=o.shiftKey?vn.shiftTabKeyDown:vn.tabKeyDown,o.preventDefault()),r){const l=(0,n.A)({},t,{reason:r});e.current.publishEvent("cellEditStop",l,o)}}else if(t.isEditable){let r;if(!e.current.unstable_applyPipeProcessors("canStartEditing",!0,{event:o,cellParams:t,editMode:"cell"}))return;if(Dn(o)?r=mn.printableKeyDown:Ln(o)?r=mn.pasteKeyDown:"Enter"===o.key?r=mn.enterKeyDown:"Backspace"!==o.key&&"Delete"!==o.key||(r=mn.deleteKeyDown),r){const l=(0,n.A)({},t,{reason:r,key:o.key});e.current.publishEvent("cellEditStart",l,o)}}},[e]),w=r.useCallback(t=>{const{id:o,field:n,reason:r}=t,l={id:o,field:n};r!==mn.printableKeyDown&&r!==mn.deleteKeyDown&&r!==mn.pasteKeyDown||(l.deleteValue=!0),e.current.startCellEditMode(l)},[e]),C=r.useCallback(t=>{const{id:o,field:n,reason:r}=t;let l;e.current.runPendingEditCellValueMutation(o,n),r===vn.enterKeyDown?l="below":r===vn.tabKeyDown?l="right":r===vn.shiftTabKeyDown&&(l="left");const i="escapeKeyDown"===r;e.current.stopCellEditMode({id:o,field:n,ignoreModifications:i,cellToFocusAfter:l})},[e]);var y;Ht(e,"cellDoubleClick",f(m)),Ht(e,"cellFocusOut",f(v)),Ht(e,"cellKeyDown",f(b)),Ht(e,"cellEditStart",f(w)),Ht(e,"cellEditStop",f(C)),Ot(e,"cellEditStart",t.onCellEditStart),Ot(e,"cellEditStop",(y=t.onCellEditStop,async function(){if(y){var t;const{id:o,field:n}=arguments.length<=0?void 0:arguments[0];(null===(t=e.current.state.editRows[o][n])||void 0===t?void 0:t.error)||y(...arguments)}}));const A=r.useCallback((t,o)=>{const n=vs(e);return n[t]&&n[t][o]?wn.Edit:wn.View},[e]),x=(0,It.A)(o=>{const n=o!==t.cellModesModel;p&&n&&p(o,{api:e.current}),t.cellModesModel&&n||(l(o),i.current=o,e.current.publishEvent("cellModesModelChange",o))}),S=r.useCallback((e,t,o)=>{const r=(0,n.A)({},i.current);if(null!==o)r[e]=(0,n.A)({},r[e],{[t]:(0,n.A)({},o)});else{const o=r[e],n=(0,s.A)(o,[t].map(Kl.A));r[e]=n,0===Object.keys(r[e]).length&&delete r[e]}x(r)},[x]),R=r.useCallback((t,o,r)=>{e.current.setState(e=>{const l=(0,n.A)({},e.editRows);return null!==r?l[t]=(0,n.A)({},l[t],{[o]:(0,n.A)({},r)}):(delete l[t][o],0===Object.keys(l[t]).length&&delete l[t]),(0,n.A)({},e,{editRows:l})})},[e]),M=r.useCallback(e=>{const{id:t,field:o}=e,r=(0,s.A)(e,ys);g(t,o),h(t,o,wn.View),S(t,o,(0,n.A)({mode:wn.Edit},r))},[g,h,S]),I=(0,It.A)(async t=>{const{id:o,field:r,deleteValue:l,initialValue:i}=t,a=e.current.getCellValue(o,r);let s=a;l?s=Cs(e.current.getColumn(r)):i&&(s=i);const c=e.current.getColumn(r),u=!!c.preProcessEditCellProps&&l;let d={value:s,error:!1,isProcessingProps:u};if(R(o,r,d),e.current.setCellFocus(o,r),u&&(d=await Promise.resolve(c.preProcessEditCellProps({id:o,row:e.current.getRow(o),props:d,hasChanged:s!==a})),e.current.getCellMode(o,r)===wn.Edit)){const t=vs(e);R(o,r,(0,n.A)({},d,{value:t[o][r].value,isProcessingProps:!1}))}}),P=r.useCallback(e=>{const{id:t,field:o}=e,r=(0,s.A)(e,As);h(t,o,wn.Edit),S(t,o,(0,n.A)({mode:wn.View},r))},[h,S]),k=(0,It.A)(async o=>{var n;const{id:r,field:l,ignoreModifications:i,cellToFocusAfter:s="none"}=o;h(r,l,wn.Edit),e.current.runPendingEditCellValueMutation(r,l);const d=()=>{R(r,l,null),S(r,l,null),"none"!==s&&e.current.moveFocusToRelativeCell(r,l,s)};if(i)return void d();const p=vs(e),{error:f,isProcessingProps:g}=p[r][l],m=e.current.getRow(r);if(f||g)return a.current[r][l].mode=wn.Edit,void S(r,l,{mode:wn.Edit});const v=e.current.getRowWithUpdatedValuesFromCellEditing(r,l);if(null!==(n=t.dataSource)&&void 0!==n&&n.updateRow){if(ii(m,v))return void d();const t=()=>{a.current[r][l].mode=wn.Edit,S(r,l,{mode:wn.Edit})},o={rowId:r,updatedRow:v,previousRow:m};try{await e.current.dataSource.editRow(o),d()}catch(b){t()}}else if(c){const t=e=>{a.current[r][l].mode=wn.Edit,S(r,l,{mode:wn.Edit}),u&&u(e)};try{Promise.resolve(c(v,m,{rowId:r})).then(t=>{e.current.updateRows([t]),d()}).catch(t)}catch(w){t(w)}}else e.current.updateRows([v]),d()}),E={setCellEditingEditCellValue:r.useCallback(async t=>{var o;const{id:r,field:l,value:i,debounceMs:a,unstable_skipValueParser:s}=t;g(r,l),h(r,l,wn.Edit);const c=e.current.getColumn(l),u=e.current.getRow(r);let d=i;c.valueParser&&!s&&(d=c.valueParser(i,u,c,e));let p=vs(e),f=(0,n.A)({},p[r][l],{value:d,changeReason:a?"debouncedSetEditCellValue":"setEditCellValue"});if(c.preProcessEditCellProps){const e=i!==p[r][l].value;f=(0,n.A)({},f,{isProcessingProps:!0}),R(r,l,f),f=await Promise.resolve(c.preProcessEditCellProps({id:r,row:u,props:f,hasChanged:e}))}return e.current.getCellMode(r,l)!==wn.View&&(p=vs(e),f=(0,n.A)({},f,{isProcessingProps:!1}),f.value=c.preProcessEditCellProps?p[r][l].value:d,R(r,l,f),p=vs(e),!(null!==(o=p[r])&&void 0!==o&&null!==(o=o[l])&&void 0!==o&&o.error))},[e,g,h,R]),getRowWithUpdatedValuesFromCellEditing:r.useCallback((t,o)=>{const r=e.current.getColumn(o),l=vs(e),i=e.current.getRow(t);if(!l[t]||!l[t][o])return e.current.getRow(t);const{value:a}=l[t][o];return r.valueSetter?r.valueSetter(a,i,r,e):(0,n.A)({},i,{[o]:a})},[e])};Nl(e,{getCellMode:A,startCellEditMode:M,stopCellEditMode:P},"public"),Nl(e,E,"private"),r.useEffect(()=>{d&&x(d)},[d,x]),(0,Nt.A)(()=>{const t=mt(e),r=a.current;a.current=lo(o),Object.entries(o).forEach(o=>{let[l,i]=o;Object.entries(i).forEach(o=>{var i;let[a,s]=o;const c=(null===(i=r[l])||void 0===i||null===(i=i[a])||void 0===i?void 0:i.mode)||wn.View,u=t[l]?e.current.getRowId(t[l]):l;s.mode===wn.Edit&&c===wn.View?I((0,n.A)({id:u,field:a},s)):s.mode===wn.View&&c===wn.Edit&&k((0,n.A)({id:u,field:a},s))})})},[e,o,I,k])})(e,t),((e,t)=>{const[o,l]=r.useState({}),i=r.useRef(o),a=r.useRef({}),c=r.useRef({}),u=r.useRef(void 0),d=r.useRef(null),{processRowUpdate:p,onProcessRowUpdateError:f,rowModesModel:g,onRowModesModelChange:h}=t,m=e=>function(){t.editMode===bn.Row&&e(...arguments)},v=r.useCallback((t,o)=>{const n=e.current.getCellParams(t,o);if(!e.current.isCellEditable(n))throw new Error("MUI X: The cell with id=".concat(t," and field=").concat(o," is not editable."))},[e]),b=r.useCallback((t,o)=>{if(e.current.getRowMode(t)!==o)throw new Error("MUI X: The row with id=".concat(t," is not in ").concat(o," mode."))},[e]),w=r.useCallback(t=>{const o=vs(e);return Object.values(o[t]).some(e=>e.error)},[e]),C=r.useCallback((t,o)=>{if(!t.isEditable)return;if(e.current.getRowMode(t.id)===Cn.Edit)return;const r=e.current.getRowParams(t.id),l=(0,n.A)({},r,{field:t.field,reason:xs.cellDoubleClick});e.current.publishEvent("rowEditStart",l,o)},[e]),y=r.useCallback(e=>{d.current=e},[]),A=r.useCallback((t,o)=>{t.isEditable&&e.current.getRowMode(t.id)!==Cn.View&&(d.current=null,u.current=setTimeout(()=>{var r;if((null===(r=d.current)||void 0===r?void 0:r.id)!==t.id){if(!e.current.getRow(t.id))return;if(e.current.getRowMode(t.id)===Cn.View)return;if(w(t.id))return;const r=e.current.getRowParams(t.id),l=(0,n.A)({},r,{field:t.field,reason:Ss.rowFocusOut});e.current.publishEvent("rowEditStop",l,o)}}))},[e,w]);r.useEffect(()=>()=>{clearTimeout(u.current)},[]);const x=r.useCallback((t,o)=>{if(t.cellMode===Cn.Edit){if(229===o.which)return;let r;if("Escape"===o.key)r=Ss.escapeKeyDown;else if("Enter"===o.key)r=Ss.enterKeyDown;else if("Tab"===o.key){const n=ze(e).filter(o=>e.current.getColumn(o).type===Wn||e.current.isCellEditable(e.current.getCellParams(t.id,o)));if(o.shiftKey?t.field===n[0]&&(r=Ss.shiftTabKeyDown):t.field===n[n.length-1]&&(r=Ss.tabKeyDown),o.preventDefault(),!r){const r=n.findIndex(e=>e===t.field),l=n[o.shiftKey?r-1:r+1];e.current.setCellFocus(t.id,l)}}if(r){if(r!==Ss.escapeKeyDown&&w(t.id))return;const l=(0,n.A)({},e.current.getRowParams(t.id),{reason:r,field:t.field});e.current.publishEvent("rowEditStop",l,o)}}else if(t.isEditable){let r;if(!e.current.unstable_applyPipeProcessors("canStartEditing",!0,{event:o,cellParams:t,editMode:"row"}))return;if(Dn(o)||Ln(o)?r=xs.printableKeyDown:"Enter"===o.key?r=xs.enterKeyDown:"Backspace"!==o.key&&"Delete"!==o.key||(r=xs.deleteKeyDown),r){const l=e.current.getRowParams(t.id),i=(0,n.A)({},l,{field:t.field,reason:r});e.current.publishEvent("rowEditStart",i,o)}}},[e,w]),S=r.useCallback(t=>{const{id:o,field:n,reason:r}=t,l={id:o,fieldToFocus:n};r!==xs.printableKeyDown&&r!==xs.deleteKeyDown||(l.deleteValue=!!n),e.current.startRowEditMode(l)},[e]),R=r.useCallback(t=>{const{id:o,reason:n,field:r}=t;let l;e.current.runPendingEditCellValueMutation(o),n===Ss.enterKeyDown?l="below":n===Ss.tabKeyDown?l="right":n===Ss.shiftTabKeyDown&&(l="left");const i="escapeKeyDown"===n;e.current.stopRowEditMode({id:o,ignoreModifications:i,field:r,cellToFocusAfter:l})},[e]);Ht(e,"cellDoubleClick",m(C)),Ht(e,"cellFocusIn",m(y)),Ht(e,"cellFocusOut",m(A)),Ht(e,"cellKeyDown",m(x)),Ht(e,"rowEditStart",m(S)),Ht(e,"rowEditStop",m(R)),Ot(e,"rowEditStart",t.onRowEditStart),Ot(e,"rowEditStop",t.onRowEditStop);const M=r.useCallback(o=>bs(e,{rowId:o,editMode:t.editMode})?Cn.Edit:Cn.View,[e,t.editMode]),I=(0,It.A)(o=>{const n=o!==t.rowModesModel;h&&n&&h(o,{api:e.current}),t.rowModesModel&&n||(l(o),i.current=o,e.current.publishEvent("rowModesModelChange",o))}),P=r.useCallback((e,t)=>{const o=(0,n.A)({},i.current);null!==t?o[e]=(0,n.A)({},t):delete o[e],I(o)},[I]),k=r.useCallback((t,o)=>{e.current.setState(e=>{const r=(0,n.A)({},e.editRows);return null!==o?r[t]=o:delete r[t],(0,n.A)({},e,{editRows:r})})},[e]),E=r.useCallback((t,o,r)=>{e.current.setState(e=>{const l=(0,n.A)({},e.editRows);return null!==r?l[t]=(0,n.A)({},l[t],{[o]:(0,n.A)({},r)}):(delete l[t][o],0===Object.keys(l[t]).length&&delete l[t]),(0,n.A)({},e,{editRows:l})})},[e]),F=r.useCallback(e=>{const{id:t}=e,o=(0,s.A)(e,Rs);b(t,Cn.View),P(t,(0,n.A)({mode:Cn.Edit},o))},[b,P]),T=(0,It.A)(t=>{const{id:o,fieldToFocus:r,deleteValue:l,initialValue:i}=t,a=e.current.getRow(o),s=Te(e),u=s.reduce((t,n)=>{const a=n.field;if(!e.current.getCellParams(o,a).isEditable)return t;const s=e.current.getColumn(a);let c=e.current.getCellValue(o,a);return r===a&&(l||i)&&(l?c=Cs(s):i&&(c=i)),t[a]={value:c,error:!1,isProcessingProps:s.editable&&!!s.preProcessEditCellProps&&l},t},{});c.current[o]=a,k(o,u),r&&e.current.setCellFocus(o,r),s.filter(t=>e.current.getCellParams(o,t.field).isEditable&&t.editable&&!!t.preProcessEditCellProps&&l).forEach(t=>{const r=t.field,s=e.current.getCellValue(o,r),c=l?Cs(t):null!==i&&void 0!==i?i:s;Promise.resolve(t.preProcessEditCellProps({id:o,row:a,props:u[r],hasChanged:c!==s})).then(t=>{if(e.current.getRowMode(o)===Cn.Edit){const l=vs(e);E(o,r,(0,n.A)({},t,{value:l[o][r].value,isProcessingProps:!1}))}})})}),H=r.useCallback(e=>{const{id:t}=e,o=(0,s.A)(e,Ms);b(t,Cn.Edit),P(t,(0,n.A)({mode:Cn.View},o))},[b,P]),D=(0,It.A)(async o=>{var n;const{id:r,ignoreModifications:l,field:i,cellToFocusAfter:s="none"}=o;e.current.runPendingEditCellValueMutation(r);const u=()=>{"none"!==s&&i&&e.current.moveFocusToRelativeCell(r,i,s),k(r,null),P(r,null),delete c.current[r]};if(l)return void u();const d=vs(e),g=c.current[r];if(Object.values(d[r]).some(e=>e.isProcessingProps))return void(a.current[r].mode=Cn.Edit);if(w(r))return a.current[r].mode=Cn.Edit,void P(r,{mode:Cn.Edit});const h=e.current.getRowWithUpdatedValuesFromRowEditing(r);if(null!==(n=t.dataSource)&&void 0!==n&&n.updateRow){if(ii(g,h))return void u();const t=()=>{a.current[r].mode=Cn.Edit,P(r,{mode:Cn.Edit})},o={rowId:r,updatedRow:h,previousRow:g};try{await e.current.dataSource.editRow(o),u()}catch(m){t()}}else if(p){const t=e=>{a.current[r]&&(a.current[r].mode=Cn.Edit,P(r,{mode:Cn.Edit})),f&&f(e)};try{Promise.resolve(p(h,g,{rowId:r})).then(t=>{e.current.updateRows([t]),u()}).catch(t)}catch(v){t(v)}}else e.current.updateRows([h]),u()}),O={setRowEditingEditCellValue:r.useCallback(t=>{const{id:o,field:r,value:l,debounceMs:i,unstable_skipValueParser:a}=t;v(o,r);const c=e.current.getColumn(r),u=e.current.getRow(o);let d=l;c.valueParser&&!a&&(d=c.valueParser(l,u,c,e));let p=vs(e),f=(0,n.A)({},p[o][r],{value:d,changeReason:i?"debouncedSetEditCellValue":"setEditCellValue"});return c.preProcessEditCellProps||E(o,r,f),new Promise(t=>{const l=[];if(c.preProcessEditCellProps){const i=f.value!==p[o][r].value;f=(0,n.A)({},f,{isProcessingProps:!0}),E(o,r,f);const a=p[o],g=(0,s.A)(a,[r].map(Kl.A)),h=Promise.resolve(c.preProcessEditCellProps({id:o,row:u,props:f,hasChanged:i,otherFieldsProps:g})).then(l=>{e.current.getRowMode(o)!==Cn.View?(p=vs(e),(l=(0,n.A)({},l,{isProcessingProps:!1})).value=c.preProcessEditCellProps?p[o][r].value:d,E(o,r,l)):t(!1)});l.push(h)}Object.entries(p[o]).forEach(i=>{let[a,c]=i;if(a===r)return;const d=e.current.getColumn(a);if(!d.preProcessEditCellProps)return;c=(0,n.A)({},c,{isProcessingProps:!0}),E(o,a,c),p=vs(e);const f=p[o],g=(0,s.A)(f,[a].map(Kl.A)),h=Promise.resolve(d.preProcessEditCellProps({id:o,row:u,props:c,hasChanged:!1,otherFieldsProps:g})).then(r=>{e.current.getRowMode(o)!==Cn.View?(r=(0,n.A)({},r,{isProcessingProps:!1}),E(o,a,r)):t(!1)});l.push(h)}),Promise.all(l).then(()=>{e.current.getRowMode(o)===Cn.Edit?(p=vs(e),t(!p[o][r].error)):t(!1)})})},[e,v,E]),getRowWithUpdatedValuesFromRowEditing:r.useCallback(t=>{const o=vs(e),r=e.current.getRow(t);if(!o[t])return e.current.getRow(t);let l=(0,n.A)({},c.current[t],r);return Object.entries(o[t]).forEach(t=>{let[o,n]=t;const r=e.current.getColumn(o);null!==r&&void 0!==r&&r.valueSetter?l=r.valueSetter(n.value,l,r,e):l[o]=n.value}),l},[e])};Nl(e,{getRowMode:M,startRowEditMode:F,stopRowEditMode:H},"public"),Nl(e,O,"private"),r.useEffect(()=>{g&&I(g)},[g,I]),(0,Nt.A)(()=>{const t=mt(e),r=a.current;a.current=lo(o);const l=new Set([...Object.keys(o),...Object.keys(r)]);Array.from(l).forEach(l=>{var i,a;const s=null!==(i=o[l])&&void 0!==i?i:{mode:Cn.View},c=(null===(a=r[l])||void 0===a?void 0:a.mode)||Cn.View,u=t[l]?e.current.getRowId(t[l]):l;s.mode===Cn.Edit&&c===Cn.View?T((0,n.A)({id:u},s)):s.mode===Cn.View&&c===Cn.Edit&&D((0,n.A)({id:u},s))})},[e,o,T,D])})(e,t);const o=r.useRef({}),{isCellEditable:l}=t,i=r.useCallback(e=>!_o(e.rowNode)&&(!!e.colDef.editable&&(!!e.colDef.renderEditCell&&(!l||l(e)))),[l]);r.useEffect(()=>{const e=o.current;return()=>{Object.entries(e).forEach(t=>{let[o,n]=t;Object.keys(n).forEach(t=>{const[n]=e[o][t];clearTimeout(n),delete e[o][t]})})}},[]);const a=r.useCallback((e,t)=>{if(o.current[e])if(t){if(o.current[e][t]){const[,n]=o.current[e][t];n()}}else Object.keys(o.current[e]).forEach(t=>{const[,n]=o.current[e][t];n()})},[]),c=r.useCallback(n=>{const{id:r,field:l,debounceMs:i}=n;return new Promise(a=>{((e,t,n,r)=>{if(!n)return void r();if(o.current[e]||(o.current[e]={}),o.current[e][t]){const[n]=o.current[e][t];clearTimeout(n)}const l=setTimeout(()=>{r(),delete o.current[e][t]},n);o.current[e][t]=[l,()=>{const[n]=o.current[e][t];clearTimeout(n),r(),delete o.current[e][t]}]})(r,l,i,async()=>{const o=t.editMode===bn.Row?e.current.setRowEditingEditCellValue:e.current.setCellEditingEditCellValue;if(e.current.getCellMode(r,l)===wn.Edit){const e=await o(n);a(e)}})})},[e,t.editMode]),u=r.useCallback((o,n)=>t.editMode===bn.Cell?e.current.getRowWithUpdatedValuesFromCellEditing(o,n):e.current.getRowWithUpdatedValuesFromRowEditing(o),[e,t.editMode]),d=r.useCallback((t,o)=>{var n,r;return null!==(n=null===(r=vs(e)[t])||void 0===r?void 0:r[o])&&void 0!==n?n:null},[e]),p={runPendingEditCellValueMutation:a};Nl(e,{isCellEditable:i,setEditCellValue:c,getRowWithUpdatedValues:u,unstable_getEditCellMeta:d},"public"),Nl(e,p,"private")},ks=(e,t,o)=>{const r=!!t.dataSource;return o.current.caches.rows=Wo({rows:r?[]:t.rows,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),(0,n.A)({},e,{rows:Ko({apiRef:o,rowCountProp:t.rowCount,loadingProp:!!r||t.loading,previousTree:null,previousTreeDepths:null})})},Es=e=>"full"===e.updates.type?(e=>{const t={[Bo]:(0,n.A)({},{type:"group",id:Bo,depth:-1,groupingField:null,groupingKey:null,isAutoGenerated:!0,children:[],childrenFromPath:{},childrenExpanded:!0,parent:null},{children:e})};for(let o=0;o<e.length;o+=1){const n=e[o];t[n]={id:n,depth:0,parent:Bo,type:"leaf",groupingKey:null}}return{groupingName:_l,tree:t,treeDepths:{0:e.length},dataRowIds:e}})(e.updates.rows):(e=>{let{previousTree:t,actions:o}=e;const r=(0,n.A)({},t),l={};for(let n=0;n<o.remove.length;n+=1){const e=o.remove[n];l[e]=!0,delete r[e]}for(let n=0;n<o.insert.length;n+=1){const e=o.insert[n];r[e]={id:e,depth:0,parent:Bo,type:"leaf",groupingKey:null}}const i=r[Bo];let a=[...i.children,...o.insert];return Object.values(l).length&&(a=a.filter(e=>!l[e])),r[Bo]=(0,n.A)({},i,{children:a}),{groupingName:_l,tree:r,treeDepths:{0:a.length},dataRowIds:a}})({previousTree:e.previousTree,actions:e.updates.actions});class Fs extends Error{}function Ts(e,t){var o;const n=r.useCallback(t=>({field:t,colDef:e.current.getColumn(t)}),[e]),l=r.useCallback(t=>{const o=e.current.getRow(t);if(!o)throw new Fs("No row with id #".concat(t," found"));return{id:t,columns:e.current.getAllColumns(),row:o}},[e]),i=r.useCallback((t,o,n,r)=>{let{cellMode:l,colDef:i,hasFocus:a,rowNode:s,tabIndex:c}=r;const u=n[o],d=null!==i&&void 0!==i&&i.valueGetter?i.valueGetter(u,n,i,e):u,p={id:t,field:o,row:n,rowNode:s,colDef:i,cellMode:l,hasFocus:a,tabIndex:c,value:d,formattedValue:d,isEditable:!1,api:e.current};return i&&i.valueFormatter&&(p.formattedValue=i.valueFormatter(d,n,i,e)),p.isEditable=i&&e.current.isCellEditable(p),p},[e]),a=r.useCallback((o,n)=>{var r;const l=e.current.getRow(o),i=bt(e,o);if(!l||!i)throw new Fs("No row with id #".concat(o," found"));const a=Gr(e),s=qr(e),c=e.current.getCellMode(o,n);return e.current.getCellParamsForRow(o,n,l,{colDef:t.listView&&(null===(r=t.listViewColumn)||void 0===r?void 0:r.field)===n?Pe(e):e.current.getColumn(n),rowNode:i,hasFocus:null!==a&&a.field===n&&a.id===o,tabIndex:s&&s.field===n&&s.id===o?0:-1,cellMode:c})},[e,t.listView,null===(o=t.listViewColumn)||void 0===o?void 0:o.field]),s=r.useCallback((t,o)=>{const n=e.current.getColumn(o),r=e.current.getRow(t);if(!r)throw new Fs("No row with id #".concat(t," found"));return n&&n.valueGetter?n.valueGetter(r[n.field],r,n,e):r[o]},[e]),c=r.useCallback((t,o)=>((e,t,o)=>{const n=t.field;if(!t||!t.valueGetter)return e[n];const r=e[t.field];return t.valueGetter(r,e,t,o)})(t,o,e),[e]),u=r.useCallback((t,o)=>{const n=c(t,o);return o&&o.valueFormatter?o.valueFormatter(n,t,o,e):n},[e,c]),d=r.useCallback(t=>e.current.rootElementRef.current?function(e,t){return e.querySelector('[role="columnheader"][data-field="'.concat(os(t),'"]'))}(e.current.rootElementRef.current,t):null,[e]),p=r.useCallback(t=>e.current.rootElementRef.current?function(e,t){return e.querySelector(ns(t))}(e.current.rootElementRef.current,t):null,[e]),f=r.useCallback((t,o)=>e.current.rootElementRef.current?function(e,t){let{id:o,field:n}=t;const r=ns(o),l=".".concat(C.cell,'[data-field="').concat(os(n),'"]'),i="".concat(r," ").concat(l);return e.querySelector(i)}(e.current.rootElementRef.current,{id:t,field:o}):null,[e]),g={getCellParamsForRow:i};Nl(e,{getCellValue:s,getCellParams:a,getCellElement:f,getRowValue:c,getRowFormattedValue:u,getRowParams:l,getRowElement:p,getColumnHeaderParams:n,getColumnHeaderElement:d},"public"),Nl(e,g,"private")}const Hs={type:"include",ids:new Set},Ds=(e,t)=>{var o;return(0,n.A)({},e,{rowSelection:t.rowSelection&&null!==(o=t.rowSelectionModel)&&void 0!==o?o:Hs})},Os=(e,t)=>{const o=(e=>{const{classes:t}=e;return r.useMemo(()=>(0,p.A)({cellCheckbox:["cellCheckbox"],columnHeaderCheckbox:["columnHeaderCheckbox"]},w,t),[t])})({classes:t.classes}),l=r.useCallback(r=>{const l=(0,n.A)({},Ra,{cellClassName:o.cellCheckbox,headerClassName:o.columnHeaderCheckbox,headerName:e.current.getLocaleText("checkboxSelectionHeaderName")}),i=t.checkboxSelection,a=null!=r.lookup[Sa];return i&&!a?(r.lookup[Sa]=l,r.orderedFields=[Sa,...r.orderedFields]):!i&&a?(delete r.lookup[Sa],r.orderedFields=r.orderedFields.filter(e=>e!==Sa)):i&&a&&(r.lookup[Sa]=(0,n.A)({},l,r.lookup[Sa]),t.columns.some(e=>e.field===Sa)||(r.orderedFields=[Sa,...r.orderedFields.filter(e=>e!==Sa)])),r},[e,o,t.columns,t.checkboxSelection]);Ha(e,"hydrateColumns",l)},zs=(e,t)=>{var o,r,l;const i=null!==(o=null!==(r=t.sortModel)&&void 0!==r?r:null===(l=t.initialState)||void 0===l||null===(l=l.sorting)||void 0===l?void 0:l.sortModel)&&void 0!==o?o:[];return(0,n.A)({},e,{sorting:{sortModel:Ut(i,t.disableMultipleColumnsSorting),sortedRows:[]}})};function Ls(e){const{containerSize:t,scrollPosition:o,elementSize:n,elementOffset:r}=e,l=r+n;return n>t?r:l-t>o?l-t:r<o?r:void 0}const js={width:0,height:0},Ns={isReady:!1,root:js,viewportOuterSize:js,viewportInnerSize:js,contentSize:js,minimumSize:js,hasScrollX:!1,hasScrollY:!1,scrollbarSize:0,headerHeight:0,groupHeaderHeight:0,headerFilterHeight:0,rowWidth:0,rowHeight:0,columnsTotalWidth:0,leftPinnedWidth:0,rightPinnedWidth:0,headersTotalHeight:0,topContainerHeight:0,bottomContainerHeight:0},Bs=(e,t,o)=>{const r=Ns,l=Ce(o);return(0,n.A)({},e,{dimensions:(0,n.A)({},r,Ws(t,o,l,je(o)))})},Vs=ge(Oe,Be,(e,t)=>{const o=e.length;return 0===o?0:$l(t[o-1]+e[o-1].computedWidth,1)});function Gs(e,t){const o=(t,o)=>e.style.setProperty(t,o);o("--DataGrid-hasScrollX","".concat(Number(t.hasScrollX))),o("--DataGrid-hasScrollY","".concat(Number(t.hasScrollY))),o("--DataGrid-scrollbarSize","".concat(t.scrollbarSize,"px")),o("--DataGrid-rowWidth","".concat(t.rowWidth,"px")),o("--DataGrid-columnsTotalWidth","".concat(t.columnsTotalWidth,"px")),o("--DataGrid-leftPinnedWidth","".concat(t.leftPinnedWidth,"px")),o("--DataGrid-rightPinnedWidth","".concat(t.rightPinnedWidth,"px")),o("--DataGrid-headerHeight","".concat(t.headerHeight,"px")),o("--DataGrid-headersTotalHeight","".concat(t.headersTotalHeight,"px")),o("--DataGrid-topContainerHeight","".concat(t.topContainerHeight,"px")),o("--DataGrid-bottomContainerHeight","".concat(t.bottomContainerHeight,"px")),o("--height","".concat(t.rowHeight,"px"))}function Ws(e,t,o,n){var r,l;const i=Zo(e.rowHeight,da.rowHeight);return{rowHeight:Math.floor(i*o),headerHeight:Math.floor(e.columnHeaderHeight*o),groupHeaderHeight:Math.floor((null!==(r=e.columnGroupHeaderHeight)&&void 0!==r?r:e.columnHeaderHeight)*o),headerFilterHeight:Math.floor((null!==(l=e.headerFilterHeight)&&void 0!==l?l:e.columnHeaderHeight)*o),columnsTotalWidth:Vs(t),headersTotalHeight:lr(t,e),leftPinnedWidth:n.left.reduce((e,t)=>e+t.computedWidth,0),rightPinnedWidth:n.right.reduce((e,t)=>e+t.computedWidth,0)}}const Us=(e,t,o)=>{const r=nt(o),l=ft(o),i=qi(o),a=Math.min(i.enabled?i.paginationModel.pageSize:l,l);return(0,n.A)({},e,{rowsMeta:{currentPageTotalHeight:a*r,positions:Array.from({length:a},(e,t)=>t*r),pinnedTopRowsTotalHeight:0,pinnedBottomRowsTotalHeight:0}})};function Ks(e){return void 0!==e.field}const qs=(e,t,o)=>{if(Ks(e)){if(void 0!==o[e.field])throw new Error(["MUI X: columnGroupingModel contains duplicated field","column field ".concat(e.field," occurs two times in the grouping model:"),"- ".concat(o[e.field].join(" > ")),"- ".concat(t.join(" > "))].join("\n"));return void(o[e.field]=t)}const{groupId:n,children:r}=e;r.forEach(e=>{qs(e,[...t,n],o)})},_s=e=>{if(!e)return{};const t={};return e.forEach(e=>{qs(e,[],t)}),t},Xs=(e,t,o)=>{const n=e=>{var o;return null!==(o=t[e])&&void 0!==o?o:[]},r=[],l=Math.max(0,...e.map(e=>n(e).length)),i=(e,t,o)=>{const r=n(e),l=n(t);for(let n=0;n<=o;n+=1)if(r[n]!==l[n])return!1;return!0},a=(e,t)=>{const n=null===o||void 0===o?void 0:o.left,r=null===o||void 0===o?void 0:o.right,l=!(null===n||void 0===n||!n.includes(e)),i=!(null===n||void 0===n||!n.includes(t)),a=!(null===r||void 0===r||!r.includes(e)),s=!(null===r||void 0===r||!r.includes(t));return l!==i||a!==s};for(let c=0;c<l;c+=1){const t=[];for(let o=0;o<e.length;o+=1){var s;const r=e[o],l=null!==(s=n(r)[c])&&void 0!==s?s:null;if(0===t.length){t.push({columnFields:[r],groupId:l});continue}const u=t[t.length-1],d=u.columnFields[u.columnFields.length-1];u.groupId!==l||!i(d,r,c)||a(d,r)?t.push({columnFields:[r],groupId:l}):u.columnFields.push(r)}r.push(t)}return r},Ys=["groupId","children"],Qs=e=>{const t={};for(let o=0;o<e.length;o+=1){const r=e[o];if(Ks(r))continue;const{groupId:l,children:i}=r,a=(0,s.A)(r,Ys);if(!l)throw new Error("MUI X: An element of the columnGroupingModel does not have either `field` or `groupId`.");0;const c=(0,n.A)({},a,{groupId:l}),u=Qs(i);if(void 0!==u[l]||void 0!==t[l])throw new Error("MUI X: The groupId ".concat(l," is used multiple times in the columnGroupingModel."));Object.assign(t,u),t[l]=c}return t},$s=(e,t,o)=>{var r,l,i;if(o.current.caches.columnGrouping={lastColumnGroupingModel:t.columnGroupingModel},!t.columnGroupingModel)return e;const a=Ee(o),s=ze(o),c=Qs(null!==(r=t.columnGroupingModel)&&void 0!==r?r:[]),u=_s(null!==(l=t.columnGroupingModel)&&void 0!==l?l:[]),d=Xs(a,u,null!==(i=o.current.state.pinnedColumns)&&void 0!==i?i:{}),p=0===s.length?0:Math.max(...s.map(e=>{var t,o;return null!==(t=null===(o=u[e])||void 0===o?void 0:o.length)&&void 0!==t?t:0}));return(0,n.A)({},e,{columnGrouping:{lookup:c,unwrappedGroupingModel:u,headerStructure:d,maxDepth:p}})},Zs=!("undefined"!==typeof window&&/jsdom|HappyDOM/.test(window.navigator.userAgent)),Js=(e,t)=>{const{disableVirtualization:o,autoHeight:r}=t,l={enabled:!o&&Zs,enabledForColumns:!o&&Zs,enabledForRows:!o&&!r&&Zs,renderContext:Ri};return(0,n.A)({},e,{virtualization:l})};const ec={includeHeaders:!0,includeOutliers:!1,outliersFactor:1.5,expand:!1,disableColumnVirtualization:!0};function tc(e,t){if(void 0!==t&&e.changedTouches){for(let o=0;o<e.changedTouches.length;o+=1){const n=e.changedTouches[o];if(n.identifier===t)return{x:n.clientX,y:n.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function oc(e,t,o,n){let r=e;return r+="Right"===n?t-o.left:o.right-t,r}function nc(e){e.preventDefault(),e.stopImmediatePropagation()}function rc(e){const t=r.useRef(void 0),o=()=>aa(e),n=D(e,o);r.useEffect(()=>{t.current&&!1===n&&(t.current.resolve(),t.current=void 0)});return()=>{if(!t.current){if(!1===o())return Promise.resolve();t.current=function(){let e,t;const o=new Promise((o,n)=>{e=o,t=n});return o.resolve=e,o.reject=t,o}()}return t.current}}function lc(e,t,o){const n={},r=e.current.rootElementRef.current;return r.classList.add(C.autosizing),o.forEach(o=>{const r=function(e,t){const o=e.virtualScrollerRef.current;return Array.from(o.querySelectorAll(':scope > div > div > div > [data-field="'.concat(os(t),'"][role="gridcell"]')))}(e.current,o.field),l=r.map(e=>{var t;return null!==(t=e.getBoundingClientRect().width)&&void 0!==t?t:0}),i=t.includeOutliers?l:function(e,t){if(e.length<4)return e;const o=e.slice();o.sort((e,t)=>e-t);const n=o[Math.floor(.25*o.length)],r=o[Math.floor(.75*o.length)-1],l=r-n,i=l<5?5:l*t;return o.filter(e=>e>n-i&&e<r+i)}(l,t.outliersFactor);if(t.includeHeaders){const t=(c=e.current,u=o.field,c.columnHeadersContainerRef.current.querySelector(':scope > div > [data-field="'.concat(os(u),'"][role="columnheader"]')));if(t){var a,s;const e=t.querySelector(".".concat(C.columnHeaderTitle)),o=t.querySelector(".".concat(C.columnHeaderTitleContainerContent)),n=t.querySelector(".".concat(C.iconButtonContainer)),r=t.querySelector(".".concat(C.menuIcon)),l=null!==e&&void 0!==e?e:o,c=window.getComputedStyle(t,null),u=parseInt(c.paddingLeft,10)+parseInt(c.paddingRight,10),d=l.scrollWidth+1+u+(null!==(a=null===n||void 0===n?void 0:n.clientWidth)&&void 0!==a?a:0)+(null!==(s=null===r||void 0===r?void 0:r.clientWidth)&&void 0!==s?s:0);i.push(d)}}var c,u;const d=o.minWidth!==-1/0&&void 0!==o.minWidth,p=o.maxWidth!==1/0&&void 0!==o.maxWidth,f=d?o.minWidth:0,g=p?o.maxWidth:1/0,h=0===i.length?0:Math.max(...i);n[o.field]=ro(h,f,g)}),r.classList.remove(C.autosizing),n}const ic=e=>(0,n.A)({},e,{columnResize:{resizingColumnField:""}});function ac(){return{colDef:void 0,initialColWidth:0,initialTotalWidth:0,previousMouseClickEvent:void 0,columnHeaderElement:void 0,headerFilterElement:void 0,groupHeaderElements:[],cellElements:[],leftPinnedCellsAfter:[],rightPinnedCellsBefore:[],fillerLeft:void 0,fillerRight:void 0,leftPinnedHeadersAfter:[],rightPinnedHeadersBefore:[]}}const sc=(e,t)=>{const o=(0,Hn.I)(),l=va(e,"useGridColumnResize"),i=(0,I.A)(ac).current,a=r.useRef(null),s=r.useRef(null),c=(0,Lt.A)(),u=r.useRef(void 0),d=t=>{l.debug("Updating width to ".concat(t," for col ").concat(i.colDef.field));const o=i.columnHeaderElement.offsetWidth,n=t-o,r=t-i.initialColWidth;if(r>0){var a;const t=i.initialTotalWidth+r;null===(a=e.current.rootElementRef)||void 0===a||null===(a=a.current)||void 0===a||a.style.setProperty("--DataGrid-rowWidth","".concat(t,"px"))}i.colDef.computedWidth=t,i.colDef.width=t,i.colDef.flex=0,i.columnHeaderElement.style.width="".concat(t,"px");const s=i.headerFilterElement;s&&(s.style.width="".concat(t,"px")),i.groupHeaderElements.forEach(e=>{const o=e;let r;r="1"===o.getAttribute("aria-colspan")?"".concat(t,"px"):"".concat(o.offsetWidth+n,"px"),o.style.width=r}),i.cellElements.forEach(e=>{const o=e;let r;r="1"===o.getAttribute("aria-colspan")?"".concat(t,"px"):"".concat(o.offsetWidth+n,"px"),o.style.setProperty("--width",r)});const c=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,i.colDef.field);c===Se.LEFT&&(cc(i.fillerLeft,"width",n),i.leftPinnedCellsAfter.forEach(e=>{cc(e,"left",n)}),i.leftPinnedHeadersAfter.forEach(e=>{cc(e,"left",n)})),c===Se.RIGHT&&(cc(i.fillerRight,"width",n),i.rightPinnedCellsBefore.forEach(e=>{cc(e,"right",n)}),i.rightPinnedHeadersBefore.forEach(e=>{cc(e,"right",n)}))},p=t=>{if(w(),i.previousMouseClickEvent){const o=i.previousMouseClickEvent,n=o.timeStamp,r=o.clientX,l=o.clientY;if(t.timeStamp-n<300&&t.clientX===r&&t.clientY===l)return i.previousMouseClickEvent=void 0,void e.current.publishEvent("columnResizeStop",null,t)}if(i.colDef){e.current.setColumnWidth(i.colDef.field,i.colDef.width),l.debug("Updating col ".concat(i.colDef.field," with new width: ").concat(i.colDef.width));const t=ke(e);i.groupHeaderElements.forEach(e=>{const o=e,n=e.getAttribute("data-fields").slice(2,-2).split("-|-").reduce((e,o)=>!1!==t.columnVisibilityModel[o]?e+t.lookup[o].computedWidth:e,0),r="".concat(n,"px");o.style.width=r})}c.start(0,()=>{e.current.publishEvent("columnResizeStop",null,t)})},f=(t,n,r)=>{var l;const c=e.current.rootElementRef.current;var u,d;i.initialColWidth=t.computedWidth,i.initialTotalWidth=e.current.getRootDimensions().rowWidth,i.colDef=t,i.columnHeaderElement=(u=e.current.columnHeadersContainerRef.current,d=t.field,u.querySelector('[data-field="'.concat(os(d),'"]')));const p=c.querySelector(".".concat(C.headerFilterRow,' [data-field="').concat(os(t.field),'"]'));p&&(i.headerFilterElement=p),i.groupHeaderElements=function(e,t){var o;return Array.from(null!==(o=e.querySelectorAll('[data-fields*="|-'.concat(os(t),'-|"]')))&&void 0!==o?o:[])}(null===(l=e.current.columnHeadersContainerRef)||void 0===l?void 0:l.current,t.field),i.cellElements=function(e,t){var o;if(!ts(e,C.root))throw new Error("MUI X: The root element is not found.");const n=e.getAttribute("aria-colindex");if(!n)return[];const r=Number(n)-1,l=[];return null!==(o=t.virtualScrollerRef)&&void 0!==o&&o.current?(ss(t).forEach(e=>{const o=e.getAttribute("data-id");if(!o)return;let n=r;const i=t.unstable_getCellColSpanInfo(o,r);i&&i.spannedByColSpan&&(n=i.leftVisibleCellIndex);const a=e.querySelector('[data-colindex="'.concat(n,'"]'));a&&l.push(a)}),l):[]}(i.columnHeaderElement,e.current),i.fillerLeft=ls(e.current,o?"filler--pinnedRight":"filler--pinnedLeft"),i.fillerRight=ls(e.current,o?"filler--pinnedLeft":"filler--pinnedRight");const f=e.current.unstable_applyPipeProcessors("isColumnPinned",!1,i.colDef.field);i.leftPinnedCellsAfter=f!==Se.LEFT?[]:function(e,t,o){const n=cs(t);return is({api:e,colIndex:n,position:o?"right":"left",filterFn:e=>o?e<n:e>n})}(e.current,i.columnHeaderElement,o),i.rightPinnedCellsBefore=f!==Se.RIGHT?[]:function(e,t,o){const n=cs(t);return is({api:e,colIndex:n,position:o?"left":"right",filterFn:e=>o?e>n:e<n})}(e.current,i.columnHeaderElement,o),i.leftPinnedHeadersAfter=f!==Se.LEFT?[]:function(e,t,o){const n=cs(t);return as({api:e,position:o?"right":"left",colIndex:n,filterFn:e=>o?e<n:e>n})}(e.current,i.columnHeaderElement,o),i.rightPinnedHeadersBefore=f!==Se.RIGHT?[]:function(e,t,o){const n=cs(t);return as({api:e,position:o?"left":"right",colIndex:n,filterFn:(e,t)=>!t.classList.contains(C["columnHeader--last"])&&(o?e>n:e<n)})}(e.current,i.columnHeaderElement,o),s.current=function(e,t){const o=e.classList.contains(C["columnSeparator--sideRight"])?"Right":"Left";return t?function(e){return"Right"===e?"Left":"Right"}(o):o}(n,o),a.current=function(e,t,o){return"Left"===o?e-t.left:t.right-e}(r,i.columnHeaderElement.getBoundingClientRect(),s.current)},g=(0,It.A)(p),h=(0,It.A)(t=>{if(0===t.buttons)return void g(t);let o=oc(a.current,t.clientX,i.columnHeaderElement.getBoundingClientRect(),s.current);o=ro(o,i.colDef.minWidth,i.colDef.maxWidth),d(o);const n={element:i.columnHeaderElement,colDef:i.colDef,width:o};e.current.publishEvent("columnResize",n,t)}),m=(0,It.A)(e=>{tc(e,u.current)&&p(e)}),v=(0,It.A)(t=>{const o=tc(t,u.current);if(!o)return;if("mousemove"===t.type&&0===t.buttons)return void m(t);let n=oc(a.current,o.x,i.columnHeaderElement.getBoundingClientRect(),s.current);n=ro(n,i.colDef.minWidth,i.colDef.maxWidth),d(n);const r={element:i.columnHeaderElement,colDef:i.colDef,width:n};e.current.publishEvent("columnResize",r,t)}),b=(0,It.A)(t=>{const o=ts(t.target,C["columnSeparator--resizable"]);if(!o)return;const n=t.changedTouches[0];null!=n&&(u.current=n.identifier);const r=ts(t.target,C.columnHeader),i=r.getAttribute("data-field");const a=e.current.getColumn(i);l.debug("Start Resize on col ".concat(a.field)),e.current.publishEvent("columnResizeStart",{field:i},t),f(a,o,n.clientX);const s=(0,li.A)(t.currentTarget);s.addEventListener("touchmove",v),s.addEventListener("touchend",m)}),w=r.useCallback(()=>{const t=(0,li.A)(e.current.rootElementRef.current);t.body.style.removeProperty("cursor"),t.removeEventListener("mousemove",h),t.removeEventListener("mouseup",g),t.removeEventListener("touchmove",v),t.removeEventListener("touchend",m),setTimeout(()=>{t.removeEventListener("click",nc,!0)},100),i.columnHeaderElement&&(i.columnHeaderElement.style.pointerEvents="unset")},[e,i,h,g,v,m]),y=r.useCallback(t=>{let{field:o}=t;e.current.setState(e=>(0,n.A)({},e,{columnResize:(0,n.A)({},e.columnResize,{resizingColumnField:o})}))},[e]),A=r.useCallback(()=>{e.current.setState(e=>(0,n.A)({},e,{columnResize:(0,n.A)({},e.columnResize,{resizingColumnField:""})}))},[e]),x=(0,It.A)((t,o)=>{let{colDef:n}=t;if(0!==o.button)return;if(!o.currentTarget.classList.contains(C["columnSeparator--resizable"]))return;o.preventDefault(),l.debug("Start Resize on col ".concat(n.field)),e.current.publishEvent("columnResizeStart",{field:n.field},o),f(n,o.currentTarget,o.clientX);const r=(0,li.A)(e.current.rootElementRef.current);r.body.style.cursor="col-resize",i.previousMouseClickEvent=o.nativeEvent,r.addEventListener("mousemove",h),r.addEventListener("mouseup",g),r.addEventListener("click",nc,!0)}),S=(0,It.A)((o,r)=>{if(t.disableAutosize)return;if(0!==r.button)return;const l=e.current.state.columns.lookup[o.field];!1!==l.resizable&&e.current.autosizeColumns((0,n.A)({},t.autosizeOptions,{disableColumnVirtualization:!1,columns:[l.field]}))}),R=rc(e),M=r.useRef(!1),P=r.useCallback(async o=>{var r,l;if(!(null===(r=e.current.rootElementRef)||void 0===r?void 0:r.current))return;if(M.current)return;M.current=!0;const i=ke(e),a=(0,n.A)({},ec,o,{columns:null!==(l=null===o||void 0===o?void 0:o.columns)&&void 0!==l?l:i.orderedFields});a.columns=a.columns.filter(e=>!1!==i.columnVisibilityModel[e]);const s=a.columns.map(t=>e.current.state.columns.lookup[t]);try{!t.disableVirtualization&&a.disableColumnVirtualization&&(e.current.unstable_setColumnVirtualization(!1),await R());const o=lc(e,a,s),r=s.map(e=>(0,n.A)({},e,{width:o[e.field],computedWidth:o[e.field],flex:0}));if(a.expand){const t=i.orderedFields.map(e=>i.lookup[e]).filter(e=>!1!==i.columnVisibilityModel[e.field]).reduce((e,t)=>{var n,r;return e+(null!==(n=null!==(r=o[t.field])&&void 0!==r?r:t.computedWidth)&&void 0!==n?n:t.width)},0),n=e.current.getRootDimensions(),l=n.viewportInnerSize.width-t;if(l>0){const e=l/(r.length||1);r.forEach(t=>{t.width+=e,t.computedWidth+=e})}}e.current.updateColumns(r),r.forEach((t,o)=>{if(t.width!==s[o].width){const o=t.width;e.current.publishEvent("columnWidthChange",{element:e.current.getColumnHeaderElement(t.field),colDef:t,width:o})}})}finally{t.disableVirtualization||e.current.unstable_setColumnVirtualization(!0),M.current=!1}},[e,R,t.disableVirtualization]);r.useEffect(()=>w,[w]),(0,fl.A)(()=>{t.autosizeOnMount&&Promise.resolve().then(()=>{e.current.autosizeColumns(t.autosizeOptions)})}),ba(e,()=>{var t;return null===(t=e.current.columnHeadersContainerRef)||void 0===t?void 0:t.current},"touchstart",b,{passive:!0}),Nl(e,{autosizeColumns:P},"public"),Ht(e,"columnResizeStop",A),Ht(e,"columnResizeStart",y),Ht(e,"columnSeparatorMouseDown",x),Ht(e,"columnSeparatorDoubleClick",S),Ot(e,"columnResize",t.onColumnResize),Ot(e,"columnWidthChange",t.onColumnWidthChange)};function cc(e,t,o){e&&(e.style[t]="".concat(parseInt(e.style[t],10)+o,"px"))}function uc(e){return 0!==e.firstRowIndex||0!==e.lastRowIndex}const dc=(e,t,o)=>{var n;if(!e)return null;let r=e[t.field];const l=null!==(n=t.rowSpanValueGetter)&&void 0!==n?n:t.valueGetter;return l&&(r=l(r,e,t,o)),r},pc={spannedCells:{},hiddenCells:{},hiddenCellOriginMap:{}},fc={caches:pc,processedRange:{firstRowIndex:0,lastRowIndex:0}},gc=(e,t,o,r,l,i)=>{const a=e.current.virtualizer,s=i?fc:Vi.selectors.state(a.store.state),c=(0,n.A)({},s.caches.spannedCells),u=(0,n.A)({},s.caches.hiddenCells),d=(0,n.A)({},s.caches.hiddenCellOriginMap),p={firstRowIndex:Math.min(s.processedRange.firstRowIndex,l.firstRowIndex),lastRowIndex:Math.max(s.processedRange.lastRowIndex,l.lastRowIndex)};return t.forEach((t,n)=>{for(let a=l.firstRowIndex;a<l.lastRowIndex;a+=1){var i;const s=o[a];if(null!==(i=u[s.id])&&void 0!==i&&i[n])continue;const p=dc(s.model,t,e);if(null==p)continue;let f=s.id,g=a,h=0;const m=[];if(a===l.firstRowIndex){let l=a-1,i=o[l];for(;l>=r.firstRowIndex&&i&&dc(i.model,t,e)===p;){const e=o[l+1];u[e.id]?u[e.id][n]=!0:u[e.id]={[n]:!0},m.push(a),h+=1,f=i.id,g=l,l-=1,i=o[l]}}m.forEach(e=>{d[e]?d[e][n]=g:d[e]={[n]:g}});let v=a+1;for(;v<=r.lastRowIndex&&o[v]&&dc(o[v].model,t,e)===p;){const e=o[v];u[e.id]?u[e.id][n]=!0:u[e.id]={[n]:!0},d[v]?d[v][n]=g:d[v]={[n]:g},v+=1,h+=1}h>0&&(c[f]?c[f][n]=h+1:c[f]={[n]:h+1})}}),{caches:{spannedCells:c,hiddenCells:u,hiddenCellOriginMap:d},processedRange:p}},hc=(e,t,o)=>{var r;if(!t.rowSpanning)return(0,n.A)({},e,{rowSpanning:fc});const l=e.rows.dataRowIds||[],i=e.columns.orderedFields||[],a=e.rows.dataRowIdToModelLookup,s=e.columns.lookup,c=Boolean(e.filter.filterModel.items.length)||Boolean(null===(r=e.filter.filterModel.quickFilterValues)||void 0===r?void 0:r.length);if(!l.length||!i.length||!a||!s||c)return(0,n.A)({},e,{rowSpanning:fc});const u=((e,t)=>{const o=xt(t).length;if(e.pagination){const e=Zi(t);let n=20;return e>0&&(n=e-1),{firstRowIndex:0,lastRowIndex:Math.min(n,o)}}return{firstRowIndex:0,lastRowIndex:Math.min(20,o)}})(t,o),d=l.map(e=>({id:e,model:a[e]})),p=i.map(e=>s[e]),f=gc(o,p,d,u,u,!0);return(0,n.A)({},e,{rowSpanning:f})};new Set;const mc=(e,t,o)=>(0,n.A)({},e,{listViewColumn:t.listViewColumn?(0,n.A)({},t.listViewColumn,{computedWidth:vc(o)}):void 0});function vc(e){return tt(e).viewportInnerSize.width}var bc=o(2517);const wc=ge(Cr,vr,Xi,(e,t,o)=>({groupKeys:[],paginationModel:o,sortModel:t,filterModel:e,start:o.page*o.pageSize,end:o.page*o.pageSize+o.pageSize-1}));let Cc=function(e){return e.Default="set-new-rows",e.LazyLoading="replace-row-range",e}({});class yc{constructor(e){(0,Q.A)(this,"getCacheKeys",e=>{if(this.chunkSize<1||"number"!==typeof e.start)return[e];const t=[];for(let o=e.start;o<=e.end;o+=this.chunkSize){const r=Math.min(o+this.chunkSize-1,e.end);t.push((0,n.A)({},e,{start:o,end:r}))}return t}),(0,Q.A)(this,"splitResponse",(e,t)=>{const o=this.getCacheKeys(e);if(1===o.length)return new Map([[e,t]]);const r=new Map;return o.forEach(o=>{var l,i,a,s;const c=o.end===e.end,u=(0,n.A)({},t,{pageInfo:(0,n.A)({},t.pageInfo,{hasNextPage:void 0!==(null===(l=t.pageInfo)||void 0===l?void 0:l.hasNextPage)&&!c||(null===(i=t.pageInfo)||void 0===i?void 0:i.hasNextPage),nextCursor:void 0===(null===(a=t.pageInfo)||void 0===a?void 0:a.nextCursor)||c?null===(s=t.pageInfo)||void 0===s?void 0:s.nextCursor:t.rows[o.end+1].id}),rows:"number"!==typeof o.start||"number"!==typeof e.start?t.rows:t.rows.slice(o.start-e.start,o.end-e.start+1)});r.set(o,u)}),r}),this.chunkSize=e}}function Ac(e){return JSON.stringify([e.filterModel,e.sortModel,e.start,e.end])}(0,Q.A)(yc,"mergeResponses",e=>1===e.length?e[0]:e.reduce((e,t)=>({rows:[...e.rows,...t.rows],rowCount:t.rowCount,pageInfo:t.pageInfo}),{rows:[],rowCount:0,pageInfo:{}}));class xc{constructor(e){let{ttl:t=3e5,getKey:o=Ac}=e;this.cache={},this.ttl=t,this.getKey=o}set(e,t){const o=this.getKey(e),n=Date.now()+this.ttl;this.cache[o]={value:t,expiry:n}}get(e){const t=this.getKey(e),o=this.cache[t];if(o){if(!(Date.now()>o.expiry))return o.value;delete this.cache[t]}}clear(){this.cache={}}}class Sc extends Error{constructor(e){super(e.message),this.name="GridGetRowsError",this.params=e.params,this.cause=e.cause}}class Rc extends Error{constructor(e){super(e.message),this.name="GridUpdateRowError",this.params=e.params,this.cause=e.cause}}const Mc=["skipCache"],Ic={clear:()=>{},get:()=>{},set:()=>{}};function Pc(e){return null===e?Ic:null!==e&&void 0!==e?e:new xc(arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}const kc=(e,t)=>{const{api:o,strategyProcessor:l,events:i,setStrategyAvailability:a}=function(e,t){var o,l;let i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const a=r.useCallback(()=>{e.current.setStrategyAvailability(ql.DataSource,Cc.Default,t.dataSource?()=>!0:()=>!1)},[e,t.dataSource]),[c,u]=r.useState(!1),d=D(e,Xi),p=r.useRef(0),f=t.onDataSourceError,g=(0,I.A)(()=>{if(!t.pagination)return new yc(d.pageSize);const e=t.pageSizeOptions.map(e=>"number"===typeof e?e:e.value).sort((e,t)=>e-t),o=Math.min(d.pageSize,e[0]);return new yc(o)}).current,[h,m]=r.useState(()=>Pc(t.dataSourceCache,i.cacheOptions)),v=r.useCallback(async(o,r)=>{var l,a;const u=null===(l=t.dataSource)||void 0===l?void 0:l.getRows;if(!u)return;var d;if(o&&o!==Bo&&"DataGrid"!==t.signature)return void(null===(d=i.fetchRowChildren)||void 0===d||d.call(i,[o]));null===(a=i.clearDataSourceState)||void 0===a||a.call(i);const m=r||{},{skipCache:v}=m,b=(0,s.A)(m,Mc),w=(0,n.A)({},wc(e),e.current.unstable_applyPipeProcessors("getRowsParams",{}),b),C=g.getCacheKeys(w).map(e=>h.get(e));if(!v&&C.every(e=>void 0!==e))return void e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:yc.mergeResponses(C),fetchParams:w});(c||0===e.current.getRowsCount())&&e.current.setLoading(!0);const y=p.current+1;p.current=y;try{const t=await u(w);g.splitResponse(w,t).forEach((e,t)=>h.set(t,e)),p.current===y&&e.current.applyStrategyProcessor("dataSourceRowsUpdate",{response:t,fetchParams:w})}catch(A){p.current===y&&(e.current.applyStrategyProcessor("dataSourceRowsUpdate",{error:A,fetchParams:w}),"function"===typeof f&&f(new Sc({message:null===A||void 0===A?void 0:A.message,params:w,cause:A})))}finally{c&&p.current===y&&e.current.setLoading(!1)}},[g,h,e,c,null===(o=t.dataSource)||void 0===o?void 0:o.getRows,f,i,t.signature]),b=r.useCallback(()=>{u(e.current.getActiveStrategy(ql.DataSource)===Cc.Default)},[e]),w=r.useCallback(t=>{if("error"in t)return void e.current.setRows([]);const{response:o}=t;void 0!==o.rowCount&&e.current.setRowCount(o.rowCount),e.current.setRows(o.rows),e.current.unstable_applyPipeProcessors("processDataSourceRows",{params:t.fetchParams,response:o},!0)},[e]),C=null===(l=t.dataSource)||void 0===l?void 0:l.updateRow,y=i.handleEditRow,A=r.useCallback(async t=>{if(C)try{const o=await C(t);return"function"===typeof y?(y(t,o),o):(e.current.updateNestedRows([o],[]),o&&!ii(o,t.previousRow)&&e.current.dataSource.cache.clear(),o)}catch(o){throw"function"===typeof f&&f(new Rc({message:null===o||void 0===o?void 0:o.message,params:t,cause:o})),o}},[e,C,f,y]),x={dataSource:{fetchRows:v,cache:h,editRow:A}},S=r.useMemo(()=>(0,bc.A)(v,0),[v]),R=r.useRef(!0);return r.useEffect(()=>{if(R.current)return void(R.current=!1);if(void 0===t.dataSourceCache)return;const e=Pc(t.dataSourceCache,i.cacheOptions);m(t=>t!==e?e:t)},[t.dataSourceCache,i.cacheOptions]),r.useEffect(()=>(t.dataSource&&(e.current.dataSource.cache.clear(),e.current.dataSource.fetchRows()),()=>{p.current+=1}),[e,t.dataSource]),{api:{public:x},debouncedFetchRows:S,strategyProcessor:{strategyName:Cc.Default,group:"dataSourceRowsUpdate",processor:w},setStrategyAvailability:a,cacheChunkManager:g,cache:h,events:{strategyAvailabilityChange:b,sortModelChange:io(c,()=>S()),filterModelChange:io(c,()=>S()),paginationModelChange:io(c,()=>S())}}}(e,t);Nl(e,o.public,"public"),Ya(e,l.strategyName,l.group,l.processor),Object.entries(i).forEach(t=>{let[o,n]=t;Ht(e,o,n)}),r.useEffect(()=>{a()},[a])},Ec=(e,t,o)=>{Ql(e,t),Os(e,t),(e=>{Ya(e,_l,"rowTreeCreation",Es)})(e),ma(Yl,e,t),ma(Ds,e,t),ma(Oa,e,t),ma(ks,e,t),ma(gs,e,t),ma(Is,e,t),ma(es,e,t),ma(zs,e,t),ma(ms,e,t),ma(Qa,e,t),ma(hc,e,t),ma(La,e,t),ma(ic,e,t),ma(Ta,e,t),ma($s,e,t),ma(Js,e,t),ma(Bs,e,t),ma(Us,e,t),ma(mc,e,t),ha(e,t),fs(e,t),((e,t)=>{var o,l,i,a,s,c,u,d,p,f;const g=va(e,"useGridSelection"),h=r.useCallback(e=>function(){t.rowSelection&&e(...arguments)},[t.rowSelection]),m=D(e,At)>1,v=t.signature!==Rl.DataGrid&&((null===(o=t.rowSelectionPropagation)||void 0===o?void 0:o.parents)||(null===(l=t.rowSelectionPropagation)||void 0===l?void 0:l.descendants))&&m,b=r.useMemo(()=>t.rowSelectionModel,[t.rowSelectionModel]),w=r.useRef(null);e.current.registerControlState({stateId:"rowSelection",propModel:b,propOnChange:t.onRowSelectionModelChange,stateSelector:kl,changeEvent:"rowSelectionChange"});const{checkboxSelection:y,disableRowSelectionOnClick:A,isRowSelectable:x}=t,S=Ol(t),R=D(e,vt),M=r.useCallback(t=>{var o;let n=t;const r=null!==(o=w.current)&&void 0!==o?o:t,l=e.current.isRowSelected(t);if(l){const t=Rr(e),o=t.findIndex(e=>e===r),l=t.findIndex(e=>e===n);if(o===l)return;n=o>l?t[l+1]:t[l-1]}w.current=t,e.current.selectRowRange({startId:r,endId:n},!l)},[e]),I=(0,It.A)(()=>t.pagination&&t.checkboxSelectionVisibleOnly&&"client"===t.paginationMode?oa(e):Rr(e)),P=r.useCallback((o,r)=>{if(t.signature===Rl.DataGrid&&!S&&("include"!==o.type||o.ids.size>1))throw new Error(["MUI X: `rowSelectionModel` can only contain 1 item in DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock multiple selection."].join("\n"));kl(e)!==o&&(g.debug("Setting selection model"),e.current.setState(e=>(0,n.A)({},e,{rowSelection:t.rowSelection?o:Hs}),r))},[e,g,t.rowSelection,t.signature,S]),k=r.useCallback(t=>El(e).has(t),[e]),E=r.useCallback(o=>{if(!1===t.rowSelection)return!1;if(x&&!x(e.current.getRowParams(o)))return!1;const n=bt(e,o);return"footer"!==(null===n||void 0===n?void 0:n.type)&&"pinnedRow"!==(null===n||void 0===n?void 0:n.type)},[e,t.rowSelection,x]),F=r.useCallback(()=>Tl(e),[e]),T=r.useCallback(function(o){let n=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],r=arguments.length>2&&void 0!==arguments[2]&&arguments[2];if(e.current.isRowSelectable(o))if(w.current=o,r){g.debug("Setting selection for row ".concat(o));const r={type:"include",ids:new Set},c=e=>{r.ids.add(e)};var l,i,a,s;n&&(c(o),v&&zl(e,R,o,null!==(l=null===(i=t.rowSelectionPropagation)||void 0===i?void 0:i.descendants)&&void 0!==l&&l,null!==(a=null===(s=t.rowSelectionPropagation)||void 0===s?void 0:s.parents)&&void 0!==a&&a,c)),e.current.setRowSelectionModel(r,"singleRowSelection")}else{g.debug("Toggling selection for row ".concat(o));const r=kl(e),l={type:r.type,ids:new Set(r.ids)},i=Pl(l);i.unselect(o);const a=e=>{i.select(e)},s=e=>{i.unselect(e)};var c,u,d,p;if(n)a(o),v&&zl(e,R,o,null!==(c=null===(u=t.rowSelectionPropagation)||void 0===u?void 0:u.descendants)&&void 0!==c&&c,null!==(d=null===(p=t.rowSelectionPropagation)||void 0===p?void 0:p.parents)&&void 0!==d&&d,a);else if(v){var f,h,m,b;Ll(e,R,o,null!==(f=null===(h=t.rowSelectionPropagation)||void 0===h?void 0:h.descendants)&&void 0!==f&&f,null!==(m=null===(b=t.rowSelectionPropagation)||void 0===b?void 0:b.parents)&&void 0!==m&&m,s)}("include"===l.type&&l.ids.size<2||S)&&e.current.setRowSelectionModel(l,"singleRowSelection")}},[e,g,v,R,null===(i=t.rowSelectionPropagation)||void 0===i?void 0:i.descendants,null===(a=t.rowSelectionPropagation)||void 0===a?void 0:a.parents,S]),H=r.useCallback(function(o){let n=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],r=arguments.length>2&&void 0!==arguments[2]&&arguments[2];if(g.debug("Setting selection for several rows"),!1===t.rowSelection)return;const l=new Set;for(let t=0;t<o.length;t+=1){const n=o[t];e.current.isRowSelectable(n)&&l.add(n)}const i=kl(e);let a;if(r){if(a={type:"include",ids:l},n){const o=Pl(a);if(v){const n=e=>{o.select(e)};for(const o of l){var s,c,u,d;zl(e,R,o,null!==(s=null===(c=t.rowSelectionPropagation)||void 0===c?void 0:c.descendants)&&void 0!==s&&s,null!==(u=null===(d=t.rowSelectionPropagation)||void 0===d?void 0:d.parents)&&void 0!==u&&u,n)}}}else a.ids=new Set;if(i.type===a.type&&a.ids.size===i.ids.size&&Array.from(a.ids).every(e=>i.ids.has(e)))return}else{a={type:i.type,ids:new Set(i.ids)};const o=Pl(a),r=e=>{o.select(e)},s=e=>{o.unselect(e)};for(const i of l){var p,f,h,m,b,w,C,y;n?(o.select(i),v&&zl(e,R,i,null!==(p=null===(f=t.rowSelectionPropagation)||void 0===f?void 0:f.descendants)&&void 0!==p&&p,null!==(h=null===(m=t.rowSelectionPropagation)||void 0===m?void 0:m.parents)&&void 0!==h&&h,r)):(s(i),v&&Ll(e,R,i,null!==(b=null===(w=t.rowSelectionPropagation)||void 0===w?void 0:w.descendants)&&void 0!==b&&b,null!==(C=null===(y=t.rowSelectionPropagation)||void 0===y?void 0:y.parents)&&void 0!==C&&C,s))}}("include"===a.type&&a.ids.size<2||S)&&e.current.setRowSelectionModel(a,"multipleRowsSelection")},[g,v,S,e,R,null===(s=t.rowSelectionPropagation)||void 0===s?void 0:s.descendants,null===(c=t.rowSelectionPropagation)||void 0===c?void 0:c.parents,t.rowSelection]),O=r.useCallback(o=>{if(!m||!v||0===o.ids.size&&"include"===o.type)return o;const n={type:o.type,ids:new Set(o.ids)},r=Pl(n),l=e=>{r.select(e)};for(const u of o.ids){var i,a,s,c;zl(e,R,u,null!==(i=null===(a=t.rowSelectionPropagation)||void 0===a?void 0:a.descendants)&&void 0!==i&&i,null!==(s=null===(c=t.rowSelectionPropagation)||void 0===c?void 0:c.parents)&&void 0!==s&&s,l,r)}return n},[e,R,null===(u=t.rowSelectionPropagation)||void 0===u?void 0:u.descendants,null===(d=t.rowSelectionPropagation)||void 0===d?void 0:d.parents,m,v]),z={selectRows:H,selectRowRange:r.useCallback(function(t){let{startId:o,endId:n}=t,r=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],l=arguments.length>2&&void 0!==arguments[2]&&arguments[2];if(!e.current.getRow(o)||!e.current.getRow(n))return;g.debug("Expanding selection from row ".concat(o," to row ").concat(n));const i=Rr(e),a=i.indexOf(o),s=i.indexOf(n),[c,u]=a>s?[s,a]:[a,s],d=i.slice(c,u+1);e.current.selectRows(d,r,l)},[e,g]),getPropagatedRowSelectionModel:O};Nl(e,{selectRow:T,setRowSelectionModel:P,getSelectedRows:F,isRowSelected:k,isRowSelectable:E},"public"),Nl(e,z,t.signature===Rl.DataGrid?"private":"public");const L=r.useRef(!0),j=r.useCallback(function(){var o;let n=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(L.current)return;const r=kl(e),l=mt(e),i=vt(e),a=xr(e),s=e=>"server"===t.filterMode?!l[e]:!i[e]||!1===a[e],c={type:r.type,ids:new Set(r.ids)},u=Pl(c);let d=!1;for(const e of r.ids){var p;if(s(e)){if(t.keepNonExistentRowsSelected)continue;u.unselect(e),d=!0;continue}if(null===(p=t.rowSelectionPropagation)||void 0===p||!p.parents)continue;const o=R[e];if("group"===(null===o||void 0===o?void 0:o.type)){if(o.isAutoGenerated){u.unselect(e),d=!0;continue}o.children.every(e=>!1===a[e])||(u.unselect(e),d=!0)}}const f=m&&(null===(o=t.rowSelectionPropagation)||void 0===o?void 0:o.parents)&&(c.ids.size>0||"exclude"===c.type);if(d||f&&!n)if(f)if("exclude"===c.type){const o=I(),n=[];for(let e=0;e<o.length;e+=1){const r=o[e];!t.keepNonExistentRowsSelected&&s(r)||!u.has(r)||n.push(r)}e.current.selectRows(n,!0,!0)}else e.current.selectRows(Array.from(c.ids),!0,!0);else e.current.setRowSelectionModel(c,"multipleRowsSelection")},[e,m,null===(p=t.rowSelectionPropagation)||void 0===p?void 0:p.parents,t.keepNonExistentRowsSelected,t.filterMode,R,I]),N=r.useCallback((t,o)=>{const n=o.metaKey||o.ctrlKey,r=!y&&!n&&!(e=>!!e.key)(o),l=!S||r,i=e.current.isRowSelected(t),a=Fl(e)>1&&l||!i;e.current.selectRow(t,a,l)},[e,S,y]),B=r.useCallback((t,o)=>{var n;if(A)return;const r=null===(n=o.target.closest(".".concat(C.cell)))||void 0===n?void 0:n.getAttribute("data-field");if(r!==Ra.field&&r!==rn){if(r){const t=e.current.getColumn(r);if((null===t||void 0===t?void 0:t.type)===Wn)return}"pinnedRow"!==bt(e,t.id).type&&(o.shiftKey&&S?M(t.id):N(t.id,o))}},[A,S,e,M,N]),V=r.useCallback((e,t)=>{var o;S&&t.shiftKey&&(null===(o=window.getSelection())||void 0===o||o.removeAllRanges())},[S]),G=r.useCallback((t,o)=>{S&&o.nativeEvent.shiftKey?M(t.id):e.current.selectRow(t.id,t.value,!S)},[e,M,S]),W=r.useCallback(o=>{var n;const r=Cr(e),l=yr(e),i=r.items.length>0||(null===l||void 0===l?void 0:l.some(e=>e.length));t.isRowSelectable||t.checkboxSelectionVisibleOnly||m&&(null===(n=t.rowSelectionPropagation)||void 0===n||!n.descendants)||i||t.disableRowSelectionExcludeModel?e.current.selectRows(I(),o):e.current.setRowSelectionModel({type:o?"exclude":"include",ids:new Set},"multipleRowsSelection")},[e,I,t.checkboxSelectionVisibleOnly,t.isRowSelectable,null===(f=t.rowSelectionPropagation)||void 0===f?void 0:f.descendants,t.disableRowSelectionExcludeModel,m]),U=r.useCallback(e=>{W(e.value)},[W]),K=r.useCallback((t,o)=>{if(e.current.getCellMode(t.id,t.field)!==wn.Edit&&!rs(o)){if(On(o.key)&&o.shiftKey){const n=Gr(e);if(n&&n.id!==t.id){o.preventDefault();const r=e.current.isRowSelected(n.id);if(!S)return void e.current.selectRow(n.id,!r,!0);const l=e.current.getRowIndexRelativeToVisibleRows(n.id),i=e.current.getRowIndexRelativeToVisibleRows(t.id);let a,s;l>i?r?(a=i,s=l-1):(a=i,s=l):r?(a=l+1,s=i):(a=l,s=i);const c=ra(e),u=[];for(let e=a;e<=s;e+=1)u.push(c.rows[e].id);return void e.current.selectRows(u,!r)}}if(" "===o.key&&o.shiftKey)return o.preventDefault(),void N(t.id,o);"A"===String.fromCharCode(o.keyCode)&&(o.ctrlKey||o.metaKey)&&(o.preventDefault(),W(!0))}},[e,S,N,W]),q=(0,It.A)(()=>{if(!t.rowSelection)return void e.current.setRowSelectionModel(Hs);if(void 0===b)return;if(!v||!m||"include"===b.type&&0===b.ids.size)return void e.current.setRowSelectionModel(b);const o=e.current.getPropagatedRowSelectionModel(b);o.type===b.type&&o.ids.size===b.ids.size&&Array.from(b.ids).every(e=>o.ids.has(e))?e.current.setRowSelectionModel(b):e.current.setRowSelectionModel(o)});Ht(e,"sortedRowsSet",h(()=>j(!0))),Ht(e,"filteredRowsSet",h(()=>j())),Ht(e,"rowClick",h(B)),Ht(e,"rowSelectionCheckboxChange",h(G)),Ht(e,"headerSelectionCheckboxChange",U),Ht(e,"cellMouseDown",h(V)),Ht(e,"cellKeyDown",h(K)),r.useEffect(()=>{q()},[e,b,t.rowSelection,q]);const _=null!=b;r.useEffect(()=>{if(_||!t.rowSelection||"function"!==typeof E)return;const o=kl(e);if("include"!==o.type)return;const n=new Set;for(const e of o.ids)E(e)&&n.add(e);n.size<o.ids.size&&e.current.setRowSelectionModel({type:o.type,ids:n})},[e,E,_,t.rowSelection]),r.useEffect(()=>{if(!t.rowSelection||_)return;const o=kl(e);!S&&("include"===o.type&&o.ids.size>1||"exclude"===o.type)&&e.current.setRowSelectionModel(Hs)},[e,S,y,_,t.rowSelection]),r.useEffect(()=>{h(j)},[j,h]),r.useEffect(()=>{L.current&&(L.current=!1)},[])})(e,t),za(e,t),((e,t,o)=>{const l=va(e,"useGridRows"),i=r.useRef(Date.now()),a=r.useRef(t.rowCount),s=(0,Lt.A)(),{setRowIndex:c}=o.hooks.useGridRowsOverridableMethods(e,t),u=r.useCallback(t=>{const o=mt(e)[t];if(o)return o;const n=bt(e,t);return n&&_o(n)?{[Vo]:t}:null},[e]),d=r.useCallback(t=>Jo(e,t),[e]),p=r.useCallback(o=>{let{cache:r,throttle:l}=o;const a=()=>{i.current=Date.now(),e.current.setState(o=>(0,n.A)({},o,{rows:Ko({apiRef:e,rowCountProp:t.rowCount,loadingProp:t.loading,previousTree:vt(e),previousTreeDepths:yt(e),previousGroupsToFetch:wt(e)})})),e.current.publishEvent("rowsSet")};if(s.clear(),e.current.caches.rows=r,!l)return void a();const c=t.throttleRowsMs-(Date.now()-i.current);c>0?s.start(c,a):a()},[t.throttleRowsMs,t.rowCount,t.loading,e,s]),f=r.useCallback(o=>{if(l.debug("Updating all rows, new length ".concat(o.length)),jr(e))return void e.current.updateNonPivotRows(o,!1);const n=Wo({rows:o,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),r=e.current.caches.rows;n.rowsBeforePartialUpdates=r.rowsBeforePartialUpdates,p({cache:n,throttle:!0})},[l,t.getRowId,t.loading,t.rowCount,p,e]),g=r.useCallback(o=>{if(t.signature===Rl.DataGrid&&o.length>1)throw new Error(["MUI X: You cannot update several rows at once in `apiRef.current.updateRows` on the DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock this feature."].join("\n"));if(jr(e))return void e.current.updateNonPivotRows(o);const n=$o(e,o,t.getRowId),r=Yo({updates:n,getRowId:t.getRowId,previousCache:e.current.caches.rows});p({cache:r,throttle:!0})},[t.signature,t.getRowId,p,e]),h=r.useCallback((o,n)=>{const r=$o(e,o,t.getRowId),l=Yo({updates:r,getRowId:t.getRowId,previousCache:e.current.caches.rows,groupKeys:null!==n&&void 0!==n?n:[]});p({cache:l,throttle:!1})},[t.getRowId,p,e]),m=r.useCallback(t=>{l.debug("Setting loading to ".concat(t)),e.current.setState(e=>(0,n.A)({},e,{rows:(0,n.A)({},e.rows,{loading:t})})),e.current.caches.rows.loadingPropBeforePartialUpdates=t},[e,l]),v=r.useCallback(()=>{const t=xt(e),o=mt(e);return new Map(t.map(e=>{var t;return[e,null!==(t=o[e])&&void 0!==t?t:{}]}))},[e]),b=r.useCallback(()=>ft(e),[e]),w=r.useCallback(()=>xt(e),[e]),C=r.useCallback(t=>{const{rowIdToIndexMap:o}=ra(e);return o.get(t)},[e]),y=r.useCallback((t,o)=>{const r=bt(e,t);if(!r)throw new Error("MUI X: No row with id #".concat(t," found."));if("group"!==r.type)throw new Error("MUI X: Only group nodes can be expanded or collapsed.");const l=(0,n.A)({},r,{childrenExpanded:o});e.current.setState(e=>(0,n.A)({},e,{rows:(0,n.A)({},e.rows,{tree:(0,n.A)({},e.rows.tree,{[t]:l})})})),e.current.publishEvent("rowExpansionChange",l)},[e]),A=r.useCallback(t=>{var o;return null!==(o=bt(e,t))&&void 0!==o?o:null},[e]),x=r.useCallback(t=>{let{skipAutoGeneratedRows:o=!0,groupId:n,applySorting:r,applyFiltering:l,directChildrenOnly:i=!1}=t;const a=vt(e);let s;if(r){const t=a[n];if(!t)return[];const r=hr(e);s=[];for(let e=r.findIndex(e=>e===n)+1;e<r.length&&(i?a[r[e]].depth===t.depth+1:a[r[e]].depth>t.depth);e+=1){const t=r[e];o&&_o(a[t])||s.push(t)}}else s=Xo(a,n,o,i);if(l){const t=xr(e);s=fr(t)?s:s.filter(e=>!1!==t[e])}return s},[e]),S={getRow:u,setLoading:m,getRowId:d,getRowModels:v,getRowsCount:b,getAllRowIds:w,setRows:f,updateRows:g,getRowNode:A,getRowIndexRelativeToVisibleRows:C,unstable_replaceRows:r.useCallback((o,r)=>{if(t.signature===Rl.DataGrid&&r.length>1)throw new Error(["MUI X: You cannot replace rows using `apiRef.current.unstable_replaceRows` on the DataGrid.","You need to upgrade to DataGridPro or DataGridPremium component to unlock this feature."].join("\n"));if(0===r.length)return;if(At(e)>1)throw new Error("`apiRef.current.unstable_replaceRows` is not compatible with tree data and row grouping");const l=(0,n.A)({},vt(e)),i=(0,n.A)({},mt(e)),a=l[Bo],s=[...a.children],c=new Set;for(let e=0;e<r.length;e+=1){const n=r[e],a=Go(n,t.getRowId,"A row was provided without id when calling replaceRows()."),[u]=s.splice(o+e,1,a);c.has(u)||(delete i[u],delete l[u]);const d={id:a,depth:0,parent:Bo,type:"leaf",groupingKey:null};i[a]=n,l[a]=d,c.add(a)}l[Bo]=(0,n.A)({},a,{children:s});const u=s.filter(e=>{var t;return"leaf"===(null===(t=l[e])||void 0===t?void 0:t.type)});e.current.caches.rows.dataRowIdToModelLookup=i,e.current.setState(e=>(0,n.A)({},e,{rows:(0,n.A)({},e.rows,{loading:t.loading,totalRowCount:Math.max(t.rowCount||0,s.length),dataRowIdToModelLookup:i,dataRowIds:u,tree:l})})),e.current.publishEvent("rowsSet")},[e,t.signature,t.getRowId,t.loading,t.rowCount])},R={setRowIndex:c,setRowChildrenExpansion:y,getRowGroupChildren:x},M={updateNestedRows:h},P=r.useCallback(()=>{let o;l.info("Row grouping pre-processing have changed, regenerating the row tree"),o=e.current.caches.rows.rowsBeforePartialUpdates===t.rows?(0,n.A)({},e.current.caches.rows,{updates:{type:"full",rows:xt(e)}}):Wo({rows:t.rows,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),p({cache:o,throttle:!1})},[l,e,t.rows,t.getRowId,t.loading,t.rowCount,p]),k=(0,I.A)(()=>t.dataSource),E=r.useCallback(e=>{t.dataSource&&t.dataSource!==k.current?k.current=t.dataSource:"rowTreeCreation"===e&&P()},[P,k,t.dataSource]),F=r.useCallback(()=>{e.current.getActiveStrategy(ql.RowTree)!==Ct(e)&&P()},[e,P]);Ht(e,"activeStrategyProcessorChange",E),Ht(e,"strategyAvailabilityChange",F);const T=r.useCallback(()=>{e.current.setState(o=>{const r=e.current.unstable_applyPipeProcessors("hydrateRows",{tree:vt(e),treeDepths:yt(e),dataRowIds:xt(e),dataRowIdToModelLookup:mt(e)});return(0,n.A)({},o,{rows:(0,n.A)({},o.rows,r,{totalTopLevelRowCount:Uo({tree:r.tree,rowCountProp:t.rowCount})})})}),e.current.publishEvent("rowsSet")},[e,t.rowCount]);Da(e,"hydrateRows",T),Nl(e,S,"public"),Nl(e,R,t.signature===Rl.DataGrid?"private":"public"),Nl(e,M,"private");const H=r.useRef(!0);r.useEffect(()=>{if(H.current)return void(H.current=!1);let o=!1;t.rowCount!==a.current&&(o=!0,a.current=t.rowCount);const r=t.dataSource?St(e):t.rows,i=e.current.caches.rows.rowsBeforePartialUpdates===r,s=e.current.caches.rows.loadingPropBeforePartialUpdates===t.loading,c=e.current.caches.rows.rowCountPropBeforePartialUpdates===t.rowCount;i&&(s||(e.current.setState(e=>(0,n.A)({},e,{rows:(0,n.A)({},e.rows,{loading:t.loading})})),e.current.caches.rows.loadingPropBeforePartialUpdates=t.loading),c||(e.current.setState(e=>(0,n.A)({},e,{rows:(0,n.A)({},e.rows,{totalRowCount:Math.max(t.rowCount||0,e.rows.totalRowCount),totalTopLevelRowCount:Math.max(t.rowCount||0,e.rows.totalTopLevelRowCount)})})),e.current.caches.rows.rowCountPropBeforePartialUpdates=t.rowCount),!o)||(l.debug("Updating all rows, new length ".concat(null===r||void 0===r?void 0:r.length)),p({cache:Wo({rows:r,getRowId:t.getRowId,loading:t.loading,rowCount:t.rowCount}),throttle:!1}))},[t.rows,t.rowCount,t.getRowId,t.loading,t.dataSource,l,p,e])})(e,t,o),((e,t)=>{const o=e.current.virtualizer.store,n=r.useCallback(function(t){let n=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const{range:r,rows:l}=ra(e);if(null===r||!uc(t))return;const i=n?fc:Vi.selectors.state(o.state),a=(s={firstRowIndex:t.firstRowIndex,lastRowIndex:Math.min(t.lastRowIndex,r.lastRowIndex-r.firstRowIndex+1)},c=i.processedRange,s.firstRowIndex>=c.firstRowIndex&&s.lastRowIndex<=c.lastRowIndex?null:s.firstRowIndex>=c.firstRowIndex&&s.lastRowIndex>c.lastRowIndex?{firstRowIndex:c.lastRowIndex,lastRowIndex:s.lastRowIndex}:s.firstRowIndex<c.firstRowIndex&&s.lastRowIndex<=c.lastRowIndex?{firstRowIndex:s.firstRowIndex,lastRowIndex:c.firstRowIndex-1}:s);var s,c;if(null===a)return;const u=Oe(e),d=gc(e,u,l,r,a,n),p=Object.keys(d.caches.spannedCells).length,f=Object.keys(d.caches.hiddenCells).length,g=Object.keys(i.caches.spannedCells).length,h=Object.keys(i.caches.hiddenCells).length;(n||p!==g||f!==h)&&(0!==p||0!==g)&&o.set("rowSpanning",d)},[e,o]),l=r.useCallback(()=>{const t=sa(e);uc(t)&&n(t,!0)},[e,n]);Ht(e,"renderedRowsIntervalChange",io(t.rowSpanning,n)),Ht(e,"sortedRowsSet",io(t.rowSpanning,l)),Ht(e,"paginationModelChange",io(t.rowSpanning,l)),Ht(e,"filteredRowsSet",io(t.rowSpanning,l)),Ht(e,"columnsChange",io(t.rowSpanning,l)),r.useEffect(()=>{t.rowSpanning?o.state.rowSpanning.caches===pc&&l():o.state.rowSpanning!==fc&&o.set("rowSpanning",fc)},[e,o,l,t.rowSpanning])})(e,t),Ts(e,t),(e=>{const t=e.current.virtualizer,o=t.api.resetColSpan,n=t.api.getCellColSpanInfo,r={resetColSpan:o,calculateColSpan:t.api.calculateColSpan};Nl(e,{unstable_getCellColSpanInfo:n},"public"),Nl(e,r,"private"),Ht(e,"columnOrderChange",o)})(e),((e,t)=>{const o=r.useCallback(t=>{var o;return null!==(o=Qn(e)[t])&&void 0!==o?o:[]},[e]),l=r.useCallback(()=>$n(e),[e]);Nl(e,{getColumnGroupPath:o,getAllGroupDetails:l},"public");const i=r.useCallback(()=>{var o;const r=_s(null!==(o=t.columnGroupingModel)&&void 0!==o?o:[]);e.current.setState(e=>{var t,o,l;const i=null!==(t=null===(o=e.columns)||void 0===o?void 0:o.orderedFields)&&void 0!==t?t:[],a=null!==(l=e.pinnedColumns)&&void 0!==l?l:{},s=Xs(i,r,a);return(0,n.A)({},e,{columnGrouping:(0,n.A)({},e.columnGrouping,{headerStructure:s})})})},[e,t.columnGroupingModel]),a=r.useCallback(t=>{var o,r,l;e.current.caches.columnGrouping.lastColumnGroupingModel=t;const i=null!==(o=null===(r=(l=e.current).getPinnedColumns)||void 0===r?void 0:r.call(l))&&void 0!==o?o:{},a=Ee(e),s=ze(e),c=Qs(null!==t&&void 0!==t?t:[]),u=_s(null!==t&&void 0!==t?t:[]),d=Xs(a,u,i),p=0===s.length?0:Math.max(...s.map(e=>{var t,o;return null!==(t=null===(o=u[e])||void 0===o?void 0:o.length)&&void 0!==t?t:0}));e.current.setState(e=>(0,n.A)({},e,{columnGrouping:{lookup:c,unwrappedGroupingModel:u,headerStructure:d,maxDepth:p}}))},[e]);Ht(e,"columnIndexChange",i),Ht(e,"columnsChange",()=>{a(t.columnGroupingModel)}),Ht(e,"columnVisibilityModelChange",()=>{a(t.columnGroupingModel)}),r.useEffect(()=>{t.columnGroupingModel!==e.current.caches.columnGrouping.lastColumnGroupingModel&&a(t.columnGroupingModel)},[e,a,t.columnGroupingModel])})(e,t),Ps(e,t),((e,t)=>{const o=va(e,"useGridFocus"),l=r.useRef(null),i=null!==e.current.rootElementRef.current,a=r.useCallback((t,o)=>{t&&e.current.getRow(t.id)&&e.current.publishEvent("cellFocusOut",e.current.getCellParams(t.id,t.field),o)},[e]),s=r.useCallback((t,r)=>{const l=Gr(e);(null===l||void 0===l?void 0:l.id)===t&&(null===l||void 0===l?void 0:l.field)===r||(e.current.setState(e=>(o.debug("Focusing on cell with id=".concat(t," and field=").concat(r)),(0,n.A)({},e,{tabIndex:{cell:{id:t,field:r},columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null},focus:{cell:{id:t,field:r},columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null}}))),e.current.getRow(t)&&(l&&a(l,{}),e.current.publishEvent("cellFocusIn",e.current.getCellParams(t,r))))},[e,o,a]),c=r.useCallback(function(t){let r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const l=Gr(e);a(l,r),e.current.setState(e=>(o.debug("Focusing on column header with colIndex=".concat(t)),(0,n.A)({},e,{tabIndex:{columnHeader:{field:t},columnHeaderFilter:null,cell:null,columnGroupHeader:null},focus:{columnHeader:{field:t},columnHeaderFilter:null,cell:null,columnGroupHeader:null}})))},[e,o,a]),u=r.useCallback(function(t){let r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const l=Gr(e);a(l,r),e.current.setState(e=>(o.debug("Focusing on column header filter with colIndex=".concat(t)),(0,n.A)({},e,{tabIndex:{columnHeader:null,columnHeaderFilter:{field:t},cell:null,columnGroupHeader:null},focus:{columnHeader:null,columnHeaderFilter:{field:t},cell:null,columnGroupHeader:null}})))},[e,o,a]),d=r.useCallback(function(t,o){let r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};const l=Gr(e);l&&e.current.publishEvent("cellFocusOut",e.current.getCellParams(l.id,l.field),r),e.current.setState(e=>(0,n.A)({},e,{tabIndex:{columnGroupHeader:{field:t,depth:o},columnHeader:null,columnHeaderFilter:null,cell:null},focus:{columnGroupHeader:{field:t,depth:o},columnHeader:null,columnHeaderFilter:null,cell:null}}))},[e]),p=r.useCallback(()=>Ur(e),[e]),f=r.useCallback((o,n,r)=>{let l=e.current.getColumnIndex(n);const i=Oe(e),a=ra(e,(t.pagination,t.paginationMode)),s=Rt(e),c=[].concat(s.top||[],a.rows,s.bottom||[]);let u=c.findIndex(e=>e.id===o);"right"===r?l+=1:"left"===r?l-=1:u+=1,l>=i.length?(u+=1,u<c.length&&(l=0)):l<0&&(u-=1,u>=0&&(l=i.length-1)),u=ro(u,0,c.length-1);const d=c[u];if(!d)return;const p=e.current.unstable_getCellColSpanInfo(d.id,l);p&&p.spannedByColSpan&&("left"===r||"below"===r?l=p.leftVisibleCellIndex:"right"===r&&(l=p.rightVisibleCellIndex)),l=ro(l,0,i.length-1);const f=i[l];e.current.setCellFocus(d.id,f.field)},[e,t.pagination,t.paginationMode]),g=r.useCallback(t=>{let{id:o,field:n}=t;e.current.setCellFocus(o,n)},[e]),h=r.useCallback((t,o)=>{"Enter"===o.key||"Tab"===o.key||"Shift"===o.key||On(o.key)||e.current.setCellFocus(t.id,t.field)},[e]),m=r.useCallback((t,o)=>{let{field:n}=t;o.target===o.currentTarget&&e.current.setColumnHeaderFocus(n,o)},[e]),v=r.useCallback((t,o)=>{let{fields:n,depth:r}=t;if(o.target!==o.currentTarget)return;const l=Ur(e);null!==l&&l.depth===r&&n.includes(l.field)||e.current.setColumnGroupHeaderFocus(n[0],r,o)},[e]),b=r.useCallback((t,r)=>{var l;null!==(l=r.relatedTarget)&&void 0!==l&&null!==(l=l.getAttribute("class"))&&void 0!==l&&l.includes(C.columnHeader)||(o.debug("Clearing focus"),e.current.setState(e=>(0,n.A)({},e,{focus:{cell:null,columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null}})))},[o,e]),w=r.useCallback(e=>{l.current=e},[]),y=r.useCallback(t=>{const o=l.current;l.current=null;const r=Gr(e);if(!e.current.unstable_applyPipeProcessors("canUpdateFocus",!0,{event:t,cell:o}))return;if(!r)return void(o&&e.current.setCellFocus(o.id,o.field));if((null===o||void 0===o?void 0:o.id)===r.id&&(null===o||void 0===o?void 0:o.field)===r.field)return;const i=e.current.getCellElement(r.id,r.field);null!==i&&void 0!==i&&i.contains(t.target)||(o?e.current.setCellFocus(o.id,o.field):(e.current.setState(e=>(0,n.A)({},e,{focus:{cell:null,columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null}})),a(r,t)))},[e,a]),A=r.useCallback(t=>{if("view"===t.cellMode)return;const o=Gr(e);(null===o||void 0===o?void 0:o.id)===t.id&&(null===o||void 0===o?void 0:o.field)===t.field||e.current.setCellFocus(t.id,t.field)},[e]),x=r.useCallback(()=>{const o=Gr(e);if(o&&!e.current.getRow(o.id)){const l=o.id;let i=null;if("undefined"!==typeof l){var r;const o=e.current.getRowElement(l),n=null!==o&&void 0!==o&&o.dataset.rowindex?Number(null===o||void 0===o?void 0:o.dataset.rowindex):0,a=ra(e,(t.pagination,t.paginationMode)),s=a.rows[ro(n,0,a.rows.length-1)];i=null!==(r=null===s||void 0===s?void 0:s.id)&&void 0!==r?r:null}e.current.setState(e=>(0,n.A)({},e,{focus:{cell:null===i?null:{id:i,field:o.field},columnHeader:null,columnHeaderFilter:null,columnGroupHeader:null}}))}},[e,t.pagination,t.paginationMode]),S=(0,It.A)(()=>{const o=Gr(e);if(!o)return;const r=ra(e,(t.pagination,t.paginationMode));if(r.rows.find(e=>e.id===o.id)||0===r.rows.length)return;const l=Oe(e);e.current.setState(e=>(0,n.A)({},e,{tabIndex:{cell:{id:r.rows[0].id,field:l[0].field},columnGroupHeader:null,columnHeader:null,columnHeaderFilter:null}}))}),R={moveFocusToRelativeCell:f,setColumnGroupHeaderFocus:d,getColumnGroupHeaderFocus:p};Nl(e,{setCellFocus:s,setColumnHeaderFocus:c,setColumnHeaderFilterFocus:u},"public"),Nl(e,R,"private"),r.useEffect(()=>{const t=(0,li.A)(e.current.rootElementRef.current);return t.addEventListener("mouseup",y),()=>{t.removeEventListener("mouseup",y)}},[e,i,y]),Ht(e,"columnHeaderBlur",b),Ht(e,"cellDoubleClick",g),Ht(e,"cellMouseDown",w),Ht(e,"cellKeyDown",h),Ht(e,"cellModeChange",A),Ht(e,"columnHeaderFocus",m),Ht(e,"columnGroupHeaderFocus",v),Ht(e,"rowsSet",x),Ht(e,"paginationModelChange",S)})(e,t),((e,t)=>{var o;const l=va(e,"useGridPreferencesPanel"),i=r.useCallback(()=>{e.current.setState(t=>{if(!t.preferencePanel.open)return t;l.debug("Hiding Preferences Panel");const o=Ue(e);return e.current.publishEvent("preferencePanelClose",{openedPanelValue:o.openedPanelValue}),(0,n.A)({},t,{preferencePanel:{open:!1}})})},[e,l]),a=r.useCallback((t,o,r)=>{l.debug("Opening Preferences Panel"),e.current.setState(e=>(0,n.A)({},e,{preferencePanel:(0,n.A)({},e.preferencePanel,{open:!0,openedPanelValue:t,panelId:o,labelId:r})})),e.current.publishEvent("preferencePanelOpen",{openedPanelValue:t})},[l,e]);Nl(e,{showPreferences:a,hidePreferences:i},"public");const s=r.useCallback((o,r)=>{var l;const i=Ue(e);return!r.exportOnlyDirtyModels||null!=(null===(l=t.initialState)||void 0===l?void 0:l.preferencePanel)||i.open?(0,n.A)({},o,{preferencePanel:i}):o},[e,null===(o=t.initialState)||void 0===o?void 0:o.preferencePanel]),c=r.useCallback((t,o)=>{const r=o.stateToRestore.preferencePanel;return null!=r&&e.current.setState(e=>(0,n.A)({},e,{preferencePanel:r})),t},[e]);Ha(e,"exportState",s),Ha(e,"restoreState",c)})(e,t),((e,t)=>{var o,l;const i=va(e,"useGridFilter");e.current.registerControlState({stateId:"filter",propModel:t.filterModel,propOnChange:t.onFilterModelChange,stateSelector:Cr,changeEvent:"filterModelChange"});const a=r.useCallback(()=>{e.current.setState(t=>{const o=Cr(e),r=e.current.getFilterState(o),l=(0,n.A)({},t,{filter:(0,n.A)({},t.filter,r)}),i=Za(e,l);return(0,n.A)({},l,{visibleRowsLookup:i})}),e.current.publishEvent("filteredRowsSet")},[e]),s=r.useCallback((e,o)=>null==o||!1===o.filterable||t.disableColumnFilter?e:[...e,"columnMenuFilterItem"],[t.disableColumnFilter]),c=r.useCallback(t=>{const o=Cr(e),r=[...o.items],l=r.findIndex(e=>e.id===t.id);-1===l?r.push(t):r[l]=t,e.current.setFilterModel((0,n.A)({},o,{items:r}),"upsertFilterItem")},[e]),u=r.useCallback(t=>{const o=Cr(e),r=[...o.items];t.forEach(e=>{const t=r.findIndex(t=>t.id===e.id);-1===t?r.push(e):r[t]=e}),e.current.setFilterModel((0,n.A)({},o,{items:r}),"upsertFilterItems")},[e]),d=r.useCallback(t=>{const o=Cr(e),r=o.items.filter(e=>e.id!==t.id);r.length!==o.items.length&&e.current.setFilterModel((0,n.A)({},o,{items:r}),"deleteFilterItem")},[e]),p=r.useCallback((o,r,l)=>{if(i.debug("Displaying filter panel"),o){const r=Cr(e),l=r.items.filter(t=>{var o;if(void 0!==t.value)return!Array.isArray(t.value)||0!==t.value.length;const n=null===(o=e.current.getColumn(t.field).filterOperators)||void 0===o?void 0:o.find(e=>e.value===t.operator);return!("undefined"===typeof(null===n||void 0===n?void 0:n.requiresFilterValue)||(null===n||void 0===n?void 0:n.requiresFilterValue))});let i;const a=l.find(e=>e.field===o),s=e.current.getColumn(o);i=a?l:t.disableMultipleColumnsFiltering?[go({field:o,operator:s.filterOperators[0].value},e)]:[...l,go({field:o,operator:s.filterOperators[0].value},e)],e.current.setFilterModel((0,n.A)({},r,{items:i}))}e.current.showPreferences(qe.filters,r,l)},[e,i,t.disableMultipleColumnsFiltering]),f=r.useCallback(()=>{i.debug("Hiding filter panel"),e.current.hidePreferences()},[e,i]),g=r.useCallback(t=>{const o=Cr(e);o.logicOperator!==t&&e.current.setFilterModel((0,n.A)({},o,{logicOperator:t}),"changeLogicOperator")},[e]),h=r.useCallback(t=>{const o=Cr(e);ii(o.quickFilterValues,t)||e.current.setFilterModel((0,n.A)({},o,{quickFilterValues:[...t]}))},[e]),m=r.useCallback((o,n)=>{Cr(e)!==o&&(i.debug("Setting filter model"),e.current.updateControlState("filter",mo(o,t.disableMultipleColumnsFiltering,e),n),e.current.unstable_applyFilters())},[e,i,t.disableMultipleColumnsFiltering]),v=r.useCallback(o=>{const r=ho(o,t.disableMultipleColumnsFiltering,e),l="client"===t.filterMode?Ao(r,e,t.disableEval):null,i=e.current.applyStrategyProcessor("filtering",{isRowMatchingFilters:l,filterModel:null!==r&&void 0!==r?r:uo()});return(0,n.A)({},i,{filterModel:r})},[t.disableMultipleColumnsFiltering,t.filterMode,t.disableEval,e]),b={setFilterLogicOperator:g,unstable_applyFilters:a,deleteFilterItem:d,upsertFilterItem:c,upsertFilterItems:u,setFilterModel:m,showFilterPanel:p,hideFilterPanel:f,setQuickFilterValues:h,ignoreDiacritics:t.ignoreDiacritics,getFilterState:v};Nl(e,b,"public");const w=r.useCallback((o,r)=>{var l;const i=Cr(e);return i.items.forEach(e=>{delete e.fromInput}),r.exportOnlyDirtyModels&&null==t.filterModel&&null==(null===(l=t.initialState)||void 0===l||null===(l=l.filter)||void 0===l?void 0:l.filterModel)&&ii(i,uo())?o:(0,n.A)({},o,{filter:{filterModel:i}})},[e,t.filterModel,null===(o=t.initialState)||void 0===o||null===(o=o.filter)||void 0===o?void 0:o.filterModel]),C=r.useCallback((o,r)=>{var l;const i=null===(l=r.stateToRestore.filter)||void 0===l?void 0:l.filterModel;return null==i?o:(e.current.updateControlState("filter",mo(i,t.disableMultipleColumnsFiltering,e),"restoreState"),(0,n.A)({},o,{callbacks:[...o.callbacks,e.current.unstable_applyFilters]}))},[e,t.disableMultipleColumnsFiltering]),y=r.useCallback((e,o)=>{if(o===qe.filters){var r;const e=t.slots.filterPanel;return(0,q.jsx)(e,(0,n.A)({},null===(r=t.slotProps)||void 0===r?void 0:r.filterPanel))}return e},[t.slots.filterPanel,null===(l=t.slotProps)||void 0===l?void 0:l.filterPanel]),{getRowId:A}=t,x=(0,I.A)(Ja),S=r.useCallback(o=>{var n;if("client"!==t.filterMode||!o.isRowMatchingFilters||!o.filterModel.items.length&&(null===(n=o.filterModel.quickFilterValues)||void 0===n||!n.length))return co;const r=mt(e),l={},{isRowMatchingFilters:i}=o,a={},s={passingFilterItems:null,passingQuickFilterValues:null},c=x.current(e.current.state.rows.dataRowIdToModelLookup);for(let t=0;t<c.length;t+=1){const n=c[t],r=A?A(n):n.id;i(n,void 0,s);const u=So([s.passingFilterItems],[s.passingQuickFilterValues],o.filterModel,e,a);u||(l[r]=u)}const u="auto-generated-group-footer-root";return r[u]&&(l[u]=!0),{filteredRowsLookup:l,filteredChildrenCountLookup:{},filteredDescendantCountLookup:{}}},[e,t.filterMode,A,x]);Ha(e,"columnMenu",s),Ha(e,"exportState",w),Ha(e,"restoreState",C),Ha(e,"preferencePanel",y),Ya(e,_l,"filtering",S),Ya(e,_l,"visibleRowsLookupCreation",$a);const R=r.useCallback(()=>{i.debug("onColUpdated - GridColumns changed, applying filters");const t=Cr(e),o=Fe(e),r=t.items.filter(e=>e.field&&o[e.field]);r.length<t.items.length&&e.current.setFilterModel((0,n.A)({},t,{items:r}))},[e,i]),M=r.useCallback(t=>{"filtering"===t&&e.current.unstable_applyFilters()},[e]),P=r.useCallback(()=>{e.current.setState(t=>(0,n.A)({},t,{visibleRowsLookup:Za(e,t)}))},[e]);Ht(e,"rowsSet",a),Ht(e,"columnsChange",R),Ht(e,"activeStrategyProcessorChange",M),Ht(e,"rowExpansionChange",P),Ht(e,"columnVisibilityModelChange",()=>{var t;const o=Cr(e);null!==(t=o.quickFilterValues)&&void 0!==t&&t.length&&yo(o)&&a()}),yi(()=>{a()}),(0,Nt.A)(()=>{void 0!==t.filterModel&&e.current.setFilterModel(t.filterModel)},[e,i,t.filterModel])})(e,t),((e,t)=>{var o;const l=va(e,"useGridSorting");e.current.registerControlState({stateId:"sortModel",propModel:t.sortModel,propOnChange:t.onSortModelChange,stateSelector:vr,changeEvent:"sortModelChange"});const i=r.useCallback((t,o)=>{const n=vr(e),r=n.findIndex(e=>e.field===t);let l=[...n];return r>-1?null==(null===o||void 0===o?void 0:o.sort)?l.splice(r,1):l.splice(r,1,o):l=[...n,o],l},[e]),a=r.useCallback((o,r)=>{var l;const i=vr(e).find(e=>e.field===o.field);if(i){var a;const e=void 0===r?_t(null!==(a=o.sortingOrder)&&void 0!==a?a:t.sortingOrder,i.sort):r;return void 0===e?void 0:(0,n.A)({},i,{sort:e})}return{field:o.field,sort:void 0===r?_t(null!==(l=o.sortingOrder)&&void 0!==l?l:t.sortingOrder):r}},[e,t.sortingOrder]),s=r.useCallback((e,o)=>null==o||!1===o.sortable||t.disableColumnSorting?e:(o.sortingOrder||t.sortingOrder).some(e=>!!e)?[...e,"columnMenuSortItem"]:e,[t.sortingOrder,t.disableColumnSorting]),c=r.useCallback(()=>{e.current.setState(o=>{if("server"===t.sortingMode)return l.debug("Skipping sorting rows as sortingMode = server"),(0,n.A)({},o,{sorting:(0,n.A)({},o.sorting,{sortedRows:Xo(vt(e),Bo,!1)})});const r=vr(e),i=qt(r,e),a=e.current.applyStrategyProcessor("sorting",{sortRowList:i});return(0,n.A)({},o,{sorting:(0,n.A)({},o.sorting,{sortedRows:a})})}),e.current.publishEvent("sortedRowsSet")},[e,l,t.sortingMode]),u=r.useCallback(o=>{vr(e)!==o&&(l.debug("Setting sort model"),e.current.setState(Kt(o,t.disableMultipleColumnsSorting)),e.current.applySorting())},[e,l,t.disableMultipleColumnsSorting]),d=r.useCallback((o,n,r)=>{const l=e.current.getColumn(o),s=a(l,n);let c;c=!r||t.disableMultipleColumnsSorting?null==(null===s||void 0===s?void 0:s.sort)?[]:[s]:i(l.field,s),e.current.setSortModel(c)},[e,i,a,t.disableMultipleColumnsSorting]),p=r.useCallback(()=>vr(e),[e]),f=r.useCallback(()=>mr(e).map(e=>e.model),[e]),g=r.useCallback(()=>hr(e),[e]),h=r.useCallback(t=>e.current.getSortedRowIds()[t],[e]);Nl(e,{getSortModel:p,getSortedRows:f,getSortedRowIds:g,getRowIdFromRowIndex:h,setSortModel:u,sortColumn:d,applySorting:c},"public");const m=r.useCallback((o,r)=>{var l;const i=vr(e);return!r.exportOnlyDirtyModels||null!=t.sortModel||null!=(null===(l=t.initialState)||void 0===l||null===(l=l.sorting)||void 0===l?void 0:l.sortModel)||i.length>0?(0,n.A)({},o,{sorting:{sortModel:i}}):o},[e,t.sortModel,null===(o=t.initialState)||void 0===o||null===(o=o.sorting)||void 0===o?void 0:o.sortModel]),v=r.useCallback((o,r)=>{var l;const i=null===(l=r.stateToRestore.sorting)||void 0===l?void 0:l.sortModel;return null==i?o:(e.current.setState(Kt(i,t.disableMultipleColumnsSorting)),(0,n.A)({},o,{callbacks:[...o.callbacks,e.current.applySorting]}))},[e,t.disableMultipleColumnsSorting]),b=r.useCallback(t=>{const o=vt(e),n=o[Bo],r=t.sortRowList?t.sortRowList(n.children.map(e=>o[e])):[...n.children];return null!=n.footerId&&r.push(n.footerId),r},[e]);Ha(e,"exportState",m),Ha(e,"restoreState",v),Ya(e,_l,"sorting",b);const w=r.useCallback((e,o)=>{let{field:n,colDef:r}=e;if(!r.sortable||t.disableColumnSorting)return;const l="always"===t.multipleColumnsSortingMode||o.shiftKey||o.metaKey||o.ctrlKey;d(n,void 0,l)},[d,t.disableColumnSorting,t.multipleColumnsSortingMode]),C=r.useCallback((e,o)=>{let{field:n,colDef:r}=e;r.sortable&&!t.disableColumnSorting&&("Enter"!==o.key||o.ctrlKey||o.metaKey||d(n,void 0,"always"===t.multipleColumnsSortingMode||o.shiftKey))},[d,t.disableColumnSorting,t.multipleColumnsSortingMode]),y=r.useCallback(()=>{const t=vr(e),o=Fe(e);if(t.length>0){const n=t.filter(e=>o[e.field]);n.length<t.length&&e.current.setSortModel(n)}},[e]),A=r.useCallback(t=>{"sorting"===t&&e.current.applySorting()},[e]);Ha(e,"columnMenu",s),Ht(e,"columnHeaderClick",w),Ht(e,"columnHeaderKeyDown",C),Ht(e,"rowsSet",e.current.applySorting),Ht(e,"columnsChange",y),Ht(e,"activeStrategyProcessorChange",A),yi(()=>{e.current.applySorting()}),(0,Nt.A)(()=>{void 0!==t.sortModel&&e.current.setSortModel(t.sortModel)},[e,t.sortModel])})(e,t),((e,t)=>{var o;const l=va(e,"useDensity");e.current.registerControlState({stateId:"density",propModel:t.density,propOnChange:t.onDensityChange,stateSelector:we,changeEvent:"densityChange"});const i=(0,It.A)(t=>{we(e)!==t&&(l.debug("Set grid density to ".concat(t)),e.current.setState(e=>(0,n.A)({},e,{density:t})))});Nl(e,{setDensity:i},"public");const a=r.useCallback((o,r)=>{var l;const i=we(e);return r.exportOnlyDirtyModels&&null==t.density&&null==(null===(l=t.initialState)||void 0===l?void 0:l.density)?o:(0,n.A)({},o,{density:i})},[e,t.density,null===(o=t.initialState)||void 0===o?void 0:o.density]),s=r.useCallback((t,o)=>{var r;const l=null!==(r=o.stateToRestore)&&void 0!==r&&r.density?o.stateToRestore.density:we(e);return e.current.setState(e=>(0,n.A)({},e,{density:l})),t},[e]);Ha(e,"exportState",a),Ha(e,"restoreState",s),r.useEffect(()=>{t.density&&e.current.setDensity(t.density)},[e,t.density])})(e,t),sc(e,t),hs(e,t),(e=>{const t=e.current.virtualizer,{getRowHeight:o,setLastMeasuredRowIndex:n,storeRowHeightMeasurement:r,resetRowHeights:l,hydrateRowsMeta:i,observeRowHeight:a,rowHasAutoHeight:s,getRowHeightEntry:c,getLastMeasuredRowIndex:u}=t.api.rowsMeta;Da(e,"rowHeight",i);const d={hydrateRowsMeta:i,observeRowHeight:a,rowHasAutoHeight:s,getRowHeightEntry:c,getLastMeasuredRowIndex:u};Nl(e,{unstable_getRowHeight:o,unstable_setLastMeasuredRowIndex:n,unstable_storeRowHeightMeasurement:r,resetRowHeights:l},"public"),Nl(e,d,"private")})(e),((e,t)=>{const o=(0,Hn.I)(),n=va(e,"useGridScroll"),l=e.current.columnHeadersContainerRef,i=e.current.virtualScrollerRef,a=D(e,Sr),s=r.useCallback(o=>{const r=tt(e),l=ft(e),s=Oe(e);if(null!=o.rowIndex&&0===l||0===s.length)return!1;n.debug("Scrolling to cell at row ".concat(o.rowIndex,", col: ").concat(o.colIndex," "));let c={};if(void 0!==o.colIndex){const t=Be(e);let n;if("undefined"!==typeof o.rowIndex){var u;const t=null===(u=a[o.rowIndex])||void 0===u?void 0:u.id,r=e.current.unstable_getCellColSpanInfo(t,o.colIndex);r&&!r.spannedByColSpan&&(n=r.cellProps.width)}"undefined"===typeof n&&(n=s[o.colIndex].computedWidth),c.left=Ls({containerSize:r.viewportOuterSize.width,scrollPosition:Math.abs(i.current.scrollLeft),elementSize:n,elementOffset:t[o.colIndex]})}if(void 0!==o.rowIndex){const n=ir(e),l=$i(e),a=Zi(e),s=t.pagination?o.rowIndex-l*a:o.rowIndex,u=n.positions[s+1]?n.positions[s+1]-n.positions[s]:n.currentPageTotalHeight-n.positions[s];c.top=Ls({containerSize:r.viewportInnerSize.height,scrollPosition:i.current.scrollTop,elementSize:u,elementOffset:n.positions[s]})}return c=e.current.unstable_applyPipeProcessors("scrollToIndexes",c,o),("undefined"!==typeof c.left||"undefined"!==typeof c.top)&&(e.current.scroll(c),!0)},[n,e,i,t.pagination,a]),c=r.useCallback(e=>{if(i.current&&void 0!==e.left&&l.current){const t=o?-1:1;l.current.scrollLeft=e.left,i.current.scrollLeft=t*e.left,n.debug("Scrolling left: ".concat(e.left))}i.current&&void 0!==e.top&&(i.current.scrollTop=e.top,n.debug("Scrolling top: ".concat(e.top))),n.debug("Scrolling, updating container, and viewport")},[i,o,l,n]),u=r.useCallback(()=>null!==i&&void 0!==i&&i.current?{top:i.current.scrollTop,left:i.current.scrollLeft}:{top:0,left:0},[i]);Nl(e,{scroll:c,scrollToIndexes:s,getScrollPosition:u},"public")})(e,t),(e=>{const t=va(e,"useGridColumnMenu"),o=r.useCallback(o=>{const r=Yr(e),l=o;(!0!==r.open||l!==r.field)&&(e.current.setState(e=>e.columnMenu.open&&e.columnMenu.field===o?e:(t.debug("Opening Column Menu"),(0,n.A)({},e,{columnMenu:{open:!0,field:o}}))),e.current.hidePreferences())},[e,t]),l=r.useCallback(()=>{const o=Yr(e);if(o.field){const t=Fe(e),n=He(e),r=Ee(e);let l=o.field;if(t[l]||(l=r[0]),!1===n[l]){const e=r.filter(e=>e===l||!1!==n[e]),t=e.indexOf(l);l=e[t+1]||e[t-1]}e.current.setColumnHeaderFocus(l)}const r={open:!1,field:void 0};(r.open!==o.open||r.field!==o.field)&&e.current.setState(e=>(t.debug("Hiding Column Menu"),(0,n.A)({},e,{columnMenu:r})))},[e,t]),i=r.useCallback(n=>{t.debug("Toggle Column Menu");const r=Yr(e);r.open&&r.field===n?l():o(n)},[e,t,o,l]);Nl(e,{showColumnMenu:o,hideColumnMenu:l,toggleColumnMenu:i},"public"),Ht(e,"columnResizeStart",l),Ht(e,"virtualScrollerWheel",e.current.hideColumnMenu),Ht(e,"virtualScrollerTouchMove",e.current.hideColumnMenu)})(e),qa(e,t),Xa(e,t),Fa(e,t),function(e,t){const o=e.current.virtualizer,n=o.api.updateDimensions,l=o.api.getViewportPageSize,i=r.useCallback(()=>tt(e),[e]),a={updateDimensions:n,getViewportPageSize:l};Nl(e,{getRootDimensions:i},"public"),Nl(e,a,"private"),Ot(e,"rootMount",t=>{Gs(t,tt(e))}),Ot(e,"debouncedResize",t.onResize),Jl(e.current.store,e=>e.dimensions,(t,o)=>{var n,r;e.current.rootElementRef.current&&Gs(e.current.rootElementRef.current,o),n=o.viewportInnerSize,r=t.viewportInnerSize,(n.width!==r.width||n.height!==r.height)&&e.current.publishEvent("viewportInnerSizeChange",o.viewportInnerSize),e.current.publishEvent("debouncedResize",o.root)})}(e,t),function(e,t){Ot(e,"columnHeaderClick",t.onColumnHeaderClick),Ot(e,"columnHeaderContextMenu",t.onColumnHeaderContextMenu),Ot(e,"columnHeaderDoubleClick",t.onColumnHeaderDoubleClick),Ot(e,"columnHeaderOver",t.onColumnHeaderOver),Ot(e,"columnHeaderOut",t.onColumnHeaderOut),Ot(e,"columnHeaderEnter",t.onColumnHeaderEnter),Ot(e,"columnHeaderLeave",t.onColumnHeaderLeave),Ot(e,"cellClick",t.onCellClick),Ot(e,"cellDoubleClick",t.onCellDoubleClick),Ot(e,"cellKeyDown",t.onCellKeyDown),Ot(e,"preferencePanelClose",t.onPreferencePanelClose),Ot(e,"preferencePanelOpen",t.onPreferencePanelOpen),Ot(e,"menuOpen",t.onMenuOpen),Ot(e,"menuClose",t.onMenuClose),Ot(e,"rowDoubleClick",t.onRowDoubleClick),Ot(e,"rowClick",t.onRowClick),Ot(e,"stateChange",t.onStateChange)}(e,t),(e=>{const t=r.useCallback(function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return e.current.unstable_applyPipeProcessors("exportState",{},t)},[e]),o=r.useCallback(t=>{e.current.unstable_applyPipeProcessors("restoreState",{callbacks:[]},{stateToRestore:t}).callbacks.forEach(e=>{e()})},[e]);Nl(e,{exportState:t,restoreState:o},"public")})(e),function(e,t){const{virtualizer:o}=e.current,{autoHeight:l,disableVirtualization:i}=t,a=e=>{e&&(e=Zs),o.store.set("virtualization",(0,n.A)({},o.store.state.virtualization,{enabled:e,enabledForColumns:e,enabledForRows:e&&!l}))};Nl(e,{unstable_setVirtualization:a,unstable_setColumnVirtualization:e=>{e&&(e=Zs),o.store.set("virtualization",(0,n.A)({},o.store.state.virtualization,{enabledForColumns:e}))}},"public");const s=o.api.forceUpdateRenderContext;e.current.register("private",{updateRenderContext:s}),Ot(e,"sortedRowsSet",s),Ot(e,"paginationModelChange",s),Ot(e,"columnsChange",s),r.useEffect(()=>{a(!t.disableVirtualization)},[i,l])}(e,t),function(e,t){const o=()=>{e.current.setState(t=>t.listViewColumn?(0,n.A)({},t,{listViewColumn:(0,n.A)({},t.listViewColumn,{computedWidth:vc(e)})}):t)},l=r.useRef(null);Ht(e,"viewportInnerSizeChange",e=>{l.current!==e.width&&(l.current=e.width,o())}),Ht(e,"columnVisibilityModelChange",o),(0,Nt.A)(()=>{const o=t.listViewColumn;o&&e.current.setState(t=>(0,n.A)({},t,{listViewColumn:(0,n.A)({},o,{computedWidth:vc(e)})}))},[e,t.listViewColumn]),r.useEffect(()=>{t.listView&&t.listViewColumn},[t.listView,t.listViewColumn])}(e,t),kc(e,t),r.useEffect(()=>{e.current.runAppliersForPendingProcessors()})};var Fc=o(267),Tc=o(8480);const Hc={noRowsLabel:"No rows",noResultsOverlayLabel:"No results found.",noColumnsOverlayLabel:"No columns",noColumnsOverlayManageColumns:"Manage columns",emptyPivotOverlayLabel:"Add fields to rows, columns, and values to create a pivot table",toolbarDensity:"Density",toolbarDensityLabel:"Density",toolbarDensityCompact:"Compact",toolbarDensityStandard:"Standard",toolbarDensityComfortable:"Comfortable",toolbarColumns:"Columns",toolbarColumnsLabel:"Select columns",toolbarFilters:"Filters",toolbarFiltersLabel:"Show filters",toolbarFiltersTooltipHide:"Hide filters",toolbarFiltersTooltipShow:"Show filters",toolbarFiltersTooltipActive:e=>"".concat(e,1!==e?" active filters":" active filter"),toolbarQuickFilterPlaceholder:"Search\u2026",toolbarQuickFilterLabel:"Search",toolbarQuickFilterDeleteIconLabel:"Clear",toolbarExport:"Export",toolbarExportLabel:"Export",toolbarExportCSV:"Download as CSV",toolbarExportPrint:"Print",toolbarExportExcel:"Download as Excel",toolbarPivot:"Pivot",toolbarAssistant:"AI Assistant",columnsManagementSearchTitle:"Search",columnsManagementNoColumns:"No columns",columnsManagementShowHideAllText:"Show/Hide All",columnsManagementReset:"Reset",columnsManagementDeleteIconLabel:"Clear",filterPanelAddFilter:"Add filter",filterPanelRemoveAll:"Remove all",filterPanelDeleteIconLabel:"Delete",filterPanelLogicOperator:"Logic operator",filterPanelOperator:"Operator",filterPanelOperatorAnd:"And",filterPanelOperatorOr:"Or",filterPanelColumns:"Columns",filterPanelInputLabel:"Value",filterPanelInputPlaceholder:"Filter value",filterOperatorContains:"contains",filterOperatorDoesNotContain:"does not contain",filterOperatorEquals:"equals",filterOperatorDoesNotEqual:"does not equal",filterOperatorStartsWith:"starts with",filterOperatorEndsWith:"ends with",filterOperatorIs:"is",filterOperatorNot:"is not",filterOperatorAfter:"is after",filterOperatorOnOrAfter:"is on or after",filterOperatorBefore:"is before",filterOperatorOnOrBefore:"is on or before",filterOperatorIsEmpty:"is empty",filterOperatorIsNotEmpty:"is not empty",filterOperatorIsAnyOf:"is any of","filterOperator=":"=","filterOperator!=":"!=","filterOperator>":">","filterOperator>=":">=","filterOperator<":"<","filterOperator<=":"<=",headerFilterOperatorContains:"Contains",headerFilterOperatorDoesNotContain:"Does not contain",headerFilterOperatorEquals:"Equals",headerFilterOperatorDoesNotEqual:"Does not equal",headerFilterOperatorStartsWith:"Starts with",headerFilterOperatorEndsWith:"Ends with",headerFilterOperatorIs:"Is",headerFilterOperatorNot:"Is not",headerFilterOperatorAfter:"Is after",headerFilterOperatorOnOrAfter:"Is on or after",headerFilterOperatorBefore:"Is before",headerFilterOperatorOnOrBefore:"Is on or before",headerFilterOperatorIsEmpty:"Is empty",headerFilterOperatorIsNotEmpty:"Is not empty",headerFilterOperatorIsAnyOf:"Is any of","headerFilterOperator=":"Equals","headerFilterOperator!=":"Not equals","headerFilterOperator>":"Greater than","headerFilterOperator>=":"Greater than or equal to","headerFilterOperator<":"Less than","headerFilterOperator<=":"Less than or equal to",headerFilterClear:"Clear filter",filterValueAny:"any",filterValueTrue:"true",filterValueFalse:"false",columnMenuLabel:"Menu",columnMenuAriaLabel:e=>"".concat(e," column menu"),columnMenuShowColumns:"Show columns",columnMenuManageColumns:"Manage columns",columnMenuFilter:"Filter",columnMenuHideColumn:"Hide column",columnMenuUnsort:"Unsort",columnMenuSortAsc:"Sort by ASC",columnMenuSortDesc:"Sort by DESC",columnMenuManagePivot:"Manage pivot",columnHeaderFiltersTooltipActive:e=>"".concat(e,1!==e?" active filters":" active filter"),columnHeaderFiltersLabel:"Show filters",columnHeaderSortIconLabel:"Sort",footerRowSelected:e=>"".concat(e.toLocaleString(),1!==e?" rows selected":" row selected"),footerTotalRows:"Total Rows:",footerTotalVisibleRows:(e,t)=>"".concat(e.toLocaleString()," of ").concat(t.toLocaleString()),checkboxSelectionHeaderName:"Checkbox selection",checkboxSelectionSelectAllRows:"Select all rows",checkboxSelectionUnselectAllRows:"Unselect all rows",checkboxSelectionSelectRow:"Select row",checkboxSelectionUnselectRow:"Unselect row",booleanCellTrueLabel:"yes",booleanCellFalseLabel:"no",actionsCellMore:"more",pinToLeft:"Pin to left",pinToRight:"Pin to right",unpin:"Unpin",treeDataGroupingHeaderName:"Group",treeDataExpand:"see children",treeDataCollapse:"hide children",groupingColumnHeaderName:"Group",groupColumn:e=>"Group by ".concat(e),unGroupColumn:e=>"Stop grouping by ".concat(e),detailPanelToggle:"Detail panel toggle",expandDetailPanel:"Expand",collapseDetailPanel:"Collapse",paginationRowsPerPage:"Rows per page:",paginationDisplayedRows:e=>{let{from:t,to:o,count:n,estimated:r}=e;if(!r)return"".concat(t,"\u2013").concat(o," of ").concat(-1!==n?n:"more than ".concat(o));const l=r&&r>o?"around ".concat(r):"more than ".concat(o);return"".concat(t,"\u2013").concat(o," of ").concat(-1!==n?n:l)},paginationItemAriaLabel:e=>"first"===e?"Go to first page":"last"===e?"Go to last page":"next"===e?"Go to next page":"Go to previous page",rowReorderingHeaderName:"Row reordering",aggregationMenuItemHeader:"Aggregation",aggregationFunctionLabelSum:"sum",aggregationFunctionLabelAvg:"avg",aggregationFunctionLabelMin:"min",aggregationFunctionLabelMax:"max",aggregationFunctionLabelSize:"size",pivotToggleLabel:"Pivot",pivotRows:"Rows",pivotColumns:"Columns",pivotValues:"Values",pivotCloseButton:"Close pivot settings",pivotSearchButton:"Search fields",pivotSearchControlPlaceholder:"Search fields",pivotSearchControlLabel:"Search fields",pivotSearchControlClear:"Clear search",pivotNoFields:"No fields",pivotMenuMoveUp:"Move up",pivotMenuMoveDown:"Move down",pivotMenuMoveToTop:"Move to top",pivotMenuMoveToBottom:"Move to bottom",pivotMenuRows:"Rows",pivotMenuColumns:"Columns",pivotMenuValues:"Values",pivotMenuOptions:"Field options",pivotMenuAddToRows:"Add to Rows",pivotMenuAddToColumns:"Add to Columns",pivotMenuAddToValues:"Add to Values",pivotMenuRemove:"Remove",pivotDragToRows:"Drag here to create rows",pivotDragToColumns:"Drag here to create columns",pivotDragToValues:"Drag here to create values",pivotYearColumnHeaderName:"(Year)",pivotQuarterColumnHeaderName:"(Quarter)",aiAssistantPanelTitle:"AI Assistant",aiAssistantPanelClose:"Close AI Assistant",aiAssistantPanelNewConversation:"New conversation",aiAssistantPanelConversationHistory:"Conversation history",aiAssistantPanelEmptyConversation:"No prompt history",aiAssistantSuggestions:"Suggestions",promptFieldLabel:"Prompt",promptFieldPlaceholder:"Type a prompt\u2026",promptFieldPlaceholderWithRecording:"Type or record a prompt\u2026",promptFieldPlaceholderListening:"Listening for prompt\u2026",promptFieldSpeechRecognitionNotSupported:"Speech recognition is not supported in this browser",promptFieldSend:"Send",promptFieldRecord:"Record",promptFieldStopRecording:"Stop recording",promptRerun:"Run again",promptProcessing:"Processing\u2026",promptAppliedChanges:"Applied changes",promptChangeGroupDescription:e=>"Group by ".concat(e),promptChangeAggregationLabel:(e,t)=>"".concat(e," (").concat(t,")"),promptChangeAggregationDescription:(e,t)=>"Aggregate ".concat(e," (").concat(t,")"),promptChangeFilterLabel:(e,t,o)=>"is any of"===t?"".concat(e," is any of: ").concat(o):"".concat(e," ").concat(t," ").concat(o),promptChangeFilterDescription:(e,t,o)=>"is any of"===t?"Filter where ".concat(e," is any of: ").concat(o):"Filter where ".concat(e," ").concat(t," ").concat(o),promptChangeSortDescription:(e,t)=>"Sort by ".concat(e," (").concat(t,")"),promptChangePivotEnableLabel:"Pivot",promptChangePivotEnableDescription:"Enable pivot",promptChangePivotColumnsLabel:e=>"Columns (".concat(e,")"),promptChangePivotColumnsDescription:(e,t)=>"".concat(e).concat(t?" (".concat(t,")"):""),promptChangePivotRowsLabel:e=>"Rows (".concat(e,")"),promptChangePivotValuesLabel:e=>"Values (".concat(e,")"),promptChangePivotValuesDescription:(e,t)=>"".concat(e," (").concat(t,")")},Dc=["field","type","align","width","height","empty","style","className"],Oc="1.3em",zc=[40,80],Lc={number:[40,60],string:[40,80],date:[40,60],dateTime:[60,80],singleSelect:[40,80]},jc=function(e){const t=(o=e,()=>{let e=o+=1831565813;return e=Math.imul(e^e>>>15,1|e),e^=e+Math.imul(e^e>>>7,61|e),((e^e>>>14)>>>0)/4294967296});var o;return(e,o)=>e+(o-e)*t()}(12345);const Nc=h(function(e){const{field:t,type:o,align:l,width:i,height:a,empty:u=!1,style:f,className:g}=e,h=(0,s.A)(e,Dc),m=W(),v=(e=>{const{align:t,classes:o,empty:n}=e,r={root:["cell","cellSkeleton","cell--text".concat(t?(0,d.A)(t):"Left"),n&&"cellEmpty"]};return(0,p.A)(r,w,o)})({classes:m.classes,align:l,empty:u}),b=r.useMemo(()=>{var e;if("boolean"===o||"actions"===o)return{variant:"circular",width:Oc,height:Oc};const[t,n]=o&&null!==(e=Lc[o])&&void 0!==e?e:zc;return{variant:"text",width:"".concat(Math.round(jc(t,n)),"%"),height:"1.2em"}},[o]);return(0,q.jsx)("div",(0,n.A)({"data-field":t,className:(0,c.A)(v.root,g),style:(0,n.A)({height:a,maxWidth:i,minWidth:i},f)},h,{children:!u&&(0,q.jsx)(m.slots.baseSkeleton,(0,n.A)({},b))}))}),Bc=["className"],Vc=(0,et.A)("div",{name:"MuiDataGrid",slot:"IconButtonContainer"})(()=>({display:"flex",visibility:"hidden",width:0})),Gc=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,Bc),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["iconButtonContainer"]},w,t)})(l);return(0,q.jsx)(Vc,(0,n.A)({className:(0,c.A)(i.root,o),ownerState:l},r,{ref:t}))});function Wc(e){var t,o;const{counter:l,field:i,onClick:a}=e,s=Xe(),c=W(),u=(e=>{const{classes:t}=e;return(0,p.A)({icon:["filterIcon"]},w,t)})((0,n.A)({},e,{classes:c.classes})),d=(0,Zt.A)(),f=D(s,Ke,d),g=(0,Zt.A)(),h=r.useCallback(e=>{e.preventDefault(),e.stopPropagation();const{open:t,openedPanelValue:o}=Ue(s);t&&o===qe.filters?s.current.hideFilterPanel():s.current.showFilterPanel(void 0,g,d),a&&a(s.current.getColumnHeaderParams(i),e)},[s,i,a,g,d]);if(!l)return null;const m=(0,q.jsx)(c.slots.baseIconButton,(0,n.A)({id:d,onClick:h,"aria-label":s.current.getLocaleText("columnHeaderFiltersLabel"),size:"small",tabIndex:-1,"aria-haspopup":"menu","aria-expanded":f,"aria-controls":f?g:void 0},null===(t=c.slotProps)||void 0===t?void 0:t.baseIconButton,{children:(0,q.jsx)(c.slots.columnFilteredIcon,{className:u.icon,fontSize:"small"})}));return(0,q.jsx)(c.slots.baseTooltip,(0,n.A)({title:s.current.getLocaleText("columnHeaderFiltersTooltipActive")(l),enterDelay:1e3},null===(o=c.slotProps)||void 0===o?void 0:o.baseTooltip,{children:(0,q.jsxs)(Gc,{children:[l>1&&(0,q.jsx)(c.slots.baseBadge,{badgeContent:l,color:"default",children:m}),1===l&&m]})}))}const Uc=["direction","index","sortingOrder","disabled","className"],Kc=(0,et.A)(Bt,{name:"MuiDataGrid",slot:"SortButton"})({transition:S.transition(["opacity"],{duration:S.transitions.duration.short,easing:S.transitions.easing.easeInOut})});function qc(e){var t;const{direction:o,index:l,sortingOrder:i,disabled:a,className:u}=e,d=(0,s.A)(e,Uc),f=Xe(),g=W(),h=(0,n.A)({},e,{classes:g.classes}),m=(e=>{const{classes:t}=e;return(0,p.A)({root:["sortButton"],icon:["sortIcon"]},w,t)})(h),v=function(e,t,o,r){let l;const i={};return"asc"===t?l=e.columnSortedAscendingIcon:"desc"===t?l=e.columnSortedDescendingIcon:(l=e.columnUnsortedIcon,i.sortingOrder=r),l?(0,q.jsx)(l,(0,n.A)({fontSize:"small",className:o},i)):null}(g.slots,o,m.icon,i);if(!v)return null;const b=(0,q.jsx)(Kc,(0,n.A)({as:g.slots.baseIconButton,ownerState:h,"aria-label":f.current.getLocaleText("columnHeaderSortIconLabel"),title:f.current.getLocaleText("columnHeaderSortIconLabel"),size:"small",disabled:a,className:(0,c.A)(m.root,u)},null===(t=g.slotProps)||void 0===t?void 0:t.baseIconButton,d,{children:v}));return(0,q.jsxs)(r.Fragment,{children:[null!=l&&(0,q.jsx)(g.slots.baseBadge,{badgeContent:l,color:"default",overlap:"circular",children:b}),null==l&&b]})}function _c(e){return(0,q.jsx)(Gc,{children:(0,q.jsx)(qc,(0,n.A)({},e,{tabIndex:-1}))})}const Xc=r.memo(_c);const Yc=["className","selectedRowCount"],Qc=(0,et.A)("div",{name:"MuiDataGrid",slot:"SelectedRowCount"})({alignItems:"center",display:"flex",margin:S.spacing(0,2),visibility:"hidden",width:0,height:0,[S.breakpoints.up("sm")]:{visibility:"visible",width:"auto",height:"auto"}}),$c=a(function(e,t){const{className:o,selectedRowCount:r}=e,l=(0,s.A)(e,Yc),i=Xe(),a=W(),u=(e=>{const{classes:t}=e;return(0,p.A)({root:["selectedRowCount"]},w,t)})(a),d=i.current.getLocaleText("footerRowSelected")(r);return(0,q.jsx)(Qc,(0,n.A)({className:(0,c.A)(u.root,o),ownerState:a},l,{ref:t,children:d}))});const Zc=["className"],Jc=(0,et.A)("div",{name:"MuiDataGrid",slot:"FooterContainer"})({display:"flex",justifyContent:"space-between",alignItems:"center",minHeight:52,borderTop:"1px solid"}),eu=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,Zc),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["footerContainer","withBorderColor"]},w,t)})(l);return(0,q.jsx)(Jc,(0,n.A)({className:(0,c.A)(i.root,o),ownerState:l},r,{ref:t}))});const tu=a(function(e,t){var o,r;const l=Xe(),i=W(),a=D(l,ht),s=D(l,Fl),c=D(l,Er),u=!i.hideFooterSelectedRowCount&&s>0?(0,q.jsx)($c,{selectedRowCount:s}):(0,q.jsx)("div",{}),d=i.hideFooterRowCount||i.pagination?null:(0,q.jsx)(i.slots.footerRowCount,(0,n.A)({},null===(o=i.slotProps)||void 0===o?void 0:o.footerRowCount,{rowCount:a,visibleRowCount:c})),p=i.pagination&&!i.hideFooterPagination&&i.slots.pagination&&(0,q.jsx)(i.slots.pagination,(0,n.A)({},null===(r=i.slotProps)||void 0===r?void 0:r.pagination));return(0,q.jsxs)(eu,(0,n.A)({},e,{ref:t,children:[u,d,p]}))});const ou=["className","rowCount","visibleRowCount"],nu=(0,et.A)("div",{name:"MuiDataGrid",slot:"RowCount"})({alignItems:"center",display:"flex",margin:S.spacing(0,2)}),ru=a(function(e,t){const{className:o,rowCount:r,visibleRowCount:l}=e,i=(0,s.A)(e,ou),a=Xe(),u=W(),d=(e=>{const{classes:t}=e;return(0,p.A)({root:["rowCount"]},w,t)})(u);if(0===r)return null;const f=l<r?a.current.getLocaleText("footerTotalVisibleRows")(l,r):r.toLocaleString();return(0,q.jsxs)(nu,(0,n.A)({className:(0,c.A)(d.root,o),ownerState:u},i,{ref:t,children:[a.current.getLocaleText("footerTotalRows")," ",f]}))});const lu=["className"],iu=(0,et.A)("div",{name:"MuiDataGrid",slot:"Overlay"})({width:"100%",height:"100%",display:"flex",gap:S.spacing(1),flexDirection:"column",alignSelf:"center",alignItems:"center",justifyContent:"center",textAlign:"center",textWrap:"balance",backgroundColor:S.colors.background.backdrop}),au=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,lu),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["overlay"]},w,t)})(l);return(0,q.jsx)(iu,(0,n.A)({className:(0,c.A)(i.root,o),ownerState:l},r,{ref:t}))});const su=(e,t,o,n,r,l)=>{let i;switch(e){case ln.LEFT:i=n[o];break;case ln.RIGHT:i=r-n[o]-t+l;break;default:i=void 0}return Number.isNaN(i)&&(i=void 0),i},cu=(e,t,o,n,r)=>{const l=t===o-1;return!(e!==ln.LEFT||!l)||!!n&&(e===ln.LEFT||(e===ln.RIGHT?!l:!l||r))},uu=(e,t)=>e===ln.RIGHT&&0===t,du={root:C.scrollbarFiller,header:C["scrollbarFiller--header"],borderTop:C["scrollbarFiller--borderTop"],borderBottom:C["scrollbarFiller--borderBottom"],pinnedRight:C["scrollbarFiller--pinnedRight"]};function pu(e){let{header:t,borderTop:o=!0,borderBottom:n,pinnedRight:r}=e;return(0,q.jsx)("div",{role:"presentation",className:(0,c.A)(du.root,t&&du.header,o&&du.borderTop,n&&du.borderBottom,r&&du.pinnedRight)})}const fu=(e,t)=>{if(e)if(t){if(e===ln.LEFT)return"right";if(e===ln.RIGHT)return"left"}else{if(e===ln.LEFT)return"left";if(e===ln.RIGHT)return"right"}};function gu(e,t,o,n){const r=fu(o,t);return r&&void 0!==n?(e[r]=n,e):e}const hu=["skeletonRowsCount","visibleColumns","showFirstRowBorder"],mu=(0,et.A)("div",{name:"MuiDataGrid",slot:"SkeletonLoadingOverlay"})({minWidth:"100%",width:"max-content",height:"100%",overflow:"clip"}),vu=e=>parseInt(e.getAttribute("data-colindex"),10),bu=a(function(e,t){const o=W(),{slots:l}=o,i=(0,Hn.I)(),a=(e=>{const{classes:t}=e;return(0,p.A)({root:["skeletonLoadingOverlay"]},w,t)})({classes:o.classes}),d=r.useRef(null),f=(0,u.A)(d,t),g=Xe(),h=D(g,tt),m=D(g,ot),v=D(g,Be),b=r.useMemo(()=>v.filter(e=>e<=m).length,[m,v]),{skeletonRowsCount:y,visibleColumns:A,showFirstRowBorder:x}=e,S=(0,s.A)(e,hu),R=D(g,Oe),M=r.useMemo(()=>R.slice(0,b),[R,b]),I=D(g,je),P=r.useCallback(e=>-1!==I.left.findIndex(t=>t.field===e)?ln.LEFT:-1!==I.right.findIndex(t=>t.field===e)?ln.RIGHT:void 0,[I.left,I.right]),k=r.useMemo(()=>{const e=[];for(let t=0;t<y;t+=1){const r=[];for(let e=0;e<M.length;e+=1){const a=M[e],s=P(a.field),u=s===ln.LEFT,d=s===ln.RIGHT,p=fu(s,i),f=p?I[p].length:M.length-I.left.length-I.right.length,g=p?I[p].findIndex(e=>e.field===a.field):e-I.left.length,m=h.hasScrollY?h.scrollbarSize:0,b=gu({},i,s,su(s,a.computedWidth,e,v,h.columnsTotalWidth,m)),w=h.columnsTotalWidth<h.viewportOuterSize.width,y=cu(s,g,f,o.showCellVerticalBorder,w),x=uu(s,g),S=e===M.length-1,R=d&&0===g,k=R&&w,E=S&&!R&&w,F=h.viewportOuterSize.width-h.columnsTotalWidth,T=Math.max(0,F),H=(0,q.jsx)(l.skeletonCell,{width:T,empty:!0},"skeleton-filler-column-".concat(t)),D=S&&0!==m;k&&r.push(H),r.push((0,q.jsx)(l.skeletonCell,{field:a.field,type:a.type,align:a.align,width:"var(--width)",height:h.rowHeight,"data-colindex":e,empty:A&&!A.has(a.field),className:(0,c.A)(u&&C["cell--pinnedLeft"],d&&C["cell--pinnedRight"],y&&C["cell--withRightBorder"],x&&C["cell--withLeftBorder"]),style:(0,n.A)({"--width":"".concat(a.computedWidth,"px")},b)},"skeleton-column-".concat(t,"-").concat(a.field))),E&&r.push(H),D&&r.push((0,q.jsx)(pu,{pinnedRight:I.right.length>0},"skeleton-scrollbar-filler-".concat(t)))}e.push((0,q.jsx)("div",{className:(0,c.A)(C.row,C.rowSkeleton,0===t&&!x&&C["row--firstVisible"]),children:r},"skeleton-row-".concat(t)))}return e},[y,M,P,i,I,h.hasScrollY,h.scrollbarSize,h.columnsTotalWidth,h.viewportOuterSize.width,h.rowHeight,v,o.showCellVerticalBorder,l,A,x]);return Ht(g,"columnResize",e=>{var t;const{colDef:o,width:n}=e,r=null===(t=d.current)||void 0===t?void 0:t.querySelectorAll('[data-field="'.concat(os(o.field),'"]'));if(!r)throw new Error("MUI X: Expected skeleton cells to be defined with `data-field` attribute.");const l=M.findIndex(e=>e.field===o.field),i=P(o.field),a=i===ln.LEFT,s=i===ln.RIGHT,c=getComputedStyle(r[0]).getPropertyValue("--width"),u=parseInt(c,10)-n;if(r&&r.forEach(e=>{e.style.setProperty("--width","".concat(n,"px"))}),a){var p;const e=null===(p=d.current)||void 0===p?void 0:p.querySelectorAll(".".concat(C["cell--pinnedLeft"]));null===e||void 0===e||e.forEach(e=>{vu(e)>l&&(e.style.left="".concat(parseInt(getComputedStyle(e).left,10)-u,"px"))})}if(s){var f;const e=null===(f=d.current)||void 0===f?void 0:f.querySelectorAll(".".concat(C["cell--pinnedRight"]));null===e||void 0===e||e.forEach(e=>{vu(e)<l&&(e.style.right="".concat(parseInt(getComputedStyle(e).right,10)+u,"px"))})}}),(0,q.jsx)(mu,(0,n.A)({className:a.root},S,{ref:f,children:k}))});const wu=a(function(e,t){var o;const r=D(Xe(),tt),l=null!==(o=null===r||void 0===r?void 0:r.viewportInnerSize.height)&&void 0!==o?o:0,i=Math.ceil(l/r.rowHeight);return(0,q.jsx)(bu,(0,n.A)({},e,{skeletonRowsCount:i,ref:t}))});const Cu=["variant","noRowsVariant","style"],yu={"circular-progress":{component:e=>e.slots.baseCircularProgress,style:{}},"linear-progress":{component:e=>e.slots.baseLinearProgress,style:{display:"block"}},skeleton:{component:()=>wu,style:{display:"block"}}},Au=a(function(e,t){const{variant:o="linear-progress",noRowsVariant:r="skeleton",style:l}=e,i=(0,s.A)(e,Cu),a=Xe(),c=W(),u=D(a,ft),d=yu[0===u?r:o],p=d.component(c);return(0,q.jsx)(au,(0,n.A)({style:(0,n.A)({},d.style,l)},i,{ref:t,children:(0,q.jsx)(p,{})}))});const xu=a(function(e,t){const o=Xe().current.getLocaleText("noRowsLabel");return(0,q.jsx)(au,(0,n.A)({},e,{ref:t,children:o}))});const Su=a(function(e,t){var o;const r=W(),l=Xe(),i=D(l,Ee),a=!r.disableColumnSelector&&i.length>0;return(0,q.jsxs)(au,(0,n.A)({},e,{ref:t,children:[l.current.getLocaleText("noColumnsOverlayLabel"),a&&(0,q.jsx)(r.slots.baseButton,(0,n.A)({size:"small"},null===(o=r.slotProps)||void 0===o?void 0:o.baseButton,{onClick:()=>{l.current.showPreferences(qe.columns)},children:l.current.getLocaleText("noColumnsOverlayManageColumns")}))]}))});const Ru=(0,m.Ay)(Bt)({maxHeight:"calc(100% + 1px)",flexGrow:1});const Mu=["className"],Iu=(0,et.A)("div",{name:"MuiDataGrid",slot:"PanelContent"})({display:"flex",flexDirection:"column",overflow:"auto",flex:"1 1",maxHeight:400,padding:S.spacing(2.5,1.5,2,1),gap:S.spacing(2.5)});function Pu(e){const{className:t}=e,o=(0,s.A)(e,Mu),r=W(),l=(e=>{const{classes:t}=e;return(0,p.A)({root:["panelContent"]},w,t)})(r);return(0,q.jsx)(Iu,(0,n.A)({className:(0,c.A)(l.root,t),ownerState:r},o))}const ku=["className"],Eu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"PanelFooter"})({padding:S.spacing(1),display:"flex",justifyContent:"space-between",borderTop:"1px solid ".concat(S.colors.border.base)});function Fu(e){const{className:t}=e,o=(0,s.A)(e,ku),r=W(),l=(e=>{const{classes:t}=e;return(0,p.A)({root:["panelFooter"]},w,t)})(r);return(0,q.jsx)(Eu,(0,n.A)({className:(0,c.A)(l.root,t),ownerState:r},o))}const Tu=["className"],Hu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"PanelWrapper"})({display:"flex",flexDirection:"column",flex:1,"&:focus":{outline:0}}),Du=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,Tu),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["panelWrapper"]},w,t)})(l);return(0,q.jsx)(Hu,(0,n.A)({tabIndex:-1,className:(0,c.A)(i.root,o),ownerState:l},r,{ref:t}))});const Ou=["item","hasMultipleFilters","deleteFilter","applyFilterChanges","showMultiFilterOperators","disableMultiFilterOperator","applyMultiFilterOperatorChanges","focusElementRef","logicOperators","columnsSort","filterColumns","deleteIconProps","logicOperatorInputProps","operatorInputProps","columnInputProps","valueInputProps","readOnly","children"],zu=["InputComponentProps"],Lu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterForm"})({display:"flex",gap:S.spacing(1.5)}),ju=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterFormDeleteIcon"})({flexShrink:0,display:"flex",justifyContent:"center",alignItems:"center"}),Nu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterFormLogicOperatorInput"})({minWidth:75,justifyContent:"end"}),Bu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterFormColumnInput"})({width:150}),Vu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterFormOperatorInput"})({width:150}),Gu=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"FilterFormValueInput"})({width:190}),Wu=e=>e.headerName||e.field,Uu=new Intl.Collator,Ku=a(function(e,t){var o,l,i,a,u,f,g,h,m;const{item:v,hasMultipleFilters:b,deleteFilter:C,applyFilterChanges:y,showMultiFilterOperators:A,disableMultiFilterOperator:x,applyMultiFilterOperatorChanges:S,focusElementRef:R,logicOperators:M=[so.And,so.Or],columnsSort:I,filterColumns:P,deleteIconProps:k={},logicOperatorInputProps:E={},operatorInputProps:F={},columnInputProps:T={},valueInputProps:H={},readOnly:O}=e,z=(0,s.A)(e,Ou),L=Xe(),j=D(L,Fe),N=D(L,Ve),B=D(L,Cr),V=(0,Zt.A)(),G=(0,Zt.A)(),U=(0,Zt.A)(),K=(0,Zt.A)(),_=W(),X=(e=>{const{classes:t}=e;return(0,p.A)({root:["filterForm"],deleteIcon:["filterFormDeleteIcon"],logicOperatorInput:["filterFormLogicOperatorInput"],columnInput:["filterFormColumnInput"],operatorInput:["filterFormOperatorInput"],valueInput:["filterFormValueInput"]},w,t)})(_),Y=r.useRef(null),Q=r.useRef(null),$=null!==(o=B.logicOperator)&&void 0!==o?o:so.And,Z=b&&M.length>0,J=null!==(i=((null===(l=_.slotProps)||void 0===l?void 0:l.baseSelect)||{}).native)&&void 0!==i&&i,ee=(null===(a=_.slotProps)||void 0===a?void 0:a.baseSelectOption)||{},{InputComponentProps:te}=H,oe=(0,s.A)(H,zu),ne=D(L,jr),re=D(L,Br),{filteredColumns:le,selectedField:ie}=r.useMemo(()=>{let e=v.field;const t=!1===j[v.field].filterable?j[v.field]:null;if(t)return{filteredColumns:[t],selectedField:e};if(ne)return{filteredColumns:N.filter(e=>void 0!==re.get(e.field)),selectedField:e};if(void 0===P||"function"!==typeof P)return{filteredColumns:N,selectedField:e};const o=P({field:v.field,columns:N,currentFilters:(null===B||void 0===B?void 0:B.items)||[]});return{filteredColumns:N.filter(t=>{const n=o.includes(t.field);return t.field!==v.field||n||(e=void 0),n}),selectedField:e}},[v.field,j,ne,P,N,null===B||void 0===B?void 0:B.items,re]),ae=r.useMemo(()=>{switch(I){case"asc":return le.sort((e,t)=>Uu.compare(Wu(e),Wu(t)));case"desc":return le.sort((e,t)=>-Uu.compare(Wu(e),Wu(t)));default:return le}},[le,I]),se=v.field?L.current.getColumn(v.field):null,ce=r.useMemo(()=>{var e;return v.operator&&se?null===(e=se.filterOperators)||void 0===e?void 0:e.find(e=>e.value===v.operator):null},[v,se]),ue=r.useCallback(e=>{const t=e.target.value,o=L.current.getColumn(t);if(o.field===se.field)return;const r=o.filterOperators.find(e=>e.value===v.operator)||o.filterOperators[0];let l=!r.InputComponent||r.InputComponent!==(null===ce||void 0===ce?void 0:ce.InputComponent)||o.type!==se.type?void 0:v.value;if("singleSelect"===o.type&&void 0!==l){const e=o,t=An(e);Array.isArray(l)?l=l.filter(o=>void 0!==xn(o,t,null===e||void 0===e?void 0:e.getOptionValue)):void 0===xn(v.value,t,null===e||void 0===e?void 0:e.getOptionValue)&&(l=void 0)}y((0,n.A)({},v,{field:t,operator:r.value,value:l}))},[L,y,v,se,ce]),de=r.useCallback(e=>{const t=e.target.value,o=null===se||void 0===se?void 0:se.filterOperators.find(e=>e.value===t),r=!(null!==o&&void 0!==o&&o.InputComponent)||(null===o||void 0===o?void 0:o.InputComponent)!==(null===ce||void 0===ce?void 0:ce.InputComponent);y((0,n.A)({},v,{operator:t,value:r?void 0:v.value}))},[y,v,se,ce]),pe=r.useCallback(e=>{const t=e.target.value===so.And.toString()?so.And:so.Or;S(t)},[S]);return r.useImperativeHandle(R,()=>({focus:()=>{var e;null!==ce&&void 0!==ce&&ce.InputComponent?null===Y||void 0===Y||null===(e=Y.current)||void 0===e||e.focus():Q.current.focus()}}),[ce]),(0,q.jsxs)(Lu,(0,n.A)({className:X.root,"data-id":v.id,ownerState:_},z,{ref:t,children:[(0,q.jsx)(ju,(0,n.A)({},k,{className:(0,c.A)(X.deleteIcon,k.className),ownerState:_,children:(0,q.jsx)(_.slots.baseIconButton,(0,n.A)({"aria-label":L.current.getLocaleText("filterPanelDeleteIconLabel"),title:L.current.getLocaleText("filterPanelDeleteIconLabel"),onClick:()=>{C(v)},size:"small",disabled:O},null===(u=_.slotProps)||void 0===u?void 0:u.baseIconButton,{children:(0,q.jsx)(_.slots.filterPanelDeleteIcon,{fontSize:"small"})}))})),(0,q.jsx)(Nu,(0,n.A)({as:_.slots.baseSelect,sx:[Z?{display:"flex"}:{display:"none"},A?{visibility:"visible"}:{visibility:"hidden"},E.sx],className:(0,c.A)(X.logicOperatorInput,E.className),ownerState:_},E,{size:"small",slotProps:{htmlInput:{"aria-label":L.current.getLocaleText("filterPanelLogicOperator")}},value:null!==$&&void 0!==$?$:"",onChange:pe,disabled:!!x||1===M.length,native:J},null===(f=_.slotProps)||void 0===f?void 0:f.baseSelect,{children:M.map(e=>(0,r.createElement)(_.slots.baseSelectOption,(0,n.A)({},ee,{native:J,key:e.toString(),value:e.toString()}),L.current.getLocaleText((e=>{switch(e){case so.And:return"filterPanelOperatorAnd";case so.Or:return"filterPanelOperatorOr";default:throw new Error("MUI X: Invalid `logicOperator` property in the `GridFilterPanel`.")}})(e))))})),(0,q.jsx)(Bu,(0,n.A)({as:_.slots.baseSelect},T,{className:(0,c.A)(X.columnInput,T.className),ownerState:_,size:"small",labelId:G,id:V,label:L.current.getLocaleText("filterPanelColumns"),value:null!==ie&&void 0!==ie?ie:"",onChange:ue,native:J,disabled:O},null===(g=_.slotProps)||void 0===g?void 0:g.baseSelect,{children:ae.map(e=>(0,r.createElement)(_.slots.baseSelectOption,(0,n.A)({},ee,{native:J,key:e.field,value:e.field}),Wu(e)))})),(0,q.jsx)(Vu,(0,n.A)({as:_.slots.baseSelect,size:"small"},F,{className:(0,c.A)(X.operatorInput,F.className),ownerState:_,labelId:K,label:L.current.getLocaleText("filterPanelOperator"),id:U,value:v.operator,onChange:de,native:J,inputRef:Q,disabled:O},null===(h=_.slotProps)||void 0===h?void 0:h.baseSelect,{children:null===se||void 0===se||null===(m=se.filterOperators)||void 0===m?void 0:m.map(e=>(0,r.createElement)(_.slots.baseSelectOption,(0,n.A)({},ee,{native:J,key:e.value,value:e.value}),e.label||L.current.getLocaleText("filterOperator".concat((0,d.A)(e.value)))))})),(0,q.jsx)(Gu,(0,n.A)({},oe,{className:(0,c.A)(X.valueInput,oe.className),ownerState:_,children:null!==ce&&void 0!==ce&&ce.InputComponent?(0,q.jsx)(ce.InputComponent,(0,n.A)({apiRef:L,item:v,applyValue:y,focusElementRef:Y,disabled:O,slotProps:{root:{size:"small"}}},ce.InputComponentProps,te),v.field):null}))]}))});const qu=["logicOperators","columnsSort","filterFormProps","getColumnForNewFilter","children","disableAddFilterButton","disableRemoveAllButton"],_u=e=>({field:e.field,operator:e.filterOperators[0].value,id:Math.round(1e5*Math.random())}),Xu=a(function(e,t){var o,l;const i=Xe(),a=W(),c=D(i,Cr),u=D(i,Ve),d=D(i,Ge),p=r.useRef(null),f=r.useRef(null),{logicOperators:g=[so.And,so.Or],columnsSort:h,filterFormProps:m,getColumnForNewFilter:v,disableAddFilterButton:b=!1,disableRemoveAllButton:w=!1}=e,C=(0,s.A)(e,qu),y=i.current.upsertFilterItem,A=r.useCallback(e=>{i.current.setFilterLogicOperator(e)},[i]),x=r.useCallback(()=>{let e;if(v&&"function"===typeof v){const t=v({currentFilters:(null===c||void 0===c?void 0:c.items)||[],columns:u});if(null===t)return null;e=u.find(e=>{let{field:o}=e;return o===t})}else e=u.find(e=>{var t;return null===(t=e.filterOperators)||void 0===t?void 0:t.length});return e?_u(e):null},[null===c||void 0===c?void 0:c.items,u,v]),S=r.useCallback(()=>{if(void 0===v||"function"!==typeof v)return x();const e=c.items.length?c.items:[x()].filter(Boolean),t=v({currentFilters:e,columns:u});if(null===t)return null;const o=u.find(e=>{let{field:o}=e;return o===t});return o?_u(o):null},[c.items,u,v,x]),R=r.useMemo(()=>c.items.length?c.items:(f.current||(f.current=x()),f.current?[f.current]:[]),[c.items,x]),M=R.length>1,{readOnlyFilters:I,validFilters:P}=r.useMemo(()=>R.reduce((e,t)=>(d[t.field]?e.validFilters.push(t):e.readOnlyFilters.push(t),e),{readOnlyFilters:[],validFilters:[]}),[R,d]),k=r.useCallback(()=>{const e=S();e&&i.current.upsertFilterItems([...R,e])},[i,S,R]),E=r.useCallback(e=>{const t=1===P.length;i.current.deleteFilterItem(e),t&&i.current.hideFilterPanel()},[i,P.length]),F=r.useCallback(()=>1===P.length&&void 0===P[0].value?(i.current.deleteFilterItem(P[0]),i.current.hideFilterPanel()):i.current.setFilterModel((0,n.A)({},c,{items:I}),"removeAllFilterItems"),[i,I,c,P]);return r.useEffect(()=>{g.length>0&&c.logicOperator&&!g.includes(c.logicOperator)&&A(g[0])},[g,A,c.logicOperator]),r.useEffect(()=>{P.length>0&&p.current.focus()},[P.length]),(0,q.jsxs)(Du,(0,n.A)({},C,{ref:t,children:[(0,q.jsxs)(Pu,{children:[I.map((e,t)=>(0,q.jsx)(Ku,(0,n.A)({item:e,applyFilterChanges:y,deleteFilter:E,hasMultipleFilters:M,showMultiFilterOperators:t>0,disableMultiFilterOperator:1!==t,applyMultiFilterOperatorChanges:A,focusElementRef:null,readOnly:!0,logicOperators:g,columnsSort:h},m),null==e.id?t:e.id)),P.map((e,t)=>(0,q.jsx)(Ku,(0,n.A)({item:e,applyFilterChanges:y,deleteFilter:E,hasMultipleFilters:M,showMultiFilterOperators:I.length+t>0,disableMultiFilterOperator:I.length+t!==1,applyMultiFilterOperatorChanges:A,focusElementRef:t===P.length-1?p:null,logicOperators:g,columnsSort:h},m),null==e.id?t+I.length:e.id))]}),a.disableMultipleColumnsFiltering||b&&w?null:(0,q.jsxs)(Fu,{children:[b?(0,q.jsx)("span",{}):(0,q.jsx)(a.slots.baseButton,(0,n.A)({onClick:k,startIcon:(0,q.jsx)(a.slots.filterPanelAddIcon,{})},null===(o=a.slotProps)||void 0===o?void 0:o.baseButton,{children:i.current.getLocaleText("filterPanelAddFilter")})),!w&&P.length>0?(0,q.jsx)(a.slots.baseButton,(0,n.A)({onClick:F,startIcon:(0,q.jsx)(a.slots.filterPanelRemoveAllIcon,{})},null===(l=a.slotProps)||void 0===l?void 0:l.baseButton,{children:i.current.getLocaleText("filterPanelRemoveAll")})):null]})]}))});var Yu=o(8031);const Qu=(e,t)=>(e.headerName||e.field).toLowerCase().indexOf(t)>-1;var $u,Zu=o(7528),Ju=o(3290);const ed=["children"],td=(0,Ju.i7)({from:{opacity:0},to:{opacity:1}}),od=(0,Ju.i7)({"from, to":{"--scrollable":'" "'}}),nd=(0,et.A)("div",{name:"MuiDataGrid",slot:"ShadowScrollArea"})($u||($u=(0,Zu.A)(["\n  flex: 1;\n  display: flex;\n  flex-direction: column;\n  animation: ",";\n  animation-timeline: --scroll-timeline;\n  animation-fill-mode: none;\n  box-sizing: border-box;\n  overflow: auto;\n  scrollbar-width: thin;\n  scroll-timeline: --scroll-timeline block;\n\n  &::before,\n  &::after {\n    content: '';\n    flex-shrink: 0;\n    display: block;\n    position: sticky;\n    left: 0;\n    width: 100%;\n    height: 4px;\n    animation: "," linear both;\n    animation-timeline: --scroll-timeline;\n\n    // Custom property toggle trick:\n    // - Detects if the element is scrollable\n    // - https://css-tricks.com/the-css-custom-property-toggle-trick/\n    --visibility-scrollable: var(--scrollable) visible;\n    --visibility-not-scrollable: hidden;\n    visibility: var(--visibility-scrollable, var(--visibility-not-scrollable));\n  }\n\n  &::before {\n    top: 0;\n    background: linear-gradient(to bottom, rgba(0, 0, 0, 0.05) 0, transparent 100%);\n    animation-range: 0 4px;\n  }\n\n  &::after {\n    bottom: 0;\n    background: linear-gradient(to top, rgba(0, 0, 0, 0.05) 0, transparent 100%);\n    animation-direction: reverse;\n    animation-range: calc(100% - 4px) 100%;\n  }\n"])),od,td),rd=a(function(e,t){const{children:o}=e,r=(0,s.A)(e,ed);return(0,q.jsx)(nd,(0,n.A)({},r,{ref:t,children:o}))});const ld=new Intl.Collator;const id=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"ColumnsManagement"})({display:"flex",flexDirection:"column",padding:S.spacing(.5,1.5)}),ad=(0,m.Ay)(rd,{name:"MuiDataGrid",slot:"ColumnsManagementScrollArea"})({maxHeight:300}),sd=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"ColumnsManagementHeader"})({padding:S.spacing(1.5,2),borderBottom:"1px solid ".concat(S.colors.border.base)}),cd=(0,m.Ay)(Bt,{name:"MuiDataGrid",slot:"ColumnsManagementSearchInput"})({["& .".concat(Yu.A.input,"::-webkit-search-decoration,\n      & .").concat(Yu.A.input,"::-webkit-search-cancel-button,\n      & .").concat(Yu.A.input,"::-webkit-search-results-button,\n      & .").concat(Yu.A.input,"::-webkit-search-results-decoration")]:{display:"none"}}),ud=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"ColumnsManagementFooter"})({padding:S.spacing(1,1,1,1.5),display:"flex",justifyContent:"space-between",borderTop:"1px solid ".concat(S.colors.border.base)}),dd=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"ColumnsManagementEmptyText"})({padding:S.spacing(1,0),alignSelf:"center",font:S.typography.font.body}),pd=(0,m.Ay)(Bt,{name:"MuiDataGrid",slot:"ColumnsManagementRow"})({}),fd=["children","className","classes","onClose"],gd=(0,b.A)("MuiDataGrid",["panel","paper"]),hd=(0,m.Ay)(Bt,{name:"MuiDataGrid",slot:"panel"})({zIndex:S.zIndex.panel}),md=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"panelContent"})({backgroundColor:S.colors.background.overlay,borderRadius:S.radius.base,boxShadow:S.shadows.overlay,display:"flex",maxWidth:"calc(100vw - ".concat(S.spacing(2),")"),overflow:"auto"}),vd=a((e,t)=>{var o,l;const{children:i,className:a,onClose:u}=e,d=(0,s.A)(e,fd),p=Xe(),f=W(),g=gd,[h,m]=r.useState(!1),v=X(),b=(0,It.A)(()=>m(!0)),w=(0,It.A)(()=>m(!1)),C=(0,It.A)(()=>{null===u||void 0===u||u()}),y=(0,It.A)(e=>{"Escape"===e.key&&(null===u||void 0===u||u())}),[A,x]=r.useState(null);return r.useEffect(()=>{var e;const t=null===(e=p.current.rootElementRef)||void 0===e||null===(e=e.current)||void 0===e?void 0:e.querySelector('[data-id="gridPanelAnchor"]');t&&x(t)},[p]),A?(0,q.jsx)(hd,(0,n.A)({as:f.slots.basePopper,ownerState:f,placement:"bottom-end",className:(0,c.A)(g.panel,a,v),flip:!0,onDidShow:b,onDidHide:w,onClickAway:C,clickAwayMouseEvent:"onPointerUp",clickAwayTouchEvent:!1,focusTrap:!0},d,null===(o=f.slotProps)||void 0===o?void 0:o.basePopper,{target:null!==(l=e.target)&&void 0!==l?l:A,ref:t,children:(0,q.jsx)(md,{className:g.paper,ownerState:f,onKeyDown:y,children:h&&i})})):null});const bd=ge(me(e=>e.rowReorder),e=>{var t;return null!==(t=null===e||void 0===e?void 0:e.isActive)&&void 0!==t&&t}),wd=["selected","rowId","row","index","style","rowHeight","className","visibleColumns","pinnedColumns","offsetLeft","columnsTotalWidth","firstColumnIndex","lastColumnIndex","focusedColumnIndex","isFirstVisible","isLastVisible","isNotVisible","showBottomBorder","scrollbarWidth","gridHasFiller","onClick","onDoubleClick","onMouseEnter","onMouseLeave","onMouseOut","onMouseOver"],Cd=ge(vs,(e,t)=>{let{rowReordering:o,treeData:n}=t;if(!o||n)return!1;return!!fr(e)}),yd=a(function(e,t){const{selected:o,rowId:l,row:i,index:a,style:d,rowHeight:f,className:g,visibleColumns:h,pinnedColumns:m,offsetLeft:v,columnsTotalWidth:b,firstColumnIndex:y,lastColumnIndex:A,focusedColumnIndex:x,isFirstVisible:S,isLastVisible:R,isNotVisible:M,showBottomBorder:I,scrollbarWidth:P,gridHasFiller:E,onClick:F,onDoubleClick:T,onMouseEnter:H,onMouseLeave:O,onMouseOut:L,onMouseOver:j}=e,N=(0,s.A)(e,wd),B=z(),V=K(),G=r.useRef(null),U=W(),_=la(B),X=D(B,vr),Y=D(B,Be),Q=U.rowReordering,$=U.treeData,Z=D(B,Cd,{rowReordering:Q,treeData:$}),J=D(B,bd),ee=(0,u.A)(G,t),te=bt(B,l),oe=D(B,bs,{rowId:l,editMode:U.editMode}),ne=U.editMode===bn.Row,re=void 0!==x,le=re&&x>=m.left.length&&x<y,ie=re&&x<h.length-m.right.length&&x>=A,ae=function(e,t){return(0,p.A)(t,w,e)}(U.classes,{root:["row",o&&"selected",ne&&"row--editable",oe&&"row--editing",S&&"row--firstVisible",R&&"row--lastVisible",I&&"row--borderBottom","auto"===f&&"row--dynamicHeight"]}),se=V.hooks.useGridRowAriaAttributes();r.useLayoutEffect(()=>{if(_.range){const e=B.current.getRowIndexRelativeToVisibleRows(l);void 0!==e&&B.current.unstable_setLastMeasuredRowIndex(e)}if(G.current&&"auto"===f)return B.current.observeRowHeight(G.current,l)},[B,_.range,f,l]);const ce=r.useCallback((e,t)=>o=>{rs(o)||B.current.getRow(l)&&(B.current.publishEvent(e,B.current.getRowParams(l),o),t&&t(o))},[B,l]),ue=r.useCallback(e=>{const t=ts(e.target,C.cell),o=null===t||void 0===t?void 0:t.getAttribute("data-field");if(o){if(o===Ra.field)return;if(o===rn)return;if("__reorder__"===o)return;if(B.current.getCellMode(l,o)===wn.Edit)return;const e=B.current.getColumn(o);if((null===e||void 0===e?void 0:e.type)===Wn)return}ce("rowClick",F)(e)},[B,F,ce,l]),{slots:de,slotProps:pe,disableColumnReorder:fe}=U,ge=D(B,()=>(0,n.A)({},B.current.getRowHeightEntry(l)),void 0,k),he=r.useMemo(()=>{if(M)return{opacity:0,width:0,height:0};const e=(0,n.A)({},d,{maxHeight:"auto"===f?"none":f,minHeight:f,"--height":"number"===typeof f?"".concat(f,"px"):f});if(ge.spacingTop){e["border"===U.rowSpacingType?"borderTopWidth":"marginTop"]=ge.spacingTop}if(ge.spacingBottom){const t="border"===U.rowSpacingType?"borderBottomWidth":"marginBottom";let o=e[t];"number"!==typeof o&&(o=parseInt(o||"0",10)),o+=ge.spacingBottom,e[t]=o}return e},[M,f,d,ge,U.rowSpacingType]);if(!te)return null;const me=B.current.unstable_applyPipeProcessors("rowClassName",[],l),ve=se(te,a);if("function"===typeof U.getRowClassName){var be;const e=a-((null===(be=_.range)||void 0===be?void 0:be.firstRowIndex)||0),t=(0,n.A)({},B.current.getRowParams(l),{isFirstVisible:0===e,isLastVisible:e===_.rows.length-1,indexRelativeToCurrentPage:e});me.push(U.getRowClassName(t))}const we=function(e,t,o,r){var a,s;let c=arguments.length>4&&void 0!==arguments[4]?arguments[4]:ln.NONE;const u=B.current.unstable_getCellColSpanInfo(l,o);if(null!==u&&void 0!==u&&u.spannedByColSpan)return null;const d=null!==(a=null===u||void 0===u?void 0:u.cellProps.width)&&void 0!==a?a:e.computedWidth,p=null!==(s=null===u||void 0===u?void 0:u.cellProps.colSpan)&&void 0!==s?s:1,g=su(c,e.computedWidth,o,Y,b,P);if("skeletonRow"===te.type)return(0,q.jsx)(de.skeletonCell,{type:e.type,width:d,height:f,field:e.field,align:e.align},e.field);const h="__reorder__"===e.field,m=!(fe||e.disableReorder),v=Z&&!X.length,w=!(m||h&&v||J),C=c===ln.VIRTUAL,y=uu(c,t),A=cu(c,t,r,U.showCellVerticalBorder,E);return(0,q.jsx)(de.cell,(0,n.A)({column:e,width:d,rowId:l,align:e.align||"left",colIndex:o,colSpan:p,disableDragEvents:w,isNotVisible:C,pinnedOffset:g,pinnedPosition:c,showLeftBorder:y,showRightBorder:A,row:i,rowNode:te},null===pe||void 0===pe?void 0:pe.cell),e.field)};const Ce=m.left.map((e,t)=>we(e,t,t,m.left.length,ln.LEFT)),ye=m.right.map((e,t)=>{const o=h.length-m.right.length+t;return we(e,t,o,m.right.length,ln.RIGHT)}),Ae=h.length-m.left.length-m.right.length,xe=[];le&&xe.push(we(h[x],x-m.left.length,x,Ae,ln.VIRTUAL));for(let n=y;n<A;n+=1){const e=h[n],t=n-m.left.length;e&&xe.push(we(e,t,n,Ae))}ie&&xe.push(we(h[x],x-m.left.length,x,Ae,ln.VIRTUAL));const Se=i?{onClick:ue,onDoubleClick:ce("rowDoubleClick",T),onMouseEnter:ce("rowMouseEnter",H),onMouseLeave:ce("rowMouseLeave",O),onMouseOut:ce("rowMouseOut",L),onMouseOver:ce("rowMouseOver",j)}:null;return(0,q.jsxs)("div",(0,n.A)({"data-id":l,"data-rowindex":a,role:"row",className:(0,c.A)(...me,ae.root,g),style:he},ve,Se,N,{ref:ee,children:[Ce,(0,q.jsx)("div",{role:"presentation",className:C.cellOffsetLeft,style:{width:v}}),xe,(0,q.jsx)("div",{role:"presentation",className:(0,c.A)(C.cell,C.cellEmpty)}),ye,0!==P&&(0,q.jsx)(pu,{pinnedRight:m.right.length>0,borderTop:!S})]}))});const Ad=h(yd);let xd;function Sd(){return void 0===xd&&document.createElement("div").focus({get preventScroll(){return xd=!0,!1}}),xd}const Rd=["column","row","rowId","rowNode","align","children","colIndex","width","className","style","colSpan","disableDragEvents","isNotVisible","pinnedOffset","pinnedPosition","showRightBorder","showLeftBorder","onClick","onDoubleClick","onMouseDown","onMouseUp","onMouseOver","onKeyDown","onKeyUp","onDragEnter","onDragOver"],Md=["changeReason","unstable_updateValueOnRender"];ln.LEFT,Se.LEFT,ln.RIGHT,Se.RIGHT,ln.NONE,ln.VIRTUAL;const Id=a(function(e,t){var o,l,i,a,f,g;const{column:h,row:m,rowId:v,rowNode:b,align:y,colIndex:A,width:x,className:S,style:R,colSpan:M,disableDragEvents:I,isNotVisible:P,pinnedOffset:k,pinnedPosition:E,showRightBorder:F,showLeftBorder:T,onClick:H,onDoubleClick:O,onMouseDown:L,onMouseUp:j,onMouseOver:N,onKeyDown:B,onKeyUp:V,onDragEnter:G,onDragOver:U}=e,_=(0,s.A)(e,Rd),X=z(),Y=W(),Q=(0,Hn.I)(),$=h.field,Z=D(X,ws,{rowId:v,field:$}),J=K().hooks.useCellAggregationResult(v,$),ee=Z?wn.Edit:wn.View,te=X.current.getCellParamsForRow(v,$,m,{colDef:h,cellMode:ee,rowNode:b,tabIndex:D(X,()=>{const e=qr(X);return e&&e.field===$&&e.id===v?0:-1}),hasFocus:D(X,()=>{const e=Gr(X);return(null===e||void 0===e?void 0:e.id)===v&&e.field===$})});te.api=X.current,J&&(te.value=J.value,te.formattedValue=h.valueFormatter?h.valueFormatter(te.value,m,h,X):te.value);const oe=D(X,()=>X.current.unstable_applyPipeProcessors("isCellSelected",!1,{id:v,field:$})),ne=X.current.virtualizer.store,re=si(ne,Vi.selectors.hiddenCells),le=si(ne,Vi.selectors.spannedCells),{hasFocus:ie,isEditable:ae=!1,value:se}=te,ce="actions"===h.type&&"getActions"in h&&"function"===typeof h.getActions&&h.getActions(X.current.getRowParams(v)).some(e=>!e.props.disabled),ue="view"!==ee&&ae||ce?-1:te.tabIndex,{classes:de,getCellClassName:pe}=Y,fe=[D(X,()=>X.current.unstable_applyPipeProcessors("cellClassName",[],{id:v,field:$}).filter(Boolean).join(" "))];h.cellClassName&&fe.push("function"===typeof h.cellClassName?h.cellClassName(te):h.cellClassName),"flex"===h.display&&fe.push(C["cell--flex"]),pe&&fe.push(pe(te));const ge=null!==(o=te.formattedValue)&&void 0!==o?o:se,he=r.useRef(null),me=(0,u.A)(t,he),ve=r.useRef(null),be=null!==(l=Y.cellSelection)&&void 0!==l&&l,we=(e=>{const{align:t,showLeftBorder:o,showRightBorder:n,pinnedPosition:r,isEditable:l,isSelected:i,isSelectionMode:a,classes:s}=e,c={root:["cell","cell--text".concat((0,d.A)(t)),i&&"selected",l&&"cell--editable",o&&"cell--withLeftBorder",n&&"cell--withRightBorder",r===ln.LEFT&&"cell--pinnedLeft",r===ln.RIGHT&&"cell--pinnedRight",a&&!l&&"cell--selectionMode"]};return(0,p.A)(c,w,s)})({align:y,showLeftBorder:T,showRightBorder:F,isEditable:ae,classes:Y.classes,pinnedPosition:E,isSelected:oe,isSelectionMode:be}),Ce=r.useCallback(e=>t=>{const o=X.current.getCellParams(v,$||"");X.current.publishEvent(e,o,t),j&&j(t)},[X,$,j,v]),ye=r.useCallback(e=>t=>{const o=X.current.getCellParams(v,$||"");X.current.publishEvent(e,o,t),L&&L(t)},[X,$,L,v]),Ae=r.useCallback((e,t)=>o=>{if(!X.current.getRow(v))return;const n=X.current.getCellParams(v,$||"");X.current.publishEvent(e,n,o),t&&t(o)},[X,$,v]),xe=null!==(i=null===(a=re[v])||void 0===a?void 0:a[A])&&void 0!==i&&i,Se=null!==(f=null===(g=le[v])||void 0===g?void 0:g[A])&&void 0!==f?f:1,Re=r.useMemo(()=>{if(P)return{padding:0,opacity:0,width:0,height:0,border:0};const e=gu((0,n.A)({"--width":"".concat(x,"px")},R),Q,E,k),t=E===ln.LEFT,o=E===ln.RIGHT;return Se>1&&(e.height="calc(var(--height) * ".concat(Se,")"),e.zIndex=10,(t||o)&&(e.zIndex=40)),e},[x,P,R,k,E,Q,Se]);if(r.useEffect(()=>{if(!ie||ee===wn.Edit)return;const e=(0,li.A)(X.current.rootElementRef.current);if(he.current&&!he.current.contains(e.activeElement)){const e=he.current.querySelector('[tabindex="0"]'),t=ve.current||e||he.current;if(Sd())t.focus({preventScroll:!0});else{const e=X.current.getScrollPosition();t.focus(),X.current.scroll(e)}}},[ie,ee,X]),xe)return(0,q.jsx)("div",{"data-colindex":A,role:"presentation",style:(0,n.A)({width:"var(--width)"},Re)});let Me,Ie,Pe=_.onFocus;if(null===Z&&h.renderCell&&(Me=h.renderCell(te)),null!==Z&&h.renderEditCell){const e=X.current.getRowWithUpdatedValues(v,h.field),t=(0,s.A)(Z,Md),o=h.valueFormatter?h.valueFormatter(Z.value,e,h,X):te.formattedValue,r=(0,n.A)({},te,{row:e,formattedValue:o},t);Me=h.renderEditCell(r),fe.push(C["cell--editing"]),fe.push(null===de||void 0===de?void 0:de["cell--editing"])}if(void 0===Me){const e=null===ge||void 0===ge?void 0:ge.toString();Me=e,Ie=e}r.isValidElement(Me)&&ce&&(Me=r.cloneElement(Me,{focusElementRef:ve}));const ke=I?null:{onDragEnter:Ae("cellDragEnter",G),onDragOver:Ae("cellDragOver",U)};return(0,q.jsx)("div",(0,n.A)({className:(0,c.A)(we.root,fe,S),role:"gridcell","data-field":$,"data-colindex":A,"aria-colindex":A+1,"aria-colspan":M,"aria-rowspan":Se,style:Re,title:Ie,tabIndex:ue,onClick:Ae("cellClick",H),onDoubleClick:Ae("cellDoubleClick",O),onMouseOver:Ae("cellMouseOver",N),onMouseDown:ye("cellMouseDown"),onMouseUp:Ce("cellMouseUp"),onKeyDown:Ae("cellKeyDown",B),onKeyUp:Ae("cellKeyUp",V)},ke,_,{onFocus:Pe,ref:me,children:Me}))});const Pd=h(Id),kd=r.memo(e=>{var t,o,l;const{colDef:i,open:a,columnMenuId:s,columnMenuButtonId:c,iconButtonRef:u}=e,d=Xe(),f=W(),g=(e=>{const{classes:t,open:o}=e,n={root:["menuIcon",o&&"menuOpen"],button:["menuIconButton"]};return(0,p.A)(n,w,t)})((0,n.A)({},e,{classes:f.classes})),h=r.useCallback(e=>{e.preventDefault(),e.stopPropagation(),d.current.toggleColumnMenu(i.field)},[d,i.field]),m=null!==(t=i.headerName)&&void 0!==t?t:i.field;return(0,q.jsx)("div",{className:g.root,children:(0,q.jsx)(f.slots.baseTooltip,(0,n.A)({title:d.current.getLocaleText("columnMenuLabel"),enterDelay:1e3},null===(o=f.slotProps)||void 0===o?void 0:o.baseTooltip,{children:(0,q.jsx)(f.slots.baseIconButton,(0,n.A)({ref:u,tabIndex:-1,className:g.button,"aria-label":d.current.getLocaleText("columnMenuAriaLabel")(m),size:"small",onClick:h,"aria-haspopup":"menu","aria-expanded":a,"aria-controls":a?s:void 0,id:c},null===(l=f.slotProps)||void 0===l?void 0:l.baseIconButton,{children:(0,q.jsx)(f.slots.columnMenuIcon,{fontSize:"inherit"})}))}))})});function Ed(e){let{columnMenuId:t,columnMenuButtonId:o,ContentComponent:r,contentComponentProps:l,field:i,open:a,target:s,onExited:c}=e;const u=Xe(),d=u.current.getColumn(i),p=(0,It.A)(e=>{e&&(e.stopPropagation(),null!==s&&void 0!==s&&s.contains(e.target))||u.current.hideColumnMenu()});return s&&d?(0,q.jsx)(Bn,{position:"bottom-".concat("right"===d.align?"start":"end"),open:a,target:s,onClose:p,onExited:c,children:(0,q.jsx)(r,(0,n.A)({colDef:d,hideMenu:p,open:a,id:t,labelledby:o},l))}):null}const Fd=["className","aria-label"],Td=(0,et.A)("div",{name:"MuiDataGrid",slot:"ColumnHeaderTitle"})({textOverflow:"ellipsis",overflow:"hidden",whiteSpace:"nowrap",fontWeight:"var(--unstable_DataGrid-headWeight)",lineHeight:"normal"}),Hd=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,Fd),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["columnHeaderTitle"]},w,t)})(l);return(0,q.jsx)(Td,(0,n.A)({className:(0,c.A)(i.root,o),ownerState:l},r,{ref:t}))});function Dd(e){var t;const{label:o,description:l}=e,i=W(),a=r.useRef(null),[s,c]=r.useState(""),u=r.useCallback(()=>{if(!l&&null!==a&&void 0!==a&&a.current){const t=(e=a.current).scrollHeight>e.clientHeight||e.scrollWidth>e.clientWidth;c(t?o:"")}var e},[l,o]);return(0,q.jsx)(i.slots.baseTooltip,(0,n.A)({title:l||s},null===(t=i.slotProps)||void 0===t?void 0:t.baseTooltip,{children:(0,q.jsx)(Hd,{onMouseOver:u,ref:a,children:o})}))}const Od=["resizable","resizing","height","side"];var zd=function(e){return e.Left="left",e.Right="right",e}(zd||{});function Ld(e){const{height:t,side:o=zd.Right}=e,l=(0,s.A)(e,Od),i=W(),a=(e=>{const{resizable:t,resizing:o,classes:n,side:r}=e,l={root:["columnSeparator",t&&"columnSeparator--resizable",o&&"columnSeparator--resizing",r&&"columnSeparator--side".concat((0,d.A)(r))],icon:["iconSeparator"]};return(0,p.A)(l,w,n)})((0,n.A)({},e,{side:o,classes:i.classes})),c=r.useCallback(e=>{e.preventDefault(),e.stopPropagation()},[]);return(0,q.jsx)("div",(0,n.A)({className:a.root,style:{minHeight:t}},l,{onClick:c,children:(0,q.jsx)(i.slots.columnResizeIcon,{className:a.icon})}))}const jd=r.memo(Ld);const Nd=["classes","columnMenuOpen","colIndex","height","isResizing","sortDirection","hasFocus","tabIndex","separatorSide","isDraggable","headerComponent","description","elementId","width","columnMenuIconButton","columnMenu","columnTitleIconButtons","headerClassName","label","resizable","draggableContainerProps","columnHeaderSeparatorProps","style"],Bd=a(function(e,t){const{classes:o,colIndex:l,height:i,isResizing:a,sortDirection:d,tabIndex:p,separatorSide:f,isDraggable:g,headerComponent:h,description:m,width:v,columnMenuIconButton:b=null,columnMenu:w=null,columnTitleIconButtons:C=null,headerClassName:y,label:A,resizable:x,draggableContainerProps:S,columnHeaderSeparatorProps:R,style:M}=e,I=(0,s.A)(e,Nd),P=W(),k=r.useRef(null),E=(0,u.A)(k,t);let F="none";return null!=d&&(F="asc"===d?"ascending":"descending"),(0,q.jsxs)("div",(0,n.A)({className:(0,c.A)(o.root,y),style:(0,n.A)({},M,{width:v}),role:"columnheader",tabIndex:p,"aria-colindex":l+1,"aria-sort":F},I,{ref:E,children:[(0,q.jsxs)("div",(0,n.A)({className:o.draggableContainer,draggable:g,role:"presentation"},S,{children:[(0,q.jsxs)("div",{className:o.titleContainer,role:"presentation",children:[(0,q.jsx)("div",{className:o.titleContainerContent,children:void 0!==h?h:(0,q.jsx)(Dd,{label:A,description:m,columnWidth:v})}),C]}),b]})),(0,q.jsx)(jd,(0,n.A)({resizable:!P.disableColumnResize&&!!x,resizing:a,height:i,side:f},R)),w]}))});const Vd=h(function(e){var t,o,l,i,a;const{colDef:s,columnMenuOpen:u,colIndex:d,headerHeight:f,isResizing:g,isLast:h,sortDirection:m,sortIndex:v,filterItemsCounter:b,hasFocus:y,tabIndex:A,disableReorder:x,separatorSide:S,showLeftBorder:R,showRightBorder:M,pinnedPosition:I,pinnedOffset:P}=e,k=z(),E=W(),F=(0,Hn.I)(),T=r.useRef(null),H=(0,Zt.A)(),D=(0,Zt.A)(),O=r.useRef(null),[L,j]=r.useState(u),N=r.useMemo(()=>!E.disableColumnReorder&&!x&&!s.disableReorder,[E.disableColumnReorder,x,s.disableReorder]);let B;s.renderHeader&&(B=s.renderHeader(k.current.getColumnHeaderParams(s.field)));const V=(e=>{const{disableColumnSorting:t}=W(),{colDef:o,classes:n,isDragging:r,sortDirection:l,showRightBorder:i,showLeftBorder:a,filterItemsCounter:s,pinnedPosition:c,isLastUnpinned:u,isSiblingFocused:d}=e,f=o.sortable&&!t,g=null!=l,h=null!=s&&s>0,m="number"===o.type,v={root:["columnHeader","left"===o.headerAlign&&"columnHeader--alignLeft","center"===o.headerAlign&&"columnHeader--alignCenter","right"===o.headerAlign&&"columnHeader--alignRight",f&&"columnHeader--sortable",r&&"columnHeader--moving",g&&"columnHeader--sorted",h&&"columnHeader--filtered",m&&"columnHeader--numeric","withBorderColor",i&&"columnHeader--withRightBorder",a&&"columnHeader--withLeftBorder",c===ln.LEFT&&"columnHeader--pinnedLeft",c===ln.RIGHT&&"columnHeader--pinnedRight",u&&"columnHeader--lastUnpinned",d&&"columnHeader--siblingFocused"],draggableContainer:["columnHeaderDraggableContainer"],titleContainer:["columnHeaderTitleContainer"],titleContainerContent:["columnHeaderTitleContainerContent"]};return(0,p.A)(v,w,n)})((0,n.A)({},e,{classes:E.classes,showRightBorder:M,showLeftBorder:R})),G=r.useCallback(e=>t=>{rs(t)||k.current.publishEvent(e,k.current.getColumnHeaderParams(s.field),t)},[k,s.field]),U=r.useMemo(()=>({onClick:G("columnHeaderClick"),onContextMenu:G("columnHeaderContextMenu"),onDoubleClick:G("columnHeaderDoubleClick"),onMouseOver:G("columnHeaderOver"),onMouseOut:G("columnHeaderOut"),onMouseEnter:G("columnHeaderEnter"),onMouseLeave:G("columnHeaderLeave"),onKeyDown:G("columnHeaderKeyDown"),onFocus:G("columnHeaderFocus"),onBlur:G("columnHeaderBlur")}),[G]),K=r.useMemo(()=>N?{onDragStart:G("columnHeaderDragStart"),onDragEnter:G("columnHeaderDragEnter"),onDragOver:G("columnHeaderDragOver"),onDragEndCapture:G("columnHeaderDragEnd")}:{},[N,G]),_=r.useMemo(()=>({onMouseDown:G("columnSeparatorMouseDown"),onDoubleClick:G("columnSeparatorDoubleClick")}),[G]);r.useEffect(()=>{L||j(u)},[L,u]);const X=r.useCallback(()=>{j(!1)},[]),Y=!E.disableColumnMenu&&!s.disableColumnMenu&&(0,q.jsx)(kd,{colDef:s,columnMenuId:H,columnMenuButtonId:D,open:L,iconButtonRef:O}),Q=(0,q.jsx)(Ed,{columnMenuId:H,columnMenuButtonId:D,field:s.field,open:u,target:O.current,ContentComponent:E.slots.columnMenu,contentComponentProps:null===(t=E.slotProps)||void 0===t?void 0:t.columnMenu,onExited:X}),$=null!==(o=s.sortingOrder)&&void 0!==o?o:E.sortingOrder,Z=(s.sortable||null!=m)&&!s.hideSortIcons&&!E.disableColumnSorting,J=(0,q.jsxs)(r.Fragment,{children:[!E.disableColumnFilter&&(0,q.jsx)(E.slots.columnHeaderFilterIconButton,(0,n.A)({field:s.field,counter:b},null===(l=E.slotProps)||void 0===l?void 0:l.columnHeaderFilterIconButton)),Z&&(0,q.jsx)(E.slots.columnHeaderSortIcon,(0,n.A)({field:s.field,direction:m,index:v,sortingOrder:$,disabled:!s.sortable},null===(i=E.slotProps)||void 0===i?void 0:i.columnHeaderSortIcon))]});r.useLayoutEffect(()=>{const e=k.current.state.columnMenu;if(y&&!e.open){const e=T.current.querySelector('[tabindex="0"]')||T.current;if(!e)return;if(Sd())e.focus({preventScroll:!0});else{const t=k.current.getScrollPosition();e.focus(),k.current.scroll(t)}}},[k,y]);const ee="function"===typeof s.headerClassName?s.headerClassName({field:s.field,colDef:s}):s.headerClassName,te=null!==(a=s.headerName)&&void 0!==a?a:s.field,oe=r.useMemo(()=>gu((0,n.A)({},e.style),F,I,P),[I,P,e.style,F]);return(0,q.jsx)(Bd,(0,n.A)({ref:T,classes:V,columnMenuOpen:u,colIndex:d,height:f,isResizing:g,sortDirection:m,hasFocus:y,tabIndex:A,separatorSide:S,isDraggable:N,headerComponent:B,description:s.description,elementId:s.field,width:s.computedWidth,columnMenuIconButton:Y,columnTitleIconButtons:J,headerClassName:(0,c.A)(ee,h&&C["columnHeader--last"]),label:te,resizable:!E.disableColumnResize&&!!s.resizable,"data-field":s.field,columnMenu:Q,draggableContainerProps:K,columnHeaderSeparatorProps:_,style:oe},U))});function Gd(e){var t;const{groupId:o,width:l,depth:i,maxDepth:a,fields:s,height:c,colIndex:u,hasFocus:d,tabIndex:f,isLastColumn:g,pinnedPosition:h,pinnedOffset:m}=e,v=W(),b=(0,Hn.I)(),C=r.useRef(null),y=Xe(),A=D(y,$n),x=o?A[o]:{},{headerName:S=(null!==o&&void 0!==o?o:""),description:R="",headerAlign:M}=x;let I;const P=o&&(null===(t=A[o])||void 0===t?void 0:t.renderHeaderGroup),k=r.useMemo(()=>({groupId:o,headerName:S,description:R,depth:i,maxDepth:a,fields:s,colIndex:u,isLastColumn:g}),[o,S,R,i,a,s,u,g]);o&&P&&(I=P(k));const E=(0,n.A)({},e,{classes:v.classes,headerAlign:M,depth:i,isDragging:!1}),F=null!==S&&void 0!==S?S:o,T=(0,Zt.A)(),H=null===o?"empty-group-cell-".concat(T):o,O=(e=>{const{classes:t,headerAlign:o,isDragging:n,isLastColumn:r,showLeftBorder:l,showRightBorder:i,groupId:a,pinnedPosition:s}=e,c={root:["columnHeader","left"===o&&"columnHeader--alignLeft","center"===o&&"columnHeader--alignCenter","right"===o&&"columnHeader--alignRight",n&&"columnHeader--moving",i&&"columnHeader--withRightBorder",l&&"columnHeader--withLeftBorder","withBorderColor",null===a?"columnHeader--emptyGroup":"columnHeader--filledGroup",s===ln.LEFT&&"columnHeader--pinnedLeft",s===ln.RIGHT&&"columnHeader--pinnedRight",r&&"columnHeader--last"],draggableContainer:["columnHeaderDraggableContainer"],titleContainer:["columnHeaderTitleContainer","withBorderColor"],titleContainerContent:["columnHeaderTitleContainerContent"]};return(0,p.A)(c,w,t)})(E);r.useLayoutEffect(()=>{if(d){const e=C.current.querySelector('[tabindex="0"]')||C.current;if(!e)return;if(Sd())e.focus({preventScroll:!0});else{const t=y.current.getScrollPosition();e.focus(),y.current.scroll(t)}}},[y,d]);const z=r.useCallback(e=>t=>{rs(t)||y.current.publishEvent(e,k,t)},[y,k]),L=r.useMemo(()=>({onKeyDown:z("columnGroupHeaderKeyDown"),onFocus:z("columnGroupHeaderFocus"),onBlur:z("columnGroupHeaderBlur")}),[z]),j="function"===typeof x.headerClassName?x.headerClassName(k):x.headerClassName,N=r.useMemo(()=>gu((0,n.A)({},e.style),b,h,m),[h,m,e.style,b]);return(0,q.jsx)(Bd,(0,n.A)({ref:C,classes:O,columnMenuOpen:!1,colIndex:u,height:c,isResizing:!1,sortDirection:null,hasFocus:!1,tabIndex:f,isDraggable:!1,headerComponent:I,headerClassName:j,description:R,elementId:H,width:l,columnMenuIconButton:null,columnTitleIconButtons:null,resizable:!1,label:F,"aria-colspan":s.length,"data-fields":"|-".concat(s.join("-|-"),"-|"),style:N},L))}const Wd=(0,m.Ay)("div",{name:"MuiDataGrid",slot:"ColumnHeaderRow"})({display:"flex"}),Ud=["className"],Kd=(0,et.A)("div",{name:"MuiDataGrid",slot:"ColumnHeaders"})({display:"flex",flexDirection:"column",borderTopLeftRadius:"var(--unstable_DataGrid-radius)",borderTopRightRadius:"var(--unstable_DataGrid-radius)"}),qd=a(function(e,t){const{className:o}=e,r=(0,s.A)(e,Ud),l=W(),i=(e=>{const{classes:t}=e;return(0,p.A)({root:["columnHeaders"]},w,t)})(l);return(0,q.jsx)(Kd,(0,n.A)({className:(0,c.A)(i.root,o),ownerState:l},r,{role:"presentation",ref:t}))});const _d=["className","visibleColumns","sortColumnLookup","filterColumnLookup","columnHeaderTabIndexState","columnGroupHeaderTabIndexState","columnHeaderFocus","columnGroupHeaderFocus","headerGroupingMaxDepth","columnMenuState","columnVisibility","columnGroupsHeaderStructure","hasOtherElementInTabSequence"];const Xd=h(a(function(e,t){const{visibleColumns:o,sortColumnLookup:l,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:u,columnHeaderFocus:d,columnGroupHeaderFocus:p,headerGroupingMaxDepth:f,columnMenuState:g,columnVisibility:h,columnGroupsHeaderStructure:m,hasOtherElementInTabSequence:v}=e,b=(0,s.A)(e,_d),{getInnerProps:w,getColumnHeadersRow:y,getColumnGroupHeadersRows:A}=(e=>{const{visibleColumns:t,sortColumnLookup:o,filterColumnLookup:l,columnHeaderTabIndexState:i,columnGroupHeaderTabIndexState:a,columnHeaderFocus:s,columnGroupHeaderFocus:u,headerGroupingMaxDepth:d,columnMenuState:p,columnVisibility:f,columnGroupsHeaderStructure:g,hasOtherElementInTabSequence:h}=e,[m,v]=r.useState(""),[b,w]=r.useState(""),y=z(),A=W(),x=D(y,Qn),S=D(y,Be),R=D(y,ca),M=D(y,je),I=D(y,Fe),P=Di(S,R,M.left.length),k=D(y,ot),E=D(y,it),F=D(y,at),T=D(y,st),H=D(y,ut),O=r.useCallback(e=>w(e.field),[]),L=r.useCallback(()=>w(""),[]),j=r.useCallback(e=>v(e.field),[]),N=r.useCallback(()=>v(""),[]),B=r.useMemo(()=>M.left.length?{firstColumnIndex:0,lastColumnIndex:M.left.length}:null,[M.left.length]),V=r.useMemo(()=>M.right.length?{firstColumnIndex:t.length-M.right.length,lastColumnIndex:t.length}:null,[M.right.length,t.length]);Ht(y,"columnResizeStart",O),Ht(y,"columnResizeStop",L),Ht(y,"columnHeaderDragStart",j),Ht(y,"columnHeaderDragEndNative",N);const G=e=>{const{renderContext:o=R}=e||{},n=o.firstColumnIndex,r=Math.min(o.lastColumnIndex,t.length);return{renderedColumns:t.slice(n,r),firstColumnToRender:n,lastColumnToRender:r}},U=function(e,t,o){let n=arguments.length>3&&void 0!==arguments[3]&&arguments[3];const l=(null===e||void 0===e?void 0:e.position)===ln.RIGHT,i=void 0===(null===e||void 0===e?void 0:e.position),a=M.right.length>0&&l||0===M.right.length&&i,s=P-o;return(0,q.jsxs)(r.Fragment,{children:[i&&(0,q.jsx)("div",{role:"presentation",style:{width:s}}),t,i&&(0,q.jsx)("div",{role:"presentation",className:(0,c.A)(C.filler,n&&C["filler--borderBottom"])}),a&&(0,q.jsx)(pu,{header:!0,pinnedRight:l,borderBottom:n,borderTop:!1})]})},K=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{renderedColumns:r,firstColumnToRender:a}=G(e),c=[];for(let u=0;u<r.length;u+=1){const d=r[u],f=a+u,g=0===f,v=null!==i&&i.field===d.field||g&&!h?0:-1,w=null!==s&&s.field===d.field,C=p.open&&p.field===d.field,y=null===e||void 0===e?void 0:e.position,x=su(y,d.computedWidth,f,S,k,H),R=y===ln.RIGHT?r[u-1]:r[u+1],I=!!R&&null!==s&&s.field===R.field,P=f+1===S.length-M.right.length,T=u,D=r.length,O=uu(y,T),z=cu(y,T,D,A.showColumnVerticalBorder,E);c.push((0,q.jsx)(Vd,(0,n.A)({},o[d.field],{columnMenuOpen:C,filterItemsCounter:l[d.field]&&l[d.field].length,headerHeight:F,isDragging:d.field===m,colDef:d,colIndex:f,isResizing:b===d.field,isLast:f===S.length-1,hasFocus:w,tabIndex:v,pinnedPosition:y,pinnedOffset:x,isLastUnpinned:P,isSiblingFocused:I,showLeftBorder:O,showRightBorder:z},t),d.field))}return U(e,c,0)},_=e=>{var o,r,l,i;let{depth:s,params:c}=e;const p=G(c);if(0===p.renderedColumns.length)return null;const{firstColumnToRender:h,lastColumnToRender:m}=p,v=g[s],b=t[h].field,w=null!==(o=null===(r=x[b])||void 0===r?void 0:r[s])&&void 0!==o?o:null,C=v.findIndex(e=>{let{groupId:t,columnFields:o}=e;return t===w&&o.includes(b)}),y=t[m-1].field,R=null!==(l=null===(i=x[y])||void 0===i?void 0:i[s])&&void 0!==l?l:null,M=v.findIndex(e=>{let{groupId:t,columnFields:o}=e;return t===R&&o.includes(y)}),P=v.slice(C,M+1).map(e=>(0,n.A)({},e,{columnFields:e.columnFields.filter(e=>!1!==f[e])})).filter(e=>e.columnFields.length>0),F=P[0].columnFields.indexOf(b),D=P[0].columnFields.slice(0,F).reduce((e,t)=>{var o;return e+(null!==(o=I[t].computedWidth)&&void 0!==o?o:0)},0);let O=h;const z=P.map((e,t)=>{let{groupId:o,columnFields:n}=e;const r=null!==u&&u.depth===s&&n.includes(u.field),l=null!==a&&a.depth===s&&n.includes(a.field)?0:-1,i={groupId:o,width:n.reduce((e,t)=>e+I[t].computedWidth,0),fields:n,colIndex:O,hasFocus:r,tabIndex:l},p=c.position,f=su(p,i.width,O,S,k,H);O+=n.length;let g=t;return p===ln.LEFT&&(g=O-1),(0,q.jsx)(Gd,{groupId:o,width:i.width,fields:i.fields,colIndex:i.colIndex,depth:s,isLastColumn:t===P.length-1,maxDepth:d,height:T,hasFocus:r,tabIndex:l,pinnedPosition:p,pinnedOffset:f,showLeftBorder:uu(p,g),showRightBorder:cu(p,g,P.length,A.showColumnVerticalBorder,E)},t)});return U(c,z,D)};return{renderContext:R,leftRenderContext:B,rightRenderContext:V,pinnedColumns:M,visibleColumns:t,columnPositions:S,getFillers:U,getColumnHeadersRow:()=>(0,q.jsxs)(Wd,{role:"row","aria-rowindex":d+1,ownerState:A,className:C["row--borderBottom"],style:{height:F},children:[B&&K({position:ln.LEFT,renderContext:B},{disableReorder:!0}),K({renderContext:R}),V&&K({position:ln.RIGHT,renderContext:V},{disableReorder:!0,separatorSide:zd.Left})]}),getColumnsToRender:G,getColumnGroupHeadersRows:()=>{if(0===d)return null;const e=[];for(let t=0;t<d;t+=1)e.push((0,q.jsxs)(Wd,{role:"row","aria-rowindex":t+1,ownerState:A,style:{height:T},children:[B&&_({depth:t,params:{position:ln.LEFT,renderContext:B,maxLastColumn:B.lastColumnIndex}}),_({depth:t,params:{renderContext:R}}),V&&_({depth:t,params:{position:ln.RIGHT,renderContext:V,maxLastColumn:V.lastColumnIndex}})]},t));return e},getPinnedCellOffset:su,isDragging:!!m,getInnerProps:()=>({role:"rowgroup"})}})({visibleColumns:o,sortColumnLookup:l,filterColumnLookup:i,columnHeaderTabIndexState:a,columnGroupHeaderTabIndexState:u,columnHeaderFocus:d,columnGroupHeaderFocus:p,headerGroupingMaxDepth:f,columnMenuState:g,columnVisibility:h,columnGroupsHeaderStructure:m,hasOtherElementInTabSequence:v});return(0,q.jsxs)(qd,(0,n.A)({},b,w(),{ref:t,children:[A(),y()]}))})),Yd=["displayOrder"],Qd=["hideMenu","colDef","id","labelledby","className","children","open"],$d=(0,m.Ay)(Bt)(()=>({minWidth:248}));function Zd(e){e.currentTarget.contains(e.target)&&e.stopPropagation()}const Jd=a(function(e,t){const{hideMenu:o,id:l,labelledby:i,className:a,children:u,open:d}=e,p=(0,s.A)(e,Qd),f=W(),g=r.useCallback(e=>{"Tab"===e.key&&e.preventDefault(),zn(e.key)&&o(e)},[o]);return(0,q.jsx)($d,(0,n.A)({as:f.slots.baseMenuList,id:l,className:(0,c.A)(C.menuList,a),"aria-labelledby":i,onKeyDown:g,onWheel:Zd,onTouchMove:Zd,autoFocus:d},p,{ref:t,children:u}))});function ep(e){const{colDef:t,onClick:o}=e,n=Xe(),l=W(),i=1===Oe(n).filter(e=>!0!==e.disableColumnMenu).length,a=r.useCallback(e=>{i||(n.current.setColumnVisibility(t.field,!1),o(e))},[n,t.field,o,i]);return l.disableColumnSelector||!1===t.hideable?null:(0,q.jsx)(l.slots.baseMenuItem,{onClick:a,disabled:i,iconStart:(0,q.jsx)(l.slots.columnMenuHideIcon,{fontSize:"small"}),children:n.current.getLocaleText("columnMenuHideColumn")})}function tp(e){const{onClick:t}=e,o=Xe(),n=W(),l=r.useCallback(e=>{t(e),o.current.showPreferences(qe.columns)},[o,t]);return n.disableColumnSelector?null:(0,q.jsx)(n.slots.baseMenuItem,{onClick:l,iconStart:(0,q.jsx)(n.slots.columnMenuManageColumnsIcon,{fontSize:"small"}),children:o.current.getLocaleText("columnMenuManageColumns")})}const op=["defaultSlots","defaultSlotProps","slots","slotProps"],np={columnMenuSortItem:function(e){var t;const{colDef:o,onClick:n}=e,l=Xe(),i=D(l,vr),a=W(),s=r.useMemo(()=>{if(!o)return null;const e=i.find(e=>e.field===o.field);return null===e||void 0===e?void 0:e.sort},[o,i]),c=null!==(t=o.sortingOrder)&&void 0!==t?t:a.sortingOrder,u=r.useCallback(e=>{n(e);const t=e.currentTarget.getAttribute("data-value")||null,r="always"===a.multipleColumnsSortingMode;l.current.sortColumn(o.field,t===s?null:t,r)},[l,o,n,s,a.multipleColumnsSortingMode]);if(a.disableColumnSorting||!o||!o.sortable||!c.some(e=>!!e))return null;const d=e=>{const t=l.current.getLocaleText(e);return"function"===typeof t?t(o):t};return(0,q.jsxs)(r.Fragment,{children:[c.includes("asc")&&"asc"!==s?(0,q.jsx)(a.slots.baseMenuItem,{onClick:u,"data-value":"asc",iconStart:(0,q.jsx)(a.slots.columnMenuSortAscendingIcon,{fontSize:"small"}),children:d("columnMenuSortAsc")}):null,c.includes("desc")&&"desc"!==s?(0,q.jsx)(a.slots.baseMenuItem,{onClick:u,"data-value":"desc",iconStart:(0,q.jsx)(a.slots.columnMenuSortDescendingIcon,{fontSize:"small"}),children:d("columnMenuSortDesc")}):null,c.includes(null)&&null!=s?(0,q.jsx)(a.slots.baseMenuItem,{onClick:u,iconStart:a.slots.columnMenuUnsortIcon?(0,q.jsx)(a.slots.columnMenuUnsortIcon,{fontSize:"small"}):(0,q.jsx)("span",{}),children:l.current.getLocaleText("columnMenuUnsort")}):null]})},columnMenuFilterItem:function(e){const{colDef:t,onClick:o}=e,n=Xe(),l=W(),i=r.useCallback(e=>{o(e),n.current.showFilterPanel(t.field)},[n,t.field,o]);return l.disableColumnFilter||!t.filterable?null:(0,q.jsx)(l.slots.baseMenuItem,{onClick:i,iconStart:(0,q.jsx)(l.slots.columnMenuFilterIcon,{fontSize:"small"}),children:n.current.getLocaleText("columnMenuFilter")})},columnMenuColumnsItem:function(e){return(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(ep,(0,n.A)({},e)),(0,q.jsx)(tp,(0,n.A)({},e))]})}},rp={columnMenuSortItem:{displayOrder:10},columnMenuFilterItem:{displayOrder:20},columnMenuColumnsItem:{displayOrder:30}},lp=a(function(e,t){const{defaultSlots:o,defaultSlotProps:l,slots:i,slotProps:a}=e,c=(0,s.A)(e,op),u=(e=>{const t=z(),o=W(),{defaultSlots:l,defaultSlotProps:i,slots:a={},slotProps:c={},hideMenu:u,colDef:d,addDividers:p=!0}=e,f=r.useMemo(()=>(0,n.A)({},l,a),[l,a]),g=r.useMemo(()=>{if(!c||0===Object.keys(c).length)return i;const e=(0,n.A)({},c);return Object.entries(i).forEach(t=>{let[o,r]=t;e[o]=(0,n.A)({},r,c[o]||{})}),e},[i,c]),h=t.current.unstable_applyPipeProcessors("columnMenu",[],e.colDef),m=r.useMemo(()=>{const e=Object.keys(l);return Object.keys(a).filter(t=>!e.includes(t))},[a,l]);return r.useMemo(()=>{const e=Array.from(new Set([...h,...m])).filter(e=>null!=f[e]).sort((e,t)=>{const o=g[e],n=g[t];return(Number.isFinite(null===o||void 0===o?void 0:o.displayOrder)?o.displayOrder:100)-(Number.isFinite(null===n||void 0===n?void 0:n.displayOrder)?n.displayOrder:100)});return e.reduce((t,r,l)=>{let i={colDef:d,onClick:u};const a=g[r];if(a){const e=(0,s.A)(a,Yd);i=(0,n.A)({},i,e)}return p&&l!==e.length-1?[...t,[f[r],i],[o.slots.baseDivider,{}]]:[...t,[f[r],i]]},[])},[p,d,h,u,f,g,m,o.slots.baseDivider])})((0,n.A)({},c,{defaultSlots:o,defaultSlotProps:l,slots:i,slotProps:a}));return(0,q.jsx)(Jd,(0,n.A)({},c,{ref:t,children:u.map((e,t)=>{let[o,r]=e;return(0,q.jsx)(o,(0,n.A)({},r),t)})}))});const ip=a(function(e,t){return(0,q.jsx)(lp,(0,n.A)({},e,{ref:t,defaultSlots:np,defaultSlotProps:rp}))});const ap=a(function(e,t){const o=Xe().current.getLocaleText("noResultsOverlayLabel");return(0,q.jsx)(au,(0,n.A)({},e,{ref:t,children:o}))});var sp=o(6923),cp=o(45),up=o(4079);const dp=function(e){const{badgeContent:t,invisible:o=!1,max:n=99,showZero:r=!1}=e,l=(0,up.A)({badgeContent:t,max:n});let i=o;!1!==o||0!==t||r||(i=!0);const{badgeContent:a,max:s=n}=i?l:e;return{badgeContent:a,invisible:i,max:s,displayValue:a&&Number(a)>s?"".concat(s,"+"):a}};var pp=o(1612),fp=o(4412),gp=o(8301),hp=o(7194);function mp(e){return(0,v.Ay)("MuiBadge",e)}const vp=(0,b.A)("MuiBadge",["root","badge","dot","standard","anchorOriginTopRight","anchorOriginBottomRight","anchorOriginTopLeft","anchorOriginBottomLeft","invisible","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","overlapRectangular","overlapCircular","anchorOriginTopLeftCircular","anchorOriginTopLeftRectangular","anchorOriginTopRightCircular","anchorOriginTopRightRectangular","anchorOriginBottomLeftCircular","anchorOriginBottomLeftRectangular","anchorOriginBottomRightCircular","anchorOriginBottomRightRectangular"]);var bp=o(9905);const wp=["anchorOrigin","className","classes","component","components","componentsProps","children","overlap","color","invisible","max","badgeContent","slots","slotProps","showZero","variant"],Cp=(0,m.Ay)("span",{name:"MuiBadge",slot:"Root"})({position:"relative",display:"inline-flex",verticalAlign:"middle",flexShrink:0}),yp=(0,m.Ay)("span",{name:"MuiBadge",slot:"Badge",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.badge,t[o.variant],t["anchorOrigin".concat((0,hp.A)(o.anchorOrigin.vertical)).concat((0,hp.A)(o.anchorOrigin.horizontal)).concat((0,hp.A)(o.overlap))],"default"!==o.color&&t["color".concat((0,hp.A)(o.color))],o.invisible&&t.invisible]}})((0,pp.A)(e=>{let{theme:t}=e;return{display:"flex",flexDirection:"row",flexWrap:"wrap",justifyContent:"center",alignContent:"center",alignItems:"center",position:"absolute",boxSizing:"border-box",fontFamily:t.typography.fontFamily,fontWeight:t.typography.fontWeightMedium,fontSize:t.typography.pxToRem(12),minWidth:20,lineHeight:1,padding:"0 6px",height:20,borderRadius:10,zIndex:1,transition:t.transitions.create("transform",{easing:t.transitions.easing.easeInOut,duration:t.transitions.duration.enteringScreen}),variants:[...Object.entries(t.palette).filter((0,fp.A)(["contrastText"])).map(e=>{let[o]=e;return{props:{color:o},style:{backgroundColor:(t.vars||t).palette[o].main,color:(t.vars||t).palette[o].contrastText}}}),{props:{variant:"dot"},style:{borderRadius:4,height:8,minWidth:8,padding:0}},{props:e=>{let{ownerState:t}=e;return"top"===t.anchorOrigin.vertical&&"right"===t.anchorOrigin.horizontal&&"rectangular"===t.overlap},style:{top:0,right:0,transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(50%, -50%)"}}},{props:e=>{let{ownerState:t}=e;return"bottom"===t.anchorOrigin.vertical&&"right"===t.anchorOrigin.horizontal&&"rectangular"===t.overlap},style:{bottom:0,right:0,transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(50%, 50%)"}}},{props:e=>{let{ownerState:t}=e;return"top"===t.anchorOrigin.vertical&&"left"===t.anchorOrigin.horizontal&&"rectangular"===t.overlap},style:{top:0,left:0,transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(-50%, -50%)"}}},{props:e=>{let{ownerState:t}=e;return"bottom"===t.anchorOrigin.vertical&&"left"===t.anchorOrigin.horizontal&&"rectangular"===t.overlap},style:{bottom:0,left:0,transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(-50%, 50%)"}}},{props:e=>{let{ownerState:t}=e;return"top"===t.anchorOrigin.vertical&&"right"===t.anchorOrigin.horizontal&&"circular"===t.overlap},style:{top:"14%",right:"14%",transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(50%, -50%)"}}},{props:e=>{let{ownerState:t}=e;return"bottom"===t.anchorOrigin.vertical&&"right"===t.anchorOrigin.horizontal&&"circular"===t.overlap},style:{bottom:"14%",right:"14%",transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(50%, 50%)"}}},{props:e=>{let{ownerState:t}=e;return"top"===t.anchorOrigin.vertical&&"left"===t.anchorOrigin.horizontal&&"circular"===t.overlap},style:{top:"14%",left:"14%",transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(-50%, -50%)"}}},{props:e=>{let{ownerState:t}=e;return"bottom"===t.anchorOrigin.vertical&&"left"===t.anchorOrigin.horizontal&&"circular"===t.overlap},style:{bottom:"14%",left:"14%",transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%",["&.".concat(vp.invisible)]:{transform:"scale(0) translate(-50%, 50%)"}}},{props:{invisible:!0},style:{transition:t.transitions.create("transform",{easing:t.transitions.easing.easeInOut,duration:t.transitions.duration.leavingScreen})}}]}}));function Ap(e){var t,o;return{vertical:null!==(t=null===e||void 0===e?void 0:e.vertical)&&void 0!==t?t:"top",horizontal:null!==(o=null===e||void 0===e?void 0:e.horizontal)&&void 0!==o?o:"right"}}const xp=r.forwardRef(function(e,t){var o,n,r,l;const i=(0,gp.b)({props:e,name:"MuiBadge"}),{anchorOrigin:a,className:s,classes:u,component:d,components:f={},componentsProps:g={},children:h,overlap:m="rectangular",color:v="default",invisible:b=!1,max:w=99,badgeContent:C,slots:y,slotProps:A,showZero:x=!1,variant:S="standard"}=i,R=(0,cp.A)(i,wp),{badgeContent:M,invisible:I,max:P,displayValue:k}=dp({max:w,invisible:b,badgeContent:C,showZero:x}),E=(0,up.A)({anchorOrigin:Ap(a),color:v,overlap:m,variant:S,badgeContent:C}),F=I||null==M&&"dot"!==S,{color:T=v,overlap:H=m,anchorOrigin:D,variant:O=S}=F?E:i,z=Ap(D),L="dot"!==O?k:void 0,j=(0,$.A)((0,$.A)({},i),{},{badgeContent:M,invisible:F,max:P,displayValue:L,showZero:x,anchorOrigin:z,color:T,overlap:H,variant:O}),N=(e=>{const{color:t,anchorOrigin:o,invisible:n,overlap:r,variant:l,classes:i={}}=e,a={root:["root"],badge:["badge",l,n&&"invisible","anchorOrigin".concat((0,hp.A)(o.vertical)).concat((0,hp.A)(o.horizontal)),"anchorOrigin".concat((0,hp.A)(o.vertical)).concat((0,hp.A)(o.horizontal)).concat((0,hp.A)(r)),"overlap".concat((0,hp.A)(r)),"default"!==t&&"color".concat((0,hp.A)(t))]};return(0,p.A)(a,mp,i)})(j),B={slots:{root:null!==(o=null===y||void 0===y?void 0:y.root)&&void 0!==o?o:f.Root,badge:null!==(n=null===y||void 0===y?void 0:y.badge)&&void 0!==n?n:f.Badge},slotProps:{root:null!==(r=null===A||void 0===A?void 0:A.root)&&void 0!==r?r:g.root,badge:null!==(l=null===A||void 0===A?void 0:A.badge)&&void 0!==l?l:g.badge}},[V,G]=(0,bp.A)("root",{elementType:Cp,externalForwardedProps:(0,$.A)((0,$.A)({},B),R),ownerState:j,className:(0,c.A)(N.root,s),ref:t,additionalProps:{as:d}}),[W,U]=(0,bp.A)("badge",{elementType:yp,externalForwardedProps:B,ownerState:j,className:N.badge});return(0,q.jsxs)(V,(0,$.A)((0,$.A)({},G),{},{children:[h,(0,q.jsx)(W,(0,$.A)((0,$.A)({},U),{},{children:L}))]}))}),Sp=xp;var Rp=o(2466),Mp=o(2447),Ip=o(8700),Pp=o(9699);function kp(e){return(0,v.Ay)("PrivateSwitchBase",e)}(0,b.A)("PrivateSwitchBase",["root","checked","disabled","input","edgeStart","edgeEnd"]);const Ep=["autoFocus","checked","checkedIcon","defaultChecked","disabled","disableFocusRipple","edge","icon","id","inputProps","inputRef","name","onBlur","onChange","onFocus","readOnly","required","tabIndex","type","value","slots","slotProps"],Fp=(0,m.Ay)(Pp.A,{name:"MuiSwitchBase"})({padding:9,borderRadius:"50%",variants:[{props:{edge:"start",size:"small"},style:{marginLeft:-3}},{props:e=>{let{edge:t,ownerState:o}=e;return"start"===t&&"small"!==o.size},style:{marginLeft:-12}},{props:{edge:"end",size:"small"},style:{marginRight:-3}},{props:e=>{let{edge:t,ownerState:o}=e;return"end"===t&&"small"!==o.size},style:{marginRight:-12}}]}),Tp=(0,m.Ay)("input",{name:"MuiSwitchBase",shouldForwardProp:Rp.A})({cursor:"inherit",position:"absolute",opacity:0,width:"100%",height:"100%",top:0,left:0,margin:0,padding:0,zIndex:1}),Hp=r.forwardRef(function(e,t){const{autoFocus:o,checked:n,checkedIcon:r,defaultChecked:l,disabled:i,disableFocusRipple:a=!1,edge:s=!1,icon:c,id:u,inputProps:d,inputRef:f,name:g,onBlur:h,onChange:m,onFocus:v,readOnly:b,required:w=!1,tabIndex:C,type:y,value:A,slots:x={},slotProps:S={}}=e,R=(0,cp.A)(e,Ep),[M,I]=(0,Mp.A)({controlled:n,default:Boolean(l),name:"SwitchBase",state:"checked"}),P=(0,Ip.A)();let k=i;P&&"undefined"===typeof k&&(k=P.disabled);const E="checkbox"===y||"radio"===y,F=(0,$.A)((0,$.A)({},e),{},{checked:M,disabled:k,disableFocusRipple:a,edge:s}),T=(e=>{const{classes:t,checked:o,disabled:n,edge:r}=e,l={root:["root",o&&"checked",n&&"disabled",r&&"edge".concat((0,hp.A)(r))],input:["input"]};return(0,p.A)(l,kp,t)})(F),H={slots:x,slotProps:(0,$.A)({input:d},S)},[D,O]=(0,bp.A)("root",{ref:t,elementType:Fp,className:T.root,shouldForwardComponentProp:!0,externalForwardedProps:(0,$.A)((0,$.A)({},H),{},{component:"span"},R),getSlotProps:e=>(0,$.A)((0,$.A)({},e),{},{onFocus:t=>{var o;null===(o=e.onFocus)||void 0===o||o.call(e,t),(e=>{v&&v(e),P&&P.onFocus&&P.onFocus(e)})(t)},onBlur:t=>{var o;null===(o=e.onBlur)||void 0===o||o.call(e,t),(e=>{h&&h(e),P&&P.onBlur&&P.onBlur(e)})(t)}}),ownerState:F,additionalProps:{centerRipple:!0,focusRipple:!a,disabled:k,role:void 0,tabIndex:null}}),[z,L]=(0,bp.A)("input",{ref:f,elementType:Tp,className:T.input,externalForwardedProps:H,getSlotProps:e=>(0,$.A)((0,$.A)({},e),{},{onChange:t=>{var o;null===(o=e.onChange)||void 0===o||o.call(e,t),(e=>{if(e.nativeEvent.defaultPrevented)return;const t=e.target.checked;I(t),m&&m(e,t)})(t)}}),ownerState:F,additionalProps:(0,$.A)({autoFocus:o,checked:n,defaultChecked:l,disabled:k,id:E?u:void 0,name:g,readOnly:b,required:w,tabIndex:C,type:y},"checkbox"===y&&void 0===A?{}:{value:A})});return(0,q.jsxs)(D,(0,$.A)((0,$.A)({},O),{},{children:[(0,q.jsx)(z,(0,$.A)({},L)),M?r:c]}))}),Dp=Hp;var Op=o(9992);const zp=(0,Op.A)((0,q.jsx)("path",{d:"M19 5v14H5V5h14m0-2H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2z"}),"CheckBoxOutlineBlank"),Lp=(0,Op.A)((0,q.jsx)("path",{d:"M19 3H5c-1.11 0-2 .9-2 2v14c0 1.1.89 2 2 2h14c1.11 0 2-.9 2-2V5c0-1.1-.89-2-2-2zm-9 14l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"}),"CheckBox"),jp=(0,Op.A)((0,q.jsx)("path",{d:"M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm-2 10H7v-2h10v2z"}),"IndeterminateCheckBox");function Np(e){return(0,v.Ay)("MuiCheckbox",e)}const Bp=(0,b.A)("MuiCheckbox",["root","checked","disabled","indeterminate","colorPrimary","colorSecondary","sizeSmall","sizeMedium"]);var Vp=o(122);const Gp=["checkedIcon","color","icon","indeterminate","indeterminateIcon","inputProps","size","disableRipple","className","slots","slotProps"],Wp=(0,m.Ay)(Dp,{shouldForwardProp:e=>(0,Rp.A)(e)||"classes"===e,name:"MuiCheckbox",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,o.indeterminate&&t.indeterminate,t["size".concat((0,hp.A)(o.size))],"default"!==o.color&&t["color".concat((0,hp.A)(o.color))]]}})((0,pp.A)(e=>{let{theme:t}=e;return{color:(t.vars||t).palette.text.secondary,variants:[{props:{color:"default",disableRipple:!1},style:{"&:hover":{backgroundColor:t.alpha((t.vars||t).palette.action.active,(t.vars||t).palette.action.hoverOpacity)}}},...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o,disableRipple:!1},style:{"&:hover":{backgroundColor:t.alpha((t.vars||t).palette[o].main,(t.vars||t).palette.action.hoverOpacity)}}}}),...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o},style:{["&.".concat(Bp.checked,", &.").concat(Bp.indeterminate)]:{color:(t.vars||t).palette[o].main},["&.".concat(Bp.disabled)]:{color:(t.vars||t).palette.action.disabled}}}}),{props:{disableRipple:!1},style:{"&:hover":{"@media (hover: none)":{backgroundColor:"transparent"}}}}]}})),Up=(0,q.jsx)(Lp,{}),Kp=(0,q.jsx)(zp,{}),qp=(0,q.jsx)(jp,{}),_p=r.forwardRef(function(e,t){var o,n,l;const i=(0,gp.b)({props:e,name:"MuiCheckbox"}),{checkedIcon:a=Up,color:s="primary",icon:u=Kp,indeterminate:d=!1,indeterminateIcon:f=qp,inputProps:g,size:h="medium",disableRipple:m=!1,className:v,slots:b={},slotProps:w={}}=i,C=(0,cp.A)(i,Gp),y=d?f:u,A=d?f:a,x=(0,$.A)((0,$.A)({},i),{},{disableRipple:m,color:s,indeterminate:d,size:h}),S=(e=>{const{classes:t,indeterminate:o,color:n,size:r}=e,l={root:["root",o&&"indeterminate","color".concat((0,hp.A)(n)),"size".concat((0,hp.A)(r))]},i=(0,p.A)(l,Np,t);return(0,$.A)((0,$.A)({},t),i)})(x),R=null!==(o=w.input)&&void 0!==o?o:g,[M,I]=(0,bp.A)("root",{ref:t,elementType:Wp,className:(0,c.A)(S.root,v),shouldForwardComponentProp:!0,externalForwardedProps:(0,$.A)({slots:b,slotProps:w},C),ownerState:x,additionalProps:{type:"checkbox",icon:r.cloneElement(y,{fontSize:null!==(n=y.props.fontSize)&&void 0!==n?n:h}),checkedIcon:r.cloneElement(A,{fontSize:null!==(l=A.props.fontSize)&&void 0!==l?l:h}),disableRipple:m,slots:b,slotProps:{input:(0,Vp.A)("function"===typeof R?R(x):R,{"data-indeterminate":d})}}});return(0,q.jsx)(M,(0,$.A)((0,$.A)({},I),{},{classes:S}))}),Xp=_p;var Yp=o(3759),Qp=o(172),$p=o(4527),Zp=o(3209),Jp=o(2524);function ef(e){return(0,v.Ay)("MuiLinearProgress",e)}(0,b.A)("MuiLinearProgress",["root","colorPrimary","colorSecondary","determinate","indeterminate","buffer","query","dashed","dashedColorPrimary","dashedColorSecondary","bar","bar1","bar2","barColorPrimary","barColorSecondary","bar1Indeterminate","bar1Determinate","bar1Buffer","bar2Indeterminate","bar2Buffer"]);const tf=["className","color","value","valueBuffer","variant"];var of,nf,rf,lf,af,sf;const cf=(0,Ju.i7)(of||(of=(0,Zu.A)(["\n  0% {\n    left: -35%;\n    right: 100%;\n  }\n\n  60% {\n    left: 100%;\n    right: -90%;\n  }\n\n  100% {\n    left: 100%;\n    right: -90%;\n  }\n"]))),uf="string"!==typeof cf?(0,Ju.AH)(nf||(nf=(0,Zu.A)(["\n        animation: "," 2.1s cubic-bezier(0.65, 0.815, 0.735, 0.395) infinite;\n      "])),cf):null,df=(0,Ju.i7)(rf||(rf=(0,Zu.A)(["\n  0% {\n    left: -200%;\n    right: 100%;\n  }\n\n  60% {\n    left: 107%;\n    right: -8%;\n  }\n\n  100% {\n    left: 107%;\n    right: -8%;\n  }\n"]))),pf="string"!==typeof df?(0,Ju.AH)(lf||(lf=(0,Zu.A)(["\n        animation: "," 2.1s cubic-bezier(0.165, 0.84, 0.44, 1) 1.15s infinite;\n      "])),df):null,ff=(0,Ju.i7)(af||(af=(0,Zu.A)(["\n  0% {\n    opacity: 1;\n    background-position: 0 -23px;\n  }\n\n  60% {\n    opacity: 0;\n    background-position: 0 -23px;\n  }\n\n  100% {\n    opacity: 1;\n    background-position: -200px -23px;\n  }\n"]))),gf="string"!==typeof ff?(0,Ju.AH)(sf||(sf=(0,Zu.A)(["\n        animation: "," 3s infinite linear;\n      "])),ff):null,hf=(e,t)=>e.vars?e.vars.palette.LinearProgress["".concat(t,"Bg")]:"light"===e.palette.mode?e.lighten(e.palette[t].main,.62):e.darken(e.palette[t].main,.5),mf=(0,m.Ay)("span",{name:"MuiLinearProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,t["color".concat((0,hp.A)(o.color))],t[o.variant]]}})((0,pp.A)(e=>{let{theme:t}=e;return{position:"relative",overflow:"hidden",display:"block",height:4,zIndex:0,"@media print":{colorAdjust:"exact"},variants:[...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o},style:{backgroundColor:hf(t,o)}}}),{props:e=>{let{ownerState:t}=e;return"inherit"===t.color&&"buffer"!==t.variant},style:{"&::before":{content:'""',position:"absolute",left:0,top:0,right:0,bottom:0,backgroundColor:"currentColor",opacity:.3}}},{props:{variant:"buffer"},style:{backgroundColor:"transparent"}},{props:{variant:"query"},style:{transform:"rotate(180deg)"}}]}})),vf=(0,m.Ay)("span",{name:"MuiLinearProgress",slot:"Dashed",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.dashed,t["dashedColor".concat((0,hp.A)(o.color))]]}})((0,pp.A)(e=>{let{theme:t}=e;return{position:"absolute",marginTop:0,height:"100%",width:"100%",backgroundSize:"10px 10px",backgroundPosition:"0 -23px",variants:[{props:{color:"inherit"},style:{opacity:.3,backgroundImage:"radial-gradient(currentColor 0%, currentColor 16%, transparent 42%)"}},...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;const n=hf(t,o);return{props:{color:o},style:{backgroundImage:"radial-gradient(".concat(n," 0%, ").concat(n," 16%, transparent 42%)")}}})]}}),gf||{animation:"".concat(ff," 3s infinite linear")}),bf=(0,m.Ay)("span",{name:"MuiLinearProgress",slot:"Bar1",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.bar,t.bar1,t["barColor".concat((0,hp.A)(o.color))],("indeterminate"===o.variant||"query"===o.variant)&&t.bar1Indeterminate,"determinate"===o.variant&&t.bar1Determinate,"buffer"===o.variant&&t.bar1Buffer]}})((0,pp.A)(e=>{let{theme:t}=e;return{width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left",variants:[{props:{color:"inherit"},style:{backgroundColor:"currentColor"}},...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o},style:{backgroundColor:(t.vars||t).palette[o].main}}}),{props:{variant:"determinate"},style:{transition:"transform .".concat(4,"s linear")}},{props:{variant:"buffer"},style:{zIndex:1,transition:"transform .".concat(4,"s linear")}},{props:e=>{let{ownerState:t}=e;return"indeterminate"===t.variant||"query"===t.variant},style:{width:"auto"}},{props:e=>{let{ownerState:t}=e;return"indeterminate"===t.variant||"query"===t.variant},style:uf||{animation:"".concat(cf," 2.1s cubic-bezier(0.65, 0.815, 0.735, 0.395) infinite")}}]}})),wf=(0,m.Ay)("span",{name:"MuiLinearProgress",slot:"Bar2",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.bar,t.bar2,t["barColor".concat((0,hp.A)(o.color))],("indeterminate"===o.variant||"query"===o.variant)&&t.bar2Indeterminate,"buffer"===o.variant&&t.bar2Buffer]}})((0,pp.A)(e=>{let{theme:t}=e;return{width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left",variants:[...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o},style:{"--LinearProgressBar2-barColor":(t.vars||t).palette[o].main}}}),{props:e=>{let{ownerState:t}=e;return"buffer"!==t.variant&&"inherit"!==t.color},style:{backgroundColor:"var(--LinearProgressBar2-barColor, currentColor)"}},{props:e=>{let{ownerState:t}=e;return"buffer"!==t.variant&&"inherit"===t.color},style:{backgroundColor:"currentColor"}},{props:{color:"inherit"},style:{opacity:.3}},...Object.entries(t.palette).filter((0,fp.A)()).map(e=>{let[o]=e;return{props:{color:o,variant:"buffer"},style:{backgroundColor:hf(t,o),transition:"transform .".concat(4,"s linear")}}}),{props:e=>{let{ownerState:t}=e;return"indeterminate"===t.variant||"query"===t.variant},style:{width:"auto"}},{props:e=>{let{ownerState:t}=e;return"indeterminate"===t.variant||"query"===t.variant},style:pf||{animation:"".concat(df," 2.1s cubic-bezier(0.165, 0.84, 0.44, 1) 1.15s infinite")}}]}})),Cf=r.forwardRef(function(e,t){const o=(0,gp.b)({props:e,name:"MuiLinearProgress"}),{className:n,color:r="primary",value:l,valueBuffer:i,variant:a="indeterminate"}=o,s=(0,cp.A)(o,tf),u=(0,$.A)((0,$.A)({},o),{},{color:r,variant:a}),d=(e=>{const{classes:t,variant:o,color:n}=e,r={root:["root","color".concat((0,hp.A)(n)),o],dashed:["dashed","dashedColor".concat((0,hp.A)(n))],bar1:["bar","bar1","barColor".concat((0,hp.A)(n)),("indeterminate"===o||"query"===o)&&"bar1Indeterminate","determinate"===o&&"bar1Determinate","buffer"===o&&"bar1Buffer"],bar2:["bar","bar2","buffer"!==o&&"barColor".concat((0,hp.A)(n)),"buffer"===o&&"color".concat((0,hp.A)(n)),("indeterminate"===o||"query"===o)&&"bar2Indeterminate","buffer"===o&&"bar2Buffer"]};return(0,p.A)(r,ef,t)})(u),f=(0,Hn.I)(),g={},h={bar1:{},bar2:{}};if("determinate"===a||"buffer"===a)if(void 0!==l){g["aria-valuenow"]=Math.round(l),g["aria-valuemin"]=0,g["aria-valuemax"]=100;let e=l-100;f&&(e=-e),h.bar1.transform="translateX(".concat(e,"%)")}else 0;if("buffer"===a)if(void 0!==i){let e=(i||0)-100;f&&(e=-e),h.bar2.transform="translateX(".concat(e,"%)")}else 0;return(0,q.jsxs)(mf,(0,$.A)((0,$.A)((0,$.A)({className:(0,c.A)(d.root,n),ownerState:u,role:"progressbar"},g),{},{ref:t},s),{},{children:["buffer"===a?(0,q.jsx)(vf,{className:d.dashed,ownerState:u}):null,(0,q.jsx)(bf,{className:d.bar1,ownerState:u,style:h.bar1}),"determinate"===a?null:(0,q.jsx)(wf,{className:d.bar2,ownerState:u,style:h.bar2})]}))}),yf=Cf;var Af=o(9801),xf=o(6185),Sf=o(1977),Rf=o(6554),Mf=o(7471),If=o(6154),Pf=o(256),kf=o(5895);function Ef(e){return(0,v.Ay)("MuiFormControlLabel",e)}const Ff=(0,b.A)("MuiFormControlLabel",["root","labelPlacementStart","labelPlacementTop","labelPlacementBottom","disabled","label","error","required","asterisk"]);var Tf=o(7566);const Hf=["checked","className","componentsProps","control","disabled","disableTypography","inputRef","label","labelPlacement","name","onChange","required","slots","slotProps","value"],Df=(0,m.Ay)("label",{name:"MuiFormControlLabel",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[{["& .".concat(Ff.label)]:t.label},t.root,t["labelPlacement".concat((0,hp.A)(o.labelPlacement))]]}})((0,pp.A)(e=>{let{theme:t}=e;return{display:"inline-flex",alignItems:"center",cursor:"pointer",verticalAlign:"middle",WebkitTapHighlightColor:"transparent",marginLeft:-11,marginRight:16,["&.".concat(Ff.disabled)]:{cursor:"default"},["& .".concat(Ff.label)]:{["&.".concat(Ff.disabled)]:{color:(t.vars||t).palette.text.disabled}},variants:[{props:{labelPlacement:"start"},style:{flexDirection:"row-reverse",marginRight:-11}},{props:{labelPlacement:"top"},style:{flexDirection:"column-reverse"}},{props:{labelPlacement:"bottom"},style:{flexDirection:"column"}},{props:e=>{let{labelPlacement:t}=e;return"start"===t||"top"===t||"bottom"===t},style:{marginLeft:16}}]}})),Of=(0,m.Ay)("span",{name:"MuiFormControlLabel",slot:"Asterisk"})((0,pp.A)(e=>{let{theme:t}=e;return{["&.".concat(Ff.error)]:{color:(t.vars||t).palette.error.main}}})),zf=r.forwardRef(function(e,t){var o;const n=(0,gp.b)({props:e,name:"MuiFormControlLabel"}),{checked:l,className:i,componentsProps:a={},control:s,disabled:u,disableTypography:d,inputRef:f,label:g,labelPlacement:h="end",name:m,onChange:v,required:b,slots:w={},slotProps:C={},value:y}=n,A=(0,cp.A)(n,Hf),x=(0,Ip.A)(),S=null!==(o=null!==u&&void 0!==u?u:s.props.disabled)&&void 0!==o?o:null===x||void 0===x?void 0:x.disabled,R=null!==b&&void 0!==b?b:s.props.required,M={disabled:S,required:R};["checked","name","onChange","value","inputRef"].forEach(e=>{"undefined"===typeof s.props[e]&&"undefined"!==typeof n[e]&&(M[e]=n[e])});const I=(0,Tf.A)({props:n,muiFormControl:x,states:["error"]}),P=(0,$.A)((0,$.A)({},n),{},{disabled:S,labelPlacement:h,required:R,error:I.error}),k=(e=>{const{classes:t,disabled:o,labelPlacement:n,error:r,required:l}=e,i={root:["root",o&&"disabled","labelPlacement".concat((0,hp.A)(n)),r&&"error",l&&"required"],label:["label",o&&"disabled"],asterisk:["asterisk",r&&"error"]};return(0,p.A)(i,Ef,t)})(P),E={slots:w,slotProps:(0,$.A)((0,$.A)({},a),C)},[F,T]=(0,bp.A)("typography",{elementType:kf.A,externalForwardedProps:E,ownerState:P});let H=g;return null==H||H.type===kf.A||d||(H=(0,q.jsx)(F,(0,$.A)((0,$.A)({component:"span"},T),{},{className:(0,c.A)(k.label,null===T||void 0===T?void 0:T.className),children:H}))),(0,q.jsxs)(Df,(0,$.A)((0,$.A)({className:(0,c.A)(k.root,i),ownerState:P,ref:t},A),{},{children:[r.cloneElement(s,M),R?(0,q.jsxs)("div",{children:[H,(0,q.jsxs)(Of,{ownerState:P,"aria-hidden":!0,className:k.asterisk,children:["\u2009","*"]})]}):H]}))}),Lf=zf;var jf=o(4481);function Nf(e){return(0,v.Ay)("MuiSwitch",e)}const Bf=(0,b.A)("MuiSwitch",["root","edgeStart","edgeEnd","switchBase","colorPrimary","colorSecondary","sizeSmall","sizeMedium","checked","disabled","input","thumb","track"]),Vf=["className","color","edge","size","sx","slots","slotProps"],Gf=(0,m.Ay)("span",{name:"MuiSwitch",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,o.edge&&t["edge".concat((0,hp.A)(o.edge))],t["size".concat((0,hp.A)(o.size))]]}})({display:"inline-flex",width:58,height:38,overflow:"hidden",padding:12,boxSizing:"border-box",position:"relative",flexShrink:0,zIndex:0,verticalAlign:"middle","@media print":{colorAdjust:"exact"},variants:[{props:{edge:"start"},style:{marginLeft:-8}},{props:{edge:"end"},style:{marginRight:-8}},{props:{size:"small"},style:{width:40,height:24,padding:7,["& .".concat(Bf.thumb)]:{width:16,height:16},["& .".concat(Bf.switchBase)]:{padding:4,["&.".concat(Bf.checked)]:{transform:"translateX(16px)"}}}}]}),Wf=(0,m.Ay)(Dp,{name:"MuiSwitch",slot:"SwitchBase",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.switchBase,{["& .".concat(Bf.input)]:t.input},"default"!==o.color&&t["color".concat((0,hp.A)(o.color))]]}})((0,pp.A)(e=>{let{theme:t}=e;return{position:"absolute",top:0,left:0,zIndex:1,color:t.vars?t.vars.palette.Switch.defaultColor:"".concat("light"===t.palette.mode?t.palette.common.white:t.palette.grey[300]),transition:t.transitions.create(["left","transform"],{duration:t.transitions.duration.shortest}),["&.".concat(Bf.checked)]:{transform:"translateX(20px)"},["&.".concat(Bf.disabled)]:{color:t.vars?t.vars.palette.Switch.defaultDisabledColor:"".concat("light"===t.palette.mode?t.palette.grey[100]:t.palette.grey[600])},["&.".concat(Bf.checked," + .").concat(Bf.track)]:{opacity:.5},["&.".concat(Bf.disabled," + .").concat(Bf.track)]:{opacity:t.vars?t.vars.opacity.switchTrackDisabled:"".concat("light"===t.palette.mode?.12:.2)},["& .".concat(Bf.input)]:{left:"-100%",width:"300%"}}}),(0,pp.A)(e=>{let{theme:t}=e;return{"&:hover":{backgroundColor:t.alpha((t.vars||t).palette.action.active,(t.vars||t).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},variants:[...Object.entries(t.palette).filter((0,fp.A)(["light"])).map(e=>{let[o]=e;return{props:{color:o},style:{["&.".concat(Bf.checked)]:{color:(t.vars||t).palette[o].main,"&:hover":{backgroundColor:t.alpha((t.vars||t).palette[o].main,(t.vars||t).palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(Bf.disabled)]:{color:t.vars?t.vars.palette.Switch["".concat(o,"DisabledColor")]:"".concat("light"===t.palette.mode?t.lighten(t.palette[o].main,.62):t.darken(t.palette[o].main,.55))}},["&.".concat(Bf.checked," + .").concat(Bf.track)]:{backgroundColor:(t.vars||t).palette[o].main}}}})]}})),Uf=(0,m.Ay)("span",{name:"MuiSwitch",slot:"Track"})((0,pp.A)(e=>{let{theme:t}=e;return{height:"100%",width:"100%",borderRadius:7,zIndex:-1,transition:t.transitions.create(["opacity","background-color"],{duration:t.transitions.duration.shortest}),backgroundColor:t.vars?t.vars.palette.common.onBackground:"".concat("light"===t.palette.mode?t.palette.common.black:t.palette.common.white),opacity:t.vars?t.vars.opacity.switchTrack:"".concat("light"===t.palette.mode?.38:.3)}})),Kf=(0,m.Ay)("span",{name:"MuiSwitch",slot:"Thumb"})((0,pp.A)(e=>{let{theme:t}=e;return{boxShadow:(t.vars||t).shadows[1],backgroundColor:"currentColor",width:20,height:20,borderRadius:"50%"}})),qf=r.forwardRef(function(e,t){const o=(0,gp.b)({props:e,name:"MuiSwitch"}),{className:n,color:r="primary",edge:l=!1,size:i="medium",sx:a,slots:s={},slotProps:u={}}=o,d=(0,cp.A)(o,Vf),f=(0,$.A)((0,$.A)({},o),{},{color:r,edge:l,size:i}),g=(e=>{const{classes:t,edge:o,size:n,color:r,checked:l,disabled:i}=e,a={root:["root",o&&"edge".concat((0,hp.A)(o)),"size".concat((0,hp.A)(n))],switchBase:["switchBase","color".concat((0,hp.A)(r)),l&&"checked",i&&"disabled"],thumb:["thumb"],track:["track"],input:["input"]},s=(0,p.A)(a,Nf,t);return(0,$.A)((0,$.A)({},t),s)})(f),h={slots:s,slotProps:u},[m,v]=(0,bp.A)("root",{className:(0,c.A)(g.root,n),elementType:Gf,externalForwardedProps:h,ownerState:f,additionalProps:{sx:a}}),[b,w]=(0,bp.A)("thumb",{className:g.thumb,elementType:Kf,externalForwardedProps:h,ownerState:f}),C=(0,q.jsx)(b,(0,$.A)({},w)),[y,A]=(0,bp.A)("track",{className:g.track,elementType:Uf,externalForwardedProps:h,ownerState:f});return(0,q.jsxs)(m,(0,$.A)((0,$.A)({},v),{},{children:[(0,q.jsx)(Wf,(0,$.A)((0,$.A)({type:"checkbox",icon:C,checkedIcon:C,ref:t,ownerState:f},d),{},{classes:(0,$.A)((0,$.A)({},g),{},{root:g.switchBase}),slots:(0,$.A)((0,$.A)({},s.switchBase&&{root:s.switchBase}),s.input&&{input:s.input}),slotProps:(0,$.A)((0,$.A)({},u.switchBase&&{root:"function"===typeof u.switchBase?u.switchBase(f):u.switchBase}),{},{input:{role:"switch"}},u.input&&{input:"function"===typeof u.input?u.input(f):u.input})})),(0,q.jsx)(y,(0,$.A)({},A))]}))}),_f=qf;var Xf=o(2097),Yf=o(6835),Qf=o(6647),$f=o(8736);function Zf(e){return(0,v.Ay)("MuiInputAdornment",e)}const Jf=(0,b.A)("MuiInputAdornment",["root","filled","standard","outlined","positionStart","positionEnd","disablePointerEvents","hiddenLabel","sizeSmall"]),eg=["children","className","component","disablePointerEvents","disableTypography","position","variant"];var tg;const og=(0,m.Ay)("div",{name:"MuiInputAdornment",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,t["position".concat((0,hp.A)(o.position))],!0===o.disablePointerEvents&&t.disablePointerEvents,t[o.variant]]}})((0,pp.A)(e=>{let{theme:t}=e;return{display:"flex",maxHeight:"2em",alignItems:"center",whiteSpace:"nowrap",color:(t.vars||t).palette.action.active,variants:[{props:{variant:"filled"},style:{["&.".concat(Jf.positionStart,"&:not(.").concat(Jf.hiddenLabel,")")]:{marginTop:16}}},{props:{position:"start"},style:{marginRight:8}},{props:{position:"end"},style:{marginLeft:8}},{props:{disablePointerEvents:!0},style:{pointerEvents:"none"}}]}})),ng=r.forwardRef(function(e,t){const o=(0,gp.b)({props:e,name:"MuiInputAdornment"}),{children:n,className:l,component:i="div",disablePointerEvents:a=!1,disableTypography:s=!1,position:u,variant:d}=o,f=(0,cp.A)(o,eg),g=(0,Ip.A)()||{};let h=d;d&&g.variant,g&&!h&&(h=g.variant);const m=(0,$.A)((0,$.A)({},o),{},{hiddenLabel:g.hiddenLabel,size:g.size,disablePointerEvents:a,position:u,variant:h}),v=(e=>{const{classes:t,disablePointerEvents:o,hiddenLabel:n,position:r,size:l,variant:i}=e,a={root:["root",o&&"disablePointerEvents",r&&"position".concat((0,hp.A)(r)),i,n&&"hiddenLabel",l&&"size".concat((0,hp.A)(l))]};return(0,p.A)(a,Zf,t)})(m);return(0,q.jsx)($f.A.Provider,{value:null,children:(0,q.jsx)(og,(0,$.A)((0,$.A)({as:i,ownerState:m,className:(0,c.A)(v.root,l),ref:t},f),{},{children:"string"!==typeof n||s?(0,q.jsxs)(r.Fragment,{children:["start"===u?tg||(tg=(0,q.jsx)("span",{className:"notranslate","aria-hidden":!0,children:"\u200b"})):null,n]}):(0,q.jsx)(kf.A,{color:"textSecondary",children:n})}))})}),rg=ng;var lg=o(4167),ig=o(2475),ag=o(6595),sg=o(9181),cg=o(2674),ug=o(8348),dg=o(6572);function pg(e){return(0,v.Ay)("MuiTooltip",e)}const fg=(0,b.A)("MuiTooltip",["popper","popperInteractive","popperArrow","popperClose","tooltip","tooltipArrow","touch","tooltipPlacementLeft","tooltipPlacementRight","tooltipPlacementTop","tooltipPlacementBottom","arrow"]),gg=["arrow","children","classes","components","componentsProps","describeChild","disableFocusListener","disableHoverListener","disableInteractive","disableTouchListener","enterDelay","enterNextDelay","enterTouchDelay","followCursor","id","leaveDelay","leaveTouchDelay","onClose","onOpen","open","placement","PopperComponent","PopperProps","slotProps","slots","title","TransitionComponent","TransitionProps"];const hg=(0,m.Ay)(sg.A,{name:"MuiTooltip",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.popper,!o.disableInteractive&&t.popperInteractive,o.arrow&&t.popperArrow,!o.open&&t.popperClose]}})((0,pp.A)(e=>{let{theme:t}=e;return{zIndex:(t.vars||t).zIndex.tooltip,pointerEvents:"none",variants:[{props:e=>{let{ownerState:t}=e;return!t.disableInteractive},style:{pointerEvents:"auto"}},{props:e=>{let{open:t}=e;return!t},style:{pointerEvents:"none"}},{props:e=>{let{ownerState:t}=e;return t.arrow},style:{['&[data-popper-placement*="bottom"] .'.concat(fg.arrow)]:{top:0,marginTop:"-0.71em","&::before":{transformOrigin:"0 100%"}},['&[data-popper-placement*="top"] .'.concat(fg.arrow)]:{bottom:0,marginBottom:"-0.71em","&::before":{transformOrigin:"100% 0"}},['&[data-popper-placement*="right"] .'.concat(fg.arrow)]:{height:"1em",width:"0.71em","&::before":{transformOrigin:"100% 100%"}},['&[data-popper-placement*="left"] .'.concat(fg.arrow)]:{height:"1em",width:"0.71em","&::before":{transformOrigin:"0 0"}}}},{props:e=>{let{ownerState:t}=e;return t.arrow&&!t.isRtl},style:{['&[data-popper-placement*="right"] .'.concat(fg.arrow)]:{left:0,marginLeft:"-0.71em"}}},{props:e=>{let{ownerState:t}=e;return t.arrow&&!!t.isRtl},style:{['&[data-popper-placement*="right"] .'.concat(fg.arrow)]:{right:0,marginRight:"-0.71em"}}},{props:e=>{let{ownerState:t}=e;return t.arrow&&!t.isRtl},style:{['&[data-popper-placement*="left"] .'.concat(fg.arrow)]:{right:0,marginRight:"-0.71em"}}},{props:e=>{let{ownerState:t}=e;return t.arrow&&!!t.isRtl},style:{['&[data-popper-placement*="left"] .'.concat(fg.arrow)]:{left:0,marginLeft:"-0.71em"}}}]}})),mg=(0,m.Ay)("div",{name:"MuiTooltip",slot:"Tooltip",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.tooltip,o.touch&&t.touch,o.arrow&&t.tooltipArrow,t["tooltipPlacement".concat((0,hp.A)(o.placement.split("-")[0]))]]}})((0,pp.A)(e=>{let{theme:t}=e;return{backgroundColor:t.vars?t.vars.palette.Tooltip.bg:t.alpha(t.palette.grey[700],.92),borderRadius:(t.vars||t).shape.borderRadius,color:(t.vars||t).palette.common.white,fontFamily:t.typography.fontFamily,padding:"4px 8px",fontSize:t.typography.pxToRem(11),maxWidth:300,margin:2,wordWrap:"break-word",fontWeight:t.typography.fontWeightMedium,[".".concat(fg.popper,'[data-popper-placement*="left"] &')]:{transformOrigin:"right center"},[".".concat(fg.popper,'[data-popper-placement*="right"] &')]:{transformOrigin:"left center"},[".".concat(fg.popper,'[data-popper-placement*="top"] &')]:{transformOrigin:"center bottom",marginBottom:"14px"},[".".concat(fg.popper,'[data-popper-placement*="bottom"] &')]:{transformOrigin:"center top",marginTop:"14px"},variants:[{props:e=>{let{ownerState:t}=e;return t.arrow},style:{position:"relative",margin:0}},{props:e=>{let{ownerState:t}=e;return t.touch},style:{padding:"8px 16px",fontSize:t.typography.pxToRem(14),lineHeight:"".concat((o=16/14,Math.round(1e5*o)/1e5),"em"),fontWeight:t.typography.fontWeightRegular}},{props:e=>{let{ownerState:t}=e;return!t.isRtl},style:{[".".concat(fg.popper,'[data-popper-placement*="left"] &')]:{marginRight:"14px"},[".".concat(fg.popper,'[data-popper-placement*="right"] &')]:{marginLeft:"14px"}}},{props:e=>{let{ownerState:t}=e;return!t.isRtl&&t.touch},style:{[".".concat(fg.popper,'[data-popper-placement*="left"] &')]:{marginRight:"24px"},[".".concat(fg.popper,'[data-popper-placement*="right"] &')]:{marginLeft:"24px"}}},{props:e=>{let{ownerState:t}=e;return!!t.isRtl},style:{[".".concat(fg.popper,'[data-popper-placement*="left"] &')]:{marginLeft:"14px"},[".".concat(fg.popper,'[data-popper-placement*="right"] &')]:{marginRight:"14px"}}},{props:e=>{let{ownerState:t}=e;return!!t.isRtl&&t.touch},style:{[".".concat(fg.popper,'[data-popper-placement*="left"] &')]:{marginLeft:"24px"},[".".concat(fg.popper,'[data-popper-placement*="right"] &')]:{marginRight:"24px"}}},{props:e=>{let{ownerState:t}=e;return t.touch},style:{[".".concat(fg.popper,'[data-popper-placement*="top"] &')]:{marginBottom:"24px"}}},{props:e=>{let{ownerState:t}=e;return t.touch},style:{[".".concat(fg.popper,'[data-popper-placement*="bottom"] &')]:{marginTop:"24px"}}}]};var o})),vg=(0,m.Ay)("span",{name:"MuiTooltip",slot:"Arrow"})((0,pp.A)(e=>{let{theme:t}=e;return{overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:t.vars?t.vars.palette.Tooltip.bg:t.alpha(t.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}}}));let bg=!1;const wg=new Lt.E;let Cg={x:0,y:0};function yg(e,t){return function(o){for(var n=arguments.length,r=new Array(n>1?n-1:0),l=1;l<n;l++)r[l-1]=arguments[l];t&&t(o,...r),e(o,...r)}}const Ag=r.forwardRef(function(e,t){var o,n,l;const i=(0,gp.b)({props:e,name:"MuiTooltip"}),{arrow:a=!1,children:s,classes:u,components:d={},componentsProps:f={},describeChild:g=!1,disableFocusListener:h=!1,disableHoverListener:m=!1,disableInteractive:v=!1,disableTouchListener:b=!1,enterDelay:w=100,enterNextDelay:C=0,enterTouchDelay:y=700,followCursor:A=!1,id:x,leaveDelay:S=0,leaveTouchDelay:R=1500,onClose:M,onOpen:I,open:P,placement:k="bottom",PopperComponent:E,PopperProps:F={},slotProps:T={},slots:H={},title:D,TransitionComponent:O,TransitionProps:z}=i,L=(0,cp.A)(i,gg),j=r.isValidElement(s)?s:(0,q.jsx)("span",{children:s}),N=(0,Fc.A)(),B=(0,Hn.I)(),[V,G]=r.useState(),[W,U]=r.useState(null),K=r.useRef(!1),_=v||A,X=(0,Lt.A)(),Y=(0,Lt.A)(),Q=(0,Lt.A)(),Z=(0,Lt.A)(),[J,ee]=(0,Mp.A)({controlled:P,default:!1,name:"Tooltip",state:"open"});let te=J;const oe=(0,dg.A)(x),ne=r.useRef(),re=(0,cg.A)(()=>{void 0!==ne.current&&(document.body.style.WebkitUserSelect=ne.current,ne.current=void 0),Z.clear()});r.useEffect(()=>re,[re]);const le=e=>{wg.clear(),bg=!0,ee(!0),I&&!te&&I(e)},ie=(0,cg.A)(e=>{wg.start(800+S,()=>{bg=!1}),ee(!1),M&&te&&M(e),X.start(N.transitions.duration.shortest,()=>{K.current=!1})}),ae=e=>{K.current&&"touchstart"!==e.type||(V&&V.removeAttribute("title"),Y.clear(),Q.clear(),w||bg&&C?Y.start(bg?C:w,()=>{le(e)}):le(e))},se=e=>{Y.clear(),Q.start(S,()=>{ie(e)})},[,ce]=r.useState(!1),ue=e=>{(0,lg.A)(e.target)||(ce(!1),se(e))},de=e=>{V||G(e.currentTarget),(0,lg.A)(e.target)&&(ce(!0),ae(e))},pe=e=>{K.current=!0;const t=j.props;t.onTouchStart&&t.onTouchStart(e)},fe=e=>{pe(e),Q.clear(),X.clear(),re(),ne.current=document.body.style.WebkitUserSelect,document.body.style.WebkitUserSelect="none",Z.start(y,()=>{document.body.style.WebkitUserSelect=ne.current,ae(e)})},ge=e=>{j.props.onTouchEnd&&j.props.onTouchEnd(e),re(),Q.start(R,()=>{ie(e)})};r.useEffect(()=>{if(te)return document.addEventListener("keydown",e),()=>{document.removeEventListener("keydown",e)};function e(e){"Escape"===e.key&&ie(e)}},[ie,te]);const he=(0,ug.A)((0,ig.A)(j),G,t);D||0===D||(te=!1);const me=r.useRef(),ve={},be="string"===typeof D;g?(ve.title=te||!be||m?null:D,ve["aria-describedby"]=te?oe:null):(ve["aria-label"]=be?D:null,ve["aria-labelledby"]=te&&!be?oe:null);const we=(0,$.A)((0,$.A)((0,$.A)((0,$.A)({},ve),L),j.props),{},{className:(0,c.A)(L.className,j.props.className),onTouchStart:pe,ref:he},A?{onMouseMove:e=>{const t=j.props;t.onMouseMove&&t.onMouseMove(e),Cg={x:e.clientX,y:e.clientY},me.current&&me.current.update()}}:{});const Ce={};b||(we.onTouchStart=fe,we.onTouchEnd=ge),m||(we.onMouseOver=yg(ae,we.onMouseOver),we.onMouseLeave=yg(se,we.onMouseLeave),_||(Ce.onMouseOver=ae,Ce.onMouseLeave=se)),h||(we.onFocus=yg(de,we.onFocus),we.onBlur=yg(ue,we.onBlur),_||(Ce.onFocus=de,Ce.onBlur=ue));const ye=(0,$.A)((0,$.A)({},i),{},{isRtl:B,arrow:a,disableInteractive:_,placement:k,PopperComponentProp:E,touch:K.current}),Ae="function"===typeof T.popper?T.popper(ye):T.popper,xe=r.useMemo(()=>{var e,t;let o=[{name:"arrow",enabled:Boolean(W),options:{element:W,padding:4}}];return null!==(e=F.popperOptions)&&void 0!==e&&e.modifiers&&(o=o.concat(F.popperOptions.modifiers)),null!==Ae&&void 0!==Ae&&null!==(t=Ae.popperOptions)&&void 0!==t&&t.modifiers&&(o=o.concat(Ae.popperOptions.modifiers)),(0,$.A)((0,$.A)((0,$.A)({},F.popperOptions),null===Ae||void 0===Ae?void 0:Ae.popperOptions),{},{modifiers:o})},[W,F.popperOptions,null===Ae||void 0===Ae?void 0:Ae.popperOptions]),Se=(e=>{const{classes:t,disableInteractive:o,arrow:n,touch:r,placement:l}=e,i={popper:["popper",!o&&"popperInteractive",n&&"popperArrow"],tooltip:["tooltip",n&&"tooltipArrow",r&&"touch","tooltipPlacement".concat((0,hp.A)(l.split("-")[0]))],arrow:["arrow"]};return(0,p.A)(i,pg,t)})(ye),Re="function"===typeof T.transition?T.transition(ye):T.transition,Me={slots:(0,$.A)({popper:d.Popper,transition:null!==(o=d.Transition)&&void 0!==o?o:O,tooltip:d.Tooltip,arrow:d.Arrow},H),slotProps:{arrow:null!==(n=T.arrow)&&void 0!==n?n:f.arrow,popper:(0,$.A)((0,$.A)({},F),null!==Ae&&void 0!==Ae?Ae:f.popper),tooltip:null!==(l=T.tooltip)&&void 0!==l?l:f.tooltip,transition:(0,$.A)((0,$.A)({},z),null!==Re&&void 0!==Re?Re:f.transition)}},[Ie,Pe]=(0,bp.A)("popper",{elementType:hg,externalForwardedProps:Me,ownerState:ye,className:(0,c.A)(Se.popper,null===F||void 0===F?void 0:F.className)}),[ke,Ee]=(0,bp.A)("transition",{elementType:ag.A,externalForwardedProps:Me,ownerState:ye}),[Fe,Te]=(0,bp.A)("tooltip",{elementType:mg,className:Se.tooltip,externalForwardedProps:Me,ownerState:ye}),[He,De]=(0,bp.A)("arrow",{elementType:vg,className:Se.arrow,externalForwardedProps:Me,ownerState:ye,ref:U});return(0,q.jsxs)(r.Fragment,{children:[r.cloneElement(j,we),(0,q.jsx)(Ie,(0,$.A)((0,$.A)((0,$.A)({as:null!==E&&void 0!==E?E:sg.A,placement:k,anchorEl:A?{getBoundingClientRect:()=>({top:Cg.y,left:Cg.x,right:Cg.x,bottom:Cg.y,width:0,height:0})}:V,popperRef:me,open:!!V&&te,id:oe,transition:!0},Ce),Pe),{},{popperOptions:xe,children:e=>{let{TransitionProps:t}=e;return(0,q.jsx)(ke,(0,$.A)((0,$.A)((0,$.A)({timeout:N.transitions.duration.shorter},t),Ee),{},{children:(0,q.jsxs)(Fe,(0,$.A)((0,$.A)({},Te),{},{children:[D,a?(0,q.jsx)(He,(0,$.A)({},De)):null]}))}))}}))]})}),xg=Ag;const Sg=r.createContext();const Rg=r.createContext();function Mg(e){return(0,v.Ay)("MuiTableCell",e)}const Ig=(0,b.A)("MuiTableCell",["root","head","body","footer","sizeSmall","sizeMedium","paddingCheckbox","paddingNone","alignLeft","alignCenter","alignRight","alignJustify","stickyHeader"]),Pg=["align","className","component","padding","scope","size","sortDirection","variant"],kg=(0,m.Ay)("td",{name:"MuiTableCell",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,t[o.variant],t["size".concat((0,hp.A)(o.size))],"normal"!==o.padding&&t["padding".concat((0,hp.A)(o.padding))],"inherit"!==o.align&&t["align".concat((0,hp.A)(o.align))],o.stickyHeader&&t.stickyHeader]}})((0,pp.A)(e=>{let{theme:t}=e;return(0,$.A)((0,$.A)({},t.typography.body2),{},{display:"table-cell",verticalAlign:"inherit",borderBottom:t.vars?"1px solid ".concat(t.vars.palette.TableCell.border):"1px solid\n    ".concat("light"===t.palette.mode?t.lighten(t.alpha(t.palette.divider,1),.88):t.darken(t.alpha(t.palette.divider,1),.68)),textAlign:"left",padding:16,variants:[{props:{variant:"head"},style:{color:(t.vars||t).palette.text.primary,lineHeight:t.typography.pxToRem(24),fontWeight:t.typography.fontWeightMedium}},{props:{variant:"body"},style:{color:(t.vars||t).palette.text.primary}},{props:{variant:"footer"},style:{color:(t.vars||t).palette.text.secondary,lineHeight:t.typography.pxToRem(21),fontSize:t.typography.pxToRem(12)}},{props:{size:"small"},style:{padding:"6px 16px",["&.".concat(Ig.paddingCheckbox)]:{width:24,padding:"0 12px 0 16px","& > *":{padding:0}}}},{props:{padding:"checkbox"},style:{width:48,padding:"0 0 0 4px"}},{props:{padding:"none"},style:{padding:0}},{props:{align:"left"},style:{textAlign:"left"}},{props:{align:"center"},style:{textAlign:"center"}},{props:{align:"right"},style:{textAlign:"right",flexDirection:"row-reverse"}},{props:{align:"justify"},style:{textAlign:"justify"}},{props:e=>{let{ownerState:t}=e;return t.stickyHeader},style:{position:"sticky",top:0,zIndex:2,backgroundColor:(t.vars||t).palette.background.default}}]})})),Eg=r.forwardRef(function(e,t){const o=(0,gp.b)({props:e,name:"MuiTableCell"}),{align:n="inherit",className:l,component:i,padding:a,scope:s,size:u,sortDirection:d,variant:f}=o,g=(0,cp.A)(o,Pg),h=r.useContext(Sg),m=r.useContext(Rg),v=m&&"head"===m.variant;let b;b=i||(v?"th":"td");let w=s;"td"===b?w=void 0:!w&&v&&(w="col");const C=f||m&&m.variant,y=(0,$.A)((0,$.A)({},o),{},{align:n,component:b,padding:a||(h&&h.padding?h.padding:"normal"),size:u||(h&&h.size?h.size:"medium"),sortDirection:d,stickyHeader:"head"===C&&h&&h.stickyHeader,variant:C}),A=(e=>{const{classes:t,variant:o,align:n,padding:r,size:l,stickyHeader:i}=e,a={root:["root",o,i&&"stickyHeader","inherit"!==n&&"align".concat((0,hp.A)(n)),"normal"!==r&&"padding".concat((0,hp.A)(r)),"size".concat((0,hp.A)(l))]};return(0,p.A)(a,Mg,t)})(y);let x=null;return d&&(x="asc"===d?"ascending":"descending"),(0,q.jsx)(kg,(0,$.A)({as:b,ref:t,className:(0,c.A)(A.root,l),"aria-sort":x,scope:w,ownerState:y},g))}),Fg=Eg;var Tg=o(3182);const Hg=(0,Op.A)((0,q.jsx)("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),Dg=(0,Op.A)((0,q.jsx)("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");var Og=o(9155),zg=o(8735);function Lg(e){return(0,v.Ay)("MuiTablePaginationActions",e)}(0,b.A)("MuiTablePaginationActions",["root"]);const jg=["backIconButtonProps","className","count","disabled","getItemAriaLabel","nextIconButtonProps","onPageChange","page","rowsPerPage","showFirstButton","showLastButton","slots","slotProps"],Ng=(0,m.Ay)("div",{name:"MuiTablePaginationActions",slot:"Root"})({}),Bg=r.forwardRef(function(e,t){var o,n,r,l,i,a,s,u;const d=(0,gp.b)({props:e,name:"MuiTablePaginationActions"}),{backIconButtonProps:f,className:g,count:h,disabled:m=!1,getItemAriaLabel:v,nextIconButtonProps:b,onPageChange:w,page:C,rowsPerPage:y,showFirstButton:A,showLastButton:x,slots:S={},slotProps:R={}}=d,M=(0,cp.A)(d,jg),I=(0,Hn.I)(),P=(e=>{const{classes:t}=e;return(0,p.A)({root:["root"]},Lg,t)})(d),k=null!==(o=S.firstButton)&&void 0!==o?o:Qf.A,E=null!==(n=S.lastButton)&&void 0!==n?n:Qf.A,F=null!==(r=S.nextButton)&&void 0!==r?r:Qf.A,T=null!==(l=S.previousButton)&&void 0!==l?l:Qf.A,H=null!==(i=S.firstButtonIcon)&&void 0!==i?i:zg.A,D=null!==(a=S.lastButtonIcon)&&void 0!==a?a:Og.A,O=null!==(s=S.nextButtonIcon)&&void 0!==s?s:Dg,z=null!==(u=S.previousButtonIcon)&&void 0!==u?u:Hg,L=I?E:k,j=I?F:T,N=I?T:F,B=I?k:E,V=I?R.lastButton:R.firstButton,G=I?R.nextButton:R.previousButton,W=I?R.previousButton:R.nextButton,U=I?R.firstButton:R.lastButton;return(0,q.jsxs)(Ng,(0,$.A)((0,$.A)({ref:t,className:(0,c.A)(P.root,g)},M),{},{children:[A&&(0,q.jsx)(L,(0,$.A)((0,$.A)({onClick:e=>{w(e,0)},disabled:m||0===C,"aria-label":v("first",C),title:v("first",C)},V),{},{children:I?(0,q.jsx)(D,(0,$.A)({},R.lastButtonIcon)):(0,q.jsx)(H,(0,$.A)({},R.firstButtonIcon))})),(0,q.jsx)(j,(0,$.A)((0,$.A)({onClick:e=>{w(e,C-1)},disabled:m||0===C,color:"inherit","aria-label":v("previous",C),title:v("previous",C)},null!==G&&void 0!==G?G:f),{},{children:I?(0,q.jsx)(O,(0,$.A)({},R.nextButtonIcon)):(0,q.jsx)(z,(0,$.A)({},R.previousButtonIcon))})),(0,q.jsx)(N,(0,$.A)((0,$.A)({onClick:e=>{w(e,C+1)},disabled:m||-1!==h&&C>=Math.ceil(h/y)-1,color:"inherit","aria-label":v("next",C),title:v("next",C)},null!==W&&void 0!==W?W:b),{},{children:I?(0,q.jsx)(z,(0,$.A)({},R.previousButtonIcon)):(0,q.jsx)(O,(0,$.A)({},R.nextButtonIcon))})),x&&(0,q.jsx)(B,(0,$.A)((0,$.A)({onClick:e=>{w(e,Math.max(0,Math.ceil(h/y)-1))},disabled:m||C>=Math.ceil(h/y)-1,"aria-label":v("last",C),title:v("last",C)},U),{},{children:I?(0,q.jsx)(H,(0,$.A)({},R.firstButtonIcon)):(0,q.jsx)(D,(0,$.A)({},R.lastButtonIcon))}))]}))}),Vg=Bg;function Gg(e){return(0,v.Ay)("MuiTablePagination",e)}const Wg=(0,b.A)("MuiTablePagination",["root","toolbar","spacer","selectLabel","selectRoot","select","selectIcon","input","menuItem","displayedRows","actions"]),Ug=["ActionsComponent","backIconButtonProps","colSpan","component","count","disabled","getItemAriaLabel","labelDisplayedRows","labelRowsPerPage","nextIconButtonProps","onPageChange","onRowsPerPageChange","page","rowsPerPage","rowsPerPageOptions","SelectProps","showFirstButton","showLastButton","slotProps","slots"];var Kg;const qg=(0,m.Ay)(Fg,{name:"MuiTablePagination",slot:"Root"})((0,pp.A)(e=>{let{theme:t}=e;return{overflow:"auto",color:(t.vars||t).palette.text.primary,fontSize:t.typography.pxToRem(14),"&:last-child":{padding:0}}})),_g=(0,m.Ay)(Tg.A,{name:"MuiTablePagination",slot:"Toolbar",overridesResolver:(e,t)=>(0,$.A)({["& .".concat(Wg.actions)]:t.actions},t.toolbar)})((0,pp.A)(e=>{let{theme:t}=e;return{minHeight:52,paddingRight:2,["".concat(t.breakpoints.up("xs")," and (orientation: landscape)")]:{minHeight:52},[t.breakpoints.up("sm")]:{minHeight:52,paddingRight:2},["& .".concat(Wg.actions)]:{flexShrink:0,marginLeft:20}}})),Xg=(0,m.Ay)("div",{name:"MuiTablePagination",slot:"Spacer"})({flex:"1 1 100%"}),Yg=(0,m.Ay)("p",{name:"MuiTablePagination",slot:"SelectLabel"})((0,pp.A)(e=>{let{theme:t}=e;return(0,$.A)((0,$.A)({},t.typography.body2),{},{flexShrink:0})})),Qg=(0,m.Ay)(jf.A,{name:"MuiTablePagination",slot:"Select",overridesResolver:(e,t)=>(0,$.A)((0,$.A)({["& .".concat(Wg.selectIcon)]:t.selectIcon,["& .".concat(Wg.select)]:t.select},t.input),t.selectRoot)})({color:"inherit",fontSize:"inherit",flexShrink:0,marginRight:32,marginLeft:8,["& .".concat(Wg.select)]:{paddingLeft:8,paddingRight:24,textAlign:"right",textAlignLast:"right"}}),$g=(0,m.Ay)(Mf.A,{name:"MuiTablePagination",slot:"MenuItem"})({}),Zg=(0,m.Ay)("p",{name:"MuiTablePagination",slot:"DisplayedRows"})((0,pp.A)(e=>{let{theme:t}=e;return(0,$.A)((0,$.A)({},t.typography.body2),{},{flexShrink:0})}));function Jg(e){let{from:t,to:o,count:n}=e;return"".concat(t,"\u2013").concat(o," of ").concat(-1!==n?n:"more than ".concat(o))}function eh(e){return"Go to ".concat(e," page")}const th=r.forwardRef(function(e,t){var o;const n=(0,gp.b)({props:e,name:"MuiTablePagination"}),{ActionsComponent:l=Vg,backIconButtonProps:i,colSpan:a,component:s=Fg,count:u,disabled:d=!1,getItemAriaLabel:f=eh,labelDisplayedRows:g=Jg,labelRowsPerPage:h="Rows per page:",nextIconButtonProps:m,onPageChange:v,onRowsPerPageChange:b,page:w,rowsPerPage:C,rowsPerPageOptions:y=[10,25,50,100],SelectProps:A={},showFirstButton:x=!1,showLastButton:S=!1,slotProps:R={},slots:M={}}=n,I=(0,cp.A)(n,Ug),P=n,k=(e=>{const{classes:t}=e;return(0,p.A)({root:["root"],toolbar:["toolbar"],spacer:["spacer"],selectLabel:["selectLabel"],select:["select"],input:["input"],selectIcon:["selectIcon"],menuItem:["menuItem"],displayedRows:["displayedRows"],actions:["actions"]},Gg,t)})(P),E=null!==(o=null===R||void 0===R?void 0:R.select)&&void 0!==o?o:A,F=E.native?"option":$g;let T;s!==Fg&&"td"!==s||(T=a||1e3);const H=(0,dg.A)(E.id),D=(0,dg.A)(E.labelId),O={slots:M,slotProps:R},[z,L]=(0,bp.A)("root",{ref:t,className:k.root,elementType:qg,externalForwardedProps:(0,$.A)((0,$.A)({},O),{},{component:s},I),ownerState:P,additionalProps:{colSpan:T}}),[j,N]=(0,bp.A)("toolbar",{className:k.toolbar,elementType:_g,externalForwardedProps:O,ownerState:P}),[B,V]=(0,bp.A)("spacer",{className:k.spacer,elementType:Xg,externalForwardedProps:O,ownerState:P}),[G,W]=(0,bp.A)("selectLabel",{className:k.selectLabel,elementType:Yg,externalForwardedProps:O,ownerState:P,additionalProps:{id:D}}),[U,K]=(0,bp.A)("select",{className:k.select,elementType:Qg,externalForwardedProps:O,ownerState:P}),[_,X]=(0,bp.A)("menuItem",{className:k.menuItem,elementType:F,externalForwardedProps:O,ownerState:P}),[Y,Q]=(0,bp.A)("displayedRows",{className:k.displayedRows,elementType:Zg,externalForwardedProps:O,ownerState:P});return(0,q.jsx)(z,(0,$.A)((0,$.A)({},L),{},{children:(0,q.jsxs)(j,(0,$.A)((0,$.A)({},N),{},{children:[(0,q.jsx)(B,(0,$.A)({},V)),y.length>1&&(0,q.jsx)(G,(0,$.A)((0,$.A)({},W),{},{children:h})),y.length>1&&(0,q.jsx)(U,(0,$.A)((0,$.A)((0,$.A)((0,$.A)({variant:"standard"},!E.variant&&{input:Kg||(Kg=(0,q.jsx)(Zp.Ay,{}))}),{},{value:C,onChange:b,id:H,labelId:D},E),{},{classes:(0,$.A)((0,$.A)({},E.classes),{},{root:(0,c.A)(k.input,k.selectRoot,(E.classes||{}).root),select:(0,c.A)(k.select,(E.classes||{}).select),icon:(0,c.A)(k.selectIcon,(E.classes||{}).icon)}),disabled:d},K),{},{children:y.map(e=>(0,r.createElement)(_,(0,$.A)((0,$.A)({},X),{},{key:e.label?e.label:e,value:e.value?e.value:e}),e.label?e.label:e))})),(0,q.jsx)(Y,(0,$.A)((0,$.A)({},Q),{},{children:g({from:0===u?0:w*C+1,to:-1===u?(w+1)*C:-1===C?u:Math.min(u,(w+1)*C),count:-1===u?-1:u,page:w})})),(0,q.jsx)(l,{className:k.actions,backIconButtonProps:i,count:u,nextIconButtonProps:m,onPageChange:v,page:w,rowsPerPage:C,showFirstButton:x,showLastButton:S,slotProps:R.actions,slots:M.actions,getItemAriaLabel:f,disabled:d})]}))}))}),oh=th;function nh(e){return e.substring(2).toLowerCase()}function rh(e){const{children:t,disableReactTree:o=!1,mouseEvent:n="onClick",onClickAway:l,touchEvent:i="onTouchEnd"}=e,a=r.useRef(!1),s=r.useRef(null),c=r.useRef(!1),d=r.useRef(!1);r.useEffect(()=>(setTimeout(()=>{c.current=!0},0),()=>{c.current=!1}),[]);const p=(0,u.A)((0,ig.A)(t),s),f=(0,It.A)(e=>{const t=d.current;d.current=!1;const n=(0,li.A)(s.current);if(!c.current||!s.current||"clientX"in e&&function(e,t){return t.documentElement.clientWidth<e.clientX||t.documentElement.clientHeight<e.clientY}(e,n))return;if(a.current)return void(a.current=!1);let r;r=e.composedPath?e.composedPath().includes(s.current):!n.documentElement.contains(e.target)||s.current.contains(e.target),r||!o&&t||l(e)}),g=e=>o=>{d.current=!0;const n=t.props[e];n&&n(o)},h={ref:p};return!1!==i&&(h[i]=g(i)),r.useEffect(()=>{if(!1!==i){const e=nh(i),t=(0,li.A)(s.current),o=()=>{a.current=!0};return t.addEventListener(e,f),t.addEventListener("touchmove",o),()=>{t.removeEventListener(e,f),t.removeEventListener("touchmove",o)}}},[f,i]),!1!==n&&(h[n]=g(n)),r.useEffect(()=>{if(!1!==n){const e=nh(n),t=(0,li.A)(s.current);return t.addEventListener(e,f),()=>{t.removeEventListener(e,f)}}},[f,n]),r.cloneElement(t,h)}var lh=o(4799),ih=o(9067);function ah(e){return String(e).match(/[\d.\-+]*\s*(.*)/)[1]||""}function sh(e){return parseFloat(e)}function ch(e){return(0,v.Ay)("MuiSkeleton",e)}(0,b.A)("MuiSkeleton",["root","text","rectangular","rounded","circular","pulse","wave","withChildren","fitContent","heightAuto"]);const uh=["animation","className","component","height","style","variant","width"];var dh,ph,fh,gh;const hh=(0,Ju.i7)(dh||(dh=(0,Zu.A)(["\n  0% {\n    opacity: 1;\n  }\n\n  50% {\n    opacity: 0.4;\n  }\n\n  100% {\n    opacity: 1;\n  }\n"]))),mh=(0,Ju.i7)(ph||(ph=(0,Zu.A)(["\n  0% {\n    transform: translateX(-100%);\n  }\n\n  50% {\n    /* +0.5s of delay between each loop */\n    transform: translateX(100%);\n  }\n\n  100% {\n    transform: translateX(100%);\n  }\n"]))),vh="string"!==typeof hh?(0,Ju.AH)(fh||(fh=(0,Zu.A)(["\n        animation: "," 2s ease-in-out 0.5s infinite;\n      "])),hh):null,bh="string"!==typeof mh?(0,Ju.AH)(gh||(gh=(0,Zu.A)(["\n        &::after {\n          animation: "," 2s linear 0.5s infinite;\n        }\n      "])),mh):null,wh=(0,m.Ay)("span",{name:"MuiSkeleton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:o}=e;return[t.root,t[o.variant],!1!==o.animation&&t[o.animation],o.hasChildren&&t.withChildren,o.hasChildren&&!o.width&&t.fitContent,o.hasChildren&&!o.height&&t.heightAuto]}})((0,pp.A)(e=>{let{theme:t}=e;const o=ah(t.shape.borderRadius)||"px",n=sh(t.shape.borderRadius);return{display:"block",backgroundColor:t.vars?t.vars.palette.Skeleton.bg:t.alpha(t.palette.text.primary,"light"===t.palette.mode?.11:.13),height:"1.2em",variants:[{props:{variant:"text"},style:{marginTop:0,marginBottom:0,height:"auto",transformOrigin:"0 55%",transform:"scale(1, 0.60)",borderRadius:"".concat(n).concat(o,"/").concat(Math.round(n/.6*10)/10).concat(o),"&:empty:before":{content:'"\\00a0"'}}},{props:{variant:"circular"},style:{borderRadius:"50%"}},{props:{variant:"rounded"},style:{borderRadius:(t.vars||t).shape.borderRadius}},{props:e=>{let{ownerState:t}=e;return t.hasChildren},style:{"& > *":{visibility:"hidden"}}},{props:e=>{let{ownerState:t}=e;return t.hasChildren&&!t.width},style:{maxWidth:"fit-content"}},{props:e=>{let{ownerState:t}=e;return t.hasChildren&&!t.height},style:{height:"auto"}},{props:{animation:"pulse"},style:vh||{animation:"".concat(hh," 2s ease-in-out 0.5s infinite")}},{props:{animation:"wave"},style:{position:"relative",overflow:"hidden",WebkitMaskImage:"-webkit-radial-gradient(white, black)","&::after":{background:"linear-gradient(\n                90deg,\n                transparent,\n                ".concat((t.vars||t).palette.action.hover,",\n                transparent\n              )"),content:'""',position:"absolute",transform:"translateX(-100%)",bottom:0,left:0,right:0,top:0}}},{props:{animation:"wave"},style:bh||{"&::after":{animation:"".concat(mh," 2s linear 0.5s infinite")}}}]}})),Ch=r.forwardRef(function(e,t){const o=(0,gp.b)({props:e,name:"MuiSkeleton"}),{animation:n="pulse",className:r,component:l="span",height:i,style:a,variant:s="text",width:u}=o,d=(0,cp.A)(o,uh),f=(0,$.A)((0,$.A)({},o),{},{animation:n,component:l,variant:s,hasChildren:Boolean(d.children)}),g=(e=>{const{classes:t,variant:o,animation:n,hasChildren:r,width:l,height:i}=e,a={root:["root",o,n,r&&"withChildren",r&&!l&&"fitContent",r&&!i&&"heightAuto"]};return(0,p.A)(a,ch,t)})(f);return(0,q.jsx)(wh,(0,$.A)((0,$.A)({as:l,ref:t,className:(0,c.A)(g.root,r),ownerState:f},d),{},{style:(0,$.A)({width:u,height:i},a)}))}),yh=Ch,Ah=Op.A,xh=Ah((0,q.jsx)("path",{d:"M4 12l1.41 1.41L11 7.83V20h2V7.83l5.58 5.59L20 12l-8-8-8 8z"}),"ArrowUpward"),Sh=Ah((0,q.jsx)("path",{d:"M20 12l-1.41-1.41L13 16.17V4h-2v12.17l-5.58-5.59L4 12l8 8 8-8z"}),"ArrowDownward"),Rh=Ah((0,q.jsx)("path",{d:"M8.59 16.59 13.17 12 8.59 7.41 10 6l6 6-6 6-1.41-1.41z"}),"KeyboardArrowRight"),Mh=Ah((0,q.jsx)("path",{d:"M16.59 8.59 12 13.17 7.41 8.59 6 10l6 6 6-6z"}),"ExpandMore"),Ih=Ah((0,q.jsx)("path",{d:"M10 18h4v-2h-4v2zM3 6v2h18V6H3zm3 7h12v-2H6v2z"}),"FilterList"),Ph=Ah((0,q.jsx)("path",{d:"M4.25 5.61C6.27 8.2 10 13 10 13v6c0 .55.45 1 1 1h2c.55 0 1-.45 1-1v-6s3.72-4.8 5.74-7.39c.51-.66.04-1.61-.79-1.61H5.04c-.83 0-1.3.95-.79 1.61z"}),"FilterAlt"),kh=Ah((0,q.jsx)("path",{d:"M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19l-4.99-5zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14z"}),"Search"),Eh=(Ah((0,q.jsx)("path",{d:"M3 18h18v-2H3v2zm0-5h18v-2H3v2zm0-7v2h18V6H3z"}),"Menu"),Ah((0,q.jsx)("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"}),"CheckCircle"),Ah((0,q.jsx)("path",{d:"M14.67 5v14H9.33V5zm1 14H21V5h-5.33zm-7.34 0V5H3v14z"}),"ColumnIcon")),Fh=Ah((0,q.jsx)("rect",{width:"1",height:"24",x:"11.5",rx:"0.5"}),"Separator"),Th=Ah((0,q.jsx)("path",{d:"M4 15h16v-2H4v2zm0 4h16v-2H4v2zm0-8h16V9H4v2zm0-6v2h16V5H4z"}),"ViewHeadline"),Hh=Ah((0,q.jsx)("path",{d:"M21,8H3V4h18V8z M21,10H3v4h18V10z M21,16H3v4h18V16z"}),"TableRows"),Dh=Ah((0,q.jsx)("path",{d:"M4 18h17v-6H4v6zM4 5v6h17V5H4z"}),"ViewStream"),Oh=Ah((0,q.jsx)("path",{d:"M12 8c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm0 2c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2zm0 6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2z"}),"TripleDotsVertical"),zh=Ah((0,q.jsx)("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),Lh=Ah((0,q.jsx)("path",{d:"M19 13h-6v6h-2v-6H5v-2h6V5h2v6h6v2z"}),"Add"),jh=Ah((0,q.jsx)("path",{d:"M19 13H5v-2h14v2z"}),"Remove"),Nh=Ah((0,q.jsx)("path",{d:"M12 4V1L8 5l4 4V6c3.31 0 6 2.69 6 6 0 1.01-.25 1.97-.7 2.8l1.46 1.46C19.54 15.03 20 13.57 20 12c0-4.42-3.58-8-8-8zm0 14c-3.31 0-6-2.69-6-6 0-1.01.25-1.97.7-2.8L5.24 7.74C4.46 8.97 4 10.43 4 12c0 4.42 3.58 8 8 8v3l4-4-4-4v3z"}),"Load"),Bh=Ah((0,q.jsx)("path",{d:"M11 18c0 1.1-.9 2-2 2s-2-.9-2-2 .9-2 2-2 2 .9 2 2zm-2-8c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2zm0-6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2zm6 4c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm0 2c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2zm0 6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2z"}),"Drag"),Vh=Ah((0,q.jsx)("path",{d:"M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z"}),"Check"),Gh=Ah((0,q.jsx)("path",{d:"M12 8c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm0 2c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2zm0 6c-1.1 0-2 .9-2 2s.9 2 2 2 2-.9 2-2-.9-2-2-2z"}),"MoreVert"),Wh=Ah((0,q.jsx)("path",{d:"M12 7c2.76 0 5 2.24 5 5 0 .65-.13 1.26-.36 1.83l2.92 2.92c1.51-1.26 2.7-2.89 3.43-4.75-1.73-4.39-6-7.5-11-7.5-1.4 0-2.74.25-3.98.7l2.16 2.16C10.74 7.13 11.35 7 12 7zM2 4.27l2.28 2.28.46.46C3.08 8.3 1.78 10.02 1 12c1.73 4.39 6 7.5 11 7.5 1.55 0 3.03-.3 4.38-.84l.42.42L19.73 22 21 20.73 3.27 3 2 4.27zM7.53 9.8l1.55 1.55c-.05.21-.08.43-.08.65 0 1.66 1.34 3 3 3 .22 0 .44-.03.65-.08l1.55 1.55c-.67.33-1.41.53-2.2.53-2.76 0-5-2.24-5-5 0-.79.2-1.53.53-2.2zm4.31-.78l3.15 3.15.02-.16c0-1.66-1.34-3-3-3l-.17.01z"}),"VisibilityOff"),Uh=Ah((0,q.jsx)("g",{children:(0,q.jsx)("path",{d:"M14.67,5v14H9.33V5H14.67z M15.67,19H21V5h-5.33V19z M8.33,19V5H3v14H8.33z"})}),"ViewColumn"),Kh=Ah((0,q.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2m5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12z"}),"Clear"),qh=(Ah((0,q.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6v12zM19 4h-3.5l-1-1h-5l-1 1H5v2h14V4z"}),"Delete"),Ah((0,q.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6v12zm2.46-7.12l1.41-1.41L12 12.59l2.12-2.12 1.41 1.41L13.41 14l2.12 2.12-1.41 1.41L12 15.41l-2.12 2.12-1.41-1.41L10.59 14l-2.13-2.12zM15.5 4l-1-1h-5l-1 1H5v2h14V4z"}),"Delete")),_h=Ah((0,q.jsx)("path",{d:"M5 20h14v-2H5zM19 9h-4V3H9v6H5l7 7z"}),"Download"),Xh=["sortingOrder"],Yh=r.memo(function(e){const{sortingOrder:t}=e,o=(0,s.A)(e,Xh),r=W(),[l]=t,i="asc"===l?r.slots.columnSortedAscendingIcon:r.slots.columnSortedDescendingIcon;return i?(0,q.jsx)(i,(0,n.A)({},o)):null});const Qh=["id","label","labelId","material","disabled","slotProps","onChange","onKeyDown","onOpen","onClose","size","style","fullWidth"],$h=["onRowsPerPageChange","material","disabled"],Zh=["material"],Jh=["autoFocus","label","fullWidth","slotProps","className","material"],em=["material"],tm=["material"],om=["material"],nm=["material"],rm=["material"],lm=["material"],im=["material"],am=["material"],sm=["material","label","className"],cm=["material"],um=["inert","iconStart","iconEnd","children","material"],dm=["slotProps","material"],pm=["id","multiple","freeSolo","options","getOptionLabel","isOptionEqualToValue","value","onChange","label","placeholder","slotProps","material"],fm=["key"],gm=["inputProps","InputProps","InputLabelProps"],hm=["slotProps","material"],mm=["ref","open","children","className","clickAwayTouchEvent","clickAwayMouseEvent","flip","focusTrap","onExited","onClickAway","onDidShow","onDidHide","id","target","transition","placement","material"],vm=["native"],bm=(0,m.Ay)(rg)(e=>{let{theme:t}=e;return{["&.".concat(Jf.positionEnd," .").concat(Yf.A.sizeSmall)]:{marginRight:t.spacing(-.75)}}}),wm=(0,m.Ay)(Lf,{shouldForwardProp:e=>"fullWidth"!==e})(e=>{let{theme:t}=e;return{gap:t.spacing(.5),margin:0,overflow:"hidden",["& .".concat(Ff.label)]:{fontSize:t.typography.pxToRem(14),overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},variants:[{props:{fullWidth:!0},style:{width:"100%"}}]}}),Cm=(0,m.Ay)(Xp,{shouldForwardProp:e=>"density"!==e})(e=>{let{theme:t}=e;return{variants:[{props:{density:"compact"},style:{padding:t.spacing(.5)}}]}}),ym=(0,m.Ay)(xf.A)({["& .".concat(Sf.A.primary)]:{overflowX:"clip",textOverflow:"ellipsis",maxWidth:"300px"}}),Am=a(function(e,t){const{id:o,label:r,labelId:l,material:i,disabled:a,slotProps:c,onChange:u,onKeyDown:d,onOpen:p,onClose:f,size:g,style:h,fullWidth:m}=e,v=(0,s.A)(e,Qh),b={PaperProps:{onKeyDown:d}};return f&&(b.onClose=f),(0,q.jsxs)(Pf.A,{size:g,fullWidth:m,style:h,disabled:a,ref:t,children:[(0,q.jsx)(ih.A,{id:l,htmlFor:o,shrink:!0,variant:"outlined",children:r}),(0,q.jsx)(jf.A,(0,n.A)({id:o,labelId:l,label:r,displayEmpty:!0,onChange:u,variant:"outlined"},v,{notched:!0,inputProps:null===c||void 0===c?void 0:c.htmlInput,onOpen:p,MenuProps:b,size:g},i))]})});const xm=(0,m.Ay)(oh)(e=>{let{theme:t}=e;return{["& .".concat(Wg.selectLabel)]:{display:"none",[t.breakpoints.up("sm")]:{display:"block"}},["& .".concat(Wg.input)]:{display:"none",[t.breakpoints.up("sm")]:{display:"inline-flex"}}}}),Sm=a(function(e,t){const{onRowsPerPageChange:o,material:l,disabled:i}=e,a=(0,s.A)(e,$h),c=r.useMemo(()=>{if(i)return{backIconButtonProps:{disabled:!0},nextIconButtonProps:{disabled:!0}}},[i]),u=Xe(),d=W(),{estimatedRowCount:p}=d;return(0,q.jsx)(xm,(0,n.A)({component:"div",onRowsPerPageChange:(0,It.A)(e=>{null===o||void 0===o||o(Number(e.target.value))}),labelRowsPerPage:u.current.getLocaleText("paginationRowsPerPage"),labelDisplayedRows:e=>u.current.getLocaleText("paginationDisplayedRows")((0,n.A)({},e,{estimated:p})),getItemAriaLabel:u.current.getLocaleText("paginationItemAriaLabel")},c,a,l,{ref:t}))});const Rm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,Zh);return(0,q.jsx)(Sp,(0,n.A)({},r,o,{ref:t}))});const Mm=a(function(e,t){const{autoFocus:o,label:l,fullWidth:i,slotProps:a,className:d,material:p}=e,f=(0,s.A)(e,Jh),g=r.useRef(null),h=(0,u.A)(g,t),m=r.useRef(null);return r.useEffect(()=>{if(o){var e;const t=null===(e=g.current)||void 0===e?void 0:e.querySelector("input");null===t||void 0===t||t.focus({preventScroll:!0})}else!1===o&&m.current&&m.current.stop({})},[o]),l?(0,q.jsx)(wm,{className:d,control:(0,q.jsx)(Cm,(0,n.A)({},f,p,{inputProps:null===a||void 0===a?void 0:a.htmlInput,ref:h,touchRippleRef:m})),label:l,fullWidth:i}):(0,q.jsx)(Cm,(0,n.A)({},f,p,{className:(0,c.A)(d,null===p||void 0===p?void 0:p.className),inputProps:null===a||void 0===a?void 0:a.htmlInput,ref:h,touchRippleRef:m}))});const Im=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,em);return(0,q.jsx)(Qp.A,(0,n.A)({},r,o,{ref:t}))});const Pm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,tm);return(0,q.jsx)($p.A,(0,n.A)({},r,o,{ref:t}))});const km=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,om);return(0,q.jsx)(yf,(0,n.A)({},r,o,{ref:t}))});const Em=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,nm);return(0,q.jsx)(Xf.A,(0,n.A)({},r,o,{ref:t}))});const Fm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,rm);return(0,q.jsx)(Yp.A,(0,n.A)({},r,o,{ref:t}))});const Tm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,lm);return(0,q.jsx)(Qf.A,(0,n.A)({},r,o,{ref:t}))});const Hm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,im);return(0,q.jsx)(xg,(0,n.A)({},r,o,{ref:t}))});const Dm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,am);return(0,q.jsx)(yh,(0,n.A)({},r,o,{ref:t}))});const Om=a(function(e,t){const{material:o,label:r,className:l}=e,i=(0,s.A)(e,sm);return r?(0,q.jsx)(wm,{className:l,control:(0,q.jsx)(_f,(0,n.A)({},i,o,{ref:t})),label:r}):(0,q.jsx)(_f,(0,n.A)({},i,o,{className:l,ref:t}))});const zm=a(function(e,t){const{material:o}=e,r=(0,s.A)(e,cm);return(0,q.jsx)(Rf.A,(0,n.A)({},r,o,{ref:t}))});function Lm(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!e)return;const{slotProps:o,material:r}=e,l=(0,s.A)(e,hm);t&&(l.startAdornment&&(l.startAdornment=(0,q.jsx)(bm,{position:"start",children:l.startAdornment})),l.endAdornment&&(l.endAdornment=(0,q.jsx)(bm,{position:"end",children:l.endAdornment})));for(const n in r)Object.hasOwn(r,n)&&(l[n]=r[n]);return null!==o&&void 0!==o&&o.htmlInput&&(l.inputProps?l.inputProps=(0,n.A)({},l.inputProps,null===o||void 0===o?void 0:o.htmlInput):l.inputProps=null===o||void 0===o?void 0:o.htmlInput),l}const jm={"bottom-start":"top left","bottom-end":"top right"};function Nm(e,t){return function(e,t){if(void 0===e.focusTrap)return t;return(0,q.jsx)(Jp.A,{open:!0,disableEnforceFocus:!0,disableAutoFocus:!0,children:(0,q.jsx)("div",{tabIndex:-1,children:t})})}(e,function(e,t){if(void 0===e.onClickAway)return t;return(0,q.jsx)(rh,{onClickAway:e.onClickAway,touchEvent:e.clickAwayTouchEvent,mouseEvent:e.clickAwayMouseEvent,children:t})}(e,t))}const Bm={booleanCellTrueIcon:Vh,booleanCellFalseIcon:zh,columnMenuIcon:Oh,openFilterButtonIcon:Ih,filterPanelDeleteIcon:zh,columnFilteredIcon:Ph,columnSelectorIcon:Eh,columnUnsortedIcon:Yh,columnSortedAscendingIcon:xh,columnSortedDescendingIcon:Sh,columnResizeIcon:Fh,densityCompactIcon:Th,densityStandardIcon:Hh,densityComfortableIcon:Dh,exportIcon:_h,moreActionsIcon:Gh,treeDataCollapseIcon:Mh,treeDataExpandIcon:Rh,groupingCriteriaCollapseIcon:Mh,groupingCriteriaExpandIcon:Rh,detailPanelExpandIcon:Lh,detailPanelCollapseIcon:jh,rowReorderIcon:Bh,quickFilterIcon:kh,quickFilterClearIcon:Kh,columnMenuHideIcon:Wh,columnMenuSortAscendingIcon:xh,columnMenuSortDescendingIcon:Sh,columnMenuUnsortIcon:null,columnMenuFilterIcon:Ph,columnMenuManageColumnsIcon:Uh,columnMenuClearIcon:Kh,loadIcon:Nh,filterPanelAddIcon:Lh,filterPanelRemoveAllIcon:qh,columnReorderIcon:Bh,menuItemCheckIcon:Vh},Vm={baseAutocomplete:function(e){const t=W(),{id:o,multiple:r,freeSolo:l,options:i,getOptionLabel:a,isOptionEqualToValue:c,value:u,onChange:d,label:p,placeholder:f,slotProps:g,material:h}=e,m=(0,s.A)(e,pm);return(0,q.jsx)(sp.A,(0,n.A)({id:o,multiple:r,freeSolo:l,options:i,getOptionLabel:a,isOptionEqualToValue:c,value:u,onChange:d,renderTags:(e,t)=>e.map((e,o)=>{const r=t({index:o}),{key:l}=r,i=(0,s.A)(r,fm);return(0,q.jsx)(Yp.A,(0,n.A)({variant:"outlined",size:"small",label:"string"===typeof e?e:null===a||void 0===a?void 0:a(e)},i),l)}),renderInput:e=>{var o;const{inputProps:r,InputProps:l,InputLabelProps:i}=e,a=(0,s.A)(e,gm);return(0,q.jsx)(If.A,(0,n.A)({},a,{label:p,placeholder:f,inputProps:r,InputProps:Lm(l,!1),InputLabelProps:(0,n.A)({shrink:!0},i)},null===g||void 0===g?void 0:g.textField,null===(o=t.slotProps)||void 0===o?void 0:o.baseTextField))}},m,h))},baseBadge:Rm,baseCheckbox:Mm,baseChip:Fm,baseCircularProgress:Im,baseDivider:Pm,baseInput:function(e){return(0,q.jsx)(Zp.Ay,(0,n.A)({},Lm(e)))},baseLinearProgress:km,baseMenuList:zm,baseMenuItem:function(e){const{inert:t,iconStart:o,iconEnd:l,children:i,material:a}=e,c=(0,s.A)(e,um);return t&&(c.disableRipple=!0),r.createElement(Mf.A,(0,n.A)({},c,a),[o&&(0,q.jsx)(Af.A,{children:o},"1"),(0,q.jsx)(ym,{children:i},"2"),l&&(0,q.jsx)(Af.A,{children:l},"3")])},baseTextField:function(e){const{slotProps:t,material:o}=e,r=(0,s.A)(e,dm);return(0,q.jsx)(If.A,(0,n.A)({variant:"outlined"},r,o,{inputProps:null===t||void 0===t?void 0:t.htmlInput,InputProps:Lm(null===t||void 0===t?void 0:t.input),InputLabelProps:(0,n.A)({shrink:!0},null===t||void 0===t?void 0:t.inputLabel)}))},baseButton:Em,baseIconButton:Tm,baseTooltip:Hm,basePagination:Sm,basePopper:function(e){const{open:t,children:o,className:l,flip:i,onExited:a,onDidShow:c,onDidHide:u,id:d,target:p,transition:f,placement:g,material:h}=e,m=(0,s.A)(e,mm),v=r.useMemo(()=>{const e=[{name:"preventOverflow",options:{padding:8}}];return i&&e.push({name:"flip",enabled:!0,options:{rootBoundary:"document"}}),(c||u)&&e.push({name:"isPlaced",enabled:!0,phase:"main",fn:()=>{null===c||void 0===c||c()},effect:()=>()=>{null===u||void 0===u||u()}}),e},[i,c,u]);let b;if(f){const t=e=>t=>{e&&e(),a&&a(t)};b=r=>{var l;return Nm(e,(0,q.jsx)(ag.A,(0,n.A)({},r.TransitionProps,{style:{transformOrigin:jm[r.placement]},onExited:t(null===(l=r.TransitionProps)||void 0===l?void 0:l.onExited),children:(0,q.jsx)(lh.A,{children:o})})))}}else b=Nm(e,o);return(0,q.jsx)(sg.A,(0,n.A)({id:d,className:l,open:t,anchorEl:p,transition:f,placement:g,modifiers:v},m,h,{children:b}))},baseSelect:Am,baseSelectOption:function(e){let{native:t}=e,o=(0,s.A)(e,vm);return t?(0,q.jsx)("option",(0,n.A)({},o)):(0,q.jsx)(Mf.A,(0,n.A)({},o))},baseSkeleton:Dm,baseSwitch:Om},Gm=(0,n.A)({},Vm,Bm),Wm=(0,et.A)("div")({position:"sticky",zIndex:40,bottom:"calc(var(--DataGrid-hasScrollX) * var(--DataGrid-scrollbarSize))"});function Um(e,t,o){return"function"===typeof t?t(o,arguments.length>3&&void 0!==arguments[3]?arguments[3]:{}):t?(t.props.className&&(o.className=function(e,t){if(!e||!t)return e||t;return"".concat(e," ").concat(t)}(t.props.className,o.className)),(t.props.style||o.style)&&(o.style=(0,n.A)({},o.style,t.props.style)),r.cloneElement(t,o)):r.createElement(e,o)}const Km=r.createContext(void 0);function qm(e,t){if(!e.ref.current||!t.ref.current)return 0;const o=e.ref.current.compareDocumentPosition(t.ref.current);return o?o&Node.DOCUMENT_POSITION_FOLLOWING||o&Node.DOCUMENT_POSITION_CONTAINED_BY?-1:o&Node.DOCUMENT_POSITION_PRECEDING||o&Node.DOCUMENT_POSITION_CONTAINS?1:0:0}const _m=["render","className"],Xm=(0,et.A)("div",{name:"MuiDataGrid",slot:"Toolbar"})({flex:0,display:"flex",alignItems:"center",justifyContent:"end",gap:S.spacing(.25),padding:S.spacing(.75),minHeight:52,boxSizing:"border-box",borderBottom:"1px solid ".concat(S.colors.border.base)}),Ym=a(function(e,t){const{render:o,className:l}=e,i=(0,s.A)(e,_m),a=W(),u=(e=>{const{classes:t}=e;return(0,p.A)({root:["toolbar"]},w,t)})(a),[d,f]=r.useState(null),[g,h]=r.useState([]),m=r.useCallback(()=>g.sort(qm),[g]),v=r.useCallback(function(e,t){let o=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=e;const r=m(),l=r.length;for(let s=0;s<l;s+=1){var i,a;if(n+=t,n>=l){if(!o)return-1;n=0}else if(n<0){if(!o)return-1;n=l-1}if((null===(i=r[n].ref.current)||void 0===i||!i.disabled)&&"true"!==(null===(a=r[n].ref.current)||void 0===a?void 0:a.ariaDisabled))return n}return-1},[m]),b=r.useCallback((e,t)=>{h(o=>[...o,{id:e,ref:t}])},[]),C=r.useCallback(e=>{h(t=>t.filter(t=>t.id!==e))},[]),y=r.useCallback(e=>{if(!d)return;const t=m(),o=t.findIndex(e=>e.id===d);let n=-1;if("ArrowRight"===e.key?(e.preventDefault(),n=v(o,1)):"ArrowLeft"===e.key?(e.preventDefault(),n=v(o,-1)):"Home"===e.key?(e.preventDefault(),n=v(-1,1,!1)):"End"===e.key&&(e.preventDefault(),n=v(t.length,-1,!1)),n>=0&&n<t.length){var r;const e=t[n];f(e.id),null===(r=e.ref.current)||void 0===r||r.focus()}},[m,d,v]),A=r.useCallback(e=>{d!==e&&f(e)},[d,f]),x=r.useCallback(e=>{const t=m(),o=t.findIndex(t=>t.id===e),n=v(o,1);if(n>=0&&n<t.length){var r;const e=t[n];f(e.id),null===(r=e.ref.current)||void 0===r||r.focus()}},[m,v]);r.useEffect(()=>{const e=m();if(e.length>0){if(!d)return void f(e[0].id);const n=e.findIndex(e=>e.id===d);if(e[n]){if(-1===n){const o=e[n];var t;if(o)f(o.id),null===(t=o.ref.current)||void 0===t||t.focus()}}else{const t=e[e.length-1];var o;if(t)f(t.id),null===(o=t.ref.current)||void 0===o||o.focus()}}},[m,v]);const S=r.useMemo(()=>({focusableItemId:d,registerItem:b,unregisterItem:C,onItemKeyDown:y,onItemFocus:A,onItemDisabled:x}),[d,b,C,y,A,x]),R=Um(Xm,o,(0,n.A)({role:"toolbar","aria-orientation":"horizontal","aria-label":a.label||void 0,className:(0,c.A)(u.root,l)},i,{ref:t}));return(0,q.jsx)(Km.Provider,{value:S,children:R})});const Qm=["render","onKeyDown","onFocus","disabled","aria-disabled"],$m=a(function(e,t){var o;const{render:l,onKeyDown:i,onFocus:a,disabled:c,"aria-disabled":d}=e,p=(0,s.A)(e,Qm),f=(0,Zt.A)(),g=W(),h=r.useRef(null),m=(0,u.A)(h,t),{focusableItemId:v,registerItem:b,unregisterItem:w,onItemKeyDown:C,onItemFocus:y,onItemDisabled:A}=function(){const e=r.useContext(Km);if(void 0===e)throw new Error("MUI X: Missing context. Toolbar subcomponents must be placed within a <Toolbar /> component.");return e}();r.useEffect(()=>(b(f,h),()=>w(f)),[]);const x=r.useRef(c);r.useEffect(()=>{x.current!==c&&!0===c&&A(f,c),x.current=c},[c,f,A]);const S=r.useRef(d);r.useEffect(()=>{S.current!==d&&!0===d&&A(f,!0),S.current=d},[d,f,A]);const R=Um(g.slots.baseIconButton,l,(0,n.A)({},null===(o=g.slotProps)||void 0===o?void 0:o.baseIconButton,{tabIndex:v===f?0:-1},p,{disabled:c,"aria-disabled":d,onKeyDown:e=>{C(e),null===i||void 0===i||i(e)},onFocus:e=>{y(f),null===a||void 0===a||a(e)},ref:m}));return(0,q.jsx)(r.Fragment,{children:R})});const Zm=["render","className","onClick","onPointerUp"],Jm=a(function(e,t){var o;const{render:l,className:i,onClick:a,onPointerUp:c}=e,d=(0,s.A)(e,Zm),p=W(),f=(0,Zt.A)(),g=(0,Zt.A)(),h=Xe(),m=D(h,Ue),v=m.open&&m.openedPanelValue===qe.filters,b=D(h,Tr).length,w={open:v,filterCount:b},C="function"===typeof i?i(w):i,{filterPanelTriggerRef:y}=Qe(),A=(0,u.A)(t,y),x=Um(p.slots.baseButton,l,(0,n.A)({},null===(o=p.slotProps)||void 0===o?void 0:o.baseButton,{id:f,"aria-haspopup":"true","aria-expanded":v?"true":void 0,"aria-controls":v?g:void 0,onClick:e=>{v?h.current.hidePreferences():h.current.showPreferences(qe.filters,g,f),null===a||void 0===a||a(e)},onPointerUp:e=>{v&&e.stopPropagation(),null===c||void 0===c||c(e)},className:C},d,{ref:A}),w);return(0,q.jsx)(r.Fragment,{children:x})});const ev=["render","className","onClick","onPointerUp"],tv=a(function(e,t){var o;const{render:l,className:i,onClick:a,onPointerUp:c}=e,d=(0,s.A)(e,ev),p=W(),f=(0,Zt.A)(),g=(0,Zt.A)(),h=Xe(),m=D(h,Ue),v=m.open&&m.openedPanelValue===qe.columns,b={open:v},w="function"===typeof i?i(b):i,{columnsPanelTriggerRef:C}=Qe(),y=(0,u.A)(t,C),A=Um(p.slots.baseButton,l,(0,n.A)({},null===(o=p.slotProps)||void 0===o?void 0:o.baseButton,{id:f,"aria-haspopup":"true","aria-expanded":v?"true":void 0,"aria-controls":v?g:void 0,className:w},d,{onPointerUp:e=>{v&&e.stopPropagation(),null===c||void 0===c||c(e)},onClick:e=>{v?h.current.hidePreferences():h.current.showPreferences(qe.columns,g,f),null===a||void 0===a||a(e)},ref:y}),b);return(0,q.jsx)(r.Fragment,{children:A})});const ov=["render","options","onClick"],nv=a(function(e,t){var o;const{render:l,options:i,onClick:a}=e,c=(0,s.A)(e,ov),u=W(),d=Xe(),p=Um(u.slots.baseButton,l,(0,n.A)({},null===(o=u.slotProps)||void 0===o?void 0:o.baseButton,{onClick:e=>{d.current.exportDataAsPrint(i),null===a||void 0===a||a(e)}},c,{ref:t}));return(0,q.jsx)(r.Fragment,{children:p})});const rv=["render","options","onClick"],lv=a(function(e,t){var o;const{render:l,options:i,onClick:a}=e,c=(0,s.A)(e,rv),u=W(),d=Xe(),p=Um(u.slots.baseButton,l,(0,n.A)({},null===(o=u.slotProps)||void 0===o?void 0:o.baseButton,{onClick:e=>{d.current.exportDataAsCsv(i),null===a||void 0===a||a(e)}},c,{ref:t}));return(0,q.jsx)(r.Fragment,{children:p})});const iv=r.createContext(void 0);function av(){const e=r.useContext(iv);if(void 0===e)throw new Error("MUI X: Missing context. Quick Filter subcomponents must be placed within a <QuickFilter /> component.");return e}const sv=["render","className","parser","formatter","debounceMs","defaultExpanded","expanded","onExpandedChange"],cv=e=>e.split(" ").filter(e=>""!==e),uv=e=>e.join(" ");function dv(e){const t=W(),{render:o,className:l,parser:i=cv,formatter:a=uv,debounceMs:c=t.filterDebounceMs,defaultExpanded:u,expanded:d,onExpandedChange:p}=e,f=(0,s.A)(e,sv),g=Xe(),h=r.useRef(null),m=r.useRef(null),v=D(g,yr),[b,w]=r.useState(a(null!==v&&void 0!==v?v:[])),[C,y]=r.useState(null!==u&&void 0!==u?u:b.length>0),A=null!==d&&void 0!==d?d:C,x=r.useMemo(()=>({value:b,expanded:A}),[b,A]),S="function"===typeof l?l(x):l,R=r.useRef(null),M=(0,Zt.A)(),I=r.useCallback(e=>{p&&p(e),void 0===d&&y(e)},[p,d]),P=r.useRef(v);r.useEffect(()=>{ii(P.current,v)||(P.current=v,w(e=>ii(i(e),v)?e:a(null!==v&&void 0!==v?v:[])))},[v,a,i]);const k=r.useRef(!0),E=r.useRef(A);r.useEffect(()=>{if(k.current)k.current=!1;else if(E.current!==A){var e;if(A)requestAnimationFrame(()=>{var e;null===(e=h.current)||void 0===e||e.focus({preventScroll:!0})});else null===(e=m.current)||void 0===e||e.focus({preventScroll:!0});E.current=A}},[A]);const F=r.useMemo(()=>(0,bc.A)(e=>{const t=i(e);P.current=t,g.current.setQuickFilterValues(t)},c),[g,c,i]);r.useEffect(()=>F.clear,[F]);const T=r.useCallback(e=>{const t=e.target.value;w(t),F(t)},[F]),H=r.useCallback(()=>{var e;w(""),g.current.setQuickFilterValues([]),null===(e=h.current)||void 0===e||e.focus()},[g,h]),O=r.useMemo(()=>({controlRef:h,triggerRef:m,state:x,controlId:M,clearValue:H,onValueChange:T,onExpandedChange:I}),[M,x,T,H,I]);(0,Nt.A)(()=>{var e;R.current&&m.current&&R.current.style.setProperty("--trigger-width","".concat(null===(e=m.current)||void 0===e?void 0:e.offsetWidth,"px"))},[]);const z=Um("div",o,(0,n.A)({className:S},f,{ref:R}),x);return(0,q.jsx)(iv.Provider,{value:O,children:z})}const pv=["render","className","onClick"],fv=a(function(e,t){var o;const{render:l,className:i,onClick:a}=e,c=(0,s.A)(e,pv),d=W(),{state:p,controlId:f,onExpandedChange:g,triggerRef:h}=av(),m="function"===typeof i?i(p):i,v=(0,u.A)(h,t),b=Um(d.slots.baseButton,l,(0,n.A)({},null===(o=d.slotProps)||void 0===o?void 0:o.baseButton,{className:m,"aria-controls":f,"aria-expanded":p.expanded},c,{onClick:e=>{g(!p.expanded),null===a||void 0===a||a(e)},ref:v}),p);return(0,q.jsx)(r.Fragment,{children:b})});const gv=["render","className","slotProps","onKeyDown","onChange"],hv=a(function(e,t){var o;const{render:l,className:i,slotProps:a,onKeyDown:c,onChange:d}=e,p=(0,s.A)(e,gv),f=W(),{state:g,controlId:h,controlRef:m,onValueChange:v,onExpandedChange:b,clearValue:w}=av(),C="function"===typeof i?i(g):i,y=(0,u.A)(m,t),A=Um(f.slots.baseTextField,l,(0,n.A)({},null===(o=f.slotProps)||void 0===o?void 0:o.baseTextField,{slotProps:(0,n.A)({htmlInput:(0,n.A)({role:"searchbox",id:h,tabIndex:g.expanded?void 0:-1},null===a||void 0===a?void 0:a.htmlInput,{onBlur:e=>{var t,o;""===g.value&&b(!1),null===a||void 0===a||null===(t=a.htmlInput)||void 0===t||null===(o=t.onBlur)||void 0===o||o.call(t,e)}})},a),value:g.value,className:C},p,{onChange:e=>{g.expanded||b(!0),v(e),null===d||void 0===d||d(e)},onKeyDown:e=>{"Escape"===e.key&&(""===g.value?b(!1):w()),null===c||void 0===c||c(e)},ref:y}),g);return(0,q.jsx)(r.Fragment,{children:A})});const mv=["render","className","onClick"],vv=a(function(e,t){var o;const{render:l,className:i,onClick:a}=e,c=(0,s.A)(e,mv),u=W(),{state:d,clearValue:p}=av(),f="function"===typeof i?i(d):i,g=Um(u.slots.baseIconButton,l,(0,n.A)({},null===(o=u.slotProps)||void 0===o?void 0:o.baseIconButton,{className:f,tabIndex:-1},c,{onClick:e=>{p(),null===a||void 0===a||a(e)},ref:t}),d);return(0,q.jsx)(r.Fragment,{children:g})});const bv=["quickFilterParser","quickFilterFormatter","debounceMs","className","slotProps"],wv=["ref","slotProps"],Cv=(0,et.A)("div",{name:"MuiDataGrid",slot:"ToolbarQuickFilter"})({display:"grid",alignItems:"center"}),yv=(0,et.A)($m,{name:"MuiDataGrid",slot:"ToolbarQuickFilterTrigger"})(e=>{let{ownerState:t}=e;return{gridArea:"1 / 1",width:"min-content",height:"min-content",zIndex:1,opacity:t.expanded?0:1,pointerEvents:t.expanded?"none":"auto",transition:S.transition(["opacity"])}}),Av=(0,et.A)(e=>{throw new Error("Failed assertion: should not be rendered")},{name:"MuiDataGrid",slot:"ToolbarQuickFilterControl"})(e=>{let{ownerState:t}=e;return{gridArea:"1 / 1",overflowX:"clip",width:t.expanded?260:"var(--trigger-width)",opacity:t.expanded?1:0,transition:S.transition(["width","opacity"])}});function xv(e){const t=Xe(),o=W(),r={classes:o.classes,expanded:!1},l=(e=>{const{classes:t}=e;return(0,p.A)({root:["toolbarQuickFilter"],trigger:["toolbarQuickFilterTrigger"],control:["toolbarQuickFilterControl"]},w,t)})(r),{quickFilterParser:i,quickFilterFormatter:a,debounceMs:u,className:d,slotProps:f}=e,g=(0,s.A)(e,bv);return(0,q.jsx)(dv,{parser:i,formatter:a,debounceMs:u,render:(e,i)=>{const a=(0,n.A)({},r,{expanded:i.expanded});return(0,q.jsxs)(Cv,(0,n.A)({},e,{className:(0,c.A)(l.root,d),children:[(0,q.jsx)(fv,{render:e=>(0,q.jsx)(o.slots.baseTooltip,{title:t.current.getLocaleText("toolbarQuickFilterLabel"),enterDelay:0,children:(0,q.jsx)(yv,(0,n.A)({className:l.trigger},e,{ownerState:a,color:"default","aria-disabled":i.expanded,children:(0,q.jsx)(o.slots.quickFilterIcon,{fontSize:"small"})}))})}),(0,q.jsx)(hv,{render:e=>{var r;let{ref:i,slotProps:c}=e,u=(0,s.A)(e,wv);return(0,q.jsx)(Av,(0,n.A)({as:o.slots.baseTextField,className:l.control,ownerState:a,inputRef:i,"aria-label":t.current.getLocaleText("toolbarQuickFilterLabel"),placeholder:t.current.getLocaleText("toolbarQuickFilterPlaceholder"),size:"small",slotProps:(0,n.A)({input:(0,n.A)({startAdornment:(0,q.jsx)(o.slots.quickFilterIcon,{fontSize:"small"}),endAdornment:u.value?(0,q.jsx)(vv,{render:(0,q.jsx)(o.slots.baseIconButton,{size:"small",edge:"end","aria-label":t.current.getLocaleText("toolbarQuickFilterDeleteIconLabel"),children:(0,q.jsx)(o.slots.quickFilterClearIcon,{fontSize:"small"})})}):null},null===c||void 0===c?void 0:c.input)},c)},null===(r=o.slotProps)||void 0===r?void 0:r.baseTextField,u,null===f||void 0===f?void 0:f.root,g))}})]}))}})}const Sv=["className"],Rv=["className"],Mv=e=>{const{classes:t}=e;return(0,p.A)({divider:["toolbarDivider"],label:["toolbarLabel"]},w,t)},Iv=(0,et.A)(Bt,{name:"MuiDataGrid",slot:"ToolbarDivider"})({height:"50%",margin:S.spacing(0,.5)}),Pv=(0,et.A)("span",{name:"MuiDataGrid",slot:"ToolbarLabel"})({flex:1,font:S.typography.font.large,fontWeight:S.typography.fontWeight.medium,margin:S.spacing(0,.5),textOverflow:"ellipsis",overflow:"hidden",whiteSpace:"nowrap"});function kv(e){const t=(0,s.A)(e,Sv),o=W(),r=Mv(o);return(0,q.jsx)(Iv,(0,n.A)({as:o.slots.baseDivider,orientation:"vertical",className:r.divider},t))}function Ev(e){const t=(0,s.A)(e,Rv),o=W(),r=Mv(o);return(0,q.jsx)(Pv,(0,n.A)({className:r.label},t))}const Fv=(0,n.A)({},Gm,{cell:Pd,skeletonCell:Nc,columnHeaderFilterIconButton:function(e){return e.counter?(0,q.jsx)(Wc,(0,n.A)({},e)):null},columnHeaderSortIcon:Xc,columnMenu:ip,columnHeaders:Xd,detailPanels:function(e){return null},bottomContainer:function(e){const t=(0,p.A)({root:["bottomContainer"]},w,{});return(0,q.jsx)(Wm,(0,n.A)({},e,{className:(0,c.A)(t.root,C["container--bottom"]),role:"presentation"}))},footer:tu,footerRowCount:ru,toolbar:function(e){var t,o,l;const{showQuickFilter:i=!0,quickFilterProps:a,csvOptions:s,printOptions:c,additionalItems:u,additionalExportMenuItems:d}=e,p=Xe(),f=W(),[g,h]=r.useState(!1),m=r.useRef(null),v=(0,Zt.A)(),b=(0,Zt.A)(),w=!(null!==s&&void 0!==s&&s.disableToolbarButton)||!(null!==c&&void 0!==c&&c.disableToolbarButton)||d,C=()=>h(!1);return(0,q.jsxs)(Ym,{children:[f.label&&(0,q.jsx)(Ev,{children:f.label}),!f.disableColumnSelector&&(0,q.jsx)(f.slots.baseTooltip,{title:p.current.getLocaleText("toolbarColumns"),children:(0,q.jsx)(tv,{render:(0,q.jsx)($m,{}),children:(0,q.jsx)(f.slots.columnSelectorIcon,{fontSize:"small"})})}),!f.disableColumnFilter&&(0,q.jsx)(f.slots.baseTooltip,{title:p.current.getLocaleText("toolbarFilters"),children:(0,q.jsx)(Jm,{render:(e,t)=>(0,q.jsx)($m,(0,n.A)({},e,{color:t.filterCount>0?"primary":"default",children:(0,q.jsx)(f.slots.baseBadge,{badgeContent:t.filterCount,color:"primary",variant:"dot",children:(0,q.jsx)(f.slots.openFilterButtonIcon,{fontSize:"small"})})}))})}),u,w&&(!f.disableColumnFilter||!f.disableColumnSelector)&&(0,q.jsx)(kv,{}),w&&(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(f.slots.baseTooltip,{title:p.current.getLocaleText("toolbarExport"),disableInteractive:g,children:(0,q.jsx)($m,{ref:m,id:b,"aria-controls":v,"aria-haspopup":"true","aria-expanded":g?"true":void 0,onClick:()=>h(!g),children:(0,q.jsx)(f.slots.exportIcon,{fontSize:"small"})})}),(0,q.jsx)(Bn,{target:m.current,open:g,onClose:C,position:"bottom-end",children:(0,q.jsxs)(f.slots.baseMenuList,(0,n.A)({id:v,"aria-labelledby":b,autoFocusItem:!0},null===(t=f.slotProps)||void 0===t?void 0:t.baseMenuList,{children:[!(null!==c&&void 0!==c&&c.disableToolbarButton)&&(0,q.jsx)(nv,{render:(0,q.jsx)(f.slots.baseMenuItem,(0,n.A)({},null===(o=f.slotProps)||void 0===o?void 0:o.baseMenuItem)),options:c,onClick:C,children:p.current.getLocaleText("toolbarExportPrint")}),!(null!==s&&void 0!==s&&s.disableToolbarButton)&&(0,q.jsx)(lv,{render:(0,q.jsx)(f.slots.baseMenuItem,(0,n.A)({},null===(l=f.slotProps)||void 0===l?void 0:l.baseMenuItem)),options:s,onClick:C,children:p.current.getLocaleText("toolbarExportCSV")}),null===d||void 0===d?void 0:d(C)]}))})]}),i&&(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(kv,{}),(0,q.jsx)(xv,(0,n.A)({},a))]})]})},pinnedRows:function(e){return null},loadingOverlay:Au,noResultsOverlay:ap,noRowsOverlay:xu,noColumnsOverlay:Su,pagination:function(){var e;const t=Xe(),o=W(),l=D(t,Xi),i=D(t,Yi),a=D(t,Ji),{paginationMode:s,loading:c}=o,u=-1===i&&"server"===s&&c,d=r.useMemo(()=>Math.max(0,a-1),[a]),p=r.useMemo(()=>-1===i||l.page<=d?l.page:d,[d,l.page,i]),f=r.useCallback(e=>{t.current.setPageSize(e)},[t]),g=r.useCallback((e,o)=>{t.current.setPage(o)},[t]),h=(e=>{for(let t=0;t<o.pageSizeOptions.length;t+=1){const n=o.pageSizeOptions[t];if("number"===typeof n){if(n===e)return!0}else if(n.value===e)return!0}return!1})(l.pageSize)?o.pageSizeOptions:[];return(0,q.jsx)(Ru,(0,n.A)({as:o.slots.basePagination,count:i,page:p,rowsPerPageOptions:h,rowsPerPage:l.pageSize,onPageChange:g,onRowsPerPageChange:f,disabled:u},null===(e=o.slotProps)||void 0===e?void 0:e.basePagination))},filterPanel:Xu,columnsPanel:function(e){var t;const o=W();return(0,q.jsx)(Du,(0,n.A)({},e,{children:(0,q.jsx)(o.slots.columnsManagement,(0,n.A)({},null===(t=o.slotProps)||void 0===t?void 0:t.columnsManagement))}))},columnsManagement:function(e){var t,o,l,i;const a=Xe(),s=r.useRef(null),c=D(a,De),u=D(a,He),d=W(),[f,g]=r.useState(""),h=(e=>{const{classes:t}=e;return(0,p.A)({root:["columnsManagement"],header:["columnsManagementHeader"],searchInput:["columnsManagementSearchInput"],footer:["columnsManagementFooter"],row:["columnsManagementRow"]},w,t)})(d),m=D(a,Te),v=D(a,jr),b=D(a,Br),C=r.useMemo(()=>v?Array.from(b.values()):m,[v,b,m]),{sort:y,searchPredicate:A=Qu,autoFocusSearchField:x=!0,disableShowHideToggle:S=!1,disableResetButton:R=!1,toggleAllMode:M="all",getTogglableColumns:I,searchInputProps:P,searchDebounceMs:k=d.columnFilterDebounceMs}=e,E=r.useMemo(()=>(0,bc.A)(e=>{g(e)},null!==k&&void 0!==k?k:150),[k]),F=r.useMemo(()=>((e,t)=>{const o=new Set(Object.keys(e).filter(t=>!1===e[t])),n=new Set(Object.keys(t).filter(e=>!1===t[e]));if(o.size!==n.size)return!1;let r=!0;return o.forEach(e=>{n.has(e)||(r=!1)}),r})(u,c),[u,c]),T=r.useMemo(()=>{switch(y){case"asc":return[...C].sort((e,t)=>ld.compare(e.headerName||e.field,t.headerName||t.field));case"desc":return[...C].sort((e,t)=>-ld.compare(e.headerName||e.field,t.headerName||t.field));default:return C}},[C,y]),H=e=>{const{name:t}=e.target;a.current.setColumnVisibility(t,!1===u[t])},O=r.useMemo(()=>{const e=I?I(T):null,t=e?T.filter(t=>{let{field:o}=t;return e.includes(o)}):T;return f?t.filter(e=>A(e,f.toLowerCase())):t},[T,f,A,I]),z=r.useCallback(e=>{const t=He(a),o=(0,n.A)({},t),r=I?I(C):null;return("filteredOnly"===M?O:C).forEach(t=>{t.hideable&&(null==r||r.includes(t.field))&&(e?delete o[t.field]:o[t.field]=!1)}),a.current.setColumnVisibilityModel(o)},[a,C,I,M,O]),L=r.useCallback(e=>{E(e.target.value)},[E]),j=r.useMemo(()=>O.filter(e=>e.hideable),[O]),N=r.useMemo(()=>j.every(e=>null==u[e.field]||!1!==u[e.field]),[u,j]),B=r.useMemo(()=>j.every(e=>!1===u[e.field]),[u,j]),V=r.useRef(null);r.useEffect(()=>{var e;x?null===(e=s.current)||void 0===e||e.focus():V.current&&"function"===typeof V.current.focus&&V.current.focus()},[x]);let G=!1;const U=e=>!1===G&&!1!==e.hideable&&(G=!0,!0),K=r.useCallback(()=>{g(""),s.current&&(s.current.value="",s.current.focus())},[]);return(0,q.jsxs)(r.Fragment,{children:[(0,q.jsx)(sd,{className:h.header,ownerState:d,children:(0,q.jsx)(cd,(0,n.A)({as:d.slots.baseTextField,ownerState:d,placeholder:a.current.getLocaleText("columnsManagementSearchTitle"),inputRef:s,className:h.searchInput,onChange:L,size:"small",type:"search",slotProps:{input:{startAdornment:(0,q.jsx)(d.slots.quickFilterIcon,{fontSize:"small"}),endAdornment:(0,q.jsx)(d.slots.baseIconButton,(0,n.A)({size:"small","aria-label":a.current.getLocaleText("columnsManagementDeleteIconLabel"),style:f?{visibility:"visible"}:{visibility:"hidden"},tabIndex:-1,onClick:K,edge:"end"},null===(t=d.slotProps)||void 0===t?void 0:t.baseIconButton,{children:(0,q.jsx)(d.slots.quickFilterClearIcon,{fontSize:"small"})}))},htmlInput:{"aria-label":a.current.getLocaleText("columnsManagementSearchTitle")}},autoComplete:"off",fullWidth:!0},null===(o=d.slotProps)||void 0===o?void 0:o.baseTextField,P))}),(0,q.jsx)(ad,{ownerState:d,children:(0,q.jsxs)(id,{className:h.root,ownerState:d,children:[O.map(e=>{var t;return(0,q.jsx)(pd,(0,n.A)({as:d.slots.baseCheckbox,className:h.row,disabled:!1===e.hideable||v,checked:!1!==u[e.field],onChange:H,name:e.field,inputRef:U(e)?V:void 0,label:e.headerName||e.field,density:"compact",fullWidth:!0},null===(t=d.slotProps)||void 0===t?void 0:t.baseCheckbox),e.field)}),0===O.length&&(0,q.jsx)(dd,{ownerState:d,children:a.current.getLocaleText("columnsManagementNoColumns")})]})}),S&&R?null:(0,q.jsxs)(ud,{ownerState:d,className:h.footer,children:[S?(0,q.jsx)("span",{}):(0,q.jsx)(d.slots.baseCheckbox,(0,n.A)({disabled:0===j.length||v,checked:N,indeterminate:!N&&!B,onChange:()=>z(!N),name:a.current.getLocaleText("columnsManagementShowHideAllText"),label:a.current.getLocaleText("columnsManagementShowHideAllText"),density:"compact"},null===(l=d.slotProps)||void 0===l?void 0:l.baseCheckbox)),R?null:(0,q.jsx)(d.slots.baseButton,(0,n.A)({onClick:()=>a.current.setColumnVisibilityModel(c),disabled:F||v},null===(i=d.slotProps)||void 0===i?void 0:i.baseButton,{children:a.current.getLocaleText("columnsManagementReset")}))]})]})},panel:vd,row:Ad});const Tv={disableMultipleColumnsFiltering:!0,disableMultipleColumnsSorting:!0,throttleRowsMs:void 0,hideFooterRowCount:!1,pagination:!0,checkboxSelectionVisibleOnly:!1,disableColumnReorder:!0,keepColumnPositionIfDraggedOutside:!1,signature:"DataGrid",listView:!1},Hv=Fv,Dv=e=>{const t=(0,Fc.A)(),o=r.useMemo(()=>(0,Tc.A)({props:e,theme:t,name:"MuiDataGrid"}),[t,e]),l=r.useMemo(()=>(0,n.A)({},Hc,o.localeText),[o.localeText]),i=r.useMemo(()=>function(e){let{defaultSlots:t,slots:o}=e;const r=o;if(!r||0===Object.keys(r).length)return t;const l=(0,n.A)({},t);return Object.keys(r).forEach(e=>{const t=e;void 0!==r[t]&&(l[t]=r[t])}),l}({defaultSlots:Hv,slots:o.slots}),[o.slots]),a=r.useMemo(()=>Object.keys(da).reduce((e,t)=>{var n;return e[t]=null!==(n=o[t])&&void 0!==n?n:da[t],e},{}),[o]);return r.useMemo(()=>(0,n.A)({},o,a,{localeText:l,slots:i},(e=>(0,n.A)({},Tv,e.dataSource?{filterMode:"server",sortingMode:"server",paginationMode:"server"}:{}))(o)),[o,l,i,a])};var Ov=o(9826);const zv=new TextEncoder;let Lv=2048,jv=new ArrayBuffer(Lv),Nv=new Uint8Array(jv),Bv=new Int32Array(jv);const Vv=function(e){const t=2*e.length;t>Lv&&(Lv=t+(4-t%4),jv=new ArrayBuffer(Lv),Nv=new Uint8Array(jv),Bv=new Int32Array(jv));const o=zv.encodeInto(e,Nv).written,n=0|o;let r=0,l=374761393+(0+n|0)|0;if(n<16)for(;(r+3|0)<n;r=r+4|0)l=Math.imul(0|Gv(l+Math.imul(0|Bv[r],3266489917)|0,17),668265263);else{let e=606290984,t=-2048144777,o=0,i=1640531535;for(;(r+15|0)<n;r=r+16|0)e=Math.imul(0|Gv(e+Math.imul(0|Bv[r+0|0],2246822519)|0,13),2654435761),t=Math.imul(0|Gv(t+Math.imul(0|Bv[r+4|0],2246822519)|0,13),2654435761),o=Math.imul(0|Gv(o+Math.imul(0|Bv[r+8|0],2246822519)|0,13),2654435761),i=Math.imul(0|Gv(i+Math.imul(0|Bv[r+12|0],2246822519)|0,13),2654435761);for(l=(((Gv(e,1)|0+Gv(t,7)|0)+Gv(o,12)|0)+Gv(i,18)|0)+n|0;(r+3|0)<n;r=r+4|0)l=Math.imul(0|Gv(l+Math.imul(0|Bv[r],3266489917)|0,17),668265263)}for(;r<n;r=r+1|0)l=Math.imul(0|Gv(l+Math.imul(0|Nv[r],374761393)|0,11),2654435761);return l=Math.imul(l^l>>>15,2246822519),l=Math.imul(l^l>>>13,3266489917),((l^l>>>16)>>>0).toString()};function Gv(e,t){return e<<t|e>>>32-t}function Wv(e){return function(e,t){return"rgba(from ".concat(e," r g b / ").concat(t,")")}(e,1)}function Uv(e){if(!e)return;const t="number"===typeof e.fontSize?"".concat(e.fontSize,"px"):e.fontSize;return"".concat(e.fontWeight," ").concat(t," / ").concat(e.lineHeight," ").concat(e.fontFamily)}class Kv{constructor(){(0,Q.A)(this,"maxListeners",20),(0,Q.A)(this,"warnOnce",!1),(0,Q.A)(this,"events",{})}on(e,t){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},n=this.events[e];n||(n={highPriority:new Map,regular:new Map},this.events[e]=n),o.isFirst?n.highPriority.set(t,!0):n.regular.set(t,!0)}removeListener(e,t){this.events[e]&&(this.events[e].regular.delete(t),this.events[e].highPriority.delete(t))}removeAllListeners(){this.events={}}emit(e){const t=this.events[e];if(!t)return;const o=Array.from(t.highPriority.keys()),n=Array.from(t.regular.keys());for(var r=arguments.length,l=new Array(r>1?r-1:0),i=1;i<r;i++)l[i-1]=arguments[i];for(let a=o.length-1;a>=0;a-=1){const e=o[a];t.highPriority.has(e)&&e.apply(this,l)}for(let a=0;a<n.length;a+=1){const e=n[a];t.regular.has(e)&&e.apply(this,l)}}once(e,t){const o=this;this.on(e,function n(){o.removeListener(e,n);for(var r=arguments.length,l=new Array(r),i=0;i<r;i++)l[i]=arguments[i];t.apply(o,l)})}}const qv=Symbol("mui.api_private");let _v=0;function Xv(e,t){var o;const n=r.useRef(null),l=r.useRef(null);l.current||(l.current=function(e){var t;const o=null===(t=e.current)||void 0===t?void 0:t[qv];if(o)return o;const n={},r={state:n,store:ti.create(n),instanceId:{id:_v}};return _v+=1,r.getPublicApi=()=>e.current,r.register=(t,o)=>{Object.keys(o).forEach(n=>{const l=o[n],i=r[n];if(!0===(null===i||void 0===i?void 0:i.spying)?i.target=l:r[n]=l,"public"===t){const t=e.current,o=t[n];!0===(null===o||void 0===o?void 0:o.spying)?o.target=l:t[n]=l}})},r.register("private",{caches:{},eventManager:new Kv}),r}(n)),n.current||(n.current=function(e){return{get state(){return e.current.state},get store(){return e.current.store},get instanceId(){return e.current.instanceId},[qv]:e.current}}(l));const i=r.useCallback(function(){for(var e=arguments.length,o=new Array(e),n=0;n<e;n++)o[n]=arguments[n];const[r,i,a={}]=o;if(a.defaultMuiPrevented=!1,(e=>void 0!==e.isPropagationStopped)(a)&&a.isPropagationStopped())return;const s=t.signature===Rl.DataGridPro||t.signature===Rl.DataGridPremium?{api:l.current.getPublicApi()}:{};l.current.eventManager.emit(r,i,a,s)},[l,t.signature]),a=r.useCallback((e,t,o)=>{l.current.eventManager.on(e,t,o);const n=l.current;return()=>{n.eventManager.removeListener(e,t)}},[l]);return Nl(l,{subscribeEvent:a,publishEvent:i},"public"),!e||null!==(o=e.current)&&void 0!==o&&o.state||(e.current=n.current),r.useImperativeHandle(e,()=>n.current,[n]),r.useEffect(()=>{const e=l.current;return()=>{e.publishEvent("unmount")}},[l]),l}const Yv={hooks:{useCSSVariables:function(){const e=(0,Fc.A)();return r.useMemo(()=>{const t=Vv(function(e){const t=new WeakSet;return JSON.stringify(e,(e,o)=>{if("undefined"!==typeof window&&o===window||"undefined"!==typeof document&&o===document)return o.toString();if(null!==o&&"object"===typeof o){if(r.isValidElement(o))return null;if(t.has(o))return null;t.add(o)}return o})}(e)),o=function(e){var t,o,n,r,l,i,a,s,c,u;const d=function(e){if(e.vars)return e.vars.palette.TableCell.border;if("light"===e.palette.mode)return(0,Ov.a)((0,Ov.X4)(e.palette.divider,1),.88);return(0,Ov.e$)((0,Ov.X4)(e.palette.divider,1),.68)}(e),p=(e.vars||e).palette.DataGrid,f=null!==(t=null===p||void 0===p?void 0:p.bg)&&void 0!==t?t:(e.vars||e).palette.background.default,g=null!==(o=null===p||void 0===p?void 0:p.headerBg)&&void 0!==o?o:f,h=null!==(n=null===p||void 0===p?void 0:p.pinnedBg)&&void 0!==n?n:f,m=e.vars?"rgba(".concat(e.vars.palette.background.defaultChannel," / ").concat(e.vars.palette.action.disabledOpacity,")"):(0,Ov.X4)(e.palette.background.default,e.palette.action.disabledOpacity),v="dark"===e.palette.mode?"color-mix(in srgb, ".concat((e.vars||e).palette.background.paper," 95%, #fff)"):(e.vars||e).palette.background.paper,b=e.vars?"rgb(".concat(e.vars.palette.primary.mainChannel,")"):e.palette.primary.main,w=function(e){if(e.vars)return e.vars.shape.borderRadius;return"number"===typeof e.shape.borderRadius?"".concat(e.shape.borderRadius,"px"):e.shape.borderRadius}(e),C=null!==(r=null===(l=e.vars)||void 0===l||null===(l=l.font)||void 0===l?void 0:l.body2)&&void 0!==r?r:Uv(e.typography.body2),y=null!==(i=null===(a=e.vars)||void 0===a||null===(a=a.font)||void 0===a?void 0:a.caption)&&void 0!==i?i:Uv(e.typography.caption),A=null!==(s=null===(c=e.vars)||void 0===c||null===(c=c.font)||void 0===c?void 0:c.body1)&&void 0!==s?s:Uv(e.typography.body1),x=S.keys;return{[x.spacingUnit]:e.vars&&null!==(u=e.vars.spacing)&&void 0!==u?u:e.spacing(1),[x.colors.border.base]:d,[x.colors.background.base]:f,[x.colors.background.overlay]:v,[x.colors.background.backdrop]:m,[x.colors.foreground.base]:(e.vars||e).palette.text.primary,[x.colors.foreground.muted]:(e.vars||e).palette.text.secondary,[x.colors.foreground.accent]:(e.vars||e).palette.primary.dark,[x.colors.foreground.disabled]:(e.vars||e).palette.text.disabled,[x.colors.foreground.error]:(e.vars||e).palette.error.dark,[x.colors.interactive.hover]:(e.vars||e).palette.action.hover,[x.colors.interactive.hoverOpacity]:(e.vars||e).palette.action.hoverOpacity,[x.colors.interactive.focus]:Wv((e.vars||e).palette.primary.main),[x.colors.interactive.focusOpacity]:(e.vars||e).palette.action.focusOpacity,[x.colors.interactive.disabled]:Wv((e.vars||e).palette.action.disabled),[x.colors.interactive.disabledOpacity]:(e.vars||e).palette.action.disabledOpacity,[x.colors.interactive.selected]:b,[x.colors.interactive.selectedOpacity]:(e.vars||e).palette.action.selectedOpacity,[x.header.background.base]:g,[x.cell.background.pinned]:h,[x.radius.base]:w,[x.typography.fontFamily.base]:e.typography.fontFamily,[x.typography.fontWeight.light]:e.typography.fontWeightLight,[x.typography.fontWeight.regular]:e.typography.fontWeightRegular,[x.typography.fontWeight.medium]:e.typography.fontWeightMedium,[x.typography.fontWeight.bold]:e.typography.fontWeightBold,[x.typography.font.body]:C,[x.typography.font.small]:y,[x.typography.font.large]:A,[x.transitions.easing.easeIn]:e.transitions.easing.easeIn,[x.transitions.easing.easeOut]:e.transitions.easing.easeOut,[x.transitions.easing.easeInOut]:e.transitions.easing.easeInOut,[x.transitions.duration.short]:"".concat(e.transitions.duration.shorter,"ms"),[x.transitions.duration.base]:"".concat(e.transitions.duration.short,"ms"),[x.transitions.duration.long]:"".concat(e.transitions.duration.standard,"ms"),[x.shadows.base]:(e.vars||e).shadows[2],[x.shadows.overlay]:(e.vars||e).shadows[8],[x.zIndex.panel]:(e.vars||e).zIndex.modal,[x.zIndex.menu]:(e.vars||e).zIndex.modal}}(e);return{id:t,variables:o}},[e])},useGridAriaAttributes:()=>{const e=z(),t=W(),o=D(e,Oe),n=D(e,kr),r=D(e,Jn),l=D(e,Mt),i=t["aria-label"],a=t["aria-labelledby"];return{role:"grid","aria-label":!i&&!a&&t.label?t.label:i,"aria-labelledby":a,"aria-colcount":o.length,"aria-rowcount":r+1+l+n,"aria-multiselectable":Ol(t)}},useGridRowAriaAttributes:()=>{const e=z(),t=D(e,Jn);return r.useCallback((o,n)=>{const r={},l=n+t+2;return r["aria-rowindex"]=l,o&&e.current.isRowSelectable(o.id)&&(r["aria-selected"]=e.current.isRowSelected(o.id)),r},[e,t])},useGridRowsOverridableMethods:e=>({setRowIndex:r.useCallback((t,o)=>{const r=bt(e,t);if(!r)throw new Error("MUI X: No row with id #".concat(t," found."));if(r.parent!==Bo)throw new Error("MUI X: The row reordering do not support reordering of grouped rows yet.");if("leaf"!==r.type)throw new Error("MUI X: The row reordering do not support reordering of footer or grouping rows.");e.current.setState(r=>{const l=vt(e)[Bo],i=l.children,a=i.findIndex(e=>e===t);if(-1===a||a===o)return r;const s=[...i];return s.splice(o,0,s.splice(a,1)[0]),(0,n.A)({},r,{rows:(0,n.A)({},r.rows,{tree:(0,n.A)({},r.rows.tree,{[Bo]:(0,n.A)({},l,{children:s})})})})}),e.current.publishEvent("rowsSet")},[e])}),useCellAggregationResult:()=>null}},Qv=function(e,t){var o;const r=Dv(e),l=Xv(r.apiRef,r);return Ec(l,r,Yv),(0,q.jsx)(jl,{privateApiRef:l,configuration:Yv,props:r,children:(0,q.jsx)(Sl,(0,n.A)({className:r.className,style:r.style,sx:r.sx},null===(o=r.slotProps)||void 0===o?void 0:o.root,{ref:t}))})};const $v=r.memo(a(Qv));Qv.propTypes={apiRef:l.shape({current:l.object}),"aria-label":l.string,"aria-labelledby":l.string,autoHeight:l.bool,autoPageSize:l.bool,autosizeOnMount:l.bool,autosizeOptions:l.shape({columns:l.arrayOf(l.string),disableColumnVirtualization:l.bool,expand:l.bool,includeHeaders:l.bool,includeOutliers:l.bool,outliersFactor:l.number}),cellModesModel:l.object,checkboxSelection:l.bool,classes:l.object,className:l.string,clipboardCopyCellDelimiter:l.string,columnBufferPx:l.number,columnFilterDebounceMs:l.number,columnGroupHeaderHeight:l.number,columnGroupingModel:l.arrayOf(l.object),columnHeaderHeight:l.number,columns:l.arrayOf(l.object).isRequired,columnVisibilityModel:l.object,dataSource:l.shape({getRows:l.func.isRequired,updateRow:l.func}),dataSourceCache:l.shape({clear:l.func.isRequired,get:l.func.isRequired,set:l.func.isRequired}),density:l.oneOf(["comfortable","compact","standard"]),disableAutosize:l.bool,disableColumnFilter:l.bool,disableColumnMenu:l.bool,disableColumnResize:l.bool,disableColumnSelector:l.bool,disableColumnSorting:l.bool,disableDensitySelector:l.bool,disableEval:l.bool,disableMultipleRowSelection:l.bool,disableRowSelectionExcludeModel:l.bool,disableRowSelectionOnClick:l.bool,disableVirtualization:l.bool,editMode:l.oneOf(["cell","row"]),estimatedRowCount:l.number,experimentalFeatures:l.shape({warnIfFocusStateIsNotSynced:l.bool}),filterDebounceMs:l.number,filterMode:l.oneOf(["client","server"]),filterModel:l.shape({items:l.arrayOf(l.shape({field:l.string.isRequired,id:l.oneOfType([l.number,l.string]),operator:l.string.isRequired,value:l.any})).isRequired,logicOperator:l.oneOf(["and","or"]),quickFilterExcludeHiddenColumns:l.bool,quickFilterLogicOperator:l.oneOf(["and","or"]),quickFilterValues:l.array}),getCellClassName:l.func,getDetailPanelContent:l.func,getEstimatedRowHeight:l.func,getRowClassName:l.func,getRowHeight:l.func,getRowId:l.func,getRowSpacing:l.func,hideFooter:l.bool,hideFooterPagination:l.bool,hideFooterSelectedRowCount:l.bool,ignoreDiacritics:l.bool,ignoreValueFormatterDuringExport:l.oneOfType([l.shape({clipboardExport:l.bool,csvExport:l.bool}),l.bool]),initialState:l.object,isCellEditable:l.func,isRowSelectable:l.func,keepNonExistentRowsSelected:l.bool,label:l.string,loading:l.bool,localeText:l.object,logger:l.shape({debug:l.func.isRequired,error:l.func.isRequired,info:l.func.isRequired,warn:l.func.isRequired}),logLevel:l.oneOf(["debug","error","info","warn",!1]),nonce:l.string,onCellClick:l.func,onCellDoubleClick:l.func,onCellEditStart:l.func,onCellEditStop:l.func,onCellKeyDown:l.func,onCellModesModelChange:l.func,onClipboardCopy:l.func,onColumnHeaderClick:l.func,onColumnHeaderContextMenu:l.func,onColumnHeaderDoubleClick:l.func,onColumnHeaderEnter:l.func,onColumnHeaderLeave:l.func,onColumnHeaderOut:l.func,onColumnHeaderOver:l.func,onColumnOrderChange:l.func,onColumnResize:l.func,onColumnVisibilityModelChange:l.func,onColumnWidthChange:l.func,onDataSourceError:l.func,onDensityChange:l.func,onFilterModelChange:l.func,onMenuClose:l.func,onMenuOpen:l.func,onPaginationMetaChange:l.func,onPaginationModelChange:l.func,onPreferencePanelClose:l.func,onPreferencePanelOpen:l.func,onProcessRowUpdateError:l.func,onResize:l.func,onRowClick:l.func,onRowCountChange:l.func,onRowDoubleClick:l.func,onRowEditStart:l.func,onRowEditStop:l.func,onRowModesModelChange:l.func,onRowSelectionModelChange:l.func,onSortModelChange:l.func,onStateChange:l.func,pageSizeOptions:l.arrayOf(l.oneOfType([l.number,l.shape({label:l.string.isRequired,value:l.number.isRequired})]).isRequired),pagination:l.oneOf([!0]),paginationMeta:l.shape({hasNextPage:l.bool}),paginationMode:l.oneOf(["client","server"]),paginationModel:l.shape({page:l.number.isRequired,pageSize:l.number.isRequired}),processRowUpdate:l.func,resizeThrottleMs:l.number,rowBufferPx:l.number,rowCount:l.number,rowHeight:l.number,rowModesModel:l.object,rows:l.arrayOf(l.object),rowSelection:l.bool,rowSelectionModel:l.shape({ids:l.instanceOf(Set).isRequired,type:l.oneOf(["exclude","include"]).isRequired}),rowSpacingType:l.oneOf(["border","margin"]),rowSpanning:l.bool,scrollbarSize:l.number,showCellVerticalBorder:l.bool,showColumnVerticalBorder:l.bool,showToolbar:l.bool,slotProps:l.object,slots:l.object,sortingMode:l.oneOf(["client","server"]),sortingOrder:l.arrayOf(l.oneOf(["asc","desc"])),sortModel:l.arrayOf(l.shape({field:l.string.isRequired,sort:l.oneOf(["asc","desc"])})),style:l.object,sx:l.oneOfType([l.arrayOf(l.oneOfType([l.func,l.object,l.bool])),l.func,l.object]),virtualizeColumnsWithAutoRowHeight:l.bool}},6705:(e,t,o)=>{"use strict";o.d(t,{A:()=>l});var n=o(9992),r=o(579);const l=(0,n.A)((0,r.jsx)("path",{d:"M19 3H4.99c-1.11 0-1.98.89-1.98 2L3 19c0 1.1.88 2 1.99 2H19c1.1 0 2-.9 2-2V5c0-1.11-.9-2-2-2m0 12h-4c0 1.66-1.35 3-3 3s-3-1.34-3-3H4.99V5H19z"}),"Inbox")},8443:(e,t,o)=>{"use strict";e.exports=o(9717)},8735:(e,t,o)=>{"use strict";o.d(t,{A:()=>l});o(5043);var n=o(9992),r=o(579);const l=(0,n.A)((0,r.jsx)("path",{d:"M18.41 16.59L13.82 12l4.59-4.59L17 6l-6 6 6 6zM6 6h2v12H6z"}),"FirstPage")},9155:(e,t,o)=>{"use strict";o.d(t,{A:()=>l});o(5043);var n=o(9992),r=o(579);const l=(0,n.A)((0,r.jsx)("path",{d:"M5.59 7.41L10.18 12l-4.59 4.59L7 18l6-6-6-6zM16 6h2v12h-2z"}),"LastPage")},9461:(e,t,o)=>{"use strict";e.exports=o(2330)},9717:(e,t,o)=>{"use strict";var n=o(5043),r=o(9461);var l="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t},i=r.useSyncExternalStore,a=n.useRef,s=n.useEffect,c=n.useMemo,u=n.useDebugValue;t.useSyncExternalStoreWithSelector=function(e,t,o,n,r){var d=a(null);if(null===d.current){var p={hasValue:!1,value:null};d.current=p}else p=d.current;d=c(function(){function e(e){if(!s){if(s=!0,i=e,e=n(e),void 0!==r&&p.hasValue){var t=p.value;if(r(t,e))return a=t}return a=e}if(t=a,l(i,e))return t;var o=n(e);return void 0!==r&&r(t,o)?(i=e,t):(i=e,a=o)}var i,a,s=!1,c=void 0===o?null:o;return[function(){return e(t())},null===c?void 0:function(){return e(c())}]},[t,o,n,r]);var f=i(e,d[0],d[1]);return s(function(){p.hasValue=!0,p.value=f},[f]),u(f),f}}}]);
-//# sourceMappingURL=167.81cf3a27.chunk.js.map
\ No newline at end of file
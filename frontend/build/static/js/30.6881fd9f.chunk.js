@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[30],{883:(e,n,t)=>{t.d(n,{A:()=>o});const o=(0,t(7675).Ay)()},998:(e,n,t)=>{t.d(n,{A:()=>L});var o=t(9379),r=t(45),a=t(5043),c=t(8387),i=t(2573),s=t(6061),l=t(1807),u=t(883),p=t(8480),d=t(4265);var m=t(5227),f=t(9049);const v=(e,n,t)=>{const o=e.keys[0];if(Array.isArray(n))n.forEach((n,o)=>{t((n,t)=>{o<=e.keys.length-1&&(0===o?Object.assign(n,t):n[e.up(e.keys[o])]=t)},n)});else if(n&&"object"===typeof n){(Object.keys(n).length>e.keys.length?e.keys:(r=e.keys,a=Object.keys(n),r.filter(e=>a.includes(e)))).forEach(r=>{if(e.keys.includes(r)){const a=n[r];void 0!==a&&t((n,t)=>{o===r?Object.assign(n,t):n[e.up(r)]=t},a)}})}else"number"!==typeof n&&"string"!==typeof n||t((e,n)=>{Object.assign(e,n)},n);var r,a};function A(e){return"--Grid-".concat(e,"Spacing")}function h(e){return"--Grid-parent-".concat(e,"Spacing")}const g="--Grid-columns",w="--Grid-parent-columns",y=e=>{let{theme:n,ownerState:t}=e;const o={};return v(n.breakpoints,t.size,(e,n)=>{let t={};"grow"===n&&(t={flexBasis:0,flexGrow:1,maxWidth:"100%"}),"auto"===n&&(t={flexBasis:"auto",flexGrow:0,flexShrink:0,maxWidth:"none",width:"auto"}),"number"===typeof n&&(t={flexGrow:0,flexBasis:"auto",width:"calc(100% * ".concat(n," / var(").concat(w,") - (var(").concat(w,") - ").concat(n,") * (var(").concat(h("column"),") / var(").concat(w,")))")}),e(o,t)}),o},b=e=>{let{theme:n,ownerState:t}=e;const o={};return v(n.breakpoints,t.offset,(e,n)=>{let t={};"auto"===n&&(t={marginLeft:"auto"}),"number"===typeof n&&(t={marginLeft:0===n?"0px":"calc(100% * ".concat(n," / var(").concat(w,") + var(").concat(h("column"),") * ").concat(n," / var(").concat(w,"))")}),e(o,t)}),o},S=e=>{let{theme:n,ownerState:t}=e;if(!t.container)return{};const o={[g]:12};return v(n.breakpoints,t.columns,(e,n)=>{const t=null!==n&&void 0!==n?n:12;e(o,{[g]:t,"> *":{[w]:t}})}),o},k=e=>{let{theme:n,ownerState:t}=e;if(!t.container)return{};const o={};return v(n.breakpoints,t.rowSpacing,(e,t)=>{var r;const a="string"===typeof t?t:null===(r=n.spacing)||void 0===r?void 0:r.call(n,t);e(o,{[A("row")]:a,"> *":{[h("row")]:a}})}),o},x=e=>{let{theme:n,ownerState:t}=e;if(!t.container)return{};const o={};return v(n.breakpoints,t.columnSpacing,(e,t)=>{var r;const a="string"===typeof t?t:null===(r=n.spacing)||void 0===r?void 0:r.call(n,t);e(o,{[A("column")]:a,"> *":{[h("column")]:a}})}),o},C=e=>{let{theme:n,ownerState:t}=e;if(!t.container)return{};const o={};return v(n.breakpoints,t.direction,(e,n)=>{e(o,{flexDirection:n})}),o},M=e=>{let{ownerState:n}=e;return(0,o.A)({minWidth:0,boxSizing:"border-box"},n.container&&(0,o.A)((0,o.A)({display:"flex",flexWrap:"wrap"},n.wrap&&"wrap"!==n.wrap&&{flexWrap:n.wrap}),{},{gap:"var(".concat(A("row"),") var(").concat(A("column"),")")}))},j=e=>{const n=[];return Object.entries(e).forEach(e=>{let[t,o]=e;!1!==o&&void 0!==o&&n.push("grid-".concat(t,"-").concat(String(o)))}),n},N=function(e){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"xs";function t(e){return void 0!==e&&("string"===typeof e&&!Number.isNaN(Number(e))||"number"===typeof e&&e>0)}if(t(e))return["spacing-".concat(n,"-").concat(String(e))];if("object"===typeof e&&!Array.isArray(e)){const n=[];return Object.entries(e).forEach(e=>{let[o,r]=e;t(r)&&n.push("spacing-".concat(o,"-").concat(String(r)))}),n}return[]},G=e=>void 0===e?[]:"object"===typeof e?Object.entries(e).map(e=>{let[n,t]=e;return"direction-".concat(n,"-").concat(t)}):["direction-xs-".concat(String(e))];var z=t(579);const E=["className","children","columns","container","component","direction","wrap","size","offset","spacing","rowSpacing","columnSpacing","unstable_level"],O=(0,f.A)(),R=(0,u.A)("div",{name:"MuiGrid",slot:"Root"});function W(e){return function(e){let{props:n,name:t,defaultTheme:o,themeId:r}=e,a=(0,d.A)(o);return r&&(a=a[r]||a),(0,p.A)({theme:a,name:t,props:n})}({props:e,name:"MuiGrid",defaultTheme:O})}var T=t(8128),B=t(8301),P=t(267);const _=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{createStyledComponent:n=R,useThemeProps:t=W,useTheme:u=d.A,componentName:p="MuiGrid"}=e;function f(e,n){let t=arguments.length>2&&void 0!==arguments[2]?arguments[2]:()=>!0;const o={};return null===e||(Array.isArray(e)?e.forEach((e,r)=>{null!==e&&t(e)&&n.keys[r]&&(o[n.keys[r]]=e)}):"object"===typeof e?Object.keys(e).forEach(n=>{const r=e[n];null!==r&&void 0!==r&&t(r)&&(o[n]=r)}):o[n.keys[0]]=e),o}const v=n(S,x,k,y,C,M,b),A=a.forwardRef(function(e,n){var d,A,h,g,w,y;const b=u(),S=t(e),k=(0,m.A)(S);!function(e,n){const t=[];void 0!==e.item&&(delete e.item,t.push("item")),void 0!==e.zeroMinWidth&&(delete e.zeroMinWidth,t.push("zeroMinWidth")),n.keys.forEach(n=>{void 0!==e[n]&&(t.push(n),delete e[n])})}(k,b.breakpoints);const{className:x,children:C,columns:M=12,container:O=!1,component:R="div",direction:W="row",wrap:T="wrap",size:B={},offset:P={},spacing:_=0,rowSpacing:L=_,columnSpacing:D=_,unstable_level:I=0}=k,V=(0,r.A)(k,E),q=f(B,b.breakpoints,e=>!1!==e),F=f(P,b.breakpoints),H=null!==(d=e.columns)&&void 0!==d?d:I?void 0:M,J=null!==(A=e.spacing)&&void 0!==A?A:I?void 0:_,K=null!==(h=null!==(g=e.rowSpacing)&&void 0!==g?g:e.spacing)&&void 0!==h?h:I?void 0:L,Q=null!==(w=null!==(y=e.columnSpacing)&&void 0!==y?y:e.spacing)&&void 0!==w?w:I?void 0:D,U=(0,o.A)((0,o.A)({},k),{},{level:I,columns:H,container:O,direction:W,wrap:T,spacing:J,rowSpacing:K,columnSpacing:Q,size:q,offset:F}),X=((e,n)=>{const{container:t,direction:o,spacing:r,wrap:a,size:c}=e,i={root:["root",t&&"container","wrap"!==a&&"wrap-xs-".concat(String(a)),...G(o),...j(c),...t?N(r,n.breakpoints.keys[0]):[]]};return(0,l.A)(i,e=>(0,s.Ay)(p,e),{})})(U,b);return(0,z.jsx)(v,(0,o.A)((0,o.A)({ref:n,as:R,ownerState:U,className:(0,c.A)(X.root,x)},V),{},{children:a.Children.map(C,e=>{var n,t;return a.isValidElement(e)&&(0,i.A)(e,["Grid"])&&O&&e.props.container?a.cloneElement(e,{unstable_level:null!==(n=null===(t=e.props)||void 0===t?void 0:t.unstable_level)&&void 0!==n?n:I+1}):e})}))});return A.muiName="Grid",A}({createStyledComponent:(0,T.Ay)("div",{name:"MuiGrid",slot:"Root",overridesResolver:(e,n)=>{const{ownerState:t}=e;return[n.root,t.container&&n.container]}}),componentName:"MuiGrid",useThemeProps:e=>(0,B.b)({props:e,name:"MuiGrid"}),useTheme:P.A});const L=_},1244:(e,n,t)=>{t.d(n,{A:()=>h});var o=t(9379),r=t(45),a=t(5043),c=t(8387),i=t(1807),s=t(8128),l=t(8301),u=t(4799),p=t(9857),d=t(6061);function m(e){return(0,d.Ay)("MuiCard",e)}(0,p.A)("MuiCard",["root"]);var f=t(579);const v=["className","raised"],A=(0,s.Ay)(u.A,{name:"MuiCard",slot:"Root"})({overflow:"hidden"}),h=a.forwardRef(function(e,n){const t=(0,l.b)({props:e,name:"MuiCard"}),{className:a,raised:s=!1}=t,u=(0,r.A)(t,v),p=(0,o.A)((0,o.A)({},t),{},{raised:s}),d=(e=>{const{classes:n}=e;return(0,i.A)({root:["root"]},m,n)})(p);return(0,f.jsx)(A,(0,o.A)({className:(0,c.A)(d.root,a),elevation:s?8:void 0,ref:n,ownerState:p},u))})},6128:(e,n,t)=>{t.d(n,{A:()=>A});var o=t(9379),r=t(45),a=t(5043),c=t(8387),i=t(1807),s=t(8128),l=t(8301),u=t(9857),p=t(6061);function d(e){return(0,p.Ay)("MuiCardContent",e)}(0,u.A)("MuiCardContent",["root"]);var m=t(579);const f=["className","component"],v=(0,s.Ay)("div",{name:"MuiCardContent",slot:"Root"})({padding:16,"&:last-child":{paddingBottom:24}}),A=a.forwardRef(function(e,n){const t=(0,l.b)({props:e,name:"MuiCardContent"}),{className:a,component:s="div"}=t,u=(0,r.A)(t,f),p=(0,o.A)((0,o.A)({},t),{},{component:s}),A=(e=>{const{classes:n}=e;return(0,i.A)({root:["root"]},d,n)})(p);return(0,m.jsx)(v,(0,o.A)({as:s,className:(0,c.A)(A.root,a),ownerState:p,ref:n},u))})},8480:(e,n,t)=>{t.d(n,{A:()=>r});var o=t(4599);function r(e){const{theme:n,name:t,props:r}=e;return n&&n.components&&n.components[t]&&n.components[t].defaultProps?(0,o.A)(n.components[t].defaultProps,r):r}}}]);
-//# sourceMappingURL=30.6881fd9f.chunk.js.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[361],{4079:(e,t,n)=>{n.d(t,{A:()=>r});var o=n(5043);const r=e=>{const t=o.useRef({});return o.useEffect(()=>{t.current=e}),t.current}},4527:(e,t,n)=>{n.d(t,{A:()=>v});var o=n(9379),r=n(45),i=n(5043),a=n(8387),s=n(1807),l=n(8128),c=n(1612),p=n(8301),u=n(4171),d=n(579);const f=["absolute","children","className","orientation","component","flexItem","light","role","textAlign","variant"],h=(0,l.Ay)("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,"vertical"===n.orientation&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&"vertical"===n.orientation&&t.withChildrenVertical,"right"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignRight,"left"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignLeft]}})((0,c.A)(e=>{let{theme:t}=e;return{margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(t.vars||t).palette.divider,borderBottomWidth:"thin",variants:[{props:{absolute:!0},style:{position:"absolute",bottom:0,left:0,width:"100%"}},{props:{light:!0},style:{borderColor:t.alpha((t.vars||t).palette.divider,.08)}},{props:{variant:"inset"},style:{marginLeft:72}},{props:{variant:"middle",orientation:"horizontal"},style:{marginLeft:t.spacing(2),marginRight:t.spacing(2)}},{props:{variant:"middle",orientation:"vertical"},style:{marginTop:t.spacing(1),marginBottom:t.spacing(1)}},{props:{orientation:"vertical"},style:{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"}},{props:{flexItem:!0},style:{alignSelf:"stretch",height:"auto"}},{props:e=>{let{ownerState:t}=e;return!!t.children},style:{display:"flex",textAlign:"center",border:0,borderTopStyle:"solid",borderLeftStyle:"solid","&::before, &::after":{content:'""',alignSelf:"center"}}},{props:e=>{let{ownerState:t}=e;return t.children&&"vertical"!==t.orientation},style:{"&::before, &::after":{width:"100%",borderTop:"thin solid ".concat((t.vars||t).palette.divider),borderTopStyle:"inherit"}}},{props:e=>{let{ownerState:t}=e;return"vertical"===t.orientation&&t.children},style:{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:"thin solid ".concat((t.vars||t).palette.divider),borderLeftStyle:"inherit"}}},{props:e=>{let{ownerState:t}=e;return"right"===t.textAlign&&"vertical"!==t.orientation},style:{"&::before":{width:"90%"},"&::after":{width:"10%"}}},{props:e=>{let{ownerState:t}=e;return"left"===t.textAlign&&"vertical"!==t.orientation},style:{"&::before":{width:"10%"},"&::after":{width:"90%"}}}]}})),g=(0,l.Ay)("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,"vertical"===n.orientation&&t.wrapperVertical]}})((0,c.A)(e=>{let{theme:t}=e;return{display:"inline-block",paddingLeft:"calc(".concat(t.spacing(1)," * 1.2)"),paddingRight:"calc(".concat(t.spacing(1)," * 1.2)"),whiteSpace:"nowrap",variants:[{props:{orientation:"vertical"},style:{paddingTop:"calc(".concat(t.spacing(1)," * 1.2)"),paddingBottom:"calc(".concat(t.spacing(1)," * 1.2)")}}]}})),m=i.forwardRef(function(e,t){const n=(0,p.b)({props:e,name:"MuiDivider"}),{absolute:i=!1,children:l,className:c,orientation:m="horizontal",component:v=(l||"vertical"===m?"div":"hr"),flexItem:b=!1,light:y=!1,role:x=("hr"!==v?"separator":void 0),textAlign:A="center",variant:w="fullWidth"}=n,O=(0,r.A)(n,f),P=(0,o.A)((0,o.A)({},n),{},{absolute:i,component:v,flexItem:b,light:y,orientation:m,role:x,textAlign:A,variant:w}),S=(e=>{const{absolute:t,children:n,classes:o,flexItem:r,light:i,orientation:a,textAlign:l,variant:c}=e,p={root:["root",t&&"absolute",c,i&&"light","vertical"===a&&"vertical",r&&"flexItem",n&&"withChildren",n&&"vertical"===a&&"withChildrenVertical","right"===l&&"vertical"!==a&&"textAlignRight","left"===l&&"vertical"!==a&&"textAlignLeft"],wrapper:["wrapper","vertical"===a&&"wrapperVertical"]};return(0,s.A)(p,u.K,o)})(P);return(0,d.jsx)(h,(0,o.A)((0,o.A)({as:v,className:(0,a.A)(S.root,c),role:x,ref:t,ownerState:P,"aria-orientation":"separator"!==x||"hr"===v&&"vertical"!==m?void 0:m},O),{},{children:l?(0,d.jsx)(g,{className:S.wrapper,ownerState:P,children:l}):null}))});m&&(m.muiSkipListHighlight=!0);const v=m},6923:(e,t,n)=>{n.d(t,{A:()=>le});var o=n(45),r=n(9379),i=n(5043),a=n(8387),s=n(1807),l=n(1289),c=n(1039),p=n(7145),u=n(713),d=n(4079);function f(e){let{array1:t,array2:n,parser:o=e=>e}=e;return t&&n&&t.length===n.length&&t.every((e,t)=>o(e)===o(n[t]))}function h(e){return e.normalize("NFD").replace(/[\u0300-\u036f]/g,"")}const g=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{ignoreAccents:t=!0,ignoreCase:n=!0,limit:o,matchFrom:r="any",stringify:i,trim:a=!1}=e;return(e,s)=>{let{inputValue:l,getOptionLabel:c}=s,p=a?l.trim():l;n&&(p=p.toLowerCase()),t&&(p=h(p));const u=p?e.filter(e=>{let o=(i||c)(e);return n&&(o=o.toLowerCase()),t&&(o=h(o)),"start"===r?o.startsWith(p):o.includes(p)}):e;return"number"===typeof o?u.slice(0,o):u}}(),m=e=>{var t;return null!==e.current&&(null===(t=e.current.parentElement)||void 0===t?void 0:t.contains(document.activeElement))},v=[];function b(e,t,n,o){if(t||null==e||o)return"";const r=n(e);return"string"===typeof r?r:""}const y=function(e){const{unstable_isActiveElementInListbox:t=m,unstable_classNamePrefix:n="Mui",autoComplete:o=!1,autoHighlight:a=!1,autoSelect:s=!1,blurOnSelect:h=!1,clearOnBlur:y=!e.freeSolo,clearOnEscape:x=!1,componentName:A="useAutocomplete",defaultValue:w=(e.multiple?v:null),disableClearable:O=!1,disableCloseOnSelect:P=!1,disabled:S,disabledItemsFocusable:I=!1,disableListWrap:k=!1,filterOptions:C=g,filterSelectedOptions:L=!1,freeSolo:R=!1,getOptionDisabled:T,getOptionKey:E,getOptionLabel:D=e=>{var t;return null!==(t=e.label)&&void 0!==t?t:e},groupBy:M,handleHomeEndKeys:j=!e.freeSolo,id:W,includeInputInList:N=!1,inputValue:H,isOptionEqualToValue:V=(e,t)=>e===t,multiple:B=!1,onChange:z,onClose:F,onHighlightChange:q,onInputChange:U,onOpen:K,open:G,openOnFocus:_=!1,options:X,readOnly:Y=!1,renderValue:J,selectOnFocus:Q=!e.freeSolo,value:Z}=e,$=(0,u.A)(W);let ee=D;ee=e=>{const t=D(e);return"string"!==typeof t?String(t):t};const te=i.useRef(!1),ne=i.useRef(!0),oe=i.useRef(null),re=i.useRef(null),[ie,ae]=i.useState(null),[se,le]=i.useState(-1),ce=a?0:-1,pe=i.useRef(ce),ue=i.useRef(b(null!==w&&void 0!==w?w:Z,B,ee)).current,[de,fe]=(0,p.A)({controlled:Z,default:w,name:A}),[he,ge]=(0,p.A)({controlled:H,default:ue,name:A,state:"inputValue"}),[me,ve]=i.useState(!1),be=i.useCallback((e,t,n)=>{if(!(B?de.length<t.length:null!==t)&&!y)return;const o=b(t,B,ee,J);he!==o&&(ge(o),U&&U(e,o,n))},[ee,he,B,U,ge,y,de,J]),[ye,xe]=(0,p.A)({controlled:G,default:!1,name:A,state:"open"}),[Ae,we]=i.useState(!0),Oe=!B&&null!=de&&he===ee(de),Pe=ye&&!Y,Se=Pe?C(X.filter(e=>!L||!(B?de:[de]).some(t=>null!==t&&V(e,t))),{inputValue:Oe&&Ae?"":he,getOptionLabel:ee}):[],Ie=(0,d.A)({filteredOptions:Se,value:de,inputValue:he});i.useEffect(()=>{const e=de!==Ie.value;me&&!e||R&&!e||be(null,de,"reset")},[de,be,me,Ie.value,R]);const ke=ye&&Se.length>0&&!Y,Ce=(0,c.A)(e=>{if(-1===e)oe.current.focus();else{const t=J?"data-item-index":"data-tag-index";ie.querySelector("[".concat(t,'="').concat(e,'"]')).focus()}});i.useEffect(()=>{B&&se>de.length-1&&(le(-1),Ce(-1))},[de,B,se,Ce]);const Le=(0,c.A)(e=>{let{event:t,index:o,reason:r}=e;if(pe.current=o,-1===o?oe.current.removeAttribute("aria-activedescendant"):oe.current.setAttribute("aria-activedescendant","".concat($,"-option-").concat(o)),q&&["mouse","keyboard","touch"].includes(r)&&q(t,-1===o?null:Se[o],r),!re.current)return;const i=re.current.querySelector('[role="option"].'.concat(n,"-focused"));i&&(i.classList.remove("".concat(n,"-focused")),i.classList.remove("".concat(n,"-focusVisible")));let a=re.current;if("listbox"!==re.current.getAttribute("role")&&(a=re.current.parentElement.querySelector('[role="listbox"]')),!a)return;if(-1===o)return void(a.scrollTop=0);const s=re.current.querySelector('[data-option-index="'.concat(o,'"]'));if(s&&(s.classList.add("".concat(n,"-focused")),"keyboard"===r&&s.classList.add("".concat(n,"-focusVisible")),a.scrollHeight>a.clientHeight&&"mouse"!==r&&"touch"!==r)){const e=s,t=a.clientHeight+a.scrollTop,n=e.offsetTop+e.offsetHeight;n>t?a.scrollTop=n-a.clientHeight:e.offsetTop-e.offsetHeight*(M?1.3:0)<a.scrollTop&&(a.scrollTop=e.offsetTop-e.offsetHeight*(M?1.3:0))}}),Re=(0,c.A)(e=>{let{event:t,diff:n,direction:r="next",reason:i}=e;if(!Pe)return;const a=function(e,t){if(!re.current||e<0||e>=Se.length)return-1;let n=e;for(;;){const o=re.current.querySelector('[data-option-index="'.concat(n,'"]')),r=!I&&(!o||o.disabled||"true"===o.getAttribute("aria-disabled"));if(o&&o.hasAttribute("tabindex")&&!r)return n;if(n="next"===t?(n+1)%Se.length:(n-1+Se.length)%Se.length,n===e)return-1}}((()=>{const e=Se.length-1;if("reset"===n)return ce;if("start"===n)return 0;if("end"===n)return e;const t=pe.current+n;return t<0?-1===t&&N?-1:k&&-1!==pe.current||Math.abs(n)>1?0:e:t>e?t===e+1&&N?-1:k||Math.abs(n)>1?e:0:t})(),r);if(Le({index:a,reason:i,event:t}),o&&"reset"!==n)if(-1===a)oe.current.value=he;else{const e=ee(Se[a]);oe.current.value=e;0===e.toLowerCase().indexOf(he.toLowerCase())&&he.length>0&&oe.current.setSelectionRange(he.length,e.length)}}),Te=!f({array1:Ie.filteredOptions,array2:Se,parser:ee}),Ee=i.useCallback(()=>{if(!Pe)return;const e=(()=>{if(-1!==pe.current&&!f({array1:Ie.filteredOptions,array2:Se,parser:ee})&&Ie.inputValue===he&&(B?de.length===Ie.value.length&&Ie.value.every((e,t)=>ee(de[t])===ee(e)):(e=Ie.value,t=de,(e?ee(e):"")===(t?ee(t):"")))){const e=Ie.filteredOptions[pe.current];if(e)return Se.findIndex(t=>ee(t)===ee(e))}var e,t;return-1})();if(-1!==e)return void(pe.current=e);const t=B?de[0]:de;if(0!==Se.length&&null!=t){if(re.current){if(null!=t){const e=Se[pe.current];if(B&&e&&-1!==de.findIndex(t=>V(e,t)))return;const n=Se.findIndex(e=>V(e,t));return void(-1===n?Re({diff:"reset"}):Le({index:n}))}pe.current>=Se.length-1?Le({index:Se.length-1}):Le({index:pe.current})}}else Re({diff:"reset"})},[Se.length,!B&&de,L,Re,Le,Pe,he,B]),De=(0,c.A)(e=>{(0,l.A)(re,e),e&&Ee()});i.useEffect(()=>{Te&&Ee()},[Ee,Te]);const Me=e=>{ye||(xe(!0),we(!0),K&&K(e))},je=(e,t)=>{ye&&(xe(!1),F&&F(e,t))},We=(e,t,n,o)=>{if(B){if(de.length===t.length&&de.every((e,n)=>e===t[n]))return}else if(de===t)return;z&&z(e,t,n,o),fe(t)},Ne=i.useRef(!1),He=function(e,t){let n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"options",o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"selectOption",r=t;if(B){r=Array.isArray(de)?de.slice():[];const e=r.findIndex(e=>V(t,e));-1===e?r.push(t):"freeSolo"!==n&&(r.splice(e,1),o="removeOption")}be(e,r,o),We(e,r,o,{option:t}),P||e&&(e.ctrlKey||e.metaKey)||je(e,o),(!0===h||"touch"===h&&Ne.current||"mouse"===h&&!Ne.current)&&oe.current.blur()},Ve=(e,t)=>{if(!B)return;""===he&&je(e,"toggleInput");let n=se;-1===se?""===he&&"previous"===t&&(n=de.length-1):(n+="next"===t?1:-1,n<0&&(n=0),n===de.length&&(n=-1)),n=function(e,t){if(-1===e)return-1;let n=e;for(;;){if("next"===t&&n===de.length||"previous"===t&&-1===n)return-1;const e=J?"data-item-index":"data-tag-index",o=ie.querySelector("[".concat(e,'="').concat(n,'"]'));if(o&&o.hasAttribute("tabindex")&&!o.disabled&&"true"!==o.getAttribute("aria-disabled"))return n;n+="next"===t?1:-1}}(n,t),le(n),Ce(n)},Be=e=>{te.current=!0,ge(""),U&&U(e,"","clear"),We(e,B?[]:null,"clear")},ze=e=>t=>{if(e.onKeyDown&&e.onKeyDown(t),!t.defaultMuiPrevented&&(-1===se||["ArrowLeft","ArrowRight"].includes(t.key)||(le(-1),Ce(-1)),229!==t.which))switch(t.key){case"Home":Pe&&j&&(t.preventDefault(),Re({diff:"start",direction:"next",reason:"keyboard",event:t}));break;case"End":Pe&&j&&(t.preventDefault(),Re({diff:"end",direction:"previous",reason:"keyboard",event:t}));break;case"PageUp":t.preventDefault(),Re({diff:-5,direction:"previous",reason:"keyboard",event:t}),Me(t);break;case"PageDown":t.preventDefault(),Re({diff:5,direction:"next",reason:"keyboard",event:t}),Me(t);break;case"ArrowDown":t.preventDefault(),Re({diff:1,direction:"next",reason:"keyboard",event:t}),Me(t);break;case"ArrowUp":t.preventDefault(),Re({diff:-1,direction:"previous",reason:"keyboard",event:t}),Me(t);break;case"ArrowLeft":!B&&J?Ce(0):Ve(t,"previous");break;case"ArrowRight":!B&&J?Ce(-1):Ve(t,"next");break;case"Enter":if(-1!==pe.current&&Pe){const e=Se[pe.current],n=!!T&&T(e);if(t.preventDefault(),n)return;He(t,e,"selectOption"),o&&oe.current.setSelectionRange(oe.current.value.length,oe.current.value.length)}else R&&""!==he&&!1===Oe&&(B&&t.preventDefault(),He(t,he,"createOption","freeSolo"));break;case"Escape":Pe?(t.preventDefault(),t.stopPropagation(),je(t,"escape")):x&&(""!==he||B&&de.length>0||J)&&(t.preventDefault(),t.stopPropagation(),Be(t));break;case"Backspace":if(B&&!Y&&""===he&&de.length>0){const e=-1===se?de.length-1:se,n=de.slice();n.splice(e,1),We(t,n,"removeOption",{option:de[e]})}B||!J||Y||(fe(null),Ce(-1));break;case"Delete":if(B&&!Y&&""===he&&de.length>0&&-1!==se){const e=se,n=de.slice();n.splice(e,1),We(t,n,"removeOption",{option:de[e]})}B||!J||Y||(fe(null),Ce(-1))}},Fe=e=>{ve(!0),_&&!te.current&&Me(e)},qe=e=>{t(re)?oe.current.focus():(ve(!1),ne.current=!0,te.current=!1,s&&-1!==pe.current&&Pe?He(e,Se[pe.current],"blur"):s&&R&&""!==he?He(e,he,"blur","freeSolo"):y&&be(e,de,"blur"),je(e,"blur"))},Ue=e=>{const t=e.target.value;he!==t&&(ge(t),we(!1),U&&U(e,t,"input")),""===t?O||B||We(e,null,"clear"):Me(e)},Ke=e=>{const t=Number(e.currentTarget.getAttribute("data-option-index"));pe.current!==t&&Le({event:e,index:t,reason:"mouse"})},Ge=e=>{Le({event:e,index:Number(e.currentTarget.getAttribute("data-option-index")),reason:"touch"}),Ne.current=!0},_e=e=>{const t=Number(e.currentTarget.getAttribute("data-option-index"));He(e,Se[t],"selectOption"),Ne.current=!1},Xe=e=>t=>{const n=de.slice();n.splice(e,1),We(t,n,"removeOption",{option:de[e]})},Ye=e=>{We(e,null,"removeOption",{option:de})},Je=e=>{ye?je(e,"toggleInput"):Me(e)},Qe=e=>{e.currentTarget.contains(e.target)&&e.target.getAttribute("id")!==$&&e.preventDefault()},Ze=e=>{e.currentTarget.contains(e.target)&&(oe.current.focus(),Q&&ne.current&&oe.current.selectionEnd-oe.current.selectionStart===0&&oe.current.select(),ne.current=!1)},$e=e=>{S||""!==he&&ye||Je(e)};let et=R&&he.length>0;et=et||(B?de.length>0:null!==de);let tt=Se;if(M){new Map;tt=Se.reduce((e,t,n)=>{const o=M(t);return e.length>0&&e[e.length-1].group===o?e[e.length-1].options.push(t):e.push({key:n,index:n,group:o,options:[t]}),e},[])}return S&&me&&qe(),{getRootProps:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(0,r.A)((0,r.A)({},e),{},{onKeyDown:ze(e),onMouseDown:Qe,onClick:Ze})},getInputLabelProps:()=>({id:"".concat($,"-label"),htmlFor:$}),getInputProps:()=>({id:$,value:he,onBlur:qe,onFocus:Fe,onChange:Ue,onMouseDown:$e,"aria-activedescendant":Pe?"":null,"aria-autocomplete":o?"both":"list","aria-controls":ke?"".concat($,"-listbox"):void 0,"aria-expanded":ke,autoComplete:"off",ref:oe,autoCapitalize:"none",spellCheck:"false",role:"combobox",disabled:S}),getClearProps:()=>({tabIndex:-1,type:"button",onClick:Be}),getItemProps:function(){let{index:e=0}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(0,r.A)((0,r.A)((0,r.A)({},B&&{key:e}),J?{"data-item-index":e}:{"data-tag-index":e}),{},{tabIndex:-1},!Y&&{onDelete:B?Xe(e):Ye})},getPopupIndicatorProps:()=>({tabIndex:-1,type:"button",onClick:Je}),getTagProps:e=>{let{index:t}=e;return(0,r.A)({key:t,"data-tag-index":t,tabIndex:-1},!Y&&{onDelete:Xe(t)})},getListboxProps:()=>({role:"listbox",id:"".concat($,"-listbox"),"aria-labelledby":"".concat($,"-label"),ref:De,onMouseDown:e=>{e.preventDefault()}}),getOptionProps:e=>{var t;let{index:n,option:o}=e;const r=(B?de:[de]).some(e=>null!=e&&V(o,e)),i=!!T&&T(o);return{key:null!==(t=null===E||void 0===E?void 0:E(o))&&void 0!==t?t:ee(o),tabIndex:-1,role:"option",id:"".concat($,"-option-").concat(n),onMouseMove:Ke,onClick:_e,onTouchStart:Ge,"data-option-index":n,"aria-disabled":i,"aria-selected":r}},id:$,inputValue:he,value:de,dirty:et,expanded:Pe&&ie,popupOpen:Pe,focused:me||-1!==se,anchorEl:ie,setAnchorEl:ae,focusedItem:se,focusedTag:se,groupedOptions:tt}};var x=n(9181),A=n(8128),w=n(1612),O=n(8301),P=n(7194),S=n(9857),I=n(6061);function k(e){return(0,I.Ay)("MuiListSubheader",e)}(0,S.A)("MuiListSubheader",["root","colorPrimary","colorInherit","gutters","inset","sticky"]);var C=n(579);const L=["className","color","component","disableGutters","disableSticky","inset"],R=(0,A.Ay)("li",{name:"MuiListSubheader",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"default"!==n.color&&t["color".concat((0,P.A)(n.color))],!n.disableGutters&&t.gutters,n.inset&&t.inset,!n.disableSticky&&t.sticky]}})((0,w.A)(e=>{let{theme:t}=e;return{boxSizing:"border-box",lineHeight:"48px",listStyle:"none",color:(t.vars||t).palette.text.secondary,fontFamily:t.typography.fontFamily,fontWeight:t.typography.fontWeightMedium,fontSize:t.typography.pxToRem(14),variants:[{props:{color:"primary"},style:{color:(t.vars||t).palette.primary.main}},{props:{color:"inherit"},style:{color:"inherit"}},{props:e=>{let{ownerState:t}=e;return!t.disableGutters},style:{paddingLeft:16,paddingRight:16}},{props:e=>{let{ownerState:t}=e;return t.inset},style:{paddingLeft:72}},{props:e=>{let{ownerState:t}=e;return!t.disableSticky},style:{position:"sticky",top:0,zIndex:1,backgroundColor:(t.vars||t).palette.background.paper}}]}})),T=i.forwardRef(function(e,t){const n=(0,O.b)({props:e,name:"MuiListSubheader"}),{className:i,color:l="default",component:c="li",disableGutters:p=!1,disableSticky:u=!1,inset:d=!1}=n,f=(0,o.A)(n,L),h=(0,r.A)((0,r.A)({},n),{},{color:l,component:c,disableGutters:p,disableSticky:u,inset:d}),g=(e=>{const{classes:t,color:n,disableGutters:o,inset:r,disableSticky:i}=e,a={root:["root","default"!==n&&"color".concat((0,P.A)(n)),!o&&"gutters",r&&"inset",!i&&"sticky"]};return(0,s.A)(a,k,t)})(h);return(0,C.jsx)(R,(0,r.A)({as:c,className:(0,a.A)(g.root,i),ref:t,ownerState:h},f))});T&&(T.muiSkipListHighlight=!0);const E=T;var D=n(4799),M=n(6647),j=n(3759),W=n(8619),N=n(8031),H=n(4807),V=n(4727);const B=(0,n(9992).A)((0,C.jsx)("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");var z=n(8850);function F(e){return(0,I.Ay)("MuiAutocomplete",e)}const q=(0,S.A)("MuiAutocomplete",["root","expanded","fullWidth","focused","focusVisible","tag","tagSizeSmall","tagSizeMedium","hasPopupIcon","hasClearIcon","inputRoot","input","inputFocused","endAdornment","clearIndicator","popupIndicator","popupIndicatorOpen","popper","popperDisablePortal","paper","listbox","loading","noOptions","option","groupLabel","groupUl"]);var U=n(9905);const K=["autoComplete","autoHighlight","autoSelect","blurOnSelect","ChipProps","className","clearIcon","clearOnBlur","clearOnEscape","clearText","closeText","componentsProps","defaultValue","disableClearable","disableCloseOnSelect","disabled","disabledItemsFocusable","disableListWrap","disablePortal","filterOptions","filterSelectedOptions","forcePopupIcon","freeSolo","fullWidth","getLimitTagsText","getOptionDisabled","getOptionKey","getOptionLabel","isOptionEqualToValue","groupBy","handleHomeEndKeys","id","includeInputInList","inputValue","limitTags","ListboxComponent","ListboxProps","loading","loadingText","multiple","noOptionsText","onChange","onClose","onHighlightChange","onInputChange","onOpen","open","openOnFocus","openText","options","PaperComponent","PopperComponent","popupIcon","readOnly","renderGroup","renderInput","renderOption","renderTags","renderValue","selectOnFocus","size","slots","slotProps","value"],G=["ref"],_=["key"],X=["key"];var Y,J;const Q=(0,A.Ay)("div",{name:"MuiAutocomplete",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{fullWidth:o,hasClearIcon:r,hasPopupIcon:i,inputFocused:a,size:s}=n;return[{["& .".concat(q.tag)]:t.tag},{["& .".concat(q.tag)]:t["tagSize".concat((0,P.A)(s))]},{["& .".concat(q.inputRoot)]:t.inputRoot},{["& .".concat(q.input)]:t.input},{["& .".concat(q.input)]:a&&t.inputFocused},t.root,o&&t.fullWidth,i&&t.hasPopupIcon,r&&t.hasClearIcon]}})({["&.".concat(q.focused," .").concat(q.clearIndicator)]:{visibility:"visible"},"@media (pointer: fine)":{["&:hover .".concat(q.clearIndicator)]:{visibility:"visible"}},["& .".concat(q.tag)]:{margin:3,maxWidth:"calc(100% - 6px)"},["& .".concat(q.inputRoot)]:{[".".concat(q.hasPopupIcon,"&, .").concat(q.hasClearIcon,"&")]:{paddingRight:30},[".".concat(q.hasPopupIcon,".").concat(q.hasClearIcon,"&")]:{paddingRight:56},["& .".concat(q.input)]:{width:0,minWidth:30}},["& .".concat(W.A.root)]:{paddingBottom:1,"& .MuiInput-input":{padding:"4px 4px 4px 0px"}},["& .".concat(W.A.root,".").concat(N.A.sizeSmall)]:{["& .".concat(W.A.input)]:{padding:"2px 4px 3px 0"}},["& .".concat(H.A.root)]:{padding:9,[".".concat(q.hasPopupIcon,"&, .").concat(q.hasClearIcon,"&")]:{paddingRight:39},[".".concat(q.hasPopupIcon,".").concat(q.hasClearIcon,"&")]:{paddingRight:65},["& .".concat(q.input)]:{padding:"7.5px 4px 7.5px 5px"},["& .".concat(q.endAdornment)]:{right:9}},["& .".concat(H.A.root,".").concat(N.A.sizeSmall)]:{paddingTop:6,paddingBottom:6,paddingLeft:6,["& .".concat(q.input)]:{padding:"2.5px 4px 2.5px 8px"}},["& .".concat(V.A.root)]:{paddingTop:19,paddingLeft:8,[".".concat(q.hasPopupIcon,"&, .").concat(q.hasClearIcon,"&")]:{paddingRight:39},[".".concat(q.hasPopupIcon,".").concat(q.hasClearIcon,"&")]:{paddingRight:65},["& .".concat(V.A.input)]:{padding:"7px 4px"},["& .".concat(q.endAdornment)]:{right:9}},["& .".concat(V.A.root,".").concat(N.A.sizeSmall)]:{paddingBottom:1,["& .".concat(V.A.input)]:{padding:"2.5px 4px"}},["& .".concat(N.A.hiddenLabel)]:{paddingTop:8},["& .".concat(V.A.root,".").concat(N.A.hiddenLabel)]:{paddingTop:0,paddingBottom:0,["& .".concat(q.input)]:{paddingTop:16,paddingBottom:17}},["& .".concat(V.A.root,".").concat(N.A.hiddenLabel,".").concat(N.A.sizeSmall)]:{["& .".concat(q.input)]:{paddingTop:8,paddingBottom:9}},["& .".concat(q.input)]:{flexGrow:1,textOverflow:"ellipsis",opacity:0},variants:[{props:{fullWidth:!0},style:{width:"100%"}},{props:{size:"small"},style:{["& .".concat(q.tag)]:{margin:2,maxWidth:"calc(100% - 4px)"}}},{props:{inputFocused:!0},style:{["& .".concat(q.input)]:{opacity:1}}},{props:{multiple:!0},style:{["& .".concat(q.inputRoot)]:{flexWrap:"wrap"}}}]}),Z=(0,A.Ay)("div",{name:"MuiAutocomplete",slot:"EndAdornment"})({position:"absolute",right:0,top:"50%",transform:"translate(0, -50%)"}),$=(0,A.Ay)(M.A,{name:"MuiAutocomplete",slot:"ClearIndicator"})({marginRight:-2,padding:4,visibility:"hidden"}),ee=(0,A.Ay)(M.A,{name:"MuiAutocomplete",slot:"PopupIndicator",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.popupIndicator,n.popupOpen&&t.popupIndicatorOpen]}})({padding:2,marginRight:-2,variants:[{props:{popupOpen:!0},style:{transform:"rotate(180deg)"}}]}),te=(0,A.Ay)(x.A,{name:"MuiAutocomplete",slot:"Popper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{["& .".concat(q.option)]:t.option},t.popper,n.disablePortal&&t.popperDisablePortal]}})((0,w.A)(e=>{let{theme:t}=e;return{zIndex:(t.vars||t).zIndex.modal,variants:[{props:{disablePortal:!0},style:{position:"absolute"}}]}})),ne=(0,A.Ay)(D.A,{name:"MuiAutocomplete",slot:"Paper"})((0,w.A)(e=>{let{theme:t}=e;return(0,r.A)((0,r.A)({},t.typography.body1),{},{overflow:"auto"})})),oe=(0,A.Ay)("div",{name:"MuiAutocomplete",slot:"Loading"})((0,w.A)(e=>{let{theme:t}=e;return{color:(t.vars||t).palette.text.secondary,padding:"14px 16px"}})),re=(0,A.Ay)("div",{name:"MuiAutocomplete",slot:"NoOptions"})((0,w.A)(e=>{let{theme:t}=e;return{color:(t.vars||t).palette.text.secondary,padding:"14px 16px"}})),ie=(0,A.Ay)("ul",{name:"MuiAutocomplete",slot:"Listbox"})((0,w.A)(e=>{let{theme:t}=e;return{listStyle:"none",margin:0,padding:"8px 0",maxHeight:"40vh",overflow:"auto",position:"relative",["& .".concat(q.option)]:{minHeight:48,display:"flex",overflow:"hidden",justifyContent:"flex-start",alignItems:"center",cursor:"pointer",paddingTop:6,boxSizing:"border-box",outline:"0",WebkitTapHighlightColor:"transparent",paddingBottom:6,paddingLeft:16,paddingRight:16,[t.breakpoints.up("sm")]:{minHeight:"auto"},["&.".concat(q.focused)]:{backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},'&[aria-disabled="true"]':{opacity:(t.vars||t).palette.action.disabledOpacity,pointerEvents:"none"},["&.".concat(q.focusVisible)]:{backgroundColor:(t.vars||t).palette.action.focus},'&[aria-selected="true"]':{backgroundColor:t.alpha((t.vars||t).palette.primary.main,(t.vars||t).palette.action.selectedOpacity),["&.".concat(q.focused)]:{backgroundColor:t.alpha((t.vars||t).palette.primary.main,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.hoverOpacity)),"@media (hover: none)":{backgroundColor:(t.vars||t).palette.action.selected}},["&.".concat(q.focusVisible)]:{backgroundColor:t.alpha((t.vars||t).palette.primary.main,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.focusOpacity))}}}}})),ae=(0,A.Ay)(E,{name:"MuiAutocomplete",slot:"GroupLabel"})((0,w.A)(e=>{let{theme:t}=e;return{backgroundColor:(t.vars||t).palette.background.paper,top:-8}})),se=(0,A.Ay)("ul",{name:"MuiAutocomplete",slot:"GroupUl"})({padding:0,["& .".concat(q.option)]:{paddingLeft:24}}),le=i.forwardRef(function(e,t){const n=(0,O.b)({props:e,name:"MuiAutocomplete"}),{autoComplete:l=!1,autoHighlight:c=!1,autoSelect:p=!1,blurOnSelect:u=!1,ChipProps:d,className:f,clearIcon:h=Y||(Y=(0,C.jsx)(B,{fontSize:"small"})),clearOnBlur:g=!n.freeSolo,clearOnEscape:m=!1,clearText:v="Clear",closeText:b="Close",componentsProps:A,defaultValue:w=(n.multiple?[]:null),disableClearable:S=!1,disableCloseOnSelect:I=!1,disabled:k=!1,disabledItemsFocusable:L=!1,disableListWrap:R=!1,disablePortal:T=!1,filterOptions:E,filterSelectedOptions:M=!1,forcePopupIcon:W="auto",freeSolo:N=!1,fullWidth:H=!1,getLimitTagsText:V=e=>"+".concat(e),getOptionDisabled:q,getOptionKey:le,getOptionLabel:ce,isOptionEqualToValue:pe,groupBy:ue,handleHomeEndKeys:de=!n.freeSolo,id:fe,includeInputInList:he=!1,inputValue:ge,limitTags:me=-1,ListboxComponent:ve,ListboxProps:be,loading:ye=!1,loadingText:xe="Loading\u2026",multiple:Ae=!1,noOptionsText:we="No options",onChange:Oe,onClose:Pe,onHighlightChange:Se,onInputChange:Ie,onOpen:ke,open:Ce,openOnFocus:Le=!1,openText:Re="Open",options:Te,PaperComponent:Ee,PopperComponent:De,popupIcon:Me=J||(J=(0,C.jsx)(z.A,{})),readOnly:je=!1,renderGroup:We,renderInput:Ne,renderOption:He,renderTags:Ve,renderValue:Be,selectOnFocus:ze=!n.freeSolo,size:Fe="medium",slots:qe={},slotProps:Ue={},value:Ke}=n,Ge=(0,o.A)(n,K),{getRootProps:_e,getInputProps:Xe,getInputLabelProps:Ye,getPopupIndicatorProps:Je,getClearProps:Qe,getItemProps:Ze,getListboxProps:$e,getOptionProps:et,value:tt,dirty:nt,expanded:ot,id:rt,popupOpen:it,focused:at,focusedItem:st,anchorEl:lt,setAnchorEl:ct,inputValue:pt,groupedOptions:ut}=y((0,r.A)((0,r.A)({},n),{},{componentName:"Autocomplete"})),dt=!S&&!k&&nt&&!je,ft=(!N||!0===W)&&!1!==W,{onMouseDown:ht}=Xe(),gt=$e(),{ref:mt}=gt,vt=(0,o.A)(gt,G),bt=ce||(e=>{var t;return null!==(t=e.label)&&void 0!==t?t:e}),yt=(0,r.A)((0,r.A)({},n),{},{disablePortal:T,expanded:ot,focused:at,fullWidth:H,getOptionLabel:bt,hasClearIcon:dt,hasPopupIcon:ft,inputFocused:-1===st,popupOpen:it,size:Fe}),xt=(e=>{const{classes:t,disablePortal:n,expanded:o,focused:r,fullWidth:i,hasClearIcon:a,hasPopupIcon:l,inputFocused:c,popupOpen:p,size:u}=e,d={root:["root",o&&"expanded",r&&"focused",i&&"fullWidth",a&&"hasClearIcon",l&&"hasPopupIcon"],inputRoot:["inputRoot"],input:["input",c&&"inputFocused"],tag:["tag","tagSize".concat((0,P.A)(u))],endAdornment:["endAdornment"],clearIndicator:["clearIndicator"],popupIndicator:["popupIndicator",p&&"popupIndicatorOpen"],popper:["popper",n&&"popperDisablePortal"],paper:["paper"],listbox:["listbox"],loading:["loading"],noOptions:["noOptions"],option:["option"],groupLabel:["groupLabel"],groupUl:["groupUl"]};return(0,s.A)(d,F,t)})(yt),At={slots:(0,r.A)({paper:Ee,popper:De},qe),slotProps:(0,r.A)((0,r.A)({chip:d,listbox:be},A),Ue)},[wt,Ot]=(0,U.A)("listbox",{elementType:ie,externalForwardedProps:At,ownerState:yt,className:xt.listbox,additionalProps:vt,ref:mt}),[Pt,St]=(0,U.A)("paper",{elementType:D.A,externalForwardedProps:At,ownerState:yt,className:xt.paper}),[It,kt]=(0,U.A)("popper",{elementType:x.A,externalForwardedProps:At,ownerState:yt,className:xt.popper,additionalProps:{disablePortal:T,style:{width:lt?lt.clientWidth:null},role:"presentation",anchorEl:lt,open:it}});let Ct;const Lt=e=>(0,r.A)({className:xt.tag,disabled:k},Ze(e));if(Ae?tt.length>0&&(Ct=Ve?Ve(tt,Lt,yt):Be?Be(tt,Lt,yt):tt.map((e,t)=>{const n=Lt({index:t}),{key:i}=n,a=(0,o.A)(n,_);return(0,C.jsx)(j.A,(0,r.A)((0,r.A)({label:bt(e),size:Fe},a),At.slotProps.chip),i)})):Be&&null!=tt&&(Ct=Be(tt,Lt,yt)),me>-1&&Array.isArray(Ct)){const e=Ct.length-me;!at&&e>0&&(Ct=Ct.splice(0,me),Ct.push((0,C.jsx)("span",{className:xt.tag,children:V(e)},Ct.length)))}const Rt=We||(e=>(0,C.jsxs)("li",{children:[(0,C.jsx)(ae,{className:xt.groupLabel,ownerState:yt,component:"div",children:e.group}),(0,C.jsx)(se,{className:xt.groupUl,ownerState:yt,children:e.children})]},e.key)),Tt=He||((e,t)=>{const{key:n}=e,i=(0,o.A)(e,X);return(0,C.jsx)("li",(0,r.A)((0,r.A)({},i),{},{children:bt(t)}),n)}),Et=(e,t)=>{const n=et({option:e,index:t});return Tt((0,r.A)((0,r.A)({},n),{},{className:xt.option}),e,{selected:n["aria-selected"],index:t,inputValue:pt},yt)},Dt=At.slotProps.clearIndicator,Mt=At.slotProps.popupIndicator;return(0,C.jsxs)(i.Fragment,{children:[(0,C.jsx)(Q,(0,r.A)((0,r.A)({ref:t,className:(0,a.A)(xt.root,f),ownerState:yt},_e(Ge)),{},{children:Ne({id:rt,disabled:k,fullWidth:!0,size:"small"===Fe?"small":void 0,InputLabelProps:Ye(),InputProps:(0,r.A)({ref:ct,className:xt.inputRoot,startAdornment:Ct,onMouseDown:e=>{e.target===e.currentTarget&&ht(e)}},(dt||ft)&&{endAdornment:(0,C.jsxs)(Z,{className:xt.endAdornment,ownerState:yt,children:[dt?(0,C.jsx)($,(0,r.A)((0,r.A)((0,r.A)({},Qe()),{},{"aria-label":v,title:v,ownerState:yt},Dt),{},{className:(0,a.A)(xt.clearIndicator,null===Dt||void 0===Dt?void 0:Dt.className),children:h})):null,ft?(0,C.jsx)(ee,(0,r.A)((0,r.A)((0,r.A)({},Je()),{},{disabled:k,"aria-label":it?b:Re,title:it?b:Re,ownerState:yt},Mt),{},{className:(0,a.A)(xt.popupIndicator,null===Mt||void 0===Mt?void 0:Mt.className),children:Me})):null]})}),inputProps:(0,r.A)({className:xt.input,disabled:k,readOnly:je},Xe())})})),lt?(0,C.jsx)(te,(0,r.A)((0,r.A)({as:It},kt),{},{children:(0,C.jsxs)(ne,(0,r.A)((0,r.A)({as:Pt},St),{},{children:[ye&&0===ut.length?(0,C.jsx)(oe,{className:xt.loading,ownerState:yt,children:xe}):null,0!==ut.length||N||ye?null:(0,C.jsx)(re,{className:xt.noOptions,ownerState:yt,role:"presentation",onMouseDown:e=>{e.preventDefault()},children:we}),ut.length>0?(0,C.jsx)(wt,(0,r.A)((0,r.A)({as:ve},Ot),{},{children:ut.map((e,t)=>ue?Rt({key:e.key,group:e.group,children:e.options.map((t,n)=>Et(t,e.index+n))}):Et(e,t))})):null]}))})):null]})})},9181:(e,t,n)=>{n.d(t,{A:()=>ze});var o=n(9379),r=n(45),i=n(2432),a=n(5043),s=n(7449),l=n(6509),c=n(1767);function p(e){if(null==e)return window;if("[object Window]"!==e.toString()){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function u(e){return e instanceof p(e).Element||e instanceof Element}function d(e){return e instanceof p(e).HTMLElement||e instanceof HTMLElement}function f(e){return"undefined"!==typeof ShadowRoot&&(e instanceof p(e).ShadowRoot||e instanceof ShadowRoot)}var h=Math.max,g=Math.min,m=Math.round;function v(){var e=navigator.userAgentData;return null!=e&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(e){return e.brand+"/"+e.version}).join(" "):navigator.userAgent}function b(){return!/^((?!chrome|android).)*safari/i.test(v())}function y(e,t,n){void 0===t&&(t=!1),void 0===n&&(n=!1);var o=e.getBoundingClientRect(),r=1,i=1;t&&d(e)&&(r=e.offsetWidth>0&&m(o.width)/e.offsetWidth||1,i=e.offsetHeight>0&&m(o.height)/e.offsetHeight||1);var a=(u(e)?p(e):window).visualViewport,s=!b()&&n,l=(o.left+(s&&a?a.offsetLeft:0))/r,c=(o.top+(s&&a?a.offsetTop:0))/i,f=o.width/r,h=o.height/i;return{width:f,height:h,top:c,right:l+f,bottom:c+h,left:l,x:l,y:c}}function x(e){var t=p(e);return{scrollLeft:t.pageXOffset,scrollTop:t.pageYOffset}}function A(e){return e?(e.nodeName||"").toLowerCase():null}function w(e){return((u(e)?e.ownerDocument:e.document)||window.document).documentElement}function O(e){return y(w(e)).left+x(e).scrollLeft}function P(e){return p(e).getComputedStyle(e)}function S(e){var t=P(e),n=t.overflow,o=t.overflowX,r=t.overflowY;return/auto|scroll|overlay|hidden/.test(n+r+o)}function I(e,t,n){void 0===n&&(n=!1);var o=d(t),r=d(t)&&function(e){var t=e.getBoundingClientRect(),n=m(t.width)/e.offsetWidth||1,o=m(t.height)/e.offsetHeight||1;return 1!==n||1!==o}(t),i=w(t),a=y(e,r,n),s={scrollLeft:0,scrollTop:0},l={x:0,y:0};return(o||!o&&!n)&&(("body"!==A(t)||S(i))&&(s=function(e){return e!==p(e)&&d(e)?{scrollLeft:(t=e).scrollLeft,scrollTop:t.scrollTop}:x(e);var t}(t)),d(t)?((l=y(t,!0)).x+=t.clientLeft,l.y+=t.clientTop):i&&(l.x=O(i))),{x:a.left+s.scrollLeft-l.x,y:a.top+s.scrollTop-l.y,width:a.width,height:a.height}}function k(e){var t=y(e),n=e.offsetWidth,o=e.offsetHeight;return Math.abs(t.width-n)<=1&&(n=t.width),Math.abs(t.height-o)<=1&&(o=t.height),{x:e.offsetLeft,y:e.offsetTop,width:n,height:o}}function C(e){return"html"===A(e)?e:e.assignedSlot||e.parentNode||(f(e)?e.host:null)||w(e)}function L(e){return["html","body","#document"].indexOf(A(e))>=0?e.ownerDocument.body:d(e)&&S(e)?e:L(C(e))}function R(e,t){var n;void 0===t&&(t=[]);var o=L(e),r=o===(null==(n=e.ownerDocument)?void 0:n.body),i=p(o),a=r?[i].concat(i.visualViewport||[],S(o)?o:[]):o,s=t.concat(a);return r?s:s.concat(R(C(a)))}function T(e){return["table","td","th"].indexOf(A(e))>=0}function E(e){return d(e)&&"fixed"!==P(e).position?e.offsetParent:null}function D(e){for(var t=p(e),n=E(e);n&&T(n)&&"static"===P(n).position;)n=E(n);return n&&("html"===A(n)||"body"===A(n)&&"static"===P(n).position)?t:n||function(e){var t=/firefox/i.test(v());if(/Trident/i.test(v())&&d(e)&&"fixed"===P(e).position)return null;var n=C(e);for(f(n)&&(n=n.host);d(n)&&["html","body"].indexOf(A(n))<0;){var o=P(n);if("none"!==o.transform||"none"!==o.perspective||"paint"===o.contain||-1!==["transform","perspective"].indexOf(o.willChange)||t&&"filter"===o.willChange||t&&o.filter&&"none"!==o.filter)return n;n=n.parentNode}return null}(e)||t}var M="top",j="bottom",W="right",N="left",H="auto",V=[M,j,W,N],B="start",z="end",F="viewport",q="popper",U=V.reduce(function(e,t){return e.concat([t+"-"+B,t+"-"+z])},[]),K=[].concat(V,[H]).reduce(function(e,t){return e.concat([t,t+"-"+B,t+"-"+z])},[]),G=["beforeRead","read","afterRead","beforeMain","main","afterMain","beforeWrite","write","afterWrite"];function _(e){var t=new Map,n=new Set,o=[];function r(e){n.add(e.name),[].concat(e.requires||[],e.requiresIfExists||[]).forEach(function(e){if(!n.has(e)){var o=t.get(e);o&&r(o)}}),o.push(e)}return e.forEach(function(e){t.set(e.name,e)}),e.forEach(function(e){n.has(e.name)||r(e)}),o}function X(e){var t;return function(){return t||(t=new Promise(function(n){Promise.resolve().then(function(){t=void 0,n(e())})})),t}}var Y={placement:"bottom",modifiers:[],strategy:"absolute"};function J(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return!t.some(function(e){return!(e&&"function"===typeof e.getBoundingClientRect)})}function Q(e){void 0===e&&(e={});var t=e,n=t.defaultModifiers,o=void 0===n?[]:n,r=t.defaultOptions,i=void 0===r?Y:r;return function(e,t,n){void 0===n&&(n=i);var r={placement:"bottom",orderedModifiers:[],options:Object.assign({},Y,i),modifiersData:{},elements:{reference:e,popper:t},attributes:{},styles:{}},a=[],s=!1,l={state:r,setOptions:function(n){var s="function"===typeof n?n(r.options):n;c(),r.options=Object.assign({},i,r.options,s),r.scrollParents={reference:u(e)?R(e):e.contextElement?R(e.contextElement):[],popper:R(t)};var p=function(e){var t=_(e);return G.reduce(function(e,n){return e.concat(t.filter(function(e){return e.phase===n}))},[])}(function(e){var t=e.reduce(function(e,t){var n=e[t.name];return e[t.name]=n?Object.assign({},n,t,{options:Object.assign({},n.options,t.options),data:Object.assign({},n.data,t.data)}):t,e},{});return Object.keys(t).map(function(e){return t[e]})}([].concat(o,r.options.modifiers)));return r.orderedModifiers=p.filter(function(e){return e.enabled}),r.orderedModifiers.forEach(function(e){var t=e.name,n=e.options,o=void 0===n?{}:n,i=e.effect;if("function"===typeof i){var s=i({state:r,name:t,instance:l,options:o}),c=function(){};a.push(s||c)}}),l.update()},forceUpdate:function(){if(!s){var e=r.elements,t=e.reference,n=e.popper;if(J(t,n)){r.rects={reference:I(t,D(n),"fixed"===r.options.strategy),popper:k(n)},r.reset=!1,r.placement=r.options.placement,r.orderedModifiers.forEach(function(e){return r.modifiersData[e.name]=Object.assign({},e.data)});for(var o=0;o<r.orderedModifiers.length;o++)if(!0!==r.reset){var i=r.orderedModifiers[o],a=i.fn,c=i.options,p=void 0===c?{}:c,u=i.name;"function"===typeof a&&(r=a({state:r,options:p,name:u,instance:l})||r)}else r.reset=!1,o=-1}}},update:X(function(){return new Promise(function(e){l.forceUpdate(),e(r)})}),destroy:function(){c(),s=!0}};if(!J(e,t))return l;function c(){a.forEach(function(e){return e()}),a=[]}return l.setOptions(n).then(function(e){!s&&n.onFirstUpdate&&n.onFirstUpdate(e)}),l}}var Z={passive:!0};function $(e){return e.split("-")[0]}function ee(e){return e.split("-")[1]}function te(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function ne(e){var t,n=e.reference,o=e.element,r=e.placement,i=r?$(r):null,a=r?ee(r):null,s=n.x+n.width/2-o.width/2,l=n.y+n.height/2-o.height/2;switch(i){case M:t={x:s,y:n.y-o.height};break;case j:t={x:s,y:n.y+n.height};break;case W:t={x:n.x+n.width,y:l};break;case N:t={x:n.x-o.width,y:l};break;default:t={x:n.x,y:n.y}}var c=i?te(i):null;if(null!=c){var p="y"===c?"height":"width";switch(a){case B:t[c]=t[c]-(n[p]/2-o[p]/2);break;case z:t[c]=t[c]+(n[p]/2-o[p]/2)}}return t}var oe={top:"auto",right:"auto",bottom:"auto",left:"auto"};function re(e){var t,n=e.popper,o=e.popperRect,r=e.placement,i=e.variation,a=e.offsets,s=e.position,l=e.gpuAcceleration,c=e.adaptive,u=e.roundOffsets,d=e.isFixed,f=a.x,h=void 0===f?0:f,g=a.y,v=void 0===g?0:g,b="function"===typeof u?u({x:h,y:v}):{x:h,y:v};h=b.x,v=b.y;var y=a.hasOwnProperty("x"),x=a.hasOwnProperty("y"),A=N,O=M,S=window;if(c){var I=D(n),k="clientHeight",C="clientWidth";if(I===p(n)&&"static"!==P(I=w(n)).position&&"absolute"===s&&(k="scrollHeight",C="scrollWidth"),r===M||(r===N||r===W)&&i===z)O=j,v-=(d&&I===S&&S.visualViewport?S.visualViewport.height:I[k])-o.height,v*=l?1:-1;if(r===N||(r===M||r===j)&&i===z)A=W,h-=(d&&I===S&&S.visualViewport?S.visualViewport.width:I[C])-o.width,h*=l?1:-1}var L,R=Object.assign({position:s},c&&oe),T=!0===u?function(e,t){var n=e.x,o=e.y,r=t.devicePixelRatio||1;return{x:m(n*r)/r||0,y:m(o*r)/r||0}}({x:h,y:v},p(n)):{x:h,y:v};return h=T.x,v=T.y,l?Object.assign({},R,((L={})[O]=x?"0":"",L[A]=y?"0":"",L.transform=(S.devicePixelRatio||1)<=1?"translate("+h+"px, "+v+"px)":"translate3d("+h+"px, "+v+"px, 0)",L)):Object.assign({},R,((t={})[O]=x?v+"px":"",t[A]=y?h+"px":"",t.transform="",t))}const ie={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(e){var t=e.state,n=e.options,o=e.name,r=n.offset,i=void 0===r?[0,0]:r,a=K.reduce(function(e,n){return e[n]=function(e,t,n){var o=$(e),r=[N,M].indexOf(o)>=0?-1:1,i="function"===typeof n?n(Object.assign({},t,{placement:e})):n,a=i[0],s=i[1];return a=a||0,s=(s||0)*r,[N,W].indexOf(o)>=0?{x:s,y:a}:{x:a,y:s}}(n,t.rects,i),e},{}),s=a[t.placement],l=s.x,c=s.y;null!=t.modifiersData.popperOffsets&&(t.modifiersData.popperOffsets.x+=l,t.modifiersData.popperOffsets.y+=c),t.modifiersData[o]=a}};var ae={left:"right",right:"left",bottom:"top",top:"bottom"};function se(e){return e.replace(/left|right|bottom|top/g,function(e){return ae[e]})}var le={start:"end",end:"start"};function ce(e){return e.replace(/start|end/g,function(e){return le[e]})}function pe(e,t){var n=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(n&&f(n)){var o=t;do{if(o&&e.isSameNode(o))return!0;o=o.parentNode||o.host}while(o)}return!1}function ue(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function de(e,t,n){return t===F?ue(function(e,t){var n=p(e),o=w(e),r=n.visualViewport,i=o.clientWidth,a=o.clientHeight,s=0,l=0;if(r){i=r.width,a=r.height;var c=b();(c||!c&&"fixed"===t)&&(s=r.offsetLeft,l=r.offsetTop)}return{width:i,height:a,x:s+O(e),y:l}}(e,n)):u(t)?function(e,t){var n=y(e,!1,"fixed"===t);return n.top=n.top+e.clientTop,n.left=n.left+e.clientLeft,n.bottom=n.top+e.clientHeight,n.right=n.left+e.clientWidth,n.width=e.clientWidth,n.height=e.clientHeight,n.x=n.left,n.y=n.top,n}(t,n):ue(function(e){var t,n=w(e),o=x(e),r=null==(t=e.ownerDocument)?void 0:t.body,i=h(n.scrollWidth,n.clientWidth,r?r.scrollWidth:0,r?r.clientWidth:0),a=h(n.scrollHeight,n.clientHeight,r?r.scrollHeight:0,r?r.clientHeight:0),s=-o.scrollLeft+O(e),l=-o.scrollTop;return"rtl"===P(r||n).direction&&(s+=h(n.clientWidth,r?r.clientWidth:0)-i),{width:i,height:a,x:s,y:l}}(w(e)))}function fe(e,t,n,o){var r="clippingParents"===t?function(e){var t=R(C(e)),n=["absolute","fixed"].indexOf(P(e).position)>=0&&d(e)?D(e):e;return u(n)?t.filter(function(e){return u(e)&&pe(e,n)&&"body"!==A(e)}):[]}(e):[].concat(t),i=[].concat(r,[n]),a=i[0],s=i.reduce(function(t,n){var r=de(e,n,o);return t.top=h(r.top,t.top),t.right=g(r.right,t.right),t.bottom=g(r.bottom,t.bottom),t.left=h(r.left,t.left),t},de(e,a,o));return s.width=s.right-s.left,s.height=s.bottom-s.top,s.x=s.left,s.y=s.top,s}function he(e){return Object.assign({},{top:0,right:0,bottom:0,left:0},e)}function ge(e,t){return t.reduce(function(t,n){return t[n]=e,t},{})}function me(e,t){void 0===t&&(t={});var n=t,o=n.placement,r=void 0===o?e.placement:o,i=n.strategy,a=void 0===i?e.strategy:i,s=n.boundary,l=void 0===s?"clippingParents":s,c=n.rootBoundary,p=void 0===c?F:c,d=n.elementContext,f=void 0===d?q:d,h=n.altBoundary,g=void 0!==h&&h,m=n.padding,v=void 0===m?0:m,b=he("number"!==typeof v?v:ge(v,V)),x=f===q?"reference":q,A=e.rects.popper,O=e.elements[g?x:f],P=fe(u(O)?O:O.contextElement||w(e.elements.popper),l,p,a),S=y(e.elements.reference),I=ne({reference:S,element:A,strategy:"absolute",placement:r}),k=ue(Object.assign({},A,I)),C=f===q?k:S,L={top:P.top-C.top+b.top,bottom:C.bottom-P.bottom+b.bottom,left:P.left-C.left+b.left,right:C.right-P.right+b.right},R=e.modifiersData.offset;if(f===q&&R){var T=R[r];Object.keys(L).forEach(function(e){var t=[W,j].indexOf(e)>=0?1:-1,n=[M,j].indexOf(e)>=0?"y":"x";L[e]+=T[n]*t})}return L}function ve(e,t,n){return h(e,g(t,n))}const be={name:"preventOverflow",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,o=e.name,r=n.mainAxis,i=void 0===r||r,a=n.altAxis,s=void 0!==a&&a,l=n.boundary,c=n.rootBoundary,p=n.altBoundary,u=n.padding,d=n.tether,f=void 0===d||d,m=n.tetherOffset,v=void 0===m?0:m,b=me(t,{boundary:l,rootBoundary:c,padding:u,altBoundary:p}),y=$(t.placement),x=ee(t.placement),A=!x,w=te(y),O="x"===w?"y":"x",P=t.modifiersData.popperOffsets,S=t.rects.reference,I=t.rects.popper,C="function"===typeof v?v(Object.assign({},t.rects,{placement:t.placement})):v,L="number"===typeof C?{mainAxis:C,altAxis:C}:Object.assign({mainAxis:0,altAxis:0},C),R=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,T={x:0,y:0};if(P){if(i){var E,H="y"===w?M:N,V="y"===w?j:W,z="y"===w?"height":"width",F=P[w],q=F+b[H],U=F-b[V],K=f?-I[z]/2:0,G=x===B?S[z]:I[z],_=x===B?-I[z]:-S[z],X=t.elements.arrow,Y=f&&X?k(X):{width:0,height:0},J=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},Q=J[H],Z=J[V],ne=ve(0,S[z],Y[z]),oe=A?S[z]/2-K-ne-Q-L.mainAxis:G-ne-Q-L.mainAxis,re=A?-S[z]/2+K+ne+Z+L.mainAxis:_+ne+Z+L.mainAxis,ie=t.elements.arrow&&D(t.elements.arrow),ae=ie?"y"===w?ie.clientTop||0:ie.clientLeft||0:0,se=null!=(E=null==R?void 0:R[w])?E:0,le=F+re-se,ce=ve(f?g(q,F+oe-se-ae):q,F,f?h(U,le):U);P[w]=ce,T[w]=ce-F}if(s){var pe,ue="x"===w?M:N,de="x"===w?j:W,fe=P[O],he="y"===O?"height":"width",ge=fe+b[ue],be=fe-b[de],ye=-1!==[M,N].indexOf(y),xe=null!=(pe=null==R?void 0:R[O])?pe:0,Ae=ye?ge:fe-S[he]-I[he]-xe+L.altAxis,we=ye?fe+S[he]+I[he]-xe-L.altAxis:be,Oe=f&&ye?function(e,t,n){var o=ve(e,t,n);return o>n?n:o}(Ae,fe,we):ve(f?Ae:ge,fe,f?we:be);P[O]=Oe,T[O]=Oe-fe}t.modifiersData[o]=T}},requiresIfExists:["offset"]};const ye={name:"arrow",enabled:!0,phase:"main",fn:function(e){var t,n=e.state,o=e.name,r=e.options,i=n.elements.arrow,a=n.modifiersData.popperOffsets,s=$(n.placement),l=te(s),c=[N,W].indexOf(s)>=0?"height":"width";if(i&&a){var p=function(e,t){return he("number"!==typeof(e="function"===typeof e?e(Object.assign({},t.rects,{placement:t.placement})):e)?e:ge(e,V))}(r.padding,n),u=k(i),d="y"===l?M:N,f="y"===l?j:W,h=n.rects.reference[c]+n.rects.reference[l]-a[l]-n.rects.popper[c],g=a[l]-n.rects.reference[l],m=D(i),v=m?"y"===l?m.clientHeight||0:m.clientWidth||0:0,b=h/2-g/2,y=p[d],x=v-u[c]-p[f],A=v/2-u[c]/2+b,w=ve(y,A,x),O=l;n.modifiersData[o]=((t={})[O]=w,t.centerOffset=w-A,t)}},effect:function(e){var t=e.state,n=e.options.element,o=void 0===n?"[data-popper-arrow]":n;null!=o&&("string"!==typeof o||(o=t.elements.popper.querySelector(o)))&&pe(t.elements.popper,o)&&(t.elements.arrow=o)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function xe(e,t,n){return void 0===n&&(n={x:0,y:0}),{top:e.top-t.height-n.y,right:e.right-t.width+n.x,bottom:e.bottom-t.height+n.y,left:e.left-t.width-n.x}}function Ae(e){return[M,W,j,N].some(function(t){return e[t]>=0})}var we=Q({defaultModifiers:[{name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(e){var t=e.state,n=e.instance,o=e.options,r=o.scroll,i=void 0===r||r,a=o.resize,s=void 0===a||a,l=p(t.elements.popper),c=[].concat(t.scrollParents.reference,t.scrollParents.popper);return i&&c.forEach(function(e){e.addEventListener("scroll",n.update,Z)}),s&&l.addEventListener("resize",n.update,Z),function(){i&&c.forEach(function(e){e.removeEventListener("scroll",n.update,Z)}),s&&l.removeEventListener("resize",n.update,Z)}},data:{}},{name:"popperOffsets",enabled:!0,phase:"read",fn:function(e){var t=e.state,n=e.name;t.modifiersData[n]=ne({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})},data:{}},{name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(e){var t=e.state,n=e.options,o=n.gpuAcceleration,r=void 0===o||o,i=n.adaptive,a=void 0===i||i,s=n.roundOffsets,l=void 0===s||s,c={placement:$(t.placement),variation:ee(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:r,isFixed:"fixed"===t.options.strategy};null!=t.modifiersData.popperOffsets&&(t.styles.popper=Object.assign({},t.styles.popper,re(Object.assign({},c,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:a,roundOffsets:l})))),null!=t.modifiersData.arrow&&(t.styles.arrow=Object.assign({},t.styles.arrow,re(Object.assign({},c,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})},data:{}},{name:"applyStyles",enabled:!0,phase:"write",fn:function(e){var t=e.state;Object.keys(t.elements).forEach(function(e){var n=t.styles[e]||{},o=t.attributes[e]||{},r=t.elements[e];d(r)&&A(r)&&(Object.assign(r.style,n),Object.keys(o).forEach(function(e){var t=o[e];!1===t?r.removeAttribute(e):r.setAttribute(e,!0===t?"":t)}))})},effect:function(e){var t=e.state,n={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,n.popper),t.styles=n,t.elements.arrow&&Object.assign(t.elements.arrow.style,n.arrow),function(){Object.keys(t.elements).forEach(function(e){var o=t.elements[e],r=t.attributes[e]||{},i=Object.keys(t.styles.hasOwnProperty(e)?t.styles[e]:n[e]).reduce(function(e,t){return e[t]="",e},{});d(o)&&A(o)&&(Object.assign(o.style,i),Object.keys(r).forEach(function(e){o.removeAttribute(e)}))})}},requires:["computeStyles"]},ie,{name:"flip",enabled:!0,phase:"main",fn:function(e){var t=e.state,n=e.options,o=e.name;if(!t.modifiersData[o]._skip){for(var r=n.mainAxis,i=void 0===r||r,a=n.altAxis,s=void 0===a||a,l=n.fallbackPlacements,c=n.padding,p=n.boundary,u=n.rootBoundary,d=n.altBoundary,f=n.flipVariations,h=void 0===f||f,g=n.allowedAutoPlacements,m=t.options.placement,v=$(m),b=l||(v===m||!h?[se(m)]:function(e){if($(e)===H)return[];var t=se(e);return[ce(e),t,ce(t)]}(m)),y=[m].concat(b).reduce(function(e,n){return e.concat($(n)===H?function(e,t){void 0===t&&(t={});var n=t,o=n.placement,r=n.boundary,i=n.rootBoundary,a=n.padding,s=n.flipVariations,l=n.allowedAutoPlacements,c=void 0===l?K:l,p=ee(o),u=p?s?U:U.filter(function(e){return ee(e)===p}):V,d=u.filter(function(e){return c.indexOf(e)>=0});0===d.length&&(d=u);var f=d.reduce(function(t,n){return t[n]=me(e,{placement:n,boundary:r,rootBoundary:i,padding:a})[$(n)],t},{});return Object.keys(f).sort(function(e,t){return f[e]-f[t]})}(t,{placement:n,boundary:p,rootBoundary:u,padding:c,flipVariations:h,allowedAutoPlacements:g}):n)},[]),x=t.rects.reference,A=t.rects.popper,w=new Map,O=!0,P=y[0],S=0;S<y.length;S++){var I=y[S],k=$(I),C=ee(I)===B,L=[M,j].indexOf(k)>=0,R=L?"width":"height",T=me(t,{placement:I,boundary:p,rootBoundary:u,altBoundary:d,padding:c}),E=L?C?W:N:C?j:M;x[R]>A[R]&&(E=se(E));var D=se(E),z=[];if(i&&z.push(T[k]<=0),s&&z.push(T[E]<=0,T[D]<=0),z.every(function(e){return e})){P=I,O=!1;break}w.set(I,z)}if(O)for(var F=function(e){var t=y.find(function(t){var n=w.get(t);if(n)return n.slice(0,e).every(function(e){return e})});if(t)return P=t,"break"},q=h?3:1;q>0;q--){if("break"===F(q))break}t.placement!==P&&(t.modifiersData[o]._skip=!0,t.placement=P,t.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}},be,ye,{name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(e){var t=e.state,n=e.name,o=t.rects.reference,r=t.rects.popper,i=t.modifiersData.preventOverflow,a=me(t,{elementContext:"reference"}),s=me(t,{altBoundary:!0}),l=xe(a,o),c=xe(s,r,i),p=Ae(l),u=Ae(c);t.modifiersData[n]={referenceClippingOffsets:l,popperEscapeOffsets:c,isReferenceHidden:p,hasPopperEscaped:u},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":p,"data-popper-escaped":u})}}]}),Oe=n(1807),Pe=n(7605),Se=n(3677),Ie=n(9857),ke=n(6061);function Ce(e){return(0,ke.Ay)("MuiPopper",e)}(0,Ie.A)("MuiPopper",["root"]);var Le=n(579);const Re=["anchorEl","children","direction","disablePortal","modifiers","open","placement","popperOptions","popperRef","slotProps","slots","TransitionProps","ownerState"],Te=["anchorEl","children","container","direction","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","style","transition","slotProps","slots"];function Ee(e){return"function"===typeof e?e():e}function De(e){return void 0!==e.nodeType}const Me={},je=a.forwardRef(function(e,t){var n;const{anchorEl:i,children:s,direction:p,disablePortal:u,modifiers:d,open:f,placement:h,popperOptions:g,popperRef:m,slotProps:v={},slots:b={},TransitionProps:y,ownerState:x}=e,A=(0,r.A)(e,Re),w=a.useRef(null),O=(0,c.A)(w,t),P=a.useRef(null),S=(0,c.A)(P,m),I=a.useRef(S);(0,l.A)(()=>{I.current=S},[S]),a.useImperativeHandle(m,()=>P.current,[]);const k=function(e,t){if("ltr"===t)return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}(h,p),[C,L]=a.useState(k),[R,T]=a.useState(Ee(i));a.useEffect(()=>{P.current&&P.current.forceUpdate()}),a.useEffect(()=>{i&&T(Ee(i))},[i]),(0,l.A)(()=>{if(!R||!f)return;let e=[{name:"preventOverflow",options:{altBoundary:u}},{name:"flip",options:{altBoundary:u}},{name:"onUpdate",enabled:!0,phase:"afterWrite",fn:e=>{let{state:t}=e;L(t.placement)}}];null!=d&&(e=e.concat(d)),g&&null!=g.modifiers&&(e=e.concat(g.modifiers));const t=we(R,w.current,(0,o.A)((0,o.A)({placement:k},g),{},{modifiers:e}));return I.current(t),()=>{t.destroy(),I.current(null)}},[R,u,d,f,g,k]);const E={placement:C};null!==y&&(E.TransitionProps=y);const D=(e=>{const{classes:t}=e;return(0,Oe.A)({root:["root"]},Ce,t)})(e),M=null!==(n=b.root)&&void 0!==n?n:"div",j=(0,Pe.A)({elementType:M,externalSlotProps:v.root,externalForwardedProps:A,additionalProps:{role:"tooltip",ref:O},ownerState:e,className:D.root});return(0,Le.jsx)(M,(0,o.A)((0,o.A)({},j),{},{children:"function"===typeof s?s(E):s}))}),We=a.forwardRef(function(e,t){const{anchorEl:n,children:i,container:l,direction:c="ltr",disablePortal:p=!1,keepMounted:u=!1,modifiers:d,open:f,placement:h="bottom",popperOptions:g=Me,popperRef:m,style:v,transition:b=!1,slotProps:y={},slots:x={}}=e,A=(0,r.A)(e,Te),[w,O]=a.useState(!0);if(!u&&!f&&(!b||w))return null;let P;if(l)P=l;else if(n){const e=Ee(n);P=e&&De(e)?(0,s.A)(e).body:(0,s.A)(null).body}const S=f||!u||b&&!w?void 0:"none",I=b?{in:f,onEnter:()=>{O(!1)},onExited:()=>{O(!0)}}:void 0;return(0,Le.jsx)(Se.A,{disablePortal:p,container:P,children:(0,Le.jsx)(je,(0,o.A)((0,o.A)({anchorEl:n,direction:c,disablePortal:p,modifiers:d,ref:t,open:b?!w:f,placement:h,popperOptions:g,popperRef:m,slotProps:y,slots:x},A),{},{style:(0,o.A)({position:"fixed",top:0,left:0,display:S},v),TransitionProps:I,children:i}))})});var Ne=n(8128),He=n(8301);const Ve=["anchorEl","component","components","componentsProps","container","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","transition","slots","slotProps"],Be=(0,Ne.Ay)(We,{name:"MuiPopper",slot:"Root"})({}),ze=a.forwardRef(function(e,t){var n;const a=(0,i.I)(),s=(0,He.b)({props:e,name:"MuiPopper"}),{anchorEl:l,component:c,components:p,componentsProps:u,container:d,disablePortal:f,keepMounted:h,modifiers:g,open:m,placement:v,popperOptions:b,popperRef:y,transition:x,slots:A,slotProps:w}=s,O=(0,r.A)(s,Ve),P=null!==(n=null===A||void 0===A?void 0:A.root)&&void 0!==n?n:null===p||void 0===p?void 0:p.Root,S=(0,o.A)({anchorEl:l,container:d,disablePortal:f,keepMounted:h,modifiers:g,open:m,placement:v,popperOptions:b,popperRef:y,transition:x},O);return(0,Le.jsx)(Be,(0,o.A)((0,o.A)({as:c,direction:a?"rtl":"ltr",slots:{root:P},slotProps:null!==w&&void 0!==w?w:u},S),{},{ref:t}))})}}]);
-//# sourceMappingURL=361.6f176300.chunk.js.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[465],{6465:(e,t,a)=>{a.d(t,{A:()=>V});var o=a(9379),r=a(45),n=a(5043),s=a(8387),i=a(1807),l=a(9857),c=a(6061);function d(e){return(0,c.Ay)("MuiPagination",e)}(0,l.A)("MuiPagination",["root","ul","outlined","text"]);var p=a(7145);const u=["boundaryCount","componentName","count","defaultPage","disabled","hideNextButton","hidePrevButton","onChange","page","showFirstButton","showLastButton","siblingCount"];var v=a(2432);function g(e){return(0,c.Ay)("MuiPaginationItem",e)}const m=(0,l.A)("MuiPaginationItem",["root","page","sizeSmall","sizeLarge","text","textPrimary","textSecondary","outlined","outlinedPrimary","outlinedSecondary","rounded","ellipsis","firstLast","previousNext","focusVisible","disabled","selected","icon","colorPrimary","colorSecondary"]);var h=a(9699),b=a(7194),y=a(4412),x=a(8735),A=a(9155),f=a(9992),C=a(579);const P=(0,f.A)((0,C.jsx)("path",{d:"M15.41 7.41L14 6l-6 6 6 6 1.41-1.41L10.83 12z"}),"NavigateBefore"),z=(0,f.A)((0,C.jsx)("path",{d:"M10 6L8.59 7.41 13.17 12l-4.58 4.59L10 18l6-6z"}),"NavigateNext");var w=a(9905),k=a(8128),N=a(1612),B=a(8301);const M=["className","color","component","components","disabled","page","selected","shape","size","slots","slotProps","type","variant"],L=(e,t)=>{const{ownerState:a}=e;return[t.root,t[a.variant],t["size".concat((0,b.A)(a.size))],"text"===a.variant&&t["text".concat((0,b.A)(a.color))],"outlined"===a.variant&&t["outlined".concat((0,b.A)(a.color))],"rounded"===a.shape&&t.rounded,"page"===a.type&&t.page,("start-ellipsis"===a.type||"end-ellipsis"===a.type)&&t.ellipsis,("previous"===a.type||"next"===a.type)&&t.previousNext,("first"===a.type||"last"===a.type)&&t.firstLast]},S=(0,k.Ay)("div",{name:"MuiPaginationItem",slot:"Root",overridesResolver:L})((0,N.A)(e=>{let{theme:t}=e;return(0,o.A)((0,o.A)({},t.typography.body2),{},{borderRadius:16,textAlign:"center",boxSizing:"border-box",minWidth:32,padding:"0 6px",margin:"0 3px",color:(t.vars||t).palette.text.primary,height:"auto",["&.".concat(m.disabled)]:{opacity:(t.vars||t).palette.action.disabledOpacity},variants:[{props:{size:"small"},style:{minWidth:26,borderRadius:13,margin:"0 1px",padding:"0 4px"}},{props:{size:"large"},style:{minWidth:40,borderRadius:20,padding:"0 10px",fontSize:t.typography.pxToRem(15)}}]})})),R=(0,k.Ay)(h.A,{name:"MuiPaginationItem",slot:"Root",overridesResolver:L})((0,N.A)(e=>{let{theme:t}=e;return(0,o.A)((0,o.A)({},t.typography.body2),{},{borderRadius:16,textAlign:"center",boxSizing:"border-box",minWidth:32,height:32,padding:"0 6px",margin:"0 3px",color:(t.vars||t).palette.text.primary,["&.".concat(m.focusVisible)]:{backgroundColor:(t.vars||t).palette.action.focus},["&.".concat(m.disabled)]:{opacity:(t.vars||t).palette.action.disabledOpacity},transition:t.transitions.create(["color","background-color"],{duration:t.transitions.duration.short}),"&:hover":{backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(m.selected)]:{backgroundColor:(t.vars||t).palette.action.selected,"&:hover":{backgroundColor:t.alpha((t.vars||t).palette.action.selected,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.hoverOpacity)),"@media (hover: none)":{backgroundColor:(t.vars||t).palette.action.selected}},["&.".concat(m.focusVisible)]:{backgroundColor:t.alpha((t.vars||t).palette.action.selected,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.focusOpacity))},["&.".concat(m.disabled)]:{opacity:1,color:(t.vars||t).palette.action.disabled,backgroundColor:(t.vars||t).palette.action.selected}},variants:[{props:{size:"small"},style:{minWidth:26,height:26,borderRadius:13,margin:"0 1px",padding:"0 4px"}},{props:{size:"large"},style:{minWidth:40,height:40,borderRadius:20,padding:"0 10px",fontSize:t.typography.pxToRem(15)}},{props:{shape:"rounded"},style:{borderRadius:(t.vars||t).shape.borderRadius}},{props:{variant:"outlined"},style:{border:t.vars?"1px solid ".concat(t.alpha(t.vars.palette.common.onBackground,.23)):"1px solid ".concat("light"===t.palette.mode?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)"),["&.".concat(m.selected)]:{["&.".concat(m.disabled)]:{borderColor:(t.vars||t).palette.action.disabledBackground,color:(t.vars||t).palette.action.disabled}}}},{props:{variant:"text"},style:{["&.".concat(m.selected)]:{["&.".concat(m.disabled)]:{color:(t.vars||t).palette.action.disabled}}}},...Object.entries(t.palette).filter((0,y.A)(["dark","contrastText"])).map(e=>{let[a]=e;return{props:{variant:"text",color:a},style:{["&.".concat(m.selected)]:{color:(t.vars||t).palette[a].contrastText,backgroundColor:(t.vars||t).palette[a].main,"&:hover":{backgroundColor:(t.vars||t).palette[a].dark,"@media (hover: none)":{backgroundColor:(t.vars||t).palette[a].main}},["&.".concat(m.focusVisible)]:{backgroundColor:(t.vars||t).palette[a].dark},["&.".concat(m.disabled)]:{color:(t.vars||t).palette.action.disabled}}}}}),...Object.entries(t.palette).filter((0,y.A)(["light"])).map(e=>{let[a]=e;return{props:{variant:"outlined",color:a},style:{["&.".concat(m.selected)]:{color:(t.vars||t).palette[a].main,border:"1px solid ".concat(t.alpha((t.vars||t).palette[a].main,.5)),backgroundColor:t.alpha((t.vars||t).palette[a].main,(t.vars||t).palette.action.activatedOpacity),"&:hover":{backgroundColor:t.alpha((t.vars||t).palette[a].main,"".concat((t.vars||t).palette.action.activatedOpacity," + ").concat((t.vars||t).palette.action.focusOpacity)),"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(m.focusVisible)]:{backgroundColor:t.alpha((t.vars||t).palette[a].main,"".concat((t.vars||t).palette.action.activatedOpacity," + ").concat((t.vars||t).palette.action.focusOpacity))}}}}})]})})),I=(0,k.Ay)("div",{name:"MuiPaginationItem",slot:"Icon"})((0,N.A)(e=>{let{theme:t}=e;return{fontSize:t.typography.pxToRem(20),margin:"0 -8px",variants:[{props:{size:"small"},style:{fontSize:t.typography.pxToRem(18)}},{props:{size:"large"},style:{fontSize:t.typography.pxToRem(22)}}]}})),j=n.forwardRef(function(e,t){var a,n,l,c;const d=(0,B.b)({props:e,name:"MuiPaginationItem"}),{className:p,color:u="standard",component:m,components:h={},disabled:y=!1,page:f,selected:k=!1,shape:N="circular",size:L="medium",slots:j={},slotProps:O={},type:T="page",variant:F="text"}=d,W=(0,r.A)(d,M),V=(0,o.A)((0,o.A)({},d),{},{color:u,disabled:y,selected:k,shape:N,size:L,type:T,variant:F}),G=(0,v.I)(),H=(e=>{const{classes:t,color:a,disabled:o,selected:r,size:n,shape:s,type:l,variant:c}=e,d={root:["root","size".concat((0,b.A)(n)),c,s,"standard"!==a&&"color".concat((0,b.A)(a)),"standard"!==a&&"".concat(c).concat((0,b.A)(a)),o&&"disabled",r&&"selected",{page:"page",first:"firstLast",last:"firstLast","start-ellipsis":"ellipsis","end-ellipsis":"ellipsis",previous:"previousNext",next:"previousNext"}[l]],icon:["icon"]};return(0,i.A)(d,g,t)})(V),U={slots:{previous:null!==(a=j.previous)&&void 0!==a?a:h.previous,next:null!==(n=j.next)&&void 0!==n?n:h.next,first:null!==(l=j.first)&&void 0!==l?l:h.first,last:null!==(c=j.last)&&void 0!==c?c:h.last},slotProps:O},[q,D]=(0,w.A)("previous",{elementType:P,externalForwardedProps:U,ownerState:V}),[E,J]=(0,w.A)("next",{elementType:z,externalForwardedProps:U,ownerState:V}),[K,Q]=(0,w.A)("first",{elementType:x.A,externalForwardedProps:U,ownerState:V}),[X,Y]=(0,w.A)("last",{elementType:A.A,externalForwardedProps:U,ownerState:V}),Z=G?{previous:"next",next:"previous",first:"last",last:"first"}[T]:T,$={previous:q,next:E,first:K,last:X}[Z],_={previous:D,next:J,first:Q,last:Y}[Z];return"start-ellipsis"===T||"end-ellipsis"===T?(0,C.jsx)(S,{ref:t,ownerState:V,className:(0,s.A)(H.root,p),children:"\u2026"}):(0,C.jsxs)(R,(0,o.A)((0,o.A)({ref:t,ownerState:V,component:m,disabled:y,className:(0,s.A)(H.root,p)},W),{},{children:["page"===T&&f,$?(0,C.jsx)(I,(0,o.A)((0,o.A)({},_),{},{className:H.icon,as:$})):null]}))}),O=["boundaryCount","className","color","count","defaultPage","disabled","getItemAriaLabel","hideNextButton","hidePrevButton","onChange","page","renderItem","shape","showFirstButton","showLastButton","siblingCount","size","variant"],T=(0,k.Ay)("nav",{name:"MuiPagination",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:a}=e;return[t.root,t[a.variant]]}})({}),F=(0,k.Ay)("ul",{name:"MuiPagination",slot:"Ul"})({display:"flex",flexWrap:"wrap",alignItems:"center",padding:0,margin:0,listStyle:"none"});function W(e,t,a){return"page"===e?"".concat(a?"":"Go to ","page ").concat(t):"Go to ".concat(e," page")}const V=n.forwardRef(function(e,t){const a=(0,B.b)({props:e,name:"MuiPagination"}),{boundaryCount:n=1,className:l,color:c="standard",count:v=1,defaultPage:g=1,disabled:m=!1,getItemAriaLabel:h=W,hideNextButton:b=!1,hidePrevButton:y=!1,onChange:x,page:A,renderItem:f=e=>(0,C.jsx)(j,(0,o.A)({},e)),shape:P="circular",showFirstButton:z=!1,showLastButton:w=!1,siblingCount:k=1,size:N="medium",variant:M="text"}=a,L=(0,r.A)(a,O),{items:S}=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{boundaryCount:t=1,componentName:a="usePagination",count:n=1,defaultPage:s=1,disabled:i=!1,hideNextButton:l=!1,hidePrevButton:c=!1,onChange:d,page:v,showFirstButton:g=!1,showLastButton:m=!1,siblingCount:h=1}=e,b=(0,r.A)(e,u),[y,x]=(0,p.A)({controlled:v,default:s,name:a,state:"page"}),A=(e,t)=>{v||x(t),d&&d(e,t)},f=(e,t)=>{const a=t-e+1;return Array.from({length:a},(t,a)=>e+a)},C=f(1,Math.min(t,n)),P=f(Math.max(n-t+1,t+1),n),z=Math.max(Math.min(y-h,n-t-2*h-1),t+2),w=Math.min(Math.max(y+h,t+2*h+2),n-t-1),k=[...g?["first"]:[],...c?[]:["previous"],...C,...z>t+2?["start-ellipsis"]:t+1<n-t?[t+1]:[],...f(z,w),...w<n-t-1?["end-ellipsis"]:n-t>t?[n-t]:[],...P,...l?[]:["next"],...m?["last"]:[]],N=e=>{switch(e){case"first":return 1;case"previous":return y-1;case"next":return y+1;case"last":return n;default:return null}},B=k.map(e=>"number"===typeof e?{onClick:t=>{A(t,e)},type:"page",page:e,selected:e===y,disabled:i,"aria-current":e===y?"page":void 0}:{onClick:t=>{A(t,N(e))},type:e,page:N(e),selected:!1,disabled:i||!e.includes("ellipsis")&&("next"===e||"last"===e?y>=n:y<=1)});return(0,o.A)({items:B},b)}((0,o.A)((0,o.A)({},a),{},{componentName:"Pagination"})),R=(0,o.A)((0,o.A)({},a),{},{boundaryCount:n,color:c,count:v,defaultPage:g,disabled:m,getItemAriaLabel:h,hideNextButton:b,hidePrevButton:y,renderItem:f,shape:P,showFirstButton:z,showLastButton:w,siblingCount:k,size:N,variant:M}),I=(e=>{const{classes:t,variant:a}=e,o={root:["root",a],ul:["ul"]};return(0,i.A)(o,d,t)})(R);return(0,C.jsx)(T,(0,o.A)((0,o.A)({"aria-label":"pagination navigation",className:(0,s.A)(I.root,l),ownerState:R,ref:t},L),{},{children:(0,C.jsx)(F,{className:I.ul,ownerState:R,children:S.map((e,t)=>(0,C.jsx)("li",{children:f((0,o.A)((0,o.A)({},e),{},{color:c,"aria-label":h(e.type,e.page,e.selected),shape:P,size:N,variant:M}))},t))})}))})},8735:(e,t,a)=>{a.d(t,{A:()=>n});a(5043);var o=a(9992),r=a(579);const n=(0,o.A)((0,r.jsx)("path",{d:"M18.41 16.59L13.82 12l4.59-4.59L17 6l-6 6 6 6zM6 6h2v12H6z"}),"FirstPage")},9155:(e,t,a)=>{a.d(t,{A:()=>n});a(5043);var o=a(9992),r=a(579);const n=(0,o.A)((0,r.jsx)("path",{d:"M5.59 7.41L10.18 12l-4.59 4.59L7 18l6-6-6-6zM16 6h2v12h-2z"}),"LastPage")}}]);
-//# sourceMappingURL=465.38cd14e5.chunk.js.map
\ No newline at end of file
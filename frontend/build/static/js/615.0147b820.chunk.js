@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[615],{256:(t,e,o)=>{o.d(e,{A:()=>A});var r=o(9379),a=o(45),n=o(5043),i=o(8387),s=o(1807),l=o(8128),d=o(8301),c=o(1811),p=o(7194),u=o(3319),f=o(8736),m=o(9857),y=o(6061);function v(t){return(0,y.Ay)("MuiFormControl",t)}(0,m.A)("MuiFormControl",["root","marginNone","marginNormal","marginDense","fullWidth","disabled"]);var h=o(579);const g=["children","className","color","component","disabled","error","focused","fullWidth","hiddenLabel","margin","required","size","variant"],b=(0,l.Ay)("div",{name:"MuiFormControl",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,e["margin".concat((0,p.A)(o.margin))],o.fullWidth&&e.fullWidth]}})({display:"inline-flex",flexDirection:"column",position:"relative",minWidth:0,padding:0,margin:0,border:0,verticalAlign:"top",variants:[{props:{margin:"normal"},style:{marginTop:16,marginBottom:8}},{props:{margin:"dense"},style:{marginTop:8,marginBottom:4}},{props:{fullWidth:!0},style:{width:"100%"}}]}),A=n.forwardRef(function(t,e){const o=(0,d.b)({props:t,name:"MuiFormControl"}),{children:l,className:m,color:y="primary",component:A="div",disabled:x=!1,error:w=!1,focused:_,fullWidth:S=!1,hiddenLabel:T=!1,margin:k="none",required:I=!1,size:P="medium",variant:C="outlined"}=o,R=(0,a.A)(o,g),z=(0,r.A)((0,r.A)({},o),{},{color:y,component:A,disabled:x,error:w,fullWidth:S,hiddenLabel:T,margin:k,required:I,size:P,variant:C}),E=(t=>{const{classes:e,margin:o,fullWidth:r}=t,a={root:["root","none"!==o&&"margin".concat((0,p.A)(o)),r&&"fullWidth"]};return(0,s.A)(a,v,e)})(z),[M,F]=n.useState(()=>{let t=!1;return l&&n.Children.forEach(l,e=>{if(!(0,u.A)(e,["Input","Select"]))return;const o=(0,u.A)(e,["Select"])?e.props.input:e;o&&(0,c.gr)(o.props)&&(t=!0)}),t}),[O,L]=n.useState(()=>{let t=!1;return l&&n.Children.forEach(l,e=>{(0,u.A)(e,["Input","Select"])&&((0,c.lq)(e.props,!0)||(0,c.lq)(e.props.inputProps,!0))&&(t=!0)}),t}),[W,N]=n.useState(!1);x&&W&&N(!1);const B=void 0===_||x?W:_;let j;n.useRef(!1);const D=n.useCallback(()=>{L(!0)},[]),q=n.useCallback(()=>{L(!1)},[]),H=n.useMemo(()=>({adornedStart:M,setAdornedStart:F,color:y,disabled:x,error:w,filled:O,focused:B,fullWidth:S,hiddenLabel:T,size:P,onBlur:()=>{N(!1)},onFocus:()=>{N(!0)},onEmpty:q,onFilled:D,registerEffect:j,required:I,variant:C}),[M,y,x,w,O,B,S,T,j,q,D,I,P,C]);return(0,h.jsx)(f.A.Provider,{value:H,children:(0,h.jsx)(b,(0,r.A)((0,r.A)({as:A,ownerState:z,className:(0,i.A)(E.root,m),ref:e},R),{},{children:l}))})})},1168:(t,e,o)=>{o.d(e,{A:()=>r});const r=o(7449).A},2097:(t,e,o)=>{o.d(e,{A:()=>E});var r=o(45),a=o(9379),n=o(5043),i=o(8387),s=o(4599),l=o(1807),d=o(6572),c=o(2466),p=o(8128),u=o(1612),f=o(8301),m=o(9699),y=o(172),v=o(7194),h=o(4412),g=o(9857),b=o(6061);function A(t){return(0,b.Ay)("MuiButton",t)}const x=(0,g.A)("MuiButton",["root","text","textInherit","textPrimary","textSecondary","textSuccess","textError","textInfo","textWarning","outlined","outlinedInherit","outlinedPrimary","outlinedSecondary","outlinedSuccess","outlinedError","outlinedInfo","outlinedWarning","contained","containedInherit","containedPrimary","containedSecondary","containedSuccess","containedError","containedInfo","containedWarning","disableElevation","focusVisible","disabled","colorInherit","colorPrimary","colorSecondary","colorSuccess","colorError","colorInfo","colorWarning","textSizeSmall","textSizeMedium","textSizeLarge","outlinedSizeSmall","outlinedSizeMedium","outlinedSizeLarge","containedSizeSmall","containedSizeMedium","containedSizeLarge","sizeMedium","sizeSmall","sizeLarge","fullWidth","startIcon","endIcon","icon","iconSizeSmall","iconSizeMedium","iconSizeLarge","loading","loadingWrapper","loadingIconPlaceholder","loadingIndicator","loadingPositionCenter","loadingPositionStart","loadingPositionEnd"]);const w=n.createContext({});const _=n.createContext(void 0);var S=o(579);const T=["children","color","component","className","disabled","disableElevation","disableFocusRipple","endIcon","focusVisibleClassName","fullWidth","id","loading","loadingIndicator","loadingPosition","size","startIcon","type","variant"],k=[{props:{size:"small"},style:{"& > *:nth-of-type(1)":{fontSize:18}}},{props:{size:"medium"},style:{"& > *:nth-of-type(1)":{fontSize:20}}},{props:{size:"large"},style:{"& > *:nth-of-type(1)":{fontSize:22}}}],I=(0,p.Ay)(m.A,{shouldForwardProp:t=>(0,c.A)(t)||"classes"===t,name:"MuiButton",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,e[o.variant],e["".concat(o.variant).concat((0,v.A)(o.color))],e["size".concat((0,v.A)(o.size))],e["".concat(o.variant,"Size").concat((0,v.A)(o.size))],"inherit"===o.color&&e.colorInherit,o.disableElevation&&e.disableElevation,o.fullWidth&&e.fullWidth,o.loading&&e.loading]}})((0,u.A)(t=>{let{theme:e}=t;const o="light"===e.palette.mode?e.palette.grey[300]:e.palette.grey[800],r="light"===e.palette.mode?e.palette.grey.A100:e.palette.grey[700];return(0,a.A)((0,a.A)({},e.typography.button),{},{minWidth:64,padding:"6px 16px",border:0,borderRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create(["background-color","box-shadow","border-color","color"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none"},["&.".concat(x.disabled)]:{color:(e.vars||e).palette.action.disabled},variants:[{props:{variant:"contained"},style:{color:"var(--variant-containedColor)",backgroundColor:"var(--variant-containedBg)",boxShadow:(e.vars||e).shadows[2],"&:hover":{boxShadow:(e.vars||e).shadows[4],"@media (hover: none)":{boxShadow:(e.vars||e).shadows[2]}},"&:active":{boxShadow:(e.vars||e).shadows[8]},["&.".concat(x.focusVisible)]:{boxShadow:(e.vars||e).shadows[6]},["&.".concat(x.disabled)]:{color:(e.vars||e).palette.action.disabled,boxShadow:(e.vars||e).shadows[0],backgroundColor:(e.vars||e).palette.action.disabledBackground}}},{props:{variant:"outlined"},style:{padding:"5px 15px",border:"1px solid currentColor",borderColor:"var(--variant-outlinedBorder, currentColor)",backgroundColor:"var(--variant-outlinedBg)",color:"var(--variant-outlinedColor)",["&.".concat(x.disabled)]:{border:"1px solid ".concat((e.vars||e).palette.action.disabledBackground)}}},{props:{variant:"text"},style:{padding:"6px 8px",color:"var(--variant-textColor)",backgroundColor:"var(--variant-textBg)"}},...Object.entries(e.palette).filter((0,h.A)()).map(t=>{let[o]=t;return{props:{color:o},style:{"--variant-textColor":(e.vars||e).palette[o].main,"--variant-outlinedColor":(e.vars||e).palette[o].main,"--variant-outlinedBorder":e.alpha((e.vars||e).palette[o].main,.5),"--variant-containedColor":(e.vars||e).palette[o].contrastText,"--variant-containedBg":(e.vars||e).palette[o].main,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":(e.vars||e).palette[o].dark,"--variant-textBg":e.alpha((e.vars||e).palette[o].main,(e.vars||e).palette.action.hoverOpacity),"--variant-outlinedBorder":(e.vars||e).palette[o].main,"--variant-outlinedBg":e.alpha((e.vars||e).palette[o].main,(e.vars||e).palette.action.hoverOpacity)}}}}}),{props:{color:"inherit"},style:{color:"inherit",borderColor:"currentColor","--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedBg:o,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedHoverBg:r,"--variant-textBg":e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.hoverOpacity),"--variant-outlinedBg":e.alpha((e.vars||e).palette.text.primary,(e.vars||e).palette.action.hoverOpacity)}}}},{props:{size:"small",variant:"text"},style:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"text"},style:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"outlined"},style:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"outlined"},style:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"contained"},style:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"contained"},style:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)}},{props:{disableElevation:!0},style:{boxShadow:"none","&:hover":{boxShadow:"none"},["&.".concat(x.focusVisible)]:{boxShadow:"none"},"&:active":{boxShadow:"none"},["&.".concat(x.disabled)]:{boxShadow:"none"}}},{props:{fullWidth:!0},style:{width:"100%"}},{props:{loadingPosition:"center"},style:{transition:e.transitions.create(["background-color","box-shadow","border-color"],{duration:e.transitions.duration.short}),["&.".concat(x.loading)]:{color:"transparent"}}}]})})),P=(0,p.Ay)("span",{name:"MuiButton",slot:"StartIcon",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.startIcon,o.loading&&e.startIconLoadingStart,e["iconSize".concat((0,v.A)(o.size))]]}})(t=>{let{theme:e}=t;return{display:"inherit",marginRight:8,marginLeft:-4,variants:[{props:{size:"small"},style:{marginLeft:-2}},{props:{loadingPosition:"start",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"start",loading:!0,fullWidth:!0},style:{marginRight:-8}},...k]}}),C=(0,p.Ay)("span",{name:"MuiButton",slot:"EndIcon",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.endIcon,o.loading&&e.endIconLoadingEnd,e["iconSize".concat((0,v.A)(o.size))]]}})(t=>{let{theme:e}=t;return{display:"inherit",marginRight:-4,marginLeft:8,variants:[{props:{size:"small"},style:{marginRight:-2}},{props:{loadingPosition:"end",loading:!0},style:{transition:e.transitions.create(["opacity"],{duration:e.transitions.duration.short}),opacity:0}},{props:{loadingPosition:"end",loading:!0,fullWidth:!0},style:{marginLeft:-8}},...k]}}),R=(0,p.Ay)("span",{name:"MuiButton",slot:"LoadingIndicator"})(t=>{let{theme:e}=t;return{display:"none",position:"absolute",visibility:"visible",variants:[{props:{loading:!0},style:{display:"flex"}},{props:{loadingPosition:"start"},style:{left:14}},{props:{loadingPosition:"start",size:"small"},style:{left:10}},{props:{variant:"text",loadingPosition:"start"},style:{left:6}},{props:{loadingPosition:"center"},style:{left:"50%",transform:"translate(-50%)",color:(e.vars||e).palette.action.disabled}},{props:{loadingPosition:"end"},style:{right:14}},{props:{loadingPosition:"end",size:"small"},style:{right:10}},{props:{variant:"text",loadingPosition:"end"},style:{right:6}},{props:{loadingPosition:"start",fullWidth:!0},style:{position:"relative",left:-10}},{props:{loadingPosition:"end",fullWidth:!0},style:{position:"relative",right:-10}}]}}),z=(0,p.Ay)("span",{name:"MuiButton",slot:"LoadingIconPlaceholder"})({display:"inline-block",width:"1em",height:"1em"}),E=n.forwardRef(function(t,e){const o=n.useContext(w),c=n.useContext(_),p=(0,s.A)(o,t),u=(0,f.b)({props:p,name:"MuiButton"}),{children:m,color:h="primary",component:g="button",className:b,disabled:x=!1,disableElevation:k=!1,disableFocusRipple:E=!1,endIcon:M,focusVisibleClassName:F,fullWidth:O=!1,id:L,loading:W=null,loadingIndicator:N,loadingPosition:B="center",size:j="medium",startIcon:D,type:q,variant:H="text"}=u,V=(0,r.A)(u,T),U=(0,d.A)(L),K=null!==N&&void 0!==N?N:(0,S.jsx)(y.A,{"aria-labelledby":U,color:"inherit",size:16}),X=(0,a.A)((0,a.A)({},u),{},{color:h,component:g,disabled:x,disableElevation:k,disableFocusRipple:E,fullWidth:O,loading:W,loadingIndicator:K,loadingPosition:B,size:j,type:q,variant:H}),G=(t=>{const{color:e,disableElevation:o,fullWidth:r,size:n,variant:i,loading:s,loadingPosition:d,classes:c}=t,p={root:["root",s&&"loading",i,"".concat(i).concat((0,v.A)(e)),"size".concat((0,v.A)(n)),"".concat(i,"Size").concat((0,v.A)(n)),"color".concat((0,v.A)(e)),o&&"disableElevation",r&&"fullWidth",s&&"loadingPosition".concat((0,v.A)(d))],startIcon:["icon","startIcon","iconSize".concat((0,v.A)(n))],endIcon:["icon","endIcon","iconSize".concat((0,v.A)(n))],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]},u=(0,l.A)(p,A,c);return(0,a.A)((0,a.A)({},c),u)})(X),Q=(D||W&&"start"===B)&&(0,S.jsx)(P,{className:G.startIcon,ownerState:X,children:D||(0,S.jsx)(z,{className:G.loadingIconPlaceholder,ownerState:X})}),Y=(M||W&&"end"===B)&&(0,S.jsx)(C,{className:G.endIcon,ownerState:X,children:M||(0,S.jsx)(z,{className:G.loadingIconPlaceholder,ownerState:X})}),Z=c||"",J="boolean"===typeof W?(0,S.jsx)("span",{className:G.loadingWrapper,style:{display:"contents"},children:W&&(0,S.jsx)(R,{className:G.loadingIndicator,ownerState:X,children:K})}):null;return(0,S.jsxs)(I,(0,a.A)((0,a.A)({ownerState:X,className:(0,i.A)(o.className,G.root,b,Z),component:g,disabled:x||W,focusRipple:!E,focusVisibleClassName:(0,i.A)(G.focusVisible,F),ref:e,type:q,id:W?U:L},V),{},{classes:G,children:[Q,"end"!==B&&J,m,"end"===B&&J,Y]}))})},2447:(t,e,o)=>{o.d(e,{A:()=>r});const r=o(7145).A},2485:(t,e,o)=>{o.d(e,{A:()=>I});var r=o(45),a=o(9379),n=o(5043),i=o(1807),s=o(2466),l=o(8128),d=o(1612),c=o(579);const p=["children","classes","className","label","notched"];var u;const f=(0,l.Ay)("fieldset",{name:"MuiNotchedOutlined",shouldForwardProp:s.A})({textAlign:"left",position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden",minWidth:"0%"}),m=(0,l.Ay)("legend",{name:"MuiNotchedOutlined",shouldForwardProp:s.A})((0,d.A)(t=>{let{theme:e}=t;return{float:"unset",width:"auto",overflow:"hidden",variants:[{props:t=>{let{ownerState:e}=t;return!e.withLabel},style:{padding:0,lineHeight:"11px",transition:e.transitions.create("width",{duration:150,easing:e.transitions.easing.easeOut})}},{props:t=>{let{ownerState:e}=t;return e.withLabel},style:{display:"block",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:e.transitions.create("max-width",{duration:50,easing:e.transitions.easing.easeOut}),whiteSpace:"nowrap","& > span":{paddingLeft:5,paddingRight:5,display:"inline-block",opacity:0,visibility:"visible"}}},{props:t=>{let{ownerState:e}=t;return e.withLabel&&e.notched},style:{maxWidth:"100%",transition:e.transitions.create("max-width",{duration:100,easing:e.transitions.easing.easeOut,delay:50})}}]}}));var y=o(8700),v=o(7566),h=o(4412),g=o(8301),b=o(4807),A=o(3209),x=o(9905);const w=["components","fullWidth","inputComponent","label","multiline","notched","slots","slotProps","type"],_=(0,l.Ay)(A.Sh,{shouldForwardProp:t=>(0,s.A)(t)||"classes"===t,name:"MuiOutlinedInput",slot:"Root",overridesResolver:A.WC})((0,d.A)(t=>{let{theme:e}=t;const o="light"===e.palette.mode?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{position:"relative",borderRadius:(e.vars||e).shape.borderRadius,["&:hover .".concat(b.A.notchedOutline)]:{borderColor:(e.vars||e).palette.text.primary},"@media (hover: none)":{["&:hover .".concat(b.A.notchedOutline)]:{borderColor:e.vars?e.alpha(e.vars.palette.common.onBackground,.23):o}},["&.".concat(b.A.focused," .").concat(b.A.notchedOutline)]:{borderWidth:2},variants:[...Object.entries(e.palette).filter((0,h.A)()).map(t=>{let[o]=t;return{props:{color:o},style:{["&.".concat(b.A.focused," .").concat(b.A.notchedOutline)]:{borderColor:(e.vars||e).palette[o].main}}}}),{props:{},style:{["&.".concat(b.A.error," .").concat(b.A.notchedOutline)]:{borderColor:(e.vars||e).palette.error.main},["&.".concat(b.A.disabled," .").concat(b.A.notchedOutline)]:{borderColor:(e.vars||e).palette.action.disabled}}},{props:t=>{let{ownerState:e}=t;return e.startAdornment},style:{paddingLeft:14}},{props:t=>{let{ownerState:e}=t;return e.endAdornment},style:{paddingRight:14}},{props:t=>{let{ownerState:e}=t;return e.multiline},style:{padding:"16.5px 14px"}},{props:t=>{let{ownerState:e,size:o}=t;return e.multiline&&"small"===o},style:{padding:"8.5px 14px"}}]}})),S=(0,l.Ay)(function(t){const{children:e,classes:o,className:n,label:i,notched:s}=t,l=(0,r.A)(t,p),d=null!=i&&""!==i,y=(0,a.A)((0,a.A)({},t),{},{notched:s,withLabel:d});return(0,c.jsx)(f,(0,a.A)((0,a.A)({"aria-hidden":!0,className:n,ownerState:y},l),{},{children:(0,c.jsx)(m,{ownerState:y,children:d?(0,c.jsx)("span",{children:i}):u||(u=(0,c.jsx)("span",{className:"notranslate","aria-hidden":!0,children:"\u200b"}))})}))},{name:"MuiOutlinedInput",slot:"NotchedOutline"})((0,d.A)(t=>{let{theme:e}=t;const o="light"===e.palette.mode?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{borderColor:e.vars?e.alpha(e.vars.palette.common.onBackground,.23):o}})),T=(0,l.Ay)(A.ck,{name:"MuiOutlinedInput",slot:"Input",overridesResolver:A.Oj})((0,d.A)(t=>{let{theme:e}=t;return(0,a.A)((0,a.A)((0,a.A)({padding:"16.5px 14px"},!e.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.mode?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.mode?null:"#fff",caretColor:"light"===e.palette.mode?null:"#fff",borderRadius:"inherit"}}),e.vars&&{"&:-webkit-autofill":{borderRadius:"inherit"},[e.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}}),{},{variants:[{props:{size:"small"},style:{padding:"8.5px 14px"}},{props:t=>{let{ownerState:e}=t;return e.multiline},style:{padding:0}},{props:t=>{let{ownerState:e}=t;return e.startAdornment},style:{paddingLeft:0}},{props:t=>{let{ownerState:e}=t;return e.endAdornment},style:{paddingRight:0}}]})})),k=n.forwardRef(function(t,e){var o,s,l,d;const p=(0,g.b)({props:t,name:"MuiOutlinedInput"}),{components:u={},fullWidth:f=!1,inputComponent:m="input",label:h,multiline:k=!1,notched:I,slots:P={},slotProps:C={},type:R="text"}=p,z=(0,r.A)(p,w),E=(t=>{const{classes:e}=t,o=(0,i.A)({root:["root"],notchedOutline:["notchedOutline"],input:["input"]},b.v,e);return(0,a.A)((0,a.A)({},e),o)})(p),M=(0,y.A)(),F=(0,v.A)({props:p,muiFormControl:M,states:["color","disabled","error","focused","hiddenLabel","size","required"]}),O=(0,a.A)((0,a.A)({},p),{},{color:F.color||"primary",disabled:F.disabled,error:F.error,focused:F.focused,formControl:M,fullWidth:f,hiddenLabel:F.hiddenLabel,multiline:k,size:F.size,type:R}),L=null!==(o=null!==(s=P.root)&&void 0!==s?s:u.Root)&&void 0!==o?o:_,W=null!==(l=null!==(d=P.input)&&void 0!==d?d:u.Input)&&void 0!==l?l:T,[N,B]=(0,x.A)("notchedOutline",{elementType:S,className:E.notchedOutline,shouldForwardComponentProp:!0,ownerState:O,externalForwardedProps:{slots:P,slotProps:C},additionalProps:{label:null!=h&&""!==h&&F.required?(0,c.jsxs)(n.Fragment,{children:[h,"\u2009","*"]}):h}});return(0,c.jsx)(A.Ay,(0,a.A)((0,a.A)({slots:{root:L,input:W},slotProps:C,renderSuffix:t=>(0,c.jsx)(N,(0,a.A)((0,a.A)({},B),{},{notched:"undefined"!==typeof I?I:Boolean(t.startAdornment||t.filled||t.focused)})),fullWidth:f,inputComponent:m,multiline:k,ref:e,type:R},z),{},{classes:(0,a.A)((0,a.A)({},E),{},{notchedOutline:null})}))});k.muiName="Input";const I=k},3027:(t,e,o)=>{o.d(e,{A:()=>x});var r=o(45),a=o(9379),n=o(5043),i=o(3129),s=o(1807),l=o(3209),d=o(2466),c=o(8128),p=o(1612),u=o(4412),f=o(8301),m=o(4727),y=o(7194),v=o(579);const h=["disableUnderline","components","componentsProps","fullWidth","hiddenLabel","inputComponent","multiline","slotProps","slots","type"],g=(0,c.Ay)(l.Sh,{shouldForwardProp:t=>(0,d.A)(t)||"classes"===t,name:"MuiFilledInput",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[...(0,l.WC)(t,e),!o.disableUnderline&&e.underline]}})((0,p.A)(t=>{let{theme:e}=t;const o="light"===e.palette.mode,r=o?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",a=o?"rgba(0, 0, 0, 0.06)":"rgba(255, 255, 255, 0.09)",n=o?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.13)",i=o?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)";return{position:"relative",backgroundColor:e.vars?e.vars.palette.FilledInput.bg:a,borderTopLeftRadius:(e.vars||e).shape.borderRadius,borderTopRightRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),"&:hover":{backgroundColor:e.vars?e.vars.palette.FilledInput.hoverBg:n,"@media (hover: none)":{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:a}},["&.".concat(m.A.focused)]:{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:a},["&.".concat(m.A.disabled)]:{backgroundColor:e.vars?e.vars.palette.FilledInput.disabledBg:i},variants:[{props:t=>{let{ownerState:e}=t;return!e.disableUnderline},style:{"&::after":{left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},["&.".concat(m.A.focused,":after")]:{transform:"scaleX(1) translateX(0)"},["&.".concat(m.A.error)]:{"&::before, &::after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:"1px solid ".concat(e.vars?e.alpha(e.vars.palette.common.onBackground,e.vars.opacity.inputUnderline):r),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},["&:hover:not(.".concat(m.A.disabled,", .").concat(m.A.error,"):before")]:{borderBottom:"1px solid ".concat((e.vars||e).palette.text.primary)},["&.".concat(m.A.disabled,":before")]:{borderBottomStyle:"dotted"}}},...Object.entries(e.palette).filter((0,u.A)()).map(t=>{var o;let[r]=t;return{props:{disableUnderline:!1,color:r},style:{"&::after":{borderBottom:"2px solid ".concat(null===(o=(e.vars||e).palette[r])||void 0===o?void 0:o.main)}}}}),{props:t=>{let{ownerState:e}=t;return e.startAdornment},style:{paddingLeft:12}},{props:t=>{let{ownerState:e}=t;return e.endAdornment},style:{paddingRight:12}},{props:t=>{let{ownerState:e}=t;return e.multiline},style:{padding:"25px 12px 8px"}},{props:t=>{let{ownerState:e,size:o}=t;return e.multiline&&"small"===o},style:{paddingTop:21,paddingBottom:4}},{props:t=>{let{ownerState:e}=t;return e.multiline&&e.hiddenLabel},style:{paddingTop:16,paddingBottom:17}},{props:t=>{let{ownerState:e}=t;return e.multiline&&e.hiddenLabel&&"small"===e.size},style:{paddingTop:8,paddingBottom:9}}]}})),b=(0,c.Ay)(l.ck,{name:"MuiFilledInput",slot:"Input",overridesResolver:l.Oj})((0,p.A)(t=>{let{theme:e}=t;return(0,a.A)((0,a.A)((0,a.A)({paddingTop:25,paddingRight:12,paddingBottom:8,paddingLeft:12},!e.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.mode?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.mode?null:"#fff",caretColor:"light"===e.palette.mode?null:"#fff",borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"}}),e.vars&&{"&:-webkit-autofill":{borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"},[e.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}}),{},{variants:[{props:{size:"small"},style:{paddingTop:21,paddingBottom:4}},{props:t=>{let{ownerState:e}=t;return e.hiddenLabel},style:{paddingTop:16,paddingBottom:17}},{props:t=>{let{ownerState:e}=t;return e.startAdornment},style:{paddingLeft:0}},{props:t=>{let{ownerState:e}=t;return e.endAdornment},style:{paddingRight:0}},{props:t=>{let{ownerState:e}=t;return e.hiddenLabel&&"small"===e.size},style:{paddingTop:8,paddingBottom:9}},{props:t=>{let{ownerState:e}=t;return e.multiline},style:{paddingTop:0,paddingBottom:0,paddingLeft:0,paddingRight:0}}]})})),A=n.forwardRef(function(t,e){var o,n,d,c;const p=(0,f.b)({props:t,name:"MuiFilledInput"}),{disableUnderline:u=!1,components:A={},componentsProps:x,fullWidth:w=!1,hiddenLabel:_,inputComponent:S="input",multiline:T=!1,slotProps:k,slots:I={},type:P="text"}=p,C=(0,r.A)(p,h),R=(0,a.A)((0,a.A)({},p),{},{disableUnderline:u,fullWidth:w,inputComponent:S,multiline:T,type:P}),z=(t=>{const{classes:e,disableUnderline:o,startAdornment:r,endAdornment:n,size:i,hiddenLabel:l,multiline:d}=t,c={root:["root",!o&&"underline",r&&"adornedStart",n&&"adornedEnd","small"===i&&"size".concat((0,y.A)(i)),l&&"hiddenLabel",d&&"multiline"],input:["input"]},p=(0,s.A)(c,m.N,e);return(0,a.A)((0,a.A)({},e),p)})(p),E={root:{ownerState:R},input:{ownerState:R}},M=(null!==k&&void 0!==k?k:x)?(0,i.A)(E,null!==k&&void 0!==k?k:x):E,F=null!==(o=null!==(n=I.root)&&void 0!==n?n:A.Root)&&void 0!==o?o:g,O=null!==(d=null!==(c=I.input)&&void 0!==c?c:A.Input)&&void 0!==d?d:b;return(0,v.jsx)(l.Ay,(0,a.A)((0,a.A)({slots:{root:F,input:O},slotProps:M,fullWidth:w,inputComponent:S,multiline:T,ref:e,type:P},C),{},{classes:z}))});A.muiName="Input";const x=A},4171:(t,e,o)=>{o.d(e,{A:()=>i,K:()=>n});var r=o(9857),a=o(6061);function n(t){return(0,a.Ay)("MuiDivider",t)}const i=(0,r.A)("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"])},4481:(t,e,o)=>{o.d(e,{A:()=>zt});var r=o(45),a=o(9379),n=o(5043),i=o(8387),s=o(3129),l=o(1807),d=o(2475),c=o(2065),p=o(713),u=o(1168),f=o(7194),m=o(2432),y=o(7605),v=o(6554),h=o(1449),g=o(8128),b=o(8301),A=o(6967),x=o(1917),w=o(6595),_=o(8549),S=o(4799),T=o(9857),k=o(6061);function I(t){return(0,k.Ay)("MuiPopover",t)}(0,T.A)("MuiPopover",["root","paper"]);var P=o(9905),C=o(122),R=o(579);const z=["action","anchorEl","anchorOrigin","anchorPosition","anchorReference","children","className","container","elevation","marginThreshold","open","PaperProps","slots","slotProps","transformOrigin","TransitionComponent","transitionDuration","TransitionProps","disableScrollLock"],E=["slots","slotProps"];function M(t,e){let o=0;return"number"===typeof e?o=e:"center"===e?o=t.height/2:"bottom"===e&&(o=t.height),o}function F(t,e){let o=0;return"number"===typeof e?o=e:"center"===e?o=t.width/2:"right"===e&&(o=t.width),o}function O(t){return[t.horizontal,t.vertical].map(t=>"number"===typeof t?"".concat(t,"px"):t).join(" ")}function L(t){return"function"===typeof t?t():t}const W=(0,g.Ay)(_.A,{name:"MuiPopover",slot:"Root"})({}),N=(0,g.Ay)(S.A,{name:"MuiPopover",slot:"Paper"})({position:"absolute",overflowY:"auto",overflowX:"hidden",minWidth:16,minHeight:16,maxWidth:"calc(100% - 32px)",maxHeight:"calc(100% - 32px)",outline:0}),B=n.forwardRef(function(t,e){const o=(0,b.b)({props:t,name:"MuiPopover"}),{action:s,anchorEl:d,anchorOrigin:c={vertical:"top",horizontal:"left"},anchorPosition:p,anchorReference:f="anchorEl",children:m,className:y,container:v,elevation:g=8,marginThreshold:_=16,open:S,PaperProps:T={},slots:k={},slotProps:B={},transformOrigin:j={vertical:"top",horizontal:"left"},TransitionComponent:D,transitionDuration:q="auto",TransitionProps:H={},disableScrollLock:V=!1}=o,U=(0,r.A)(o,z),K=n.useRef(),X=(0,a.A)((0,a.A)({},o),{},{anchorOrigin:c,anchorReference:f,elevation:g,marginThreshold:_,transformOrigin:j,TransitionComponent:D,transitionDuration:q,TransitionProps:H}),G=(t=>{const{classes:e}=t;return(0,l.A)({root:["root"],paper:["paper"]},I,e)})(X),Q=n.useCallback(()=>{if("anchorPosition"===f)return p;const t=L(d),e=(t&&1===t.nodeType?t:(0,u.A)(K.current).body).getBoundingClientRect();return{top:e.top+M(e,c.vertical),left:e.left+F(e,c.horizontal)}},[d,c.horizontal,c.vertical,p,f]),Y=n.useCallback(t=>({vertical:M(t,j.vertical),horizontal:F(t,j.horizontal)}),[j.horizontal,j.vertical]),Z=n.useCallback(t=>{const e={width:t.offsetWidth,height:t.offsetHeight},o=Y(e);if("none"===f)return{top:null,left:null,transformOrigin:O(o)};const r=Q();let a=r.top-o.vertical,n=r.left-o.horizontal;const i=a+e.height,s=n+e.width,l=(0,x.A)(L(d)),c=l.innerHeight-_,p=l.innerWidth-_;if(null!==_&&a<_){const t=a-_;a-=t,o.vertical+=t}else if(null!==_&&i>c){const t=i-c;a-=t,o.vertical+=t}if(null!==_&&n<_){const t=n-_;n-=t,o.horizontal+=t}else if(s>p){const t=s-p;n-=t,o.horizontal+=t}return{top:"".concat(Math.round(a),"px"),left:"".concat(Math.round(n),"px"),transformOrigin:O(o)}},[d,f,Q,Y,_]),[J,$]=n.useState(S),tt=n.useCallback(()=>{const t=K.current;if(!t)return;const e=Z(t);null!==e.top&&t.style.setProperty("top",e.top),null!==e.left&&(t.style.left=e.left),t.style.transformOrigin=e.transformOrigin,$(!0)},[Z]);n.useEffect(()=>(V&&window.addEventListener("scroll",tt),()=>window.removeEventListener("scroll",tt)),[d,V,tt]);n.useEffect(()=>{S&&tt()}),n.useImperativeHandle(s,()=>S?{updatePosition:()=>{tt()}}:null,[S,tt]),n.useEffect(()=>{if(!S)return;const t=(0,A.A)(()=>{tt()}),e=(0,x.A)(L(d));return e.addEventListener("resize",t),()=>{t.clear(),e.removeEventListener("resize",t)}},[d,S,tt]);let et=q;const ot={slots:(0,a.A)({transition:D},k),slotProps:(0,a.A)({transition:H,paper:T},B)},[rt,at]=(0,P.A)("transition",{elementType:w.A,externalForwardedProps:ot,ownerState:X,getSlotProps:t=>(0,a.A)((0,a.A)({},t),{},{onEntering:(e,o)=>{var r;null===(r=t.onEntering)||void 0===r||r.call(t,e,o),tt()},onExited:e=>{var o;null===(o=t.onExited)||void 0===o||o.call(t,e),$(!1)}}),additionalProps:{appear:!0,in:S}});"auto"!==q||rt.muiSupportAuto||(et=void 0);const nt=v||(d?(0,u.A)(L(d)).body:void 0),[it,st]=(0,P.A)("root",{ref:e,elementType:W,externalForwardedProps:(0,a.A)((0,a.A)({},ot),U),shouldForwardComponentProp:!0,additionalProps:{slots:{backdrop:k.backdrop},slotProps:{backdrop:(0,C.A)("function"===typeof B.backdrop?B.backdrop(X):B.backdrop,{invisible:!0})},container:nt,open:S},ownerState:X,className:(0,i.A)(G.root,y)}),{slots:lt,slotProps:dt}=st,ct=(0,r.A)(st,E),[pt,ut]=(0,P.A)("paper",{ref:K,className:G.paper,elementType:N,externalForwardedProps:ot,shouldForwardComponentProp:!0,additionalProps:{elevation:g,style:J?void 0:{opacity:0}},ownerState:X});return(0,R.jsx)(it,(0,a.A)((0,a.A)((0,a.A)({},ct),!(0,h.A)(it)&&{slots:lt,slotProps:dt,disableScrollLock:V}),{},{children:(0,R.jsx)(rt,(0,a.A)((0,a.A)({},at),{},{timeout:et,children:(0,R.jsx)(pt,(0,a.A)((0,a.A)({},ut),{},{children:m}))}))}))});var j=o(2466);function D(t){return(0,k.Ay)("MuiMenu",t)}(0,T.A)("MuiMenu",["root","paper","list"]);const q=["onEntering"],H=["autoFocus","children","className","disableAutoFocusItem","MenuListProps","onClose","open","PaperProps","PopoverClasses","transitionDuration","TransitionProps","variant","slots","slotProps"],V={vertical:"top",horizontal:"right"},U={vertical:"top",horizontal:"left"},K=(0,g.Ay)(B,{shouldForwardProp:t=>(0,j.A)(t)||"classes"===t,name:"MuiMenu",slot:"Root"})({}),X=(0,g.Ay)(N,{name:"MuiMenu",slot:"Paper"})({maxHeight:"calc(100% - 96px)",WebkitOverflowScrolling:"touch"}),G=(0,g.Ay)(v.A,{name:"MuiMenu",slot:"List"})({outline:0}),Q=n.forwardRef(function(t,e){const o=(0,b.b)({props:t,name:"MuiMenu"}),{autoFocus:s=!0,children:d,className:c,disableAutoFocusItem:p=!1,MenuListProps:u={},onClose:f,open:v,PaperProps:h={},PopoverClasses:g,transitionDuration:A="auto",TransitionProps:{onEntering:x}={},variant:w="selectedMenu",slots:_={},slotProps:S={}}=o,T=(0,r.A)(o.TransitionProps,q),k=(0,r.A)(o,H),I=(0,m.I)(),C=(0,a.A)((0,a.A)({},o),{},{autoFocus:s,disableAutoFocusItem:p,MenuListProps:u,onEntering:x,PaperProps:h,transitionDuration:A,TransitionProps:T,variant:w}),z=(t=>{const{classes:e}=t;return(0,l.A)({root:["root"],paper:["paper"],list:["list"]},D,e)})(C),E=s&&!p&&v,M=n.useRef(null);let F=-1;n.Children.map(d,(t,e)=>{n.isValidElement(t)&&(t.props.disabled||("selectedMenu"===w&&t.props.selected||-1===F)&&(F=e))});const O={slots:_,slotProps:(0,a.A)({list:u,transition:T,paper:h},S)},L=(0,y.A)({elementType:_.root,externalSlotProps:S.root,ownerState:C,className:[z.root,c]}),[W,N]=(0,P.A)("paper",{className:z.paper,elementType:X,externalForwardedProps:O,shouldForwardComponentProp:!0,ownerState:C}),[B,j]=(0,P.A)("list",{className:(0,i.A)(z.list,u.className),elementType:G,shouldForwardComponentProp:!0,externalForwardedProps:O,getSlotProps:t=>(0,a.A)((0,a.A)({},t),{},{onKeyDown:e=>{var o;(t=>{"Tab"===t.key&&(t.preventDefault(),f&&f(t,"tabKeyDown"))})(e),null===(o=t.onKeyDown)||void 0===o||o.call(t,e)}}),ownerState:C}),Q="function"===typeof O.slotProps.transition?O.slotProps.transition(C):O.slotProps.transition;return(0,R.jsx)(K,(0,a.A)((0,a.A)({onClose:f,anchorOrigin:{vertical:"bottom",horizontal:I?"right":"left"},transformOrigin:I?V:U,slots:(0,a.A)({root:_.root,paper:W,backdrop:_.backdrop},_.transition&&{transition:_.transition}),slotProps:{root:L,paper:N,backdrop:"function"===typeof S.backdrop?S.backdrop(C):S.backdrop,transition:(0,a.A)((0,a.A)({},Q),{},{onEntering:function(){for(var t,e=arguments.length,o=new Array(e),r=0;r<e;r++)o[r]=arguments[r];((t,e)=>{M.current&&M.current.adjustStyleForScrollbar(t,{direction:I?"rtl":"ltr"}),x&&x(t,e)})(...o),null===Q||void 0===Q||null===(t=Q.onEntering)||void 0===t||t.call(Q,...o)}})},open:v,ref:e,transitionDuration:A,ownerState:C},k),{},{classes:g,children:(0,R.jsx)(B,(0,a.A)((0,a.A)({actions:M,autoFocus:s&&(-1===F||p),autoFocusItem:E,variant:w},j),{},{children:d}))}))});function Y(t){return(0,k.Ay)("MuiNativeSelect",t)}const Z=(0,T.A)("MuiNativeSelect",["root","select","multiple","filled","outlined","standard","disabled","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]),J=["className","disabled","error","IconComponent","inputRef","variant"],$=(0,g.Ay)("select",{name:"MuiNativeSelect"})(t=>{let{theme:e}=t;return{MozAppearance:"none",WebkitAppearance:"none",userSelect:"none",borderRadius:0,cursor:"pointer","&:focus":{borderRadius:0},["&.".concat(Z.disabled)]:{cursor:"default"},"&[multiple]":{height:"auto"},"&:not([multiple]) option, &:not([multiple]) optgroup":{backgroundColor:(e.vars||e).palette.background.paper},variants:[{props:t=>{let{ownerState:e}=t;return"filled"!==e.variant&&"outlined"!==e.variant},style:{"&&&":{paddingRight:24,minWidth:16}}},{props:{variant:"filled"},style:{"&&&":{paddingRight:32}}},{props:{variant:"outlined"},style:{borderRadius:(e.vars||e).shape.borderRadius,"&:focus":{borderRadius:(e.vars||e).shape.borderRadius},"&&&":{paddingRight:32}}}]}}),tt=(0,g.Ay)($,{name:"MuiNativeSelect",slot:"Select",shouldForwardProp:j.A,overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.select,e[o.variant],o.error&&e.error,{["&.".concat(Z.multiple)]:e.multiple}]}})({}),et=(0,g.Ay)("svg",{name:"MuiNativeSelect"})(t=>{let{theme:e}=t;return{position:"absolute",right:0,top:"calc(50% - .5em)",pointerEvents:"none",color:(e.vars||e).palette.action.active,["&.".concat(Z.disabled)]:{color:(e.vars||e).palette.action.disabled},variants:[{props:t=>{let{ownerState:e}=t;return e.open},style:{transform:"rotate(180deg)"}},{props:{variant:"filled"},style:{right:7}},{props:{variant:"outlined"},style:{right:7}}]}}),ot=(0,g.Ay)(et,{name:"MuiNativeSelect",slot:"Icon",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.icon,o.variant&&e["icon".concat((0,f.A)(o.variant))],o.open&&e.iconOpen]}})({}),rt=n.forwardRef(function(t,e){const{className:o,disabled:s,error:d,IconComponent:c,inputRef:p,variant:u="standard"}=t,m=(0,r.A)(t,J),y=(0,a.A)((0,a.A)({},t),{},{disabled:s,variant:u,error:d}),v=(t=>{const{classes:e,variant:o,disabled:r,multiple:a,open:n,error:i}=t,s={select:["select",o,r&&"disabled",a&&"multiple",i&&"error"],icon:["icon","icon".concat((0,f.A)(o)),n&&"iconOpen",r&&"disabled"]};return(0,l.A)(s,Y,e)})(y);return(0,R.jsxs)(n.Fragment,{children:[(0,R.jsx)(tt,(0,a.A)({ownerState:y,className:(0,i.A)(v.select,o),disabled:s,ref:p||e},m)),t.multiple?null:(0,R.jsx)(ot,{as:c,ownerState:y,className:v.icon})]})});var at=o(1811),nt=o(478),it=o(8348),st=o(2447);function lt(t){return(0,k.Ay)("MuiSelect",t)}const dt=(0,T.A)("MuiSelect",["root","select","multiple","filled","outlined","standard","disabled","focused","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]),ct=["aria-describedby","aria-label","autoFocus","autoWidth","children","className","defaultOpen","defaultValue","disabled","displayEmpty","error","IconComponent","inputRef","labelId","MenuProps","multiple","name","onBlur","onChange","onClose","onFocus","onOpen","open","readOnly","renderValue","required","SelectDisplayProps","tabIndex","type","value","variant"];var pt;const ut=(0,g.Ay)($,{name:"MuiSelect",slot:"Select",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[{["&.".concat(dt.select)]:e.select},{["&.".concat(dt.select)]:e[o.variant]},{["&.".concat(dt.error)]:e.error},{["&.".concat(dt.multiple)]:e.multiple}]}})({["&.".concat(dt.select)]:{height:"auto",minHeight:"1.4375em",textOverflow:"ellipsis",whiteSpace:"nowrap",overflow:"hidden"}}),ft=(0,g.Ay)(et,{name:"MuiSelect",slot:"Icon",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.icon,o.variant&&e["icon".concat((0,f.A)(o.variant))],o.open&&e.iconOpen]}})({}),mt=(0,g.Ay)("input",{shouldForwardProp:t=>(0,nt.A)(t)&&"classes"!==t,name:"MuiSelect",slot:"NativeInput"})({bottom:0,left:0,position:"absolute",opacity:0,pointerEvents:"none",width:"100%",boxSizing:"border-box"});function yt(t,e){return"object"===typeof e&&null!==e?t===e:String(t)===String(e)}function vt(t){return null==t||"string"===typeof t&&!t.trim()}const ht=n.forwardRef(function(t,e){var o,s,d,m;const{"aria-describedby":y,"aria-label":v,autoFocus:h,autoWidth:g,children:b,className:A,defaultOpen:x,defaultValue:w,disabled:_,displayEmpty:S,error:T=!1,IconComponent:k,inputRef:I,labelId:P,MenuProps:C={},multiple:z,name:E,onBlur:M,onChange:F,onClose:O,onFocus:L,onOpen:W,open:N,readOnly:B,renderValue:j,required:D,SelectDisplayProps:q={},tabIndex:H,type:V,value:U,variant:K="standard"}=t,X=(0,r.A)(t,ct),[G,Y]=(0,st.A)({controlled:U,default:w,name:"Select"}),[Z,J]=(0,st.A)({controlled:N,default:x,name:"Select"}),$=n.useRef(null),tt=n.useRef(null),[et,ot]=n.useState(null),{current:rt}=n.useRef(null!=N),[nt,dt]=n.useState(),ht=(0,it.A)(e,I),gt=n.useCallback(t=>{tt.current=t,t&&ot(t)},[]),bt=null===et||void 0===et?void 0:et.parentNode;n.useImperativeHandle(ht,()=>({focus:()=>{tt.current.focus()},node:$.current,value:G}),[G]),n.useEffect(()=>{x&&Z&&et&&!rt&&(dt(g?null:bt.clientWidth),tt.current.focus())},[et,g]),n.useEffect(()=>{h&&tt.current.focus()},[h]),n.useEffect(()=>{if(!P)return;const t=(0,u.A)(tt.current).getElementById(P);if(t){const e=()=>{getSelection().isCollapsed&&tt.current.focus()};return t.addEventListener("click",e),()=>{t.removeEventListener("click",e)}}},[P]);const At=(t,e)=>{t?W&&W(e):O&&O(e),rt||(dt(g?null:bt.clientWidth),J(t))},xt=n.Children.toArray(b),wt=t=>e=>{let o;if(e.currentTarget.hasAttribute("tabindex")){if(z){o=Array.isArray(G)?G.slice():[];const e=G.indexOf(t.props.value);-1===e?o.push(t.props.value):o.splice(e,1)}else o=t.props.value;if(t.props.onClick&&t.props.onClick(e),G!==o&&(Y(o),F)){const r=e.nativeEvent||e,a=new r.constructor(r.type,r);Object.defineProperty(a,"target",{writable:!0,value:{value:o,name:E}}),F(a,t)}z||At(!1,e)}},_t=null!==et&&Z;let St,Tt;delete X["aria-invalid"];const kt=[];let It=!1,Pt=!1;((0,at.lq)({value:G})||S)&&(j?St=j(G):It=!0);const Ct=xt.map(t=>{if(!n.isValidElement(t))return null;let e;if(z){if(!Array.isArray(G))throw new Error((0,c.A)(2));e=G.some(e=>yt(e,t.props.value)),e&&It&&kt.push(t.props.children)}else e=yt(G,t.props.value),e&&It&&(Tt=t.props.children);return e&&(Pt=!0),n.cloneElement(t,{"aria-selected":e?"true":"false",onClick:wt(t),onKeyUp:e=>{" "===e.key&&e.preventDefault(),t.props.onKeyUp&&t.props.onKeyUp(e)},role:"option",selected:e,value:void 0,"data-value":t.props.value})});It&&(St=z?0===kt.length?null:kt.reduce((t,e,o)=>(t.push(e),o<kt.length-1&&t.push(", "),t),[]):Tt);let Rt,zt=nt;!g&&rt&&et&&(zt=bt.clientWidth),Rt="undefined"!==typeof H?H:_?null:0;const Et=q.id||(E?"mui-component-select-".concat(E):void 0),Mt=(0,a.A)((0,a.A)({},t),{},{variant:K,value:G,open:_t,error:T}),Ft=(t=>{const{classes:e,variant:o,disabled:r,multiple:a,open:n,error:i}=t,s={select:["select",o,r&&"disabled",a&&"multiple",i&&"error"],icon:["icon","icon".concat((0,f.A)(o)),n&&"iconOpen",r&&"disabled"],nativeInput:["nativeInput"]};return(0,l.A)(s,lt,e)})(Mt),Ot=(0,a.A)((0,a.A)({},C.PaperProps),"function"===typeof(null===(o=C.slotProps)||void 0===o?void 0:o.paper)?C.slotProps.paper(Mt):null===(s=C.slotProps)||void 0===s?void 0:s.paper),Lt=(0,a.A)((0,a.A)({},C.MenuListProps),"function"===typeof(null===(d=C.slotProps)||void 0===d?void 0:d.list)?C.slotProps.list(Mt):null===(m=C.slotProps)||void 0===m?void 0:m.list),Wt=(0,p.A)();return(0,R.jsxs)(n.Fragment,{children:[(0,R.jsx)(ut,(0,a.A)((0,a.A)({as:"div",ref:gt,tabIndex:Rt,role:"combobox","aria-controls":_t?Wt:void 0,"aria-disabled":_?"true":void 0,"aria-expanded":_t?"true":"false","aria-haspopup":"listbox","aria-label":v,"aria-labelledby":[P,Et].filter(Boolean).join(" ")||void 0,"aria-describedby":y,"aria-required":D?"true":void 0,"aria-invalid":T?"true":void 0,onKeyDown:t=>{if(!B){[" ","ArrowUp","ArrowDown","Enter"].includes(t.key)&&(t.preventDefault(),At(!0,t))}},onMouseDown:_||B?null:t=>{0===t.button&&(t.preventDefault(),tt.current.focus(),At(!0,t))},onBlur:t=>{!_t&&M&&(Object.defineProperty(t,"target",{writable:!0,value:{value:G,name:E}}),M(t))},onFocus:L},q),{},{ownerState:Mt,className:(0,i.A)(q.className,Ft.select,A),id:Et,children:vt(St)?pt||(pt=(0,R.jsx)("span",{className:"notranslate","aria-hidden":!0,children:"\u200b"})):St})),(0,R.jsx)(mt,(0,a.A)((0,a.A)({"aria-invalid":T,value:Array.isArray(G)?G.join(","):G,name:E,ref:$,"aria-hidden":!0,onChange:t=>{const e=xt.find(e=>e.props.value===t.target.value);void 0!==e&&(Y(e.props.value),F&&F(t,e))},tabIndex:-1,disabled:_,className:Ft.nativeInput,autoFocus:h,required:D},X),{},{ownerState:Mt})),(0,R.jsx)(ft,{as:k,className:Ft.icon,ownerState:Mt}),(0,R.jsx)(Q,(0,a.A)((0,a.A)({id:"menu-".concat(E||""),anchorEl:bt,open:_t,onClose:t=>{At(!1,t)},anchorOrigin:{vertical:"bottom",horizontal:"center"},transformOrigin:{vertical:"top",horizontal:"center"}},C),{},{slotProps:(0,a.A)((0,a.A)({},C.slotProps),{},{list:(0,a.A)({"aria-labelledby":P,role:"listbox","aria-multiselectable":z?"true":void 0,disableListWrap:!0,id:Wt},Lt),paper:(0,a.A)((0,a.A)({},Ot),{},{style:(0,a.A)({minWidth:zt},null!=Ot?Ot.style:null)})}),children:Ct}))]})});var gt=o(7566),bt=o(8700),At=o(8850),xt=o(4735),wt=o(3027),_t=o(2485);const St=["autoWidth","children","classes","className","defaultOpen","displayEmpty","IconComponent","id","input","inputProps","label","labelId","MenuProps","multiple","native","onClose","onOpen","open","renderValue","SelectDisplayProps","variant"],Tt=["root"],kt={name:"MuiSelect",slot:"Root",shouldForwardProp:t=>(0,j.A)(t)&&"variant"!==t},It=(0,g.Ay)(xt.A,kt)(""),Pt=(0,g.Ay)(_t.A,kt)(""),Ct=(0,g.Ay)(wt.A,kt)(""),Rt=n.forwardRef(function(t,e){const o=(0,b.b)({name:"MuiSelect",props:t}),{autoWidth:c=!1,children:p,classes:u={},className:f,defaultOpen:m=!1,displayEmpty:y=!1,IconComponent:v=At.A,id:h,input:g,inputProps:A,label:x,labelId:w,MenuProps:_,multiple:S=!1,native:T=!1,onClose:k,onOpen:I,open:P,renderValue:C,SelectDisplayProps:z,variant:E="outlined"}=o,M=(0,r.A)(o,St),F=T?rt:ht,O=(0,bt.A)(),L=(0,gt.A)({props:o,muiFormControl:O,states:["variant","error"]}),W=L.variant||E,N=(0,a.A)((0,a.A)({},o),{},{variant:W,classes:u}),B=(t=>{const{classes:e}=t,o=(0,l.A)({root:["root"]},lt,e);return(0,a.A)((0,a.A)({},e),o)})(N),{root:j}=B,D=(0,r.A)(B,Tt),q=g||{standard:(0,R.jsx)(It,{ownerState:N}),outlined:(0,R.jsx)(Pt,{label:x,ownerState:N}),filled:(0,R.jsx)(Ct,{ownerState:N})}[W],H=(0,it.A)(e,(0,d.A)(q));return(0,R.jsx)(n.Fragment,{children:n.cloneElement(q,(0,a.A)((0,a.A)((0,a.A)({inputComponent:F,inputProps:(0,a.A)((0,a.A)((0,a.A)({children:p,error:L.error,IconComponent:v,variant:W,type:void 0,multiple:S},T?{id:h}:{autoWidth:c,defaultOpen:m,displayEmpty:y,labelId:w,MenuProps:_,onClose:k,onOpen:I,open:P,renderValue:C,SelectDisplayProps:(0,a.A)({id:h},z)}),A),{},{classes:A?(0,s.A)(D,A.classes):D},g?g.props.inputProps:{})},(S&&T||y)&&"outlined"===W?{notched:!0}:{}),{},{ref:H,className:(0,i.A)(q.props.className,f,B.root)},!g&&{variant:W}),M))})});Rt.muiName="Select";const zt=Rt},4727:(t,e,o)=>{o.d(e,{A:()=>l,N:()=>s});var r=o(9379),a=o(9857),n=o(6061),i=o(8031);function s(t){return(0,n.Ay)("MuiFilledInput",t)}const l=(0,r.A)((0,r.A)({},i.A),(0,a.A)("MuiFilledInput",["root","underline","input","adornedStart","adornedEnd","sizeSmall","multiline","hiddenLabel"]))},4735:(t,e,o)=>{o.d(e,{A:()=>A});var r=o(45),a=o(9379),n=o(5043),i=o(1807),s=o(3129),l=o(3209),d=o(2466),c=o(8128),p=o(1612),u=o(4412),f=o(8301),m=o(8619),y=o(579);const v=["disableUnderline","components","componentsProps","fullWidth","inputComponent","multiline","slotProps","slots","type"],h=(0,c.Ay)(l.Sh,{shouldForwardProp:t=>(0,d.A)(t)||"classes"===t,name:"MuiInput",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[...(0,l.WC)(t,e),!o.disableUnderline&&e.underline]}})((0,p.A)(t=>{let{theme:e}=t;let o="light"===e.palette.mode?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return e.vars&&(o=e.alpha(e.vars.palette.common.onBackground,e.vars.opacity.inputUnderline)),{position:"relative",variants:[{props:t=>{let{ownerState:e}=t;return e.formControl},style:{"label + &":{marginTop:16}}},{props:t=>{let{ownerState:e}=t;return!e.disableUnderline},style:{"&::after":{left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},["&.".concat(m.A.focused,":after")]:{transform:"scaleX(1) translateX(0)"},["&.".concat(m.A.error)]:{"&::before, &::after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:"1px solid ".concat(o),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},["&:hover:not(.".concat(m.A.disabled,", .").concat(m.A.error,"):before")]:{borderBottom:"2px solid ".concat((e.vars||e).palette.text.primary),"@media (hover: none)":{borderBottom:"1px solid ".concat(o)}},["&.".concat(m.A.disabled,":before")]:{borderBottomStyle:"dotted"}}},...Object.entries(e.palette).filter((0,u.A)()).map(t=>{let[o]=t;return{props:{color:o,disableUnderline:!1},style:{"&::after":{borderBottom:"2px solid ".concat((e.vars||e).palette[o].main)}}}})]}})),g=(0,c.Ay)(l.ck,{name:"MuiInput",slot:"Input",overridesResolver:l.Oj})({}),b=n.forwardRef(function(t,e){var o,n,d,c;const p=(0,f.b)({props:t,name:"MuiInput"}),{disableUnderline:u=!1,components:b={},componentsProps:A,fullWidth:x=!1,inputComponent:w="input",multiline:_=!1,slotProps:S,slots:T={},type:k="text"}=p,I=(0,r.A)(p,v),P=(t=>{const{classes:e,disableUnderline:o}=t,r={root:["root",!o&&"underline"],input:["input"]},n=(0,i.A)(r,m.B,e);return(0,a.A)((0,a.A)({},e),n)})(p),C={root:{ownerState:{disableUnderline:u}}},R=(null!==S&&void 0!==S?S:A)?(0,s.A)(null!==S&&void 0!==S?S:A,C):C,z=null!==(o=null!==(n=T.root)&&void 0!==n?n:b.Root)&&void 0!==o?o:h,E=null!==(d=null!==(c=T.input)&&void 0!==c?c:b.Input)&&void 0!==d?d:g;return(0,y.jsx)(l.Ay,(0,a.A)((0,a.A)({slots:{root:z,input:E},slotProps:R,fullWidth:x,inputComponent:w,multiline:_,ref:e,type:k},I),{},{classes:P}))});b.muiName="Input";const A=b},4807:(t,e,o)=>{o.d(e,{A:()=>l,v:()=>s});var r=o(9379),a=o(9857),n=o(6061),i=o(8031);function s(t){return(0,n.Ay)("MuiOutlinedInput",t)}const l=(0,r.A)((0,r.A)({},i.A),(0,a.A)("MuiOutlinedInput",["root","notchedOutline","input"]))},6154:(t,e,o)=>{o.d(e,{A:()=>O});var r=o(9379),a=o(45),n=o(5043),i=o(8387),s=o(1807),l=o(713),d=o(8128),c=o(8301),p=o(4735),u=o(3027),f=o(2485),m=o(9067),y=o(256),v=o(7566),h=o(8700),g=o(1612),b=o(7194),A=o(9857),x=o(6061);function w(t){return(0,x.Ay)("MuiFormHelperText",t)}const _=(0,A.A)("MuiFormHelperText",["root","error","disabled","sizeSmall","sizeMedium","contained","focused","filled","required"]);var S=o(579);const T=["children","className","component","disabled","error","filled","focused","margin","required","variant"];var k;const I=(0,d.Ay)("p",{name:"MuiFormHelperText",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,o.size&&e["size".concat((0,b.A)(o.size))],o.contained&&e.contained,o.filled&&e.filled]}})((0,g.A)(t=>{let{theme:e}=t;return(0,r.A)((0,r.A)({color:(e.vars||e).palette.text.secondary},e.typography.caption),{},{textAlign:"left",marginTop:3,marginRight:0,marginBottom:0,marginLeft:0,["&.".concat(_.disabled)]:{color:(e.vars||e).palette.text.disabled},["&.".concat(_.error)]:{color:(e.vars||e).palette.error.main},variants:[{props:{size:"small"},style:{marginTop:4}},{props:t=>{let{ownerState:e}=t;return e.contained},style:{marginLeft:14,marginRight:14}}]})})),P=n.forwardRef(function(t,e){const o=(0,c.b)({props:t,name:"MuiFormHelperText"}),{children:n,className:l,component:d="p",disabled:p,error:u,filled:f,focused:m,margin:y,required:g,variant:A}=o,x=(0,a.A)(o,T),_=(0,h.A)(),P=(0,v.A)({props:o,muiFormControl:_,states:["variant","size","disabled","error","filled","focused","required"]}),C=(0,r.A)((0,r.A)({},o),{},{component:d,contained:"filled"===P.variant||"outlined"===P.variant,variant:P.variant,size:P.size,disabled:P.disabled,error:P.error,filled:P.filled,focused:P.focused,required:P.required});delete C.ownerState;const R=(t=>{const{classes:e,contained:o,size:r,disabled:a,error:n,filled:i,focused:l,required:d}=t,c={root:["root",a&&"disabled",n&&"error",r&&"size".concat((0,b.A)(r)),o&&"contained",l&&"focused",i&&"filled",d&&"required"]};return(0,s.A)(c,w,e)})(C);return(0,S.jsx)(I,(0,r.A)((0,r.A)({as:d,className:(0,i.A)(R.root,l),ref:e},x),{},{ownerState:C,children:" "===n?k||(k=(0,S.jsx)("span",{className:"notranslate","aria-hidden":!0,children:"\u200b"})):n}))});var C=o(4481);function R(t){return(0,x.Ay)("MuiTextField",t)}(0,A.A)("MuiTextField",["root"]);var z=o(9905);const E=["autoComplete","autoFocus","children","className","color","defaultValue","disabled","error","FormHelperTextProps","fullWidth","helperText","id","InputLabelProps","inputProps","InputProps","inputRef","label","maxRows","minRows","multiline","name","onBlur","onChange","onFocus","placeholder","required","rows","select","SelectProps","slots","slotProps","type","value","variant"],M={standard:p.A,filled:u.A,outlined:f.A},F=(0,d.Ay)(y.A,{name:"MuiTextField",slot:"Root"})({}),O=n.forwardRef(function(t,e){const o=(0,c.b)({props:t,name:"MuiTextField"}),{autoComplete:n,autoFocus:d=!1,children:p,className:u,color:f="primary",defaultValue:y,disabled:v=!1,error:h=!1,FormHelperTextProps:g,fullWidth:b=!1,helperText:A,id:x,InputLabelProps:w,inputProps:_,InputProps:T,inputRef:k,label:I,maxRows:O,minRows:L,multiline:W=!1,name:N,onBlur:B,onChange:j,onFocus:D,placeholder:q,required:H=!1,rows:V,select:U=!1,SelectProps:K,slots:X={},slotProps:G={},type:Q,value:Y,variant:Z="outlined"}=o,J=(0,a.A)(o,E),$=(0,r.A)((0,r.A)({},o),{},{autoFocus:d,color:f,disabled:v,error:h,fullWidth:b,multiline:W,required:H,select:U,variant:Z}),tt=(t=>{const{classes:e}=t;return(0,s.A)({root:["root"]},R,e)})($);const et=(0,l.A)(x),ot=A&&et?"".concat(et,"-helper-text"):void 0,rt=I&&et?"".concat(et,"-label"):void 0,at=M[Z],nt={slots:X,slotProps:(0,r.A)({input:T,inputLabel:w,htmlInput:_,formHelperText:g,select:K},G)},it={},st=nt.slotProps.inputLabel;"outlined"===Z&&(st&&"undefined"!==typeof st.shrink&&(it.notched=st.shrink),it.label=I),U&&(K&&K.native||(it.id=void 0),it["aria-describedby"]=void 0);const[lt,dt]=(0,z.A)("root",{elementType:F,shouldForwardComponentProp:!0,externalForwardedProps:(0,r.A)((0,r.A)({},nt),J),ownerState:$,className:(0,i.A)(tt.root,u),ref:e,additionalProps:{disabled:v,error:h,fullWidth:b,required:H,color:f,variant:Z}}),[ct,pt]=(0,z.A)("input",{elementType:at,externalForwardedProps:nt,additionalProps:it,ownerState:$}),[ut,ft]=(0,z.A)("inputLabel",{elementType:m.A,externalForwardedProps:nt,ownerState:$}),[mt,yt]=(0,z.A)("htmlInput",{elementType:"input",externalForwardedProps:nt,ownerState:$}),[vt,ht]=(0,z.A)("formHelperText",{elementType:P,externalForwardedProps:nt,ownerState:$}),[gt,bt]=(0,z.A)("select",{elementType:C.A,externalForwardedProps:nt,ownerState:$}),At=(0,S.jsx)(ct,(0,r.A)({"aria-describedby":ot,autoComplete:n,autoFocus:d,defaultValue:y,fullWidth:b,multiline:W,name:N,rows:V,maxRows:O,minRows:L,type:Q,value:Y,id:et,inputRef:k,onBlur:B,onChange:j,onFocus:D,placeholder:q,inputProps:yt,slots:{input:X.htmlInput?mt:void 0}},pt));return(0,S.jsxs)(lt,(0,r.A)((0,r.A)({},dt),{},{children:[null!=I&&""!==I&&(0,S.jsx)(ut,(0,r.A)((0,r.A)({htmlFor:et,id:rt},ft),{},{children:I})),U?(0,S.jsx)(gt,(0,r.A)((0,r.A)({"aria-describedby":ot,id:et,labelId:rt,value:Y,input:At},bt),{},{children:p})):At,A&&(0,S.jsx)(vt,(0,r.A)((0,r.A)({id:ot},ht),{},{children:A}))]}))})},6554:(t,e,o)=>{o.d(e,{A:()=>g});var r=o(9379),a=o(45),n=o(5043),i=o(1168),s=o(5315);const l=o(9385).A;var d=o(8348),c=o(4418),p=o(1917),u=o(579);const f=["actions","autoFocus","autoFocusItem","children","className","disabledItemsFocusable","disableListWrap","onKeyDown","variant"];function m(t,e,o){return t===e?t.firstChild:e&&e.nextElementSibling?e.nextElementSibling:o?null:t.firstChild}function y(t,e,o){return t===e?o?t.firstChild:t.lastChild:e&&e.previousElementSibling?e.previousElementSibling:o?null:t.lastChild}function v(t,e){if(void 0===e)return!0;let o=t.innerText;return void 0===o&&(o=t.textContent),o=o.trim().toLowerCase(),0!==o.length&&(e.repeating?o[0]===e.keys[0]:o.startsWith(e.keys.join("")))}function h(t,e,o,r,a,n){let i=!1,s=a(t,e,!!e&&o);for(;s;){if(s===t.firstChild){if(i)return!1;i=!0}const e=!r&&(s.disabled||"true"===s.getAttribute("aria-disabled"));if(s.hasAttribute("tabindex")&&v(s,n)&&!e)return s.focus(),!0;s=a(t,s,o)}return!1}const g=n.forwardRef(function(t,e){const{actions:o,autoFocus:g=!1,autoFocusItem:b=!1,children:A,className:x,disabledItemsFocusable:w=!1,disableListWrap:_=!1,onKeyDown:S,variant:T="selectedMenu"}=t,k=(0,a.A)(t,f),I=n.useRef(null),P=n.useRef({keys:[],repeating:!0,previousKeyMatched:!0,lastTime:null});(0,c.A)(()=>{g&&I.current.focus()},[g]),n.useImperativeHandle(o,()=>({adjustStyleForScrollbar:(t,e)=>{let{direction:o}=e;const r=!I.current.style.width;if(t.clientHeight<I.current.clientHeight&&r){const e="".concat(l((0,p.A)(t)),"px");I.current.style["rtl"===o?"paddingLeft":"paddingRight"]=e,I.current.style.width="calc(100% + ".concat(e,")")}return I.current}}),[]);const C=(0,d.A)(I,e);let R=-1;n.Children.forEach(A,(t,e)=>{n.isValidElement(t)?(t.props.disabled||("selectedMenu"===T&&t.props.selected||-1===R)&&(R=e),R===e&&(t.props.disabled||t.props.muiSkipListHighlight||t.type.muiSkipListHighlight)&&(R+=1,R>=A.length&&(R=-1))):R===e&&(R+=1,R>=A.length&&(R=-1))});const z=n.Children.map(A,(t,e)=>{if(e===R){const e={};return b&&(e.autoFocus=!0),void 0===t.props.tabIndex&&"selectedMenu"===T&&(e.tabIndex=0),n.cloneElement(t,e)}return t});return(0,u.jsx)(s.A,(0,r.A)((0,r.A)({role:"menu",ref:C,className:x,onKeyDown:t=>{const e=I.current,o=t.key;if(t.ctrlKey||t.metaKey||t.altKey)return void(S&&S(t));const r=(0,i.A)(e).activeElement;if("ArrowDown"===o)t.preventDefault(),h(e,r,_,w,m);else if("ArrowUp"===o)t.preventDefault(),h(e,r,_,w,y);else if("Home"===o)t.preventDefault(),h(e,null,_,w,m);else if("End"===o)t.preventDefault(),h(e,null,_,w,y);else if(1===o.length){const a=P.current,n=o.toLowerCase(),i=performance.now();a.keys.length>0&&(i-a.lastTime>500?(a.keys=[],a.repeating=!0,a.previousKeyMatched=!0):a.repeating&&n!==a.keys[0]&&(a.repeating=!1)),a.lastTime=i,a.keys.push(n);const s=r&&!a.repeating&&v(r,a);a.previousKeyMatched&&(s||h(e,r,!1,w,m,a))?t.preventDefault():a.previousKeyMatched=!1}S&&S(t)},tabIndex:g?0:-1},k),{},{children:z}))})},6572:(t,e,o)=>{o.d(e,{A:()=>r});const r=o(713).A},6595:(t,e,o)=>{o.d(e,{A:()=>b});var r=o(9379),a=o(45),n=o(5043),i=o(3115),s=o(2475),l=o(9998),d=o(267),c=o(6906),p=o(8348),u=o(579);const f=["addEndListener","appear","children","easing","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"],m=["ownerState"];function y(t){return"scale(".concat(t,", ").concat(t**2,")")}const v={entering:{opacity:1,transform:y(1)},entered:{opacity:1,transform:"none"}},h="undefined"!==typeof navigator&&/^((?!chrome|android).)*(safari|mobile)/i.test(navigator.userAgent)&&/(os |version\/)15(.|_)4/i.test(navigator.userAgent),g=n.forwardRef(function(t,e){const{addEndListener:o,appear:g=!0,children:b,easing:A,in:x,onEnter:w,onEntered:_,onEntering:S,onExit:T,onExited:k,onExiting:I,style:P,timeout:C="auto",TransitionComponent:R=l.Ay}=t,z=(0,a.A)(t,f),E=(0,i.A)(),M=n.useRef(),F=(0,d.A)(),O=n.useRef(null),L=(0,p.A)(O,(0,s.A)(b),e),W=t=>e=>{if(t){const o=O.current;void 0===e?t(o):t(o,e)}},N=W(S),B=W((t,e)=>{(0,c.q)(t);const{duration:o,delay:r,easing:a}=(0,c.c)({style:P,timeout:C,easing:A},{mode:"enter"});let n;"auto"===C?(n=F.transitions.getAutoHeightDuration(t.clientHeight),M.current=n):n=o,t.style.transition=[F.transitions.create("opacity",{duration:n,delay:r}),F.transitions.create("transform",{duration:h?n:.666*n,delay:r,easing:a})].join(","),w&&w(t,e)}),j=W(_),D=W(I),q=W(t=>{const{duration:e,delay:o,easing:r}=(0,c.c)({style:P,timeout:C,easing:A},{mode:"exit"});let a;"auto"===C?(a=F.transitions.getAutoHeightDuration(t.clientHeight),M.current=a):a=e,t.style.transition=[F.transitions.create("opacity",{duration:a,delay:o}),F.transitions.create("transform",{duration:h?a:.666*a,delay:h?o:o||.333*a,easing:r})].join(","),t.style.opacity=0,t.style.transform=y(.75),T&&T(t)}),H=W(k);return(0,u.jsx)(R,(0,r.A)((0,r.A)({appear:g,in:x,nodeRef:O,onEnter:B,onEntered:j,onEntering:N,onExit:q,onExited:H,onExiting:D,addEndListener:t=>{"auto"===C&&E.start(M.current||0,t),o&&o(O.current,t)},timeout:"auto"===C?null:C},z),{},{children:(t,e)=>{let{ownerState:o}=e,i=(0,a.A)(e,m);return n.cloneElement(b,(0,r.A)({style:(0,r.A)((0,r.A)((0,r.A)({opacity:0,transform:y(.75),visibility:"exited"!==t||x?void 0:"hidden"},v[t]),P),b.props.style),ref:L},i))}}))});g&&(g.muiSupportAuto=!0);const b=g},6647:(t,e,o)=>{o.d(e,{A:()=>x});var r=o(9379),a=o(45),n=o(5043),i=o(8387),s=o(1807),l=o(6572),d=o(8128),c=o(1612),p=o(4412),u=o(8301),f=o(9699),m=o(172),y=o(7194),v=o(6835),h=o(579);const g=["edge","children","className","color","disabled","disableFocusRipple","size","id","loading","loadingIndicator"],b=(0,d.Ay)(f.A,{name:"MuiIconButton",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,o.loading&&e.loading,"default"!==o.color&&e["color".concat((0,y.A)(o.color))],o.edge&&e["edge".concat((0,y.A)(o.edge))],e["size".concat((0,y.A)(o.size))]]}})((0,c.A)(t=>{let{theme:e}=t;return{textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:8,borderRadius:"50%",color:(e.vars||e).palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),variants:[{props:t=>!t.disableRipple,style:{"--IconButton-hoverBg":e.alpha((e.vars||e).palette.action.active,(e.vars||e).palette.action.hoverOpacity),"&:hover":{backgroundColor:"var(--IconButton-hoverBg)","@media (hover: none)":{backgroundColor:"transparent"}}}},{props:{edge:"start"},style:{marginLeft:-12}},{props:{edge:"start",size:"small"},style:{marginLeft:-3}},{props:{edge:"end"},style:{marginRight:-12}},{props:{edge:"end",size:"small"},style:{marginRight:-3}}]}}),(0,c.A)(t=>{let{theme:e}=t;return{variants:[{props:{color:"inherit"},style:{color:"inherit"}},...Object.entries(e.palette).filter((0,p.A)()).map(t=>{let[o]=t;return{props:{color:o},style:{color:(e.vars||e).palette[o].main}}}),...Object.entries(e.palette).filter((0,p.A)()).map(t=>{let[o]=t;return{props:{color:o},style:{"--IconButton-hoverBg":e.alpha((e.vars||e).palette[o].main,(e.vars||e).palette.action.hoverOpacity)}}}),{props:{size:"small"},style:{padding:5,fontSize:e.typography.pxToRem(18)}},{props:{size:"large"},style:{padding:12,fontSize:e.typography.pxToRem(28)}}],["&.".concat(v.A.disabled)]:{backgroundColor:"transparent",color:(e.vars||e).palette.action.disabled},["&.".concat(v.A.loading)]:{color:"transparent"}}})),A=(0,d.Ay)("span",{name:"MuiIconButton",slot:"LoadingIndicator"})(t=>{let{theme:e}=t;return{display:"none",position:"absolute",visibility:"visible",top:"50%",left:"50%",transform:"translate(-50%, -50%)",color:(e.vars||e).palette.action.disabled,variants:[{props:{loading:!0},style:{display:"flex"}}]}}),x=n.forwardRef(function(t,e){const o=(0,u.b)({props:t,name:"MuiIconButton"}),{edge:n=!1,children:d,className:c,color:p="default",disabled:f=!1,disableFocusRipple:x=!1,size:w="medium",id:_,loading:S=null,loadingIndicator:T}=o,k=(0,a.A)(o,g),I=(0,l.A)(_),P=null!==T&&void 0!==T?T:(0,h.jsx)(m.A,{"aria-labelledby":I,color:"inherit",size:16}),C=(0,r.A)((0,r.A)({},o),{},{edge:n,color:p,disabled:f,disableFocusRipple:x,loading:S,loadingIndicator:P,size:w}),R=(t=>{const{classes:e,disabled:o,color:r,edge:a,size:n,loading:i}=t,l={root:["root",i&&"loading",o&&"disabled","default"!==r&&"color".concat((0,y.A)(r)),a&&"edge".concat((0,y.A)(a)),"size".concat((0,y.A)(n))],loadingIndicator:["loadingIndicator"],loadingWrapper:["loadingWrapper"]};return(0,s.A)(l,v.G,e)})(C);return(0,h.jsxs)(b,(0,r.A)((0,r.A)({id:S?I:_,className:(0,i.A)(R.root,c),centerRipple:!0,focusRipple:!x,disabled:f||S,ref:e},k),{},{ownerState:C,children:["boolean"===typeof S&&(0,h.jsx)("span",{className:R.loadingWrapper,style:{display:"contents"},children:(0,h.jsx)(A,{className:R.loadingIndicator,ownerState:C,children:S&&P})}),d]}))})},6835:(t,e,o)=>{o.d(e,{A:()=>i,G:()=>n});var r=o(9857),a=o(6061);function n(t){return(0,a.Ay)("MuiIconButton",t)}const i=(0,r.A)("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge","loading","loadingIndicator","loadingWrapper"])},7145:(t,e,o)=>{o.d(e,{A:()=>a});var r=o(5043);function a(t){const{controlled:e,default:o,name:a,state:n="value"}=t,{current:i}=r.useRef(void 0!==e),[s,l]=r.useState(o);return[i?e:s,r.useCallback(t=>{i||l(t)},[])]}},7471:(t,e,o)=>{o.d(e,{A:()=>k});var r=o(45),a=o(9379),n=o(5043),i=o(8387),s=o(1807),l=o(2466),d=o(8128),c=o(1612),p=o(8301),u=o(9066),f=o(9699),m=o(4418),y=o(8348),v=o(4171),h=o(6057),g=o(1977),b=o(9857),A=o(6061);function x(t){return(0,A.Ay)("MuiMenuItem",t)}const w=(0,b.A)("MuiMenuItem",["root","focusVisible","dense","disabled","divider","gutters","selected"]);var _=o(579);const S=["autoFocus","component","dense","divider","disableGutters","focusVisibleClassName","role","tabIndex","className"],T=(0,d.Ay)(f.A,{shouldForwardProp:t=>(0,l.A)(t)||"classes"===t,name:"MuiMenuItem",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,o.dense&&e.dense,o.divider&&e.divider,!o.disableGutters&&e.gutters]}})((0,c.A)(t=>{let{theme:e}=t;return(0,a.A)((0,a.A)({},e.typography.body1),{},{display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",minHeight:48,paddingTop:6,paddingBottom:6,boxSizing:"border-box",whiteSpace:"nowrap","&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(w.selected)]:{backgroundColor:e.alpha((e.vars||e).palette.primary.main,(e.vars||e).palette.action.selectedOpacity),["&.".concat(w.focusVisible)]:{backgroundColor:e.alpha((e.vars||e).palette.primary.main,"".concat((e.vars||e).palette.action.selectedOpacity," + ").concat((e.vars||e).palette.action.focusOpacity))}},["&.".concat(w.selected,":hover")]:{backgroundColor:e.alpha((e.vars||e).palette.primary.main,"".concat((e.vars||e).palette.action.selectedOpacity," + ").concat((e.vars||e).palette.action.hoverOpacity)),"@media (hover: none)":{backgroundColor:e.alpha((e.vars||e).palette.primary.main,(e.vars||e).palette.action.selectedOpacity)}},["&.".concat(w.focusVisible)]:{backgroundColor:(e.vars||e).palette.action.focus},["&.".concat(w.disabled)]:{opacity:(e.vars||e).palette.action.disabledOpacity},["& + .".concat(v.A.root)]:{marginTop:e.spacing(1),marginBottom:e.spacing(1)},["& + .".concat(v.A.inset)]:{marginLeft:52},["& .".concat(g.A.root)]:{marginTop:0,marginBottom:0},["& .".concat(g.A.inset)]:{paddingLeft:36},["& .".concat(h.A.root)]:{minWidth:36},variants:[{props:t=>{let{ownerState:e}=t;return!e.disableGutters},style:{paddingLeft:16,paddingRight:16}},{props:t=>{let{ownerState:e}=t;return e.divider},style:{borderBottom:"1px solid ".concat((e.vars||e).palette.divider),backgroundClip:"padding-box"}},{props:t=>{let{ownerState:e}=t;return!e.dense},style:{[e.breakpoints.up("sm")]:{minHeight:"auto"}}},{props:t=>{let{ownerState:e}=t;return e.dense},style:(0,a.A)((0,a.A)({minHeight:32,paddingTop:4,paddingBottom:4},e.typography.body2),{},{["& .".concat(h.A.root," svg")]:{fontSize:"1.25rem"}})}]})})),k=n.forwardRef(function(t,e){const o=(0,p.b)({props:t,name:"MuiMenuItem"}),{autoFocus:l=!1,component:d="li",dense:c=!1,divider:f=!1,disableGutters:v=!1,focusVisibleClassName:h,role:g="menuitem",tabIndex:b,className:A}=o,w=(0,r.A)(o,S),k=n.useContext(u.A),I=n.useMemo(()=>({dense:c||k.dense||!1,disableGutters:v}),[k.dense,c,v]),P=n.useRef(null);(0,m.A)(()=>{l&&P.current&&P.current.focus()},[l]);const C=(0,a.A)((0,a.A)({},o),{},{dense:I.dense,divider:f,disableGutters:v}),R=(t=>{const{disabled:e,dense:o,divider:r,disableGutters:n,selected:i,classes:l}=t,d={root:["root",o&&"dense",e&&"disabled",!n&&"gutters",r&&"divider",i&&"selected"]},c=(0,s.A)(d,x,l);return(0,a.A)((0,a.A)({},l),c)})(o),z=(0,y.A)(P,e);let E;return o.disabled||(E=void 0!==b?b:-1),(0,_.jsx)(u.A.Provider,{value:I,children:(0,_.jsx)(T,(0,a.A)((0,a.A)({ref:z,role:g,tabIndex:E,component:d,focusVisibleClassName:(0,i.A)(R.focusVisible,h),className:(0,i.A)(R.root,A)},w),{},{ownerState:C,classes:R}))})})},7488:(t,e,o)=>{o.d(e,{oR:()=>S});o(45);var r=o(9379),a=o(5043);!function(t){if(!t||"undefined"==typeof document)return;let e=document.head||document.getElementsByTagName("head")[0],o=document.createElement("style");o.type="text/css",e.firstChild?e.insertBefore(o,e.firstChild):e.appendChild(o),o.styleSheet?o.styleSheet.cssText=t:o.appendChild(document.createTextNode(t))}(':root{--toastify-color-light: #fff;--toastify-color-dark: #121212;--toastify-color-info: #3498db;--toastify-color-success: #07bc0c;--toastify-color-warning: #f1c40f;--toastify-color-error: hsl(6, 78%, 57%);--toastify-color-transparent: rgba(255, 255, 255, .7);--toastify-icon-color-info: var(--toastify-color-info);--toastify-icon-color-success: var(--toastify-color-success);--toastify-icon-color-warning: var(--toastify-color-warning);--toastify-icon-color-error: var(--toastify-color-error);--toastify-container-width: fit-content;--toastify-toast-width: 320px;--toastify-toast-offset: 16px;--toastify-toast-top: max(var(--toastify-toast-offset), env(safe-area-inset-top));--toastify-toast-right: max(var(--toastify-toast-offset), env(safe-area-inset-right));--toastify-toast-left: max(var(--toastify-toast-offset), env(safe-area-inset-left));--toastify-toast-bottom: max(var(--toastify-toast-offset), env(safe-area-inset-bottom));--toastify-toast-background: #fff;--toastify-toast-padding: 14px;--toastify-toast-min-height: 64px;--toastify-toast-max-height: 800px;--toastify-toast-bd-radius: 6px;--toastify-toast-shadow: 0px 4px 12px rgba(0, 0, 0, .1);--toastify-font-family: sans-serif;--toastify-z-index: 9999;--toastify-text-color-light: #757575;--toastify-text-color-dark: #fff;--toastify-text-color-info: #fff;--toastify-text-color-success: #fff;--toastify-text-color-warning: #fff;--toastify-text-color-error: #fff;--toastify-spinner-color: #616161;--toastify-spinner-color-empty-area: #e0e0e0;--toastify-color-progress-light: linear-gradient(to right, #4cd964, #5ac8fa, #007aff, #34aadc, #5856d6, #ff2d55);--toastify-color-progress-dark: #bb86fc;--toastify-color-progress-info: var(--toastify-color-info);--toastify-color-progress-success: var(--toastify-color-success);--toastify-color-progress-warning: var(--toastify-color-warning);--toastify-color-progress-error: var(--toastify-color-error);--toastify-color-progress-bgo: .2}.Toastify__toast-container{z-index:var(--toastify-z-index);-webkit-transform:translate3d(0,0,var(--toastify-z-index));position:fixed;width:var(--toastify-container-width);box-sizing:border-box;color:#fff;display:flex;flex-direction:column}.Toastify__toast-container--top-left{top:var(--toastify-toast-top);left:var(--toastify-toast-left)}.Toastify__toast-container--top-center{top:var(--toastify-toast-top);left:50%;transform:translate(-50%);align-items:center}.Toastify__toast-container--top-right{top:var(--toastify-toast-top);right:var(--toastify-toast-right);align-items:end}.Toastify__toast-container--bottom-left{bottom:var(--toastify-toast-bottom);left:var(--toastify-toast-left)}.Toastify__toast-container--bottom-center{bottom:var(--toastify-toast-bottom);left:50%;transform:translate(-50%);align-items:center}.Toastify__toast-container--bottom-right{bottom:var(--toastify-toast-bottom);right:var(--toastify-toast-right);align-items:end}.Toastify__toast{--y: 0;position:relative;touch-action:none;width:var(--toastify-toast-width);min-height:var(--toastify-toast-min-height);box-sizing:border-box;margin-bottom:1rem;padding:var(--toastify-toast-padding);border-radius:var(--toastify-toast-bd-radius);box-shadow:var(--toastify-toast-shadow);max-height:var(--toastify-toast-max-height);font-family:var(--toastify-font-family);z-index:0;display:flex;flex:1 auto;align-items:center;word-break:break-word}@media only screen and (max-width: 480px){.Toastify__toast-container{width:100vw;left:env(safe-area-inset-left);margin:0}.Toastify__toast-container--top-left,.Toastify__toast-container--top-center,.Toastify__toast-container--top-right{top:env(safe-area-inset-top);transform:translate(0)}.Toastify__toast-container--bottom-left,.Toastify__toast-container--bottom-center,.Toastify__toast-container--bottom-right{bottom:env(safe-area-inset-bottom);transform:translate(0)}.Toastify__toast-container--rtl{right:env(safe-area-inset-right);left:initial}.Toastify__toast{--toastify-toast-width: 100%;margin-bottom:0;border-radius:0}}.Toastify__toast-container[data-stacked=true]{width:var(--toastify-toast-width)}.Toastify__toast--stacked{position:absolute;width:100%;transform:translate3d(0,var(--y),0) scale(var(--s));transition:transform .3s}.Toastify__toast--stacked[data-collapsed] .Toastify__toast-body,.Toastify__toast--stacked[data-collapsed] .Toastify__close-button{transition:opacity .1s}.Toastify__toast--stacked[data-collapsed=false]{overflow:visible}.Toastify__toast--stacked[data-collapsed=true]:not(:last-child)>*{opacity:0}.Toastify__toast--stacked:after{content:"";position:absolute;left:0;right:0;height:calc(var(--g) * 1px);bottom:100%}.Toastify__toast--stacked[data-pos=top]{top:0}.Toastify__toast--stacked[data-pos=bot]{bottom:0}.Toastify__toast--stacked[data-pos=bot].Toastify__toast--stacked:before{transform-origin:top}.Toastify__toast--stacked[data-pos=top].Toastify__toast--stacked:before{transform-origin:bottom}.Toastify__toast--stacked:before{content:"";position:absolute;left:0;right:0;bottom:0;height:100%;transform:scaleY(3);z-index:-1}.Toastify__toast--rtl{direction:rtl}.Toastify__toast--close-on-click{cursor:pointer}.Toastify__toast-icon{margin-inline-end:10px;width:22px;flex-shrink:0;display:flex}.Toastify--animate{animation-fill-mode:both;animation-duration:.5s}.Toastify--animate-icon{animation-fill-mode:both;animation-duration:.3s}.Toastify__toast-theme--dark{background:var(--toastify-color-dark);color:var(--toastify-text-color-dark)}.Toastify__toast-theme--light,.Toastify__toast-theme--colored.Toastify__toast--default{background:var(--toastify-color-light);color:var(--toastify-text-color-light)}.Toastify__toast-theme--colored.Toastify__toast--info{color:var(--toastify-text-color-info);background:var(--toastify-color-info)}.Toastify__toast-theme--colored.Toastify__toast--success{color:var(--toastify-text-color-success);background:var(--toastify-color-success)}.Toastify__toast-theme--colored.Toastify__toast--warning{color:var(--toastify-text-color-warning);background:var(--toastify-color-warning)}.Toastify__toast-theme--colored.Toastify__toast--error{color:var(--toastify-text-color-error);background:var(--toastify-color-error)}.Toastify__progress-bar-theme--light{background:var(--toastify-color-progress-light)}.Toastify__progress-bar-theme--dark{background:var(--toastify-color-progress-dark)}.Toastify__progress-bar--info{background:var(--toastify-color-progress-info)}.Toastify__progress-bar--success{background:var(--toastify-color-progress-success)}.Toastify__progress-bar--warning{background:var(--toastify-color-progress-warning)}.Toastify__progress-bar--error{background:var(--toastify-color-progress-error)}.Toastify__progress-bar-theme--colored.Toastify__progress-bar--info,.Toastify__progress-bar-theme--colored.Toastify__progress-bar--success,.Toastify__progress-bar-theme--colored.Toastify__progress-bar--warning,.Toastify__progress-bar-theme--colored.Toastify__progress-bar--error{background:var(--toastify-color-transparent)}.Toastify__close-button{color:#fff;position:absolute;top:6px;right:6px;background:transparent;outline:none;border:none;padding:0;cursor:pointer;opacity:.7;transition:.3s ease;z-index:1}.Toastify__toast--rtl .Toastify__close-button{left:6px;right:unset}.Toastify__close-button--light{color:#000;opacity:.3}.Toastify__close-button>svg{fill:currentColor;height:16px;width:14px}.Toastify__close-button:hover,.Toastify__close-button:focus{opacity:1}@keyframes Toastify__trackProgress{0%{transform:scaleX(1)}to{transform:scaleX(0)}}.Toastify__progress-bar{position:absolute;bottom:0;left:0;width:100%;height:100%;z-index:1;opacity:.7;transform-origin:left}.Toastify__progress-bar--animated{animation:Toastify__trackProgress linear 1 forwards}.Toastify__progress-bar--controlled{transition:transform .2s}.Toastify__progress-bar--rtl{right:0;left:initial;transform-origin:right;border-bottom-left-radius:initial}.Toastify__progress-bar--wrp{position:absolute;overflow:hidden;bottom:0;left:0;width:100%;height:5px;border-bottom-left-radius:var(--toastify-toast-bd-radius);border-bottom-right-radius:var(--toastify-toast-bd-radius)}.Toastify__progress-bar--wrp[data-hidden=true]{opacity:0}.Toastify__progress-bar--bg{opacity:var(--toastify-color-progress-bgo);width:100%;height:100%}.Toastify__spinner{width:20px;height:20px;box-sizing:border-box;border:2px solid;border-radius:100%;border-color:var(--toastify-spinner-color-empty-area);border-right-color:var(--toastify-spinner-color);animation:Toastify__spin .65s linear infinite}@keyframes Toastify__bounceInRight{0%,60%,75%,90%,to{animation-timing-function:cubic-bezier(.215,.61,.355,1)}0%{opacity:0;transform:translate3d(3000px,0,0)}60%{opacity:1;transform:translate3d(-25px,0,0)}75%{transform:translate3d(10px,0,0)}90%{transform:translate3d(-5px,0,0)}to{transform:none}}@keyframes Toastify__bounceOutRight{20%{opacity:1;transform:translate3d(-20px,var(--y),0)}to{opacity:0;transform:translate3d(2000px,var(--y),0)}}@keyframes Toastify__bounceInLeft{0%,60%,75%,90%,to{animation-timing-function:cubic-bezier(.215,.61,.355,1)}0%{opacity:0;transform:translate3d(-3000px,0,0)}60%{opacity:1;transform:translate3d(25px,0,0)}75%{transform:translate3d(-10px,0,0)}90%{transform:translate3d(5px,0,0)}to{transform:none}}@keyframes Toastify__bounceOutLeft{20%{opacity:1;transform:translate3d(20px,var(--y),0)}to{opacity:0;transform:translate3d(-2000px,var(--y),0)}}@keyframes Toastify__bounceInUp{0%,60%,75%,90%,to{animation-timing-function:cubic-bezier(.215,.61,.355,1)}0%{opacity:0;transform:translate3d(0,3000px,0)}60%{opacity:1;transform:translate3d(0,-20px,0)}75%{transform:translate3d(0,10px,0)}90%{transform:translate3d(0,-5px,0)}to{transform:translateZ(0)}}@keyframes Toastify__bounceOutUp{20%{transform:translate3d(0,calc(var(--y) - 10px),0)}40%,45%{opacity:1;transform:translate3d(0,calc(var(--y) + 20px),0)}to{opacity:0;transform:translate3d(0,-2000px,0)}}@keyframes Toastify__bounceInDown{0%,60%,75%,90%,to{animation-timing-function:cubic-bezier(.215,.61,.355,1)}0%{opacity:0;transform:translate3d(0,-3000px,0)}60%{opacity:1;transform:translate3d(0,25px,0)}75%{transform:translate3d(0,-10px,0)}90%{transform:translate3d(0,5px,0)}to{transform:none}}@keyframes Toastify__bounceOutDown{20%{transform:translate3d(0,calc(var(--y) - 10px),0)}40%,45%{opacity:1;transform:translate3d(0,calc(var(--y) + 20px),0)}to{opacity:0;transform:translate3d(0,2000px,0)}}.Toastify__bounce-enter--top-left,.Toastify__bounce-enter--bottom-left{animation-name:Toastify__bounceInLeft}.Toastify__bounce-enter--top-right,.Toastify__bounce-enter--bottom-right{animation-name:Toastify__bounceInRight}.Toastify__bounce-enter--top-center{animation-name:Toastify__bounceInDown}.Toastify__bounce-enter--bottom-center{animation-name:Toastify__bounceInUp}.Toastify__bounce-exit--top-left,.Toastify__bounce-exit--bottom-left{animation-name:Toastify__bounceOutLeft}.Toastify__bounce-exit--top-right,.Toastify__bounce-exit--bottom-right{animation-name:Toastify__bounceOutRight}.Toastify__bounce-exit--top-center{animation-name:Toastify__bounceOutUp}.Toastify__bounce-exit--bottom-center{animation-name:Toastify__bounceOutDown}@keyframes Toastify__zoomIn{0%{opacity:0;transform:scale3d(.3,.3,.3)}50%{opacity:1}}@keyframes Toastify__zoomOut{0%{opacity:1}50%{opacity:0;transform:translate3d(0,var(--y),0) scale3d(.3,.3,.3)}to{opacity:0}}.Toastify__zoom-enter{animation-name:Toastify__zoomIn}.Toastify__zoom-exit{animation-name:Toastify__zoomOut}@keyframes Toastify__flipIn{0%{transform:perspective(400px) rotateX(90deg);animation-timing-function:ease-in;opacity:0}40%{transform:perspective(400px) rotateX(-20deg);animation-timing-function:ease-in}60%{transform:perspective(400px) rotateX(10deg);opacity:1}80%{transform:perspective(400px) rotateX(-5deg)}to{transform:perspective(400px)}}@keyframes Toastify__flipOut{0%{transform:translate3d(0,var(--y),0) perspective(400px)}30%{transform:translate3d(0,var(--y),0) perspective(400px) rotateX(-20deg);opacity:1}to{transform:translate3d(0,var(--y),0) perspective(400px) rotateX(90deg);opacity:0}}.Toastify__flip-enter{animation-name:Toastify__flipIn}.Toastify__flip-exit{animation-name:Toastify__flipOut}@keyframes Toastify__slideInRight{0%{transform:translate3d(110%,0,0);visibility:visible}to{transform:translate3d(0,var(--y),0)}}@keyframes Toastify__slideInLeft{0%{transform:translate3d(-110%,0,0);visibility:visible}to{transform:translate3d(0,var(--y),0)}}@keyframes Toastify__slideInUp{0%{transform:translate3d(0,110%,0);visibility:visible}to{transform:translate3d(0,var(--y),0)}}@keyframes Toastify__slideInDown{0%{transform:translate3d(0,-110%,0);visibility:visible}to{transform:translate3d(0,var(--y),0)}}@keyframes Toastify__slideOutRight{0%{transform:translate3d(0,var(--y),0)}to{visibility:hidden;transform:translate3d(110%,var(--y),0)}}@keyframes Toastify__slideOutLeft{0%{transform:translate3d(0,var(--y),0)}to{visibility:hidden;transform:translate3d(-110%,var(--y),0)}}@keyframes Toastify__slideOutDown{0%{transform:translate3d(0,var(--y),0)}to{visibility:hidden;transform:translate3d(0,500px,0)}}@keyframes Toastify__slideOutUp{0%{transform:translate3d(0,var(--y),0)}to{visibility:hidden;transform:translate3d(0,-500px,0)}}.Toastify__slide-enter--top-left,.Toastify__slide-enter--bottom-left{animation-name:Toastify__slideInLeft}.Toastify__slide-enter--top-right,.Toastify__slide-enter--bottom-right{animation-name:Toastify__slideInRight}.Toastify__slide-enter--top-center{animation-name:Toastify__slideInDown}.Toastify__slide-enter--bottom-center{animation-name:Toastify__slideInUp}.Toastify__slide-exit--top-left,.Toastify__slide-exit--bottom-left{animation-name:Toastify__slideOutLeft;animation-timing-function:ease-in;animation-duration:.3s}.Toastify__slide-exit--top-right,.Toastify__slide-exit--bottom-right{animation-name:Toastify__slideOutRight;animation-timing-function:ease-in;animation-duration:.3s}.Toastify__slide-exit--top-center{animation-name:Toastify__slideOutUp;animation-timing-function:ease-in;animation-duration:.3s}.Toastify__slide-exit--bottom-center{animation-name:Toastify__slideOutDown;animation-timing-function:ease-in;animation-duration:.3s}@keyframes Toastify__spin{0%{transform:rotate(0)}to{transform:rotate(360deg)}}\n');var n=t=>"number"==typeof t&&!isNaN(t),i=t=>"string"==typeof t,s=t=>"function"==typeof t,l=t=>(0,a.isValidElement)(t)||i(t)||s(t)||n(t);function d(t){let{enter:e,exit:o,appendPosition:r=!1,collapse:n=!0,collapseDuration:i=300}=t;return function(t){let{children:s,position:l,preventExitTransition:d,done:c,nodeRef:p,isIn:u,playToast:f}=t,m=r?"".concat(e,"--").concat(l):e,y=r?"".concat(o,"--").concat(l):o,v=(0,a.useRef)(0);return(0,a.useLayoutEffect)(()=>{let t=p.current,e=m.split(" "),o=r=>{r.target===p.current&&(f(),t.removeEventListener("animationend",o),t.removeEventListener("animationcancel",o),0===v.current&&"animationcancel"!==r.type&&t.classList.remove(...e))};t.classList.add(...e),t.addEventListener("animationend",o),t.addEventListener("animationcancel",o)},[]),(0,a.useEffect)(()=>{let t=p.current,e=()=>{t.removeEventListener("animationend",e),n?function(t,e){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:300,{scrollHeight:r,style:a}=t;requestAnimationFrame(()=>{a.minHeight="initial",a.height=r+"px",a.transition="all ".concat(o,"ms"),requestAnimationFrame(()=>{a.height="0",a.padding="0",a.margin="0",setTimeout(e,o)})})}(t,c,i):c()};u||(d?e():(v.current=1,t.className+=" ".concat(y),t.addEventListener("animationend",e)))},[u]),a.createElement(a.Fragment,null,s)}}var c=1,p=()=>"".concat(c++);var u=new Map,f=[],m=new Set,y=()=>u.size>0;function v(t,e){var o;if(e)return!(null==(o=u.get(e))||!o.isToastActive(t));let r=!1;return u.forEach(e=>{e.isToastActive(t)&&(r=!0)}),r}function h(t){if(y()){if(null==t||(t=>i(t)||n(t))(t))u.forEach(e=>{e.removeToast(t)});else if(t&&("containerId"in t||"id"in t)){let e=u.get(t.containerId);e?e.removeToast(t.id):u.forEach(e=>{e.removeToast(t.id)})}}else f=f.filter(e=>null!=t&&e.options.toastId!==t)}function g(t,e){l(t)&&(y()||f.push({content:t,options:e}),u.forEach(o=>{o.buildToast(t,e)}))}function b(t,e){u.forEach(o=>{(null==e||null==e||!e.containerId||(null==e?void 0:e.containerId)===o.id)&&o.toggle(t,null==e?void 0:e.id)})}function A(t){return t&&(i(t.toastId)||n(t.toastId))?t.toastId:p()}function x(t,e){return g(t,e),e.toastId}function w(t,e){return(0,r.A)((0,r.A)({},e),{},{type:e&&e.type||t,toastId:A(e)})}function _(t){return(e,o)=>x(e,w(t,o))}function S(t,e){return x(t,w("default",e))}S.loading=(t,e)=>x(t,w("default",(0,r.A)({isLoading:!0,autoClose:!1,closeOnClick:!1,closeButton:!1,draggable:!1},e))),S.promise=function(t,e,o){let a,{pending:n,error:l,success:d}=e;n&&(a=i(n)?S.loading(n,o):S.loading(n.render,(0,r.A)((0,r.A)({},o),n)));let c={isLoading:null,autoClose:null,closeOnClick:null,closeButton:null,draggable:null},p=(t,e,n)=>{if(null==e)return void S.dismiss(a);let s=(0,r.A)((0,r.A)((0,r.A)({type:t},c),o),{},{data:n}),l=i(e)?{render:e}:e;return a?S.update(a,(0,r.A)((0,r.A)({},s),l)):S(l.render,(0,r.A)((0,r.A)({},s),l)),n},u=s(t)?t():t;return u.then(t=>p("success",d,t)).catch(t=>p("error",l,t)),u},S.success=_("success"),S.info=_("info"),S.error=_("error"),S.warning=_("warning"),S.warn=S.warning,S.dark=(t,e)=>x(t,w("default",(0,r.A)({theme:"dark"},e))),S.dismiss=function(t){h(t)},S.clearWaitingQueue=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};u.forEach(e=>{e.props.limit&&(!t.containerId||e.id===t.containerId)&&e.clearQueue()})},S.isActive=v,S.update=function(t){let e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},o=((t,e)=>{let{containerId:o}=e;var r;return null==(r=u.get(o||1))?void 0:r.toasts.get(t)})(t,e);if(o){let{props:a,content:n}=o,i=(0,r.A)((0,r.A)((0,r.A)({delay:100},a),e),{},{toastId:e.toastId||t,updateId:p()});i.toastId!==t&&(i.staleId=t);let s=i.render||n;delete i.render,x(s,i)}},S.done=t=>{S.update(t,{progress:1})},S.onChange=function(t){return m.add(t),()=>{m.delete(t)}},S.play=t=>b(!0,t),S.pause=t=>b(!1,t);"undefined"!=typeof window?a.useLayoutEffect:a.useEffect;var T=function(t){let e=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return{enter:"Toastify--animate Toastify__".concat(t,"-enter"),exit:"Toastify--animate Toastify__".concat(t,"-exit"),appendPosition:e}};d(T("bounce",!0)),d(T("slide",!0)),d(T("zoom")),d(T("flip"))},7605:(t,e,o)=>{o.d(e,{A:()=>c});var r=o(9379),a=o(45),n=o(1767),i=o(8211),s=o(6155),l=o(1033);const d=["elementType","externalSlotProps","ownerState","skipResolvingSlotProps"];const c=function(t){var e;const{elementType:o,externalSlotProps:c,ownerState:p,skipResolvingSlotProps:u=!1}=t,f=(0,a.A)(t,d),m=u?{}:(0,l.A)(c,p),{props:y,internalRef:v}=(0,s.A)((0,r.A)((0,r.A)({},f),{},{externalSlotProps:m})),h=(0,n.A)(v,null===m||void 0===m?void 0:m.ref,null===(e=t.additionalProps)||void 0===e?void 0:e.ref);return(0,i.A)(o,(0,r.A)((0,r.A)({},y),{},{ref:h}),p)}},8619:(t,e,o)=>{o.d(e,{A:()=>l,B:()=>s});var r=o(9379),a=o(9857),n=o(6061),i=o(8031);function s(t){return(0,n.Ay)("MuiInput",t)}const l=(0,r.A)((0,r.A)({},i.A),(0,a.A)("MuiInput",["root","underline","input"]))},8850:(t,e,o)=>{o.d(e,{A:()=>n});o(5043);var r=o(9992),a=o(579);const n=(0,r.A)((0,a.jsx)("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown")},9067:(t,e,o)=>{o.d(e,{A:()=>P});var r=o(45),a=o(9379),n=o(5043),i=o(1807),s=o(8387),l=o(7566),d=o(8700),c=o(7194),p=o(8128),u=o(1612),f=o(4412),m=o(8301),y=o(9857),v=o(6061);function h(t){return(0,v.Ay)("MuiFormLabel",t)}const g=(0,y.A)("MuiFormLabel",["root","colorSecondary","focused","disabled","error","filled","required","asterisk"]);var b=o(579);const A=["children","className","color","component","disabled","error","filled","focused","required"],x=(0,p.Ay)("label",{name:"MuiFormLabel",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[e.root,"secondary"===o.color&&e.colorSecondary,o.filled&&e.filled]}})((0,u.A)(t=>{let{theme:e}=t;return(0,a.A)((0,a.A)({color:(e.vars||e).palette.text.secondary},e.typography.body1),{},{lineHeight:"1.4375em",padding:0,position:"relative",variants:[...Object.entries(e.palette).filter((0,f.A)()).map(t=>{let[o]=t;return{props:{color:o},style:{["&.".concat(g.focused)]:{color:(e.vars||e).palette[o].main}}}}),{props:{},style:{["&.".concat(g.disabled)]:{color:(e.vars||e).palette.text.disabled},["&.".concat(g.error)]:{color:(e.vars||e).palette.error.main}}}]})})),w=(0,p.Ay)("span",{name:"MuiFormLabel",slot:"Asterisk"})((0,u.A)(t=>{let{theme:e}=t;return{["&.".concat(g.error)]:{color:(e.vars||e).palette.error.main}}})),_=n.forwardRef(function(t,e){const o=(0,m.b)({props:t,name:"MuiFormLabel"}),{children:n,className:p,color:u,component:f="label",disabled:y,error:v,filled:g,focused:_,required:S}=o,T=(0,r.A)(o,A),k=(0,d.A)(),I=(0,l.A)({props:o,muiFormControl:k,states:["color","required","focused","disabled","error","filled"]}),P=(0,a.A)((0,a.A)({},o),{},{color:I.color||"primary",component:f,disabled:I.disabled,error:I.error,filled:I.filled,focused:I.focused,required:I.required}),C=(t=>{const{classes:e,color:o,focused:r,disabled:a,error:n,filled:s,required:l}=t,d={root:["root","color".concat((0,c.A)(o)),a&&"disabled",n&&"error",s&&"filled",r&&"focused",l&&"required"],asterisk:["asterisk",n&&"error"]};return(0,i.A)(d,h,e)})(P);return(0,b.jsxs)(x,(0,a.A)((0,a.A)({as:f,ownerState:P,className:(0,s.A)(C.root,p),ref:e},T),{},{children:[n,I.required&&(0,b.jsxs)(w,{ownerState:P,"aria-hidden":!0,className:C.asterisk,children:["\u2009","*"]})]}))});var S=o(2466);function T(t){return(0,v.Ay)("MuiInputLabel",t)}(0,y.A)("MuiInputLabel",["root","focused","disabled","error","required","asterisk","formControl","sizeSmall","shrink","animated","standard","filled","outlined"]);const k=["disableAnimation","margin","shrink","variant","className"],I=(0,p.Ay)(_,{shouldForwardProp:t=>(0,S.A)(t)||"classes"===t,name:"MuiInputLabel",slot:"Root",overridesResolver:(t,e)=>{const{ownerState:o}=t;return[{["& .".concat(g.asterisk)]:e.asterisk},e.root,o.formControl&&e.formControl,"small"===o.size&&e.sizeSmall,o.shrink&&e.shrink,!o.disableAnimation&&e.animated,o.focused&&e.focused,e[o.variant]]}})((0,u.A)(t=>{let{theme:e}=t;return{display:"block",transformOrigin:"top left",whiteSpace:"nowrap",overflow:"hidden",textOverflow:"ellipsis",maxWidth:"100%",variants:[{props:t=>{let{ownerState:e}=t;return e.formControl},style:{position:"absolute",left:0,top:0,transform:"translate(0, 20px) scale(1)"}},{props:{size:"small"},style:{transform:"translate(0, 17px) scale(1)"}},{props:t=>{let{ownerState:e}=t;return e.shrink},style:{transform:"translate(0, -1.5px) scale(0.75)",transformOrigin:"top left",maxWidth:"133%"}},{props:t=>{let{ownerState:e}=t;return!e.disableAnimation},style:{transition:e.transitions.create(["color","transform","max-width"],{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut})}},{props:{variant:"filled"},style:{zIndex:1,pointerEvents:"none",transform:"translate(12px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"}},{props:{variant:"filled",size:"small"},style:{transform:"translate(12px, 13px) scale(1)"}},{props:t=>{let{variant:e,ownerState:o}=t;return"filled"===e&&o.shrink},style:{userSelect:"none",pointerEvents:"auto",transform:"translate(12px, 7px) scale(0.75)",maxWidth:"calc(133% - 24px)"}},{props:t=>{let{variant:e,ownerState:o,size:r}=t;return"filled"===e&&o.shrink&&"small"===r},style:{transform:"translate(12px, 4px) scale(0.75)"}},{props:{variant:"outlined"},style:{zIndex:1,pointerEvents:"none",transform:"translate(14px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"}},{props:{variant:"outlined",size:"small"},style:{transform:"translate(14px, 9px) scale(1)"}},{props:t=>{let{variant:e,ownerState:o}=t;return"outlined"===e&&o.shrink},style:{userSelect:"none",pointerEvents:"auto",maxWidth:"calc(133% - 32px)",transform:"translate(14px, -9px) scale(0.75)"}}]}})),P=n.forwardRef(function(t,e){const o=(0,m.b)({name:"MuiInputLabel",props:t}),{disableAnimation:n=!1,margin:p,shrink:u,variant:f,className:y}=o,v=(0,r.A)(o,k),h=(0,d.A)();let g=u;"undefined"===typeof g&&h&&(g=h.filled||h.focused||h.adornedStart);const A=(0,l.A)({props:o,muiFormControl:h,states:["size","variant","required","focused"]}),x=(0,a.A)((0,a.A)({},o),{},{disableAnimation:n,formControl:h,shrink:g,size:A.size,variant:A.variant,required:A.required,focused:A.focused}),w=(t=>{const{classes:e,formControl:o,size:r,shrink:n,disableAnimation:s,variant:l,required:d}=t,p={root:["root",o&&"formControl",!s&&"animated",n&&"shrink",r&&"medium"!==r&&"size".concat((0,c.A)(r)),l],asterisk:[d&&"asterisk"]},u=(0,i.A)(p,T,e);return(0,a.A)((0,a.A)({},e),u)})(x);return(0,b.jsx)(I,(0,a.A)((0,a.A)({"data-shrink":g,ref:e,className:(0,s.A)(w.root,y)},v),{},{ownerState:x,classes:w}))})}}]);
-//# sourceMappingURL=615.0147b820.chunk.js.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[684],{1684:(e,s,t)=>{t.r(s),t.d(s,{default:()=>b});var r=t(5043),n=t(9722),c=t(3969),l=t(172),i=t(5895),a=t(998),o=t(1244),d=t(6128),h=t(5315),x=t(2394),m=t(6185),j=t(3759),A=t(9992),u=t(579);const p=(0,A.A)((0,u.jsx)("path",{d:"m16 6 2.29 2.29-4.88 4.88-4-4L2 16.59 3.41 18l6-6 4 4 6.3-6.29L22 12V6z"}),"TrendingUp"),g=(0,A.A)((0,u.jsx)("path",{d:"M16.5 13c-1.2 0-3.07.34-4.5 1-1.43-.67-3.3-1-4.5-1C5.33 13 1 14.08 1 16.25V19h22v-2.75c0-2.17-4.33-3.25-6.5-3.25m-4 4.5h-10v-1.25c0-.54 2.56-1.75 5-1.75s5 1.21 5 1.75zm9 0H14v-1.25c0-.46-.2-.86-.52-1.22.88-.3 1.96-.53 3.02-.53 2.44 0 5 1.21 5 1.75zM7.5 12c1.93 0 3.5-1.57 3.5-3.5S9.43 5 7.5 5 4 6.57 4 8.5 5.57 12 7.5 12m0-5.5c1.1 0 2 .9 2 2s-.9 2-2 2-2-.9-2-2 .9-2 2-2m9 5.5c1.93 0 3.5-1.57 3.5-3.5S18.43 5 16.5 5 13 6.57 13 8.5s1.57 3.5 3.5 3.5m0-5.5c1.1 0 2 .9 2 2s-.9 2-2 2-2-.9-2-2 .9-2 2-2"}),"PeopleOutline"),y=(0,A.A)((0,u.jsx)("path",{d:"M15.55 13c.75 0 1.41-.41 1.75-1.03l3.58-6.49c.37-.66-.11-1.48-.87-1.48H5.21l-.94-2H1v2h2l3.6 7.59-1.35 2.44C4.52 15.37 5.48 17 7 17h12v-2H7l1.1-2zM6.16 6h12.15l-2.76 5H8.53zM7 18c-1.1 0-1.99.9-1.99 2S5.9 22 7 22s2-.9 2-2-.9-2-2-2m10 0c-1.1 0-1.99.9-1.99 2s.89 2 1.99 2 2-.9 2-2-.9-2-2-2"}),"ShoppingCartOutlined"),v=(0,A.A)((0,u.jsx)("path",{d:"M11.8 10.9c-2.27-.59-3-1.2-3-2.15 0-1.09 1.01-1.85 2.7-1.85 1.78 0 2.44.85 2.5 2.1h2.21c-.07-1.72-1.12-3.3-3.21-3.81V3h-3v2.16c-1.94.42-3.5 1.68-3.5 3.61 0 2.31 1.91 3.46 4.7 4.13 2.5.6 3 1.48 3 2.41 0 .69-.49 1.79-2.7 1.79-2.06 0-2.87-.92-2.98-2.1h-2.2c.12 2.19 1.76 3.42 3.68 3.83V21h3v-2.15c1.95-.37 3.5-1.5 3.5-3.55 0-2.84-2.43-3.81-4.7-4.4"}),"AttachMoney"),f=(0,A.A)([(0,u.jsx)("path",{d:"M20 2H4c-1 0-2 .9-2 2v3.01c0 .72.43 1.34 1 1.69V20c0 1.1 1.1 2 2 2h14c.9 0 2-.9 2-2V8.7c.57-.35 1-.97 1-1.69V4c0-1.1-1-2-2-2m-1 18H5V9h14zm1-13H4V4h16z"},"0"),(0,u.jsx)("path",{d:"M9 12h6v2H9z"},"1")],"Inventory2Outlined"),_=[{date:"Jan",sales:2e3},{date:"Feb",sales:2200},{date:"Mar",sales:2500},{date:"Apr",sales:2300},{date:"May",sales:2800},{date:"Jun",sales:3e3}];const b=function(){const[e,s]=(0,r.useState)(null),[t,A]=(0,r.useState)(!0),[b,S]=(0,r.useState)(null);return(0,r.useEffect)(()=>{n.A.get("http://localhost:8000/api/dashboard/").then(e=>{s(e.data),A(!1)}).catch(e=>{console.error("Error fetching dashboard stats:",e),S("Failed to load dashboard data."),A(!1)})},[]),t?(0,u.jsx)(c.A,{sx:{display:"flex",justifyContent:"center",alignItems:"center",height:"80vh"},children:(0,u.jsx)(l.A,{})}):b?(0,u.jsx)(c.A,{sx:{p:3,textAlign:"center",color:"error.main"},children:(0,u.jsx)(i.A,{variant:"h6",children:b})}):(0,u.jsxs)(c.A,{sx:{flexGrow:1,p:3},children:[(0,u.jsx)(i.A,{variant:"h2",gutterBottom:!0,children:"\ud83d\udcca Dashboard"}),(0,u.jsxs)(a.A,{container:!0,spacing:3,children:[(0,u.jsx)(a.A,{item:!0,xs:12,sm:6,md:4,lg:3,children:(0,u.jsxs)(o.A,{sx:{display:"flex",alignItems:"center",p:2,height:"100%"},children:[(0,u.jsx)(v,{color:"primary",sx:{fontSize:40,mr:2}}),(0,u.jsxs)(c.A,{children:[(0,u.jsx)(i.A,{variant:"subtitle1",color:"text.secondary",children:"Total Outstanding Credit"}),(0,u.jsxs)(i.A,{variant:"h5",children:["\u20b9",e.total_outstanding_credit.toFixed(2)]})]})]})}),(0,u.jsx)(a.A,{item:!0,xs:12,sm:6,md:4,lg:3,children:(0,u.jsxs)(o.A,{sx:{display:"flex",alignItems:"center",p:2,height:"100%"},children:[(0,u.jsx)(f,{color:"secondary",sx:{fontSize:40,mr:2}}),(0,u.jsxs)(c.A,{children:[(0,u.jsx)(i.A,{variant:"subtitle1",color:"text.secondary",children:"Total Product Variants"}),(0,u.jsx)(i.A,{variant:"h5",children:e.low_stock_items.length>0?"...":"N/A"})]})]})}),(0,u.jsx)(a.A,{item:!0,xs:12,sm:6,md:4,lg:3,children:(0,u.jsxs)(o.A,{sx:{display:"flex",alignItems:"center",p:2,height:"100%"},children:[(0,u.jsx)(g,{color:"info",sx:{fontSize:40,mr:2}}),(0,u.jsxs)(c.A,{children:[(0,u.jsx)(i.A,{variant:"subtitle1",color:"text.secondary",children:"Total Customers"}),(0,u.jsx)(i.A,{variant:"h5",children:e.top_customers_by_credit.length>0?"...":"N/A"})]})]})}),(0,u.jsx)(a.A,{item:!0,xs:12,sm:6,md:4,lg:3,children:(0,u.jsxs)(o.A,{sx:{display:"flex",alignItems:"center",p:2,height:"100%"},children:[(0,u.jsx)(y,{color:"success",sx:{fontSize:40,mr:2}}),(0,u.jsxs)(c.A,{children:[(0,u.jsx)(i.A,{variant:"subtitle1",color:"text.secondary",children:"Total Sales (Month)"}),(0,u.jsxs)(i.A,{variant:"h5",children:["\u20b9",_[_.length-1].sales]})]})]})}),(0,u.jsx)(a.A,{item:!0,xs:12,lg:8,children:(0,u.jsx)(o.A,{children:(0,u.jsxs)(d.A,{children:[(0,u.jsx)(i.A,{variant:"h3",gutterBottom:!0,children:"Recent Sales Trend"}),(0,u.jsx)(c.A,{sx:{height:300,display:"flex",alignItems:"center",justifyContent:"center",bgcolor:"background.default",borderRadius:1},children:(0,u.jsxs)(i.A,{variant:"h4",color:"text.secondary",children:["Graph Placeholder ",(0,u.jsx)(p,{sx:{fontSize:30,verticalAlign:"middle"}})]})}),(0,u.jsx)(i.A,{variant:"caption",display:"block",sx:{mt:1,color:"text.secondary"},children:"This is a placeholder for a sales trend graph."})]})})}),(0,u.jsx)(a.A,{item:!0,xs:12,md:6,lg:4,children:(0,u.jsx)(o.A,{sx:{height:"100%"},children:(0,u.jsxs)(d.A,{children:[(0,u.jsx)(i.A,{variant:"h3",gutterBottom:!0,children:"Low Stock Items"}),e.low_stock_items&&e.low_stock_items.length>0?(0,u.jsx)(h.A,{dense:!0,children:e.low_stock_items.map(e=>(0,u.jsxs)(x.Ay,{divider:!0,children:[(0,u.jsx)(m.A,{primary:"".concat(e.product_name," (").concat(e.name,")"),secondary:"Current Stock: ".concat(e.current_stock)}),(0,u.jsx)(j.A,{label:"Low",color:"warning",size:"small"})]},e.id))}):(0,u.jsx)(i.A,{color:"text.secondary",sx:{mt:2},children:"No items are currently low in stock."})]})})}),(0,u.jsx)(a.A,{item:!0,xs:12,md:6,lg:4,children:(0,u.jsx)(o.A,{sx:{height:"100%"},children:(0,u.jsxs)(d.A,{children:[(0,u.jsx)(i.A,{variant:"h3",gutterBottom:!0,children:"Top Customers by Credit"}),e.top_customers_by_credit&&e.top_customers_by_credit.length>0?(0,u.jsx)(h.A,{dense:!0,children:e.top_customers_by_credit.map((e,s)=>(0,u.jsxs)(x.Ay,{divider:!0,children:[(0,u.jsx)(m.A,{primary:e.name}),(0,u.jsx)(j.A,{label:"\u20b9".concat(e.balance.toFixed(2)),color:"error",size:"small"})]},s))}):(0,u.jsx)(i.A,{color:"text.secondary",sx:{mt:2},children:"No customers with outstanding credit."})]})})})]})]})}}}]);
-//# sourceMappingURL=684.0cc9096f.chunk.js.map
\ No newline at end of file
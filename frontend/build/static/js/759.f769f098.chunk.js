@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[759],{3759:(e,o,a)=>{a.d(o,{A:()=>z});var t=a(9379),l=a(45),c=a(5043),r=a(8387),n=a(1807),i=a(9992),s=a(579);const d=(0,i.A)((0,s.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");var p=a(8348),v=a(7194),m=a(9699),u=a(8128),b=a(1612),y=a(4412),g=a(8301),h=a(9857),C=a(6061);function f(e){return(0,C.Ay)("MuiChip",e)}const A=(0,h.A)("MuiChip",["root","sizeSmall","sizeMedium","colorDefault","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","disabled","clickable","clickableColorPrimary","clickableColorSecondary","deletable","deletableColorPrimary","deletableColorSecondary","outlined","filled","outlinedPrimary","outlinedSecondary","filledPrimary","filledSecondary","avatar","avatarSmall","avatarMedium","avatarColorPrimary","avatarColorSecondary","icon","iconSmall","iconMedium","iconColorPrimary","iconColorSecondary","label","labelSmall","labelMedium","deleteIcon","deleteIconSmall","deleteIconMedium","deleteIconColorPrimary","deleteIconColorSecondary","deleteIconOutlinedColorPrimary","deleteIconOutlinedColorSecondary","deleteIconFilledColorPrimary","deleteIconFilledColorSecondary","focusVisible"]);var k=a(9905);const I=["avatar","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant","tabIndex","skipFocusWhenDisabled","slots","slotProps"],S=(0,u.Ay)("div",{name:"MuiChip",slot:"Root",overridesResolver:(e,o)=>{const{ownerState:a}=e,{color:t,iconColor:l,clickable:c,onDelete:r,size:n,variant:i}=a;return[{["& .".concat(A.avatar)]:o.avatar},{["& .".concat(A.avatar)]:o["avatar".concat((0,v.A)(n))]},{["& .".concat(A.avatar)]:o["avatarColor".concat((0,v.A)(t))]},{["& .".concat(A.icon)]:o.icon},{["& .".concat(A.icon)]:o["icon".concat((0,v.A)(n))]},{["& .".concat(A.icon)]:o["iconColor".concat((0,v.A)(l))]},{["& .".concat(A.deleteIcon)]:o.deleteIcon},{["& .".concat(A.deleteIcon)]:o["deleteIcon".concat((0,v.A)(n))]},{["& .".concat(A.deleteIcon)]:o["deleteIconColor".concat((0,v.A)(t))]},{["& .".concat(A.deleteIcon)]:o["deleteIcon".concat((0,v.A)(i),"Color").concat((0,v.A)(t))]},o.root,o["size".concat((0,v.A)(n))],o["color".concat((0,v.A)(t))],c&&o.clickable,c&&"default"!==t&&o["clickableColor".concat((0,v.A)(t),")")],r&&o.deletable,r&&"default"!==t&&o["deletableColor".concat((0,v.A)(t))],o[i],o["".concat(i).concat((0,v.A)(t))]]}})((0,b.A)(e=>{let{theme:o}=e;const a="light"===o.palette.mode?o.palette.grey[700]:o.palette.grey[300];return{maxWidth:"100%",fontFamily:o.typography.fontFamily,fontSize:o.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,lineHeight:1.5,color:(o.vars||o).palette.text.primary,backgroundColor:(o.vars||o).palette.action.selected,borderRadius:16,whiteSpace:"nowrap",transition:o.transitions.create(["background-color","box-shadow"]),cursor:"unset",outline:0,textDecoration:"none",border:0,padding:0,verticalAlign:"middle",boxSizing:"border-box",["&.".concat(A.disabled)]:{opacity:(o.vars||o).palette.action.disabledOpacity,pointerEvents:"none"},["& .".concat(A.avatar)]:{marginLeft:5,marginRight:-6,width:24,height:24,color:o.vars?o.vars.palette.Chip.defaultAvatarColor:a,fontSize:o.typography.pxToRem(12)},["& .".concat(A.avatarColorPrimary)]:{color:(o.vars||o).palette.primary.contrastText,backgroundColor:(o.vars||o).palette.primary.dark},["& .".concat(A.avatarColorSecondary)]:{color:(o.vars||o).palette.secondary.contrastText,backgroundColor:(o.vars||o).palette.secondary.dark},["& .".concat(A.avatarSmall)]:{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:o.typography.pxToRem(10)},["& .".concat(A.icon)]:{marginLeft:5,marginRight:-6},["& .".concat(A.deleteIcon)]:{WebkitTapHighlightColor:"transparent",color:o.alpha((o.vars||o).palette.text.primary,.26),fontSize:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:o.alpha((o.vars||o).palette.text.primary,.4)}},variants:[{props:{size:"small"},style:{height:24,["& .".concat(A.icon)]:{fontSize:18,marginLeft:4,marginRight:-4},["& .".concat(A.deleteIcon)]:{fontSize:16,marginRight:4,marginLeft:-4}}},...Object.entries(o.palette).filter((0,y.A)(["contrastText"])).map(e=>{let[a]=e;return{props:{color:a},style:{backgroundColor:(o.vars||o).palette[a].main,color:(o.vars||o).palette[a].contrastText,["& .".concat(A.deleteIcon)]:{color:o.alpha((o.vars||o).palette[a].contrastText,.7),"&:hover, &:active":{color:(o.vars||o).palette[a].contrastText}}}}}),{props:e=>e.iconColor===e.color,style:{["& .".concat(A.icon)]:{color:o.vars?o.vars.palette.Chip.defaultIconColor:a}}},{props:e=>e.iconColor===e.color&&"default"!==e.color,style:{["& .".concat(A.icon)]:{color:"inherit"}}},{props:{onDelete:!0},style:{["&.".concat(A.focusVisible)]:{backgroundColor:o.alpha((o.vars||o).palette.action.selected,"".concat((o.vars||o).palette.action.selectedOpacity," + ").concat((o.vars||o).palette.action.focusOpacity))}}},...Object.entries(o.palette).filter((0,y.A)(["dark"])).map(e=>{let[a]=e;return{props:{color:a,onDelete:!0},style:{["&.".concat(A.focusVisible)]:{background:(o.vars||o).palette[a].dark}}}}),{props:{clickable:!0},style:{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover":{backgroundColor:o.alpha((o.vars||o).palette.action.selected,"".concat((o.vars||o).palette.action.selectedOpacity," + ").concat((o.vars||o).palette.action.hoverOpacity))},["&.".concat(A.focusVisible)]:{backgroundColor:o.alpha((o.vars||o).palette.action.selected,"".concat((o.vars||o).palette.action.selectedOpacity," + ").concat((o.vars||o).palette.action.focusOpacity))},"&:active":{boxShadow:(o.vars||o).shadows[1]}}},...Object.entries(o.palette).filter((0,y.A)(["dark"])).map(e=>{let[a]=e;return{props:{color:a,clickable:!0},style:{["&:hover, &.".concat(A.focusVisible)]:{backgroundColor:(o.vars||o).palette[a].dark}}}}),{props:{variant:"outlined"},style:{backgroundColor:"transparent",border:o.vars?"1px solid ".concat(o.vars.palette.Chip.defaultBorder):"1px solid ".concat("light"===o.palette.mode?o.palette.grey[400]:o.palette.grey[700]),["&.".concat(A.clickable,":hover")]:{backgroundColor:(o.vars||o).palette.action.hover},["&.".concat(A.focusVisible)]:{backgroundColor:(o.vars||o).palette.action.focus},["& .".concat(A.avatar)]:{marginLeft:4},["& .".concat(A.avatarSmall)]:{marginLeft:2},["& .".concat(A.icon)]:{marginLeft:4},["& .".concat(A.iconSmall)]:{marginLeft:2},["& .".concat(A.deleteIcon)]:{marginRight:5},["& .".concat(A.deleteIconSmall)]:{marginRight:3}}},...Object.entries(o.palette).filter((0,y.A)()).map(e=>{let[a]=e;return{props:{variant:"outlined",color:a},style:{color:(o.vars||o).palette[a].main,border:"1px solid ".concat(o.alpha((o.vars||o).palette[a].main,.7)),["&.".concat(A.clickable,":hover")]:{backgroundColor:o.alpha((o.vars||o).palette[a].main,(o.vars||o).palette.action.hoverOpacity)},["&.".concat(A.focusVisible)]:{backgroundColor:o.alpha((o.vars||o).palette[a].main,(o.vars||o).palette.action.focusOpacity)},["& .".concat(A.deleteIcon)]:{color:o.alpha((o.vars||o).palette[a].main,.7),"&:hover, &:active":{color:(o.vars||o).palette[a].main}}}}})]}})),x=(0,u.Ay)("span",{name:"MuiChip",slot:"Label",overridesResolver:(e,o)=>{const{ownerState:a}=e,{size:t}=a;return[o.label,o["label".concat((0,v.A)(t))]]}})({overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap",variants:[{props:{variant:"outlined"},style:{paddingLeft:11,paddingRight:11}},{props:{size:"small"},style:{paddingLeft:8,paddingRight:8}},{props:{size:"small",variant:"outlined"},style:{paddingLeft:7,paddingRight:7}}]});function w(e){return"Backspace"===e.key||"Delete"===e.key}const z=c.forwardRef(function(e,o){const a=(0,g.b)({props:e,name:"MuiChip"}),{avatar:i,className:u,clickable:b,color:y="default",component:h,deleteIcon:C,disabled:A=!1,icon:z,label:R,onClick:P,onDelete:D,onKeyDown:O,onKeyUp:L,size:T="medium",variant:V="filled",tabIndex:N,skipFocusWhenDisabled:M=!1,slots:j={},slotProps:E={}}=a,F=(0,l.A)(a,I),K=c.useRef(null),W=(0,p.A)(K,o),U=e=>{e.stopPropagation(),D&&D(e)},H=!(!1===b||!P)||b,B=H||D?m.A:h||"div",q=(0,t.A)((0,t.A)({},a),{},{component:B,disabled:A,size:T,color:y,iconColor:c.isValidElement(z)&&z.props.color||y,onDelete:!!D,clickable:H,variant:V}),G=(e=>{const{classes:o,disabled:a,size:t,color:l,iconColor:c,onDelete:r,clickable:i,variant:s}=e,d={root:["root",s,a&&"disabled","size".concat((0,v.A)(t)),"color".concat((0,v.A)(l)),i&&"clickable",i&&"clickableColor".concat((0,v.A)(l)),r&&"deletable",r&&"deletableColor".concat((0,v.A)(l)),"".concat(s).concat((0,v.A)(l))],label:["label","label".concat((0,v.A)(t))],avatar:["avatar","avatar".concat((0,v.A)(t)),"avatarColor".concat((0,v.A)(l))],icon:["icon","icon".concat((0,v.A)(t)),"iconColor".concat((0,v.A)(c))],deleteIcon:["deleteIcon","deleteIcon".concat((0,v.A)(t)),"deleteIconColor".concat((0,v.A)(l)),"deleteIcon".concat((0,v.A)(s),"Color").concat((0,v.A)(l))]};return(0,n.A)(d,f,o)})(q),J=B===m.A?(0,t.A)({component:h||"div",focusVisibleClassName:G.focusVisible},D&&{disableRipple:!0}):{};let Q=null;D&&(Q=C&&c.isValidElement(C)?c.cloneElement(C,{className:(0,r.A)(C.props.className,G.deleteIcon),onClick:U}):(0,s.jsx)(d,{className:G.deleteIcon,onClick:U}));let X=null;i&&c.isValidElement(i)&&(X=c.cloneElement(i,{className:(0,r.A)(G.avatar,i.props.className)}));let Y=null;z&&c.isValidElement(z)&&(Y=c.cloneElement(z,{className:(0,r.A)(G.icon,z.props.className)}));const Z={slots:j,slotProps:E},[$,_]=(0,k.A)("root",{elementType:S,externalForwardedProps:(0,t.A)((0,t.A)({},Z),F),ownerState:q,shouldForwardComponentProp:!0,ref:W,className:(0,r.A)(G.root,u),additionalProps:(0,t.A)({disabled:!(!H||!A)||void 0,tabIndex:M&&A?-1:N},J),getSlotProps:e=>(0,t.A)((0,t.A)({},e),{},{onClick:o=>{var a;null===(a=e.onClick)||void 0===a||a.call(e,o),null===P||void 0===P||P(o)},onKeyDown:o=>{var a;null===(a=e.onKeyDown)||void 0===a||a.call(e,o),(e=>{e.currentTarget===e.target&&w(e)&&e.preventDefault(),O&&O(e)})(o)},onKeyUp:o=>{var a;null===(a=e.onKeyUp)||void 0===a||a.call(e,o),(e=>{e.currentTarget===e.target&&D&&w(e)&&D(e),L&&L(e)})(o)}})}),[ee,oe]=(0,k.A)("label",{elementType:x,externalForwardedProps:Z,ownerState:q,className:G.label});return(0,s.jsxs)($,(0,t.A)((0,t.A)({as:B},_),{},{children:[X||Y,(0,s.jsx)(ee,(0,t.A)((0,t.A)({},oe),{},{children:R})),Q]}))})}}]);
-//# sourceMappingURL=759.f769f098.chunk.js.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-"use strict";(self.webpackChunkfrontend=self.webpackChunkfrontend||[]).push([[940],{1911:(e,o,t)=>{t.d(o,{A:()=>x});var r=t(9379),a=t(45),n=t(5043),i=t(8387),l=t(1807),s=t(5895),p=t(8128),c=t(8301),d=t(8739),u=t(9310),A=t(579);const m=["className","id"],h=(0,p.Ay)(s.A,{name:"MuiDialogTitle",slot:"Root"})({padding:"16px 24px",flex:"0 0 auto"}),x=n.forwardRef(function(e,o){const t=(0,c.b)({props:e,name:"MuiDialogTitle"}),{className:s,id:p}=t,x=(0,a.A)(t,m),v=t,f=(e=>{const{classes:o}=e;return(0,l.A)({root:["root"]},d.t,o)})(v),{titleId:g=p}=n.useContext(u.A);return(0,A.jsx)(h,(0,r.A)({component:"h2",className:(0,i.A)(f.root,s),ownerState:v,ref:o,variant:"h6",id:null!==p&&void 0!==p?p:g},x))})},3023:(e,o,t)=>{t.d(o,{A:()=>T});var r=t(9379),a=t(45),n=t(5043),i=t(8387),l=t(1807),s=t(713),p=t(7194),c=t(8549),d=t(405),u=t(4799),A=t(9857),m=t(6061);function h(e){return(0,m.Ay)("MuiDialog",e)}const x=(0,A.A)("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]);var v=t(9310),f=t(6945),g=t(8128),b=t(267),y=t(1612),w=t(8301),S=t(9905),k=t(579);const D=["aria-describedby","aria-labelledby","aria-modal","BackdropComponent","BackdropProps","children","className","disableEscapeKeyDown","fullScreen","fullWidth","maxWidth","onClick","onClose","open","PaperComponent","PaperProps","scroll","slots","slotProps","TransitionComponent","transitionDuration","TransitionProps"],W=(0,g.Ay)(f.A,{name:"MuiDialog",slot:"Backdrop",overrides:(e,o)=>o.backdrop})({zIndex:-1}),C=(0,g.Ay)(c.A,{name:"MuiDialog",slot:"Root"})({"@media print":{position:"absolute !important"}}),M=(0,g.Ay)("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,o)=>{const{ownerState:t}=e;return[o.container,o["scroll".concat((0,p.A)(t.scroll))]]}})({height:"100%","@media print":{height:"auto"},outline:0,variants:[{props:{scroll:"paper"},style:{display:"flex",justifyContent:"center",alignItems:"center"}},{props:{scroll:"body"},style:{overflowY:"auto",overflowX:"hidden",textAlign:"center","&::after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}}}]}),P=(0,g.Ay)(u.A,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,o)=>{const{ownerState:t}=e;return[o.paper,o["scrollPaper".concat((0,p.A)(t.scroll))],o["paperWidth".concat((0,p.A)(String(t.maxWidth)))],t.fullWidth&&o.paperFullWidth,t.fullScreen&&o.paperFullScreen]}})((0,y.A)(e=>{let{theme:o}=e;return{margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"},variants:[{props:{scroll:"paper"},style:{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"}},{props:{scroll:"body"},style:{display:"inline-block",verticalAlign:"middle",textAlign:"initial"}},{props:e=>{let{ownerState:o}=e;return!o.maxWidth},style:{maxWidth:"calc(100% - 64px)"}},{props:{maxWidth:"xs"},style:{maxWidth:"px"===o.breakpoints.unit?Math.max(o.breakpoints.values.xs,444):"max(".concat(o.breakpoints.values.xs).concat(o.breakpoints.unit,", 444px)"),["&.".concat(x.paperScrollBody)]:{[o.breakpoints.down(Math.max(o.breakpoints.values.xs,444)+64)]:{maxWidth:"calc(100% - 64px)"}}}},...Object.keys(o.breakpoints.values).filter(e=>"xs"!==e).map(e=>({props:{maxWidth:e},style:{maxWidth:"".concat(o.breakpoints.values[e]).concat(o.breakpoints.unit),["&.".concat(x.paperScrollBody)]:{[o.breakpoints.down(o.breakpoints.values[e]+64)]:{maxWidth:"calc(100% - 64px)"}}}})),{props:e=>{let{ownerState:o}=e;return o.fullWidth},style:{width:"calc(100% - 64px)"}},{props:e=>{let{ownerState:o}=e;return o.fullScreen},style:{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,["&.".concat(x.paperScrollBody)]:{margin:0,maxWidth:"100%"}}}]}})),T=n.forwardRef(function(e,o){const t=(0,w.b)({props:e,name:"MuiDialog"}),c=(0,b.A)(),A={enter:c.transitions.duration.enteringScreen,exit:c.transitions.duration.leavingScreen},{"aria-describedby":m,"aria-labelledby":x,"aria-modal":f=!0,BackdropComponent:g,BackdropProps:y,children:T,className:N,disableEscapeKeyDown:F=!1,fullScreen:R=!1,fullWidth:j=!1,maxWidth:B="sm",onClick:I,onClose:E,open:H,PaperComponent:K=u.A,PaperProps:Y={},scroll:z="paper",slots:X={},slotProps:L={},TransitionComponent:O=d.A,transitionDuration:V=A,TransitionProps:q}=t,G=(0,a.A)(t,D),J=(0,r.A)((0,r.A)({},t),{},{disableEscapeKeyDown:F,fullScreen:R,fullWidth:j,maxWidth:B,scroll:z}),Q=(e=>{const{classes:o,scroll:t,maxWidth:r,fullWidth:a,fullScreen:n}=e,i={root:["root"],container:["container","scroll".concat((0,p.A)(t))],paper:["paper","paperScroll".concat((0,p.A)(t)),"paperWidth".concat((0,p.A)(String(r))),a&&"paperFullWidth",n&&"paperFullScreen"]};return(0,l.A)(i,h,o)})(J),U=n.useRef(),Z=(0,s.A)(x),$=n.useMemo(()=>({titleId:Z}),[Z]),_={slots:(0,r.A)({transition:O},X),slotProps:(0,r.A)({transition:q,paper:Y,backdrop:y},L)},[ee,oe]=(0,S.A)("root",{elementType:C,shouldForwardComponentProp:!0,externalForwardedProps:_,ownerState:J,className:(0,i.A)(Q.root,N),ref:o}),[te,re]=(0,S.A)("backdrop",{elementType:W,shouldForwardComponentProp:!0,externalForwardedProps:_,ownerState:J}),[ae,ne]=(0,S.A)("paper",{elementType:P,shouldForwardComponentProp:!0,externalForwardedProps:_,ownerState:J,className:(0,i.A)(Q.paper,Y.className)}),[ie,le]=(0,S.A)("container",{elementType:M,externalForwardedProps:_,ownerState:J,className:Q.container}),[se,pe]=(0,S.A)("transition",{elementType:d.A,externalForwardedProps:_,ownerState:J,additionalProps:{appear:!0,in:H,timeout:V,role:"presentation"}});return(0,k.jsx)(ee,(0,r.A)((0,r.A)((0,r.A)({closeAfterTransition:!0,slots:{backdrop:te},slotProps:{backdrop:(0,r.A)({transitionDuration:V,as:g},re)},disableEscapeKeyDown:F,onClose:E,open:H,onClick:e=>{I&&I(e),U.current&&(U.current=null,E&&E(e,"backdropClick"))}},oe),G),{},{children:(0,k.jsx)(se,(0,r.A)((0,r.A)({},pe),{},{children:(0,k.jsx)(ie,(0,r.A)((0,r.A)({onMouseDown:e=>{U.current=e.target===e.currentTarget}},le),{},{children:(0,k.jsx)(ae,(0,r.A)((0,r.A)({as:K,elevation:24,role:"dialog","aria-describedby":m,"aria-labelledby":Z,"aria-modal":f},ne),{},{children:(0,k.jsx)(v.A.Provider,{value:$,children:T})}))}))}))}))})},5362:(e,o,t)=>{t.d(o,{A:()=>n});var r=t(9992),a=t(579);const n=(0,r.A)((0,a.jsx)("path",{d:"M6 19c0 1.1.9 2 2 2h8c1.1 0 2-.9 2-2V7H6zM19 4h-3.5l-1-1h-5l-1 1H5v2h14z"}),"Delete")},5877:(e,o,t)=>{t.d(o,{A:()=>x});var r=t(9379),a=t(45),n=t(5043),i=t(8387),l=t(1807),s=t(8128),p=t(8301),c=t(9857),d=t(6061);function u(e){return(0,d.Ay)("MuiDialogActions",e)}(0,c.A)("MuiDialogActions",["root","spacing"]);var A=t(579);const m=["className","disableSpacing"],h=(0,s.Ay)("div",{name:"MuiDialogActions",slot:"Root",overridesResolver:(e,o)=>{const{ownerState:t}=e;return[o.root,!t.disableSpacing&&o.spacing]}})({display:"flex",alignItems:"center",padding:8,justifyContent:"flex-end",flex:"0 0 auto",variants:[{props:e=>{let{ownerState:o}=e;return!o.disableSpacing},style:{"& > :not(style) ~ :not(style)":{marginLeft:8}}}]}),x=n.forwardRef(function(e,o){const t=(0,p.b)({props:e,name:"MuiDialogActions"}),{className:n,disableSpacing:s=!1}=t,c=(0,a.A)(t,m),d=(0,r.A)((0,r.A)({},t),{},{disableSpacing:s}),x=(e=>{const{classes:o,disableSpacing:t}=e,r={root:["root",!t&&"spacing"]};return(0,l.A)(r,u,o)})(d);return(0,A.jsx)(h,(0,r.A)({className:(0,i.A)(x.root,n),ownerState:d,ref:o},c))})},8739:(e,o,t)=>{t.d(o,{A:()=>i,t:()=>n});var r=t(9857),a=t(6061);function n(e){return(0,a.Ay)("MuiDialogTitle",e)}const i=(0,r.A)("MuiDialogTitle",["root"])},8776:(e,o,t)=>{t.d(o,{A:()=>f});var r=t(9379),a=t(45),n=t(5043),i=t(8387),l=t(1807),s=t(8128),p=t(1612),c=t(8301),d=t(9857),u=t(6061);function A(e){return(0,u.Ay)("MuiDialogContent",e)}(0,d.A)("MuiDialogContent",["root","dividers"]);var m=t(8739),h=t(579);const x=["className","dividers"],v=(0,s.Ay)("div",{name:"MuiDialogContent",slot:"Root",overridesResolver:(e,o)=>{const{ownerState:t}=e;return[o.root,t.dividers&&o.dividers]}})((0,p.A)(e=>{let{theme:o}=e;return{flex:"1 1 auto",WebkitOverflowScrolling:"touch",overflowY:"auto",padding:"20px 24px",variants:[{props:e=>{let{ownerState:o}=e;return o.dividers},style:{padding:"16px 24px",borderTop:"1px solid ".concat((o.vars||o).palette.divider),borderBottom:"1px solid ".concat((o.vars||o).palette.divider)}},{props:e=>{let{ownerState:o}=e;return!o.dividers},style:{[".".concat(m.A.root," + &")]:{paddingTop:0}}}]}})),f=n.forwardRef(function(e,o){const t=(0,c.b)({props:e,name:"MuiDialogContent"}),{className:n,dividers:s=!1}=t,p=(0,a.A)(t,x),d=(0,r.A)((0,r.A)({},t),{},{dividers:s}),u=(e=>{const{classes:o,dividers:t}=e,r={root:["root",t&&"dividers"]};return(0,l.A)(r,A,o)})(d);return(0,h.jsx)(v,(0,r.A)({className:(0,i.A)(u.root,n),ownerState:d,ref:o},p))})},9200:(e,o,t)=>{t.d(o,{A:()=>f});var r=t(45),a=t(9379),n=t(5043),i=t(8387),l=t(1807),s=t(2466),p=t(8128),c=t(8301),d=t(5895),u=t(9857),A=t(6061);function m(e){return(0,A.Ay)("MuiDialogContentText",e)}(0,u.A)("MuiDialogContentText",["root"]);var h=t(579);const x=["children","className"],v=(0,p.Ay)(d.A,{shouldForwardProp:e=>(0,s.A)(e)||"classes"===e,name:"MuiDialogContentText",slot:"Root"})({}),f=n.forwardRef(function(e,o){const t=(0,c.b)({props:e,name:"MuiDialogContentText"}),{children:n,className:s}=t,p=(0,r.A)(t,x),d=(e=>{const{classes:o}=e,t=(0,l.A)({root:["root"]},m,o);return(0,a.A)((0,a.A)({},o),t)})(p);return(0,h.jsx)(v,(0,a.A)((0,a.A)({component:"p",variant:"body1",color:"textSecondary",ref:o,ownerState:p,className:(0,i.A)(d.root,s)},t),{},{classes:d}))})},9310:(e,o,t)=>{t.d(o,{A:()=>r});const r=t(5043).createContext({})}}]);
-//# sourceMappingURL=940.3c72a459.chunk.js.map
\ No newline at end of file
@@ -1,3 +0,0 @@
-/*! For license information please see main.afe94323.js.LICENSE.txt */
-(()=>{"use strict";var e={45:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(8587);function o(e,t){if(null==e)return{};var n,o,a=(0,r.A)(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(o=0;o<i.length;o++)n=i[o],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(a[n]=e[n])}return a}},99:(e,t,n)=>{n.d(t,{A:()=>s});n(5043);var r=n(9125),o=n(6204),a=n(4265),i=n(579);function l(e){const t=(0,r.tT)(e);return e!==t&&t.styles?(t.styles.match(/^@layer\s+[^{]*$/)||(t.styles="@layer global{".concat(t.styles,"}")),t):e}const s=function(e){let{styles:t,themeId:n,defaultTheme:r={}}=e;const s=(0,a.A)(r),c=n&&s[n]||s;let u="function"===typeof t?t(c):t;return c.modularCssLayers&&(u=Array.isArray(u)?u.map(e=>l("function"===typeof e?e(c):e)):l(u)),(0,i.jsx)(o.A,{styles:u})}},122:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(9379),o=n(8387);function a(e,t){if(!e)return t;function n(e,t){const n={};return Object.keys(t).forEach(r=>{(function(e,t){const n=e.charCodeAt(2);return"o"===e[0]&&"n"===e[1]&&n>=65&&n<=90&&"function"===typeof t})(r,t[r])&&"function"===typeof e[r]&&(n[r]=function(){e[r](...arguments),t[r](...arguments)})}),n}if("function"===typeof e||"function"===typeof t)return a=>{const i="function"===typeof t?t(a):t,l="function"===typeof e?e((0,r.A)((0,r.A)({},a),i)):e,s=(0,o.A)(null===a||void 0===a?void 0:a.className,null===i||void 0===i?void 0:i.className,null===l||void 0===l?void 0:l.className),c=n(l,i);return(0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)({},i),l),c),!!s&&{className:s}),(null===i||void 0===i?void 0:i.style)&&(null===l||void 0===l?void 0:l.style)&&{style:(0,r.A)((0,r.A)({},i.style),l.style)}),(null===i||void 0===i?void 0:i.sx)&&(null===l||void 0===l?void 0:l.sx)&&{sx:[...Array.isArray(i.sx)?i.sx:[i.sx],...Array.isArray(l.sx)?l.sx:[l.sx]]})};const a=t,i=n(e,a),l=(0,o.A)(null===a||void 0===a?void 0:a.className,null===e||void 0===e?void 0:e.className);return(0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)({},t),e),i),!!l&&{className:l}),(null===a||void 0===a?void 0:a.style)&&(null===e||void 0===e?void 0:e.style)&&{style:(0,r.A)((0,r.A)({},a.style),e.style)}),(null===a||void 0===a?void 0:a.sx)&&(null===e||void 0===e?void 0:e.sx)&&{sx:[...Array.isArray(a.sx)?a.sx:[a.sx],...Array.isArray(e.sx)?e.sx:[e.sx]]})}},159:(e,t,n)=>{n.d(t,{Ay:()=>l,BO:()=>i,Yn:()=>a});var r=n(3635),o=n(6167);function a(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||"string"!==typeof t)return null;if(e&&e.vars&&n){const n="vars.".concat(t).split(".").reduce((e,t)=>e&&e[t]?e[t]:null,e);if(null!=n)return n}return t.split(".").reduce((e,t)=>e&&null!=e[t]?e[t]:null,e)}function i(e,t,n){let r,o=arguments.length>3&&void 0!==arguments[3]?arguments[3]:n;return r="function"===typeof e?e(n):Array.isArray(e)?e[n]||o:a(e,n)||o,t&&(r=t(r,o,e)),r}const l=function(e){const{prop:t,cssProperty:n=e.prop,themeKey:l,transform:s}=e,c=e=>{if(null==e[t])return null;const c=e[t],u=a(e.theme,l)||{};return(0,o.NI)(e,c,e=>{let o=i(u,s,e);return e===o&&"string"===typeof e&&(o=i(u,s,"".concat(t).concat("default"===e?"":(0,r.A)(e)),e)),!1===n?o:{[n]:o}})};return c.propTypes={},c.filterProps=[t],c}},172:(e,t,n)=>{n.d(t,{A:()=>L});var r=n(9379),o=n(45),a=n(7528),i=n(5043),l=n(8387),s=n(1807),c=n(3290),u=n(8128),d=n(1612),f=n(8301),p=n(7194),h=n(4412),m=n(9857),g=n(6061);function y(e){return(0,g.Ay)("MuiCircularProgress",e)}(0,m.A)("MuiCircularProgress",["root","determinate","indeterminate","colorPrimary","colorSecondary","svg","circle","circleDeterminate","circleIndeterminate","circleDisableShrink"]);var v=n(579);const b=["className","color","disableShrink","size","style","thickness","value","variant"];var A,w,S,k;const x=44,C=(0,c.i7)(A||(A=(0,a.A)(["\n  0% {\n    transform: rotate(0deg);\n  }\n\n  100% {\n    transform: rotate(360deg);\n  }\n"]))),E=(0,c.i7)(w||(w=(0,a.A)(["\n  0% {\n    stroke-dasharray: 1px, 200px;\n    stroke-dashoffset: 0;\n  }\n\n  50% {\n    stroke-dasharray: 100px, 200px;\n    stroke-dashoffset: -15px;\n  }\n\n  100% {\n    stroke-dasharray: 1px, 200px;\n    stroke-dashoffset: -126px;\n  }\n"]))),P="string"!==typeof C?(0,c.AH)(S||(S=(0,a.A)(["\n        animation: "," 1.4s linear infinite;\n      "])),C):null,T="string"!==typeof E?(0,c.AH)(k||(k=(0,a.A)(["\n        animation: "," 1.4s ease-in-out infinite;\n      "])),E):null,R=(0,u.Ay)("span",{name:"MuiCircularProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t["color".concat((0,p.A)(n.color))]]}})((0,d.A)(e=>{let{theme:t}=e;return{display:"inline-block",variants:[{props:{variant:"determinate"},style:{transition:t.transitions.create("transform")}},{props:{variant:"indeterminate"},style:P||{animation:"".concat(C," 1.4s linear infinite")}},...Object.entries(t.palette).filter((0,h.A)()).map(e=>{let[n]=e;return{props:{color:n},style:{color:(t.vars||t).palette[n].main}}})]}})),O=(0,u.Ay)("svg",{name:"MuiCircularProgress",slot:"Svg"})({display:"block"}),N=(0,u.Ay)("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.circle,t["circle".concat((0,p.A)(n.variant))],n.disableShrink&&t.circleDisableShrink]}})((0,d.A)(e=>{let{theme:t}=e;return{stroke:"currentColor",variants:[{props:{variant:"determinate"},style:{transition:t.transitions.create("stroke-dashoffset")}},{props:{variant:"indeterminate"},style:{strokeDasharray:"80px, 200px",strokeDashoffset:0}},{props:e=>{let{ownerState:t}=e;return"indeterminate"===t.variant&&!t.disableShrink},style:T||{animation:"".concat(E," 1.4s ease-in-out infinite")}}]}})),L=i.forwardRef(function(e,t){const n=(0,f.b)({props:e,name:"MuiCircularProgress"}),{className:a,color:i="primary",disableShrink:c=!1,size:u=40,style:d,thickness:h=3.6,value:m=0,variant:g="indeterminate"}=n,A=(0,o.A)(n,b),w=(0,r.A)((0,r.A)({},n),{},{color:i,disableShrink:c,size:u,thickness:h,value:m,variant:g}),S=(e=>{const{classes:t,variant:n,color:r,disableShrink:o}=e,a={root:["root",n,"color".concat((0,p.A)(r))],svg:["svg"],circle:["circle","circle".concat((0,p.A)(n)),o&&"circleDisableShrink"]};return(0,s.A)(a,y,t)})(w),k={},C={},E={};if("determinate"===g){const e=2*Math.PI*((x-h)/2);k.strokeDasharray=e.toFixed(3),E["aria-valuenow"]=Math.round(m),k.strokeDashoffset="".concat(((100-m)/100*e).toFixed(3),"px"),C.transform="rotate(-90deg)"}return(0,v.jsx)(R,(0,r.A)((0,r.A)((0,r.A)({className:(0,l.A)(S.root,a),style:(0,r.A)((0,r.A)({width:u,height:u},C),d),ownerState:w,ref:t,role:"progressbar"},E),A),{},{children:(0,v.jsx)(O,{className:S.svg,ownerState:w,viewBox:"".concat(22," ").concat(22," ").concat(x," ").concat(x),children:(0,v.jsx)(N,{className:S.circle,style:k,ownerState:w,cx:x,cy:x,r:(x-h)/2,fill:"none",strokeWidth:h})})}))})},191:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler");Symbol.for("react.provider");var l=Symbol.for("react.consumer"),s=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.suspense_list"),f=Symbol.for("react.memo"),p=Symbol.for("react.lazy"),h=Symbol.for("react.view_transition"),m=Symbol.for("react.client.reference");function g(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case n:switch(e=e.type){case o:case i:case a:case u:case d:case h:return e;default:switch(e=e&&e.$$typeof){case s:case c:case p:case f:case l:return e;default:return t}}case r:return t}}}t.Hy=function(e){return"string"===typeof e||"function"===typeof e||e===o||e===i||e===a||e===u||e===d||"object"===typeof e&&null!==e&&(e.$$typeof===p||e.$$typeof===f||e.$$typeof===s||e.$$typeof===l||e.$$typeof===c||e.$$typeof===m||void 0!==e.getModuleId)}},219:(e,t,n)=>{var r=n(3763),o={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},i={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?i:l[e.$$typeof]||o}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=i;var c=Object.defineProperty,u=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,h=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(h){var o=p(n);o&&o!==h&&e(t,o,r)}var i=u(n);d&&(i=i.concat(d(n)));for(var l=s(t),m=s(n),g=0;g<i.length;++g){var y=i[g];if(!a[y]&&(!r||!r[y])&&(!m||!m[y])&&(!l||!l[y])){var v=f(n,y);try{c(t,y,v)}catch(b){}}}}return t}},267:(e,t,n)=>{n.d(t,{A:()=>i});n(5043);var r=n(4265),o=n(7333),a=n(416);function i(){const e=(0,r.A)(o.A);return e[a.A]||e}},405:(e,t,n)=>{n.d(t,{A:()=>g});var r=n(9379),o=n(45),a=n(5043),i=n(9998),l=n(2475),s=n(267),c=n(6906),u=n(8348),d=n(579);const f=["addEndListener","appear","children","easing","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"],p=["ownerState"],h={entering:{opacity:1},entered:{opacity:1}},m=a.forwardRef(function(e,t){const n=(0,s.A)(),m={enter:n.transitions.duration.enteringScreen,exit:n.transitions.duration.leavingScreen},{addEndListener:g,appear:y=!0,children:v,easing:b,in:A,onEnter:w,onEntered:S,onEntering:k,onExit:x,onExited:C,onExiting:E,style:P,timeout:T=m,TransitionComponent:R=i.Ay}=e,O=(0,o.A)(e,f),N=a.useRef(null),L=(0,u.A)(N,(0,l.A)(v),t),_=e=>t=>{if(e){const n=N.current;void 0===t?e(n):e(n,t)}},M=_(k),j=_((e,t)=>{(0,c.q)(e);const r=(0,c.c)({style:P,timeout:T,easing:b},{mode:"enter"});e.style.webkitTransition=n.transitions.create("opacity",r),e.style.transition=n.transitions.create("opacity",r),w&&w(e,t)}),z=_(S),F=_(E),I=_(e=>{const t=(0,c.c)({style:P,timeout:T,easing:b},{mode:"exit"});e.style.webkitTransition=n.transitions.create("opacity",t),e.style.transition=n.transitions.create("opacity",t),x&&x(e)}),D=_(C);return(0,d.jsx)(R,(0,r.A)((0,r.A)({appear:y,in:A,nodeRef:N,onEnter:j,onEntered:z,onEntering:M,onExit:I,onExited:D,onExiting:F,addEndListener:e=>{g&&g(N.current,e)},timeout:T},O),{},{children:(e,t)=>{let{ownerState:n}=t,i=(0,o.A)(t,p);return a.cloneElement(v,(0,r.A)({style:(0,r.A)((0,r.A)((0,r.A)({opacity:0,visibility:"exited"!==e||A?void 0:"hidden"},h[e]),P),v.props.style),ref:L},i))}}))}),g=m},416:(e,t,n)=>{n.d(t,{A:()=>r});const r="$$material"},478:(e,t,n)=>{n.d(t,{A:()=>r});const r=function(e){return"ownerState"!==e&&"theme"!==e&&"sx"!==e&&"as"!==e}},579:(e,t,n)=>{e.exports=n(2799)},713:(e,t,n)=>{var r;n.d(t,{A:()=>s});var o=n(9379),a=n(5043);let i=0;const l=(0,o.A)({},r||(r=n.t(a,2))).useId;function s(e){if(void 0!==l){const t=l();return null!==e&&void 0!==e?e:t}return function(e){const[t,n]=a.useState(e),r=e||t;return a.useEffect(()=>{null==t&&(i+=1,n("mui-".concat(i)))},[t]),r}(e)}},855:(e,t,n)=>{n.d(t,{A:()=>i,Y:()=>a});var r=n(9857),o=n(6061);function a(e){return(0,o.Ay)("MuiListItemButton",e)}const i=(0,r.A)("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"])},918:(e,t,n)=>{function r(e){var t=Object.create(null);return function(n){return void 0===t[n]&&(t[n]=e(n)),t[n]}}n.d(t,{A:()=>r})},1033:(e,t,n)=>{n.d(t,{A:()=>r});const r=function(e,t,n){return"function"===typeof e?e(t,n):e}},1039:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(5043),o=n(6509);const a=function(e){const t=r.useRef(e);return(0,o.A)(()=>{t.current=e}),r.useRef(function(){return(0,t.current)(...arguments)}).current}},1289:(e,t,n)=>{function r(e,t){"function"===typeof e?e(t):e&&(e.current=t)}n.d(t,{A:()=>r})},1449:(e,t,n)=>{n.d(t,{A:()=>r});const r=function(e){return"string"===typeof e}},1612:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(7242);const o={theme:void 0};const a=function(e){let t,n;return function(a){let i=t;return void 0!==i&&a.theme===n||(o.theme=a.theme,i=(0,r.A)(e(o)),t=i,n=a.theme),i}}},1722:(e,t,n)=>{n.d(t,{Rk:()=>r,SF:()=>o,sk:()=>a});function r(e,t,n){var r="";return n.split(" ").forEach(function(n){void 0!==e[n]?t.push(e[n]+";"):n&&(r+=n+" ")}),r}var o=function(e,t,n){var r=e.key+"-"+t.name;!1===n&&void 0===e.registered[r]&&(e.registered[r]=t.styles)},a=function(e,t,n){o(e,t,n);var r=e.key+"-"+t.name;if(void 0===e.inserted[t.name]){var a=t;do{e.insert(t===a?"."+r:"",a,e.sheet,!0),a=a.next}while(void 0!==a)}}},1767:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(5043);function o(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const o=r.useRef(void 0),a=r.useCallback(e=>{const n=t.map(t=>{if(null==t)return null;if("function"===typeof t){const n=t,r=n(e);return"function"===typeof r?r:()=>{n(null)}}return t.current=e,()=>{t.current=null}});return()=>{n.forEach(e=>null===e||void 0===e?void 0:e())}},t);return r.useMemo(()=>t.every(e=>null==e)?null:e=>{o.current&&(o.current(),o.current=void 0),null!=e&&(o.current=a(e))},t)}},1807:(e,t,n)=>{function r(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;const r={};for(const o in e){const a=e[o];let i="",l=!0;for(let e=0;e<a.length;e+=1){const r=a[e];r&&(i+=(!0===l?"":" ")+t(r),l=!1,n&&n[r]&&(i+=" "+n[r]))}r[o]=i}return r}n.d(t,{A:()=>r})},1811:(e,t,n)=>{function r(e){return null!=e&&!(Array.isArray(e)&&0===e.length)}function o(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return e&&(r(e.value)&&""!==e.value||t&&r(e.defaultValue)&&""!==e.defaultValue)}function a(e){return e.startAdornment}n.d(t,{gr:()=>a,lq:()=>o})},1834:(e,t,n)=>{n.d(t,{LX:()=>h,MA:()=>p,_W:()=>m,Lc:()=>v,Ms:()=>b});var r=n(6167),o=n(159),a=n(9271);const i={m:"margin",p:"padding"},l={t:"Top",r:"Right",b:"Bottom",l:"Left",x:["Left","Right"],y:["Top","Bottom"]},s={marginX:"mx",marginY:"my",paddingX:"px",paddingY:"py"},c=function(e){const t={};return n=>(void 0===t[n]&&(t[n]=e(n)),t[n])}(e=>{if(e.length>2){if(!s[e])return[e];e=s[e]}const[t,n]=e.split(""),r=i[t],o=l[n]||"";return Array.isArray(o)?o.map(e=>r+e):[r+o]}),u=["m","mt","mr","mb","ml","mx","my","margin","marginTop","marginRight","marginBottom","marginLeft","marginX","marginY","marginInline","marginInlineStart","marginInlineEnd","marginBlock","marginBlockStart","marginBlockEnd"],d=["p","pt","pr","pb","pl","px","py","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","paddingX","paddingY","paddingInline","paddingInlineStart","paddingInlineEnd","paddingBlock","paddingBlockStart","paddingBlockEnd"],f=[...u,...d];function p(e,t,n,r){var a;const i=null!==(a=(0,o.Yn)(e,t,!0))&&void 0!==a?a:n;return"number"===typeof i||"string"===typeof i?e=>"string"===typeof e?e:"string"===typeof i?i.startsWith("var(")&&0===e?0:i.startsWith("var(")&&1===e?i:"calc(".concat(e," * ").concat(i,")"):i*e:Array.isArray(i)?e=>{if("string"===typeof e)return e;const t=Math.abs(e);const n=i[t];return e>=0?n:"number"===typeof n?-n:"string"===typeof n&&n.startsWith("var(")?"calc(-1 * ".concat(n,")"):"-".concat(n)}:"function"===typeof i?i:()=>{}}function h(e){return p(e,"spacing",8)}function m(e,t){return"string"===typeof t||null==t?t:e(t)}function g(e,t,n,o){if(!t.includes(n))return null;const a=function(e,t){return n=>e.reduce((e,r)=>(e[r]=m(t,n),e),{})}(c(n),o),i=e[n];return(0,r.NI)(e,i,a)}function y(e,t){const n=h(e.theme);return Object.keys(e).map(r=>g(e,t,r,n)).reduce(a.A,{})}function v(e){return y(e,u)}function b(e){return y(e,d)}function A(e){return y(e,f)}v.propTypes={},v.filterProps=u,b.propTypes={},b.filterProps=d,A.propTypes={},A.filterProps=f},1917:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(6433).A},1977:(e,t,n)=>{n.d(t,{A:()=>i,b:()=>a});var r=n(9857),o=n(6061);function a(e){return(0,o.Ay)("MuiListItemText",e)}const i=(0,r.A)("MuiListItemText",["root","multiline","dense","inset","primary","secondary"])},2065:(e,t,n)=>{function r(e){const t=new URL("https://mui.com/production-error/?code=".concat(e));for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return r.forEach(e=>t.searchParams.append("args[]",e)),"Minified MUI error #".concat(e,"; visit ").concat(t," for the full message.")}n.d(t,{A:()=>r})},2391:(e,t,n)=>{function r(e){let t;return t=e<1?5.11916*e**2:4.5*Math.log(e+1)+2,Math.round(10*t)/1e3}n.d(t,{A:()=>r})},2394:(e,t,n)=>{n.d(t,{Ay:()=>R});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(1449),c=n(8128),u=n(1612),d=n(8301),f=n(3319),p=n(8348),h=n(9066),m=n(9857),g=n(6061);function y(e){return(0,g.Ay)("MuiListItem",e)}(0,m.A)("MuiListItem",["root","container","dense","alignItemsFlexStart","divider","gutters","padding","secondaryAction"]);var v=n(855);function b(e){return(0,g.Ay)("MuiListItemSecondaryAction",e)}(0,m.A)("MuiListItemSecondaryAction",["root","disableGutters"]);var A=n(579);const w=["className"],S=(0,c.Ay)("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)",variants:[{props:e=>{let{ownerState:t}=e;return t.disableGutters},style:{right:0}}]}),k=a.forwardRef(function(e,t){const n=(0,d.b)({props:e,name:"MuiListItemSecondaryAction"}),{className:s}=n,c=(0,o.A)(n,w),u=a.useContext(h.A),f=(0,r.A)((0,r.A)({},n),{},{disableGutters:u.disableGutters}),p=(e=>{const{disableGutters:t,classes:n}=e,r={root:["root",t&&"disableGutters"]};return(0,l.A)(r,b,n)})(f);return(0,A.jsx)(S,(0,r.A)({className:(0,i.A)(p.root,s),ownerState:f,ref:t},c))});k.muiName="ListItemSecondaryAction";const x=k,C=["className"],E=["alignItems","children","className","component","components","componentsProps","ContainerComponent","ContainerProps","dense","disableGutters","disablePadding","divider","secondaryAction","slotProps","slots"],P=(0,c.Ay)("div",{name:"MuiListItem",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,"flex-start"===n.alignItems&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.hasSecondaryAction&&t.secondaryAction]}})((0,u.A)(e=>{let{theme:t}=e;return{display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left",variants:[{props:e=>{let{ownerState:t}=e;return!t.disablePadding},style:{paddingTop:8,paddingBottom:8}},{props:e=>{let{ownerState:t}=e;return!t.disablePadding&&t.dense},style:{paddingTop:4,paddingBottom:4}},{props:e=>{let{ownerState:t}=e;return!t.disablePadding&&!t.disableGutters},style:{paddingLeft:16,paddingRight:16}},{props:e=>{let{ownerState:t}=e;return!t.disablePadding&&!!t.secondaryAction},style:{paddingRight:48}},{props:e=>{let{ownerState:t}=e;return!!t.secondaryAction},style:{["& > .".concat(v.A.root)]:{paddingRight:48}}},{props:{alignItems:"flex-start"},style:{alignItems:"flex-start"}},{props:e=>{let{ownerState:t}=e;return t.divider},style:{borderBottom:"1px solid ".concat((t.vars||t).palette.divider),backgroundClip:"padding-box"}},{props:e=>{let{ownerState:t}=e;return t.button},style:{transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}}}},{props:e=>{let{ownerState:t}=e;return t.hasSecondaryAction},style:{paddingRight:48}}]}})),T=(0,c.Ay)("li",{name:"MuiListItem",slot:"Container"})({position:"relative"}),R=a.forwardRef(function(e,t){const n=(0,d.b)({props:e,name:"MuiListItem"}),{alignItems:c="center",children:u,className:m,component:g,components:v={},componentsProps:b={},ContainerComponent:w="li",ContainerProps:{className:S}={},dense:k=!1,disableGutters:R=!1,disablePadding:O=!1,divider:N=!1,secondaryAction:L,slotProps:_={},slots:M={}}=n,j=(0,o.A)(n.ContainerProps,C),z=(0,o.A)(n,E),F=a.useContext(h.A),I=a.useMemo(()=>({dense:k||F.dense||!1,alignItems:c,disableGutters:R}),[c,F.dense,k,R]),D=a.useRef(null),B=a.Children.toArray(u),U=B.length&&(0,f.A)(B[B.length-1],["ListItemSecondaryAction"]),W=(0,r.A)((0,r.A)({},n),{},{alignItems:c,dense:I.dense,disableGutters:R,disablePadding:O,divider:N,hasSecondaryAction:U}),H=(e=>{const{alignItems:t,classes:n,dense:r,disableGutters:o,disablePadding:a,divider:i,hasSecondaryAction:s}=e,c={root:["root",r&&"dense",!o&&"gutters",!a&&"padding",i&&"divider","flex-start"===t&&"alignItemsFlexStart",s&&"secondaryAction"],container:["container"]};return(0,l.A)(c,y,n)})(W),V=(0,p.A)(D,t),$=M.root||v.Root||P,q=_.root||b.root||{},K=(0,r.A)({className:(0,i.A)(H.root,q.className,m)},z);let G=g||"li";return U?(G=K.component||g?G:"div","li"===w&&("li"===G?G="div":"li"===K.component&&(K.component="div")),(0,A.jsx)(h.A.Provider,{value:I,children:(0,A.jsxs)(T,(0,r.A)((0,r.A)({as:w,className:(0,i.A)(H.container,S),ref:V,ownerState:W},j),{},{children:[(0,A.jsx)($,(0,r.A)((0,r.A)((0,r.A)((0,r.A)({},q),!(0,s.A)($)&&{as:G,ownerState:(0,r.A)((0,r.A)({},W),q.ownerState)}),K),{},{children:B})),B.pop()]}))})):(0,A.jsx)(h.A.Provider,{value:I,children:(0,A.jsxs)($,(0,r.A)((0,r.A)((0,r.A)((0,r.A)({},q),{},{as:G,ref:V},!(0,s.A)($)&&{ownerState:(0,r.A)((0,r.A)({},W),q.ownerState)}),K),{},{children:[B,L&&(0,A.jsx)(x,{children:L})]}))})})},2432:(e,t,n)=>{n.d(t,{A:()=>u,I:()=>c});var r=n(9379),o=n(45),a=n(5043),i=n(579);const l=["value"],s=a.createContext();const c=()=>{const e=a.useContext(s);return null!==e&&void 0!==e&&e},u=function(e){let{value:t}=e,n=(0,o.A)(e,l);return(0,i.jsx)(s.Provider,(0,r.A)({value:null===t||void 0===t||t},n))}},2466:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(478);const o=e=>(0,r.A)(e)&&"classes"!==e},2475:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(5043);function o(e){var t;return parseInt(r.version,10)>=19?(null===e||void 0===e||null===(t=e.props)||void 0===t?void 0:t.ref)||null:(null===e||void 0===e?void 0:e.ref)||null}},2517:(e,t,n)=>{function r(e){let t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:166;function r(){for(var r=arguments.length,o=new Array(r),a=0;a<r;a++)o[a]=arguments[a];clearTimeout(t),t=setTimeout(()=>{e.apply(this,o)},n)}return r.clear=()=>{clearTimeout(t)},r}n.d(t,{A:()=>r})},2524:(e,t,n)=>{n.d(t,{A:()=>d});var r=n(5043),o=n(1767),a=n(7449),i=n(2475),l=n(579);const s=["input","select","textarea","a[href]","button","[tabindex]","audio[controls]","video[controls]",'[contenteditable]:not([contenteditable="false"])'].join(",");function c(e){const t=[],n=[];return Array.from(e.querySelectorAll(s)).forEach((e,r)=>{const o=function(e){const t=parseInt(e.getAttribute("tabindex")||"",10);return Number.isNaN(t)?"true"===e.contentEditable||("AUDIO"===e.nodeName||"VIDEO"===e.nodeName||"DETAILS"===e.nodeName)&&null===e.getAttribute("tabindex")?0:e.tabIndex:t}(e);-1!==o&&function(e){return!(e.disabled||"INPUT"===e.tagName&&"hidden"===e.type||function(e){if("INPUT"!==e.tagName||"radio"!==e.type)return!1;if(!e.name)return!1;const t=t=>e.ownerDocument.querySelector('input[type="radio"]'.concat(t));let n=t('[name="'.concat(e.name,'"]:checked'));return n||(n=t('[name="'.concat(e.name,'"]'))),n!==e}(e))}(e)&&(0===o?t.push(e):n.push({documentOrder:r,tabIndex:o,node:e}))}),n.sort((e,t)=>e.tabIndex===t.tabIndex?e.documentOrder-t.documentOrder:e.tabIndex-t.tabIndex).map(e=>e.node).concat(t)}function u(){return!0}const d=function(e){const{children:t,disableAutoFocus:n=!1,disableEnforceFocus:s=!1,disableRestoreFocus:d=!1,getTabbable:f=c,isEnabled:p=u,open:h}=e,m=r.useRef(!1),g=r.useRef(null),y=r.useRef(null),v=r.useRef(null),b=r.useRef(null),A=r.useRef(!1),w=r.useRef(null),S=(0,o.A)((0,i.A)(t),w),k=r.useRef(null);r.useEffect(()=>{h&&w.current&&(A.current=!n)},[n,h]),r.useEffect(()=>{if(!h||!w.current)return;const e=(0,a.A)(w.current);return w.current.contains(e.activeElement)||(w.current.hasAttribute("tabIndex")||w.current.setAttribute("tabIndex","-1"),A.current&&w.current.focus()),()=>{d||(v.current&&v.current.focus&&(m.current=!0,v.current.focus()),v.current=null)}},[h]),r.useEffect(()=>{if(!h||!w.current)return;const e=(0,a.A)(w.current),t=t=>{k.current=t,!s&&p()&&"Tab"===t.key&&e.activeElement===w.current&&t.shiftKey&&(m.current=!0,y.current&&y.current.focus())},n=()=>{const t=w.current;if(null===t)return;if(!e.hasFocus()||!p()||m.current)return void(m.current=!1);if(t.contains(e.activeElement))return;if(s&&e.activeElement!==g.current&&e.activeElement!==y.current)return;if(e.activeElement!==b.current)b.current=null;else if(null!==b.current)return;if(!A.current)return;let n=[];if(e.activeElement!==g.current&&e.activeElement!==y.current||(n=f(w.current)),n.length>0){var r,o;const e=Boolean((null===(r=k.current)||void 0===r?void 0:r.shiftKey)&&"Tab"===(null===(o=k.current)||void 0===o?void 0:o.key)),t=n[0],a=n[n.length-1];"string"!==typeof t&&"string"!==typeof a&&(e?a.focus():t.focus())}else t.focus()};e.addEventListener("focusin",n),e.addEventListener("keydown",t,!0);const r=setInterval(()=>{e.activeElement&&"BODY"===e.activeElement.tagName&&n()},50);return()=>{clearInterval(r),e.removeEventListener("focusin",n),e.removeEventListener("keydown",t,!0)}},[n,s,d,p,h,f]);const x=e=>{null===v.current&&(v.current=e.relatedTarget),A.current=!0};return(0,l.jsxs)(r.Fragment,{children:[(0,l.jsx)("div",{tabIndex:h?0:-1,onFocus:x,ref:g,"data-testid":"sentinelStart"}),r.cloneElement(t,{ref:S,onFocus:e=>{null===v.current&&(v.current=e.relatedTarget),A.current=!0,b.current=e.target;const n=t.props.onFocus;n&&n(e)}}),(0,l.jsx)("div",{tabIndex:h?0:-1,onFocus:x,ref:y,"data-testid":"sentinelEnd"})]})}},2573:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(5043);function o(e,t){var n,o;return r.isValidElement(e)&&-1!==t.indexOf(null!==(n=e.type.muiName)&&void 0!==n?n:null===(o=e.type)||void 0===o||null===(o=o._payload)||void 0===o||null===(o=o.value)||void 0===o?void 0:o.muiName)}},2674:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(1039).A},2799:(e,t)=>{var n=Symbol.for("react.transitional.element");function r(e,t,r){var o=null;if(void 0!==r&&(o=""+r),void 0!==t.key&&(o=""+t.key),"key"in t)for(var a in r={},t)"key"!==a&&(r[a]=t[a]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:o,ref:void 0!==t?t:null,props:r}}Symbol.for("react.fragment"),t.jsx=r,t.jsxs=r},3115:(e,t,n)=>{n.d(t,{A:()=>l,E:()=>i});var r=n(4467),o=n(7307),a=n(6865);class i{constructor(){(0,r.A)(this,"currentId",null),(0,r.A)(this,"clear",()=>{null!==this.currentId&&(clearTimeout(this.currentId),this.currentId=null)}),(0,r.A)(this,"disposeEffect",()=>this.clear)}static create(){return new i}start(e,t){this.clear(),this.currentId=setTimeout(()=>{this.currentId=null,t()},e)}}function l(){const e=(0,o.A)(i.create).current;return(0,a.A)(e.disposeEffect),e}},3129:(e,t,n)=>{n.d(t,{A:()=>s,Q:()=>i});var r=n(9379),o=n(5043),a=n(191);function i(e){if("object"!==typeof e||null===e)return!1;const t=Object.getPrototypeOf(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)}function l(e){if(o.isValidElement(e)||(0,a.Hy)(e)||!i(e))return e;const t={};return Object.keys(e).forEach(n=>{t[n]=l(e[n])}),t}function s(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{clone:!0};const c=n.clone?(0,r.A)({},e):e;return i(e)&&i(t)&&Object.keys(t).forEach(r=>{o.isValidElement(t[r])||(0,a.Hy)(t[r])?c[r]=t[r]:i(t[r])&&Object.prototype.hasOwnProperty.call(e,r)&&i(e[r])?c[r]=s(e[r],t[r],n):n.clone?c[r]=i(t[r])?l(t[r]):t[r]:c[r]=t[r]}),c}},3182:(e,t,n)=>{n.d(t,{A:()=>y});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(8128),c=n(1612),u=n(8301),d=n(9857),f=n(6061);function p(e){return(0,f.Ay)("MuiToolbar",e)}(0,d.A)("MuiToolbar",["root","gutters","regular","dense"]);var h=n(579);const m=["className","component","disableGutters","variant"],g=(0,s.Ay)("div",{name:"MuiToolbar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disableGutters&&t.gutters,t[n.variant]]}})((0,c.A)(e=>{let{theme:t}=e;return{position:"relative",display:"flex",alignItems:"center",variants:[{props:e=>{let{ownerState:t}=e;return!t.disableGutters},style:{paddingLeft:t.spacing(2),paddingRight:t.spacing(2),[t.breakpoints.up("sm")]:{paddingLeft:t.spacing(3),paddingRight:t.spacing(3)}}},{props:{variant:"dense"},style:{minHeight:48}},{props:{variant:"regular"},style:t.mixins.toolbar}]}})),y=a.forwardRef(function(e,t){const n=(0,u.b)({props:e,name:"MuiToolbar"}),{className:a,component:s="div",disableGutters:c=!1,variant:d="regular"}=n,f=(0,o.A)(n,m),y=(0,r.A)((0,r.A)({},n),{},{component:s,disableGutters:c,variant:d}),v=(e=>{const{classes:t,disableGutters:n,variant:r}=e,o={root:["root",!n&&"gutters",r]};return(0,l.A)(o,p,t)})(y);return(0,h.jsx)(g,(0,r.A)({as:s,className:(0,i.A)(v.root,a),ref:t,ownerState:y},f))})},3209:(e,t,n)=>{n.d(t,{ck:()=>I,Sh:()=>F,Ay:()=>B,Oj:()=>z,WC:()=>j});var r=n(45),o=n(9379),a=n(2065),i=n(5043),l=n(8387),s=n(1807),c=n(1449),u=n(2517),d=n(1767),f=n(6509),p=n(1039),h=n(6433),m=n(579);const g=["onChange","maxRows","minRows","style","value"];function y(e){return parseInt(e,10)||0}const v={visibility:"hidden",position:"absolute",overflow:"hidden",height:0,top:0,left:0,transform:"translateZ(0)"};function b(e){return function(e){for(const t in e)return!1;return!0}(e)||0===e.outerHeightStyle&&!e.overflowing}const A=i.forwardRef(function(e,t){const{onChange:n,maxRows:a,minRows:l=1,style:s,value:c}=e,A=(0,r.A)(e,g),{current:w}=i.useRef(null!=c),S=i.useRef(null),k=(0,d.A)(t,S),x=i.useRef(null),C=i.useRef(null),E=i.useCallback(()=>{const t=S.current,n=C.current;if(!t||!n)return;const r=(0,h.A)(t).getComputedStyle(t);if("0px"===r.width)return{outerHeightStyle:0,overflowing:!1};n.style.width=r.width,n.value=t.value||e.placeholder||"x","\n"===n.value.slice(-1)&&(n.value+=" ");const o=r.boxSizing,i=y(r.paddingBottom)+y(r.paddingTop),s=y(r.borderBottomWidth)+y(r.borderTopWidth),c=n.scrollHeight;n.value="x";const u=n.scrollHeight;let d=c;l&&(d=Math.max(Number(l)*u,d)),a&&(d=Math.min(Number(a)*u,d)),d=Math.max(d,u);return{outerHeightStyle:d+("border-box"===o?i+s:0),overflowing:Math.abs(d-c)<=1}},[a,l,e.placeholder]),P=(0,p.A)(()=>{const e=S.current,t=E();if(!e||!t||b(t))return!1;const n=t.outerHeightStyle;return null!=x.current&&x.current!==n}),T=i.useCallback(()=>{const e=S.current,t=E();if(!e||!t||b(t))return;const n=t.outerHeightStyle;x.current!==n&&(x.current=n,e.style.height="".concat(n,"px")),e.style.overflow=t.overflowing?"hidden":""},[E]),R=i.useRef(-1);(0,f.A)(()=>{const e=(0,u.A)(T),t=null===S||void 0===S?void 0:S.current;if(!t)return;const n=(0,h.A)(t);let r;return n.addEventListener("resize",e),"undefined"!==typeof ResizeObserver&&(r=new ResizeObserver(()=>{P()&&(r.unobserve(t),cancelAnimationFrame(R.current),T(),R.current=requestAnimationFrame(()=>{r.observe(t)}))}),r.observe(t)),()=>{e.clear(),cancelAnimationFrame(R.current),n.removeEventListener("resize",e),r&&r.disconnect()}},[E,T,P]),(0,f.A)(()=>{T()});return(0,m.jsxs)(i.Fragment,{children:[(0,m.jsx)("textarea",(0,o.A)({value:c,onChange:e=>{w||T();const t=e.target,r=t.value.length,o=t.value.endsWith("\n"),a=t.selectionStart===r;o&&a&&t.setSelectionRange(r,r),n&&n(e)},ref:k,rows:l,style:s},A)),(0,m.jsx)("textarea",{"aria-hidden":!0,className:e.className,readOnly:!0,ref:C,tabIndex:-1,style:(0,o.A)((0,o.A)((0,o.A)({},v),s),{},{paddingTop:0,paddingBottom:0})})]})});var w=n(7566),S=n(8736),k=n(8700),x=n(8128),C=n(8130),E=n(1612),P=n(8301),T=n(7194),R=n(8348),O=n(4418),N=n(1811),L=n(8031);const _=["aria-describedby","autoComplete","autoFocus","className","color","components","componentsProps","defaultValue","disabled","disableInjectingGlobalStyles","endAdornment","error","fullWidth","id","inputComponent","inputProps","inputRef","margin","maxRows","minRows","multiline","name","onBlur","onChange","onClick","onFocus","onKeyDown","onKeyUp","placeholder","readOnly","renderSuffix","rows","size","slotProps","slots","startAdornment","type","value"];var M;const j=(e,t)=>{const{ownerState:n}=e;return[t.root,n.formControl&&t.formControl,n.startAdornment&&t.adornedStart,n.endAdornment&&t.adornedEnd,n.error&&t.error,"small"===n.size&&t.sizeSmall,n.multiline&&t.multiline,n.color&&t["color".concat((0,T.A)(n.color))],n.fullWidth&&t.fullWidth,n.hiddenLabel&&t.hiddenLabel]},z=(e,t)=>{const{ownerState:n}=e;return[t.input,"small"===n.size&&t.inputSizeSmall,n.multiline&&t.inputMultiline,"search"===n.type&&t.inputTypeSearch,n.startAdornment&&t.inputAdornedStart,n.endAdornment&&t.inputAdornedEnd,n.hiddenLabel&&t.inputHiddenLabel]},F=(0,x.Ay)("div",{name:"MuiInputBase",slot:"Root",overridesResolver:j})((0,E.A)(e=>{let{theme:t}=e;return(0,o.A)((0,o.A)({},t.typography.body1),{},{color:(t.vars||t).palette.text.primary,lineHeight:"1.4375em",boxSizing:"border-box",position:"relative",cursor:"text",display:"inline-flex",alignItems:"center",["&.".concat(L.A.disabled)]:{color:(t.vars||t).palette.text.disabled,cursor:"default"},variants:[{props:e=>{let{ownerState:t}=e;return t.multiline},style:{padding:"4px 0 5px"}},{props:e=>{let{ownerState:t,size:n}=e;return t.multiline&&"small"===n},style:{paddingTop:1}},{props:e=>{let{ownerState:t}=e;return t.fullWidth},style:{width:"100%"}}]})})),I=(0,x.Ay)("input",{name:"MuiInputBase",slot:"Input",overridesResolver:z})((0,E.A)(e=>{let{theme:t}=e;const n="light"===t.palette.mode,r=(0,o.A)((0,o.A)({color:"currentColor"},t.vars?{opacity:t.vars.opacity.inputPlaceholder}:{opacity:n?.42:.5}),{},{transition:t.transitions.create("opacity",{duration:t.transitions.duration.shorter})}),a={opacity:"0 !important"},i=t.vars?{opacity:t.vars.opacity.inputPlaceholder}:{opacity:n?.42:.5};return{font:"inherit",letterSpacing:"inherit",color:"currentColor",padding:"4px 0 5px",border:0,boxSizing:"content-box",background:"none",height:"1.4375em",margin:0,WebkitTapHighlightColor:"transparent",display:"block",minWidth:0,width:"100%","&::-webkit-input-placeholder":r,"&::-moz-placeholder":r,"&::-ms-input-placeholder":r,"&:focus":{outline:0},"&:invalid":{boxShadow:"none"},"&::-webkit-search-decoration":{WebkitAppearance:"none"},["label[data-shrink=false] + .".concat(L.A.formControl," &")]:{"&::-webkit-input-placeholder":a,"&::-moz-placeholder":a,"&::-ms-input-placeholder":a,"&:focus::-webkit-input-placeholder":i,"&:focus::-moz-placeholder":i,"&:focus::-ms-input-placeholder":i},["&.".concat(L.A.disabled)]:{opacity:1,WebkitTextFillColor:(t.vars||t).palette.text.disabled},variants:[{props:e=>{let{ownerState:t}=e;return!t.disableInjectingGlobalStyles},style:{animationName:"mui-auto-fill-cancel",animationDuration:"10ms","&:-webkit-autofill":{animationDuration:"5000s",animationName:"mui-auto-fill"}}},{props:{size:"small"},style:{paddingTop:1}},{props:e=>{let{ownerState:t}=e;return t.multiline},style:{height:"auto",resize:"none",padding:0,paddingTop:0}},{props:{type:"search"},style:{MozAppearance:"textfield"}}]}})),D=(0,C.Dp)({"@keyframes mui-auto-fill":{from:{display:"block"}},"@keyframes mui-auto-fill-cancel":{from:{display:"block"}}}),B=i.forwardRef(function(e,t){var n;const u=(0,P.b)({props:e,name:"MuiInputBase"}),{"aria-describedby":d,autoComplete:f,autoFocus:p,className:h,color:g,components:y={},componentsProps:v={},defaultValue:b,disabled:x,disableInjectingGlobalStyles:C,endAdornment:E,error:j,fullWidth:z=!1,id:B,inputComponent:U="input",inputProps:W={},inputRef:H,margin:V,maxRows:$,minRows:q,multiline:K=!1,name:G,onBlur:Q,onChange:Y,onClick:X,onFocus:J,onKeyDown:Z,onKeyUp:ee,placeholder:te,readOnly:ne,renderSuffix:re,rows:oe,size:ae,slotProps:ie={},slots:le={},startAdornment:se,type:ce="text",value:ue}=u,de=(0,r.A)(u,_),fe=null!=W.value?W.value:ue,{current:pe}=i.useRef(null!=fe),he=i.useRef(),me=i.useCallback(e=>{0},[]),ge=(0,R.A)(he,H,W.ref,me),[ye,ve]=i.useState(!1),be=(0,k.A)();const Ae=(0,w.A)({props:u,muiFormControl:be,states:["color","disabled","error","hiddenLabel","size","required","filled"]});Ae.focused=be?be.focused:ye,i.useEffect(()=>{!be&&x&&ye&&(ve(!1),Q&&Q())},[be,x,ye,Q]);const we=be&&be.onFilled,Se=be&&be.onEmpty,ke=i.useCallback(e=>{(0,N.lq)(e)?we&&we():Se&&Se()},[we,Se]);(0,O.A)(()=>{pe&&ke({value:fe})},[fe,ke,pe]);i.useEffect(()=>{ke(he.current)},[]);let xe=U,Ce=W;K&&"input"===xe&&(Ce=oe?(0,o.A)({type:void 0,minRows:oe,maxRows:oe},Ce):(0,o.A)({type:void 0,maxRows:$,minRows:q},Ce),xe=A);i.useEffect(()=>{be&&be.setAdornedStart(Boolean(se))},[be,se]);const Ee=(0,o.A)((0,o.A)({},u),{},{color:Ae.color||"primary",disabled:Ae.disabled,endAdornment:E,error:Ae.error,focused:Ae.focused,formControl:be,fullWidth:z,hiddenLabel:Ae.hiddenLabel,multiline:K,size:Ae.size,startAdornment:se,type:ce}),Pe=(e=>{const{classes:t,color:n,disabled:r,error:o,endAdornment:a,focused:i,formControl:l,fullWidth:c,hiddenLabel:u,multiline:d,readOnly:f,size:p,startAdornment:h,type:m}=e,g={root:["root","color".concat((0,T.A)(n)),r&&"disabled",o&&"error",c&&"fullWidth",i&&"focused",l&&"formControl",p&&"medium"!==p&&"size".concat((0,T.A)(p)),d&&"multiline",h&&"adornedStart",a&&"adornedEnd",u&&"hiddenLabel",f&&"readOnly"],input:["input",r&&"disabled","search"===m&&"inputTypeSearch",d&&"inputMultiline","small"===p&&"inputSizeSmall",u&&"inputHiddenLabel",h&&"inputAdornedStart",a&&"inputAdornedEnd",f&&"readOnly"]};return(0,s.A)(g,L.g,t)})(Ee),Te=le.root||y.Root||F,Re=ie.root||v.root||{},Oe=le.input||y.Input||I;return Ce=(0,o.A)((0,o.A)({},Ce),null!==(n=ie.input)&&void 0!==n?n:v.input),(0,m.jsxs)(i.Fragment,{children:[!C&&"function"===typeof D&&(M||(M=(0,m.jsx)(D,{}))),(0,m.jsxs)(Te,(0,o.A)((0,o.A)((0,o.A)((0,o.A)({},Re),{},{ref:t,onClick:e=>{he.current&&e.currentTarget===e.target&&he.current.focus(),X&&X(e)}},de),!(0,c.A)(Te)&&{ownerState:(0,o.A)((0,o.A)({},Ee),Re.ownerState)}),{},{className:(0,l.A)(Pe.root,Re.className,h,ne&&"MuiInputBase-readOnly"),children:[se,(0,m.jsx)(S.A.Provider,{value:null,children:(0,m.jsx)(Oe,(0,o.A)((0,o.A)((0,o.A)({"aria-invalid":Ae.error,"aria-describedby":d,autoComplete:f,autoFocus:p,defaultValue:b,disabled:Ae.disabled,id:B,onAnimationStart:e=>{ke("mui-auto-fill-cancel"===e.animationName?he.current:{value:"x"})},name:G,placeholder:te,readOnly:ne,required:Ae.required,rows:oe,value:fe,onKeyDown:Z,onKeyUp:ee,type:ce},Ce),!(0,c.A)(Oe)&&{as:xe,ownerState:(0,o.A)((0,o.A)({},Ee),Ce.ownerState)}),{},{ref:ge,className:(0,l.A)(Pe.input,Ce.className,ne&&"MuiInputBase-readOnly"),onBlur:e=>{Q&&Q(e),W.onBlur&&W.onBlur(e),be&&be.onBlur?be.onBlur(e):ve(!1)},onChange:function(e){if(!pe){const t=e.target||he.current;if(null==t)throw new Error((0,a.A)(1));ke({value:t.value})}for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];W.onChange&&W.onChange(e,...n),Y&&Y(e,...n)},onFocus:e=>{J&&J(e),W.onFocus&&W.onFocus(e),be&&be.onFocus?be.onFocus(e):ve(!0)}}))}),E,re?re((0,o.A)((0,o.A)({},Ae),{},{startAdornment:se})):null]}))]})})},3290:(e,t,n)=>{n.d(t,{AH:()=>u,i7:()=>d,mL:()=>c});var r=n(9369),o=n(5043),a=n(1722),i=n(9436),l=n(6598),s=(n(3803),n(219),function(e,t){var n=arguments;if(null==t||!r.h.call(t,"css"))return o.createElement.apply(void 0,n);var a=n.length,i=new Array(a);i[0]=r.E,i[1]=(0,r.c)(e,t);for(var l=2;l<a;l++)i[l]=n[l];return o.createElement.apply(null,i)});!function(e){var t;t||(t=e.JSX||(e.JSX={}))}(s||(s={}));var c=(0,r.w)(function(e,t){var n=e.styles,s=(0,l.J)([n],void 0,o.useContext(r.T)),c=o.useRef();return(0,i.i)(function(){var e=t.key+"-global",n=new t.sheet.constructor({key:e,nonce:t.sheet.nonce,container:t.sheet.container,speedy:t.sheet.isSpeedy}),r=!1,o=document.querySelector('style[data-emotion="'+e+" "+s.name+'"]');return t.sheet.tags.length&&(n.before=t.sheet.tags[0]),null!==o&&(r=!0,o.setAttribute("data-emotion",e),n.hydrate([o])),c.current=[n,r],function(){n.flush()}},[t]),(0,i.i)(function(){var e=c.current,n=e[0];if(e[1])e[1]=!1;else{if(void 0!==s.next&&(0,a.sk)(t,s.next,!0),n.tags.length){var r=n.tags[n.tags.length-1].nextElementSibling;n.before=r,n.flush()}t.insert("",s,n,!1)}},[t,s.name]),null});function u(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return(0,l.J)(t)}function d(){var e=u.apply(void 0,arguments),t="animation-"+e.name;return{name:t,styles:"@keyframes "+t+"{"+e.styles+"}",anim:1,toString:function(){return"_EMO_"+this.name+"_"+this.styles+"_EMO_"}}}},3319:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(2573).A},3491:(e,t,n)=>{n.d(t,{A:()=>i,y:()=>a});var r=n(9857),o=n(6061);function a(e){return(0,o.Ay)("MuiTypography",e)}const i=(0,r.A)("MuiTypography",["root","h1","h2","h3","h4","h5","h6","subtitle1","subtitle2","body1","body2","inherit","button","caption","overline","alignLeft","alignRight","alignCenter","alignJustify","noWrap","gutterBottom","paragraph"])},3635:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(2065);function o(e){if("string"!==typeof e)throw new Error((0,r.A)(7));return e.charAt(0).toUpperCase()+e.slice(1)}},3677:(e,t,n)=>{n.d(t,{A:()=>c});var r=n(5043),o=n(7950),a=n(6509),i=n(1767),l=n(1289),s=n(2475);const c=r.forwardRef(function(e,t){const{children:n,container:c,disablePortal:u=!1}=e,[d,f]=r.useState(null),p=(0,i.A)(r.isValidElement(n)?(0,s.A)(n):null,t);if((0,a.A)(()=>{u||f(function(e){return"function"===typeof e?e():e}(c)||document.body)},[c,u]),(0,a.A)(()=>{if(d&&!u)return(0,l.A)(t,d),()=>{(0,l.A)(t,null)}},[t,d,u]),u){if(r.isValidElement(n)){const e={ref:p};return r.cloneElement(n,e)}return n}return d?o.createPortal(n,d):d})},3763:(e,t,n)=>{e.exports=n(4983)},3803:(e,t,n)=>{n.d(t,{A:()=>oe});var r=function(){function e(e){var t=this;this._insertTag=function(e){var n;n=0===t.tags.length?t.insertionPoint?t.insertionPoint.nextSibling:t.prepend?t.container.firstChild:t.before:t.tags[t.tags.length-1].nextSibling,t.container.insertBefore(e,n),t.tags.push(e)},this.isSpeedy=void 0===e.speedy||e.speedy,this.tags=[],this.ctr=0,this.nonce=e.nonce,this.key=e.key,this.container=e.container,this.prepend=e.prepend,this.insertionPoint=e.insertionPoint,this.before=null}var t=e.prototype;return t.hydrate=function(e){e.forEach(this._insertTag)},t.insert=function(e){this.ctr%(this.isSpeedy?65e3:1)===0&&this._insertTag(function(e){var t=document.createElement("style");return t.setAttribute("data-emotion",e.key),void 0!==e.nonce&&t.setAttribute("nonce",e.nonce),t.appendChild(document.createTextNode("")),t.setAttribute("data-s",""),t}(this));var t=this.tags[this.tags.length-1];if(this.isSpeedy){var n=function(e){if(e.sheet)return e.sheet;for(var t=0;t<document.styleSheets.length;t++)if(document.styleSheets[t].ownerNode===e)return document.styleSheets[t]}(t);try{n.insertRule(e,n.cssRules.length)}catch(r){}}else t.appendChild(document.createTextNode(e));this.ctr++},t.flush=function(){this.tags.forEach(function(e){var t;return null==(t=e.parentNode)?void 0:t.removeChild(e)}),this.tags=[],this.ctr=0},e}(),o=Math.abs,a=String.fromCharCode,i=Object.assign;function l(e){return e.trim()}function s(e,t,n){return e.replace(t,n)}function c(e,t){return e.indexOf(t)}function u(e,t){return 0|e.charCodeAt(t)}function d(e,t,n){return e.slice(t,n)}function f(e){return e.length}function p(e){return e.length}function h(e,t){return t.push(e),e}var m=1,g=1,y=0,v=0,b=0,A="";function w(e,t,n,r,o,a,i){return{value:e,root:t,parent:n,type:r,props:o,children:a,line:m,column:g,length:i,return:""}}function S(e,t){return i(w("",null,null,"",null,null,0),e,{length:-e.length},t)}function k(){return b=v>0?u(A,--v):0,g--,10===b&&(g=1,m--),b}function x(){return b=v<y?u(A,v++):0,g++,10===b&&(g=1,m++),b}function C(){return u(A,v)}function E(){return v}function P(e,t){return d(A,e,t)}function T(e){switch(e){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function R(e){return m=g=1,y=f(A=e),v=0,[]}function O(e){return A="",e}function N(e){return l(P(v-1,M(91===e?e+2:40===e?e+1:e)))}function L(e){for(;(b=C())&&b<33;)x();return T(e)>2||T(b)>3?"":" "}function _(e,t){for(;--t&&x()&&!(b<48||b>102||b>57&&b<65||b>70&&b<97););return P(e,E()+(t<6&&32==C()&&32==x()))}function M(e){for(;x();)switch(b){case e:return v;case 34:case 39:34!==e&&39!==e&&M(b);break;case 40:41===e&&M(e);break;case 92:x()}return v}function j(e,t){for(;x()&&e+b!==57&&(e+b!==84||47!==C()););return"/*"+P(t,v-1)+"*"+a(47===e?e:x())}function z(e){for(;!T(C());)x();return P(e,v)}var F="-ms-",I="-moz-",D="-webkit-",B="comm",U="rule",W="decl",H="@keyframes";function V(e,t){for(var n="",r=p(e),o=0;o<r;o++)n+=t(e[o],o,e,t)||"";return n}function $(e,t,n,r){switch(e.type){case"@layer":if(e.children.length)break;case"@import":case W:return e.return=e.return||e.value;case B:return"";case H:return e.return=e.value+"{"+V(e.children,r)+"}";case U:e.value=e.props.join(",")}return f(n=V(e.children,r))?e.return=e.value+"{"+n+"}":""}function q(e){return O(K("",null,null,null,[""],e=R(e),0,[0],e))}function K(e,t,n,r,o,i,l,d,p){for(var m=0,g=0,y=l,v=0,b=0,A=0,w=1,S=1,P=1,T=0,R="",O=o,M=i,F=r,I=R;S;)switch(A=T,T=x()){case 40:if(108!=A&&58==u(I,y-1)){-1!=c(I+=s(N(T),"&","&\f"),"&\f")&&(P=-1);break}case 34:case 39:case 91:I+=N(T);break;case 9:case 10:case 13:case 32:I+=L(A);break;case 92:I+=_(E()-1,7);continue;case 47:switch(C()){case 42:case 47:h(Q(j(x(),E()),t,n),p);break;default:I+="/"}break;case 123*w:d[m++]=f(I)*P;case 125*w:case 59:case 0:switch(T){case 0:case 125:S=0;case 59+g:-1==P&&(I=s(I,/\f/g,"")),b>0&&f(I)-y&&h(b>32?Y(I+";",r,n,y-1):Y(s(I," ","")+";",r,n,y-2),p);break;case 59:I+=";";default:if(h(F=G(I,t,n,m,g,o,d,R,O=[],M=[],y),i),123===T)if(0===g)K(I,t,F,F,O,i,y,d,M);else switch(99===v&&110===u(I,3)?100:v){case 100:case 108:case 109:case 115:K(e,F,F,r&&h(G(e,F,F,0,0,o,d,R,o,O=[],y),M),o,M,y,d,r?O:M);break;default:K(I,F,F,F,[""],M,0,d,M)}}m=g=b=0,w=P=1,R=I="",y=l;break;case 58:y=1+f(I),b=A;default:if(w<1)if(123==T)--w;else if(125==T&&0==w++&&125==k())continue;switch(I+=a(T),T*w){case 38:P=g>0?1:(I+="\f",-1);break;case 44:d[m++]=(f(I)-1)*P,P=1;break;case 64:45===C()&&(I+=N(x())),v=C(),g=y=f(R=I+=z(E())),T++;break;case 45:45===A&&2==f(I)&&(w=0)}}return i}function G(e,t,n,r,a,i,c,u,f,h,m){for(var g=a-1,y=0===a?i:[""],v=p(y),b=0,A=0,S=0;b<r;++b)for(var k=0,x=d(e,g+1,g=o(A=c[b])),C=e;k<v;++k)(C=l(A>0?y[k]+" "+x:s(x,/&\f/g,y[k])))&&(f[S++]=C);return w(e,t,n,0===a?U:u,f,h,m)}function Q(e,t,n){return w(e,t,n,B,a(b),d(e,2,-2),0)}function Y(e,t,n,r){return w(e,t,n,W,d(e,0,r),d(e,r+1,-1),r)}var X=function(e,t,n){for(var r=0,o=0;r=o,o=C(),38===r&&12===o&&(t[n]=1),!T(o);)x();return P(e,v)},J=function(e,t){return O(function(e,t){var n=-1,r=44;do{switch(T(r)){case 0:38===r&&12===C()&&(t[n]=1),e[n]+=X(v-1,t,n);break;case 2:e[n]+=N(r);break;case 4:if(44===r){e[++n]=58===C()?"&\f":"",t[n]=e[n].length;break}default:e[n]+=a(r)}}while(r=x());return e}(R(e),t))},Z=new WeakMap,ee=function(e){if("rule"===e.type&&e.parent&&!(e.length<1)){for(var t=e.value,n=e.parent,r=e.column===n.column&&e.line===n.line;"rule"!==n.type;)if(!(n=n.parent))return;if((1!==e.props.length||58===t.charCodeAt(0)||Z.get(n))&&!r){Z.set(e,!0);for(var o=[],a=J(t,o),i=n.props,l=0,s=0;l<a.length;l++)for(var c=0;c<i.length;c++,s++)e.props[s]=o[l]?a[l].replace(/&\f/g,i[c]):i[c]+" "+a[l]}}},te=function(e){if("decl"===e.type){var t=e.value;108===t.charCodeAt(0)&&98===t.charCodeAt(2)&&(e.return="",e.value="")}};function ne(e,t){switch(function(e,t){return 45^u(e,0)?(((t<<2^u(e,0))<<2^u(e,1))<<2^u(e,2))<<2^u(e,3):0}(e,t)){case 5103:return D+"print-"+e+e;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return D+e+e;case 5349:case 4246:case 4810:case 6968:case 2756:return D+e+I+e+F+e+e;case 6828:case 4268:return D+e+F+e+e;case 6165:return D+e+F+"flex-"+e+e;case 5187:return D+e+s(e,/(\w+).+(:[^]+)/,D+"box-$1$2"+F+"flex-$1$2")+e;case 5443:return D+e+F+"flex-item-"+s(e,/flex-|-self/,"")+e;case 4675:return D+e+F+"flex-line-pack"+s(e,/align-content|flex-|-self/,"")+e;case 5548:return D+e+F+s(e,"shrink","negative")+e;case 5292:return D+e+F+s(e,"basis","preferred-size")+e;case 6060:return D+"box-"+s(e,"-grow","")+D+e+F+s(e,"grow","positive")+e;case 4554:return D+s(e,/([^-])(transform)/g,"$1"+D+"$2")+e;case 6187:return s(s(s(e,/(zoom-|grab)/,D+"$1"),/(image-set)/,D+"$1"),e,"")+e;case 5495:case 3959:return s(e,/(image-set\([^]*)/,D+"$1$`$1");case 4968:return s(s(e,/(.+:)(flex-)?(.*)/,D+"box-pack:$3"+F+"flex-pack:$3"),/s.+-b[^;]+/,"justify")+D+e+e;case 4095:case 3583:case 4068:case 2532:return s(e,/(.+)-inline(.+)/,D+"$1$2")+e;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(f(e)-1-t>6)switch(u(e,t+1)){case 109:if(45!==u(e,t+4))break;case 102:return s(e,/(.+:)(.+)-([^]+)/,"$1"+D+"$2-$3$1"+I+(108==u(e,t+3)?"$3":"$2-$3"))+e;case 115:return~c(e,"stretch")?ne(s(e,"stretch","fill-available"),t)+e:e}break;case 4949:if(115!==u(e,t+1))break;case 6444:switch(u(e,f(e)-3-(~c(e,"!important")&&10))){case 107:return s(e,":",":"+D)+e;case 101:return s(e,/(.+:)([^;!]+)(;|!.+)?/,"$1"+D+(45===u(e,14)?"inline-":"")+"box$3$1"+D+"$2$3$1"+F+"$2box$3")+e}break;case 5936:switch(u(e,t+11)){case 114:return D+e+F+s(e,/[svh]\w+-[tblr]{2}/,"tb")+e;case 108:return D+e+F+s(e,/[svh]\w+-[tblr]{2}/,"tb-rl")+e;case 45:return D+e+F+s(e,/[svh]\w+-[tblr]{2}/,"lr")+e}return D+e+F+e+e}return e}var re=[function(e,t,n,r){if(e.length>-1&&!e.return)switch(e.type){case W:e.return=ne(e.value,e.length);break;case H:return V([S(e,{value:s(e.value,"@","@"+D)})],r);case U:if(e.length)return function(e,t){return e.map(t).join("")}(e.props,function(t){switch(function(e,t){return(e=t.exec(e))?e[0]:e}(t,/(::plac\w+|:read-\w+)/)){case":read-only":case":read-write":return V([S(e,{props:[s(t,/:(read-\w+)/,":-moz-$1")]})],r);case"::placeholder":return V([S(e,{props:[s(t,/:(plac\w+)/,":"+D+"input-$1")]}),S(e,{props:[s(t,/:(plac\w+)/,":-moz-$1")]}),S(e,{props:[s(t,/:(plac\w+)/,F+"input-$1")]})],r)}return""})}}],oe=function(e){var t=e.key;if("css"===t){var n=document.querySelectorAll("style[data-emotion]:not([data-s])");Array.prototype.forEach.call(n,function(e){-1!==e.getAttribute("data-emotion").indexOf(" ")&&(document.head.appendChild(e),e.setAttribute("data-s",""))})}var o,a,i=e.stylisPlugins||re,l={},s=[];o=e.container||document.head,Array.prototype.forEach.call(document.querySelectorAll('style[data-emotion^="'+t+' "]'),function(e){for(var t=e.getAttribute("data-emotion").split(" "),n=1;n<t.length;n++)l[t[n]]=!0;s.push(e)});var c,u,d=[$,(u=function(e){c.insert(e)},function(e){e.root||(e=e.return)&&u(e)})],f=function(e){var t=p(e);return function(n,r,o,a){for(var i="",l=0;l<t;l++)i+=e[l](n,r,o,a)||"";return i}}([ee,te].concat(i,d));a=function(e,t,n,r){c=n,function(e){V(q(e),f)}(e?e+"{"+t.styles+"}":t.styles),r&&(h.inserted[t.name]=!0)};var h={key:t,sheet:new r({key:t,container:o,nonce:e.nonce,speedy:e.speedy,prepend:e.prepend,insertionPoint:e.insertionPoint}),nonce:e.nonce,inserted:l,registered:{},insert:a};return h.sheet.hydrate(s),h}},3969:(e,t,n)=>{n.d(t,{A:()=>b});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(9125),s=n(8623),c=n(5227),u=n(4265),d=n(579);const f=["className","component"];var p=n(5571),h=n(7990),m=n(416);const g=(0,n(9857).A)("MuiBox",["root"]),y=(0,h.A)(),v=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{themeId:t,defaultTheme:n,defaultClassName:p="MuiBox-root",generateClassName:h}=e,m=(0,l.Ay)("div",{shouldForwardProp:e=>"theme"!==e&&"sx"!==e&&"as"!==e})(s.A),g=a.forwardRef(function(e,a){const l=(0,u.A)(n),s=(0,c.A)(e),{className:g,component:y="div"}=s,v=(0,o.A)(s,f);return(0,d.jsx)(m,(0,r.A)({as:y,ref:a,className:(0,i.A)(g,h?h(p):p),theme:t&&l[t]||l},v))});return g}({themeId:m.A,defaultTheme:y,defaultClassName:g.root,generateClassName:p.A.generate}),b=v},4167:(e,t,n)=>{function r(e){try{return e.matches(":focus-visible")}catch(t){0}return!1}n.d(t,{A:()=>r})},4265:(e,t,n)=>{n.d(t,{A:()=>i});var r=n(9049),o=n(5651);const a=(0,r.A)();const i=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:a;return(0,o.A)(e)}},4288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler"),l=Symbol.for("react.consumer"),s=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),u=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}y.prototype.isReactComponent={},y.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},y.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=y.prototype;var A=b.prototype=new v;A.constructor=b,m(A,y.prototype),A.isPureReactComponent=!0;var w=Array.isArray,S={H:null,A:null,T:null,S:null,V:null},k=Object.prototype.hasOwnProperty;function x(e,t,r,o,a,i){return r=i.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:i}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var E=/\/+/g;function P(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function T(){}function R(e,t,o,a,i){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s,c,u=!1;if(null===e)u=!0;else switch(l){case"bigint":case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case n:case r:u=!0;break;case f:return R((u=e._init)(e._payload),t,o,a,i)}}if(u)return i=i(e),u=""===a?"."+P(e,0):a,w(i)?(o="",null!=u&&(o=u.replace(E,"$&/")+"/"),R(i,t,o,"",function(e){return e})):null!=i&&(C(i)&&(s=i,c=o+(null==i.key||e&&e.key===i.key?"":(""+i.key).replace(E,"$&/")+"/")+u,i=x(s.type,c,void 0,0,0,s.props)),t.push(i)),1;u=0;var d,h=""===a?".":a+":";if(w(e))for(var m=0;m<e.length;m++)u+=R(a=e[m],t,o,l=h+P(a,m),i);else if("function"===typeof(m=null===(d=e)||"object"!==typeof d?null:"function"===typeof(d=p&&d[p]||d["@@iterator"])?d:null))for(e=m.call(e),m=0;!(a=e.next()).done;)u+=R(a=a.value,t,o,l=h+P(a,m++),i);else if("object"===l){if("function"===typeof e.then)return R(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(T,T):(e.status="pending",e.then(function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)},function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)})),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,o,a,i);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return u}function O(e,t,n){if(null==e)return e;var r=[],o=0;return R(e,r,"","",function(e){return t.call(n,e,o++)}),r}function N(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var L="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function _(){}t.Children={map:O,forEach:function(e,t,n){O(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return O(e,function(){t++}),t},toArray:function(e){return O(e,function(e){return e})||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=y,t.Fragment=o,t.Profiler=i,t.PureComponent=b,t.StrictMode=a,t.Suspense=u,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=S,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return S.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=m({},e.props),o=e.key;if(null!=t)for(a in void 0!==t.ref&&void 0,void 0!==t.key&&(o=""+t.key),t)!k.call(t,a)||"key"===a||"__self"===a||"__source"===a||"ref"===a&&void 0===t.ref||(r[a]=t[a]);var a=arguments.length-2;if(1===a)r.children=n;else if(1<a){for(var i=Array(a),l=0;l<a;l++)i[l]=arguments[l+2];r.children=i}return x(e.type,o,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:l,_context:e},e},t.createElement=function(e,t,n){var r,o={},a=null;if(null!=t)for(r in void 0!==t.key&&(a=""+t.key),t)k.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(o[r]=t[r]);var i=arguments.length-2;if(1===i)o.children=n;else if(1<i){for(var l=Array(i),s=0;s<i;s++)l[s]=arguments[s+2];o.children=l}if(e&&e.defaultProps)for(r in i=e.defaultProps)void 0===o[r]&&(o[r]=i[r]);return x(e,a,void 0,0,0,o)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:c,render:e}},t.isValidElement=C,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:N}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=S.T,n={};S.T=n;try{var r=e(),o=S.S;null!==o&&o(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(_,L)}catch(a){L(a)}finally{S.T=t}},t.unstable_useCacheRefresh=function(){return S.H.useCacheRefresh()},t.use=function(e){return S.H.use(e)},t.useActionState=function(e,t,n){return S.H.useActionState(e,t,n)},t.useCallback=function(e,t){return S.H.useCallback(e,t)},t.useContext=function(e){return S.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return S.H.useDeferredValue(e,t)},t.useEffect=function(e,t,n){var r=S.H;if("function"===typeof n)throw Error("useEffect CRUD overload is not enabled in this build of React.");return r.useEffect(e,t)},t.useId=function(){return S.H.useId()},t.useImperativeHandle=function(e,t,n){return S.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return S.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return S.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return S.H.useMemo(e,t)},t.useOptimistic=function(e,t){return S.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return S.H.useReducer(e,t,n)},t.useRef=function(e){return S.H.useRef(e)},t.useState=function(e){return S.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return S.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return S.H.useTransition()},t.version="19.1.1"},4391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(7004)},4412:(e,t,n)=>{function r(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[];return t=>{let[,n]=t;return n&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(!function(e){return"string"===typeof e.main}(e))return!1;for(const n of t)if(!e.hasOwnProperty(n)||"string"!==typeof e[n])return!1;return!0}(n,e)}}n.d(t,{A:()=>r})},4418:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(6509).A},4440:(e,t,n)=>{n.d(t,{A:()=>M});var r=n(1834),o=n(159),a=n(9271);const i=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t.reduce((e,t)=>(t.filterProps.forEach(n=>{e[n]=t}),e),{}),o=e=>Object.keys(e).reduce((t,n)=>r[n]?(0,a.A)(t,r[n](e)):t,{});return o.propTypes={},o.filterProps=t.reduce((e,t)=>e.concat(t.filterProps),[]),o};var l=n(6167);function s(e){return"number"!==typeof e?e:"".concat(e,"px solid")}function c(e,t){return(0,o.Ay)({prop:e,themeKey:"borders",transform:t})}const u=c("border",s),d=c("borderTop",s),f=c("borderRight",s),p=c("borderBottom",s),h=c("borderLeft",s),m=c("borderColor"),g=c("borderTopColor"),y=c("borderRightColor"),v=c("borderBottomColor"),b=c("borderLeftColor"),A=c("outline",s),w=c("outlineColor"),S=e=>{if(void 0!==e.borderRadius&&null!==e.borderRadius){const t=(0,r.MA)(e.theme,"shape.borderRadius",4,"borderRadius"),n=e=>({borderRadius:(0,r._W)(t,e)});return(0,l.NI)(e,e.borderRadius,n)}return null};S.propTypes={},S.filterProps=["borderRadius"];i(u,d,f,p,h,m,g,y,v,b,S,A,w);const k=e=>{if(void 0!==e.gap&&null!==e.gap){const t=(0,r.MA)(e.theme,"spacing",8,"gap"),n=e=>({gap:(0,r._W)(t,e)});return(0,l.NI)(e,e.gap,n)}return null};k.propTypes={},k.filterProps=["gap"];const x=e=>{if(void 0!==e.columnGap&&null!==e.columnGap){const t=(0,r.MA)(e.theme,"spacing",8,"columnGap"),n=e=>({columnGap:(0,r._W)(t,e)});return(0,l.NI)(e,e.columnGap,n)}return null};x.propTypes={},x.filterProps=["columnGap"];const C=e=>{if(void 0!==e.rowGap&&null!==e.rowGap){const t=(0,r.MA)(e.theme,"spacing",8,"rowGap"),n=e=>({rowGap:(0,r._W)(t,e)});return(0,l.NI)(e,e.rowGap,n)}return null};C.propTypes={},C.filterProps=["rowGap"];i(k,x,C,(0,o.Ay)({prop:"gridColumn"}),(0,o.Ay)({prop:"gridRow"}),(0,o.Ay)({prop:"gridAutoFlow"}),(0,o.Ay)({prop:"gridAutoColumns"}),(0,o.Ay)({prop:"gridAutoRows"}),(0,o.Ay)({prop:"gridTemplateColumns"}),(0,o.Ay)({prop:"gridTemplateRows"}),(0,o.Ay)({prop:"gridTemplateAreas"}),(0,o.Ay)({prop:"gridArea"}));function E(e,t){return"grey"===t?t:e}i((0,o.Ay)({prop:"color",themeKey:"palette",transform:E}),(0,o.Ay)({prop:"bgcolor",cssProperty:"backgroundColor",themeKey:"palette",transform:E}),(0,o.Ay)({prop:"backgroundColor",themeKey:"palette",transform:E}));function P(e){return e<=1&&0!==e?"".concat(100*e,"%"):e}const T=(0,o.Ay)({prop:"width",transform:P}),R=e=>{if(void 0!==e.maxWidth&&null!==e.maxWidth){const t=t=>{var n,r;const o=(null===(n=e.theme)||void 0===n||null===(n=n.breakpoints)||void 0===n||null===(n=n.values)||void 0===n?void 0:n[t])||l.zu[t];return o?"px"!==(null===(r=e.theme)||void 0===r||null===(r=r.breakpoints)||void 0===r?void 0:r.unit)?{maxWidth:"".concat(o).concat(e.theme.breakpoints.unit)}:{maxWidth:o}:{maxWidth:P(t)}};return(0,l.NI)(e,e.maxWidth,t)}return null};R.filterProps=["maxWidth"];const O=(0,o.Ay)({prop:"minWidth",transform:P}),N=(0,o.Ay)({prop:"height",transform:P}),L=(0,o.Ay)({prop:"maxHeight",transform:P}),_=(0,o.Ay)({prop:"minHeight",transform:P}),M=((0,o.Ay)({prop:"size",cssProperty:"width",transform:P}),(0,o.Ay)({prop:"size",cssProperty:"height",transform:P}),i(T,R,O,N,L,_,(0,o.Ay)({prop:"boxSizing"})),{border:{themeKey:"borders",transform:s},borderTop:{themeKey:"borders",transform:s},borderRight:{themeKey:"borders",transform:s},borderBottom:{themeKey:"borders",transform:s},borderLeft:{themeKey:"borders",transform:s},borderColor:{themeKey:"palette"},borderTopColor:{themeKey:"palette"},borderRightColor:{themeKey:"palette"},borderBottomColor:{themeKey:"palette"},borderLeftColor:{themeKey:"palette"},outline:{themeKey:"borders",transform:s},outlineColor:{themeKey:"palette"},borderRadius:{themeKey:"shape.borderRadius",style:S},color:{themeKey:"palette",transform:E},bgcolor:{themeKey:"palette",cssProperty:"backgroundColor",transform:E},backgroundColor:{themeKey:"palette",transform:E},p:{style:r.Ms},pt:{style:r.Ms},pr:{style:r.Ms},pb:{style:r.Ms},pl:{style:r.Ms},px:{style:r.Ms},py:{style:r.Ms},padding:{style:r.Ms},paddingTop:{style:r.Ms},paddingRight:{style:r.Ms},paddingBottom:{style:r.Ms},paddingLeft:{style:r.Ms},paddingX:{style:r.Ms},paddingY:{style:r.Ms},paddingInline:{style:r.Ms},paddingInlineStart:{style:r.Ms},paddingInlineEnd:{style:r.Ms},paddingBlock:{style:r.Ms},paddingBlockStart:{style:r.Ms},paddingBlockEnd:{style:r.Ms},m:{style:r.Lc},mt:{style:r.Lc},mr:{style:r.Lc},mb:{style:r.Lc},ml:{style:r.Lc},mx:{style:r.Lc},my:{style:r.Lc},margin:{style:r.Lc},marginTop:{style:r.Lc},marginRight:{style:r.Lc},marginBottom:{style:r.Lc},marginLeft:{style:r.Lc},marginX:{style:r.Lc},marginY:{style:r.Lc},marginInline:{style:r.Lc},marginInlineStart:{style:r.Lc},marginInlineEnd:{style:r.Lc},marginBlock:{style:r.Lc},marginBlockStart:{style:r.Lc},marginBlockEnd:{style:r.Lc},displayPrint:{cssProperty:!1,transform:e=>({"@media print":{display:e}})},display:{},overflow:{},textOverflow:{},visibility:{},whiteSpace:{},flexBasis:{},flexDirection:{},flexWrap:{},justifyContent:{},alignItems:{},alignContent:{},order:{},flex:{},flexGrow:{},flexShrink:{},alignSelf:{},justifyItems:{},justifySelf:{},gap:{style:k},rowGap:{style:C},columnGap:{style:x},gridColumn:{},gridRow:{},gridAutoFlow:{},gridAutoColumns:{},gridAutoRows:{},gridTemplateColumns:{},gridTemplateRows:{},gridTemplateAreas:{},gridArea:{},position:{},zIndex:{themeKey:"zIndex"},top:{},right:{},bottom:{},left:{},boxShadow:{themeKey:"shadows"},width:{transform:P},maxWidth:{style:R},minWidth:{transform:P},height:{transform:P},maxHeight:{transform:P},minHeight:{transform:P},boxSizing:{},font:{themeKey:"font"},fontFamily:{themeKey:"typography"},fontSize:{themeKey:"typography"},fontStyle:{themeKey:"typography"},fontWeight:{themeKey:"typography"},letterSpacing:{},textTransform:{},lineHeight:{},textAlign:{},typography:{cssProperty:!1,themeKey:"typography"}})},4467:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(9526);function o(e,t,n){return(t=(0,r.A)(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}},4599:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(9379),o=n(8387);function a(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];const i=(0,r.A)({},t);for(const l in e)if(Object.prototype.hasOwnProperty.call(e,l)){const s=l;if("components"===s||"slots"===s)i[s]=(0,r.A)((0,r.A)({},e[s]),i[s]);else if("componentsProps"===s||"slotProps"===s){const o=e[s],l=t[s];if(l)if(o){i[s]=(0,r.A)({},l);for(const e in o)if(Object.prototype.hasOwnProperty.call(o,e)){const t=e;i[s][t]=a(o[t],l[t],n)}}else i[s]=l;else i[s]=o||{}}else"className"===s&&n&&t.className?i.className=(0,o.A)(null===e||void 0===e?void 0:e.className,null===t||void 0===t?void 0:t.className):"style"===s&&n&&t.style?i.style=(0,r.A)((0,r.A)({},null===e||void 0===e?void 0:e.style),null===t||void 0===t?void 0:t.style):void 0===i[s]&&(i[s]=e[s])}return i}},4799:(e,t,n)=>{n.d(t,{A:()=>w});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(9826),c=n(8128),u=n(267),d=n(1612),f=n(8301),p=n(2391),h=n(9857),m=n(6061);function g(e){return(0,m.Ay)("MuiPaper",e)}(0,h.A)("MuiPaper",["root","rounded","outlined","elevation","elevation0","elevation1","elevation2","elevation3","elevation4","elevation5","elevation6","elevation7","elevation8","elevation9","elevation10","elevation11","elevation12","elevation13","elevation14","elevation15","elevation16","elevation17","elevation18","elevation19","elevation20","elevation21","elevation22","elevation23","elevation24"]);var y=n(579);const v=["className","component","elevation","square","variant"],b=(0,c.Ay)("div",{name:"MuiPaper",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],!n.square&&t.rounded,"elevation"===n.variant&&t["elevation".concat(n.elevation)]]}})((0,d.A)(e=>{let{theme:t}=e;return{backgroundColor:(t.vars||t).palette.background.paper,color:(t.vars||t).palette.text.primary,transition:t.transitions.create("box-shadow"),variants:[{props:e=>{let{ownerState:t}=e;return!t.square},style:{borderRadius:t.shape.borderRadius}},{props:{variant:"outlined"},style:{border:"1px solid ".concat((t.vars||t).palette.divider)}},{props:{variant:"elevation"},style:{boxShadow:"var(--Paper-shadow)",backgroundImage:"var(--Paper-overlay)"}}]}})),A=a.forwardRef(function(e,t){var n;const a=(0,f.b)({props:e,name:"MuiPaper"}),c=(0,u.A)(),{className:d,component:h="div",elevation:m=1,square:A=!1,variant:w="elevation"}=a,S=(0,o.A)(a,v),k=(0,r.A)((0,r.A)({},a),{},{component:h,elevation:m,square:A,variant:w}),x=(e=>{const{square:t,elevation:n,variant:r,classes:o}=e,a={root:["root",r,!t&&"rounded","elevation"===r&&"elevation".concat(n)]};return(0,l.A)(a,g,o)})(k);return(0,y.jsx)(b,(0,r.A)((0,r.A)({as:h,ownerState:k,className:(0,i.A)(x.root,d),ref:t},S),{},{style:(0,r.A)((0,r.A)({},"elevation"===w&&(0,r.A)((0,r.A)({"--Paper-shadow":(c.vars||c).shadows[m]},c.vars&&{"--Paper-overlay":null===(n=c.vars.overlays)||void 0===n?void 0:n[m]}),!c.vars&&"dark"===c.palette.mode&&{"--Paper-overlay":"linear-gradient(".concat((0,s.X4)("#fff",(0,p.A)(m)),", ").concat((0,s.X4)("#fff",(0,p.A)(m)),")")})),S.style)}))}),w=A},4983:(e,t)=>{var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,o=n?Symbol.for("react.portal"):60106,a=n?Symbol.for("react.fragment"):60107,i=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,c=n?Symbol.for("react.context"):60110,u=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,p=n?Symbol.for("react.suspense"):60113,h=n?Symbol.for("react.suspense_list"):60120,m=n?Symbol.for("react.memo"):60115,g=n?Symbol.for("react.lazy"):60116,y=n?Symbol.for("react.block"):60121,v=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,A=n?Symbol.for("react.scope"):60119;function w(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case u:case d:case a:case l:case i:case p:return e;default:switch(e=e&&e.$$typeof){case c:case f:case g:case m:case s:return e;default:return t}}case o:return t}}}function S(e){return w(e)===d}t.AsyncMode=u,t.ConcurrentMode=d,t.ContextConsumer=c,t.ContextProvider=s,t.Element=r,t.ForwardRef=f,t.Fragment=a,t.Lazy=g,t.Memo=m,t.Portal=o,t.Profiler=l,t.StrictMode=i,t.Suspense=p,t.isAsyncMode=function(e){return S(e)||w(e)===u},t.isConcurrentMode=S,t.isContextConsumer=function(e){return w(e)===c},t.isContextProvider=function(e){return w(e)===s},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return w(e)===f},t.isFragment=function(e){return w(e)===a},t.isLazy=function(e){return w(e)===g},t.isMemo=function(e){return w(e)===m},t.isPortal=function(e){return w(e)===o},t.isProfiler=function(e){return w(e)===l},t.isStrictMode=function(e){return w(e)===i},t.isSuspense=function(e){return w(e)===p},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===a||e===d||e===l||e===i||e===p||e===h||"object"===typeof e&&null!==e&&(e.$$typeof===g||e.$$typeof===m||e.$$typeof===s||e.$$typeof===c||e.$$typeof===f||e.$$typeof===v||e.$$typeof===b||e.$$typeof===A||e.$$typeof===y)},t.typeOf=w},5043:(e,t,n)=>{e.exports=n(4288)},5227:(e,t,n)=>{n.d(t,{A:()=>c});var r=n(9379),o=n(45),a=n(3129),i=n(4440);const l=["sx"],s=e=>{var t,n;const r={systemProps:{},otherProps:{}},o=null!==(t=null===e||void 0===e||null===(n=e.theme)||void 0===n?void 0:n.unstable_sxConfig)&&void 0!==t?t:i.A;return Object.keys(e).forEach(t=>{o[t]?r.systemProps[t]=e[t]:r.otherProps[t]=e[t]}),r};function c(e){const{sx:t}=e,n=(0,o.A)(e,l),{systemProps:i,otherProps:c}=s(n);let u;return u=Array.isArray(t)?[i,...t]:"function"===typeof t?function(){const e=t(...arguments);return(0,a.Q)(e)?(0,r.A)((0,r.A)({},i),e):i}:(0,r.A)((0,r.A)({},i),t),(0,r.A)((0,r.A)({},c),{},{sx:u})}},5315:(e,t,n)=>{n.d(t,{A:()=>y});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(8128),c=n(8301),u=n(9066),d=n(9857),f=n(6061);function p(e){return(0,f.Ay)("MuiList",e)}(0,d.A)("MuiList",["root","padding","dense","subheader"]);var h=n(579);const m=["children","className","component","dense","disablePadding","subheader"],g=(0,s.Ay)("ul",{name:"MuiList",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disablePadding&&t.padding,n.dense&&t.dense,n.subheader&&t.subheader]}})({listStyle:"none",margin:0,padding:0,position:"relative",variants:[{props:e=>{let{ownerState:t}=e;return!t.disablePadding},style:{paddingTop:8,paddingBottom:8}},{props:e=>{let{ownerState:t}=e;return t.subheader},style:{paddingTop:0}}]}),y=a.forwardRef(function(e,t){const n=(0,c.b)({props:e,name:"MuiList"}),{children:s,className:d,component:f="ul",dense:y=!1,disablePadding:v=!1,subheader:b}=n,A=(0,o.A)(n,m),w=a.useMemo(()=>({dense:y}),[y]),S=(0,r.A)((0,r.A)({},n),{},{component:f,dense:y,disablePadding:v}),k=(e=>{const{classes:t,disablePadding:n,dense:r,subheader:o}=e,a={root:["root",!n&&"padding",r&&"dense",o&&"subheader"]};return(0,l.A)(a,p,t)})(S);return(0,h.jsx)(u.A.Provider,{value:w,children:(0,h.jsxs)(g,(0,r.A)((0,r.A)({as:f,className:(0,i.A)(k.root,d),ref:t,ownerState:S},A),{},{children:[b,s]}))})})},5352:(e,t,n)=>{n.d(t,{BV:()=>Oe,Kd:()=>ct,N_:()=>dt,Zp:()=>de,k2:()=>ft,qh:()=>Te});var r=n(45),o=n(9379),a=n(5043);const i=["sri"],l=["page"],s=["page","matches"],c=["onClick","discover","prefetch","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],u=["aria-current","caseSensitive","className","end","style","to","viewTransition","children"],d=["discover","fetcherKey","navigate","reloadDocument","replace","state","method","action","onSubmit","relative","preventScrollReset","viewTransition"];var f="popstate";function p(){return A(function(e,t){let{pathname:n,search:r,hash:o}=e.location;return y("",{pathname:n,search:r,hash:o},t.state&&t.state.usr||null,t.state&&t.state.key||"default")},function(e,t){return"string"===typeof t?t:v(t)},null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function h(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function m(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function g(e,t){return{usr:e.state,key:e.key,idx:t}}function y(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return(0,o.A)((0,o.A)({pathname:"string"===typeof e?e:e.pathname,search:"",hash:""},"string"===typeof t?b(t):t),{},{state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)})}function v(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function b(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function A(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:i=!1}=r,l=a.history,s="POP",c=null,u=d();function d(){return(l.state||{idx:null}).idx}function p(){s="POP";let e=d(),t=null==e?null:e-u;u=e,c&&c({action:s,location:m.location,delta:t})}function h(e){return w(e)}null==u&&(u=0,l.replaceState((0,o.A)((0,o.A)({},l.state),{},{idx:u}),""));let m={get action(){return s},get location(){return e(a,l)},listen(e){if(c)throw new Error("A history only accepts one active listener");return a.addEventListener(f,p),c=e,()=>{a.removeEventListener(f,p),c=null}},createHref:e=>t(a,e),createURL:h,encodeLocation(e){let t=h(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){s="PUSH";let r=y(m.location,e,t);n&&n(r,e),u=d()+1;let o=g(r,u),f=m.createHref(r);try{l.pushState(o,"",f)}catch(p){if(p instanceof DOMException&&"DataCloneError"===p.name)throw p;a.location.assign(f)}i&&c&&c({action:s,location:m.location,delta:1})},replace:function(e,t){s="REPLACE";let r=y(m.location,e,t);n&&n(r,e),u=d();let o=g(r,u),a=m.createHref(r);l.replaceState(o,"",a),i&&c&&c({action:s,location:m.location,delta:0})},go:e=>l.go(e)};return m}function w(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n="http://localhost";"undefined"!==typeof window&&(n="null"!==window.location.origin?window.location.origin:window.location.href),h(n,"No window.location.(origin|href) available to create URL");let r="string"===typeof e?e:v(e);return r=r.replace(/ $/,"%20"),!t&&r.startsWith("//")&&(r=n+r),new URL(r,n)}new WeakMap;function S(e,t){return k(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function k(e,t,n,r){let o=I(("string"===typeof t?b(t):t).pathname||"/",n);if(null==o)return null;let a=x(e);!function(e){e.sort((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every((e,n)=>e===t[n]);return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map(e=>e.childrenIndex),t.routesMeta.map(e=>e.childrenIndex)))}(a);let i=null;for(let l=0;null==i&&l<a.length;++l){let e=F(o);i=M(a[l],e,r)}return i}function x(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",o=arguments.length>4&&void 0!==arguments[4]&&arguments[4],a=function(e,a){let i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:o,l=arguments.length>3?arguments[3]:void 0,s={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};if(s.relativePath.startsWith("/")){if(!s.relativePath.startsWith(r)&&i)return;h(s.relativePath.startsWith(r),'Absolute route path "'.concat(s.relativePath,'" nested under path "').concat(r,'" is not valid. An absolute child route path must start with the combined path of all its parent routes.')),s.relativePath=s.relativePath.slice(r.length)}let c=H([r,s.relativePath]),u=n.concat(s);e.children&&e.children.length>0&&(h(!0!==e.index,'Index routes must not have child routes. Please remove all child routes from route path "'.concat(c,'".')),x(e.children,t,u,c,i)),(null!=e.path||e.index)&&t.push({path:c,score:_(c,e.index),routesMeta:u})};return e.forEach((e,t)=>{var n;if(""!==e.path&&null!==(n=e.path)&&void 0!==n&&n.includes("?"))for(let r of C(e.path))a(e,t,!0,r);else a(e,t)}),t}function C(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,o=n.endsWith("?"),a=n.replace(/\?$/,"");if(0===r.length)return o?[a,""]:[a];let i=C(r.join("/")),l=[];return l.push(...i.map(e=>""===e?a:[a,e].join("/"))),o&&l.push(...i),l.map(t=>e.startsWith("/")&&""===t?"/":t)}var E=/^:[\w-]+$/,P=3,T=2,R=1,O=10,N=-2,L=e=>"*"===e;function _(e,t){let n=e.split("/"),r=n.length;return n.some(L)&&(r+=N),t&&(r+=T),n.filter(e=>!L(e)).reduce((e,t)=>e+(E.test(t)?P:""===t?R:O),r)}function M(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,o={},a="/",i=[];for(let l=0;l<r.length;++l){let e=r[l],s=l===r.length-1,c="/"===a?t:t.slice(a.length)||"/",u=j({path:e.relativePath,caseSensitive:e.caseSensitive,end:s},c),d=e.route;if(!u&&s&&n&&!r[r.length-1].route.index&&(u=j({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},c)),!u)return null;Object.assign(o,u.params),i.push({params:o,pathname:H([a,u.pathname]),pathnameBase:V(H([a,u.pathnameBase])),route:d}),"/"!==u.pathnameBase&&(a=H([a,u.pathnameBase]))}return i}function j(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=z(e.path,e.caseSensitive,e.end),o=t.match(n);if(!o)return null;let a=o[0],i=a.replace(/(.)\/+$/,"$1"),l=o.slice(1);return{params:r.reduce((e,t,n)=>{let{paramName:r,isOptional:o}=t;if("*"===r){let e=l[n]||"";i=a.slice(0,a.length-e.length).replace(/(.)\/+$/,"$1")}const s=l[n];return e[r]=o&&!s?void 0:(s||"").replace(/%2F/g,"/"),e},{}),pathname:a,pathnameBase:i,pattern:e}}function z(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];m("*"===e||!e.endsWith("*")||e.endsWith("/*"),'Route path "'.concat(e,'" will be treated as if it were "').concat(e.replace(/\*$/,"/*"),'" because the `*` character must always follow a `/` in the pattern. To get rid of this warning, please change the route path to "').concat(e.replace(/\*$/,"/*"),'".'));let r=[],o="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")).replace(/\/([\w-]+)\?(\/|$)/g,"(/$1)?$2");return e.endsWith("*")?(r.push({paramName:"*"}),o+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?o+="\\/*$":""!==e&&"/"!==e&&(o+="(?:(?=\\/|$))"),[new RegExp(o,t?void 0:"i"),r]}function F(e){try{return e.split("/").map(e=>decodeURIComponent(e).replace(/\//g,"%2F")).join("/")}catch(t){return m(!1,'The URL path "'.concat(e,'" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (').concat(t,").")),e}}function I(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function D(e,t,n,r){return"Cannot include a '".concat(e,"' character in a manually specified `to.").concat(t,"` field [").concat(JSON.stringify(r),"].  Please separate it out to the `to.").concat(n,'` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.')}function B(e){return e.filter((e,t)=>0===t||e.route.path&&e.route.path.length>0)}function U(e){let t=B(e);return t.map((e,n)=>n===t.length-1?e.pathname:e.pathnameBase)}function W(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=b(e):(r=(0,o.A)({},e),h(!r.pathname||!r.pathname.includes("?"),D("?","pathname","search",r)),h(!r.pathname||!r.pathname.includes("#"),D("#","pathname","hash",r)),h(!r.search||!r.search.includes("#"),D("#","search","hash",r)));let i,l=""===e||""===r.pathname,s=l?"/":r.pathname;if(null==s)i=n;else{let e=t.length-1;if(!a&&s.startsWith("..")){let t=s.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}i=e>=0?t[e]:"/"}let c=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:o=""}="string"===typeof e?b(e):e,a=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)}),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:a,search:$(r),hash:q(o)}}(r,i),u=s&&"/"!==s&&s.endsWith("/"),d=(l||"."===s)&&n.endsWith("/");return c.pathname.endsWith("/")||!u&&!d||(c.pathname+="/"),c}var H=e=>e.join("/").replace(/\/\/+/g,"/"),V=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),$=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",q=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function K(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var G=["POST","PUT","PATCH","DELETE"],Q=(new Set(G),["GET",...G]);new Set(Q),Symbol("ResetLoaderData");var Y=a.createContext(null);Y.displayName="DataRouter";var X=a.createContext(null);X.displayName="DataRouterState";var J=a.createContext(!1);var Z=a.createContext({isTransitioning:!1});Z.displayName="ViewTransition";var ee=a.createContext(new Map);ee.displayName="Fetchers";var te=a.createContext(null);te.displayName="Await";var ne=a.createContext(null);ne.displayName="Navigation";var re=a.createContext(null);re.displayName="Location";var oe=a.createContext({outlet:null,matches:[],isDataRoute:!1});oe.displayName="Route";var ae=a.createContext(null);ae.displayName="RouteError";var ie=!0;function le(){return null!=a.useContext(re)}function se(){return h(le(),"useLocation() may be used only in the context of a <Router> component."),a.useContext(re).location}var ce="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ue(e){a.useContext(ne).static||a.useLayoutEffect(e)}function de(){let{isDataRoute:e}=a.useContext(oe);return e?function(){let{router:e}=Ae("useNavigate"),t=Se("useNavigate"),n=a.useRef(!1);ue(()=>{n.current=!0});let r=a.useCallback(async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};m(n.current,ce),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,(0,o.A)({fromRouteId:t},a)))},[e,t]);return r}():function(){h(le(),"useNavigate() may be used only in the context of a <Router> component.");let e=a.useContext(Y),{basename:t,navigator:n}=a.useContext(ne),{matches:r}=a.useContext(oe),{pathname:o}=se(),i=JSON.stringify(U(r)),l=a.useRef(!1);ue(()=>{l.current=!0});let s=a.useCallback(function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(m(l.current,ce),!l.current)return;if("number"===typeof r)return void n.go(r);let s=W(r,JSON.parse(i),o,"path"===a.relative);null==e&&"/"!==t&&(s.pathname="/"===s.pathname?t:H([t,s.pathname])),(a.replace?n.replace:n.push)(s,a.state,a)},[t,n,i,o,e]);return s}()}a.createContext(null);function fe(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=a.useContext(oe),{pathname:r}=se(),o=JSON.stringify(U(n));return a.useMemo(()=>W(e,JSON.parse(o),r,"path"===t),[e,o,r,t])}function pe(e,t,n,r,i){h(le(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l}=a.useContext(ne),{matches:s}=a.useContext(oe),c=s[s.length-1],u=c?c.params:{},d=c?c.pathname:"/",f=c?c.pathnameBase:"/",p=c&&c.route;if(ie){let e=p&&p.path||"";Ce(d,!p||e.endsWith("*")||e.endsWith("*?"),'You rendered descendant <Routes> (or called `useRoutes()`) at "'.concat(d,'" (under <Route path="').concat(e,'">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won\'t match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="').concat(e,'"> to <Route path="').concat("/"===e?"*":"".concat(e,"/*"),'">.'))}let g,y=se();if(t){var v;let e="string"===typeof t?b(t):t;h("/"===f||(null===(v=e.pathname)||void 0===v?void 0:v.startsWith(f)),'When overriding the location using `<Routes location>` or `useRoutes(routes, location)`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "'.concat(f,'" but pathname "').concat(e.pathname,'" was given in the `location` prop.')),g=e}else g=y;let A=g.pathname||"/",w=A;if("/"!==f){let e=f.replace(/^\//,"").split("/");w="/"+A.replace(/^\//,"").split("/").slice(e.length).join("/")}let k=S(e,{pathname:w});ie&&(m(p||null!=k,'No routes matched location "'.concat(g.pathname).concat(g.search).concat(g.hash,'" ')),m(null==k||void 0!==k[k.length-1].route.element||void 0!==k[k.length-1].route.Component||void 0!==k[k.length-1].route.lazy,'Matched leaf route at location "'.concat(g.pathname).concat(g.search).concat(g.hash,'" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.')));let x=ve(k&&k.map(e=>Object.assign({},e,{params:Object.assign({},u,e.params),pathname:H([f,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?f:H([f,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])})),s,n,r,i);return t&&x?a.createElement(re.Provider,{value:{location:(0,o.A)({pathname:"/",search:"",hash:"",state:null,key:"default"},g),navigationType:"POP"}},x):x}function he(){let e=ke(),t=K(e)?"".concat(e.status," ").concat(e.statusText):e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",o={padding:"0.5rem",backgroundColor:r},i={padding:"2px 4px",backgroundColor:r},l=null;return ie&&(console.error("Error handled by React Router default ErrorBoundary:",e),l=a.createElement(a.Fragment,null,a.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),a.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",a.createElement("code",{style:i},"ErrorBoundary")," or"," ",a.createElement("code",{style:i},"errorElement")," prop on your route."))),a.createElement(a.Fragment,null,a.createElement("h2",null,"Unexpected Application Error!"),a.createElement("h3",{style:{fontStyle:"italic"}},t),n?a.createElement("pre",{style:o},n):null,l)}var me=a.createElement(he,null),ge=class extends a.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){this.props.unstable_onError?this.props.unstable_onError(e,t):console.error("React Router caught the following error during render",e)}render(){return void 0!==this.state.error?a.createElement(oe.Provider,{value:this.props.routeContext},a.createElement(ae.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function ye(e){let{routeContext:t,match:n,children:r}=e,o=a.useContext(Y);return o&&o.static&&o.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(o.staticContext._deepestRenderedBoundaryId=n.route.id),a.createElement(oe.Provider,{value:t},r)}function ve(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let o=e,i=null===n||void 0===n?void 0:n.errors;if(null!=i){let e=o.findIndex(e=>e.route.id&&void 0!==(null===i||void 0===i?void 0:i[e.route.id]));h(e>=0,"Could not find a matching route for errors on route IDs: ".concat(Object.keys(i).join(","))),o=o.slice(0,Math.min(o.length,e+1))}let l=!1,s=-1;if(n)for(let a=0;a<o.length;a++){let e=o[a];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(s=a),e.route.id){let{loaderData:t,errors:r}=n,a=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!r||void 0===r[e.route.id]);if(e.route.lazy||a){l=!0,o=s>=0?o.slice(0,s+1):[o[0]];break}}}return o.reduceRight((e,c,u)=>{let d,f=!1,p=null,h=null;n&&(d=i&&c.route.id?i[c.route.id]:void 0,p=c.route.errorElement||me,l&&(s<0&&0===u?(Ce("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),f=!0,h=null):s===u&&(f=!0,h=c.route.hydrateFallbackElement||null)));let m=t.concat(o.slice(0,u+1)),g=()=>{let t;return t=d?p:f?h:c.route.Component?a.createElement(c.route.Component,null):c.route.element?c.route.element:e,a.createElement(ye,{match:c,routeContext:{outlet:e,matches:m,isDataRoute:null!=n},children:t})};return n&&(c.route.ErrorBoundary||c.route.errorElement||0===u)?a.createElement(ge,{location:n.location,revalidation:n.revalidation,component:p,error:d,children:g(),routeContext:{outlet:null,matches:m,isDataRoute:!0},unstable_onError:r}):g()},null)}function be(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function Ae(e){let t=a.useContext(Y);return h(t,be(e)),t}function we(e){let t=a.useContext(X);return h(t,be(e)),t}function Se(e){let t=function(e){let t=a.useContext(oe);return h(t,be(e)),t}(e),n=t.matches[t.matches.length-1];return h(n.route.id,"".concat(e,' can only be used on routes that contain a unique "id"')),n.route.id}function ke(){var e;let t=a.useContext(ae),n=we("useRouteError"),r=Se("useRouteError");return void 0!==t?t:null===(e=n.errors)||void 0===e?void 0:e[r]}var xe={};function Ce(e,t,n){t||xe[e]||(xe[e]=!0,m(!1,n))}var Ee={};function Pe(e,t){e||Ee[t]||(Ee[t]=!0,console.warn(t))}a.memo(function(e){let{routes:t,future:n,state:r,unstable_onError:o}=e;return pe(t,void 0,r,o,n)});function Te(e){h(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function Re(e){let{basename:t="/",children:n=null,location:r,navigationType:o="POP",navigator:i,static:l=!1}=e;h(!le(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let s=t.replace(/^\/*/,"/"),c=a.useMemo(()=>({basename:s,navigator:i,static:l,future:{}}),[s,i,l]);"string"===typeof r&&(r=b(r));let{pathname:u="/",search:d="",hash:f="",state:p=null,key:g="default"}=r,y=a.useMemo(()=>{let e=I(u,s);return null==e?null:{location:{pathname:e,search:d,hash:f,state:p,key:g},navigationType:o}},[s,u,d,f,p,g,o]);return m(null!=y,'<Router basename="'.concat(s,'"> is not able to match the URL "').concat(u).concat(d).concat(f,"\" because it does not start with the basename, so the <Router> won't render anything.")),null==y?null:a.createElement(ne.Provider,{value:c},a.createElement(re.Provider,{children:n,value:y}))}function Oe(e){let{children:t,location:n}=e;return pe(Ne(t),n)}a.Component;function Ne(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return a.Children.forEach(e,(e,r)=>{if(!a.isValidElement(e))return;let o=[...t,r];if(e.type===a.Fragment)return void n.push.apply(n,Ne(e.props.children,o));h(e.type===Te,"[".concat("string"===typeof e.type?e.type:e.type.name,"] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>")),h(!e.props.index||!e.props.children,"An index route cannot have child routes.");let i={id:e.props.id||o.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(i.children=Ne(e.props.children,o)),n.push(i)}),n}var Le="get",_e="application/x-www-form-urlencoded";function Me(e){return null!=e&&"string"===typeof e.tagName}var je=null;var ze=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Fe(e){return null==e||ze.has(e)?e:(m(!1,'"'.concat(e,'" is not a valid `encType` for `<Form>`/`<fetcher.Form>` and will default to "').concat(_e,'"')),null)}function Ie(e,t){let n,r,o,a,i;if(Me(l=e)&&"form"===l.tagName.toLowerCase()){let i=e.getAttribute("action");r=i?I(i,t):null,n=e.getAttribute("method")||Le,o=Fe(e.getAttribute("enctype"))||_e,a=new FormData(e)}else if(function(e){return Me(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return Me(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let i=e.form;if(null==i)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let l=e.getAttribute("formaction")||i.getAttribute("action");if(r=l?I(l,t):null,n=e.getAttribute("formmethod")||i.getAttribute("method")||Le,o=Fe(e.getAttribute("formenctype"))||Fe(i.getAttribute("enctype"))||_e,a=new FormData(i,e),!function(){if(null===je)try{new FormData(document.createElement("form"),0),je=!1}catch(e){je=!0}return je}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?"".concat(t,"."):"";a.append("".concat(e,"x"),"0"),a.append("".concat(e,"y"),"0")}else t&&a.append(t,r)}}else{if(Me(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=Le,r=null,o=_e,i=e}var l;return a&&"text/plain"===o&&(i=a,a=void 0),{action:r,method:n.toLowerCase(),encType:o,formData:a,body:i}}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");"undefined"!==typeof window?window:"undefined"!==typeof globalThis&&globalThis;function De(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}Symbol("SingleFetchRedirect");function Be(e,t,n){let r="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===r.pathname?r.pathname="_root.".concat(n):t&&"/"===I(r.pathname,t)?r.pathname="".concat(t.replace(/\/$/,""),"/_root.").concat(n):r.pathname="".concat(r.pathname.replace(/\/$/,""),".").concat(n),r}async function Ue(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error("Error loading route module `".concat(e.module,"`, reloading page...")),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function We(e){return null!=e&&"string"===typeof e.page}function He(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function Ve(e,t,n,r,o,a){let i=(e,t)=>!n[t]||e.route.id!==n[t].route.id,l=(e,t)=>{var r;return n[t].pathname!==e.pathname||(null===(r=n[t].route.path)||void 0===r?void 0:r.endsWith("*"))&&n[t].params["*"]!==e.params["*"]};return"assets"===a?t.filter((e,t)=>i(e,t)||l(e,t)):"data"===a?t.filter((t,a)=>{let s=r.routes[t.route.id];if(!s||!s.hasLoader)return!1;if(i(t,a)||l(t,a))return!0;if(t.route.shouldRevalidate){var c;let r=t.route.shouldRevalidate({currentUrl:new URL(o.pathname+o.search+o.hash,window.origin),currentParams:(null===(c=n[0])||void 0===c?void 0:c.params)||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0}):[]}function $e(e,t){let{includeHydrateFallback:n}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return r=e.map(e=>{let r=t.routes[e.route.id];if(!r)return[];let o=[r.module];return r.clientActionModule&&(o=o.concat(r.clientActionModule)),r.clientLoaderModule&&(o=o.concat(r.clientLoaderModule)),n&&r.hydrateFallbackModule&&(o=o.concat(r.hydrateFallbackModule)),r.imports&&(o=o.concat(r.imports)),o}).flat(1),[...new Set(r)];var r}function qe(e,t){let n=new Set,r=new Set(t);return e.reduce((e,o)=>{if(t&&!We(o)&&"script"===o.as&&o.href&&r.has(o.href))return e;let a=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(o));return n.has(a)||(n.add(a),e.push({key:a,link:o})),e},[])}function Ke(e,t){return"lazy"===e.mode&&!0===t}function Ge(){let e=a.useContext(Y);return De(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function Qe(){let e=a.useContext(X);return De(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var Ye=a.createContext(void 0);function Xe(){let e=a.useContext(Ye);return De(e,"You must render this element inside a <HydratedRouter> element"),e}function Je(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function Ze(e,t,n){if(n&&!rt)return[e[0]];if(t){let n=e.findIndex(e=>void 0!==t[e.route.id]);return e.slice(0,n+1)}return e}Ye.displayName="FrameworkContext";function et(e){let{page:t}=e,n=(0,r.A)(e,l),{router:i}=Ge(),s=a.useMemo(()=>S(i.routes,t,i.basename),[i.routes,t,i.basename]);return s?a.createElement(nt,(0,o.A)({page:t,matches:s},n)):null}function tt(e){let{manifest:t,routeModules:n}=Xe(),[r,i]=a.useState([]);return a.useEffect(()=>{let r=!1;return async function(e,t,n){return qe((await Promise.all(e.map(async e=>{let r=t.routes[e.route.id];if(r){let e=await Ue(r,n);return e.links?e.links():[]}return[]}))).flat(1).filter(He).filter(e=>"stylesheet"===e.rel||"preload"===e.rel).map(e=>"stylesheet"===e.rel?(0,o.A)((0,o.A)({},e),{},{rel:"prefetch",as:"style"}):(0,o.A)((0,o.A)({},e),{},{rel:"prefetch"})))}(e,t,n).then(e=>{r||i(e)}),()=>{r=!0}},[e,t,n]),r}function nt(e){let{page:t,matches:n}=e,i=(0,r.A)(e,s),l=se(),{manifest:c,routeModules:u}=Xe(),{basename:d}=Ge(),{loaderData:f,matches:p}=Qe(),h=a.useMemo(()=>Ve(t,n,p,c,l,"data"),[t,n,p,c,l]),m=a.useMemo(()=>Ve(t,n,p,c,l,"assets"),[t,n,p,c,l]),g=a.useMemo(()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach(t=>{var n;let o=c.routes[t.route.id];o&&o.hasLoader&&(!h.some(e=>e.route.id===t.route.id)&&t.route.id in f&&null!==(n=u[t.route.id])&&void 0!==n&&n.shouldRevalidate||o.hasClientLoader?r=!0:e.add(t.route.id))}),0===e.size)return[];let o=Be(t,d,"data");return r&&e.size>0&&o.searchParams.set("_routes",n.filter(t=>e.has(t.route.id)).map(e=>e.route.id).join(",")),[o.pathname+o.search]},[d,f,l,c,h,n,t,u]),y=a.useMemo(()=>$e(m,c),[m,c]),v=tt(m);return a.createElement(a.Fragment,null,g.map(e=>a.createElement("link",(0,o.A)({key:e,rel:"prefetch",as:"fetch",href:e},i))),y.map(e=>a.createElement("link",(0,o.A)({key:e,rel:"modulepreload",href:e},i))),v.map(e=>{let{key:t,link:n}=e;return a.createElement("link",(0,o.A)({key:t,nonce:i.nonce},n))}))}var rt=!1;function ot(e){let{manifest:t,serverHandoffString:n,isSpaMode:l,renderMeta:s,routeDiscovery:c,ssr:u}=Xe(),{router:d,static:f,staticContext:p}=Ge(),{matches:h}=Qe(),m=a.useContext(J),g=Ke(c,u);s&&(s.didRenderScripts=!0);let y=Ze(h,null,l);a.useEffect(()=>{rt=!0},[]);let v=a.useMemo(()=>{var l;if(m)return null;let s=p?"window.__reactRouterContext = ".concat(n,";").concat("window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());"):" ",c=f?"".concat(null!==(l=t.hmr)&&void 0!==l&&l.runtime?"import ".concat(JSON.stringify(t.hmr.runtime),";"):"").concat(g?"":"import ".concat(JSON.stringify(t.url)),";\n").concat(y.map((e,n)=>{let r="route".concat(n),o=t.routes[e.route.id];De(o,"Route ".concat(e.route.id," not found in manifest"));let{clientActionModule:a,clientLoaderModule:i,clientMiddlewareModule:l,hydrateFallbackModule:s,module:c}=o,u=[...a?[{module:a,varName:"".concat(r,"_clientAction")}]:[],...i?[{module:i,varName:"".concat(r,"_clientLoader")}]:[],...l?[{module:l,varName:"".concat(r,"_clientMiddleware")}]:[],...s?[{module:s,varName:"".concat(r,"_HydrateFallback")}]:[],{module:c,varName:"".concat(r,"_main")}];return 1===u.length?"import * as ".concat(r," from ").concat(JSON.stringify(c),";"):[u.map(e=>"import * as ".concat(e.varName,' from "').concat(e.module,'";')).join("\n"),"const ".concat(r," = {").concat(u.map(e=>"...".concat(e.varName)).join(","),"};")].join("\n")}).join("\n"),"\n  ").concat(g?"window.__reactRouterManifest = ".concat(JSON.stringify(function(e,t){let{sri:n}=e,a=(0,r.A)(e,i),l=new Set(t.state.matches.map(e=>e.route.id)),s=t.state.location.pathname.split("/").filter(Boolean),c=["/"];for(s.pop();s.length>0;)c.push("/".concat(s.join("/"))),s.pop();c.forEach(e=>{let n=S(t.routes,e,t.basename);n&&n.forEach(e=>l.add(e.route.id))});let u=[...l].reduce((e,t)=>Object.assign(e,{[t]:a.routes[t]}),{});return(0,o.A)((0,o.A)({},a),{},{routes:u,sri:!!n||void 0})}(t,d),null,2),";"):"","\n  window.__reactRouterRouteModules = {").concat(y.map((e,t)=>"".concat(JSON.stringify(e.route.id),":route").concat(t)).join(","),"};\n\nimport(").concat(JSON.stringify(t.entry.module),");"):" ";return a.createElement(a.Fragment,null,a.createElement("script",(0,o.A)((0,o.A)({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:s},type:void 0})),a.createElement("script",(0,o.A)((0,o.A)({},e),{},{suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:c},type:"module",async:!0})))},[]),b=rt||m?[]:(A=t.entry.imports.concat($e(y,t,{includeHydrateFallback:!0})),[...new Set(A)]);var A;let w="object"===typeof t.sri?t.sri:{};return Pe(!m,"The <Scripts /> element is a no-op when using RSC and can be safely removed."),rt||m?null:a.createElement(a.Fragment,null,"object"===typeof t.sri?a.createElement("script",{"rr-importmap":"",type:"importmap",suppressHydrationWarning:!0,dangerouslySetInnerHTML:{__html:JSON.stringify({integrity:w})}}):null,g?null:a.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin,integrity:w[t.url],suppressHydrationWarning:!0}),a.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin,integrity:w[t.entry.module],suppressHydrationWarning:!0}),b.map(t=>a.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin,integrity:w[t],suppressHydrationWarning:!0})),v)}function at(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach(t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)})}}a.Component;function it(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let r,o=a.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://reactrouter.com/how-to/error-boundary for more information."\n        );\n      '}});if(K(t))return a.createElement(lt,{title:"Unhandled Thrown Response!"},a.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),ie?o:null);if(t instanceof Error)r=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);r=new Error(e)}return a.createElement(lt,{title:"Application Error!",isOutsideRemixApp:n},a.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),a.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},r.stack),o)}function lt(e){var t;let{title:n,renderScripts:r,isOutsideRemixApp:o,children:i}=e,{routeModules:l}=Xe();return null!==(t=l.root)&&void 0!==t&&t.Layout&&!o?i:a.createElement("html",{lang:"en"},a.createElement("head",null,a.createElement("meta",{charSet:"utf-8"}),a.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),a.createElement("title",null,n)),a.createElement("body",null,a.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},i,r?a.createElement(ot,null):null)))}var st="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{st&&(window.__reactRouterVersion="7.9.1")}catch(bt){}function ct(e){let{basename:t,children:n,window:r}=e,o=a.useRef();null==o.current&&(o.current=p({window:r,v5Compat:!0}));let i=o.current,[l,s]=a.useState({action:i.action,location:i.location}),c=a.useCallback(e=>{a.startTransition(()=>s(e))},[s]);return a.useLayoutEffect(()=>i.listen(c),[i,c]),a.createElement(Re,{basename:t,children:n,location:l.location,navigationType:l.action,navigator:i})}var ut=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,dt=a.forwardRef(function(e,t){let n,{onClick:i,discover:l="render",prefetch:s="none",relative:u,reloadDocument:d,replace:f,state:p,target:g,to:y,preventScrollReset:b,viewTransition:A}=e,w=(0,r.A)(e,c),{basename:S}=a.useContext(ne),k="string"===typeof y&&ut.test(y),x=!1;if("string"===typeof y&&k&&(n=y,st))try{let e=new URL(window.location.href),t=y.startsWith("//")?new URL(e.protocol+y):new URL(y),n=I(t.pathname,S);t.origin===e.origin&&null!=n?y=n+t.search+t.hash:x=!0}catch(bt){m(!1,'<Link to="'.concat(y,'"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.'))}let C=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};h(le(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=a.useContext(ne),{hash:o,pathname:i,search:l}=fe(e,{relative:t}),s=i;return"/"!==n&&(s="/"===i?n:H([n,i])),r.createHref({pathname:s,search:l,hash:o})}(y,{relative:u}),[E,P,T]=function(e,t){let n=a.useContext(Ye),[r,o]=a.useState(!1),[i,l]=a.useState(!1),{onFocus:s,onBlur:c,onMouseEnter:u,onMouseLeave:d,onTouchStart:f}=t,p=a.useRef(null);a.useEffect(()=>{if("render"===e&&l(!0),"viewport"===e){let e=new IntersectionObserver(e=>{e.forEach(e=>{l(e.isIntersecting)})},{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}},[e]),a.useEffect(()=>{if(r){let e=setTimeout(()=>{l(!0)},100);return()=>{clearTimeout(e)}}},[r]);let h=()=>{o(!0)},m=()=>{o(!1),l(!1)};return n?"intent"!==e?[i,p,{}]:[i,p,{onFocus:Je(s,h),onBlur:Je(c,m),onMouseEnter:Je(u,h),onMouseLeave:Je(d,m),onTouchStart:Je(f,h)}]:[!1,p,{}]}(s,w),R=function(e){let{target:t,replace:n,state:r,preventScrollReset:o,relative:i,viewTransition:l}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},s=de(),c=se(),u=fe(e,{relative:i});return a.useCallback(a=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(a,t)){a.preventDefault();let t=void 0!==n?n:v(c)===v(u);s(e,{replace:t,state:r,preventScrollReset:o,relative:i,viewTransition:l})}},[c,s,u,n,r,t,e,o,i,l])}(y,{replace:f,state:p,target:g,preventScrollReset:b,relative:u,viewTransition:A});let O=a.createElement("a",(0,o.A)((0,o.A)((0,o.A)({},w),T),{},{href:n||C,onClick:x||d?i:function(e){i&&i(e),e.defaultPrevented||R(e)},ref:at(t,P),target:g,"data-discover":k||"render"!==l?void 0:"true"}));return E&&!k?a.createElement(a.Fragment,null,O,a.createElement(et,{page:C})):O});dt.displayName="Link";var ft=a.forwardRef(function(e,t){let{"aria-current":n="page",caseSensitive:i=!1,className:l="",end:s=!1,style:c,to:d,viewTransition:f,children:p}=e,m=(0,r.A)(e,u),g=fe(d,{relative:m.relative}),y=se(),v=a.useContext(X),{navigator:b,basename:A}=a.useContext(ne),w=null!=v&&function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.useContext(Z);h(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=mt("useViewTransitionState"),o=fe(e,{relative:t});if(!n.isTransitioning)return!1;let i=I(n.currentLocation.pathname,r)||n.currentLocation.pathname,l=I(n.nextLocation.pathname,r)||n.nextLocation.pathname;return null!=j(o.pathname,l)||null!=j(o.pathname,i)}(g)&&!0===f,S=b.encodeLocation?b.encodeLocation(g).pathname:g.pathname,k=y.pathname,x=v&&v.navigation&&v.navigation.location?v.navigation.location.pathname:null;i||(k=k.toLowerCase(),x=x?x.toLowerCase():null,S=S.toLowerCase()),x&&A&&(x=I(x,A)||x);const C="/"!==S&&S.endsWith("/")?S.length-1:S.length;let E,P=k===S||!s&&k.startsWith(S)&&"/"===k.charAt(C),T=null!=x&&(x===S||!s&&x.startsWith(S)&&"/"===x.charAt(S.length)),R={isActive:P,isPending:T,isTransitioning:w},O=P?n:void 0;E="function"===typeof l?l(R):[l,P?"active":null,T?"pending":null,w?"transitioning":null].filter(Boolean).join(" ");let N="function"===typeof c?c(R):c;return a.createElement(dt,(0,o.A)((0,o.A)({},m),{},{"aria-current":O,className:E,ref:t,style:N,to:d,viewTransition:f}),"function"===typeof p?p(R):p)});ft.displayName="NavLink";var pt=a.forwardRef((e,t)=>{let{discover:n="render",fetcherKey:i,navigate:l,reloadDocument:s,replace:c,state:u,method:f=Le,action:p,onSubmit:m,relative:g,preventScrollReset:y,viewTransition:b}=e,A=(0,r.A)(e,d),w=vt(),S=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=a.useContext(ne),r=a.useContext(oe);h(r,"useFormAction must be used inside a RouteContext");let[i]=r.matches.slice(-1),l=(0,o.A)({},fe(e||".",{relative:t})),s=se();if(null==e){l.search=s.search;let e=new URLSearchParams(l.search),t=e.getAll("index");if(t.some(e=>""===e)){e.delete("index"),t.filter(e=>e).forEach(t=>e.append("index",t));let n=e.toString();l.search=n?"?".concat(n):""}}e&&"."!==e||!i.route.index||(l.search=l.search?l.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(l.pathname="/"===l.pathname?n:H([n,l.pathname]));return v(l)}(p,{relative:g}),k="get"===f.toLowerCase()?"get":"post",x="string"===typeof p&&ut.test(p);return a.createElement("form",(0,o.A)((0,o.A)({ref:t,method:k,action:S,onSubmit:s?m:e=>{if(m&&m(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=(null===t||void 0===t?void 0:t.getAttribute("formmethod"))||f;w(t||e.currentTarget,{fetcherKey:i,method:n,navigate:l,replace:c,state:u,relative:g,preventScrollReset:y,viewTransition:b})}},A),{},{"data-discover":x||"render"!==n?void 0:"true"}))});function ht(e){return"".concat(e," must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.")}function mt(e){let t=a.useContext(Y);return h(t,ht(e)),t}pt.displayName="Form";var gt=0,yt=()=>"__".concat(String(++gt),"__");function vt(){let{router:e}=mt("useSubmit"),{basename:t}=a.useContext(ne),n=Se("useRouteId");return a.useCallback(async function(r){let o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:a,method:i,encType:l,formData:s,body:c}=Ie(r,t);if(!1===o.navigate){let t=o.fetcherKey||yt();await e.fetch(t,n,o.action||a,{preventScrollReset:o.preventScrollReset,formData:s,body:c,formMethod:o.method||i,formEncType:o.encType||l,flushSync:o.flushSync})}else await e.navigate(o.action||a,{preventScrollReset:o.preventScrollReset,formData:s,body:c,formMethod:o.method||i,formEncType:o.encType||l,replace:o.replace,state:o.state,fromRouteId:n,flushSync:o.flushSync,viewTransition:o.viewTransition})},[e,t,n])}},5491:(e,t,n)=>{n.d(t,{A:()=>r});const r=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(void 0===e)return{};const n={};return Object.keys(e).filter(n=>n.match(/^on[A-Z]/)&&"function"===typeof e[n]&&!t.includes(n)).forEach(t=>{n[t]=e[t]}),n}},5540:(e,t,n)=>{function r(e,t){return r=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},r(e,t)}function o(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,r(e,t)}n.d(t,{A:()=>o})},5571:(e,t,n)=>{n.d(t,{A:()=>o});const r=e=>e,o=(()=>{let e=r;return{configure(t){e=t},generate:t=>e(t),reset(){e=r}}})()},5651:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(5043),o=n(9369);const a=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;const t=r.useContext(o.T);return t&&(n=t,0!==Object.keys(n).length)?t:e;var n}},5895:(e,t,n)=>{n.d(t,{A:()=>S});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(8130),c=n(8128),u=n(1612),d=n(8301),f=n(7194),p=n(4412),h=n(3491),m=n(579);const g=["color"],y=["align","className","component","gutterBottom","noWrap","paragraph","variant","variantMapping"],v={primary:!0,secondary:!0,error:!0,info:!0,success:!0,warning:!0,textPrimary:!0,textSecondary:!0,textDisabled:!0},b=(0,s.Dg)(),A=(0,c.Ay)("span",{name:"MuiTypography",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.variant&&t[n.variant],"inherit"!==n.align&&t["align".concat((0,f.A)(n.align))],n.noWrap&&t.noWrap,n.gutterBottom&&t.gutterBottom,n.paragraph&&t.paragraph]}})((0,u.A)(e=>{var t;let{theme:n}=e;return{margin:0,variants:[{props:{variant:"inherit"},style:{font:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}},...Object.entries(n.typography).filter(e=>{let[t,n]=e;return"inherit"!==t&&n&&"object"===typeof n}).map(e=>{let[t,n]=e;return{props:{variant:t},style:n}}),...Object.entries(n.palette).filter((0,p.A)()).map(e=>{let[t]=e;return{props:{color:t},style:{color:(n.vars||n).palette[t].main}}}),...Object.entries((null===(t=n.palette)||void 0===t?void 0:t.text)||{}).filter(e=>{let[,t]=e;return"string"===typeof t}).map(e=>{let[t]=e;return{props:{color:"text".concat((0,f.A)(t))},style:{color:(n.vars||n).palette.text[t]}}}),{props:e=>{let{ownerState:t}=e;return"inherit"!==t.align},style:{textAlign:"var(--Typography-textAlign)"}},{props:e=>{let{ownerState:t}=e;return t.noWrap},style:{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"}},{props:e=>{let{ownerState:t}=e;return t.gutterBottom},style:{marginBottom:"0.35em"}},{props:e=>{let{ownerState:t}=e;return t.paragraph},style:{marginBottom:16}}]}})),w={h1:"h1",h2:"h2",h3:"h3",h4:"h4",h5:"h5",h6:"h6",subtitle1:"h6",subtitle2:"h6",body1:"p",body2:"p",inherit:"p"},S=a.forwardRef(function(e,t){const n=(0,d.b)({props:e,name:"MuiTypography"}),{color:a}=n,s=(0,o.A)(n,g),c=!v[a],u=b((0,r.A)((0,r.A)({},s),c&&{color:a})),{align:p="inherit",className:S,component:k,gutterBottom:x=!1,noWrap:C=!1,paragraph:E=!1,variant:P="body1",variantMapping:T=w}=u,R=(0,o.A)(u,y),O=(0,r.A)((0,r.A)({},u),{},{align:p,color:a,className:S,component:k,gutterBottom:x,noWrap:C,paragraph:E,variant:P,variantMapping:T}),N=k||(E?"p":T[P]||w[P])||"span",L=(e=>{const{align:t,gutterBottom:n,noWrap:r,paragraph:o,variant:a,classes:i}=e,s={root:["root",a,"inherit"!==e.align&&"align".concat((0,f.A)(t)),n&&"gutterBottom",r&&"noWrap",o&&"paragraph"]};return(0,l.A)(s,h.y,i)})(O);return(0,m.jsx)(A,(0,r.A)((0,r.A)({as:N,ref:t,className:(0,i.A)(L.root,S)},R),{},{ownerState:O,style:(0,r.A)((0,r.A)({},"inherit"!==p&&{"--Typography-textAlign":p}),R.style)}))})},5896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,o=e[r];if(!(0<a(o,t)))break e;e[r]=t,e[n]=o,n=r}}function r(e){return 0===e.length?null:e[0]}function o(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length,i=o>>>1;r<i;){var l=2*(r+1)-1,s=e[l],c=l+1,u=e[c];if(0>a(s,n))c<o&&0>a(u,s)?(e[r]=u,e[c]=n,r=c):(e[r]=s,e[l]=n,r=l);else{if(!(c<o&&0>a(u,n)))break e;e[r]=u,e[c]=n,r=c}}}return t}function a(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var i=performance;t.unstable_now=function(){return i.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}var c=[],u=[],d=1,f=null,p=3,h=!1,m=!1,g=!1,y=!1,v="function"===typeof setTimeout?setTimeout:null,b="function"===typeof clearTimeout?clearTimeout:null,A="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(u);null!==t;){if(null===t.callback)o(u);else{if(!(t.startTime<=e))break;o(u),t.sortIndex=t.expirationTime,n(c,t)}t=r(u)}}function S(e){if(g=!1,w(e),!m)if(null!==r(c))m=!0,x||(x=!0,k());else{var t=r(u);null!==t&&L(S,t.startTime-e)}}var k,x=!1,C=-1,E=5,P=-1;function T(){return!!y||!(t.unstable_now()-P<E)}function R(){if(y=!1,x){var e=t.unstable_now();P=e;var n=!0;try{e:{m=!1,g&&(g=!1,b(C),C=-1),h=!0;var a=p;try{t:{for(w(e),f=r(c);null!==f&&!(f.expirationTime>e&&T());){var i=f.callback;if("function"===typeof i){f.callback=null,p=f.priorityLevel;var l=i(f.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof l){f.callback=l,w(e),n=!0;break t}f===r(c)&&o(c),w(e)}else o(c);f=r(c)}if(null!==f)n=!0;else{var s=r(u);null!==s&&L(S,s.startTime-e),n=!1}}break e}finally{f=null,p=a,h=!1}n=void 0}}finally{n?k():x=!1}}}if("function"===typeof A)k=function(){A(R)};else if("undefined"!==typeof MessageChannel){var O=new MessageChannel,N=O.port2;O.port1.onmessage=R,k=function(){N.postMessage(null)}}else k=function(){v(R,0)};function L(e,n){C=v(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):E=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_requestPaint=function(){y=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,o,a){var i=t.unstable_now();switch("object"===typeof a&&null!==a?a="number"===typeof(a=a.delay)&&0<a?i+a:i:a=i,e){case 1:var l=-1;break;case 2:l=250;break;case 5:l=1073741823;break;case 4:l=1e4;break;default:l=5e3}return e={id:d++,callback:o,priorityLevel:e,startTime:a,expirationTime:l=a+l,sortIndex:-1},a>i?(e.sortIndex=a,n(u,e),null===r(c)&&e===r(u)&&(g?(b(C),C=-1):g=!0,L(S,a-i))):(e.sortIndex=l,n(c,e),m||h||(m=!0,x||(x=!0,k()))),e},t.unstable_shouldYield=T,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},6009:(e,t,n)=>{n.d(t,{A:()=>s,b:()=>l});var r=n(5043),o=n(4599),a=n(579);const i=r.createContext(void 0);function l(e){let{props:t,name:n}=e;return function(e){const{theme:t,name:n,props:r}=e;if(!t||!t.components||!t.components[n])return r;const a=t.components[n];return a.defaultProps?(0,o.A)(a.defaultProps,r,t.components.mergeClassNameAndStyle):a.styleOverrides||a.variants?r:(0,o.A)(a,r,t.components.mergeClassNameAndStyle)}({props:t,name:n,theme:{components:r.useContext(i)}})}const s=function(e){let{value:t,children:n}=e;return(0,a.jsx)(i.Provider,{value:t,children:n})}},6057:(e,t,n)=>{n.d(t,{A:()=>i,f:()=>a});var r=n(9857),o=n(6061);function a(e){return(0,o.Ay)("MuiListItemIcon",e)}const i=(0,r.A)("MuiListItemIcon",["root","alignItemsFlexStart"])},6061:(e,t,n)=>{n.d(t,{Ay:()=>a});var r=n(5571);const o={active:"active",checked:"checked",completed:"completed",disabled:"disabled",error:"error",expanded:"expanded",focused:"focused",focusVisible:"focusVisible",open:"open",readOnly:"readOnly",required:"required",selected:"selected"};function a(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"Mui";const a=o[t];return a?"".concat(n,"-").concat(a):"".concat(r.A.generate(e),"-").concat(t)}},6155:(e,t,n)=>{n.d(t,{A:()=>l});var r=n(9379),o=n(8387),a=n(5491);const i=function(e){if(void 0===e)return{};const t={};return Object.keys(e).filter(t=>!(t.match(/^on[A-Z]/)&&"function"===typeof e[t])).forEach(n=>{t[n]=e[n]}),t};const l=function(e){const{getSlotProps:t,additionalProps:n,externalSlotProps:l,externalForwardedProps:s,className:c}=e;if(!t){const e=(0,o.A)(null===n||void 0===n?void 0:n.className,c,null===s||void 0===s?void 0:s.className,null===l||void 0===l?void 0:l.className),t=(0,r.A)((0,r.A)((0,r.A)({},null===n||void 0===n?void 0:n.style),null===s||void 0===s?void 0:s.style),null===l||void 0===l?void 0:l.style),a=(0,r.A)((0,r.A)((0,r.A)({},n),s),l);return e.length>0&&(a.className=e),Object.keys(t).length>0&&(a.style=t),{props:a,internalRef:void 0}}const u=(0,a.A)((0,r.A)((0,r.A)({},s),l)),d=i(l),f=i(s),p=t(u),h=(0,o.A)(null===p||void 0===p?void 0:p.className,null===n||void 0===n?void 0:n.className,c,null===s||void 0===s?void 0:s.className,null===l||void 0===l?void 0:l.className),m=(0,r.A)((0,r.A)((0,r.A)((0,r.A)({},null===p||void 0===p?void 0:p.style),null===n||void 0===n?void 0:n.style),null===s||void 0===s?void 0:s.style),null===l||void 0===l?void 0:l.style),g=(0,r.A)((0,r.A)((0,r.A)((0,r.A)({},p),n),f),d);return h.length>0&&(g.className=h),Object.keys(m).length>0&&(g.style=m),{props:g,internalRef:p.ref}}},6167:(e,t,n)=>{n.d(t,{EU:()=>s,NI:()=>l,vf:()=>c,zu:()=>o});var r=n(8087);const o={xs:0,sm:600,md:900,lg:1200,xl:1536},a={keys:["xs","sm","md","lg","xl"],up:e=>"@media (min-width:".concat(o[e],"px)")},i={containerQueries:e=>({up:t=>{let n="number"===typeof t?t:o[t]||t;return"number"===typeof n&&(n="".concat(n,"px")),e?"@container ".concat(e," (min-width:").concat(n,")"):"@container (min-width:".concat(n,")")}})};function l(e,t,n){const l=e.theme||{};if(Array.isArray(t)){const e=l.breakpoints||a;return t.reduce((r,o,a)=>(r[e.up(e.keys[a])]=n(t[a]),r),{})}if("object"===typeof t){const e=l.breakpoints||a;return Object.keys(t).reduce((a,s)=>{if((0,r.ob)(e.keys,s)){const e=(0,r.CT)(l.containerQueries?l:i,s);e&&(a[e]=n(t[s],s))}else if(Object.keys(e.values||o).includes(s)){a[e.up(s)]=n(t[s],s)}else{const e=s;a[e]=t[e]}return a},{})}return n(t)}function s(){var e;let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(null===(e=t.keys)||void 0===e?void 0:e.reduce((e,n)=>(e[t.up(n)]={},e),{}))||{}}function c(e,t){return e.reduce((e,t)=>{const n=e[t];return(!n||0===Object.keys(n).length)&&delete e[t],e},t)}},6185:(e,t,n)=>{n.d(t,{A:()=>v});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(5895),c=n(3491),u=n(9066),d=n(8128),f=n(8301),p=n(1977),h=n(9905),m=n(579);const g=["children","className","disableTypography","inset","primary","primaryTypographyProps","secondary","secondaryTypographyProps","slots","slotProps"],y=(0,d.Ay)("div",{name:"MuiListItemText",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{["& .".concat(p.A.primary)]:t.primary},{["& .".concat(p.A.secondary)]:t.secondary},t.root,n.inset&&t.inset,n.primary&&n.secondary&&t.multiline,n.dense&&t.dense]}})({flex:"1 1 auto",minWidth:0,marginTop:4,marginBottom:4,[".".concat(c.A.root,":where(& .").concat(p.A.primary,")")]:{display:"block"},[".".concat(c.A.root,":where(& .").concat(p.A.secondary,")")]:{display:"block"},variants:[{props:e=>{let{ownerState:t}=e;return t.primary&&t.secondary},style:{marginTop:6,marginBottom:6}},{props:e=>{let{ownerState:t}=e;return t.inset},style:{paddingLeft:56}}]}),v=a.forwardRef(function(e,t){const n=(0,f.b)({props:e,name:"MuiListItemText"}),{children:c,className:d,disableTypography:v=!1,inset:b=!1,primary:A,primaryTypographyProps:w,secondary:S,secondaryTypographyProps:k,slots:x={},slotProps:C={}}=n,E=(0,o.A)(n,g),{dense:P}=a.useContext(u.A);let T=null!=A?A:c,R=S;const O=(0,r.A)((0,r.A)({},n),{},{disableTypography:v,inset:b,primary:!!T,secondary:!!R,dense:P}),N=(e=>{const{classes:t,inset:n,primary:r,secondary:o,dense:a}=e,i={root:["root",n&&"inset",a&&"dense",r&&o&&"multiline"],primary:["primary"],secondary:["secondary"]};return(0,l.A)(i,p.b,t)})(O),L={slots:x,slotProps:(0,r.A)({primary:w,secondary:k},C)},[_,M]=(0,h.A)("root",{className:(0,i.A)(N.root,d),elementType:y,externalForwardedProps:(0,r.A)((0,r.A)({},L),E),ownerState:O,ref:t}),[j,z]=(0,h.A)("primary",{className:N.primary,elementType:s.A,externalForwardedProps:L,ownerState:O}),[F,I]=(0,h.A)("secondary",{className:N.secondary,elementType:s.A,externalForwardedProps:L,ownerState:O});return null==T||T.type===s.A||v||(T=(0,m.jsx)(j,(0,r.A)((0,r.A)({variant:P?"body2":"body1",component:null!==z&&void 0!==z&&z.variant?void 0:"span"},z),{},{children:T}))),null==R||R.type===s.A||v||(R=(0,m.jsx)(F,(0,r.A)((0,r.A)({variant:"body2",color:"textSecondary"},I),{},{children:R}))),(0,m.jsxs)(_,(0,r.A)((0,r.A)({},M),{},{children:[T,R]}))})},6204:(e,t,n)=>{n.d(t,{A:()=>a});n(5043);var r=n(3290),o=n(579);function a(e){const{styles:t,defaultTheme:n={}}=e,a="function"===typeof t?e=>{return t(void 0===(r=e)||null===r||0===Object.keys(r).length?n:e);var r}:t;return(0,o.jsx)(r.mL,{styles:a})}},6433:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(7449);function o(e){return(0,r.A)(e).defaultView||window}},6509:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(5043);const o="undefined"!==typeof window?r.useLayoutEffect:r.useEffect},6530:(e,t,n)=>{n.d(t,{A:()=>c});var r=n(9379),o=n(45),a=n(3129);const i=["fontFamily","fontSize","fontWeightLight","fontWeightRegular","fontWeightMedium","fontWeightBold","htmlFontSize","allVariants","pxToRem"];const l={textTransform:"uppercase"},s='"Roboto", "Helvetica", "Arial", sans-serif';function c(e,t){const n="function"===typeof t?t(e):t,{fontFamily:c=s,fontSize:u=14,fontWeightLight:d=300,fontWeightRegular:f=400,fontWeightMedium:p=500,fontWeightBold:h=700,htmlFontSize:m=16,allVariants:g,pxToRem:y}=n,v=(0,o.A)(n,i);const b=u/14,A=y||(e=>"".concat(e/m*b,"rem")),w=(e,t,n,o,a)=>{return(0,r.A)((0,r.A)((0,r.A)({fontFamily:c,fontWeight:e,fontSize:A(t),lineHeight:n},c===s?{letterSpacing:"".concat((i=o/t,Math.round(1e5*i)/1e5),"em")}:{}),a),g);var i},S={h1:w(d,96,1.167,-1.5),h2:w(d,60,1.2,-.5),h3:w(f,48,1.167,0),h4:w(f,34,1.235,.25),h5:w(f,24,1.334,0),h6:w(p,20,1.6,.15),subtitle1:w(f,16,1.75,.15),subtitle2:w(p,14,1.57,.1),body1:w(f,16,1.5,.15),body2:w(f,14,1.43,.15),button:w(p,14,1.75,.4,l),caption:w(f,12,1.66,.4),overline:w(f,12,2.66,1,l),inherit:{fontFamily:"inherit",fontWeight:"inherit",fontSize:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}};return(0,a.A)((0,r.A)({htmlFontSize:m,pxToRem:A,fontFamily:c,fontSize:u,fontWeightLight:d,fontWeightRegular:f,fontWeightMedium:p,fontWeightBold:h},S),v,{clone:!1})}},6598:(e,t,n)=>{n.d(t,{J:()=>g});var r={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1},o=n(918),a=!1,i=/[A-Z]|^ms/g,l=/_EMO_([^_]+?)_([^]*?)_EMO_/g,s=function(e){return 45===e.charCodeAt(1)},c=function(e){return null!=e&&"boolean"!==typeof e},u=(0,o.A)(function(e){return s(e)?e:e.replace(i,"-$&").toLowerCase()}),d=function(e,t){switch(e){case"animation":case"animationName":if("string"===typeof t)return t.replace(l,function(e,t,n){return h={name:t,styles:n,next:h},t})}return 1===r[e]||s(e)||"number"!==typeof t||0===t?t:t+"px"},f="Component selectors can only be used in conjunction with @emotion/babel-plugin, the swc Emotion plugin, or another Emotion-aware compiler transform.";function p(e,t,n){if(null==n)return"";var r=n;if(void 0!==r.__emotion_styles)return r;switch(typeof n){case"boolean":return"";case"object":var o=n;if(1===o.anim)return h={name:o.name,styles:o.styles,next:h},o.name;var i=n;if(void 0!==i.styles){var l=i.next;if(void 0!==l)for(;void 0!==l;)h={name:l.name,styles:l.styles,next:h},l=l.next;return i.styles+";"}return function(e,t,n){var r="";if(Array.isArray(n))for(var o=0;o<n.length;o++)r+=p(e,t,n[o])+";";else for(var i in n){var l=n[i];if("object"!==typeof l){var s=l;null!=t&&void 0!==t[s]?r+=i+"{"+t[s]+"}":c(s)&&(r+=u(i)+":"+d(i,s)+";")}else{if("NO_COMPONENT_SELECTOR"===i&&a)throw new Error(f);if(!Array.isArray(l)||"string"!==typeof l[0]||null!=t&&void 0!==t[l[0]]){var h=p(e,t,l);switch(i){case"animation":case"animationName":r+=u(i)+":"+h+";";break;default:r+=i+"{"+h+"}"}}else for(var m=0;m<l.length;m++)c(l[m])&&(r+=u(i)+":"+d(i,l[m])+";")}}return r}(e,t,n);case"function":if(void 0!==e){var s=h,m=n(e);return h=s,p(e,t,m)}}var g=n;if(null==t)return g;var y=t[g];return void 0!==y?y:g}var h,m=/label:\s*([^\s;{]+)\s*(;|$)/g;function g(e,t,n){if(1===e.length&&"object"===typeof e[0]&&null!==e[0]&&void 0!==e[0].styles)return e[0];var r=!0,o="";h=void 0;var a=e[0];null==a||void 0===a.raw?(r=!1,o+=p(n,t,a)):o+=a[0];for(var i=1;i<e.length;i++){if(o+=p(n,t,e[i]),r)o+=a[i]}m.lastIndex=0;for(var l,s="";null!==(l=m.exec(o));)s+="-"+l[1];var c=function(e){for(var t,n=0,r=0,o=e.length;o>=4;++r,o-=4)t=1540483477*(65535&(t=255&e.charCodeAt(r)|(255&e.charCodeAt(++r))<<8|(255&e.charCodeAt(++r))<<16|(255&e.charCodeAt(++r))<<24))+(59797*(t>>>16)<<16),n=1540483477*(65535&(t^=t>>>24))+(59797*(t>>>16)<<16)^1540483477*(65535&n)+(59797*(n>>>16)<<16);switch(o){case 3:n^=(255&e.charCodeAt(r+2))<<16;case 2:n^=(255&e.charCodeAt(r+1))<<8;case 1:n=1540483477*(65535&(n^=255&e.charCodeAt(r)))+(59797*(n>>>16)<<16)}return(((n=1540483477*(65535&(n^=n>>>13))+(59797*(n>>>16)<<16))^n>>>15)>>>0).toString(36)}(o)+s;return{name:c,styles:o,next:h}}},6672:(e,t,n)=>{var r=n(5043);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function a(){}var i={d:{f:a,r:function(){throw Error(o(522))},D:a,C:a,L:a,m:a,X:a,S:a,M:a},p:0,findDOMNode:null},l=Symbol.for("react.portal");var s=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function c(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=i,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(o(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:l,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=s.T,n=i.p;try{if(s.T=null,i.p=2,e)return e()}finally{s.T=t,i.p=n,i.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,i.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&i.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin),o="string"===typeof t.integrity?t.integrity:void 0,a="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?i.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:o,fetchPriority:a}):"script"===n&&i.d.X(e,{crossOrigin:r,integrity:o,fetchPriority:a,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=c(t.as,t.crossOrigin);i.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&i.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=c(n,t.crossOrigin);i.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=c(t.as,t.crossOrigin);i.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else i.d.m(e)},t.requestFormReset=function(e){i.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return s.H.useFormState(e,t,n)},t.useFormStatus=function(){return s.H.useHostTransitionStatus()},t.version="19.1.1"},6865:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(5043);const o=[];function a(e){r.useEffect(e,o)}},6906:(e,t,n)=>{n.d(t,{c:()=>o,q:()=>r});const r=e=>e.scrollTop;function o(e,t){var n,r;const{timeout:o,easing:a,style:i={}}=e;return{duration:null!==(n=i.transitionDuration)&&void 0!==n?n:"number"===typeof o?o:o[t.mode]||0,easing:null!==(r=i.transitionTimingFunction)&&void 0!==r?r:"object"===typeof a?a[t.mode]:a,delay:i.transitionDelay}}},6945:(e,t,n)=>{n.d(t,{A:()=>v});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(8128),c=n(8301),u=n(9905),d=n(405),f=n(9857),p=n(6061);function h(e){return(0,p.Ay)("MuiBackdrop",e)}(0,f.A)("MuiBackdrop",["root","invisible"]);var m=n(579);const g=["children","className","component","invisible","open","components","componentsProps","slotProps","slots","TransitionComponent","transitionDuration"],y=(0,s.Ay)("div",{name:"MuiBackdrop",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.invisible&&t.invisible]}})({position:"fixed",display:"flex",alignItems:"center",justifyContent:"center",right:0,bottom:0,top:0,left:0,backgroundColor:"rgba(0, 0, 0, 0.5)",WebkitTapHighlightColor:"transparent",variants:[{props:{invisible:!0},style:{backgroundColor:"transparent"}}]}),v=a.forwardRef(function(e,t){const n=(0,c.b)({props:e,name:"MuiBackdrop"}),{children:a,className:s,component:f="div",invisible:p=!1,open:v,components:b={},componentsProps:A={},slotProps:w={},slots:S={},TransitionComponent:k,transitionDuration:x}=n,C=(0,o.A)(n,g),E=(0,r.A)((0,r.A)({},n),{},{component:f,invisible:p}),P=(e=>{const{classes:t,invisible:n}=e,r={root:["root",n&&"invisible"]};return(0,l.A)(r,h,t)})(E),T={component:f,slots:(0,r.A)({transition:k,root:b.Root},S),slotProps:(0,r.A)((0,r.A)({},A),w)},[R,O]=(0,u.A)("root",{elementType:y,externalForwardedProps:T,className:(0,i.A)(P.root,s),ownerState:E}),[N,L]=(0,u.A)("transition",{elementType:d.A,externalForwardedProps:T,ownerState:E});return(0,m.jsx)(N,(0,r.A)((0,r.A)((0,r.A)({in:v,timeout:x},C),L),{},{children:(0,m.jsx)(R,(0,r.A)((0,r.A)({"aria-hidden":!0},O),{},{classes:P,ref:t,children:a}))}))})},6967:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(2517).A},7004:(e,t,n)=>{var r=n(8853),o=n(5043),a=n(7950);function i(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function s(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function c(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function u(e){if(s(e)!==e)throw Error(i(188))}function d(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=d(e)))return t;e=e.sibling}return null}var f=Object.assign,p=Symbol.for("react.element"),h=Symbol.for("react.transitional.element"),m=Symbol.for("react.portal"),g=Symbol.for("react.fragment"),y=Symbol.for("react.strict_mode"),v=Symbol.for("react.profiler"),b=Symbol.for("react.provider"),A=Symbol.for("react.consumer"),w=Symbol.for("react.context"),S=Symbol.for("react.forward_ref"),k=Symbol.for("react.suspense"),x=Symbol.for("react.suspense_list"),C=Symbol.for("react.memo"),E=Symbol.for("react.lazy");Symbol.for("react.scope");var P=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var T=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var R=Symbol.iterator;function O(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=R&&e[R]||e["@@iterator"])?e:null}var N=Symbol.for("react.client.reference");function L(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===N?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case g:return"Fragment";case v:return"Profiler";case y:return"StrictMode";case k:return"Suspense";case x:return"SuspenseList";case P:return"Activity"}if("object"===typeof e)switch(e.$$typeof){case m:return"Portal";case w:return(e.displayName||"Context")+".Provider";case A:return(e._context.displayName||"Context")+".Consumer";case S:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case C:return null!==(t=e.displayName||null)?t:L(e.type)||"Memo";case E:t=e._payload,e=e._init;try{return L(e(t))}catch(n){}}return null}var _=Array.isArray,M=o.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,j=a.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,z={pending:!1,data:null,method:null,action:null},F=[],I=-1;function D(e){return{current:e}}function B(e){0>I||(e.current=F[I],F[I]=null,I--)}function U(e,t){I++,F[I]=e.current,e.current=t}var W=D(null),H=D(null),V=D(null),$=D(null);function q(e,t){switch(U(V,t),U(H,e),U(W,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?od(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=ad(t=od(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}B(W),U(W,e)}function K(){B(W),B(H),B(V)}function G(e){null!==e.memoizedState&&U($,e);var t=W.current,n=ad(t,e.type);t!==n&&(U(H,e),U(W,n))}function Q(e){H.current===e&&(B(W),B(H)),$.current===e&&(B($),Gd._currentValue=z)}var Y=Object.prototype.hasOwnProperty,X=r.unstable_scheduleCallback,J=r.unstable_cancelCallback,Z=r.unstable_shouldYield,ee=r.unstable_requestPaint,te=r.unstable_now,ne=r.unstable_getCurrentPriorityLevel,re=r.unstable_ImmediatePriority,oe=r.unstable_UserBlockingPriority,ae=r.unstable_NormalPriority,ie=r.unstable_LowPriority,le=r.unstable_IdlePriority,se=r.log,ce=r.unstable_setDisableYieldValue,ue=null,de=null;function fe(e){if("function"===typeof se&&ce(e),de&&"function"===typeof de.setStrictMode)try{de.setStrictMode(ue,e)}catch(t){}}var pe=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(he(e)/me|0)|0},he=Math.log,me=Math.LN2;var ge=256,ye=4194304;function ve(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194048&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function be(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var o=0,a=e.suspendedLanes,i=e.pingedLanes;e=e.warmLanes;var l=134217727&r;return 0!==l?0!==(r=l&~a)?o=ve(r):0!==(i&=l)?o=ve(i):n||0!==(n=l&~e)&&(o=ve(n)):0!==(l=r&~a)?o=ve(l):0!==i?o=ve(i):n||0!==(n=r&~e)&&(o=ve(n)),0===o?0:0!==t&&t!==o&&0===(t&a)&&((a=o&-o)>=(n=t&-t)||32===a&&0!==(4194048&n))?t:o}function Ae(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function we(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Se(){var e=ge;return 0===(4194048&(ge<<=1))&&(ge=256),e}function ke(){var e=ye;return 0===(62914560&(ye<<=1))&&(ye=4194304),e}function xe(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Ce(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Ee(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-pe(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194090&n}function Pe(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-pe(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}function Te(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Re(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function Oe(){var e=j.p;return 0!==e?e:void 0===(e=window.event)?32:uf(e.type)}var Ne=Math.random().toString(36).slice(2),Le="__reactFiber$"+Ne,_e="__reactProps$"+Ne,Me="__reactContainer$"+Ne,je="__reactEvents$"+Ne,ze="__reactListeners$"+Ne,Fe="__reactHandles$"+Ne,Ie="__reactResources$"+Ne,De="__reactMarker$"+Ne;function Be(e){delete e[Le],delete e[_e],delete e[je],delete e[ze],delete e[Fe]}function Ue(e){var t=e[Le];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Me]||n[Le]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=bd(e);null!==e;){if(n=e[Le])return n;e=bd(e)}return t}n=(e=n).parentNode}return null}function We(e){if(e=e[Le]||e[Me]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function He(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(i(33))}function Ve(e){var t=e[Ie];return t||(t=e[Ie]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function $e(e){e[De]=!0}var qe=new Set,Ke={};function Ge(e,t){Qe(e,t),Qe(e+"Capture",t)}function Qe(e,t){for(Ke[e]=t,e=0;e<t.length;e++)qe.add(t[e])}var Ye,Xe,Je=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Ze={},et={};function tt(e,t,n){if(o=t,Y.call(et,o)||!Y.call(Ze,o)&&(Je.test(o)?et[o]=!0:(Ze[o]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var o}function nt(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function rt(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function ot(e){if(void 0===Ye)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ye=t&&t[1]||"",Xe=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+Ye+e+Xe}var at=!1;function it(e,t){if(!e||at)return"";at=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(o){var r=o}Reflect.construct(e,[],n)}else{try{n.call()}catch(a){r=a}e.call(n.prototype)}}else{try{throw Error()}catch(i){r=i}(n=e())&&"function"===typeof n.catch&&n.catch(function(){})}}catch(l){if(l&&r&&"string"===typeof l.stack)return[l.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var o=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");o&&o.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var a=r.DetermineComponentFrameRoot(),i=a[0],l=a[1];if(i&&l){var s=i.split("\n"),c=l.split("\n");for(o=r=0;r<s.length&&!s[r].includes("DetermineComponentFrameRoot");)r++;for(;o<c.length&&!c[o].includes("DetermineComponentFrameRoot");)o++;if(r===s.length||o===c.length)for(r=s.length-1,o=c.length-1;1<=r&&0<=o&&s[r]!==c[o];)o--;for(;1<=r&&0<=o;r--,o--)if(s[r]!==c[o]){if(1!==r||1!==o)do{if(r--,0>--o||s[r]!==c[o]){var u="\n"+s[r].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=r&&0<=o);break}}}finally{at=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?ot(n):""}function lt(e){switch(e.tag){case 26:case 27:case 5:return ot(e.type);case 16:return ot("Lazy");case 13:return ot("Suspense");case 19:return ot("SuspenseList");case 0:case 15:return it(e.type,!1);case 11:return it(e.type.render,!1);case 1:return it(e.type,!0);case 31:return ot("Activity");default:return""}}function st(e){try{var t="";do{t+=lt(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function ct(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ut(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function dt(e){e._valueTracker||(e._valueTracker=function(e){var t=ut(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var o=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function ft(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ut(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function pt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var ht=/[\n"\\]/g;function mt(e){return e.replace(ht,function(e){return"\\"+e.charCodeAt(0).toString(16)+" "})}function gt(e,t,n,r,o,a,i,l){e.name="",null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.type=i:e.removeAttribute("type"),null!=t?"number"===i?(0===t&&""===e.value||e.value!=t)&&(e.value=""+ct(t)):e.value!==""+ct(t)&&(e.value=""+ct(t)):"submit"!==i&&"reset"!==i||e.removeAttribute("value"),null!=t?vt(e,i,ct(t)):null!=n?vt(e,i,ct(n)):null!=r&&e.removeAttribute("value"),null==o&&null!=a&&(e.defaultChecked=!!a),null!=o&&(e.checked=o&&"function"!==typeof o&&"symbol"!==typeof o),null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l?e.name=""+ct(l):e.removeAttribute("name")}function yt(e,t,n,r,o,a,i,l){if(null!=a&&"function"!==typeof a&&"symbol"!==typeof a&&"boolean"!==typeof a&&(e.type=a),null!=t||null!=n){if(!("submit"!==a&&"reset"!==a||void 0!==t&&null!==t))return;n=null!=n?""+ct(n):"",t=null!=t?""+ct(t):n,l||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:o)&&"symbol"!==typeof r&&!!r,e.checked=l?e.checked:!!r,e.defaultChecked=!!r,null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i&&(e.name=i)}function vt(e,t,n){"number"===t&&pt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function bt(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ct(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function At(e,t,n){null==t||((t=""+ct(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+ct(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function wt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(i(92));if(_(r)){if(1<r.length)throw Error(i(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=ct(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function St(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var kt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function xt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||kt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Ct(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(i(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var o in t)r=t[o],t.hasOwnProperty(o)&&n[o]!==r&&xt(e,o,r)}else for(var a in t)t.hasOwnProperty(a)&&xt(e,a,t[a])}function Et(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Pt=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Tt=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Rt(e){return Tt.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Ot=null;function Nt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,_t=null;function Mt(e){var t=We(e);if(t&&(e=t.stateNode)){var n=e[_e]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=r[_e]||null;if(!o)throw Error(i(90));gt(r,o.value,o.defaultValue,o.defaultValue,o.checked,o.defaultChecked,o.type,o.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&ft(r)}break e;case"textarea":At(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&bt(e,!!n.multiple,t,!1)}}}var jt=!1;function zt(e,t,n){if(jt)return e(t,n);jt=!0;try{return e(t)}finally{if(jt=!1,(null!==Lt||null!==_t)&&(Uc(),Lt&&(t=Lt,e=_t,_t=Lt=null,Mt(t),e)))for(t=0;t<e.length;t++)Mt(e[t])}}function Ft(e,t){var n=e.stateNode;if(null===n)return null;var r=n[_e]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(i(231,t,typeof n));return n}var It=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),Dt=!1;if(It)try{var Bt={};Object.defineProperty(Bt,"passive",{get:function(){Dt=!0}}),window.addEventListener("test",Bt,Bt),window.removeEventListener("test",Bt,Bt)}catch(Mf){Dt=!1}var Ut=null,Wt=null,Ht=null;function Vt(){if(Ht)return Ht;var e,t,n=Wt,r=n.length,o="value"in Ut?Ut.value:Ut.textContent,a=o.length;for(e=0;e<r&&n[e]===o[e];e++);var i=r-e;for(t=1;t<=i&&n[r-t]===o[a-t];t++);return Ht=o.slice(e,1<t?1-t:void 0)}function $t(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function qt(){return!0}function Kt(){return!1}function Gt(e){function t(t,n,r,o,a){for(var i in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=o,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(i)&&(t=e[i],this[i]=t?t(o):o[i]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?qt:Kt,this.isPropagationStopped=Kt,this}return f(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=qt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=qt)},persist:function(){},isPersistent:qt}),t}var Qt,Yt,Xt,Jt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Zt=Gt(Jt),en=f({},Jt,{view:0,detail:0}),tn=Gt(en),nn=f({},en,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:hn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Xt&&(Xt&&"mousemove"===e.type?(Qt=e.screenX-Xt.screenX,Yt=e.screenY-Xt.screenY):Yt=Qt=0,Xt=e),Qt)},movementY:function(e){return"movementY"in e?e.movementY:Yt}}),rn=Gt(nn),on=Gt(f({},nn,{dataTransfer:0})),an=Gt(f({},en,{relatedTarget:0})),ln=Gt(f({},Jt,{animationName:0,elapsedTime:0,pseudoElement:0})),sn=Gt(f({},Jt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),cn=Gt(f({},Jt,{data:0})),un={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},dn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function pn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function hn(){return pn}var mn=Gt(f({},en,{key:function(e){if(e.key){var t=un[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=$t(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?dn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:hn,charCode:function(e){return"keypress"===e.type?$t(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?$t(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),gn=Gt(f({},nn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),yn=Gt(f({},en,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:hn})),vn=Gt(f({},Jt,{propertyName:0,elapsedTime:0,pseudoElement:0})),bn=Gt(f({},nn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),An=Gt(f({},Jt,{newState:0,oldState:0})),wn=[9,13,27,32],Sn=It&&"CompositionEvent"in window,kn=null;It&&"documentMode"in document&&(kn=document.documentMode);var xn=It&&"TextEvent"in window&&!kn,Cn=It&&(!Sn||kn&&8<kn&&11>=kn),En=String.fromCharCode(32),Pn=!1;function Tn(e,t){switch(e){case"keyup":return-1!==wn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Rn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var On=!1;var Nn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ln(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Nn[e.type]:"textarea"===t}function _n(e,t,n,r){Lt?_t?_t.push(r):_t=[r]:Lt=r,0<(t=Vu(t,"onChange")).length&&(n=new Zt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Mn=null,jn=null;function zn(e){zu(e,0)}function Fn(e){if(ft(He(e)))return e}function In(e,t){if("change"===e)return t}var Dn=!1;if(It){var Bn;if(It){var Un="oninput"in document;if(!Un){var Wn=document.createElement("div");Wn.setAttribute("oninput","return;"),Un="function"===typeof Wn.oninput}Bn=Un}else Bn=!1;Dn=Bn&&(!document.documentMode||9<document.documentMode)}function Hn(){Mn&&(Mn.detachEvent("onpropertychange",Vn),jn=Mn=null)}function Vn(e){if("value"===e.propertyName&&Fn(jn)){var t=[];_n(t,jn,e,Nt(e)),zt(zn,t)}}function $n(e,t,n){"focusin"===e?(Hn(),jn=n,(Mn=t).attachEvent("onpropertychange",Vn)):"focusout"===e&&Hn()}function qn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Fn(jn)}function Kn(e,t){if("click"===e)return Fn(t)}function Gn(e,t){if("input"===e||"change"===e)return Fn(t)}var Qn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Yn(e,t){if(Qn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!Y.call(t,o)||!Qn(e[o],t[o]))return!1}return!0}function Xn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Jn(e,t){var n,r=Xn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Xn(r)}}function Zn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Zn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function er(e){for(var t=pt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=pt((e=t.contentWindow).document)}return t}function tr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var nr=It&&"documentMode"in document&&11>=document.documentMode,rr=null,or=null,ar=null,ir=!1;function lr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;ir||null==rr||rr!==pt(r)||("selectionStart"in(r=rr)&&tr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},ar&&Yn(ar,r)||(ar=r,0<(r=Vu(or,"onSelect")).length&&(t=new Zt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function sr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var cr={animationend:sr("Animation","AnimationEnd"),animationiteration:sr("Animation","AnimationIteration"),animationstart:sr("Animation","AnimationStart"),transitionrun:sr("Transition","TransitionRun"),transitionstart:sr("Transition","TransitionStart"),transitioncancel:sr("Transition","TransitionCancel"),transitionend:sr("Transition","TransitionEnd")},ur={},dr={};function fr(e){if(ur[e])return ur[e];if(!cr[e])return e;var t,n=cr[e];for(t in n)if(n.hasOwnProperty(t)&&t in dr)return ur[e]=n[t];return e}It&&(dr=document.createElement("div").style,"AnimationEvent"in window||(delete cr.animationend.animation,delete cr.animationiteration.animation,delete cr.animationstart.animation),"TransitionEvent"in window||delete cr.transitionend.transition);var pr=fr("animationend"),hr=fr("animationiteration"),mr=fr("animationstart"),gr=fr("transitionrun"),yr=fr("transitionstart"),vr=fr("transitioncancel"),br=fr("transitionend"),Ar=new Map,wr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Sr(e,t){Ar.set(e,t),Ge(t,[e])}wr.push("scrollEnd");var kr=new WeakMap;function xr(e,t){if("object"===typeof e&&null!==e){var n=kr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:st(t)},kr.set(e,t),t)}return{value:e,source:t,stack:st(t)}}var Cr=[],Er=0,Pr=0;function Tr(){for(var e=Er,t=Pr=Er=0;t<e;){var n=Cr[t];Cr[t++]=null;var r=Cr[t];Cr[t++]=null;var o=Cr[t];Cr[t++]=null;var a=Cr[t];if(Cr[t++]=null,null!==r&&null!==o){var i=r.pending;null===i?o.next=o:(o.next=i.next,i.next=o),r.pending=o}0!==a&&Lr(n,o,a)}}function Rr(e,t,n,r){Cr[Er++]=e,Cr[Er++]=t,Cr[Er++]=n,Cr[Er++]=r,Pr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Or(e,t,n,r){return Rr(e,t,n,r),_r(e)}function Nr(e,t){return Rr(e,null,null,t),_r(e)}function Lr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var o=!1,a=e.return;null!==a;)a.childLanes|=n,null!==(r=a.alternate)&&(r.childLanes|=n),22===a.tag&&(null===(e=a.stateNode)||1&e._visibility||(o=!0)),e=a,a=a.return;return 3===e.tag?(a=e.stateNode,o&&null!==t&&(o=31-pe(n),null===(r=(e=a.hiddenUpdates)[o])?e[o]=[t]:r.push(t),t.lane=536870912|n),a):null}function _r(e){if(50<Lc)throw Lc=0,_c=null,Error(i(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Mr={};function jr(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function zr(e,t,n,r){return new jr(e,t,n,r)}function Fr(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Ir(e,t){var n=e.alternate;return null===n?((n=zr(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Dr(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Br(e,t,n,r,o,a){var l=0;if(r=e,"function"===typeof e)Fr(e)&&(l=1);else if("string"===typeof e)l=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,W.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case P:return(e=zr(31,n,t,o)).elementType=P,e.lanes=a,e;case g:return Ur(n.children,o,a,t);case y:l=8,o|=24;break;case v:return(e=zr(12,n,t,2|o)).elementType=v,e.lanes=a,e;case k:return(e=zr(13,n,t,o)).elementType=k,e.lanes=a,e;case x:return(e=zr(19,n,t,o)).elementType=x,e.lanes=a,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case b:case w:l=10;break e;case A:l=9;break e;case S:l=11;break e;case C:l=14;break e;case E:l=16,r=null;break e}l=29,n=Error(i(130,null===e?"null":typeof e,"")),r=null}return(t=zr(l,n,t,o)).elementType=e,t.type=r,t.lanes=a,t}function Ur(e,t,n,r){return(e=zr(7,e,r,t)).lanes=n,e}function Wr(e,t,n){return(e=zr(6,e,null,t)).lanes=n,e}function Hr(e,t,n){return(t=zr(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Vr=[],$r=0,qr=null,Kr=0,Gr=[],Qr=0,Yr=null,Xr=1,Jr="";function Zr(e,t){Vr[$r++]=Kr,Vr[$r++]=qr,qr=e,Kr=t}function eo(e,t,n){Gr[Qr++]=Xr,Gr[Qr++]=Jr,Gr[Qr++]=Yr,Yr=e;var r=Xr;e=Jr;var o=32-pe(r)-1;r&=~(1<<o),n+=1;var a=32-pe(t)+o;if(30<a){var i=o-o%5;a=(r&(1<<i)-1).toString(32),r>>=i,o-=i,Xr=1<<32-pe(t)+o|n<<o|r,Jr=a+e}else Xr=1<<a|n<<o|r,Jr=e}function to(e){null!==e.return&&(Zr(e,1),eo(e,1,0))}function no(e){for(;e===qr;)qr=Vr[--$r],Vr[$r]=null,Kr=Vr[--$r],Vr[$r]=null;for(;e===Yr;)Yr=Gr[--Qr],Gr[Qr]=null,Jr=Gr[--Qr],Gr[Qr]=null,Xr=Gr[--Qr],Gr[Qr]=null}var ro=null,oo=null,ao=!1,io=null,lo=!1,so=Error(i(519));function co(e){throw go(xr(Error(i(418,"")),e)),so}function uo(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Le]=e,t[_e]=r,n){case"dialog":Fu("cancel",t),Fu("close",t);break;case"iframe":case"object":case"embed":Fu("load",t);break;case"video":case"audio":for(n=0;n<Mu.length;n++)Fu(Mu[n],t);break;case"source":Fu("error",t);break;case"img":case"image":case"link":Fu("error",t),Fu("load",t);break;case"details":Fu("toggle",t);break;case"input":Fu("invalid",t),yt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),dt(t);break;case"select":Fu("invalid",t);break;case"textarea":Fu("invalid",t),wt(t,r.value,r.defaultValue,r.children),dt(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Yu(t.textContent,n)?(null!=r.popover&&(Fu("beforetoggle",t),Fu("toggle",t)),null!=r.onScroll&&Fu("scroll",t),null!=r.onScrollEnd&&Fu("scrollend",t),null!=r.onClick&&(t.onclick=Xu),t=!0):t=!1,t||co(e)}function fo(e){for(ro=e.return;ro;)switch(ro.tag){case 5:case 13:return void(lo=!1);case 27:case 3:return void(lo=!0);default:ro=ro.return}}function po(e){if(e!==ro)return!1;if(!ao)return fo(e),ao=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||id(e.type,e.memoizedProps)),t=!t),t&&oo&&co(e),fo(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(i(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){oo=yd(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}oo=null}}else 27===n?(n=oo,pd(e.type)?(e=vd,vd=null,oo=e):oo=n):oo=ro?yd(e.stateNode.nextSibling):null;return!0}function ho(){oo=ro=null,ao=!1}function mo(){var e=io;return null!==e&&(null===bc?bc=e:bc.push.apply(bc,e),io=null),e}function go(e){null===io?io=[e]:io.push(e)}var yo=D(null),vo=null,bo=null;function Ao(e,t,n){U(yo,t._currentValue),t._currentValue=n}function wo(e){e._currentValue=yo.current,B(yo)}function So(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function ko(e,t,n,r){var o=e.child;for(null!==o&&(o.return=e);null!==o;){var a=o.dependencies;if(null!==a){var l=o.child;a=a.firstContext;e:for(;null!==a;){var s=a;a=o;for(var c=0;c<t.length;c++)if(s.context===t[c]){a.lanes|=n,null!==(s=a.alternate)&&(s.lanes|=n),So(a.return,n,e),r||(l=null);break e}a=s.next}}else if(18===o.tag){if(null===(l=o.return))throw Error(i(341));l.lanes|=n,null!==(a=l.alternate)&&(a.lanes|=n),So(l,n,e),l=null}else l=o.child;if(null!==l)l.return=o;else for(l=o;null!==l;){if(l===e){l=null;break}if(null!==(o=l.sibling)){o.return=l.return,l=o;break}l=l.return}o=l}}function xo(e,t,n,r){e=null;for(var o=t,a=!1;null!==o;){if(!a)if(0!==(524288&o.flags))a=!0;else if(0!==(262144&o.flags))break;if(10===o.tag){var l=o.alternate;if(null===l)throw Error(i(387));if(null!==(l=l.memoizedProps)){var s=o.type;Qn(o.pendingProps.value,l.value)||(null!==e?e.push(s):e=[s])}}else if(o===$.current){if(null===(l=o.alternate))throw Error(i(387));l.memoizedState.memoizedState!==o.memoizedState.memoizedState&&(null!==e?e.push(Gd):e=[Gd])}o=o.return}null!==e&&ko(t,e,n,r),t.flags|=262144}function Co(e){for(e=e.firstContext;null!==e;){if(!Qn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Eo(e){vo=e,bo=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Po(e){return Ro(vo,e)}function To(e,t){return null===vo&&Eo(e),Ro(e,t)}function Ro(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===bo){if(null===e)throw Error(i(308));bo=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else bo=bo.next=t;return n}var Oo="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach(function(e){return e()})}},No=r.unstable_scheduleCallback,Lo=r.unstable_NormalPriority,_o={$$typeof:w,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Mo(){return{controller:new Oo,data:new Map,refCount:0}}function jo(e){e.refCount--,0===e.refCount&&No(Lo,function(){e.controller.abort()})}var zo=null,Fo=0,Io=0,Do=null;function Bo(){if(0===--Fo&&null!==zo){null!==Do&&(Do.status="fulfilled");var e=zo;zo=null,Io=0,Do=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Uo=M.S;M.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===zo){var n=zo=[];Fo=0,Io=Ru(),Do={status:"pending",value:void 0,then:function(e){n.push(e)}}}Fo++,t.then(Bo,Bo)}(0,t),null!==Uo&&Uo(e,t)};var Wo=D(null);function Ho(){var e=Wo.current;return null!==e?e:rc.pooledCache}function Vo(e,t){U(Wo,null===t?Wo.current:t.pool)}function $o(){var e=Ho();return null===e?null:{parent:_o._currentValue,pool:e}}var qo=Error(i(460)),Ko=Error(i(474)),Go=Error(i(542)),Qo={then:function(){}};function Yo(e){return"fulfilled"===(e=e.status)||"rejected"===e}function Xo(){}function Jo(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Xo,Xo),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw ta(e=t.reason),e;default:if("string"===typeof t.status)t.then(Xo,Xo);else{if(null!==(e=rc)&&100<e.shellSuspendCounter)throw Error(i(482));(e=t).status="pending",e.then(function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}},function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw ta(e=t.reason),e}throw Zo=t,qo}}var Zo=null;function ea(){if(null===Zo)throw Error(i(459));var e=Zo;return Zo=null,e}function ta(e){if(e===qo||e===Go)throw Error(i(483))}var na=!1;function ra(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function oa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function aa(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ia(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&nc)){var o=r.pending;return null===o?t.next=t:(t.next=o.next,o.next=t),r.pending=t,t=_r(e),Lr(e,null,n),t}return Rr(e,r,t,n),_r(e)}function la(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194048&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Pe(e,n)}}function sa(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var o=null,a=null;if(null!==(n=n.firstBaseUpdate)){do{var i={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===a?o=a=i:a=a.next=i,n=n.next}while(null!==n);null===a?o=a=t:a=a.next=t}else o=a=t;return n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:a,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var ca=!1;function ua(){if(ca){if(null!==Do)throw Do}}function da(e,t,n,r){ca=!1;var o=e.updateQueue;na=!1;var a=o.firstBaseUpdate,i=o.lastBaseUpdate,l=o.shared.pending;if(null!==l){o.shared.pending=null;var s=l,c=s.next;s.next=null,null===i?a=c:i.next=c,i=s;var u=e.alternate;null!==u&&((l=(u=u.updateQueue).lastBaseUpdate)!==i&&(null===l?u.firstBaseUpdate=c:l.next=c,u.lastBaseUpdate=s))}if(null!==a){var d=o.baseState;for(i=0,u=c=s=null,l=a;;){var p=-536870913&l.lane,h=p!==l.lane;if(h?(ac&p)===p:(r&p)===p){0!==p&&p===Io&&(ca=!0),null!==u&&(u=u.next={lane:0,tag:l.tag,payload:l.payload,callback:null,next:null});e:{var m=e,g=l;p=t;var y=n;switch(g.tag){case 1:if("function"===typeof(m=g.payload)){d=m.call(y,d,p);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(p="function"===typeof(m=g.payload)?m.call(y,d,p):m)||void 0===p)break e;d=f({},d,p);break e;case 2:na=!0}}null!==(p=l.callback)&&(e.flags|=64,h&&(e.flags|=8192),null===(h=o.callbacks)?o.callbacks=[p]:h.push(p))}else h={lane:p,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===u?(c=u=h,s=d):u=u.next=h,i|=p;if(null===(l=l.next)){if(null===(l=o.shared.pending))break;l=(h=l).next,h.next=null,o.lastBaseUpdate=h,o.shared.pending=null}}null===u&&(s=d),o.baseState=s,o.firstBaseUpdate=c,o.lastBaseUpdate=u,null===a&&(o.shared.lanes=0),pc|=i,e.lanes=i,e.memoizedState=d}}function fa(e,t){if("function"!==typeof e)throw Error(i(191,e));e.call(t)}function pa(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)fa(n[e],t)}var ha=D(null),ma=D(0);function ga(e,t){U(ma,e=dc),U(ha,t),dc=e|t.baseLanes}function ya(){U(ma,dc),U(ha,ha.current)}function va(){dc=ma.current,B(ha),B(ma)}var ba=0,Aa=null,wa=null,Sa=null,ka=!1,xa=!1,Ca=!1,Ea=0,Pa=0,Ta=null,Ra=0;function Oa(){throw Error(i(321))}function Na(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Qn(e[n],t[n]))return!1;return!0}function La(e,t,n,r,o,a){return ba=a,Aa=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,M.H=null===e||null===e.memoizedState?qi:Ki,Ca=!1,a=n(r,o),Ca=!1,xa&&(a=Ma(t,n,r,o)),_a(e),a}function _a(e){M.H=$i;var t=null!==wa&&null!==wa.next;if(ba=0,Sa=wa=Aa=null,ka=!1,Pa=0,Ta=null,t)throw Error(i(300));null===e||Pl||null!==(e=e.dependencies)&&Co(e)&&(Pl=!0)}function Ma(e,t,n,r){Aa=e;var o=0;do{if(xa&&(Ta=null),Pa=0,xa=!1,25<=o)throw Error(i(301));if(o+=1,Sa=wa=null,null!=e.updateQueue){var a=e.updateQueue;a.lastEffect=null,a.events=null,a.stores=null,null!=a.memoCache&&(a.memoCache.index=0)}M.H=Gi,a=t(n,r)}while(xa);return a}function ja(){var e=M.H,t=e.useState()[0];return t="function"===typeof t.then?Ua(t):t,e=e.useState()[0],(null!==wa?wa.memoizedState:null)!==e&&(Aa.flags|=1024),t}function za(){var e=0!==Ea;return Ea=0,e}function Fa(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Ia(e){if(ka){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}ka=!1}ba=0,Sa=wa=Aa=null,xa=!1,Pa=Ea=0,Ta=null}function Da(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Sa?Aa.memoizedState=Sa=e:Sa=Sa.next=e,Sa}function Ba(){if(null===wa){var e=Aa.alternate;e=null!==e?e.memoizedState:null}else e=wa.next;var t=null===Sa?Aa.memoizedState:Sa.next;if(null!==t)Sa=t,wa=e;else{if(null===e){if(null===Aa.alternate)throw Error(i(467));throw Error(i(310))}e={memoizedState:(wa=e).memoizedState,baseState:wa.baseState,baseQueue:wa.baseQueue,queue:wa.queue,next:null},null===Sa?Aa.memoizedState=Sa=e:Sa=Sa.next=e}return Sa}function Ua(e){var t=Pa;return Pa+=1,null===Ta&&(Ta=[]),e=Jo(Ta,e,t),t=Aa,null===(null===Sa?t.memoizedState:Sa.next)&&(t=t.alternate,M.H=null===t||null===t.memoizedState?qi:Ki),e}function Wa(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return Ua(e);if(e.$$typeof===w)return Po(e)}throw Error(i(438,String(e)))}function Ha(e){var t=null,n=Aa.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=Aa.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map(function(e){return e.slice()}),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},Aa.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=T;return t.index++,n}function Va(e,t){return"function"===typeof t?t(e):t}function $a(e){return qa(Ba(),wa,e)}function qa(e,t,n){var r=e.queue;if(null===r)throw Error(i(311));r.lastRenderedReducer=n;var o=e.baseQueue,a=r.pending;if(null!==a){if(null!==o){var l=o.next;o.next=a.next,a.next=l}t.baseQueue=o=a,r.pending=null}if(a=e.baseState,null===o)e.memoizedState=a;else{var s=l=null,c=null,u=t=o.next,d=!1;do{var f=-536870913&u.lane;if(f!==u.lane?(ac&f)===f:(ba&f)===f){var p=u.revertLane;if(0===p)null!==c&&(c=c.next={lane:0,revertLane:0,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null}),f===Io&&(d=!0);else{if((ba&p)===p){u=u.next,p===Io&&(d=!0);continue}f={lane:0,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=f,l=a):c=c.next=f,Aa.lanes|=p,pc|=p}f=u.action,Ca&&n(a,f),a=u.hasEagerState?u.eagerState:n(a,f)}else p={lane:f,revertLane:u.revertLane,action:u.action,hasEagerState:u.hasEagerState,eagerState:u.eagerState,next:null},null===c?(s=c=p,l=a):c=c.next=p,Aa.lanes|=f,pc|=f;u=u.next}while(null!==u&&u!==t);if(null===c?l=a:c.next=s,!Qn(a,e.memoizedState)&&(Pl=!0,d&&null!==(n=Do)))throw n;e.memoizedState=a,e.baseState=l,e.baseQueue=c,r.lastRenderedState=a}return null===o&&(r.lanes=0),[e.memoizedState,r.dispatch]}function Ka(e){var t=Ba(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,a=t.memoizedState;if(null!==o){n.pending=null;var l=o=o.next;do{a=e(a,l.action),l=l.next}while(l!==o);Qn(a,t.memoizedState)||(Pl=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function Ga(e,t,n){var r=Aa,o=Ba(),a=ao;if(a){if(void 0===n)throw Error(i(407));n=n()}else n=t();var l=!Qn((wa||o).memoizedState,n);if(l&&(o.memoizedState=n,Pl=!0),o=o.queue,yi(2048,8,Xa.bind(null,r,o,e),[e]),o.getSnapshot!==t||l||null!==Sa&&1&Sa.memoizedState.tag){if(r.flags|=2048,hi(9,{destroy:void 0,resource:void 0},Ya.bind(null,r,o,n,t),null),null===rc)throw Error(i(349));a||0!==(124&ba)||Qa(r,t,n)}return n}function Qa(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=Aa.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},Aa.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Ya(e,t,n,r){t.value=n,t.getSnapshot=r,Ja(t)&&Za(e)}function Xa(e,t,n){return n(function(){Ja(t)&&Za(e)})}function Ja(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Qn(e,n)}catch(r){return!0}}function Za(e){var t=Nr(e,2);null!==t&&zc(t,e,2)}function ei(e){var t=Da();if("function"===typeof e){var n=e;if(e=n(),Ca){fe(!0);try{n()}finally{fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Va,lastRenderedState:e},t}function ti(e,t,n,r){return e.baseState=n,qa(e,wa,"function"===typeof r?r:Va)}function ni(e,t,n,r,o){if(Wi(e))throw Error(i(485));if(null!==(e=t.action)){var a={payload:o,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){a.listeners.push(e)}};null!==M.T?n(!0):a.isTransition=!1,r(a),null===(n=t.pending)?(a.next=t.pending=a,ri(t,a)):(a.next=n.next,t.pending=n.next=a)}}function ri(e,t){var n=t.action,r=t.payload,o=e.state;if(t.isTransition){var a=M.T,i={};M.T=i;try{var l=n(o,r),s=M.S;null!==s&&s(i,l),oi(e,t,l)}catch(c){ii(e,t,c)}finally{M.T=a}}else try{oi(e,t,a=n(o,r))}catch(u){ii(e,t,u)}}function oi(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then(function(n){ai(e,t,n)},function(n){return ii(e,t,n)}):ai(e,t,n)}function ai(e,t,n){t.status="fulfilled",t.value=n,li(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,ri(e,n)))}function ii(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,li(t),t=t.next}while(t!==r)}e.action=null}function li(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function si(e,t){return t}function ci(e,t){if(ao){var n=rc.formState;if(null!==n){e:{var r=Aa;if(ao){if(oo){t:{for(var o=oo,a=lo;8!==o.nodeType;){if(!a){o=null;break t}if(null===(o=yd(o.nextSibling))){o=null;break t}}o="F!"===(a=o.data)||"F"===a?o:null}if(o){oo=yd(o.nextSibling),r="F!"===o.data;break e}}co(r)}r=!1}r&&(t=n[0])}}return(n=Da()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:si,lastRenderedState:t},n.queue=r,n=Di.bind(null,Aa,r),r.dispatch=n,r=ei(!1),a=Ui.bind(null,Aa,!1,r.queue),o={state:t,dispatch:null,action:e,pending:null},(r=Da()).queue=o,n=ni.bind(null,Aa,o,a,n),o.dispatch=n,r.memoizedState=e,[t,n,!1]}function ui(e){return di(Ba(),wa,e)}function di(e,t,n){if(t=qa(e,t,si)[0],e=$a(Va)[0],"object"===typeof t&&null!==t&&"function"===typeof t.then)try{var r=Ua(t)}catch(i){if(i===qo)throw Go;throw i}else r=t;var o=(t=Ba()).queue,a=o.dispatch;return n!==t.memoizedState&&(Aa.flags|=2048,hi(9,{destroy:void 0,resource:void 0},fi.bind(null,o,n),null)),[r,a,e]}function fi(e,t){e.action=t}function pi(e){var t=Ba(),n=wa;if(null!==n)return di(t,n,e);Ba(),t=t.memoizedState;var r=(n=Ba()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function hi(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=Aa.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},Aa.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function mi(){return Ba().memoizedState}function gi(e,t,n,r){var o=Da();r=void 0===r?null:r,Aa.flags|=e,o.memoizedState=hi(1|t,{destroy:void 0,resource:void 0},n,r)}function yi(e,t,n,r){var o=Ba();r=void 0===r?null:r;var a=o.memoizedState.inst;null!==wa&&null!==r&&Na(r,wa.memoizedState.deps)?o.memoizedState=hi(t,a,n,r):(Aa.flags|=e,o.memoizedState=hi(1|t,a,n,r))}function vi(e,t){gi(8390656,8,e,t)}function bi(e,t){yi(2048,8,e,t)}function Ai(e,t){return yi(4,2,e,t)}function wi(e,t){return yi(4,4,e,t)}function Si(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function ki(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,yi(4,4,Si.bind(null,t,e),n)}function xi(){}function Ci(e,t){var n=Ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&Na(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ei(e,t){var n=Ba();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&Na(t,r[1]))return r[0];if(r=e(),Ca){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r}function Pi(e,t,n){return void 0===n||0!==(1073741824&ba)?e.memoizedState=t:(e.memoizedState=n,e=jc(),Aa.lanes|=e,pc|=e,n)}function Ti(e,t,n,r){return Qn(n,t)?n:null!==ha.current?(e=Pi(e,n,r),Qn(e,t)||(Pl=!0),e):0===(42&ba)?(Pl=!0,e.memoizedState=n):(e=jc(),Aa.lanes|=e,pc|=e,t)}function Ri(e,t,n,r,o){var a=j.p;j.p=0!==a&&8>a?a:8;var i=M.T,l={};M.T=l,Ui(e,!1,t,n);try{var s=o(),c=M.S;if(null!==c&&c(l,s),null!==s&&"object"===typeof s&&"function"===typeof s.then)Bi(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then(function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)},function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)}),r}(s,r),Mc());else Bi(e,t,r,Mc())}catch(u){Bi(e,t,{then:function(){},status:"rejected",reason:u},Mc())}finally{j.p=a,M.T=i}}function Oi(){}function Ni(e,t,n,r){if(5!==e.tag)throw Error(i(476));var o=Li(e).queue;Ri(e,o,t,z,null===n?Oi:function(){return _i(e),n(r)})}function Li(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:z,baseState:z,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Va,lastRenderedState:z},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Va,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function _i(e){Bi(e,Li(e).next.queue,{},Mc())}function Mi(){return Po(Gd)}function ji(){return Ba().memoizedState}function zi(){return Ba().memoizedState}function Fi(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Mc(),r=ia(t,e=aa(n),n);return null!==r&&(zc(r,t,n),la(r,t,n)),t={cache:Mo()},void(e.payload=t)}t=t.return}}function Ii(e,t,n){var r=Mc();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Wi(e)?Hi(t,n):null!==(n=Or(e,t,n,r))&&(zc(n,e,r),Vi(n,t,r))}function Di(e,t,n){Bi(e,t,n,Mc())}function Bi(e,t,n,r){var o={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Wi(e))Hi(t,o);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=t.lastRenderedReducer))try{var i=t.lastRenderedState,l=a(i,n);if(o.hasEagerState=!0,o.eagerState=l,Qn(l,i))return Rr(e,t,o,0),null===rc&&Tr(),!1}catch(s){}if(null!==(n=Or(e,t,o,r)))return zc(n,e,r),Vi(n,t,r),!0}return!1}function Ui(e,t,n,r){if(r={lane:2,revertLane:Ru(),action:r,hasEagerState:!1,eagerState:null,next:null},Wi(e)){if(t)throw Error(i(479))}else null!==(t=Or(e,n,r,2))&&zc(t,e,2)}function Wi(e){var t=e.alternate;return e===Aa||null!==t&&t===Aa}function Hi(e,t){xa=ka=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Vi(e,t,n){if(0!==(4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Pe(e,n)}}var $i={readContext:Po,use:Wa,useCallback:Oa,useContext:Oa,useEffect:Oa,useImperativeHandle:Oa,useLayoutEffect:Oa,useInsertionEffect:Oa,useMemo:Oa,useReducer:Oa,useRef:Oa,useState:Oa,useDebugValue:Oa,useDeferredValue:Oa,useTransition:Oa,useSyncExternalStore:Oa,useId:Oa,useHostTransitionStatus:Oa,useFormState:Oa,useActionState:Oa,useOptimistic:Oa,useMemoCache:Oa,useCacheRefresh:Oa},qi={readContext:Po,use:Wa,useCallback:function(e,t){return Da().memoizedState=[e,void 0===t?null:t],e},useContext:Po,useEffect:vi,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,gi(4194308,4,Si.bind(null,t,e),n)},useLayoutEffect:function(e,t){return gi(4194308,4,e,t)},useInsertionEffect:function(e,t){gi(4,2,e,t)},useMemo:function(e,t){var n=Da();t=void 0===t?null:t;var r=e();if(Ca){fe(!0);try{e()}finally{fe(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=Da();if(void 0!==n){var o=n(t);if(Ca){fe(!0);try{n(t)}finally{fe(!1)}}}else o=t;return r.memoizedState=r.baseState=o,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:o},r.queue=e,e=e.dispatch=Ii.bind(null,Aa,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Da().memoizedState=e},useState:function(e){var t=(e=ei(e)).queue,n=Di.bind(null,Aa,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:xi,useDeferredValue:function(e,t){return Pi(Da(),e,t)},useTransition:function(){var e=ei(!1);return e=Ri.bind(null,Aa,e.queue,!0,!1),Da().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=Aa,o=Da();if(ao){if(void 0===n)throw Error(i(407));n=n()}else{if(n=t(),null===rc)throw Error(i(349));0!==(124&ac)||Qa(r,t,n)}o.memoizedState=n;var a={value:n,getSnapshot:t};return o.queue=a,vi(Xa.bind(null,r,a,e),[e]),r.flags|=2048,hi(9,{destroy:void 0,resource:void 0},Ya.bind(null,r,a,n,t),null),n},useId:function(){var e=Da(),t=rc.identifierPrefix;if(ao){var n=Jr;t="\xab"+t+"R"+(n=(Xr&~(1<<32-pe(Xr)-1)).toString(32)+n),0<(n=Ea++)&&(t+="H"+n.toString(32)),t+="\xbb"}else t="\xab"+t+"r"+(n=Ra++).toString(32)+"\xbb";return e.memoizedState=t},useHostTransitionStatus:Mi,useFormState:ci,useActionState:ci,useOptimistic:function(e){var t=Da();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Ui.bind(null,Aa,!0,n),n.dispatch=t,[e,t]},useMemoCache:Ha,useCacheRefresh:function(){return Da().memoizedState=Fi.bind(null,Aa)}},Ki={readContext:Po,use:Wa,useCallback:Ci,useContext:Po,useEffect:bi,useImperativeHandle:ki,useInsertionEffect:Ai,useLayoutEffect:wi,useMemo:Ei,useReducer:$a,useRef:mi,useState:function(){return $a(Va)},useDebugValue:xi,useDeferredValue:function(e,t){return Ti(Ba(),wa.memoizedState,e,t)},useTransition:function(){var e=$a(Va)[0],t=Ba().memoizedState;return["boolean"===typeof e?e:Ua(e),t]},useSyncExternalStore:Ga,useId:ji,useHostTransitionStatus:Mi,useFormState:ui,useActionState:ui,useOptimistic:function(e,t){return ti(Ba(),0,e,t)},useMemoCache:Ha,useCacheRefresh:zi},Gi={readContext:Po,use:Wa,useCallback:Ci,useContext:Po,useEffect:bi,useImperativeHandle:ki,useInsertionEffect:Ai,useLayoutEffect:wi,useMemo:Ei,useReducer:Ka,useRef:mi,useState:function(){return Ka(Va)},useDebugValue:xi,useDeferredValue:function(e,t){var n=Ba();return null===wa?Pi(n,e,t):Ti(n,wa.memoizedState,e,t)},useTransition:function(){var e=Ka(Va)[0],t=Ba().memoizedState;return["boolean"===typeof e?e:Ua(e),t]},useSyncExternalStore:Ga,useId:ji,useHostTransitionStatus:Mi,useFormState:pi,useActionState:pi,useOptimistic:function(e,t){var n=Ba();return null!==wa?ti(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Ha,useCacheRefresh:zi},Qi=null,Yi=0;function Xi(e){var t=Yi;return Yi+=1,null===Qi&&(Qi=[]),Jo(Qi,e,t)}function Ji(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function Zi(e,t){if(t.$$typeof===p)throw Error(i(525));throw e=Object.prototype.toString.call(t),Error(i(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function el(e){return(0,e._init)(e._payload)}function tl(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function o(e,t){return(e=Ir(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function l(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Wr(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function c(e,t,n,r){var a=n.type;return a===g?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===a||"object"===typeof a&&null!==a&&a.$$typeof===E&&el(a)===t.type)?(Ji(t=o(t,n.props),n),t.return=e,t):(Ji(t=Br(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hr(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function d(e,t,n,r,a){return null===t||7!==t.tag?((t=Ur(n,e.mode,r,a)).return=e,t):((t=o(t,n)).return=e,t)}function f(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Wr(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case h:return Ji(n=Br(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case m:return(t=Hr(t,e.mode,n)).return=e,t;case E:return f(e,t=(0,t._init)(t._payload),n)}if(_(t)||O(t))return(t=Ur(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return f(e,Xi(t),n);if(t.$$typeof===w)return f(e,To(e,t),n);Zi(e,t)}return null}function p(e,t,n,r){var o=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==o?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case h:return n.key===o?c(e,t,n,r):null;case m:return n.key===o?u(e,t,n,r):null;case E:return p(e,t,n=(o=n._init)(n._payload),r)}if(_(n)||O(n))return null!==o?null:d(e,t,n,r,null);if("function"===typeof n.then)return p(e,t,Xi(n),r);if(n.$$typeof===w)return p(e,t,To(e,n),r);Zi(e,n)}return null}function y(e,t,n,r,o){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return s(t,e=e.get(n)||null,""+r,o);if("object"===typeof r&&null!==r){switch(r.$$typeof){case h:return c(t,e=e.get(null===r.key?n:r.key)||null,r,o);case m:return u(t,e=e.get(null===r.key?n:r.key)||null,r,o);case E:return y(e,t,n,r=(0,r._init)(r._payload),o)}if(_(r)||O(r))return d(t,e=e.get(n)||null,r,o,null);if("function"===typeof r.then)return y(e,t,n,Xi(r),o);if(r.$$typeof===w)return y(e,t,n,To(t,r),o);Zi(t,r)}return null}function v(s,c,u,d){if("object"===typeof u&&null!==u&&u.type===g&&null===u.key&&(u=u.props.children),"object"===typeof u&&null!==u){switch(u.$$typeof){case h:e:{for(var b=u.key;null!==c;){if(c.key===b){if((b=u.type)===g){if(7===c.tag){n(s,c.sibling),(d=o(c,u.props.children)).return=s,s=d;break e}}else if(c.elementType===b||"object"===typeof b&&null!==b&&b.$$typeof===E&&el(b)===c.type){n(s,c.sibling),Ji(d=o(c,u.props),u),d.return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}u.type===g?((d=Ur(u.props.children,s.mode,d,u.key)).return=s,s=d):(Ji(d=Br(u.type,u.key,u.props,null,s.mode,d),u),d.return=s,s=d)}return l(s);case m:e:{for(b=u.key;null!==c;){if(c.key===b){if(4===c.tag&&c.stateNode.containerInfo===u.containerInfo&&c.stateNode.implementation===u.implementation){n(s,c.sibling),(d=o(c,u.children||[])).return=s,s=d;break e}n(s,c);break}t(s,c),c=c.sibling}(d=Hr(u,s.mode,d)).return=s,s=d}return l(s);case E:return v(s,c,u=(b=u._init)(u._payload),d)}if(_(u))return function(o,i,l,s){for(var c=null,u=null,d=i,h=i=0,m=null;null!==d&&h<l.length;h++){d.index>h?(m=d,d=null):m=d.sibling;var g=p(o,d,l[h],s);if(null===g){null===d&&(d=m);break}e&&d&&null===g.alternate&&t(o,d),i=a(g,i,h),null===u?c=g:u.sibling=g,u=g,d=m}if(h===l.length)return n(o,d),ao&&Zr(o,h),c;if(null===d){for(;h<l.length;h++)null!==(d=f(o,l[h],s))&&(i=a(d,i,h),null===u?c=d:u.sibling=d,u=d);return ao&&Zr(o,h),c}for(d=r(d);h<l.length;h++)null!==(m=y(d,o,h,l[h],s))&&(e&&null!==m.alternate&&d.delete(null===m.key?h:m.key),i=a(m,i,h),null===u?c=m:u.sibling=m,u=m);return e&&d.forEach(function(e){return t(o,e)}),ao&&Zr(o,h),c}(s,c,u,d);if(O(u)){if("function"!==typeof(b=O(u)))throw Error(i(150));return function(o,l,s,c){if(null==s)throw Error(i(151));for(var u=null,d=null,h=l,m=l=0,g=null,v=s.next();null!==h&&!v.done;m++,v=s.next()){h.index>m?(g=h,h=null):g=h.sibling;var b=p(o,h,v.value,c);if(null===b){null===h&&(h=g);break}e&&h&&null===b.alternate&&t(o,h),l=a(b,l,m),null===d?u=b:d.sibling=b,d=b,h=g}if(v.done)return n(o,h),ao&&Zr(o,m),u;if(null===h){for(;!v.done;m++,v=s.next())null!==(v=f(o,v.value,c))&&(l=a(v,l,m),null===d?u=v:d.sibling=v,d=v);return ao&&Zr(o,m),u}for(h=r(h);!v.done;m++,v=s.next())null!==(v=y(h,o,m,v.value,c))&&(e&&null!==v.alternate&&h.delete(null===v.key?m:v.key),l=a(v,l,m),null===d?u=v:d.sibling=v,d=v);return e&&h.forEach(function(e){return t(o,e)}),ao&&Zr(o,m),u}(s,c,u=b.call(u),d)}if("function"===typeof u.then)return v(s,c,Xi(u),d);if(u.$$typeof===w)return v(s,c,To(s,u),d);Zi(s,u)}return"string"===typeof u&&""!==u||"number"===typeof u||"bigint"===typeof u?(u=""+u,null!==c&&6===c.tag?(n(s,c.sibling),(d=o(c,u)).return=s,s=d):(n(s,c),(d=Wr(u,s.mode,d)).return=s,s=d),l(s)):n(s,c)}return function(e,t,n,r){try{Yi=0;var o=v(e,t,n,r);return Qi=null,o}catch(i){if(i===qo||i===Go)throw i;var a=zr(29,i,null,e.mode);return a.lanes=r,a.return=e,a}}}var nl=tl(!0),rl=tl(!1),ol=D(null),al=null;function il(e){var t=e.alternate;U(ul,1&ul.current),U(ol,e),null===al&&(null===t||null!==ha.current||null!==t.memoizedState)&&(al=e)}function ll(e){if(22===e.tag){if(U(ul,ul.current),U(ol,e),null===al){var t=e.alternate;null!==t&&null!==t.memoizedState&&(al=e)}}else sl()}function sl(){U(ul,ul.current),U(ol,ol.current)}function cl(e){B(ol),al===e&&(al=null),B(ul)}var ul=D(0);function dl(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||gd(n)))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function fl(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:f({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var pl={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Mc(),o=aa(r);o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=ia(e,o,r))&&(zc(t,e,r),la(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Mc(),o=aa(r);o.tag=1,o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=ia(e,o,r))&&(zc(t,e,r),la(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Mc(),r=aa(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=ia(e,r,n))&&(zc(t,e,n),la(t,e,n))}};function hl(e,t,n,r,o,a,i){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,i):!t.prototype||!t.prototype.isPureReactComponent||(!Yn(n,r)||!Yn(o,a))}function ml(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&pl.enqueueReplaceState(t,t.state,null)}function gl(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var o in n===t&&(n=f({},n)),e)void 0===n[o]&&(n[o]=e[o]);return n}var yl="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function vl(e){yl(e)}function bl(e){console.error(e)}function Al(e){yl(e)}function wl(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout(function(){throw n})}}function Sl(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout(function(){throw r})}}function kl(e,t,n){return(n=aa(n)).tag=3,n.payload={element:null},n.callback=function(){wl(e,t)},n}function xl(e){return(e=aa(e)).tag=3,e}function Cl(e,t,n,r){var o=n.type.getDerivedStateFromError;if("function"===typeof o){var a=r.value;e.payload=function(){return o(a)},e.callback=function(){Sl(t,n,r)}}var i=n.stateNode;null!==i&&"function"===typeof i.componentDidCatch&&(e.callback=function(){Sl(t,n,r),"function"!==typeof o&&(null===xc?xc=new Set([this]):xc.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var El=Error(i(461)),Pl=!1;function Tl(e,t,n,r){t.child=null===e?rl(t,null,n,r):nl(t,e.child,n,r)}function Rl(e,t,n,r,o){n=n.render;var a=t.ref;if("ref"in r){var i={};for(var l in r)"ref"!==l&&(i[l]=r[l])}else i=r;return Eo(t),r=La(e,t,n,i,a,o),l=za(),null===e||Pl?(ao&&l&&to(t),t.flags|=1,Tl(e,t,r,o),t.child):(Fa(e,t,o),Ql(e,t,o))}function Ol(e,t,n,r,o){if(null===e){var a=n.type;return"function"!==typeof a||Fr(a)||void 0!==a.defaultProps||null!==n.compare?((e=Br(n.type,null,r,t,t.mode,o)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=a,Nl(e,t,a,r,o))}if(a=e.child,!Yl(e,o)){var i=a.memoizedProps;if((n=null!==(n=n.compare)?n:Yn)(i,r)&&e.ref===t.ref)return Ql(e,t,o)}return t.flags|=1,(e=Ir(a,r)).ref=t.ref,e.return=t,t.child=e}function Nl(e,t,n,r,o){if(null!==e){var a=e.memoizedProps;if(Yn(a,r)&&e.ref===t.ref){if(Pl=!1,t.pendingProps=r=a,!Yl(e,o))return t.lanes=e.lanes,Ql(e,t,o);0!==(131072&e.flags)&&(Pl=!0)}}return jl(e,t,n,r,o)}function Ll(e,t,n){var r=t.pendingProps,o=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode){if(0!==(128&t.flags)){if(r=null!==a?a.baseLanes|n:n,null!==e){for(o=t.child=e.child,a=0;null!==o;)a=a|o.lanes|o.childLanes,o=o.sibling;t.childLanes=a&~r}else t.childLanes=0,t.child=null;return _l(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,_l(e,t,null!==a?a.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Vo(0,null!==a?a.cachePool:null),null!==a?ga(t,a):ya(),ll(t)}else null!==a?(Vo(0,a.cachePool),ga(t,a),sl(),t.memoizedState=null):(null!==e&&Vo(0,null),ya(),sl());return Tl(e,t,o,n),t.child}function _l(e,t,n,r){var o=Ho();return o=null===o?null:{parent:_o._currentValue,pool:o},t.memoizedState={baseLanes:n,cachePool:o},null!==e&&Vo(0,null),ya(),ll(t),null!==e&&xo(e,t,r,!0),null}function Ml(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(i(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function jl(e,t,n,r,o){return Eo(t),n=La(e,t,n,r,void 0,o),r=za(),null===e||Pl?(ao&&r&&to(t),t.flags|=1,Tl(e,t,n,o),t.child):(Fa(e,t,o),Ql(e,t,o))}function zl(e,t,n,r,o,a){return Eo(t),t.updateQueue=null,n=Ma(t,r,n,o),_a(e),r=za(),null===e||Pl?(ao&&r&&to(t),t.flags|=1,Tl(e,t,n,a),t.child):(Fa(e,t,a),Ql(e,t,a))}function Fl(e,t,n,r,o){if(Eo(t),null===t.stateNode){var a=Mr,i=n.contextType;"object"===typeof i&&null!==i&&(a=Po(i)),a=new n(r,a),t.memoizedState=null!==a.state&&void 0!==a.state?a.state:null,a.updater=pl,t.stateNode=a,a._reactInternals=t,(a=t.stateNode).props=r,a.state=t.memoizedState,a.refs={},ra(t),i=n.contextType,a.context="object"===typeof i&&null!==i?Po(i):Mr,a.state=t.memoizedState,"function"===typeof(i=n.getDerivedStateFromProps)&&(fl(t,n,i,r),a.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof a.getSnapshotBeforeUpdate||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||(i=a.state,"function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount(),i!==a.state&&pl.enqueueReplaceState(a,a.state,null),da(t,r,a,o),ua(),a.state=t.memoizedState),"function"===typeof a.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){a=t.stateNode;var l=t.memoizedProps,s=gl(n,l);a.props=s;var c=a.context,u=n.contextType;i=Mr,"object"===typeof u&&null!==u&&(i=Po(u));var d=n.getDerivedStateFromProps;u="function"===typeof d||"function"===typeof a.getSnapshotBeforeUpdate,l=t.pendingProps!==l,u||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l||c!==i)&&ml(t,a,r,i),na=!1;var f=t.memoizedState;a.state=f,da(t,r,a,o),ua(),c=t.memoizedState,l||f!==c||na?("function"===typeof d&&(fl(t,n,d,r),c=t.memoizedState),(s=na||hl(t,n,s,r,f,c,i))?(u||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(t.flags|=4194308)):("function"===typeof a.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=c),a.props=r,a.state=c,a.context=i,r=s):("function"===typeof a.componentDidMount&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,oa(e,t),u=gl(n,i=t.memoizedProps),a.props=u,d=t.pendingProps,f=a.context,c=n.contextType,s=Mr,"object"===typeof c&&null!==c&&(s=Po(c)),(c="function"===typeof(l=n.getDerivedStateFromProps)||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(i!==d||f!==s)&&ml(t,a,r,s),na=!1,f=t.memoizedState,a.state=f,da(t,r,a,o),ua();var p=t.memoizedState;i!==d||f!==p||na||null!==e&&null!==e.dependencies&&Co(e.dependencies)?("function"===typeof l&&(fl(t,n,l,r),p=t.memoizedState),(u=na||hl(t,n,u,r,f,p,s)||null!==e&&null!==e.dependencies&&Co(e.dependencies))?(c||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,s),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,s)),"function"===typeof a.componentDidUpdate&&(t.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof a.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),a.props=r,a.state=p,a.context=s,r=u):("function"!==typeof a.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return a=r,Ml(e,t),r=0!==(128&t.flags),a||r?(a=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:a.render(),t.flags|=1,null!==e&&r?(t.child=nl(t,e.child,null,o),t.child=nl(t,null,n,o)):Tl(e,t,n,o),t.memoizedState=a.state,e=t.child):e=Ql(e,t,o),e}function Il(e,t,n,r){return ho(),t.flags|=256,Tl(e,t,n,r),t.child}var Dl={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Bl(e){return{baseLanes:e,cachePool:$o()}}function Ul(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=gc),e}function Wl(e,t,n){var r,o=t.pendingProps,a=!1,l=0!==(128&t.flags);if((r=l)||(r=(null===e||null!==e.memoizedState)&&0!==(2&ul.current)),r&&(a=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(ao){if(a?il(t):sl(),ao){var s,c=oo;if(s=c){e:{for(s=c,c=lo;8!==s.nodeType;){if(!c){c=null;break e}if(null===(s=yd(s.nextSibling))){c=null;break e}}c=s}null!==c?(t.memoizedState={dehydrated:c,treeContext:null!==Yr?{id:Xr,overflow:Jr}:null,retryLane:536870912,hydrationErrors:null},(s=zr(18,null,null,0)).stateNode=c,s.return=t,t.child=s,ro=t,oo=null,s=!0):s=!1}s||co(t)}if(null!==(c=t.memoizedState)&&null!==(c=c.dehydrated))return gd(c)?t.lanes=32:t.lanes=536870912,null;cl(t)}return c=o.children,o=o.fallback,a?(sl(),c=Vl({mode:"hidden",children:c},a=t.mode),o=Ur(o,a,n,null),c.return=t,o.return=t,c.sibling=o,t.child=c,(a=t.child).memoizedState=Bl(n),a.childLanes=Ul(e,r,n),t.memoizedState=Dl,o):(il(t),Hl(t,c))}if(null!==(s=e.memoizedState)&&null!==(c=s.dehydrated)){if(l)256&t.flags?(il(t),t.flags&=-257,t=$l(e,t,n)):null!==t.memoizedState?(sl(),t.child=e.child,t.flags|=128,t=null):(sl(),a=o.fallback,c=t.mode,o=Vl({mode:"visible",children:o.children},c),(a=Ur(a,c,n,null)).flags|=2,o.return=t,a.return=t,o.sibling=a,t.child=o,nl(t,e.child,null,n),(o=t.child).memoizedState=Bl(n),o.childLanes=Ul(e,r,n),t.memoizedState=Dl,t=a);else if(il(t),gd(c)){if(r=c.nextSibling&&c.nextSibling.dataset)var u=r.dgst;r=u,(o=Error(i(419))).stack="",o.digest=r,go({value:o,source:null,stack:null}),t=$l(e,t,n)}else if(Pl||xo(e,t,n,!1),r=0!==(n&e.childLanes),Pl||r){if(null!==(r=rc)&&(0!==(o=0!==((o=0!==(42&(o=n&-n))?1:Te(o))&(r.suspendedLanes|n))?0:o)&&o!==s.retryLane))throw s.retryLane=o,Nr(e,o),zc(r,e,o),El;"$?"===c.data||Kc(),t=$l(e,t,n)}else"$?"===c.data?(t.flags|=192,t.child=e.child,t=null):(e=s.treeContext,oo=yd(c.nextSibling),ro=t,ao=!0,io=null,lo=!1,null!==e&&(Gr[Qr++]=Xr,Gr[Qr++]=Jr,Gr[Qr++]=Yr,Xr=e.id,Jr=e.overflow,Yr=t),(t=Hl(t,o.children)).flags|=4096);return t}return a?(sl(),a=o.fallback,c=t.mode,u=(s=e.child).sibling,(o=Ir(s,{mode:"hidden",children:o.children})).subtreeFlags=65011712&s.subtreeFlags,null!==u?a=Ir(u,a):(a=Ur(a,c,n,null)).flags|=2,a.return=t,o.return=t,o.sibling=a,t.child=o,o=a,a=t.child,null===(c=e.child.memoizedState)?c=Bl(n):(null!==(s=c.cachePool)?(u=_o._currentValue,s=s.parent!==u?{parent:u,pool:u}:s):s=$o(),c={baseLanes:c.baseLanes|n,cachePool:s}),a.memoizedState=c,a.childLanes=Ul(e,r,n),t.memoizedState=Dl,o):(il(t),e=(n=e.child).sibling,(n=Ir(n,{mode:"visible",children:o.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Hl(e,t){return(t=Vl({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Vl(e,t){return(e=zr(22,e,null,t)).lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function $l(e,t,n){return nl(t,e.child,null,n),(e=Hl(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function ql(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),So(e.return,t,n)}function Kl(e,t,n,r,o){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(a.isBackwards=t,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=n,a.tailMode=o)}function Gl(e,t,n){var r=t.pendingProps,o=r.revealOrder,a=r.tail;if(Tl(e,t,r.children,n),0!==(2&(r=ul.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&ql(e,n,t);else if(19===e.tag)ql(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(U(ul,r),o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===dl(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Kl(t,!1,o,n,a);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===dl(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Kl(t,!0,n,null,a);break;case"together":Kl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Ql(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),pc|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(xo(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(i(153));if(null!==t.child){for(n=Ir(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Ir(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Yl(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Co(e))}function Xl(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Pl=!0;else{if(!Yl(e,n)&&0===(128&t.flags))return Pl=!1,function(e,t,n){switch(t.tag){case 3:q(t,t.stateNode.containerInfo),Ao(0,_o,e.memoizedState.cache),ho();break;case 27:case 5:G(t);break;case 4:q(t,t.stateNode.containerInfo);break;case 10:Ao(0,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(il(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Wl(e,t,n):(il(t),null!==(e=Ql(e,t,n))?e.sibling:null);il(t);break;case 19:var o=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(xo(e,t,n,!1),r=0!==(n&t.childLanes)),o){if(r)return Gl(e,t,n);t.flags|=128}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),U(ul,ul.current),r)break;return null;case 22:case 23:return t.lanes=0,Ll(e,t,n);case 24:Ao(0,_o,e.memoizedState.cache)}return Ql(e,t,n)}(e,t,n);Pl=0!==(131072&e.flags)}else Pl=!1,ao&&0!==(1048576&t.flags)&&eo(t,Kr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,o=r._init;if(r=o(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((o=r.$$typeof)===S){t.tag=11,t=Rl(null,t,r,e,n);break e}if(o===C){t.tag=14,t=Ol(null,t,r,e,n);break e}}throw t=L(r)||r,Error(i(306,t,""))}Fr(r)?(e=gl(r,e),t.tag=1,t=Fl(null,t,r,e,n)):(t.tag=0,t=jl(null,t,r,e,n))}return t;case 0:return jl(e,t,t.type,t.pendingProps,n);case 1:return Fl(e,t,r=t.type,o=gl(r,t.pendingProps),n);case 3:e:{if(q(t,t.stateNode.containerInfo),null===e)throw Error(i(387));r=t.pendingProps;var a=t.memoizedState;o=a.element,oa(e,t),da(t,r,null,n);var l=t.memoizedState;if(r=l.cache,Ao(0,_o,r),r!==a.cache&&ko(t,[_o],n,!0),ua(),r=l.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:l.cache},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=Il(e,t,r,n);break e}if(r!==o){go(o=xr(Error(i(424)),t)),t=Il(e,t,r,n);break e}if(9===(e=t.stateNode.containerInfo).nodeType)e=e.body;else e="HTML"===e.nodeName?e.ownerDocument.body:e;for(oo=yd(e.firstChild),ro=t,ao=!0,io=null,lo=!0,n=rl(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(ho(),r===o){t=Ql(e,t,n);break e}Tl(e,t,r,n)}t=t.child}return t;case 26:return Ml(e,t),null===e?(n=Td(t.type,null,t.pendingProps,null))?t.memoizedState=n:ao||(n=t.type,e=t.pendingProps,(r=rd(V.current).createElement(n))[Le]=t,r[_e]=e,ed(r,n,e),$e(r),t.stateNode=r):t.memoizedState=Td(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return G(t),null===e&&ao&&(r=t.stateNode=Ad(t.type,t.pendingProps,V.current),ro=t,lo=!0,o=oo,pd(t.type)?(vd=o,oo=yd(r.firstChild)):oo=o),Tl(e,t,t.pendingProps.children,n),Ml(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&ao&&((o=r=oo)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var o=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[De])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(a=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(a!==o.rel||e.getAttribute("href")!==(null==o.href||""===o.href?null:o.href)||e.getAttribute("crossorigin")!==(null==o.crossOrigin?null:o.crossOrigin)||e.getAttribute("title")!==(null==o.title?null:o.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((a=e.getAttribute("src"))!==(null==o.src?null:o.src)||e.getAttribute("type")!==(null==o.type?null:o.type)||e.getAttribute("crossorigin")!==(null==o.crossOrigin?null:o.crossOrigin))&&a&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var a=null==o.name?null:""+o.name;if("hidden"===o.type&&e.getAttribute("name")===a)return e}if(null===(e=yd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,lo))?(t.stateNode=r,ro=t,oo=yd(r.firstChild),lo=!1,o=!0):o=!1),o||co(t)),G(t),o=t.type,a=t.pendingProps,l=null!==e?e.memoizedProps:null,r=a.children,id(o,a)?r=null:null!==l&&id(o,l)&&(t.flags|=32),null!==t.memoizedState&&(o=La(e,t,ja,null,null,n),Gd._currentValue=o),Ml(e,t),Tl(e,t,r,n),t.child;case 6:return null===e&&ao&&((e=n=oo)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=yd(e.nextSibling)))return null}return e}(n,t.pendingProps,lo))?(t.stateNode=n,ro=t,oo=null,e=!0):e=!1),e||co(t)),null;case 13:return Wl(e,t,n);case 4:return q(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=nl(t,null,r,n):Tl(e,t,r,n),t.child;case 11:return Rl(e,t,t.type,t.pendingProps,n);case 7:return Tl(e,t,t.pendingProps,n),t.child;case 8:case 12:return Tl(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,Ao(0,t.type,r.value),Tl(e,t,r.children,n),t.child;case 9:return o=t.type._context,r=t.pendingProps.children,Eo(t),r=r(o=Po(o)),t.flags|=1,Tl(e,t,r,n),t.child;case 14:return Ol(e,t,t.type,t.pendingProps,n);case 15:return Nl(e,t,t.type,t.pendingProps,n);case 19:return Gl(e,t,n);case 31:return r=t.pendingProps,n=t.mode,r={mode:r.mode,children:r.children},null===e?((n=Vl(r,n)).ref=t.ref,t.child=n,n.return=t,t=n):((n=Ir(e.child,r)).ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return Ll(e,t,n);case 24:return Eo(t),r=Po(_o),null===e?(null===(o=Ho())&&(o=rc,a=Mo(),o.pooledCache=a,a.refCount++,null!==a&&(o.pooledCacheLanes|=n),o=a),t.memoizedState={parent:r,cache:o},ra(t),Ao(0,_o,o)):(0!==(e.lanes&n)&&(oa(e,t),da(t,null,null,n),ua()),o=e.memoizedState,a=t.memoizedState,o.parent!==r?(o={parent:r,cache:r},t.memoizedState=o,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=o),Ao(0,_o,r)):(r=a.cache,Ao(0,_o,r),r!==o.cache&&ko(t,[_o],n,!0))),Tl(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(i(156,t.tag))}function Jl(e){e.flags|=4}function Zl(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Ud(t)){if(null!==(t=ol.current)&&((4194048&ac)===ac?null!==al:(62914560&ac)!==ac&&0===(536870912&ac)||t!==al))throw Zo=Qo,Ko;e.flags|=8192}}function es(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?ke():536870912,e.lanes|=t,yc|=t)}function ts(e,t){if(!ao)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function ns(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=65011712&o.subtreeFlags,r|=65011712&o.flags,o.return=e,o=o.sibling;else for(o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function rs(e,t,n){var r=t.pendingProps;switch(no(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return ns(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),wo(_o),K(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(po(t)?Jl(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,mo())),ns(t),null;case 26:return n=t.memoizedState,null===e?(Jl(t),null!==n?(ns(t),Zl(t,n)):(ns(t),t.flags&=-16777217)):n?n!==e.memoizedState?(Jl(t),ns(t),Zl(t,n)):(ns(t),t.flags&=-16777217):(e.memoizedProps!==r&&Jl(t),ns(t),t.flags&=-16777217),null;case 27:Q(t),n=V.current;var o=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Jl(t);else{if(!r){if(null===t.stateNode)throw Error(i(166));return ns(t),null}e=W.current,po(t)?uo(t):(e=Ad(o,r,n),t.stateNode=e,Jl(t))}return ns(t),null;case 5:if(Q(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&Jl(t);else{if(!r){if(null===t.stateNode)throw Error(i(166));return ns(t),null}if(e=W.current,po(t))uo(t);else{switch(o=rd(V.current),e){case 1:e=o.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=o.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=o.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=o.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=o.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?o.createElement("select",{is:r.is}):o.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?o.createElement(n,{is:r.is}):o.createElement(n)}}e[Le]=t,e[_e]=r;e:for(o=t.child;null!==o;){if(5===o.tag||6===o.tag)e.appendChild(o.stateNode);else if(4!==o.tag&&27!==o.tag&&null!==o.child){o.child.return=o,o=o.child;continue}if(o===t)break e;for(;null===o.sibling;){if(null===o.return||o.return===t)break e;o=o.return}o.sibling.return=o.return,o=o.sibling}t.stateNode=e;e:switch(ed(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&Jl(t)}}return ns(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&Jl(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(i(166));if(e=V.current,po(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(o=ro))switch(o.tag){case 27:case 5:r=o.memoizedProps}e[Le]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Yu(e.nodeValue,n)))||co(t)}else(e=rd(e).createTextNode(r))[Le]=t,t.stateNode=e}return ns(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(o=po(t),null!==r&&null!==r.dehydrated){if(null===e){if(!o)throw Error(i(318));if(!(o=null!==(o=t.memoizedState)?o.dehydrated:null))throw Error(i(317));o[Le]=t}else ho(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;ns(t),o=!1}else o=mo(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=o),o=!0;if(!o)return 256&t.flags?(cl(t),t):(cl(t),null)}if(cl(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){o=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(o=r.alternate.memoizedState.cachePool.pool);var a=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(a=r.memoizedState.cachePool.pool),a!==o&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),es(t,t.updateQueue),ns(t),null;case 4:return K(),null===e&&Bu(t.stateNode.containerInfo),ns(t),null;case 10:return wo(t.type),ns(t),null;case 19:if(B(ul),null===(o=t.memoizedState))return ns(t),null;if(r=0!==(128&t.flags),null===(a=o.rendering))if(r)ts(o,!1);else{if(0!==fc||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(a=dl(e))){for(t.flags|=128,ts(o,!1),e=a.updateQueue,t.updateQueue=e,es(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Dr(n,e),n=n.sibling;return U(ul,1&ul.current|2),t.child}e=e.sibling}null!==o.tail&&te()>Sc&&(t.flags|=128,r=!0,ts(o,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=dl(a))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,es(t,e),ts(o,!0),null===o.tail&&"hidden"===o.tailMode&&!a.alternate&&!ao)return ns(t),null}else 2*te()-o.renderingStartTime>Sc&&536870912!==n&&(t.flags|=128,r=!0,ts(o,!1),t.lanes=4194304);o.isBackwards?(a.sibling=t.child,t.child=a):(null!==(e=o.last)?e.sibling=a:t.child=a,o.last=a)}return null!==o.tail?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=te(),t.sibling=null,e=ul.current,U(ul,r?1&e|2:1&e),t):(ns(t),null);case 22:case 23:return cl(t),va(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(ns(t),6&t.subtreeFlags&&(t.flags|=8192)):ns(t),null!==(n=t.updateQueue)&&es(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&B(Wo),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),wo(_o),ns(t),null;case 25:case 30:return null}throw Error(i(156,t.tag))}function os(e,t){switch(no(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return wo(_o),K(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return Q(t),null;case 13:if(cl(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(i(340));ho()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return B(ul),null;case 4:return K(),null;case 10:return wo(t.type),null;case 22:case 23:return cl(t),va(),null!==e&&B(Wo),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return wo(_o),null;default:return null}}function as(e,t){switch(no(t),t.tag){case 3:wo(_o),K();break;case 26:case 27:case 5:Q(t);break;case 4:K();break;case 13:cl(t);break;case 19:B(ul);break;case 10:wo(t.type);break;case 22:case 23:cl(t),va(),null!==e&&B(Wo);break;case 24:wo(_o)}}function is(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var o=r.next;n=o;do{if((n.tag&e)===e){r=void 0;var a=n.create,i=n.inst;r=a(),i.destroy=r}n=n.next}while(n!==o)}}catch(l){uu(t,t.return,l)}}function ls(e,t,n){try{var r=t.updateQueue,o=null!==r?r.lastEffect:null;if(null!==o){var a=o.next;r=a;do{if((r.tag&e)===e){var i=r.inst,l=i.destroy;if(void 0!==l){i.destroy=void 0,o=t;var s=n,c=l;try{c()}catch(u){uu(o,s,u)}}}r=r.next}while(r!==a)}}catch(u){uu(t,t.return,u)}}function ss(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{pa(t,n)}catch(r){uu(e,e.return,r)}}}function cs(e,t,n){n.props=gl(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){uu(e,t,r)}}function us(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"===typeof n?e.refCleanup=n(r):n.current=r}}catch(o){uu(e,t,o)}}function ds(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(o){uu(e,t,o)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(a){uu(e,t,a)}else n.current=null}function fs(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(o){uu(e,e.return,o)}}function ps(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var o=null,a=null,l=null,s=null,c=null,u=null,d=null;for(h in n){var f=n[h];if(n.hasOwnProperty(h)&&null!=f)switch(h){case"checked":case"value":break;case"defaultValue":c=f;default:r.hasOwnProperty(h)||Ju(e,t,h,null,r,f)}}for(var p in r){var h=r[p];if(f=n[p],r.hasOwnProperty(p)&&(null!=h||null!=f))switch(p){case"type":a=h;break;case"name":o=h;break;case"checked":u=h;break;case"defaultChecked":d=h;break;case"value":l=h;break;case"defaultValue":s=h;break;case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(i(137,t));break;default:h!==f&&Ju(e,t,p,h,r,f)}}return void gt(e,l,s,c,u,d,a,o);case"select":for(a in h=l=s=p=null,n)if(c=n[a],n.hasOwnProperty(a)&&null!=c)switch(a){case"value":break;case"multiple":h=c;default:r.hasOwnProperty(a)||Ju(e,t,a,null,r,c)}for(o in r)if(a=r[o],c=n[o],r.hasOwnProperty(o)&&(null!=a||null!=c))switch(o){case"value":p=a;break;case"defaultValue":s=a;break;case"multiple":l=a;default:a!==c&&Ju(e,t,o,a,r,c)}return t=s,n=l,r=h,void(null!=p?bt(e,!!n,p,!1):!!r!==!!n&&(null!=t?bt(e,!!n,t,!0):bt(e,!!n,n?[]:"",!1)));case"textarea":for(s in h=p=null,n)if(o=n[s],n.hasOwnProperty(s)&&null!=o&&!r.hasOwnProperty(s))switch(s){case"value":case"children":break;default:Ju(e,t,s,null,r,o)}for(l in r)if(o=r[l],a=n[l],r.hasOwnProperty(l)&&(null!=o||null!=a))switch(l){case"value":p=o;break;case"defaultValue":h=o;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=o)throw Error(i(91));break;default:o!==a&&Ju(e,t,l,o,r,a)}return void At(e,p,h);case"option":for(var m in n)if(p=n[m],n.hasOwnProperty(m)&&null!=p&&!r.hasOwnProperty(m))if("selected"===m)e.selected=!1;else Ju(e,t,m,null,r,p);for(c in r)if(p=r[c],h=n[c],r.hasOwnProperty(c)&&p!==h&&(null!=p||null!=h))if("selected"===c)e.selected=p&&"function"!==typeof p&&"symbol"!==typeof p;else Ju(e,t,c,p,r,h);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)p=n[g],n.hasOwnProperty(g)&&null!=p&&!r.hasOwnProperty(g)&&Ju(e,t,g,null,r,p);for(u in r)if(p=r[u],h=n[u],r.hasOwnProperty(u)&&p!==h&&(null!=p||null!=h))switch(u){case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(i(137,t));break;default:Ju(e,t,u,p,r,h)}return;default:if(Et(t)){for(var y in n)p=n[y],n.hasOwnProperty(y)&&void 0!==p&&!r.hasOwnProperty(y)&&Zu(e,t,y,void 0,r,p);for(d in r)p=r[d],h=n[d],!r.hasOwnProperty(d)||p===h||void 0===p&&void 0===h||Zu(e,t,d,p,r,h);return}}for(var v in n)p=n[v],n.hasOwnProperty(v)&&null!=p&&!r.hasOwnProperty(v)&&Ju(e,t,v,null,r,p);for(f in r)p=r[f],h=n[f],!r.hasOwnProperty(f)||p===h||null==p&&null==h||Ju(e,t,f,p,r,h)}(r,e.type,n,t),r[_e]=t}catch(o){uu(e,e.return,o)}}function hs(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&pd(e.type)||4===e.tag}function ms(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||hs(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&pd(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function gs(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Xu));else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(gs(e,t,n),e=e.sibling;null!==e;)gs(e,t,n),e=e.sibling}function ys(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&pd(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(ys(e,t,n),e=e.sibling;null!==e;)ys(e,t,n),e=e.sibling}function vs(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,o=t.attributes;o.length;)t.removeAttributeNode(o[0]);ed(t,r,n),t[Le]=e,t[_e]=n}catch(a){uu(e,e.return,a)}}var bs=!1,As=!1,ws=!1,Ss="function"===typeof WeakSet?WeakSet:Set,ks=null;function xs(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Fs(e,n),4&r&&is(5,n);break;case 1:if(Fs(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(i){uu(n,n.return,i)}else{var o=gl(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(o,t,e.__reactInternalSnapshotBeforeUpdate)}catch(l){uu(n,n.return,l)}}64&r&&ss(n),512&r&&us(n,n.return);break;case 3:if(Fs(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{pa(e,t)}catch(i){uu(n,n.return,i)}}break;case 27:null===t&&4&r&&vs(n);case 26:case 5:Fs(e,n),null===t&&4&r&&fs(n),512&r&&us(n,n.return);break;case 12:Fs(e,n);break;case 13:Fs(e,n),4&r&&Os(e,n),64&r&&(null!==(e=n.memoizedState)&&(null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$?"!==e.data||"complete"===n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=hu.bind(null,n))));break;case 22:if(!(r=null!==n.memoizedState||bs)){t=null!==t&&null!==t.memoizedState||As,o=bs;var a=As;bs=r,(As=t)&&!a?Ds(e,n,0!==(8772&n.subtreeFlags)):Fs(e,n),bs=o,As=a}break;case 30:break;default:Fs(e,n)}}function Cs(e){var t=e.alternate;null!==t&&(e.alternate=null,Cs(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Be(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Es=null,Ps=!1;function Ts(e,t,n){for(n=n.child;null!==n;)Rs(e,t,n),n=n.sibling}function Rs(e,t,n){if(de&&"function"===typeof de.onCommitFiberUnmount)try{de.onCommitFiberUnmount(ue,n)}catch(a){}switch(n.tag){case 26:As||ds(n,t),Ts(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:As||ds(n,t);var r=Es,o=Ps;pd(n.type)&&(Es=n.stateNode,Ps=!1),Ts(e,t,n),wd(n.stateNode),Es=r,Ps=o;break;case 5:As||ds(n,t);case 6:if(r=Es,o=Ps,Es=null,Ts(e,t,n),Ps=o,null!==(Es=r))if(Ps)try{(9===Es.nodeType?Es.body:"HTML"===Es.nodeName?Es.ownerDocument.body:Es).removeChild(n.stateNode)}catch(i){uu(n,t,i)}else try{Es.removeChild(n.stateNode)}catch(i){uu(n,t,i)}break;case 18:null!==Es&&(Ps?(hd(9===(e=Es).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Tf(e)):hd(Es,n.stateNode));break;case 4:r=Es,o=Ps,Es=n.stateNode.containerInfo,Ps=!0,Ts(e,t,n),Es=r,Ps=o;break;case 0:case 11:case 14:case 15:As||ls(2,n,t),As||ls(4,n,t),Ts(e,t,n);break;case 1:As||(ds(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&cs(n,t,r)),Ts(e,t,n);break;case 21:Ts(e,t,n);break;case 22:As=(r=As)||null!==n.memoizedState,Ts(e,t,n),As=r;break;default:Ts(e,t,n)}}function Os(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{Tf(e)}catch(n){uu(t,t.return,n)}}function Ns(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new Ss),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new Ss),t;default:throw Error(i(435,e.tag))}}(e);t.forEach(function(t){var r=mu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}function Ls(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var o=n[r],a=e,l=t,s=l;e:for(;null!==s;){switch(s.tag){case 27:if(pd(s.type)){Es=s.stateNode,Ps=!1;break e}break;case 5:Es=s.stateNode,Ps=!1;break e;case 3:case 4:Es=s.stateNode.containerInfo,Ps=!0;break e}s=s.return}if(null===Es)throw Error(i(160));Rs(a,l,o),Es=null,Ps=!1,null!==(a=o.alternate)&&(a.return=null),o.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)Ms(t,e),t=t.sibling}var _s=null;function Ms(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ls(t,e),js(e),4&r&&(ls(3,e,e.return),is(3,e),ls(5,e,e.return));break;case 1:Ls(t,e),js(e),512&r&&(As||null===n||ds(n,n.return)),64&r&&bs&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var o=_s;if(Ls(t,e),js(e),512&r&&(As||null===n||ds(n,n.return)),4&r){var a=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,o=o.ownerDocument||o;t:switch(r){case"title":(!(a=o.getElementsByTagName("title")[0])||a[De]||a[Le]||"http://www.w3.org/2000/svg"===a.namespaceURI||a.hasAttribute("itemprop"))&&(a=o.createElement(r),o.head.insertBefore(a,o.querySelector("head > title"))),ed(a,r,n),a[Le]=e,$e(a),r=a;break e;case"link":var l=Dd("link","href",o).get(r+(n.href||""));if(l)for(var s=0;s<l.length;s++)if((a=l[s]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&a.getAttribute("rel")===(null==n.rel?null:n.rel)&&a.getAttribute("title")===(null==n.title?null:n.title)&&a.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){l.splice(s,1);break t}ed(a=o.createElement(r),r,n),o.head.appendChild(a);break;case"meta":if(l=Dd("meta","content",o).get(r+(n.content||"")))for(s=0;s<l.length;s++)if((a=l[s]).getAttribute("content")===(null==n.content?null:""+n.content)&&a.getAttribute("name")===(null==n.name?null:n.name)&&a.getAttribute("property")===(null==n.property?null:n.property)&&a.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&a.getAttribute("charset")===(null==n.charSet?null:n.charSet)){l.splice(s,1);break t}ed(a=o.createElement(r),r,n),o.head.appendChild(a);break;default:throw Error(i(468,r))}a[Le]=e,$e(a),r=a}e.stateNode=r}else Bd(o,e.type,e.stateNode);else e.stateNode=Md(o,r,e.memoizedProps);else a!==r?(null===a?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):a.count--,null===r?Bd(o,e.type,e.stateNode):Md(o,r,e.memoizedProps)):null===r&&null!==e.stateNode&&ps(e,e.memoizedProps,n.memoizedProps)}break;case 27:Ls(t,e),js(e),512&r&&(As||null===n||ds(n,n.return)),null!==n&&4&r&&ps(e,e.memoizedProps,n.memoizedProps);break;case 5:if(Ls(t,e),js(e),512&r&&(As||null===n||ds(n,n.return)),32&e.flags){o=e.stateNode;try{St(o,"")}catch(h){uu(e,e.return,h)}}4&r&&null!=e.stateNode&&ps(e,o=e.memoizedProps,null!==n?n.memoizedProps:o),1024&r&&(ws=!0);break;case 6:if(Ls(t,e),js(e),4&r){if(null===e.stateNode)throw Error(i(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(h){uu(e,e.return,h)}}break;case 3:if(Id=null,o=_s,_s=xd(t.containerInfo),Ls(t,e),_s=o,js(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Tf(t.containerInfo)}catch(h){uu(e,e.return,h)}ws&&(ws=!1,zs(e));break;case 4:r=_s,_s=xd(e.stateNode.containerInfo),Ls(t,e),js(e),_s=r;break;case 12:default:Ls(t,e),js(e);break;case 13:Ls(t,e),js(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(wc=te()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Ns(e,r)));break;case 22:o=null!==e.memoizedState;var c=null!==n&&null!==n.memoizedState,u=bs,d=As;if(bs=u||o,As=d||c,Ls(t,e),As=d,bs=u,js(e),8192&r)e:for(t=e.stateNode,t._visibility=o?-2&t._visibility:1|t._visibility,o&&(null===n||c||bs||As||Is(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){c=n=t;try{if(a=c.stateNode,o)"function"===typeof(l=a.style).setProperty?l.setProperty("display","none","important"):l.display="none";else{s=c.stateNode;var f=c.memoizedProps.style,p=void 0!==f&&null!==f&&f.hasOwnProperty("display")?f.display:null;s.style.display=null==p||"boolean"===typeof p?"":(""+p).trim()}}catch(h){uu(c,c.return,h)}}}else if(6===t.tag){if(null===n){c=t;try{c.stateNode.nodeValue=o?"":c.memoizedProps}catch(h){uu(c,c.return,h)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,Ns(e,n))));break;case 19:Ls(t,e),js(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,Ns(e,r)));case 30:case 21:}}function js(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(hs(r)){n=r;break}r=r.return}if(null==n)throw Error(i(160));switch(n.tag){case 27:var o=n.stateNode;ys(e,ms(e),o);break;case 5:var a=n.stateNode;32&n.flags&&(St(a,""),n.flags&=-33),ys(e,ms(e),a);break;case 3:case 4:var l=n.stateNode.containerInfo;gs(e,ms(e),l);break;default:throw Error(i(161))}}catch(s){uu(e,e.return,s)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function zs(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;zs(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Fs(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)xs(e,t.alternate,t),t=t.sibling}function Is(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:ls(4,t,t.return),Is(t);break;case 1:ds(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&cs(t,t.return,n),Is(t);break;case 27:wd(t.stateNode);case 26:case 5:ds(t,t.return),Is(t);break;case 22:null===t.memoizedState&&Is(t);break;default:Is(t)}e=e.sibling}}function Ds(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,o=e,a=t,i=a.flags;switch(a.tag){case 0:case 11:case 15:Ds(o,a,n),is(4,a);break;case 1:if(Ds(o,a,n),"function"===typeof(o=(r=a).stateNode).componentDidMount)try{o.componentDidMount()}catch(c){uu(r,r.return,c)}if(null!==(o=(r=a).updateQueue)){var l=r.stateNode;try{var s=o.shared.hiddenCallbacks;if(null!==s)for(o.shared.hiddenCallbacks=null,o=0;o<s.length;o++)fa(s[o],l)}catch(c){uu(r,r.return,c)}}n&&64&i&&ss(a),us(a,a.return);break;case 27:vs(a);case 26:case 5:Ds(o,a,n),n&&null===r&&4&i&&fs(a),us(a,a.return);break;case 12:Ds(o,a,n);break;case 13:Ds(o,a,n),n&&4&i&&Os(o,a);break;case 22:null===a.memoizedState&&Ds(o,a,n),us(a,a.return);break;case 30:break;default:Ds(o,a,n)}t=t.sibling}}function Bs(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&jo(n))}function Us(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&jo(e))}function Ws(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Hs(e,t,n,r),t=t.sibling}function Hs(e,t,n,r){var o=t.flags;switch(t.tag){case 0:case 11:case 15:Ws(e,t,n,r),2048&o&&is(9,t);break;case 1:case 13:default:Ws(e,t,n,r);break;case 3:Ws(e,t,n,r),2048&o&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&jo(e)));break;case 12:if(2048&o){Ws(e,t,n,r),e=t.stateNode;try{var a=t.memoizedProps,i=a.id,l=a.onPostCommit;"function"===typeof l&&l(i,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(s){uu(t,t.return,s)}}else Ws(e,t,n,r);break;case 23:break;case 22:a=t.stateNode,i=t.alternate,null!==t.memoizedState?2&a._visibility?Ws(e,t,n,r):$s(e,t):2&a._visibility?Ws(e,t,n,r):(a._visibility|=2,Vs(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&o&&Bs(i,t);break;case 24:Ws(e,t,n,r),2048&o&&Us(t.alternate,t)}}function Vs(e,t,n,r,o){for(o=o&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var a=e,i=t,l=n,s=r,c=i.flags;switch(i.tag){case 0:case 11:case 15:Vs(a,i,l,s,o),is(8,i);break;case 23:break;case 22:var u=i.stateNode;null!==i.memoizedState?2&u._visibility?Vs(a,i,l,s,o):$s(a,i):(u._visibility|=2,Vs(a,i,l,s,o)),o&&2048&c&&Bs(i.alternate,i);break;case 24:Vs(a,i,l,s,o),o&&2048&c&&Us(i.alternate,i);break;default:Vs(a,i,l,s,o)}t=t.sibling}}function $s(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,o=r.flags;switch(r.tag){case 22:$s(n,r),2048&o&&Bs(r.alternate,r);break;case 24:$s(n,r),2048&o&&Us(r.alternate,r);break;default:$s(n,r)}t=t.sibling}}var qs=8192;function Ks(e){if(e.subtreeFlags&qs)for(e=e.child;null!==e;)Gs(e),e=e.sibling}function Gs(e){switch(e.tag){case 26:Ks(e),e.flags&qs&&null!==e.memoizedState&&function(e,t,n){if(null===Wd)throw Error(i(475));var r=Wd;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var o=Rd(n.href),a=e.querySelector(Od(o));if(a)return null!==(e=a._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=Vd.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=a,void $e(a);a=e.ownerDocument||e,n=Nd(n),(o=Sd.get(o))&&zd(n,o),$e(a=a.createElement("link"));var l=a;l._p=new Promise(function(e,t){l.onload=e,l.onerror=t}),ed(a,"link",n),t.instance=a}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=Vd.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(_s,e.memoizedState,e.memoizedProps);break;case 5:default:Ks(e);break;case 3:case 4:var t=_s;_s=xd(e.stateNode.containerInfo),Ks(e),_s=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=qs,qs=16777216,Ks(e),qs=t):Ks(e))}}function Qs(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Ys(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];ks=r,Zs(r,e)}Qs(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Xs(e),e=e.sibling}function Xs(e){switch(e.tag){case 0:case 11:case 15:Ys(e),2048&e.flags&&ls(9,e,e.return);break;case 3:case 12:default:Ys(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,Js(e)):Ys(e)}}function Js(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];ks=r,Zs(r,e)}Qs(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:ls(8,t,t.return),Js(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,Js(t));break;default:Js(t)}e=e.sibling}}function Zs(e,t){for(;null!==ks;){var n=ks;switch(n.tag){case 0:case 11:case 15:ls(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:jo(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,ks=r;else e:for(n=e;null!==ks;){var o=(r=ks).sibling,a=r.return;if(Cs(r),r===n){ks=null;break e}if(null!==o){o.return=a,ks=o;break e}ks=a}}}var ec={getCacheForType:function(e){var t=Po(_o),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},tc="function"===typeof WeakMap?WeakMap:Map,nc=0,rc=null,oc=null,ac=0,ic=0,lc=null,sc=!1,cc=!1,uc=!1,dc=0,fc=0,pc=0,hc=0,mc=0,gc=0,yc=0,vc=null,bc=null,Ac=!1,wc=0,Sc=1/0,kc=null,xc=null,Cc=0,Ec=null,Pc=null,Tc=0,Rc=0,Oc=null,Nc=null,Lc=0,_c=null;function Mc(){if(0!==(2&nc)&&0!==ac)return ac&-ac;if(null!==M.T){return 0!==Io?Io:Ru()}return Oe()}function jc(){0===gc&&(gc=0===(536870912&ac)||ao?Se():536870912);var e=ol.current;return null!==e&&(e.flags|=32),gc}function zc(e,t,n){(e!==rc||2!==ic&&9!==ic)&&null===e.cancelPendingCommit||(Hc(e,0),Bc(e,ac,gc,!1)),Ce(e,n),0!==(2&nc)&&e===rc||(e===rc&&(0===(2&nc)&&(hc|=n),4===fc&&Bc(e,ac,gc,!1)),Su(e))}function Fc(e,t,n){if(0!==(6&nc))throw Error(i(327));for(var r=!n&&0===(124&t)&&0===(t&e.expiredLanes)||Ae(e,t),o=r?function(e,t){var n=nc;nc|=2;var r=$c(),o=qc();rc!==e||ac!==t?(kc=null,Sc=te()+500,Hc(e,t)):cc=Ae(e,t);e:for(;;)try{if(0!==ic&&null!==oc){t=oc;var a=lc;t:switch(ic){case 1:ic=0,lc=null,Zc(e,t,a,1);break;case 2:case 9:if(Yo(a)){ic=0,lc=null,Jc(t);break}t=function(){2!==ic&&9!==ic||rc!==e||(ic=7),Su(e)},a.then(t,t);break e;case 3:ic=7;break e;case 4:ic=5;break e;case 7:Yo(a)?(ic=0,lc=null,Jc(t)):(ic=0,lc=null,Zc(e,t,a,7));break;case 5:var l=null;switch(oc.tag){case 26:l=oc.memoizedState;case 5:case 27:var s=oc;if(!l||Ud(l)){ic=0,lc=null;var c=s.sibling;if(null!==c)oc=c;else{var u=s.return;null!==u?(oc=u,eu(u)):oc=null}break t}}ic=0,lc=null,Zc(e,t,a,5);break;case 6:ic=0,lc=null,Zc(e,t,a,6);break;case 8:Wc(),fc=6;break e;default:throw Error(i(462))}}Yc();break}catch(d){Vc(e,d)}return bo=vo=null,M.H=r,M.A=o,nc=n,null!==oc?0:(rc=null,ac=0,Tr(),fc)}(e,t):Gc(e,t,!0),a=r;;){if(0===o){cc&&!r&&Bc(e,t,0,!1);break}if(n=e.current.alternate,!a||Dc(n)){if(2===o){if(a=t,e.errorRecoveryDisabledLanes&a)var l=0;else l=0!==(l=-536870913&e.pendingLanes)?l:536870912&l?536870912:0;if(0!==l){t=l;e:{var s=e;o=vc;var c=s.current.memoizedState.isDehydrated;if(c&&(Hc(s,l).flags|=256),2!==(l=Gc(s,l,!1))){if(uc&&!c){s.errorRecoveryDisabledLanes|=a,hc|=a,o=4;break e}a=bc,bc=o,null!==a&&(null===bc?bc=a:bc.push.apply(bc,a))}o=l}if(a=!1,2!==o)continue}}if(1===o){Hc(e,0),Bc(e,t,0,!0);break}e:{switch(r=e,a=o){case 0:case 1:throw Error(i(345));case 4:if((4194048&t)!==t)break;case 6:Bc(r,t,gc,!sc);break e;case 2:bc=null;break;case 3:case 5:break;default:throw Error(i(329))}if((62914560&t)===t&&10<(o=wc+300-te())){if(Bc(r,t,gc,!sc),0!==be(r,0,!0))break e;r.timeoutHandle=sd(Ic.bind(null,r,n,bc,kc,Ac,t,gc,hc,yc,sc,a,2,-0,0),o)}else Ic(r,n,bc,kc,Ac,t,gc,hc,yc,sc,a,0,-0,0)}break}o=Gc(e,t,!1),a=!1}Su(e)}function Ic(e,t,n,r,o,a,l,s,c,u,d,f,p,h){if(e.timeoutHandle=-1,(8192&(f=t.subtreeFlags)||16785408===(16785408&f))&&(Wd={stylesheets:null,count:0,unsuspend:Hd},Gs(t),null!==(f=function(){if(null===Wd)throw Error(i(475));var e=Wd;return e.stylesheets&&0===e.count&&qd(e,e.stylesheets),0<e.count?function(t){var n=setTimeout(function(){if(e.stylesheets&&qd(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=f(nu.bind(null,e,t,a,n,r,o,l,s,c,d,1,p,h)),void Bc(e,a,l,!u);nu(e,t,a,n,r,o,l,s,c)}function Dc(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var o=n[r],a=o.getSnapshot;o=o.value;try{if(!Qn(a(),o))return!1}catch(i){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Bc(e,t,n,r){t&=~mc,t&=~hc,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var o=t;0<o;){var a=31-pe(o),i=1<<a;r[a]=-1,o&=~i}0!==n&&Ee(e,n,t)}function Uc(){return 0!==(6&nc)||(ku(0,!1),!1)}function Wc(){if(null!==oc){if(0===ic)var e=oc.return;else bo=vo=null,Ia(e=oc),Qi=null,Yi=0,e=oc;for(;null!==e;)as(e.alternate,e),e=e.return;oc=null}}function Hc(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,cd(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Wc(),rc=e,oc=n=Ir(e.current,null),ac=t,ic=0,lc=null,sc=!1,cc=Ae(e,t),uc=!1,yc=gc=mc=hc=pc=fc=0,bc=vc=null,Ac=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var o=31-pe(r),a=1<<o;t|=e[o],r&=~a}return dc=t,Tr(),n}function Vc(e,t){Aa=null,M.H=$i,t===qo||t===Go?(t=ea(),ic=3):t===Ko?(t=ea(),ic=4):ic=t===El?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,lc=t,null===oc&&(fc=1,wl(e,xr(t,e.current)))}function $c(){var e=M.H;return M.H=$i,null===e?$i:e}function qc(){var e=M.A;return M.A=ec,e}function Kc(){fc=4,sc||(4194048&ac)!==ac&&null!==ol.current||(cc=!0),0===(134217727&pc)&&0===(134217727&hc)||null===rc||Bc(rc,ac,gc,!1)}function Gc(e,t,n){var r=nc;nc|=2;var o=$c(),a=qc();rc===e&&ac===t||(kc=null,Hc(e,t)),t=!1;var i=fc;e:for(;;)try{if(0!==ic&&null!==oc){var l=oc,s=lc;switch(ic){case 8:Wc(),i=6;break e;case 3:case 2:case 9:case 6:null===ol.current&&(t=!0);var c=ic;if(ic=0,lc=null,Zc(e,l,s,c),n&&cc){i=0;break e}break;default:c=ic,ic=0,lc=null,Zc(e,l,s,c)}}Qc(),i=fc;break}catch(u){Vc(e,u)}return t&&e.shellSuspendCounter++,bo=vo=null,nc=r,M.H=o,M.A=a,null===oc&&(rc=null,ac=0,Tr()),i}function Qc(){for(;null!==oc;)Xc(oc)}function Yc(){for(;null!==oc&&!Z();)Xc(oc)}function Xc(e){var t=Xl(e.alternate,e,dc);e.memoizedProps=e.pendingProps,null===t?eu(e):oc=t}function Jc(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=zl(n,t,t.pendingProps,t.type,void 0,ac);break;case 11:t=zl(n,t,t.pendingProps,t.type.render,t.ref,ac);break;case 5:Ia(t);default:as(n,t),t=Xl(n,t=oc=Dr(t,dc),dc)}e.memoizedProps=e.pendingProps,null===t?eu(e):oc=t}function Zc(e,t,n,r){bo=vo=null,Ia(t),Qi=null,Yi=0;var o=t.return;try{if(function(e,t,n,r,o){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&xo(t,n,o,!0),null!==(n=ol.current)){switch(n.tag){case 13:return null===al?Kc():null===n.alternate&&0===fc&&(fc=3),n.flags&=-257,n.flags|=65536,n.lanes=o,r===Qo?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),du(e,r,o)),!1;case 22:return n.flags|=65536,r===Qo?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),du(e,r,o)),!1}throw Error(i(435,n.tag))}return du(e,r,o),Kc(),!1}if(ao)return null!==(t=ol.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=o,r!==so&&go(xr(e=Error(i(422),{cause:r}),n))):(r!==so&&go(xr(t=Error(i(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,o&=-o,e.lanes|=o,r=xr(r,n),sa(e,o=kl(e.stateNode,r,o)),4!==fc&&(fc=2)),!1;var a=Error(i(520),{cause:r});if(a=xr(a,n),null===vc?vc=[a]:vc.push(a),4!==fc&&(fc=2),null===t)return!0;r=xr(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=o&-o,n.lanes|=e,sa(n,e=kl(n.stateNode,r,e)),!1;case 1:if(t=n.type,a=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==a&&"function"===typeof a.componentDidCatch&&(null===xc||!xc.has(a))))return n.flags|=65536,o&=-o,n.lanes|=o,Cl(o=xl(o),e,n,r),sa(n,o),!1}n=n.return}while(null!==n);return!1}(e,o,t,n,ac))return fc=1,wl(e,xr(n,e.current)),void(oc=null)}catch(a){if(null!==o)throw oc=o,a;return fc=1,wl(e,xr(n,e.current)),void(oc=null)}32768&t.flags?(ao||1===r?e=!0:cc||0!==(536870912&ac)?e=!1:(sc=e=!0,(2===r||9===r||3===r||6===r)&&(null!==(r=ol.current)&&13===r.tag&&(r.flags|=16384))),tu(t,e)):eu(t)}function eu(e){var t=e;do{if(0!==(32768&t.flags))return void tu(t,sc);e=t.return;var n=rs(t.alternate,t,dc);if(null!==n)return void(oc=n);if(null!==(t=t.sibling))return void(oc=t);oc=t=e}while(null!==t);0===fc&&(fc=5)}function tu(e,t){do{var n=os(e.alternate,e);if(null!==n)return n.flags&=32767,void(oc=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(oc=e);oc=e=n}while(null!==e);fc=6,oc=null}function nu(e,t,n,r,o,a,l,s,c){e.cancelPendingCommit=null;do{lu()}while(0!==Cc);if(0!==(6&nc))throw Error(i(327));if(null!==t){if(t===e.current)throw Error(i(177));if(a=t.lanes|t.childLanes,function(e,t,n,r,o,a){var i=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var l=e.entanglements,s=e.expirationTimes,c=e.hiddenUpdates;for(n=i&~n;0<n;){var u=31-pe(n),d=1<<u;l[u]=0,s[u]=-1;var f=c[u];if(null!==f)for(c[u]=null,u=0;u<f.length;u++){var p=f[u];null!==p&&(p.lane&=-536870913)}n&=~d}0!==r&&Ee(e,r,0),0!==a&&0===o&&0!==e.tag&&(e.suspendedLanes|=a&~(i&~t))}(e,n,a|=Pr,l,s,c),e===rc&&(oc=rc=null,ac=0),Pc=t,Ec=e,Tc=n,Rc=a,Oc=o,Nc=r,0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?(e.callbackNode=null,e.callbackPriority=0,X(ae,function(){return su(),null})):(e.callbackNode=null,e.callbackPriority=0),r=0!==(13878&t.flags),0!==(13878&t.subtreeFlags)||r){r=M.T,M.T=null,o=j.p,j.p=2,l=nc,nc|=4;try{!function(e,t){if(e=e.containerInfo,td=nf,tr(e=er(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var o=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(g){n=null;break e}var l=0,s=-1,c=-1,u=0,d=0,f=e,p=null;t:for(;;){for(var h;f!==n||0!==o&&3!==f.nodeType||(s=l+o),f!==a||0!==r&&3!==f.nodeType||(c=l+r),3===f.nodeType&&(l+=f.nodeValue.length),null!==(h=f.firstChild);)p=f,f=h;for(;;){if(f===e)break t;if(p===n&&++u===o&&(s=l),p===a&&++d===r&&(c=l),null!==(h=f.nextSibling))break;p=(f=p).parentNode}f=h}n=-1===s||-1===c?null:{start:s,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(nd={focusedElem:e,selectionRange:n},nf=!1,ks=t;null!==ks;)if(e=(t=ks).child,0!==(1024&t.subtreeFlags)&&null!==e)e.return=t,ks=e;else for(;null!==ks;){switch(a=(t=ks).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==a){e=void 0,n=t,o=a.memoizedProps,a=a.memoizedState,r=n.stateNode;try{var m=gl(n.type,o,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(m,a),r.__reactInternalSnapshotBeforeUpdate=e}catch(y){uu(n,n.return,y)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))md(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":md(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(i(163))}if(null!==(e=t.sibling)){e.return=t.return,ks=e;break}ks=t.return}}(e,t)}finally{nc=l,j.p=o,M.T=r}}Cc=1,ru(),ou(),au()}}function ru(){if(1===Cc){Cc=0;var e=Ec,t=Pc,n=0!==(13878&t.flags);if(0!==(13878&t.subtreeFlags)||n){n=M.T,M.T=null;var r=j.p;j.p=2;var o=nc;nc|=4;try{Ms(t,e);var a=nd,i=er(e.containerInfo),l=a.focusedElem,s=a.selectionRange;if(i!==l&&l&&l.ownerDocument&&Zn(l.ownerDocument.documentElement,l)){if(null!==s&&tr(l)){var c=s.start,u=s.end;if(void 0===u&&(u=c),"selectionStart"in l)l.selectionStart=c,l.selectionEnd=Math.min(u,l.value.length);else{var d=l.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var p=f.getSelection(),h=l.textContent.length,m=Math.min(s.start,h),g=void 0===s.end?m:Math.min(s.end,h);!p.extend&&m>g&&(i=g,g=m,m=i);var y=Jn(l,m),v=Jn(l,g);if(y&&v&&(1!==p.rangeCount||p.anchorNode!==y.node||p.anchorOffset!==y.offset||p.focusNode!==v.node||p.focusOffset!==v.offset)){var b=d.createRange();b.setStart(y.node,y.offset),p.removeAllRanges(),m>g?(p.addRange(b),p.extend(v.node,v.offset)):(b.setEnd(v.node,v.offset),p.addRange(b))}}}}for(d=[],p=l;p=p.parentNode;)1===p.nodeType&&d.push({element:p,left:p.scrollLeft,top:p.scrollTop});for("function"===typeof l.focus&&l.focus(),l=0;l<d.length;l++){var A=d[l];A.element.scrollLeft=A.left,A.element.scrollTop=A.top}}nf=!!td,nd=td=null}finally{nc=o,j.p=r,M.T=n}}e.current=t,Cc=2}}function ou(){if(2===Cc){Cc=0;var e=Ec,t=Pc,n=0!==(8772&t.flags);if(0!==(8772&t.subtreeFlags)||n){n=M.T,M.T=null;var r=j.p;j.p=2;var o=nc;nc|=4;try{xs(e,t.alternate,t)}finally{nc=o,j.p=r,M.T=n}}Cc=3}}function au(){if(4===Cc||3===Cc){Cc=0,ee();var e=Ec,t=Pc,n=Tc,r=Nc;0!==(10256&t.subtreeFlags)||0!==(10256&t.flags)?Cc=5:(Cc=0,Pc=Ec=null,iu(e,e.pendingLanes));var o=e.pendingLanes;if(0===o&&(xc=null),Re(n),t=t.stateNode,de&&"function"===typeof de.onCommitFiberRoot)try{de.onCommitFiberRoot(ue,t,void 0,128===(128&t.current.flags))}catch(s){}if(null!==r){t=M.T,o=j.p,j.p=2,M.T=null;try{for(var a=e.onRecoverableError,i=0;i<r.length;i++){var l=r[i];a(l.value,{componentStack:l.stack})}}finally{M.T=t,j.p=o}}0!==(3&Tc)&&lu(),Su(e),o=e.pendingLanes,0!==(4194090&n)&&0!==(42&o)?e===_c?Lc++:(Lc=0,_c=e):Lc=0,ku(0,!1)}}function iu(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,jo(t)))}function lu(e){return ru(),ou(),au(),su()}function su(){if(5!==Cc)return!1;var e=Ec,t=Rc;Rc=0;var n=Re(Tc),r=M.T,o=j.p;try{j.p=32>n?32:n,M.T=null,n=Oc,Oc=null;var a=Ec,l=Tc;if(Cc=0,Pc=Ec=null,Tc=0,0!==(6&nc))throw Error(i(331));var s=nc;if(nc|=4,Xs(a.current),Hs(a,a.current,l,n),nc=s,ku(0,!1),de&&"function"===typeof de.onPostCommitFiberRoot)try{de.onPostCommitFiberRoot(ue,a)}catch(c){}return!0}finally{j.p=o,M.T=r,iu(e,t)}}function cu(e,t,n){t=xr(n,t),null!==(e=ia(e,t=kl(e.stateNode,t,2),2))&&(Ce(e,2),Su(e))}function uu(e,t,n){if(3===e.tag)cu(e,e,n);else for(;null!==t;){if(3===t.tag){cu(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===xc||!xc.has(r))){e=xr(n,e),null!==(r=ia(t,n=xl(2),2))&&(Cl(n,r,t,e),Ce(r,2),Su(r));break}}t=t.return}}function du(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new tc;var o=new Set;r.set(t,o)}else void 0===(o=r.get(t))&&(o=new Set,r.set(t,o));o.has(n)||(uc=!0,o.add(n),e=fu.bind(null,e,t,n),t.then(e,e))}function fu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,rc===e&&(ac&n)===n&&(4===fc||3===fc&&(62914560&ac)===ac&&300>te()-wc?0===(2&nc)&&Hc(e,0):mc|=n,yc===ac&&(yc=0)),Su(e)}function pu(e,t){0===t&&(t=ke()),null!==(e=Nr(e,t))&&(Ce(e,t),Su(e))}function hu(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),pu(e,n)}function mu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;null!==o&&(n=o.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(i(314))}null!==r&&r.delete(t),pu(e,n)}var gu=null,yu=null,vu=!1,bu=!1,Au=!1,wu=0;function Su(e){e!==yu&&null===e.next&&(null===yu?gu=yu=e:yu=yu.next=e),bu=!0,vu||(vu=!0,dd(function(){0!==(6&nc)?X(re,xu):Cu()}))}function ku(e,t){if(!Au&&bu){Au=!0;do{for(var n=!1,r=gu;null!==r;){if(!t)if(0!==e){var o=r.pendingLanes;if(0===o)var a=0;else{var i=r.suspendedLanes,l=r.pingedLanes;a=(1<<31-pe(42|e)+1)-1,a=201326741&(a&=o&~(i&~l))?201326741&a|1:a?2|a:0}0!==a&&(n=!0,Tu(r,a))}else a=ac,0===(3&(a=be(r,r===rc?a:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||Ae(r,a)||(n=!0,Tu(r,a));r=r.next}}while(n);Au=!1}}function xu(){Cu()}function Cu(){bu=vu=!1;var e=0;0!==wu&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==ld&&(ld=e,!0);return ld=null,!1}()&&(e=wu),wu=0);for(var t=te(),n=null,r=gu;null!==r;){var o=r.next,a=Eu(r,t);0===a?(r.next=null,null===n?gu=o:n.next=o,null===o&&(yu=n)):(n=r,(0!==e||0!==(3&a))&&(bu=!0)),r=o}ku(e,!1)}function Eu(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,a=-62914561&e.pendingLanes;0<a;){var i=31-pe(a),l=1<<i,s=o[i];-1===s?0!==(l&n)&&0===(l&r)||(o[i]=we(l,t)):s<=t&&(e.expiredLanes|=l),a&=~l}if(n=ac,n=be(e,e===(t=rc)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===ic||9===ic)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&J(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||Ae(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&J(r),Re(n)){case 2:case 8:n=oe;break;case 32:default:n=ae;break;case 268435456:n=le}return r=Pu.bind(null,e),n=X(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&J(r),e.callbackPriority=2,e.callbackNode=null,2}function Pu(e,t){if(0!==Cc&&5!==Cc)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(lu()&&e.callbackNode!==n)return null;var r=ac;return 0===(r=be(e,e===rc?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Fc(e,r,t),Eu(e,te()),null!=e.callbackNode&&e.callbackNode===n?Pu.bind(null,e):null)}function Tu(e,t){if(lu())return null;Fc(e,t,!0)}function Ru(){return 0===wu&&(wu=Se()),wu}function Ou(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Rt(""+e)}function Nu(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Lu=0;Lu<wr.length;Lu++){var _u=wr[Lu];Sr(_u.toLowerCase(),"on"+(_u[0].toUpperCase()+_u.slice(1)))}Sr(pr,"onAnimationEnd"),Sr(hr,"onAnimationIteration"),Sr(mr,"onAnimationStart"),Sr("dblclick","onDoubleClick"),Sr("focusin","onFocus"),Sr("focusout","onBlur"),Sr(gr,"onTransitionRun"),Sr(yr,"onTransitionStart"),Sr(vr,"onTransitionCancel"),Sr(br,"onTransitionEnd"),Qe("onMouseEnter",["mouseout","mouseover"]),Qe("onMouseLeave",["mouseout","mouseover"]),Qe("onPointerEnter",["pointerout","pointerover"]),Qe("onPointerLeave",["pointerout","pointerover"]),Ge("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ge("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ge("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ge("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ge("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Mu="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),ju=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Mu));function zu(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var a=void 0;if(t)for(var i=r.length-1;0<=i;i--){var l=r[i],s=l.instance,c=l.currentTarget;if(l=l.listener,s!==a&&o.isPropagationStopped())break e;a=l,o.currentTarget=c;try{a(o)}catch(u){yl(u)}o.currentTarget=null,a=s}else for(i=0;i<r.length;i++){if(s=(l=r[i]).instance,c=l.currentTarget,l=l.listener,s!==a&&o.isPropagationStopped())break e;a=l,o.currentTarget=c;try{a(o)}catch(u){yl(u)}o.currentTarget=null,a=s}}}}function Fu(e,t){var n=t[je];void 0===n&&(n=t[je]=new Set);var r=e+"__bubble";n.has(r)||(Uu(t,e,2,!1),n.add(r))}function Iu(e,t,n){var r=0;t&&(r|=4),Uu(n,e,r,t)}var Du="_reactListening"+Math.random().toString(36).slice(2);function Bu(e){if(!e[Du]){e[Du]=!0,qe.forEach(function(t){"selectionchange"!==t&&(ju.has(t)||Iu(t,!1,e),Iu(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Du]||(t[Du]=!0,Iu("selectionchange",!1,t))}}function Uu(e,t,n,r){switch(uf(t)){case 2:var o=rf;break;case 8:o=of;break;default:o=af}n=o.bind(null,t,n,e),o=void 0,!Dt||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(o=!0),r?void 0!==o?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):void 0!==o?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function Wu(e,t,n,r,o){var a=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var i=r.tag;if(3===i||4===i){var l=r.stateNode.containerInfo;if(l===o)break;if(4===i)for(i=r.return;null!==i;){var c=i.tag;if((3===c||4===c)&&i.stateNode.containerInfo===o)return;i=i.return}for(;null!==l;){if(null===(i=Ue(l)))return;if(5===(c=i.tag)||6===c||26===c||27===c){r=a=i;continue e}l=l.parentNode}}r=r.return}zt(function(){var r=a,o=Nt(n),i=[];e:{var l=Ar.get(e);if(void 0!==l){var c=Zt,u=e;switch(e){case"keypress":if(0===$t(n))break e;case"keydown":case"keyup":c=mn;break;case"focusin":u="focus",c=an;break;case"focusout":u="blur",c=an;break;case"beforeblur":case"afterblur":c=an;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":c=rn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":c=on;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":c=yn;break;case pr:case hr:case mr:c=ln;break;case br:c=vn;break;case"scroll":case"scrollend":c=tn;break;case"wheel":c=bn;break;case"copy":case"cut":case"paste":c=sn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":c=gn;break;case"toggle":case"beforetoggle":c=An}var d=0!==(4&t),f=!d&&("scroll"===e||"scrollend"===e),p=d?null!==l?l+"Capture":null:l;d=[];for(var h,m=r;null!==m;){var g=m;if(h=g.stateNode,5!==(g=g.tag)&&26!==g&&27!==g||null===h||null===p||null!=(g=Ft(m,p))&&d.push(Hu(m,g,h)),f)break;m=m.return}0<d.length&&(l=new c(l,u,null,n,o),i.push({event:l,listeners:d}))}}if(0===(7&t)){if(c="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||n===Ot||!(u=n.relatedTarget||n.fromElement)||!Ue(u)&&!u[Me])&&(c||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,c?(c=r,null!==(u=(u=n.relatedTarget||n.toElement)?Ue(u):null)&&(f=s(u),d=u.tag,u!==f||5!==d&&27!==d&&6!==d)&&(u=null)):(c=null,u=r),c!==u)){if(d=rn,g="onMouseLeave",p="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(d=gn,g="onPointerLeave",p="onPointerEnter",m="pointer"),f=null==c?l:He(c),h=null==u?l:He(u),(l=new d(g,m+"leave",c,n,o)).target=f,l.relatedTarget=h,g=null,Ue(o)===r&&((d=new d(p,m+"enter",u,n,o)).target=h,d.relatedTarget=f,g=d),f=g,c&&u)e:{for(p=u,m=0,h=d=c;h;h=$u(h))m++;for(h=0,g=p;g;g=$u(g))h++;for(;0<m-h;)d=$u(d),m--;for(;0<h-m;)p=$u(p),h--;for(;m--;){if(d===p||null!==p&&d===p.alternate)break e;d=$u(d),p=$u(p)}d=null}else d=null;null!==c&&qu(i,l,c,d,!1),null!==u&&null!==f&&qu(i,f,u,d,!0)}if("select"===(c=(l=r?He(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===c&&"file"===l.type)var y=In;else if(Ln(l))if(Dn)y=Gn;else{y=qn;var v=$n}else!(c=l.nodeName)||"input"!==c.toLowerCase()||"checkbox"!==l.type&&"radio"!==l.type?r&&Et(r.elementType)&&(y=In):y=Kn;switch(y&&(y=y(e,r))?_n(i,y,n,o):(v&&v(e,l,r),"focusout"===e&&r&&"number"===l.type&&null!=r.memoizedProps.value&&vt(l,"number",l.value)),v=r?He(r):window,e){case"focusin":(Ln(v)||"true"===v.contentEditable)&&(rr=v,or=r,ar=null);break;case"focusout":ar=or=rr=null;break;case"mousedown":ir=!0;break;case"contextmenu":case"mouseup":case"dragend":ir=!1,lr(i,n,o);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":lr(i,n,o)}var b;if(Sn)e:{switch(e){case"compositionstart":var A="onCompositionStart";break e;case"compositionend":A="onCompositionEnd";break e;case"compositionupdate":A="onCompositionUpdate";break e}A=void 0}else On?Tn(e,n)&&(A="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(A="onCompositionStart");A&&(Cn&&"ko"!==n.locale&&(On||"onCompositionStart"!==A?"onCompositionEnd"===A&&On&&(b=Vt()):(Wt="value"in(Ut=o)?Ut.value:Ut.textContent,On=!0)),0<(v=Vu(r,A)).length&&(A=new cn(A,e,null,n,o),i.push({event:A,listeners:v}),b?A.data=b:null!==(b=Rn(n))&&(A.data=b))),(b=xn?function(e,t){switch(e){case"compositionend":return Rn(t);case"keypress":return 32!==t.which?null:(Pn=!0,En);case"textInput":return(e=t.data)===En&&Pn?null:e;default:return null}}(e,n):function(e,t){if(On)return"compositionend"===e||!Sn&&Tn(e,t)?(e=Vt(),Ht=Wt=Ut=null,On=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Cn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(A=Vu(r,"onBeforeInput")).length&&(v=new cn("onBeforeInput","beforeinput",null,n,o),i.push({event:v,listeners:A}),v.data=b)),function(e,t,n,r,o){if("submit"===t&&n&&n.stateNode===o){var a=Ou((o[_e]||null).action),i=r.submitter;i&&null!==(t=(t=i[_e]||null)?Ou(t.formAction):i.getAttribute("formAction"))&&(a=t,i=null);var l=new Zt("action","action",null,r,o);e.push({event:l,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==wu){var e=i?Nu(o,i):new FormData(o);Ni(n,{pending:!0,data:e,method:o.method,action:a},null,e)}}else"function"===typeof a&&(l.preventDefault(),e=i?Nu(o,i):new FormData(o),Ni(n,{pending:!0,data:e,method:o.method,action:a},a,e))},currentTarget:o}]})}}(i,e,r,n,o)}zu(i,t)})}function Hu(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Vu(e,t){for(var n=t+"Capture",r=[];null!==e;){var o=e,a=o.stateNode;if(5!==(o=o.tag)&&26!==o&&27!==o||null===a||(null!=(o=Ft(e,n))&&r.unshift(Hu(e,o,a)),null!=(o=Ft(e,t))&&r.push(Hu(e,o,a))),3===e.tag)return r;e=e.return}return[]}function $u(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function qu(e,t,n,r,o){for(var a=t._reactName,i=[];null!==n&&n!==r;){var l=n,s=l.alternate,c=l.stateNode;if(l=l.tag,null!==s&&s===r)break;5!==l&&26!==l&&27!==l||null===c||(s=c,o?null!=(c=Ft(n,a))&&i.unshift(Hu(n,c,s)):o||null!=(c=Ft(n,a))&&i.push(Hu(n,c,s))),n=n.return}0!==i.length&&e.push({event:t,listeners:i})}var Ku=/\r\n?/g,Gu=/\u0000|\uFFFD/g;function Qu(e){return("string"===typeof e?e:""+e).replace(Ku,"\n").replace(Gu,"")}function Yu(e,t){return t=Qu(t),Qu(e)===t}function Xu(){}function Ju(e,t,n,r,o,a){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||St(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&St(e,""+r);break;case"className":nt(e,"class",r);break;case"tabIndex":nt(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":nt(e,n,r);break;case"style":Ct(e,r,a);break;case"data":if("object"!==t){nt(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Rt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof a&&("formAction"===n?("input"!==t&&Ju(e,t,"name",o.name,o,null),Ju(e,t,"formEncType",o.formEncType,o,null),Ju(e,t,"formMethod",o.formMethod,o,null),Ju(e,t,"formTarget",o.formTarget,o,null)):(Ju(e,t,"encType",o.encType,o,null),Ju(e,t,"method",o.method,o,null),Ju(e,t,"target",o.target,o,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Rt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Xu);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(i(61));if(null!=(n=r.__html)){if(null!=o.children)throw Error(i(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Rt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Fu("beforetoggle",e),Fu("toggle",e),tt(e,"popover",r);break;case"xlinkActuate":rt(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":rt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":rt(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":rt(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":rt(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":rt(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":rt(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":rt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":rt(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":tt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&tt(e,n=Pt.get(n)||n,r)}}function Zu(e,t,n,r,o,a){switch(n){case"style":Ct(e,r,a);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(i(61));if(null!=(n=r.__html)){if(null!=o.children)throw Error(i(60));e.innerHTML=n}}break;case"children":"string"===typeof r?St(e,r):("number"===typeof r||"bigint"===typeof r)&&St(e,""+r);break;case"onScroll":null!=r&&Fu("scroll",e);break;case"onScrollEnd":null!=r&&Fu("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Xu);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Ke.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(o=n.endsWith("Capture"),t=n.slice(2,o?n.length-7:void 0),"function"===typeof(a=null!=(a=e[_e]||null)?a[n]:null)&&e.removeEventListener(t,a,o),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):tt(e,n,r):("function"!==typeof a&&null!==a&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,o)))}}function ed(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Fu("error",e),Fu("load",e);var r,o=!1,a=!1;for(r in n)if(n.hasOwnProperty(r)){var l=n[r];if(null!=l)switch(r){case"src":o=!0;break;case"srcSet":a=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(i(137,t));default:Ju(e,t,r,l,n,null)}}return a&&Ju(e,t,"srcSet",n.srcSet,n,null),void(o&&Ju(e,t,"src",n.src,n,null));case"input":Fu("invalid",e);var s=r=l=a=null,c=null,u=null;for(o in n)if(n.hasOwnProperty(o)){var d=n[o];if(null!=d)switch(o){case"name":a=d;break;case"type":l=d;break;case"checked":c=d;break;case"defaultChecked":u=d;break;case"value":r=d;break;case"defaultValue":s=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(i(137,t));break;default:Ju(e,t,o,d,n,null)}}return yt(e,r,s,c,u,l,a,!1),void dt(e);case"select":for(a in Fu("invalid",e),o=l=r=null,n)if(n.hasOwnProperty(a)&&null!=(s=n[a]))switch(a){case"value":r=s;break;case"defaultValue":l=s;break;case"multiple":o=s;default:Ju(e,t,a,s,n,null)}return t=r,n=l,e.multiple=!!o,void(null!=t?bt(e,!!o,t,!1):null!=n&&bt(e,!!o,n,!0));case"textarea":for(l in Fu("invalid",e),r=a=o=null,n)if(n.hasOwnProperty(l)&&null!=(s=n[l]))switch(l){case"value":o=s;break;case"defaultValue":a=s;break;case"children":r=s;break;case"dangerouslySetInnerHTML":if(null!=s)throw Error(i(91));break;default:Ju(e,t,l,s,n,null)}return wt(e,o,a,r),void dt(e);case"option":for(c in n)if(n.hasOwnProperty(c)&&null!=(o=n[c]))if("selected"===c)e.selected=o&&"function"!==typeof o&&"symbol"!==typeof o;else Ju(e,t,c,o,n,null);return;case"dialog":Fu("beforetoggle",e),Fu("toggle",e),Fu("cancel",e),Fu("close",e);break;case"iframe":case"object":Fu("load",e);break;case"video":case"audio":for(o=0;o<Mu.length;o++)Fu(Mu[o],e);break;case"image":Fu("error",e),Fu("load",e);break;case"details":Fu("toggle",e);break;case"embed":case"source":case"link":Fu("error",e),Fu("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(u in n)if(n.hasOwnProperty(u)&&null!=(o=n[u]))switch(u){case"children":case"dangerouslySetInnerHTML":throw Error(i(137,t));default:Ju(e,t,u,o,n,null)}return;default:if(Et(t)){for(d in n)n.hasOwnProperty(d)&&(void 0!==(o=n[d])&&Zu(e,t,d,o,n,void 0));return}}for(s in n)n.hasOwnProperty(s)&&(null!=(o=n[s])&&Ju(e,t,s,o,n,null))}var td=null,nd=null;function rd(e){return 9===e.nodeType?e:e.ownerDocument}function od(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function ad(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function id(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ld=null;var sd="function"===typeof setTimeout?setTimeout:void 0,cd="function"===typeof clearTimeout?clearTimeout:void 0,ud="function"===typeof Promise?Promise:void 0,dd="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof ud?function(e){return ud.resolve(null).then(e).catch(fd)}:sd;function fd(e){setTimeout(function(){throw e})}function pd(e){return"head"===e}function hd(e,t){var n=t,r=0,o=0;do{var a=n.nextSibling;if(e.removeChild(n),a&&8===a.nodeType)if("/$"===(n=a.data)){if(0<r&&8>r){n=r;var i=e.ownerDocument;if(1&n&&wd(i.documentElement),2&n&&wd(i.body),4&n)for(wd(n=i.head),i=n.firstChild;i;){var l=i.nextSibling,s=i.nodeName;i[De]||"SCRIPT"===s||"STYLE"===s||"LINK"===s&&"stylesheet"===i.rel.toLowerCase()||n.removeChild(i),i=l}}if(0===o)return e.removeChild(a),void Tf(t);o--}else"$"===n||"$?"===n||"$!"===n?o++:r=n.charCodeAt(0)-48;else r=0;n=a}while(n);Tf(t)}function md(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":md(n),Be(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function gd(e){return"$!"===e.data||"$?"===e.data&&"complete"===e.ownerDocument.readyState}function yd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}var vd=null;function bd(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function Ad(e,t,n){switch(t=rd(n),e){case"html":if(!(e=t.documentElement))throw Error(i(452));return e;case"head":if(!(e=t.head))throw Error(i(453));return e;case"body":if(!(e=t.body))throw Error(i(454));return e;default:throw Error(i(451))}}function wd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Be(e)}var Sd=new Map,kd=new Set;function xd(e){return"function"===typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Cd=j.d;j.d={f:function(){var e=Cd.f(),t=Uc();return e||t},r:function(e){var t=We(e);null!==t&&5===t.tag&&"form"===t.type?_i(t):Cd.r(e)},D:function(e){Cd.D(e),Pd("dns-prefetch",e,null)},C:function(e,t){Cd.C(e,t),Pd("preconnect",e,t)},L:function(e,t,n){Cd.L(e,t,n);var r=Ed;if(r&&e&&t){var o='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(o+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(o+='[imagesizes="'+mt(n.imageSizes)+'"]')):o+='[href="'+mt(e)+'"]';var a=o;switch(t){case"style":a=Rd(e);break;case"script":a=Ld(e)}Sd.has(a)||(e=f({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),Sd.set(a,e),null!==r.querySelector(o)||"style"===t&&r.querySelector(Od(a))||"script"===t&&r.querySelector(_d(a))||(ed(t=r.createElement("link"),"link",e),$e(t),r.head.appendChild(t)))}},m:function(e,t){Cd.m(e,t);var n=Ed;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",o='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',a=o;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":a=Ld(e)}if(!Sd.has(a)&&(e=f({rel:"modulepreload",href:e},t),Sd.set(a,e),null===n.querySelector(o))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(_d(a)))return}ed(r=n.createElement("link"),"link",e),$e(r),n.head.appendChild(r)}}},X:function(e,t){Cd.X(e,t);var n=Ed;if(n&&e){var r=Ve(n).hoistableScripts,o=Ld(e),a=r.get(o);a||((a=n.querySelector(_d(o)))||(e=f({src:e,async:!0},t),(t=Sd.get(o))&&Fd(e,t),$e(a=n.createElement("script")),ed(a,"link",e),n.head.appendChild(a)),a={type:"script",instance:a,count:1,state:null},r.set(o,a))}},S:function(e,t,n){Cd.S(e,t,n);var r=Ed;if(r&&e){var o=Ve(r).hoistableStyles,a=Rd(e);t=t||"default";var i=o.get(a);if(!i){var l={loading:0,preload:null};if(i=r.querySelector(Od(a)))l.loading=5;else{e=f({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Sd.get(a))&&zd(e,n);var s=i=r.createElement("link");$e(s),ed(s,"link",e),s._p=new Promise(function(e,t){s.onload=e,s.onerror=t}),s.addEventListener("load",function(){l.loading|=1}),s.addEventListener("error",function(){l.loading|=2}),l.loading|=4,jd(i,t,r)}i={type:"stylesheet",instance:i,count:1,state:l},o.set(a,i)}}},M:function(e,t){Cd.M(e,t);var n=Ed;if(n&&e){var r=Ve(n).hoistableScripts,o=Ld(e),a=r.get(o);a||((a=n.querySelector(_d(o)))||(e=f({src:e,async:!0,type:"module"},t),(t=Sd.get(o))&&Fd(e,t),$e(a=n.createElement("script")),ed(a,"link",e),n.head.appendChild(a)),a={type:"script",instance:a,count:1,state:null},r.set(o,a))}}};var Ed="undefined"===typeof document?null:document;function Pd(e,t,n){var r=Ed;if(r&&"string"===typeof t&&t){var o=mt(t);o='link[rel="'+e+'"][href="'+o+'"]',"string"===typeof n&&(o+='[crossorigin="'+n+'"]'),kd.has(o)||(kd.add(o),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(o)&&(ed(t=r.createElement("link"),"link",e),$e(t),r.head.appendChild(t)))}}function Td(e,t,n,r){var o,a,l,s,c=(c=V.current)?xd(c):null;if(!c)throw Error(i(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=Rd(n.href),(r=(n=Ve(c).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=Rd(n.href);var u=Ve(c).hoistableStyles,d=u.get(e);if(d||(c=c.ownerDocument||c,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(e,d),(u=c.querySelector(Od(e)))&&!u._p&&(d.instance=u,d.state.loading=5),Sd.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Sd.set(e,n),u||(o=c,a=e,l=n,s=d.state,o.querySelector('link[rel="preload"][as="style"]['+a+"]")?s.loading=1:(a=o.createElement("link"),s.preload=a,a.addEventListener("load",function(){return s.loading|=1}),a.addEventListener("error",function(){return s.loading|=2}),ed(a,"link",l),$e(a),o.head.appendChild(a))))),t&&null===r)throw Error(i(528,""));return d}if(t&&null!==r)throw Error(i(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Ld(n),(r=(n=Ve(c).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(i(444,e))}}function Rd(e){return'href="'+mt(e)+'"'}function Od(e){return'link[rel="stylesheet"]['+e+"]"}function Nd(e){return f({},e,{"data-precedence":e.precedence,precedence:null})}function Ld(e){return'[src="'+mt(e)+'"]'}function _d(e){return"script[async]"+e}function Md(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,$e(r),r;var o=f({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return $e(r=(e.ownerDocument||e).createElement("style")),ed(r,"style",o),jd(r,n.precedence,e),t.instance=r;case"stylesheet":o=Rd(n.href);var a=e.querySelector(Od(o));if(a)return t.state.loading|=4,t.instance=a,$e(a),a;r=Nd(n),(o=Sd.get(o))&&zd(r,o),$e(a=(e.ownerDocument||e).createElement("link"));var l=a;return l._p=new Promise(function(e,t){l.onload=e,l.onerror=t}),ed(a,"link",r),t.state.loading|=4,jd(a,n.precedence,e),t.instance=a;case"script":return a=Ld(n.src),(o=e.querySelector(_d(a)))?(t.instance=o,$e(o),o):(r=n,(o=Sd.get(a))&&Fd(r=f({},n),o),$e(o=(e=e.ownerDocument||e).createElement("script")),ed(o,"link",r),e.head.appendChild(o),t.instance=o);case"void":return null;default:throw Error(i(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,jd(r,n.precedence,e));return t.instance}function jd(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),o=r.length?r[r.length-1]:null,a=o,i=0;i<r.length;i++){var l=r[i];if(l.dataset.precedence===t)a=l;else if(a!==o)break}a?a.parentNode.insertBefore(e,a.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function zd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Fd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Id=null;function Dd(e,t,n){if(null===Id){var r=new Map,o=Id=new Map;o.set(n,r)}else(r=(o=Id).get(n))||(r=new Map,o.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),o=0;o<n.length;o++){var a=n[o];if(!(a[De]||a[Le]||"link"===e&&"stylesheet"===a.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==a.namespaceURI){var i=a.getAttribute(t)||"";i=e+i;var l=r.get(i);l?l.push(a):r.set(i,[a])}}return r}function Bd(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Ud(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Wd=null;function Hd(){}function Vd(){if(this.count--,0===this.count)if(this.stylesheets)qd(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var $d=null;function qd(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,$d=new Map,t.forEach(Kd,e),$d=null,Vd.call(e))}function Kd(e,t){if(!(4&t.state.loading)){var n=$d.get(e);if(n)var r=n.get(null);else{n=new Map,$d.set(e,n);for(var o=e.querySelectorAll("link[data-precedence],style[data-precedence]"),a=0;a<o.length;a++){var i=o[a];"LINK"!==i.nodeName&&"not all"===i.getAttribute("media")||(n.set(i.dataset.precedence,i),r=i)}r&&n.set(null,r)}i=(o=t.instance).getAttribute("data-precedence"),(a=n.get(i)||r)===r&&n.set(null,o),n.set(i,o),this.count++,r=Vd.bind(this),o.addEventListener("load",r),o.addEventListener("error",r),a?a.parentNode.insertBefore(o,a.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(o,e.firstChild),t.state.loading|=4}}var Gd={$$typeof:w,Provider:null,Consumer:null,_currentValue:z,_currentValue2:z,_threadCount:0};function Qd(e,t,n,r,o,a,i,l){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=xe(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=xe(0),this.hiddenUpdates=xe(null),this.identifierPrefix=r,this.onUncaughtError=o,this.onCaughtError=a,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=l,this.incompleteTransitions=new Map}function Yd(e,t,n,r,o,a,i,l,s,c,u,d){return e=new Qd(e,t,n,i,l,s,c,d),t=1,!0===a&&(t|=24),a=zr(3,null,null,t),e.current=a,a.stateNode=e,(t=Mo()).refCount++,e.pooledCache=t,t.refCount++,a.memoizedState={element:r,isDehydrated:n,cache:t},ra(a),e}function Xd(e){return e?e=Mr:Mr}function Jd(e,t,n,r,o,a){o=Xd(o),null===r.context?r.context=o:r.pendingContext=o,(r=aa(t)).payload={element:n},null!==(a=void 0===a?null:a)&&(r.callback=a),null!==(n=ia(e,r,t))&&(zc(n,0,t),la(n,e,t))}function Zd(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function ef(e,t){Zd(e,t),(e=e.alternate)&&Zd(e,t)}function tf(e){if(13===e.tag){var t=Nr(e,67108864);null!==t&&zc(t,0,67108864),ef(e,67108864)}}var nf=!0;function rf(e,t,n,r){var o=M.T;M.T=null;var a=j.p;try{j.p=2,af(e,t,n,r)}finally{j.p=a,M.T=o}}function of(e,t,n,r){var o=M.T;M.T=null;var a=j.p;try{j.p=8,af(e,t,n,r)}finally{j.p=a,M.T=o}}function af(e,t,n,r){if(nf){var o=lf(r);if(null===o)Wu(e,t,r,sf,n),bf(e,r);else if(function(e,t,n,r,o){switch(t){case"focusin":return ff=Af(ff,e,t,n,r,o),!0;case"dragenter":return pf=Af(pf,e,t,n,r,o),!0;case"mouseover":return hf=Af(hf,e,t,n,r,o),!0;case"pointerover":var a=o.pointerId;return mf.set(a,Af(mf.get(a)||null,e,t,n,r,o)),!0;case"gotpointercapture":return a=o.pointerId,gf.set(a,Af(gf.get(a)||null,e,t,n,r,o)),!0}return!1}(o,e,t,n,r))r.stopPropagation();else if(bf(e,r),4&t&&-1<vf.indexOf(e)){for(;null!==o;){var a=We(o);if(null!==a)switch(a.tag){case 3:if((a=a.stateNode).current.memoizedState.isDehydrated){var i=ve(a.pendingLanes);if(0!==i){var l=a;for(l.pendingLanes|=2,l.entangledLanes|=2;i;){var s=1<<31-pe(i);l.entanglements[1]|=s,i&=~s}Su(a),0===(6&nc)&&(Sc=te()+500,ku(0,!1))}}break;case 13:null!==(l=Nr(a,2))&&zc(l,0,2),Uc(),ef(a,2)}if(null===(a=lf(r))&&Wu(e,t,r,sf,n),a===o)break;o=a}null!==o&&r.stopPropagation()}else Wu(e,t,r,null,n)}}function lf(e){return cf(e=Nt(e))}var sf=null;function cf(e){if(sf=null,null!==(e=Ue(e))){var t=s(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=c(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return sf=e,null}function uf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ne()){case re:return 2;case oe:return 8;case ae:case ie:return 32;case le:return 268435456;default:return 32}default:return 32}}var df=!1,ff=null,pf=null,hf=null,mf=new Map,gf=new Map,yf=[],vf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function bf(e,t){switch(e){case"focusin":case"focusout":ff=null;break;case"dragenter":case"dragleave":pf=null;break;case"mouseover":case"mouseout":hf=null;break;case"pointerover":case"pointerout":mf.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":gf.delete(t.pointerId)}}function Af(e,t,n,r,o,a){return null===e||e.nativeEvent!==a?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:a,targetContainers:[o]},null!==t&&(null!==(t=We(t))&&tf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==o&&-1===t.indexOf(o)&&t.push(o),e)}function wf(e){var t=Ue(e.target);if(null!==t){var n=s(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=c(n)))return e.blockedOn=t,void function(e,t){var n=j.p;try{return j.p=e,t()}finally{j.p=n}}(e.priority,function(){if(13===n.tag){var e=Mc();e=Te(e);var t=Nr(n,e);null!==t&&zc(t,0,e),ef(n,e)}})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Sf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=lf(e.nativeEvent);if(null!==n)return null!==(t=We(n))&&tf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Ot=r,n.target.dispatchEvent(r),Ot=null,t.shift()}return!0}function kf(e,t,n){Sf(e)&&n.delete(t)}function xf(){df=!1,null!==ff&&Sf(ff)&&(ff=null),null!==pf&&Sf(pf)&&(pf=null),null!==hf&&Sf(hf)&&(hf=null),mf.forEach(kf),gf.forEach(kf)}function Cf(e,t){e.blockedOn===t&&(e.blockedOn=null,df||(df=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,xf)))}var Ef=null;function Pf(e){Ef!==e&&(Ef=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,function(){Ef===e&&(Ef=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],o=e[t+2];if("function"!==typeof r){if(null===cf(r||n))continue;break}var a=We(n);null!==a&&(e.splice(t,3),t-=3,Ni(a,{pending:!0,data:o,method:n.method,action:r},r,o))}}))}function Tf(e){function t(t){return Cf(t,e)}null!==ff&&Cf(ff,e),null!==pf&&Cf(pf,e),null!==hf&&Cf(hf,e),mf.forEach(t),gf.forEach(t);for(var n=0;n<yf.length;n++){var r=yf[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<yf.length&&null===(n=yf[0]).blockedOn;)wf(n),null===n.blockedOn&&yf.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var o=n[r],a=n[r+1],i=o[_e]||null;if("function"===typeof a)i||Pf(n);else if(i){var l=null;if(a&&a.hasAttribute("formAction")){if(o=a,i=a[_e]||null)l=i.formAction;else if(null!==cf(o))continue}else l=i.action;"function"===typeof l?n[r+1]=l:(n.splice(r,3),r-=3),Pf(n)}}}function Rf(e){this._internalRoot=e}function Of(e){this._internalRoot=e}Of.prototype.render=Rf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(i(409));Jd(t.current,Mc(),e,t,null,null)},Of.prototype.unmount=Rf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;Jd(e.current,2,null,e,null,null),Uc(),t[Me]=null}},Of.prototype.unstable_scheduleHydration=function(e){if(e){var t=Oe();e={blockedOn:null,target:e,priority:t};for(var n=0;n<yf.length&&0!==t&&t<yf[n].priority;n++);yf.splice(n,0,e),0===n&&wf(e)}};var Nf=o.version;if("19.1.1"!==Nf)throw Error(i(527,Nf,"19.1.1"));j.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(i(188));throw e=Object.keys(e).join(","),Error(i(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=s(e)))throw Error(i(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var a=o.alternate;if(null===a){if(null!==(r=o.return)){n=r;continue}break}if(o.child===a.child){for(a=o.child;a;){if(a===n)return u(o),e;if(a===r)return u(o),t;a=a.sibling}throw Error(i(188))}if(n.return!==r.return)n=o,r=a;else{for(var l=!1,c=o.child;c;){if(c===n){l=!0,n=o,r=a;break}if(c===r){l=!0,r=o,n=a;break}c=c.sibling}if(!l){for(c=a.child;c;){if(c===n){l=!0,n=a,r=o;break}if(c===r){l=!0,r=a,n=o;break}c=c.sibling}if(!l)throw Error(i(189))}}if(n.alternate!==r)throw Error(i(190))}if(3!==n.tag)throw Error(i(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?d(e):null)?null:e.stateNode};var Lf={bundleType:0,version:"19.1.1",rendererPackageName:"react-dom",currentDispatcherRef:M,reconcilerVersion:"19.1.1"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var _f=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!_f.isDisabled&&_f.supportsFiber)try{ue=_f.inject(Lf),de=_f}catch(jf){}}t.createRoot=function(e,t){if(!l(e))throw Error(i(299));var n=!1,r="",o=vl,a=bl,s=Al;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(o=t.onUncaughtError),void 0!==t.onCaughtError&&(a=t.onCaughtError),void 0!==t.onRecoverableError&&(s=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Yd(e,1,!1,null,0,n,r,o,a,s,0,null),e[Me]=t.current,Bu(e),new Rf(t)},t.hydrateRoot=function(e,t,n){if(!l(e))throw Error(i(299));var r=!1,o="",a=vl,s=bl,c=Al,u=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(o=n.identifierPrefix),void 0!==n.onUncaughtError&&(a=n.onUncaughtError),void 0!==n.onCaughtError&&(s=n.onCaughtError),void 0!==n.onRecoverableError&&(c=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(u=n.formState)),(t=Yd(e,1,!0,t,0,r,o,a,s,c,0,u)).context=Xd(null),n=t.current,(o=aa(r=Te(r=Mc()))).callback=null,ia(n,o,r),n=r,t.current.lanes=n,Ce(t,n),Su(t),e[Me]=t.current,Bu(e),new Of(t)},t.version="19.1.1"},7194:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(3635).A},7242:(e,t,n)=>{n.d(t,{A:()=>i});var r=n(45),o=n(9125);const a=["variants"];function i(e){const{variants:t}=e,n=(0,r.A)(e,a),i={variants:t,style:(0,o.tT)(n),isProcessed:!0};return i.style===n||t&&t.forEach(e=>{"function"!==typeof e.style&&(e.style=(0,o.tT)(e.style))}),i}},7307:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(5043);const o={};function a(e,t){const n=r.useRef(o);return n.current===o&&(n.current=e(t)),n}},7333:(e,t,n)=>{n.d(t,{A:()=>r});const r=(0,n(7990).A)()},7449:(e,t,n)=>{function r(e){return e&&e.ownerDocument||document}n.d(t,{A:()=>r})},7528:(e,t,n)=>{function r(e,t){return t||(t=e.slice(0)),Object.freeze(Object.defineProperties(e,{raw:{value:Object.freeze(t)}}))}n.d(t,{A:()=>r})},7566:(e,t,n)=>{function r(e){let{props:t,states:n,muiFormControl:r}=e;return n.reduce((e,n)=>(e[n]=t[n],r&&"undefined"===typeof t[n]&&(e[n]=r[n]),e),{})}n.d(t,{A:()=>r})},7675:(e,t,n)=>{n.d(t,{Ay:()=>v});var r=n(9379),o=n(45),a=n(9125),i=n(3129),l=n(9049),s=n(8623),c=n(7242);const u=["variants"],d=["name","slot","skipVariantsResolver","skipSx","overridesResolver"],f=(0,l.A)();function p(e){return"ownerState"!==e&&"theme"!==e&&"sx"!==e&&"as"!==e}function h(e,t){return t&&e&&"object"===typeof e&&e.styles&&!e.styles.startsWith("@layer")&&(e.styles="@layer ".concat(t,"{").concat(String(e.styles),"}")),e}function m(e){return e?(t,n)=>n[e]:null}function g(e,t,n){const r="function"===typeof t?t(e):t;if(Array.isArray(r))return r.flatMap(t=>g(e,t,n));if(Array.isArray(null===r||void 0===r?void 0:r.variants)){let t;if(r.isProcessed)t=n?h(r.style,n):r.style;else{const{variants:e}=r,i=(0,o.A)(r,u);t=n?h((0,a.tT)(i),n):i}return y(e,r.variants,[t],n)}return null!==r&&void 0!==r&&r.isProcessed?n?h((0,a.tT)(r.style),n):r.style:n?h((0,a.tT)(r),n):r}function y(e,t){let n,o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:void 0;e:for(let s=0;s<t.length;s+=1){const c=t[s];if("function"===typeof c.props){if(null!==n&&void 0!==n||(n=(0,r.A)((0,r.A)((0,r.A)({},e),e.ownerState),{},{ownerState:e.ownerState})),!c.props(n))continue}else for(const t in c.props){var l;if(e[t]!==c.props[t]&&(null===(l=e.ownerState)||void 0===l?void 0:l[t])!==c.props[t])continue e}"function"===typeof c.style?(null!==n&&void 0!==n||(n=(0,r.A)((0,r.A)((0,r.A)({},e),e.ownerState),{},{ownerState:e.ownerState})),o.push(i?h((0,a.tT)(c.style(n)),i):c.style(n))):o.push(i?h((0,a.tT)(c.style),i):c.style)}return o}function v(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{themeId:t,defaultTheme:n=f,rootShouldForwardProp:l=p,slotShouldForwardProp:u=p}=e;function v(e){!function(e,t,n){e.theme=function(e){for(const t in e)return!1;return!0}(e.theme)?n:e.theme[t]||e.theme}(e,t,n)}return function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};(0,a.HX)(e,e=>e.filter(e=>e!==s.A));const{name:n,slot:f,skipVariantsResolver:w,skipSx:S,overridesResolver:k=m(A(f))}=t,x=(0,o.A)(t,d),C=n&&n.startsWith("Mui")||f?"components":"custom",E=void 0!==w?w:f&&"Root"!==f&&"root"!==f||!1,P=S||!1;let T=p;"Root"===f||"root"===f?T=l:f?T=u:function(e){return"string"===typeof e&&e.charCodeAt(0)>96}(e)&&(T=void 0);const R=(0,a.Ay)(e,(0,r.A)({shouldForwardProp:T,label:b(n,f)},x)),O=e=>{if(e.__emotion_real===e)return e;if("function"===typeof e)return function(t){return g(t,e,t.theme.modularCssLayers?C:void 0)};if((0,i.Q)(e)){const t=(0,c.A)(e);return function(e){return t.variants?g(e,t,e.theme.modularCssLayers?C:void 0):e.theme.modularCssLayers?h(t.style,C):t.style}}return e},N=function(){const t=[];for(var r=arguments.length,o=new Array(r),a=0;a<r;a++)o[a]=arguments[a];const i=o.map(O),l=[];if(t.push(v),n&&k&&l.push(function(e){var t;const r=null===(t=e.theme.components)||void 0===t||null===(t=t[n])||void 0===t?void 0:t.styleOverrides;if(!r)return null;const o={};for(const n in r)o[n]=g(e,r[n],e.theme.modularCssLayers?"theme":void 0);return k(e,o)}),n&&!E&&l.push(function(e){var t;const r=e.theme,o=null===r||void 0===r||null===(t=r.components)||void 0===t||null===(t=t[n])||void 0===t?void 0:t.variants;return o?y(e,o,[],e.theme.modularCssLayers?"theme":void 0):null}),P||l.push(s.A),Array.isArray(i[0])){const e=i.shift(),n=new Array(t.length).fill(""),r=new Array(l.length).fill("");let o;o=[...n,...e,...r],o.raw=[...n,...e.raw,...r],t.unshift(o)}const c=[...t,...i,...l],u=R(...c);return e.muiName&&(u.muiName=e.muiName),u};return R.withConfig&&(N.withConfig=R.withConfig),N}}function b(e,t){}function A(e){return e?e.charAt(0).toLowerCase()+e.slice(1):e}},7950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(6672)},7990:(e,t,n)=>{n.d(t,{A:()=>ge});var r=n(45),o=n(9379),a=n(2065),i=n(3129),l=n(9826);const s={black:"#000",white:"#fff"},c={50:"#fafafa",100:"#f5f5f5",200:"#eeeeee",300:"#e0e0e0",400:"#bdbdbd",500:"#9e9e9e",600:"#757575",700:"#616161",800:"#424242",900:"#212121",A100:"#f5f5f5",A200:"#eeeeee",A400:"#bdbdbd",A700:"#616161"},u={50:"#f3e5f5",100:"#e1bee7",200:"#ce93d8",300:"#ba68c8",400:"#ab47bc",500:"#9c27b0",600:"#8e24aa",700:"#7b1fa2",800:"#6a1b9a",900:"#4a148c",A100:"#ea80fc",A200:"#e040fb",A400:"#d500f9",A700:"#aa00ff"},d={50:"#ffebee",100:"#ffcdd2",200:"#ef9a9a",300:"#e57373",400:"#ef5350",500:"#f44336",600:"#e53935",700:"#d32f2f",800:"#c62828",900:"#b71c1c",A100:"#ff8a80",A200:"#ff5252",A400:"#ff1744",A700:"#d50000"},f={50:"#fff3e0",100:"#ffe0b2",200:"#ffcc80",300:"#ffb74d",400:"#ffa726",500:"#ff9800",600:"#fb8c00",700:"#f57c00",800:"#ef6c00",900:"#e65100",A100:"#ffd180",A200:"#ffab40",A400:"#ff9100",A700:"#ff6d00"},p={50:"#e3f2fd",100:"#bbdefb",200:"#90caf9",300:"#64b5f6",400:"#42a5f5",500:"#2196f3",600:"#1e88e5",700:"#1976d2",800:"#1565c0",900:"#0d47a1",A100:"#82b1ff",A200:"#448aff",A400:"#2979ff",A700:"#2962ff"},h={50:"#e1f5fe",100:"#b3e5fc",200:"#81d4fa",300:"#4fc3f7",400:"#29b6f6",500:"#03a9f4",600:"#039be5",700:"#0288d1",800:"#0277bd",900:"#01579b",A100:"#80d8ff",A200:"#40c4ff",A400:"#00b0ff",A700:"#0091ea"},m={50:"#e8f5e9",100:"#c8e6c9",200:"#a5d6a7",300:"#81c784",400:"#66bb6a",500:"#4caf50",600:"#43a047",700:"#388e3c",800:"#2e7d32",900:"#1b5e20",A100:"#b9f6ca",A200:"#69f0ae",A400:"#00e676",A700:"#00c853"},g=["mode","contrastThreshold","tonalOffset","colorSpace"];function y(){return{text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.6)",disabled:"rgba(0, 0, 0, 0.38)"},divider:"rgba(0, 0, 0, 0.12)",background:{paper:s.white,default:s.white},action:{active:"rgba(0, 0, 0, 0.54)",hover:"rgba(0, 0, 0, 0.04)",hoverOpacity:.04,selected:"rgba(0, 0, 0, 0.08)",selectedOpacity:.08,disabled:"rgba(0, 0, 0, 0.26)",disabledBackground:"rgba(0, 0, 0, 0.12)",disabledOpacity:.38,focus:"rgba(0, 0, 0, 0.12)",focusOpacity:.12,activatedOpacity:.12}}}const v=y();function b(){return{text:{primary:s.white,secondary:"rgba(255, 255, 255, 0.7)",disabled:"rgba(255, 255, 255, 0.5)",icon:"rgba(255, 255, 255, 0.5)"},divider:"rgba(255, 255, 255, 0.12)",background:{paper:"#121212",default:"#121212"},action:{active:s.white,hover:"rgba(255, 255, 255, 0.08)",hoverOpacity:.08,selected:"rgba(255, 255, 255, 0.16)",selectedOpacity:.16,disabled:"rgba(255, 255, 255, 0.3)",disabledBackground:"rgba(255, 255, 255, 0.12)",disabledOpacity:.38,focus:"rgba(255, 255, 255, 0.12)",focusOpacity:.12,activatedOpacity:.24}}}const A=b();function w(e,t,n,r){const o=r.light||r,a=r.dark||1.5*r;e[t]||(e.hasOwnProperty(n)?e[t]=e[n]:"light"===t?e.light=(0,l.a)(e.main,o):"dark"===t&&(e.dark=(0,l.e$)(e.main,a)))}function S(e,t,n,r,o){const a=o.light||o,i=o.dark||1.5*o;t[n]||(t.hasOwnProperty(r)?t[n]=t[r]:"light"===n?t.light="color-mix(in ".concat(e,", ").concat(t.main,", #fff ").concat((100*a).toFixed(0),"%)"):"dark"===n&&(t.dark="color-mix(in ".concat(e,", ").concat(t.main,", #000 ").concat((100*i).toFixed(0),"%)")))}function k(e){const{mode:t="light",contrastThreshold:n=3,tonalOffset:k=.2,colorSpace:x}=e,C=(0,r.A)(e,g),E=e.primary||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:p[200],light:p[50],dark:p[400]}:{main:p[700],light:p[400],dark:p[800]}}(t),P=e.secondary||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:u[200],light:u[50],dark:u[400]}:{main:u[500],light:u[300],dark:u[700]}}(t),T=e.error||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:d[500],light:d[300],dark:d[700]}:{main:d[700],light:d[400],dark:d[800]}}(t),R=e.info||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:h[400],light:h[300],dark:h[700]}:{main:h[700],light:h[500],dark:h[900]}}(t),O=e.success||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:m[400],light:m[300],dark:m[700]}:{main:m[800],light:m[500],dark:m[900]}}(t),N=e.warning||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:f[400],light:f[300],dark:f[700]}:{main:"#ed6c02",light:f[500],dark:f[900]}}(t);function L(e){if(x)return function(e){return"oklch(from ".concat(e," var(--__l) 0 h / var(--__a))")}(e);return(0,l.eM)(e,A.text.primary)>=n?A.text.primary:v.text.primary}const _=e=>{let{color:t,name:n,mainShade:r=500,lightShade:i=300,darkShade:l=700}=e;if(t=(0,o.A)({},t),!t.main&&t[r]&&(t.main=t[r]),!t.hasOwnProperty("main"))throw new Error((0,a.A)(11,n?" (".concat(n,")"):"",r));if("string"!==typeof t.main)throw new Error((0,a.A)(12,n?" (".concat(n,")"):"",JSON.stringify(t.main)));return x?(S(x,t,"light",i,k),S(x,t,"dark",l,k)):(w(t,"light",i,k),w(t,"dark",l,k)),t.contrastText||(t.contrastText=L(t.main)),t};let M;"light"===t?M=y():"dark"===t&&(M=b());return(0,i.A)((0,o.A)({common:(0,o.A)({},s),mode:t,primary:_({color:E,name:"primary"}),secondary:_({color:P,name:"secondary",mainShade:"A400",lightShade:"A200",darkShade:"A700"}),error:_({color:T,name:"error"}),warning:_({color:N,name:"warning"}),info:_({color:R,name:"info"}),success:_({color:O,name:"success"}),grey:c,contrastThreshold:n,getContrastText:L,augmentColor:_,tonalOffset:k},M),C)}var x=n(9526);function C(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"";function t(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];if(!r.length)return"";const a=r[0];return"string"!==typeof a||a.match(/(#|\(|\)|(-?(\d*\.)?\d+)(px|em|%|ex|ch|rem|vw|vh|vmin|vmax|cm|mm|in|pt|pc))|^(-?(\d*\.)?\d+)$|(\d+ \d+ \d+)/)?", ".concat(a):", var(--".concat(e?"".concat(e,"-"):"").concat(a).concat(t(...r.slice(1)),")")}return function(n){for(var r=arguments.length,o=new Array(r>1?r-1:0),a=1;a<r;a++)o[a-1]=arguments[a];return"var(--".concat(e?"".concat(e,"-"):"").concat(n).concat(t(...o),")")}}var E=n(9927),P=n(1834);function T(e){const t={};return Object.entries(e).forEach(e=>{const[n,r]=e;"object"===typeof r&&(t[n]="".concat(r.fontStyle?"".concat(r.fontStyle," "):"").concat(r.fontVariant?"".concat(r.fontVariant," "):"").concat(r.fontWeight?"".concat(r.fontWeight," "):"").concat(r.fontStretch?"".concat(r.fontStretch," "):"").concat(r.fontSize||"").concat(r.lineHeight?"/".concat(r.lineHeight," "):"").concat(r.fontFamily||""))}),t}const R=function(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:[],o=e;t.forEach((e,a)=>{a===t.length-1?Array.isArray(o)?o[Number(e)]=n:o&&"object"===typeof o&&(o[e]=n):o&&"object"===typeof o&&(o[e]||(o[e]=r.includes(e)?[]:{}),o=o[e])})};function O(e,t){const{prefix:n,shouldSkipGeneratingVar:r}=t||{},o={},a={},i={};var l,s;return l=(e,t,l)=>{if(("string"===typeof t||"number"===typeof t)&&(!r||!r(e,t))){const r="--".concat(n?"".concat(n,"-"):"").concat(e.join("-")),s=((e,t)=>"number"===typeof t?["lineHeight","fontWeight","opacity","zIndex"].some(t=>e.includes(t))||e[e.length-1].toLowerCase().includes("opacity")?t:"".concat(t,"px"):t)(e,t);Object.assign(o,{[r]:s}),R(a,e,"var(".concat(r,")"),l),R(i,e,"var(".concat(r,", ").concat(s,")"),l)}},s=e=>"vars"===e[0],function e(t){let n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[];Object.entries(t).forEach(t=>{let[o,a]=t;(!s||s&&!s([...n,o]))&&void 0!==a&&null!==a&&("object"===typeof a&&Object.keys(a).length>0?e(a,[...n,o],Array.isArray(a)?[...r,o]:r):l([...n,o],a,r))})}(e),{css:o,vars:a,varsWithDefaults:i}}const N=["colorSchemes","components","defaultColorScheme"];const L=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{getSelector:n=A,disableCssColorScheme:a,colorSchemeSelector:l,enableContrastVars:s}=t,{colorSchemes:c={},components:u,defaultColorScheme:d="light"}=e,f=(0,r.A)(e,N),{vars:p,css:h,varsWithDefaults:m}=O(f,t);let g=m;const y={},{[d]:v}=c,b=(0,r.A)(c,[d].map(x.A));if(Object.entries(b||{}).forEach(e=>{let[n,r]=e;const{vars:o,css:a,varsWithDefaults:l}=O(r,t);g=(0,i.A)(g,l),y[n]={css:a,vars:o}}),v){const{css:e,vars:n,varsWithDefaults:r}=O(v,t);g=(0,i.A)(g,r),y[d]={css:e,vars:n}}function A(t,n){let r=l;if("class"===l&&(r=".%s"),"data"===l&&(r="[data-%s]"),null!==l&&void 0!==l&&l.startsWith("data-")&&!l.includes("%s")&&(r="[".concat(l,'="%s"]')),t){if("media"===r){var o;if(e.defaultColorScheme===t)return":root";const r=(null===(o=c[t])||void 0===o||null===(o=o.palette)||void 0===o?void 0:o.mode)||t;return{["@media (prefers-color-scheme: ".concat(r,")")]:{":root":n}}}if(r)return e.defaultColorScheme===t?":root, ".concat(r.replace("%s",String(t))):r.replace("%s",String(t))}return":root"}return{vars:g,generateThemeVars:()=>{let e=(0,o.A)({},p);return Object.entries(y).forEach(t=>{let[,{vars:n}]=t;e=(0,i.A)(e,n)}),e},generateStyleSheets:()=>{const t=[],i=e.defaultColorScheme||"light";function l(e,n){Object.keys(n).length&&t.push("string"===typeof e?{[e]:(0,o.A)({},n)}:e)}l(n(void 0,(0,o.A)({},h)),h);const{[i]:u}=y,d=(0,r.A)(y,[i].map(x.A));if(u){var f;const{css:e}=u,t=null===(f=c[i])||void 0===f||null===(f=f.palette)||void 0===f?void 0:f.mode,r=!a&&t?(0,o.A)({colorScheme:t},e):(0,o.A)({},e);l(n(i,(0,o.A)({},r)),r)}return Object.entries(d).forEach(e=>{var t;let[r,{css:i}]=e;const s=null===(t=c[r])||void 0===t||null===(t=t.palette)||void 0===t?void 0:t.mode,u=!a&&s?(0,o.A)({colorScheme:s},i):(0,o.A)({},i);l(n(r,(0,o.A)({},u)),u)}),s&&t.push({":root":{"--__l-threshold":"0.7","--__l":"clamp(0, (l / var(--__l-threshold) - 1) * -infinity, 1)","--__a":"clamp(0.87, (l / var(--__l-threshold) - 1) * -infinity, 1)"}}),t}}};var _=n(4440),M=n(8623),j=n(9049);var z=n(6530);function F(){return["".concat(arguments.length<=0?void 0:arguments[0],"px ").concat(arguments.length<=1?void 0:arguments[1],"px ").concat(arguments.length<=2?void 0:arguments[2],"px ").concat(arguments.length<=3?void 0:arguments[3],"px rgba(0,0,0,").concat(.2,")"),"".concat(arguments.length<=4?void 0:arguments[4],"px ").concat(arguments.length<=5?void 0:arguments[5],"px ").concat(arguments.length<=6?void 0:arguments[6],"px ").concat(arguments.length<=7?void 0:arguments[7],"px rgba(0,0,0,").concat(.14,")"),"".concat(arguments.length<=8?void 0:arguments[8],"px ").concat(arguments.length<=9?void 0:arguments[9],"px ").concat(arguments.length<=10?void 0:arguments[10],"px ").concat(arguments.length<=11?void 0:arguments[11],"px rgba(0,0,0,").concat(.12,")")].join(",")}const I=["none",F(0,2,1,-1,0,1,1,0,0,1,3,0),F(0,3,1,-2,0,2,2,0,0,1,5,0),F(0,3,3,-2,0,3,4,0,0,1,8,0),F(0,2,4,-1,0,4,5,0,0,1,10,0),F(0,3,5,-1,0,5,8,0,0,1,14,0),F(0,3,5,-1,0,6,10,0,0,1,18,0),F(0,4,5,-2,0,7,10,1,0,2,16,1),F(0,5,5,-3,0,8,10,1,0,3,14,2),F(0,5,6,-3,0,9,12,1,0,3,16,2),F(0,6,6,-3,0,10,14,1,0,4,18,3),F(0,6,7,-4,0,11,15,1,0,4,20,3),F(0,7,8,-4,0,12,17,2,0,5,22,4),F(0,7,8,-4,0,13,19,2,0,5,24,4),F(0,7,9,-4,0,14,21,2,0,5,26,4),F(0,8,9,-5,0,15,22,2,0,6,28,5),F(0,8,10,-5,0,16,24,2,0,6,30,5),F(0,8,11,-5,0,17,26,2,0,6,32,5),F(0,9,11,-5,0,18,28,2,0,7,34,6),F(0,9,12,-6,0,19,29,2,0,7,36,6),F(0,10,13,-6,0,20,31,3,0,8,38,7),F(0,10,13,-6,0,21,33,3,0,8,40,7),F(0,10,14,-6,0,22,35,3,0,8,42,7),F(0,11,14,-7,0,23,36,3,0,9,44,8),F(0,11,15,-7,0,24,38,3,0,9,46,8)],D=["duration","easing","delay"],B={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},U={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function W(e){return"".concat(Math.round(e),"ms")}function H(e){if(!e)return 0;const t=e/36;return Math.min(Math.round(10*(4+15*t**.25+t/5)),3e3)}function V(e){const t=(0,o.A)((0,o.A)({},B),e.easing),n=(0,o.A)((0,o.A)({},U),e.duration);return(0,o.A)((0,o.A)({getAutoHeightDuration:H,create:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:["all"],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{duration:a=n.standard,easing:i=t.easeInOut,delay:l=0}=o;(0,r.A)(o,D);return(Array.isArray(e)?e:[e]).map(e=>"".concat(e," ").concat("string"===typeof a?a:W(a)," ").concat(i," ").concat("string"===typeof l?l:W(l))).join(",")}},e),{},{easing:t,duration:n})}const $={mobileStepper:1e3,fab:1050,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500};function q(e){return(0,i.Q)(e)||"undefined"===typeof e||"string"===typeof e||"boolean"===typeof e||"number"===typeof e||Array.isArray(e)}function K(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const t=(0,o.A)({},e);return function e(t){const n=Object.entries(t);for(let r=0;r<n.length;r++){const[a,l]=n[r];!q(l)||a.startsWith("unstable_")?delete t[a]:(0,i.Q)(l)&&(t[a]=(0,o.A)({},l),e(t[a]))}}(t),"import { unstable_createBreakpoints as createBreakpoints, createTransitions } from '@mui/material/styles';\n\nconst theme = ".concat(JSON.stringify(t,null,2),";\n\ntheme.breakpoints = createBreakpoints(theme.breakpoints || {});\ntheme.transitions = createTransitions(theme.transitions || {});\n\nexport default theme;")}const G=["breakpoints","mixins","spacing","palette","transitions","typography","shape","colorSpace"];function Q(e){return"number"===typeof e?"".concat((100*e).toFixed(0),"%"):"calc((".concat(e,") * 100%)")}function Y(e){Object.assign(e,{alpha(t,n){const r=this||e;return r.colorSpace?"oklch(from ".concat(t," l c h / ").concat("string"===typeof n?"calc(".concat(n,")"):n,")"):r.vars?"rgba(".concat(t.replace(/var\(--([^,\s)]+)(?:,[^)]+)?\)+/g,"var(--$1Channel)")," / ").concat("string"===typeof n?"calc(".concat(n,")"):n,")"):(0,l.X4)(t,(e=>{if(!Number.isNaN(+e))return+e;const t=e.match(/\d*\.?\d+/g);if(!t)return 0;let n=0;for(let r=0;r<t.length;r+=1)n+=+t[r];return n})(n))},lighten(t,n){const r=this||e;return r.colorSpace?"color-mix(in ".concat(r.colorSpace,", ").concat(t,", #fff ").concat(Q(n),")"):(0,l.a)(t,n)},darken(t,n){const r=this||e;return r.colorSpace?"color-mix(in ".concat(r.colorSpace,", ").concat(t,", #000 ").concat(Q(n),")"):(0,l.e$)(t,n)}})}const X=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{breakpoints:t,mixins:n={},spacing:l,palette:s={},transitions:c={},typography:u={},shape:d,colorSpace:f}=e,p=(0,r.A)(e,G);if(e.vars&&void 0===e.generateThemeVars)throw new Error((0,a.A)(20));const h=k((0,o.A)((0,o.A)({},s),{},{colorSpace:f})),m=(0,j.A)(e);let g=(0,i.A)(m,{mixins:(y=m.breakpoints,v=n,(0,o.A)({toolbar:{minHeight:56,[y.up("xs")]:{"@media (orientation: landscape)":{minHeight:48}},[y.up("sm")]:{minHeight:64}}},v)),palette:h,shadows:I.slice(),typography:(0,z.A)(h,u),transitions:V(c),zIndex:(0,o.A)({},$)});var y,v;g=(0,i.A)(g,p);for(var b=arguments.length,A=new Array(b>1?b-1:0),w=1;w<b;w++)A[w-1]=arguments[w];return g=A.reduce((e,t)=>(0,i.A)(e,t),g),g.unstable_sxConfig=(0,o.A)((0,o.A)({},_.A),null===p||void 0===p?void 0:p.unstable_sxConfig),g.unstable_sx=function(e){return(0,M.A)({sx:e,theme:this})},g.toRuntimeSource=K,Y(g),g};var J=n(2391);const Z=["palette","opacity","overlays","colorSpace"],ee=[...Array(25)].map((e,t)=>{if(0===t)return"none";const n=(0,J.A)(t);return"linear-gradient(rgba(255 255 255 / ".concat(n,"), rgba(255 255 255 / ").concat(n,"))")});function te(e){return{inputPlaceholder:"dark"===e?.5:.42,inputUnderline:"dark"===e?.7:.42,switchTrackDisabled:"dark"===e?.2:.12,switchTrack:"dark"===e?.3:.38}}function ne(e){return"dark"===e?ee:[]}function re(e){var t;return!!e[0].match(/(cssVarPrefix|colorSchemeSelector|modularCssLayers|rootSelector|typography|mixins|breakpoints|direction|transitions)/)||!!e[0].match(/sxConfig$/)||"palette"===e[0]&&!(null===(t=e[1])||void 0===t||!t.match(/(mode|contrastThreshold|tonalOffset)/))}const oe=e=>[...[...Array(25)].map((t,n)=>"--".concat(e?"".concat(e,"-"):"","overlays-").concat(n)),"--".concat(e?"".concat(e,"-"):"","palette-AppBar-darkBg"),"--".concat(e?"".concat(e,"-"):"","palette-AppBar-darkColor")],ae=e=>(t,n)=>{const r=e.rootSelector||":root",a=e.colorSchemeSelector;let i=a;if("class"===a&&(i=".%s"),"data"===a&&(i="[data-%s]"),null!==a&&void 0!==a&&a.startsWith("data-")&&!a.includes("%s")&&(i="[".concat(a,'="%s"]')),e.defaultColorScheme===t){if("dark"===t){const a={};return oe(e.cssVarPrefix).forEach(e=>{a[e]=n[e],delete n[e]}),"media"===i?{[r]:n,"@media (prefers-color-scheme: dark)":{[r]:a}}:i?{[i.replace("%s",t)]:a,["".concat(r,", ").concat(i.replace("%s",t))]:n}:{[r]:(0,o.A)((0,o.A)({},n),a)}}if(i&&"media"!==i)return"".concat(r,", ").concat(i.replace("%s",String(t)))}else if(t){if("media"===i)return{["@media (prefers-color-scheme: ".concat(String(t),")")]:{[r]:n}};if(i)return i.replace("%s",String(t))}return r},ie=["palette"],le=["colorSchemes","defaultColorScheme","disableCssColorScheme","cssVarPrefix","nativeColor","shouldSkipGeneratingVar","colorSchemeSelector","rootSelector"];function se(e,t,n){!e[t]&&n&&(e[t]=n)}function ce(e){return"string"===typeof e&&e.startsWith("hsl")?(0,l.YL)(e):e}function ue(e,t){"".concat(t,"Channel")in e||(e["".concat(t,"Channel")]=(0,l.Me)(ce(e[t]),"MUI: Can't create `palette.".concat(t,"Channel` because `palette.").concat(t,"` is not one of these formats: #nnn, #nnnnnn, rgb(), rgba(), hsl(), hsla(), color().")+"\n"+"To suppress this warning, you need to explicitly provide the `palette.".concat(t,'Channel` as a string (in rgb format, for example "12 12 12") or undefined if you want to remove the channel token.')))}const de=e=>{try{return e()}catch(t){}},fe=function(){return C(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"mui")};function pe(e,t,n,a,i){var l,s,c;if(!n)return;n=!0===n?{}:n;const u="dark"===i?"dark":"light";var d;if(!a)return void(t[i]=function(e){const{palette:t={mode:"light"},opacity:n,overlays:a,colorSpace:i}=e,l=(0,r.A)(e,Z),s=k((0,o.A)((0,o.A)({},t),{},{colorSpace:i}));return(0,o.A)({palette:s,opacity:(0,o.A)((0,o.A)({},te(s.mode)),n),overlays:a||ne(s.mode)},l)}((0,o.A)((0,o.A)({},n),{},{palette:(0,o.A)({mode:u},null===(d=n)||void 0===d?void 0:d.palette),colorSpace:e})));const f=X((0,o.A)((0,o.A)({},a),{},{palette:(0,o.A)({mode:u},null===(l=n)||void 0===l?void 0:l.palette),colorSpace:e})),{palette:p}=f,h=(0,r.A)(f,ie);return t[i]=(0,o.A)((0,o.A)({},n),{},{palette:p,opacity:(0,o.A)((0,o.A)({},te(u)),null===(s=n)||void 0===s?void 0:s.opacity),overlays:(null===(c=n)||void 0===c?void 0:c.overlays)||ne(u)}),h}const he=["palette","cssVariables","colorSchemes","defaultColorScheme"];function me(e,t,n){e.colorSchemes&&n&&(e.colorSchemes[t]=(0,o.A)((0,o.A)({},!0!==n&&n),{},{palette:k((0,o.A)((0,o.A)({},!0===n?{}:n.palette),{},{mode:t}))}))}function ge(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{palette:t,cssVariables:n=!1,colorSchemes:s=(t?void 0:{light:!0}),defaultColorScheme:c=(null===t||void 0===t?void 0:t.mode)}=e,u=(0,r.A)(e,he),d=c||"light",f=null===s||void 0===s?void 0:s[d],p=(0,o.A)((0,o.A)({},s),t?{[d]:(0,o.A)((0,o.A)({},"boolean"!==typeof f&&f),{},{palette:t})}:void 0);for(var h=arguments.length,m=new Array(h>1?h-1:0),g=1;g<h;g++)m[g-1]=arguments[g];if(!1===n){if(!("colorSchemes"in e))return X(e,...m);let n=t;"palette"in e||p[d]&&(!0!==p[d]?n=p[d].palette:"dark"===d&&(n={mode:"dark"}));const r=X((0,o.A)((0,o.A)({},e),{},{palette:n}),...m);return r.defaultColorScheme=d,r.colorSchemes=p,"light"===r.palette.mode&&(r.colorSchemes.light=(0,o.A)((0,o.A)({},!0!==p.light&&p.light),{},{palette:r.palette}),me(r,"dark",p.dark)),"dark"===r.palette.mode&&(r.colorSchemes.dark=(0,o.A)((0,o.A)({},!0!==p.dark&&p.dark),{},{palette:r.palette}),me(r,"light",p.light)),r}return t||"light"in p||"light"!==d||(p.light=!0),function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{colorSchemes:t={light:!0},defaultColorScheme:n,disableCssColorScheme:s=!1,cssVarPrefix:c="mui",nativeColor:u=!1,shouldSkipGeneratingVar:d=re,colorSchemeSelector:f=(t.light&&t.dark?"media":void 0),rootSelector:p=":root"}=e,h=(0,r.A)(e,le),m=Object.keys(t)[0],g=n||(t.light&&"light"!==m?"light":m),y=fe(c),{[g]:b,light:w,dark:S}=t,k=(0,r.A)(t,[g,"light","dark"].map(x.A)),C=(0,o.A)({},k);let R,O=b;if(("dark"===g&&!("dark"in t)||"light"===g&&!("light"in t))&&(O=!0),!O)throw new Error((0,a.A)(21,g));u&&(R="oklch");const N=pe(R,C,O,h,g);w&&!C.light&&pe(R,C,w,void 0,"light"),S&&!C.dark&&pe(R,C,S,void 0,"dark");let j=(0,o.A)((0,o.A)({defaultColorScheme:g},N),{},{cssVarPrefix:c,colorSchemeSelector:f,rootSelector:p,getCssVar:y,colorSchemes:C,font:(0,o.A)((0,o.A)({},T(N.typography)),N.font),spacing:(z=h.spacing,"number"===typeof z?"".concat(z,"px"):"string"===typeof z||"function"===typeof z||Array.isArray(z)?z:"8px")});var z;Object.keys(j.colorSchemes).forEach(e=>{const t=j.colorSchemes[e].palette,n=e=>{const n=e.split("-"),r=n[1],o=n[2];return y(e,t[r][o])};function r(e,t,n){if(R){let r;return e===l.Cg&&(r="transparent ".concat((100*(1-n)).toFixed(0),"%")),e===l.Nd&&(r="#000 ".concat((100*n).toFixed(0),"%")),e===l.j4&&(r="#fff ".concat((100*n).toFixed(0),"%")),"color-mix(in ".concat(R,", ").concat(t,", ").concat(r,")")}return e(t,n)}var o;if("light"===t.mode&&(se(t.common,"background","#fff"),se(t.common,"onBackground","#000")),"dark"===t.mode&&(se(t.common,"background","#000"),se(t.common,"onBackground","#fff")),o=t,["Alert","AppBar","Avatar","Button","Chip","FilledInput","LinearProgress","Skeleton","Slider","SnackbarContent","SpeedDialAction","StepConnector","StepContent","Switch","TableCell","Tooltip"].forEach(e=>{o[e]||(o[e]={})}),"light"===t.mode){se(t.Alert,"errorColor",r(l.Nd,t.error.light,.6)),se(t.Alert,"infoColor",r(l.Nd,t.info.light,.6)),se(t.Alert,"successColor",r(l.Nd,t.success.light,.6)),se(t.Alert,"warningColor",r(l.Nd,t.warning.light,.6)),se(t.Alert,"errorFilledBg",n("palette-error-main")),se(t.Alert,"infoFilledBg",n("palette-info-main")),se(t.Alert,"successFilledBg",n("palette-success-main")),se(t.Alert,"warningFilledBg",n("palette-warning-main")),se(t.Alert,"errorFilledColor",de(()=>t.getContrastText(t.error.main))),se(t.Alert,"infoFilledColor",de(()=>t.getContrastText(t.info.main))),se(t.Alert,"successFilledColor",de(()=>t.getContrastText(t.success.main))),se(t.Alert,"warningFilledColor",de(()=>t.getContrastText(t.warning.main))),se(t.Alert,"errorStandardBg",r(l.j4,t.error.light,.9)),se(t.Alert,"infoStandardBg",r(l.j4,t.info.light,.9)),se(t.Alert,"successStandardBg",r(l.j4,t.success.light,.9)),se(t.Alert,"warningStandardBg",r(l.j4,t.warning.light,.9)),se(t.Alert,"errorIconColor",n("palette-error-main")),se(t.Alert,"infoIconColor",n("palette-info-main")),se(t.Alert,"successIconColor",n("palette-success-main")),se(t.Alert,"warningIconColor",n("palette-warning-main")),se(t.AppBar,"defaultBg",n("palette-grey-100")),se(t.Avatar,"defaultBg",n("palette-grey-400")),se(t.Button,"inheritContainedBg",n("palette-grey-300")),se(t.Button,"inheritContainedHoverBg",n("palette-grey-A100")),se(t.Chip,"defaultBorder",n("palette-grey-400")),se(t.Chip,"defaultAvatarColor",n("palette-grey-700")),se(t.Chip,"defaultIconColor",n("palette-grey-700")),se(t.FilledInput,"bg","rgba(0, 0, 0, 0.06)"),se(t.FilledInput,"hoverBg","rgba(0, 0, 0, 0.09)"),se(t.FilledInput,"disabledBg","rgba(0, 0, 0, 0.12)"),se(t.LinearProgress,"primaryBg",r(l.j4,t.primary.main,.62)),se(t.LinearProgress,"secondaryBg",r(l.j4,t.secondary.main,.62)),se(t.LinearProgress,"errorBg",r(l.j4,t.error.main,.62)),se(t.LinearProgress,"infoBg",r(l.j4,t.info.main,.62)),se(t.LinearProgress,"successBg",r(l.j4,t.success.main,.62)),se(t.LinearProgress,"warningBg",r(l.j4,t.warning.main,.62)),se(t.Skeleton,"bg",R?r(l.Cg,t.text.primary,.11):"rgba(".concat(n("palette-text-primaryChannel")," / 0.11)")),se(t.Slider,"primaryTrack",r(l.j4,t.primary.main,.62)),se(t.Slider,"secondaryTrack",r(l.j4,t.secondary.main,.62)),se(t.Slider,"errorTrack",r(l.j4,t.error.main,.62)),se(t.Slider,"infoTrack",r(l.j4,t.info.main,.62)),se(t.Slider,"successTrack",r(l.j4,t.success.main,.62)),se(t.Slider,"warningTrack",r(l.j4,t.warning.main,.62));const e=R?r(l.Nd,t.background.default,.6825):(0,l.Y9)(t.background.default,.8);se(t.SnackbarContent,"bg",e),se(t.SnackbarContent,"color",de(()=>R?A.text.primary:t.getContrastText(e))),se(t.SpeedDialAction,"fabHoverBg",(0,l.Y9)(t.background.paper,.15)),se(t.StepConnector,"border",n("palette-grey-400")),se(t.StepContent,"border",n("palette-grey-400")),se(t.Switch,"defaultColor",n("palette-common-white")),se(t.Switch,"defaultDisabledColor",n("palette-grey-100")),se(t.Switch,"primaryDisabledColor",r(l.j4,t.primary.main,.62)),se(t.Switch,"secondaryDisabledColor",r(l.j4,t.secondary.main,.62)),se(t.Switch,"errorDisabledColor",r(l.j4,t.error.main,.62)),se(t.Switch,"infoDisabledColor",r(l.j4,t.info.main,.62)),se(t.Switch,"successDisabledColor",r(l.j4,t.success.main,.62)),se(t.Switch,"warningDisabledColor",r(l.j4,t.warning.main,.62)),se(t.TableCell,"border",r(l.j4,r(l.Cg,t.divider,1),.88)),se(t.Tooltip,"bg",r(l.Cg,t.grey[700],.92))}if("dark"===t.mode){se(t.Alert,"errorColor",r(l.j4,t.error.light,.6)),se(t.Alert,"infoColor",r(l.j4,t.info.light,.6)),se(t.Alert,"successColor",r(l.j4,t.success.light,.6)),se(t.Alert,"warningColor",r(l.j4,t.warning.light,.6)),se(t.Alert,"errorFilledBg",n("palette-error-dark")),se(t.Alert,"infoFilledBg",n("palette-info-dark")),se(t.Alert,"successFilledBg",n("palette-success-dark")),se(t.Alert,"warningFilledBg",n("palette-warning-dark")),se(t.Alert,"errorFilledColor",de(()=>t.getContrastText(t.error.dark))),se(t.Alert,"infoFilledColor",de(()=>t.getContrastText(t.info.dark))),se(t.Alert,"successFilledColor",de(()=>t.getContrastText(t.success.dark))),se(t.Alert,"warningFilledColor",de(()=>t.getContrastText(t.warning.dark))),se(t.Alert,"errorStandardBg",r(l.Nd,t.error.light,.9)),se(t.Alert,"infoStandardBg",r(l.Nd,t.info.light,.9)),se(t.Alert,"successStandardBg",r(l.Nd,t.success.light,.9)),se(t.Alert,"warningStandardBg",r(l.Nd,t.warning.light,.9)),se(t.Alert,"errorIconColor",n("palette-error-main")),se(t.Alert,"infoIconColor",n("palette-info-main")),se(t.Alert,"successIconColor",n("palette-success-main")),se(t.Alert,"warningIconColor",n("palette-warning-main")),se(t.AppBar,"defaultBg",n("palette-grey-900")),se(t.AppBar,"darkBg",n("palette-background-paper")),se(t.AppBar,"darkColor",n("palette-text-primary")),se(t.Avatar,"defaultBg",n("palette-grey-600")),se(t.Button,"inheritContainedBg",n("palette-grey-800")),se(t.Button,"inheritContainedHoverBg",n("palette-grey-700")),se(t.Chip,"defaultBorder",n("palette-grey-700")),se(t.Chip,"defaultAvatarColor",n("palette-grey-300")),se(t.Chip,"defaultIconColor",n("palette-grey-300")),se(t.FilledInput,"bg","rgba(255, 255, 255, 0.09)"),se(t.FilledInput,"hoverBg","rgba(255, 255, 255, 0.13)"),se(t.FilledInput,"disabledBg","rgba(255, 255, 255, 0.12)"),se(t.LinearProgress,"primaryBg",r(l.Nd,t.primary.main,.5)),se(t.LinearProgress,"secondaryBg",r(l.Nd,t.secondary.main,.5)),se(t.LinearProgress,"errorBg",r(l.Nd,t.error.main,.5)),se(t.LinearProgress,"infoBg",r(l.Nd,t.info.main,.5)),se(t.LinearProgress,"successBg",r(l.Nd,t.success.main,.5)),se(t.LinearProgress,"warningBg",r(l.Nd,t.warning.main,.5)),se(t.Skeleton,"bg",R?r(l.Cg,t.text.primary,.13):"rgba(".concat(n("palette-text-primaryChannel")," / 0.13)")),se(t.Slider,"primaryTrack",r(l.Nd,t.primary.main,.5)),se(t.Slider,"secondaryTrack",r(l.Nd,t.secondary.main,.5)),se(t.Slider,"errorTrack",r(l.Nd,t.error.main,.5)),se(t.Slider,"infoTrack",r(l.Nd,t.info.main,.5)),se(t.Slider,"successTrack",r(l.Nd,t.success.main,.5)),se(t.Slider,"warningTrack",r(l.Nd,t.warning.main,.5));const e=R?r(l.j4,t.background.default,.985):(0,l.Y9)(t.background.default,.98);se(t.SnackbarContent,"bg",e),se(t.SnackbarContent,"color",de(()=>R?v.text.primary:t.getContrastText(e))),se(t.SpeedDialAction,"fabHoverBg",(0,l.Y9)(t.background.paper,.15)),se(t.StepConnector,"border",n("palette-grey-600")),se(t.StepContent,"border",n("palette-grey-600")),se(t.Switch,"defaultColor",n("palette-grey-300")),se(t.Switch,"defaultDisabledColor",n("palette-grey-600")),se(t.Switch,"primaryDisabledColor",r(l.Nd,t.primary.main,.55)),se(t.Switch,"secondaryDisabledColor",r(l.Nd,t.secondary.main,.55)),se(t.Switch,"errorDisabledColor",r(l.Nd,t.error.main,.55)),se(t.Switch,"infoDisabledColor",r(l.Nd,t.info.main,.55)),se(t.Switch,"successDisabledColor",r(l.Nd,t.success.main,.55)),se(t.Switch,"warningDisabledColor",r(l.Nd,t.warning.main,.55)),se(t.TableCell,"border",r(l.Nd,r(l.Cg,t.divider,1),.68)),se(t.Tooltip,"bg",r(l.Cg,t.grey[700],.92))}ue(t.background,"default"),ue(t.background,"paper"),ue(t.common,"background"),ue(t.common,"onBackground"),ue(t,"divider"),Object.keys(t).forEach(e=>{const n=t[e];"tonalOffset"!==e&&n&&"object"===typeof n&&(n.main&&se(t[e],"mainChannel",(0,l.Me)(ce(n.main))),n.light&&se(t[e],"lightChannel",(0,l.Me)(ce(n.light))),n.dark&&se(t[e],"darkChannel",(0,l.Me)(ce(n.dark))),n.contrastText&&se(t[e],"contrastTextChannel",(0,l.Me)(ce(n.contrastText))),"text"===e&&(ue(t[e],"primary"),ue(t[e],"secondary")),"action"===e&&(n.active&&ue(t[e],"active"),n.selected&&ue(t[e],"selected")))})});for(var F=arguments.length,I=new Array(F>1?F-1:0),D=1;D<F;D++)I[D-1]=arguments[D];j=I.reduce((e,t)=>(0,i.A)(e,t),j);const B={prefix:c,disableCssColorScheme:s,shouldSkipGeneratingVar:d,getSelector:ae(j),enableContrastVars:u},{vars:U,generateThemeVars:W,generateStyleSheets:H}=L(j,B);return j.vars=U,Object.entries(j.colorSchemes[j.defaultColorScheme]).forEach(e=>{let[t,n]=e;j[t]=n}),j.generateThemeVars=W,j.generateStyleSheets=H,j.generateSpacing=function(){return(0,E.A)(h.spacing,(0,P.LX)(this))},j.getColorSchemeSelector=function(e){return function(t){return"media"===e?"@media (prefers-color-scheme: ".concat(t,")"):e?e.startsWith("data-")&&!e.includes("%s")?"[".concat(e,'="').concat(t,'"] &'):"class"===e?".".concat(t," &"):"data"===e?"[data-".concat(t,"] &"):"".concat(e.replace("%s",t)," &"):"&"}}(f),j.spacing=j.generateSpacing(),j.shouldSkipGeneratingVar=d,j.unstable_sxConfig=(0,o.A)((0,o.A)({},_.A),null===h||void 0===h?void 0:h.unstable_sxConfig),j.unstable_sx=function(e){return(0,M.A)({sx:e,theme:this})},j.toRuntimeSource=K,j}((0,o.A)((0,o.A)({},u),{},{colorSchemes:p,defaultColorScheme:d},"boolean"!==typeof n&&n),...m)}},8031:(e,t,n)=>{n.d(t,{A:()=>i,g:()=>a});var r=n(9857),o=n(6061);function a(e){return(0,o.Ay)("MuiInputBase",e)}const i=(0,r.A)("MuiInputBase",["root","formControl","focused","disabled","adornedStart","adornedEnd","error","sizeSmall","multiline","colorSecondary","fullWidth","hiddenLabel","readOnly","input","inputSizeSmall","inputMultiline","inputTypeSearch","inputAdornedStart","inputAdornedEnd","inputHiddenLabel"])},8087:(e,t,n)=>{n.d(t,{Ay:()=>l,CT:()=>i,_S:()=>o,ob:()=>a});var r=n(9379);function o(e,t){if(!e.containerQueries)return t;const n=Object.keys(t).filter(e=>e.startsWith("@container")).sort((e,t)=>{var n,r;const o=/min-width:\s*([0-9.]+)/;return+((null===(n=e.match(o))||void 0===n?void 0:n[1])||0)-+((null===(r=t.match(o))||void 0===r?void 0:r[1])||0)});return n.length?n.reduce((e,n)=>{const r=t[n];return delete e[n],e[n]=r,e},(0,r.A)({},t)):t}function a(e,t){return"@"===t||t.startsWith("@")&&(e.some(e=>t.startsWith("@".concat(e)))||!!t.match(/^@\d/))}function i(e,t){const n=t.match(/^@([^/]+)?\/?(.+)?$/);if(!n)return null;const[,r,o]=n,a=Number.isNaN(+r)?r||0:+r;return e.containerQueries(o).up(a)}function l(e){const t=(e,t)=>e.replace("@media",t?"@container ".concat(t):"@container");function n(n,r){n.up=function(){return t(e.breakpoints.up(...arguments),r)},n.down=function(){return t(e.breakpoints.down(...arguments),r)},n.between=function(){return t(e.breakpoints.between(...arguments),r)},n.only=function(){return t(e.breakpoints.only(...arguments),r)},n.not=function(){const n=t(e.breakpoints.not(...arguments),r);return n.includes("not all and")?n.replace("not all and ","").replace("min-width:","width<").replace("max-width:","width>").replace("and","or"):n}}const o={},a=e=>(n(o,e),o);return n(a),(0,r.A)((0,r.A)({},e),{},{containerQueries:a})}},8128:(e,t,n)=>{n.d(t,{Ay:()=>l});var r=n(7675),o=n(7333),a=n(416),i=n(2466);const l=(0,r.Ay)({themeId:a.A,defaultTheme:o.A,rootShouldForwardProp:i.A})},8130:(e,t,n)=>{n.d(t,{Dp:()=>u,Dg:()=>d});var r=n(9379),o=(n(5043),n(5227)),a=n(99),i=n(7333),l=n(416),s=n(579);const c=function(e){return(0,s.jsx)(a.A,(0,r.A)((0,r.A)({},e),{},{defaultTheme:i.A,themeId:l.A}))};function u(e){return function(t){return(0,s.jsx)(c,{styles:"function"===typeof e?n=>e((0,r.A)({theme:n},t)):e})}}function d(){return o.A}},8168:(e,t,n)=>{function r(){return r=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},r.apply(null,arguments)}n.d(t,{A:()=>r})},8211:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(9379),o=n(1449);const a=function(e,t,n){return void 0===e||(0,o.A)(e)?t:(0,r.A)((0,r.A)({},t),{},{ownerState:(0,r.A)((0,r.A)({},t.ownerState),n)})}},8301:(e,t,n)=>{n.d(t,{b:()=>o});n(5043);var r=n(6009);n(579);function o(e){return(0,r.b)(e)}},8348:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(1767).A},8387:(e,t,n)=>{function r(e){var t,n,o="";if("string"==typeof e||"number"==typeof e)o+=e;else if("object"==typeof e)if(Array.isArray(e)){var a=e.length;for(t=0;t<a;t++)e[t]&&(n=r(e[t]))&&(o&&(o+=" "),o+=n)}else for(n in e)e[n]&&(o&&(o+=" "),o+=n);return o}n.d(t,{A:()=>o});const o=function(){for(var e,t,n=0,o="",a=arguments.length;n<a;n++)(e=arguments[n])&&(t=r(e))&&(o&&(o+=" "),o+=t);return o}},8403:(e,t,n)=>{n.d(t,{A:()=>A});var r=n(45),o=n(9379),a=n(5043),i=n(8387),l=n(1807),s=n(8128),c=n(1612),u=n(8301),d=n(2466),f=n(9699),p=n(4418),h=n(8348),m=n(9066),g=n(855),y=n(579);const v=["alignItems","autoFocus","component","children","dense","disableGutters","divider","focusVisibleClassName","selected","className"],b=(0,s.Ay)(f.A,{shouldForwardProp:e=>(0,d.A)(e)||"classes"===e,name:"MuiListItemButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,"flex-start"===n.alignItems&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters]}})((0,c.A)(e=>{let{theme:t}=e;return{display:"flex",flexGrow:1,justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",minWidth:0,boxSizing:"border-box",textAlign:"left",paddingTop:8,paddingBottom:8,transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},["&.".concat(g.A.selected)]:{backgroundColor:t.alpha((t.vars||t).palette.primary.main,(t.vars||t).palette.action.selectedOpacity),["&.".concat(g.A.focusVisible)]:{backgroundColor:t.alpha((t.vars||t).palette.primary.main,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.focusOpacity))}},["&.".concat(g.A.selected,":hover")]:{backgroundColor:t.alpha((t.vars||t).palette.primary.main,"".concat((t.vars||t).palette.action.selectedOpacity," + ").concat((t.vars||t).palette.action.hoverOpacity)),"@media (hover: none)":{backgroundColor:t.alpha((t.vars||t).palette.primary.main,(t.vars||t).palette.action.selectedOpacity)}},["&.".concat(g.A.focusVisible)]:{backgroundColor:(t.vars||t).palette.action.focus},["&.".concat(g.A.disabled)]:{opacity:(t.vars||t).palette.action.disabledOpacity},variants:[{props:e=>{let{ownerState:t}=e;return t.divider},style:{borderBottom:"1px solid ".concat((t.vars||t).palette.divider),backgroundClip:"padding-box"}},{props:{alignItems:"flex-start"},style:{alignItems:"flex-start"}},{props:e=>{let{ownerState:t}=e;return!t.disableGutters},style:{paddingLeft:16,paddingRight:16}},{props:e=>{let{ownerState:t}=e;return t.dense},style:{paddingTop:4,paddingBottom:4}}]}})),A=a.forwardRef(function(e,t){const n=(0,u.b)({props:e,name:"MuiListItemButton"}),{alignItems:s="center",autoFocus:c=!1,component:d="div",children:f,dense:A=!1,disableGutters:w=!1,divider:S=!1,focusVisibleClassName:k,selected:x=!1,className:C}=n,E=(0,r.A)(n,v),P=a.useContext(m.A),T=a.useMemo(()=>({dense:A||P.dense||!1,alignItems:s,disableGutters:w}),[s,P.dense,A,w]),R=a.useRef(null);(0,p.A)(()=>{c&&R.current&&R.current.focus()},[c]);const O=(0,o.A)((0,o.A)({},n),{},{alignItems:s,dense:T.dense,disableGutters:w,divider:S,selected:x}),N=(e=>{const{alignItems:t,classes:n,dense:r,disabled:a,disableGutters:i,divider:s,selected:c}=e,u={root:["root",r&&"dense",!i&&"gutters",s&&"divider",a&&"disabled","flex-start"===t&&"alignItemsFlexStart",c&&"selected"]},d=(0,l.A)(u,g.Y,n);return(0,o.A)((0,o.A)({},n),d)})(O),L=(0,h.A)(R,t);return(0,y.jsx)(m.A.Provider,{value:T,children:(0,y.jsx)(b,(0,o.A)((0,o.A)({ref:L,href:E.href||E.to,component:(E.href||E.to)&&"div"===d?"button":d,focusVisibleClassName:(0,i.A)(N.focusVisible,k),ownerState:O,className:(0,i.A)(N.root,C)},E),{},{classes:N,children:f}))})})},8549:(e,t,n)=>{n.d(t,{A:()=>F});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(2524),c=n(3677),u=n(8128),d=n(1612),f=n(8301),p=n(6945),h=n(7449),m=n(1767),g=n(1039);function y(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce((e,t)=>null==t?e:function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];e.apply(this,r),t.apply(this,r)},()=>{})}var v=n(5491),b=n(6433),A=n(9385);function w(e,t){t?e.setAttribute("aria-hidden","true"):e.removeAttribute("aria-hidden")}function S(e){return parseInt((0,b.A)(e).getComputedStyle(e).paddingRight,10)||0}function k(e,t,n,r,o){const a=[t,n,...r];[].forEach.call(e.children,e=>{const t=!a.includes(e),n=!function(e){const t=["TEMPLATE","SCRIPT","STYLE","LINK","MAP","META","NOSCRIPT","PICTURE","COL","COLGROUP","PARAM","SLOT","SOURCE","TRACK"].includes(e.tagName),n="INPUT"===e.tagName&&"hidden"===e.getAttribute("type");return t||n}(e);t&&n&&w(e,o)})}function x(e,t){let n=-1;return e.some((e,r)=>!!t(e)&&(n=r,!0)),n}function C(e,t){const n=[],r=e.container;if(!t.disableScrollLock){if(function(e){const t=(0,h.A)(e);return t.body===e?(0,b.A)(e).innerWidth>t.documentElement.clientWidth:e.scrollHeight>e.clientHeight}(r)){const e=(0,A.A)((0,b.A)(r));n.push({value:r.style.paddingRight,property:"padding-right",el:r}),r.style.paddingRight="".concat(S(r)+e,"px");const t=(0,h.A)(r).querySelectorAll(".mui-fixed");[].forEach.call(t,t=>{n.push({value:t.style.paddingRight,property:"padding-right",el:t}),t.style.paddingRight="".concat(S(t)+e,"px")})}let e;if(r.parentNode instanceof DocumentFragment)e=(0,h.A)(r).body;else{const t=r.parentElement,n=(0,b.A)(r);e="HTML"===(null===t||void 0===t?void 0:t.nodeName)&&"scroll"===n.getComputedStyle(t).overflowY?t:r}n.push({value:e.style.overflow,property:"overflow",el:e},{value:e.style.overflowX,property:"overflow-x",el:e},{value:e.style.overflowY,property:"overflow-y",el:e}),e.style.overflow="hidden"}return()=>{n.forEach(e=>{let{value:t,el:n,property:r}=e;t?n.style.setProperty(r,t):n.style.removeProperty(r)})}}const E=()=>{},P=new class{constructor(){this.modals=[],this.containers=[]}add(e,t){let n=this.modals.indexOf(e);if(-1!==n)return n;n=this.modals.length,this.modals.push(e),e.modalRef&&w(e.modalRef,!1);const r=function(e){const t=[];return[].forEach.call(e.children,e=>{"true"===e.getAttribute("aria-hidden")&&t.push(e)}),t}(t);k(t,e.mount,e.modalRef,r,!0);const o=x(this.containers,e=>e.container===t);return-1!==o?(this.containers[o].modals.push(e),n):(this.containers.push({modals:[e],container:t,restore:null,hiddenSiblings:r}),n)}mount(e,t){const n=x(this.containers,t=>t.modals.includes(e)),r=this.containers[n];r.restore||(r.restore=C(r,t))}remove(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const n=this.modals.indexOf(e);if(-1===n)return n;const r=x(this.containers,t=>t.modals.includes(e)),o=this.containers[r];if(o.modals.splice(o.modals.indexOf(e),1),this.modals.splice(n,1),0===o.modals.length)o.restore&&o.restore(),e.modalRef&&w(e.modalRef,t),k(o.container,e.mount,e.modalRef,o.hiddenSiblings,!1),this.containers.splice(r,1);else{const e=o.modals[o.modals.length-1];e.modalRef&&w(e.modalRef,!1)}return n}isTopModal(e){return this.modals.length>0&&this.modals[this.modals.length-1]===e}};const T=function(e){const{container:t,disableEscapeKeyDown:n=!1,disableScrollLock:o=!1,closeAfterTransition:i=!1,onTransitionEnter:l,onTransitionExited:s,children:c,onClose:u,open:d,rootRef:f}=e,p=a.useRef({}),b=a.useRef(null),A=a.useRef(null),S=(0,m.A)(A,f),[k,x]=a.useState(!d),C=function(e){return!!e&&e.props.hasOwnProperty("in")}(c);let T=!0;"false"!==e["aria-hidden"]&&!1!==e["aria-hidden"]||(T=!1);const R=()=>(p.current.modalRef=A.current,p.current.mount=b.current,p.current),O=()=>{P.mount(R(),{disableScrollLock:o}),A.current&&(A.current.scrollTop=0)},N=(0,g.A)(()=>{const e=function(e){return"function"===typeof e?e():e}(t)||(0,h.A)(b.current).body;P.add(R(),e),A.current&&O()}),L=()=>P.isTopModal(R()),_=(0,g.A)(e=>{b.current=e,e&&(d&&L()?O():A.current&&w(A.current,T))}),M=a.useCallback(()=>{P.remove(R(),T)},[T]);a.useEffect(()=>()=>{M()},[M]),a.useEffect(()=>{d?N():C&&i||M()},[d,M,C,i,N]);const j=e=>t=>{var r;null===(r=e.onKeyDown)||void 0===r||r.call(e,t),"Escape"===t.key&&229!==t.which&&L()&&(n||(t.stopPropagation(),u&&u(t,"escapeKeyDown")))},z=e=>t=>{var n;null===(n=e.onClick)||void 0===n||n.call(e,t),t.target===t.currentTarget&&u&&u(t,"backdropClick")};return{getRootProps:function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const n=(0,v.A)(e);delete n.onTransitionEnter,delete n.onTransitionExited;const o=(0,r.A)((0,r.A)({},n),t);return(0,r.A)((0,r.A)({role:"presentation"},o),{},{onKeyDown:j(o),ref:S})},getBackdropProps:function(){const e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(0,r.A)((0,r.A)({"aria-hidden":!0},e),{},{onClick:z(e),open:d})},getTransitionProps:()=>{var e,t;return{onEnter:y(()=>{x(!1),l&&l()},null!==(e=null===c||void 0===c?void 0:c.props.onEnter)&&void 0!==e?e:E),onExited:y(()=>{x(!0),s&&s(),i&&M()},null!==(t=null===c||void 0===c?void 0:c.props.onExited)&&void 0!==t?t:E)}},rootRef:S,portalRef:_,isTopModal:L,exited:k,hasTransition:C}};var R=n(9857),O=n(6061);function N(e){return(0,O.Ay)("MuiModal",e)}(0,R.A)("MuiModal",["root","hidden","backdrop"]);var L=n(9905),_=n(579);const M=["BackdropComponent","BackdropProps","classes","className","closeAfterTransition","children","container","component","components","componentsProps","disableAutoFocus","disableEnforceFocus","disableEscapeKeyDown","disablePortal","disableRestoreFocus","disableScrollLock","hideBackdrop","keepMounted","onClose","onTransitionEnter","onTransitionExited","open","slotProps","slots","theme"],j=(0,u.Ay)("div",{name:"MuiModal",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.open&&n.exited&&t.hidden]}})((0,d.A)(e=>{let{theme:t}=e;return{position:"fixed",zIndex:(t.vars||t).zIndex.modal,right:0,bottom:0,top:0,left:0,variants:[{props:e=>{let{ownerState:t}=e;return!t.open&&t.exited},style:{visibility:"hidden"}}]}})),z=(0,u.Ay)(p.A,{name:"MuiModal",slot:"Backdrop"})({zIndex:-1}),F=a.forwardRef(function(e,t){const n=(0,f.b)({name:"MuiModal",props:e}),{BackdropComponent:u=z,BackdropProps:d,classes:p,className:h,closeAfterTransition:m=!1,children:g,container:y,component:v,components:b={},componentsProps:A={},disableAutoFocus:w=!1,disableEnforceFocus:S=!1,disableEscapeKeyDown:k=!1,disablePortal:x=!1,disableRestoreFocus:C=!1,disableScrollLock:E=!1,hideBackdrop:P=!1,keepMounted:R=!1,onClose:O,onTransitionEnter:F,onTransitionExited:I,open:D,slotProps:B={},slots:U={},theme:W}=n,H=(0,o.A)(n,M),V=(0,r.A)((0,r.A)({},n),{},{closeAfterTransition:m,disableAutoFocus:w,disableEnforceFocus:S,disableEscapeKeyDown:k,disablePortal:x,disableRestoreFocus:C,disableScrollLock:E,hideBackdrop:P,keepMounted:R}),{getRootProps:$,getBackdropProps:q,getTransitionProps:K,portalRef:G,isTopModal:Q,exited:Y,hasTransition:X}=T((0,r.A)((0,r.A)({},V),{},{rootRef:t})),J=(0,r.A)((0,r.A)({},V),{},{exited:Y}),Z=(e=>{const{open:t,exited:n,classes:r}=e,o={root:["root",!t&&n&&"hidden"],backdrop:["backdrop"]};return(0,l.A)(o,N,r)})(J),ee={};if(void 0===g.props.tabIndex&&(ee.tabIndex="-1"),X){const{onEnter:e,onExited:t}=K();ee.onEnter=e,ee.onExited=t}const te={slots:(0,r.A)({root:b.Root,backdrop:b.Backdrop},U),slotProps:(0,r.A)((0,r.A)({},A),B)},[ne,re]=(0,L.A)("root",{ref:t,elementType:j,externalForwardedProps:(0,r.A)((0,r.A)((0,r.A)({},te),H),{},{component:v}),getSlotProps:$,ownerState:J,className:(0,i.A)(h,null===Z||void 0===Z?void 0:Z.root,!J.open&&J.exited&&(null===Z||void 0===Z?void 0:Z.hidden))}),[oe,ae]=(0,L.A)("backdrop",{ref:null===d||void 0===d?void 0:d.ref,elementType:u,externalForwardedProps:te,shouldForwardComponentProp:!0,additionalProps:d,getSlotProps:e=>q((0,r.A)((0,r.A)({},e),{},{onClick:t=>{null!==e&&void 0!==e&&e.onClick&&e.onClick(t)}})),className:(0,i.A)(null===d||void 0===d?void 0:d.className,null===Z||void 0===Z?void 0:Z.backdrop),ownerState:J});return R||D||X&&!Y?(0,_.jsx)(c.A,{ref:G,container:y,disablePortal:x,children:(0,_.jsxs)(ne,(0,r.A)((0,r.A)({},re),{},{children:[!P&&u?(0,_.jsx)(oe,(0,r.A)({},ae)):null,(0,_.jsx)(s.A,{disableEnforceFocus:S,disableAutoFocus:w,disableRestoreFocus:C,isEnabled:Q,open:D,children:a.cloneElement(g,ee)})]}))}):null})},8587:(e,t,n)=>{function r(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}n.d(t,{A:()=>r})},8623:(e,t,n)=>{n.d(t,{A:()=>u});var r=n(3635),o=n(9271),a=n(159),i=n(6167),l=n(8087),s=n(4440);const c=function(){function e(e,t,n,o){const l={[e]:t,theme:n},s=o[e];if(!s)return{[e]:t};const{cssProperty:c=e,themeKey:u,transform:d,style:f}=s;if(null==t)return null;if("typography"===u&&"inherit"===t)return{[e]:t};const p=(0,a.Yn)(n,u)||{};if(f)return f(l);return(0,i.NI)(l,t,t=>{let n=(0,a.BO)(p,d,t);return t===n&&"string"===typeof t&&(n=(0,a.BO)(p,d,"".concat(e).concat("default"===t?"":(0,r.A)(t)),t)),!1===c?n:{[c]:n}})}return function t(n){var r;const{sx:a,theme:c={},nested:u}=n||{};if(!a)return null;const d=null!==(r=c.unstable_sxConfig)&&void 0!==r?r:s.A;function f(n){let r=n;if("function"===typeof n)r=n(c);else if("object"!==typeof n)return n;if(!r)return null;const a=(0,i.EU)(c.breakpoints),s=Object.keys(a);let f=a;return Object.keys(r).forEach(n=>{const a=(l=r[n],s=c,"function"===typeof l?l(s):l);var l,s;if(null!==a&&void 0!==a)if("object"===typeof a)if(d[n])f=(0,o.A)(f,e(n,a,c,d));else{const e=(0,i.NI)({theme:c},a,e=>({[n]:e}));!function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t.reduce((e,t)=>e.concat(Object.keys(t)),[]),o=new Set(r);return t.every(e=>o.size===Object.keys(e).length)}(e,a)?f=(0,o.A)(f,e):f[n]=t({sx:a,theme:c,nested:!0})}else f=(0,o.A)(f,e(n,a,c,d))}),!u&&c.modularCssLayers?{"@layer sx":(0,l._S)(c,(0,i.vf)(s,f))}:(0,l._S)(c,(0,i.vf)(s,f))}return Array.isArray(a)?a.map(f):f(a)}}();c.filterProps=["sx"];const u=c},8700:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(5043),o=n(8736);function a(){return r.useContext(o.A)}},8726:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(5043).createContext(null)},8736:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(5043).createContext(void 0)},8853:(e,t,n)=>{e.exports=n(5896)},9049:(e,t,n)=>{n.d(t,{A:()=>m});var r=n(9379),o=n(45),a=n(3129);const i=["values","unit","step"];function l(e){const{values:t={xs:0,sm:600,md:900,lg:1200,xl:1536},unit:n="px",step:a=5}=e,l=(0,o.A)(e,i),s=(e=>{const t=Object.keys(e).map(t=>({key:t,val:e[t]}))||[];return t.sort((e,t)=>e.val-t.val),t.reduce((e,t)=>(0,r.A)((0,r.A)({},e),{},{[t.key]:t.val}),{})})(t),c=Object.keys(s);function u(e){const r="number"===typeof t[e]?t[e]:e;return"@media (min-width:".concat(r).concat(n,")")}function d(e){const r="number"===typeof t[e]?t[e]:e;return"@media (max-width:".concat(r-a/100).concat(n,")")}function f(e,r){const o=c.indexOf(r);return"@media (min-width:".concat("number"===typeof t[e]?t[e]:e).concat(n,") and ")+"(max-width:".concat((-1!==o&&"number"===typeof t[c[o]]?t[c[o]]:r)-a/100).concat(n,")")}return(0,r.A)({keys:c,values:s,up:u,down:d,between:f,only:function(e){return c.indexOf(e)+1<c.length?f(e,c[c.indexOf(e)+1]):u(e)},not:function(e){const t=c.indexOf(e);return 0===t?u(c[1]):t===c.length-1?d(c[t]):f(e,c[c.indexOf(e)+1]).replace("@media","@media not all and")},unit:n},l)}var s=n(8087);const c={borderRadius:4};var u=n(9927),d=n(8623),f=n(4440);function p(e,t){const n=this;if(n.vars){var r;if(null===(r=n.colorSchemes)||void 0===r||!r[e]||"function"!==typeof n.getColorSchemeSelector)return{};let o=n.getColorSchemeSelector(e);return"&"===o?t:((o.includes("data-")||o.includes("."))&&(o="*:where(".concat(o.replace(/\s*&$/,""),") &")),{[o]:t})}return n.palette.mode===e?t:{}}const h=["breakpoints","palette","spacing","shape"];const m=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{breakpoints:t={},palette:n={},spacing:i,shape:m={}}=e,g=(0,o.A)(e,h),y=l(t),v=(0,u.A)(i);let b=(0,a.A)({breakpoints:y,direction:"ltr",components:{},palette:(0,r.A)({mode:"light"},n),spacing:v,shape:(0,r.A)((0,r.A)({},c),m)},g);b=(0,s.Ay)(b),b.applyStyles=p;for(var A=arguments.length,w=new Array(A>1?A-1:0),S=1;S<A;S++)w[S-1]=arguments[S];return b=w.reduce((e,t)=>(0,a.A)(e,t),b),b.unstable_sxConfig=(0,r.A)((0,r.A)({},f.A),null===g||void 0===g?void 0:g.unstable_sxConfig),b.unstable_sx=function(e){return(0,d.A)({sx:e,theme:this})},b}},9066:(e,t,n)=>{n.d(t,{A:()=>r});const r=n(5043).createContext({})},9125:(e,t,n)=>{n.d(t,{Ay:()=>y,HX:()=>v,tT:()=>A});var r=n(8168),o=n(9369),a=n(6598),i=n(9436),l=n(1722),s=n(5043),c=n(918),u=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|fetchpriority|fetchPriority|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|popover|popoverTarget|popoverTargetAction|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,d=(0,c.A)(function(e){return u.test(e)||111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&e.charCodeAt(2)<91}),f=function(e){return"theme"!==e},p=function(e){return"string"===typeof e&&e.charCodeAt(0)>96?d:f},h=function(e,t,n){var r;if(t){var o=t.shouldForwardProp;r=e.__emotion_forwardProp&&o?function(t){return e.__emotion_forwardProp(t)&&o(t)}:o}return"function"!==typeof r&&n&&(r=e.__emotion_forwardProp),r},m=function(e){var t=e.cache,n=e.serialized,r=e.isStringTag;return(0,l.SF)(t,n,r),(0,i.s)(function(){return(0,l.sk)(t,n,r)}),null},g=function e(t,n){var i,c,u=t.__emotion_real===t,d=u&&t.__emotion_base||t;void 0!==n&&(i=n.label,c=n.target);var f=h(t,n,u),g=f||p(d),y=!g("as");return function(){var v=arguments,b=u&&void 0!==t.__emotion_styles?t.__emotion_styles.slice(0):[];if(void 0!==i&&b.push("label:"+i+";"),null==v[0]||void 0===v[0].raw)b.push.apply(b,v);else{var A=v[0];b.push(A[0]);for(var w=v.length,S=1;S<w;S++)b.push(v[S],A[S])}var k=(0,o.w)(function(e,t,n){var r=y&&e.as||d,i="",u=[],h=e;if(null==e.theme){for(var v in h={},e)h[v]=e[v];h.theme=s.useContext(o.T)}"string"===typeof e.className?i=(0,l.Rk)(t.registered,u,e.className):null!=e.className&&(i=e.className+" ");var A=(0,a.J)(b.concat(u),t.registered,h);i+=t.key+"-"+A.name,void 0!==c&&(i+=" "+c);var w=y&&void 0===f?p(r):g,S={};for(var k in e)y&&"as"===k||w(k)&&(S[k]=e[k]);return S.className=i,n&&(S.ref=n),s.createElement(s.Fragment,null,s.createElement(m,{cache:t,serialized:A,isStringTag:"string"===typeof r}),s.createElement(r,S))});return k.displayName=void 0!==i?i:"Styled("+("string"===typeof d?d:d.displayName||d.name||"Component")+")",k.defaultProps=t.defaultProps,k.__emotion_real=k,k.__emotion_base=d,k.__emotion_styles=b,k.__emotion_forwardProp=f,Object.defineProperty(k,"toString",{value:function(){return"."+c}}),k.withComponent=function(t,o){return e(t,(0,r.A)({},n,o,{shouldForwardProp:h(k,o,!0)})).apply(void 0,b)},k}}.bind(null);function y(e,t){return g(e,t)}function v(e,t){Array.isArray(e.__emotion_styles)&&(e.__emotion_styles=t(e.__emotion_styles))}["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"].forEach(function(e){g[e]=g(e)});const b=[];function A(e){return b[0]=e,(0,a.J)(b)}},9271:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(3129);const o=function(e,t){return t?(0,r.A)(e,t,{clone:!1}):e}},9369:(e,t,n)=>{n.d(t,{E:()=>m,T:()=>u,c:()=>p,h:()=>d,w:()=>c});var r=n(5043),o=n(3803),a=n(1722),i=n(6598),l=n(9436),s=r.createContext("undefined"!==typeof HTMLElement?(0,o.A)({key:"css"}):null),c=(s.Provider,function(e){return(0,r.forwardRef)(function(t,n){var o=(0,r.useContext)(s);return e(t,o,n)})}),u=r.createContext({});var d={}.hasOwnProperty,f="__EMOTION_TYPE_PLEASE_DO_NOT_USE__",p=function(e,t){var n={};for(var r in t)d.call(t,r)&&(n[r]=t[r]);return n[f]=e,n},h=function(e){var t=e.cache,n=e.serialized,r=e.isStringTag;return(0,a.SF)(t,n,r),(0,l.s)(function(){return(0,a.sk)(t,n,r)}),null},m=c(function(e,t,n){var o=e.css;"string"===typeof o&&void 0!==t.registered[o]&&(o=t.registered[o]);var l=e[f],s=[o],c="";"string"===typeof e.className?c=(0,a.Rk)(t.registered,s,e.className):null!=e.className&&(c=e.className+" ");var p=(0,i.J)(s,void 0,r.useContext(u));c+=t.key+"-"+p.name;var m={};for(var g in e)d.call(e,g)&&"css"!==g&&g!==f&&(m[g]=e[g]);return m.className=c,n&&(m.ref=n),r.createElement(r.Fragment,null,r.createElement(h,{cache:t,serialized:p,isStringTag:"string"===typeof l}),r.createElement(l,m))})},9379:(e,t,n)=>{n.d(t,{A:()=>a});var r=n(4467);function o(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function a(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?o(Object(n),!0).forEach(function(t){(0,r.A)(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):o(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}},9385:(e,t,n)=>{function r(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:window;const t=e.document.documentElement.clientWidth;return e.innerWidth-t}n.d(t,{A:()=>r})},9436:(e,t,n)=>{var r;n.d(t,{i:()=>l,s:()=>i});var o=n(5043),a=!!(r||(r=n.t(o,2))).useInsertionEffect&&(r||(r=n.t(o,2))).useInsertionEffect,i=a||function(e){return e()},l=a||o.useLayoutEffect},9526:(e,t,n)=>{function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}function o(e){var t=function(e,t){if("object"!=r(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var o=n.call(e,t||"default");if("object"!=r(o))return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==r(t)?t:t+""}n.d(t,{A:()=>o})},9699:(e,t,n)=>{n.d(t,{A:()=>Y});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(4167),c=n(8128),u=n(8301),d=n(8348),f=n(2674),p=n(4467),h=n(7307);class m{static create(){return new m}static use(){const e=(0,h.A)(m.create).current,[t,n]=a.useState(!1);return e.shouldMount=t,e.setShouldMount=n,a.useEffect(e.mountEffect,[t]),e}constructor(){(0,p.A)(this,"mountEffect",()=>{this.shouldMount&&!this.didMount&&null!==this.ref.current&&(this.didMount=!0,this.mounted.resolve())}),this.ref={current:null},this.mounted=null,this.didMount=!1,this.shouldMount=!1,this.setShouldMount=null}mount(){return this.mounted||(this.mounted=function(){let e,t;const n=new Promise((n,r)=>{e=n,t=r});return n.resolve=e,n.reject=t,n}(),this.shouldMount=!0,this.setShouldMount(this.shouldMount)),this.mounted}start(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];this.mount().then(()=>{var e;return null===(e=this.ref.current)||void 0===e?void 0:e.start(...t)})}stop(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];this.mount().then(()=>{var e;return null===(e=this.ref.current)||void 0===e?void 0:e.stop(...t)})}pulsate(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];this.mount().then(()=>{var e;return null===(e=this.ref.current)||void 0===e?void 0:e.pulsate(...t)})}}var g=n(7528),y=n(8587),v=n(8168);var b=n(5540),A=n(8726);function w(e,t){var n=Object.create(null);return e&&a.Children.map(e,function(e){return e}).forEach(function(e){n[e.key]=function(e){return t&&(0,a.isValidElement)(e)?t(e):e}(e)}),n}function S(e,t,n){return null!=n[t]?n[t]:e.props[t]}function k(e,t,n){var r=w(e.children),o=function(e,t){function n(n){return n in t?t[n]:e[n]}e=e||{},t=t||{};var r,o=Object.create(null),a=[];for(var i in e)i in t?a.length&&(o[i]=a,a=[]):a.push(i);var l={};for(var s in t){if(o[s])for(r=0;r<o[s].length;r++){var c=o[s][r];l[o[s][r]]=n(c)}l[s]=n(s)}for(r=0;r<a.length;r++)l[a[r]]=n(a[r]);return l}(t,r);return Object.keys(o).forEach(function(i){var l=o[i];if((0,a.isValidElement)(l)){var s=i in t,c=i in r,u=t[i],d=(0,a.isValidElement)(u)&&!u.props.in;!c||s&&!d?c||!s||d?c&&s&&(0,a.isValidElement)(u)&&(o[i]=(0,a.cloneElement)(l,{onExited:n.bind(null,l),in:u.props.in,exit:S(l,"exit",e),enter:S(l,"enter",e)})):o[i]=(0,a.cloneElement)(l,{in:!1}):o[i]=(0,a.cloneElement)(l,{onExited:n.bind(null,l),in:!0,exit:S(l,"exit",e),enter:S(l,"enter",e)})}}),o}var x=Object.values||function(e){return Object.keys(e).map(function(t){return e[t]})},C=function(e){function t(t,n){var r,o=(r=e.call(this,t,n)||this).handleExited.bind(function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(r));return r.state={contextValue:{isMounting:!0},handleExited:o,firstRender:!0},r}(0,b.A)(t,e);var n=t.prototype;return n.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},n.componentWillUnmount=function(){this.mounted=!1},t.getDerivedStateFromProps=function(e,t){var n,r,o=t.children,i=t.handleExited;return{children:t.firstRender?(n=e,r=i,w(n.children,function(e){return(0,a.cloneElement)(e,{onExited:r.bind(null,e),in:!0,appear:S(e,"appear",n),enter:S(e,"enter",n),exit:S(e,"exit",n)})})):k(e,o,i),firstRender:!1}},n.handleExited=function(e,t){var n=w(this.props.children);e.key in n||(e.props.onExited&&e.props.onExited(t),this.mounted&&this.setState(function(t){var n=(0,v.A)({},t.children);return delete n[e.key],{children:n}}))},n.render=function(){var e=this.props,t=e.component,n=e.childFactory,r=(0,y.A)(e,["component","childFactory"]),o=this.state.contextValue,i=x(this.state.children).map(n);return delete r.appear,delete r.enter,delete r.exit,null===t?a.createElement(A.A.Provider,{value:o},i):a.createElement(A.A.Provider,{value:o},a.createElement(t,r,i))},t}(a.Component);C.propTypes={},C.defaultProps={component:"div",childFactory:function(e){return e}};const E=C;var P=n(3115),T=n(3290),R=n(579);const O=function(e){const{className:t,classes:n,pulsate:r=!1,rippleX:o,rippleY:l,rippleSize:s,in:c,onExited:u,timeout:d}=e,[f,p]=a.useState(!1),h=(0,i.A)(t,n.ripple,n.rippleVisible,r&&n.ripplePulsate),m={width:s,height:s,top:-s/2+l,left:-s/2+o},g=(0,i.A)(n.child,f&&n.childLeaving,r&&n.childPulsate);return c||f||p(!0),a.useEffect(()=>{if(!c&&null!=u){const e=setTimeout(u,d);return()=>{clearTimeout(e)}}},[u,c,d]),(0,R.jsx)("span",{className:h,style:m,children:(0,R.jsx)("span",{className:g})})};var N=n(9857);const L=(0,N.A)("MuiTouchRipple",["root","ripple","rippleVisible","ripplePulsate","child","childLeaving","childPulsate"]),_=["center","classes","className"];var M,j,z,F;const I=(0,T.i7)(M||(M=(0,g.A)(["\n  0% {\n    transform: scale(0);\n    opacity: 0.1;\n  }\n\n  100% {\n    transform: scale(1);\n    opacity: 0.3;\n  }\n"]))),D=(0,T.i7)(j||(j=(0,g.A)(["\n  0% {\n    opacity: 1;\n  }\n\n  100% {\n    opacity: 0;\n  }\n"]))),B=(0,T.i7)(z||(z=(0,g.A)(["\n  0% {\n    transform: scale(1);\n  }\n\n  50% {\n    transform: scale(0.92);\n  }\n\n  100% {\n    transform: scale(1);\n  }\n"]))),U=(0,c.Ay)("span",{name:"MuiTouchRipple",slot:"Root"})({overflow:"hidden",pointerEvents:"none",position:"absolute",zIndex:0,top:0,right:0,bottom:0,left:0,borderRadius:"inherit"}),W=(0,c.Ay)(O,{name:"MuiTouchRipple",slot:"Ripple"})(F||(F=(0,g.A)(["\n  opacity: 0;\n  position: absolute;\n\n  &."," {\n    opacity: 0.3;\n    transform: scale(1);\n    animation-name: ",";\n    animation-duration: ","ms;\n    animation-timing-function: ",";\n  }\n\n  &."," {\n    animation-duration: ","ms;\n  }\n\n  & ."," {\n    opacity: 1;\n    display: block;\n    width: 100%;\n    height: 100%;\n    border-radius: 50%;\n    background-color: currentColor;\n  }\n\n  & ."," {\n    opacity: 0;\n    animation-name: ",";\n    animation-duration: ","ms;\n    animation-timing-function: ",";\n  }\n\n  & ."," {\n    position: absolute;\n    /* @noflip */\n    left: 0px;\n    top: 0;\n    animation-name: ",";\n    animation-duration: 2500ms;\n    animation-timing-function: ",";\n    animation-iteration-count: infinite;\n    animation-delay: 200ms;\n  }\n"])),L.rippleVisible,I,550,e=>{let{theme:t}=e;return t.transitions.easing.easeInOut},L.ripplePulsate,e=>{let{theme:t}=e;return t.transitions.duration.shorter},L.child,L.childLeaving,D,550,e=>{let{theme:t}=e;return t.transitions.easing.easeInOut},L.childPulsate,B,e=>{let{theme:t}=e;return t.transitions.easing.easeInOut}),H=a.forwardRef(function(e,t){const n=(0,u.b)({props:e,name:"MuiTouchRipple"}),{center:l=!1,classes:s={},className:c}=n,d=(0,o.A)(n,_),[f,p]=a.useState([]),h=a.useRef(0),m=a.useRef(null);a.useEffect(()=>{m.current&&(m.current(),m.current=null)},[f]);const g=a.useRef(!1),y=(0,P.A)(),v=a.useRef(null),b=a.useRef(null),A=a.useCallback(e=>{const{pulsate:t,rippleX:n,rippleY:r,rippleSize:o,cb:a}=e;p(e=>[...e,(0,R.jsx)(W,{classes:{ripple:(0,i.A)(s.ripple,L.ripple),rippleVisible:(0,i.A)(s.rippleVisible,L.rippleVisible),ripplePulsate:(0,i.A)(s.ripplePulsate,L.ripplePulsate),child:(0,i.A)(s.child,L.child),childLeaving:(0,i.A)(s.childLeaving,L.childLeaving),childPulsate:(0,i.A)(s.childPulsate,L.childPulsate)},timeout:550,pulsate:t,rippleX:n,rippleY:r,rippleSize:o},h.current)]),h.current+=1,m.current=a},[s]),w=a.useCallback(function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:()=>{};const{pulsate:r=!1,center:o=l||t.pulsate,fakeElement:a=!1}=t;if("mousedown"===(null===e||void 0===e?void 0:e.type)&&g.current)return void(g.current=!1);"touchstart"===(null===e||void 0===e?void 0:e.type)&&(g.current=!0);const i=a?null:b.current,s=i?i.getBoundingClientRect():{width:0,height:0,left:0,top:0};let c,u,d;if(o||void 0===e||0===e.clientX&&0===e.clientY||!e.clientX&&!e.touches)c=Math.round(s.width/2),u=Math.round(s.height/2);else{const{clientX:t,clientY:n}=e.touches&&e.touches.length>0?e.touches[0]:e;c=Math.round(t-s.left),u=Math.round(n-s.top)}if(o)d=Math.sqrt((2*s.width**2+s.height**2)/3),d%2===0&&(d+=1);else{const e=2*Math.max(Math.abs((i?i.clientWidth:0)-c),c)+2,t=2*Math.max(Math.abs((i?i.clientHeight:0)-u),u)+2;d=Math.sqrt(e**2+t**2)}null!==e&&void 0!==e&&e.touches?null===v.current&&(v.current=()=>{A({pulsate:r,rippleX:c,rippleY:u,rippleSize:d,cb:n})},y.start(80,()=>{v.current&&(v.current(),v.current=null)})):A({pulsate:r,rippleX:c,rippleY:u,rippleSize:d,cb:n})},[l,A,y]),S=a.useCallback(()=>{w({},{pulsate:!0})},[w]),k=a.useCallback((e,t)=>{if(y.clear(),"touchend"===(null===e||void 0===e?void 0:e.type)&&v.current)return v.current(),v.current=null,void y.start(0,()=>{k(e,t)});v.current=null,p(e=>e.length>0?e.slice(1):e),m.current=t},[y]);return a.useImperativeHandle(t,()=>({pulsate:S,start:w,stop:k}),[S,w,k]),(0,R.jsx)(U,(0,r.A)((0,r.A)({className:(0,i.A)(L.root,s.root,c),ref:b},d),{},{children:(0,R.jsx)(E,{component:null,exit:!0,children:f})}))});var V=n(6061);function $(e){return(0,V.Ay)("MuiButtonBase",e)}const q=(0,N.A)("MuiButtonBase",["root","disabled","focusVisible"]),K=["action","centerRipple","children","className","component","disabled","disableRipple","disableTouchRipple","focusRipple","focusVisibleClassName","LinkComponent","onBlur","onClick","onContextMenu","onDragLeave","onFocus","onFocusVisible","onKeyDown","onKeyUp","onMouseDown","onMouseLeave","onMouseUp","onTouchEnd","onTouchMove","onTouchStart","tabIndex","TouchRippleProps","touchRippleRef","type"],G=(0,c.Ay)("button",{name:"MuiButtonBase",slot:"Root"})({display:"inline-flex",alignItems:"center",justifyContent:"center",position:"relative",boxSizing:"border-box",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle",MozAppearance:"none",WebkitAppearance:"none",textDecoration:"none",color:"inherit","&::-moz-focus-inner":{borderStyle:"none"},["&.".concat(q.disabled)]:{pointerEvents:"none",cursor:"default"},"@media print":{colorAdjust:"exact"}});function Q(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]&&arguments[3];return(0,f.A)(o=>(n&&n(o),r||e[t](o),!0))}const Y=a.forwardRef(function(e,t){const n=(0,u.b)({props:e,name:"MuiButtonBase"}),{action:c,centerRipple:p=!1,children:h,className:g,component:y="button",disabled:v=!1,disableRipple:b=!1,disableTouchRipple:A=!1,focusRipple:w=!1,focusVisibleClassName:S,LinkComponent:k="a",onBlur:x,onClick:C,onContextMenu:E,onDragLeave:P,onFocus:T,onFocusVisible:O,onKeyDown:N,onKeyUp:L,onMouseDown:_,onMouseLeave:M,onMouseUp:j,onTouchEnd:z,onTouchMove:F,onTouchStart:I,tabIndex:D=0,TouchRippleProps:B,touchRippleRef:U,type:W}=n,V=(0,o.A)(n,K),q=a.useRef(null),Y=m.use(),X=(0,d.A)(Y.ref,U),[J,Z]=a.useState(!1);v&&J&&Z(!1),a.useImperativeHandle(c,()=>({focusVisible:()=>{Z(!0),q.current.focus()}}),[]);const ee=Y.shouldMount&&!b&&!v;a.useEffect(()=>{J&&w&&!b&&Y.pulsate()},[b,w,J,Y]);const te=Q(Y,"start",_,A),ne=Q(Y,"stop",E,A),re=Q(Y,"stop",P,A),oe=Q(Y,"stop",j,A),ae=Q(Y,"stop",e=>{J&&e.preventDefault(),M&&M(e)},A),ie=Q(Y,"start",I,A),le=Q(Y,"stop",z,A),se=Q(Y,"stop",F,A),ce=Q(Y,"stop",e=>{(0,s.A)(e.target)||Z(!1),x&&x(e)},!1),ue=(0,f.A)(e=>{q.current||(q.current=e.currentTarget),(0,s.A)(e.target)&&(Z(!0),O&&O(e)),T&&T(e)}),de=()=>{const e=q.current;return y&&"button"!==y&&!("A"===e.tagName&&e.href)},fe=(0,f.A)(e=>{w&&!e.repeat&&J&&" "===e.key&&Y.stop(e,()=>{Y.start(e)}),e.target===e.currentTarget&&de()&&" "===e.key&&e.preventDefault(),N&&N(e),e.target===e.currentTarget&&de()&&"Enter"===e.key&&!v&&(e.preventDefault(),C&&C(e))}),pe=(0,f.A)(e=>{w&&" "===e.key&&J&&!e.defaultPrevented&&Y.stop(e,()=>{Y.pulsate(e)}),L&&L(e),C&&e.target===e.currentTarget&&de()&&" "===e.key&&!e.defaultPrevented&&C(e)});let he=y;"button"===he&&(V.href||V.to)&&(he=k);const me={};"button"===he?(me.type=void 0===W?"button":W,me.disabled=v):(V.href||V.to||(me.role="button"),v&&(me["aria-disabled"]=v));const ge=(0,d.A)(t,q),ye=(0,r.A)((0,r.A)({},n),{},{centerRipple:p,component:y,disabled:v,disableRipple:b,disableTouchRipple:A,focusRipple:w,tabIndex:D,focusVisible:J}),ve=(e=>{const{disabled:t,focusVisible:n,focusVisibleClassName:r,classes:o}=e,a={root:["root",t&&"disabled",n&&"focusVisible"]},i=(0,l.A)(a,$,o);return n&&r&&(i.root+=" ".concat(r)),i})(ye);return(0,R.jsxs)(G,(0,r.A)((0,r.A)((0,r.A)({as:he,className:(0,i.A)(ve.root,g),ownerState:ye,onBlur:ce,onClick:C,onContextMenu:ne,onFocus:ue,onKeyDown:fe,onKeyUp:pe,onMouseDown:te,onMouseLeave:ae,onMouseUp:oe,onDragLeave:re,onTouchEnd:le,onTouchMove:se,onTouchStart:ie,ref:ge,tabIndex:v?-1:D,type:W},me),V),{},{children:[h,ee?(0,R.jsx)(H,(0,r.A)({ref:X,center:p},B)):null]}))})},9722:(e,t,n)=>{n.d(t,{A:()=>Pt});var r={};function o(e,t){return function(){return e.apply(t,arguments)}}n.r(r),n.d(r,{hasBrowserEnv:()=>ue,hasStandardBrowserEnv:()=>fe,hasStandardBrowserWebWorkerEnv:()=>pe,navigator:()=>de,origin:()=>he});const{toString:a}=Object.prototype,{getPrototypeOf:i}=Object,{iterator:l,toStringTag:s}=Symbol,c=(u=Object.create(null),e=>{const t=a.call(e);return u[t]||(u[t]=t.slice(8,-1).toLowerCase())});var u;const d=e=>(e=e.toLowerCase(),t=>c(t)===e),f=e=>t=>typeof t===e,{isArray:p}=Array,h=f("undefined");function m(e){return null!==e&&!h(e)&&null!==e.constructor&&!h(e.constructor)&&v(e.constructor.isBuffer)&&e.constructor.isBuffer(e)}const g=d("ArrayBuffer");const y=f("string"),v=f("function"),b=f("number"),A=e=>null!==e&&"object"===typeof e,w=e=>{if("object"!==c(e))return!1;const t=i(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(s in e)&&!(l in e)},S=d("Date"),k=d("File"),x=d("Blob"),C=d("FileList"),E=d("URLSearchParams"),[P,T,R,O]=["ReadableStream","Request","Response","Headers"].map(d);function N(e,t){let n,r,{allOwnKeys:o=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(null!==e&&"undefined"!==typeof e)if("object"!==typeof e&&(e=[e]),p(e))for(n=0,r=e.length;n<r;n++)t.call(null,e[n],n,e);else{if(m(e))return;const r=o?Object.getOwnPropertyNames(e):Object.keys(e),a=r.length;let i;for(n=0;n<a;n++)i=r[n],t.call(null,e[i],i,e)}}function L(e,t){if(m(e))return null;t=t.toLowerCase();const n=Object.keys(e);let r,o=n.length;for(;o-- >0;)if(r=n[o],t===r.toLowerCase())return r;return null}const _="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:global,M=e=>!h(e)&&e!==_;const j=(z="undefined"!==typeof Uint8Array&&i(Uint8Array),e=>z&&e instanceof z);var z;const F=d("HTMLFormElement"),I=(e=>{let{hasOwnProperty:t}=e;return(e,n)=>t.call(e,n)})(Object.prototype),D=d("RegExp"),B=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};N(n,(n,o)=>{let a;!1!==(a=t(n,o,e))&&(r[o]=a||n)}),Object.defineProperties(e,r)};const U=d("AsyncFunction"),W=((e,t)=>{return e?setImmediate:t?(n="axios@".concat(Math.random()),r=[],_.addEventListener("message",e=>{let{source:t,data:o}=e;t===_&&o===n&&r.length&&r.shift()()},!1),e=>{r.push(e),_.postMessage(n,"*")}):e=>setTimeout(e);var n,r})("function"===typeof setImmediate,v(_.postMessage)),H="undefined"!==typeof queueMicrotask?queueMicrotask.bind(_):"undefined"!==typeof process&&process.nextTick||W,V={isArray:p,isArrayBuffer:g,isBuffer:m,isFormData:e=>{let t;return e&&("function"===typeof FormData&&e instanceof FormData||v(e.append)&&("formdata"===(t=c(e))||"object"===t&&v(e.toString)&&"[object FormData]"===e.toString()))},isArrayBufferView:function(e){let t;return t="undefined"!==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView(e):e&&e.buffer&&g(e.buffer),t},isString:y,isNumber:b,isBoolean:e=>!0===e||!1===e,isObject:A,isPlainObject:w,isEmptyObject:e=>{if(!A(e)||m(e))return!1;try{return 0===Object.keys(e).length&&Object.getPrototypeOf(e)===Object.prototype}catch(t){return!1}},isReadableStream:P,isRequest:T,isResponse:R,isHeaders:O,isUndefined:h,isDate:S,isFile:k,isBlob:x,isRegExp:D,isFunction:v,isStream:e=>A(e)&&v(e.pipe),isURLSearchParams:E,isTypedArray:j,isFileList:C,forEach:N,merge:function e(){const{caseless:t,skipUndefined:n}=M(this)&&this||{},r={},o=(o,a)=>{const i=t&&L(r,a)||a;w(r[i])&&w(o)?r[i]=e(r[i],o):w(o)?r[i]=e({},o):p(o)?r[i]=o.slice():n&&h(o)||(r[i]=o)};for(let a=0,i=arguments.length;a<i;a++)arguments[a]&&N(arguments[a],o);return r},extend:function(e,t,n){let{allOwnKeys:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return N(t,(t,r)=>{n&&v(t)?e[r]=o(t,n):e[r]=t},{allOwnKeys:r}),e},trim:e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,""),stripBOM:e=>(65279===e.charCodeAt(0)&&(e=e.slice(1)),e),inherits:(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},toFlatObject:(e,t,n,r)=>{let o,a,l;const s={};if(t=t||{},null==e)return t;do{for(o=Object.getOwnPropertyNames(e),a=o.length;a-- >0;)l=o[a],r&&!r(l,e,t)||s[l]||(t[l]=e[l],s[l]=!0);e=!1!==n&&i(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},kindOf:c,kindOfTest:d,endsWith:(e,t,n)=>{e=String(e),(void 0===n||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return-1!==r&&r===n},toArray:e=>{if(!e)return null;if(p(e))return e;let t=e.length;if(!b(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},forEachEntry:(e,t)=>{const n=(e&&e[l]).call(e);let r;for(;(r=n.next())&&!r.done;){const n=r.value;t.call(e,n[0],n[1])}},matchAll:(e,t)=>{let n;const r=[];for(;null!==(n=e.exec(t));)r.push(n);return r},isHTMLForm:F,hasOwnProperty:I,hasOwnProp:I,reduceDescriptors:B,freezeMethods:e=>{B(e,(t,n)=>{if(v(e)&&-1!==["arguments","caller","callee"].indexOf(n))return!1;const r=e[n];v(r)&&(t.enumerable=!1,"writable"in t?t.writable=!1:t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")}))})},toObjectSet:(e,t)=>{const n={},r=e=>{e.forEach(e=>{n[e]=!0})};return p(e)?r(e):r(String(e).split(t)),n},toCamelCase:e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,function(e,t,n){return t.toUpperCase()+n}),noop:()=>{},toFiniteNumber:(e,t)=>null!=e&&Number.isFinite(e=+e)?e:t,findKey:L,global:_,isContextDefined:M,isSpecCompliantForm:function(e){return!!(e&&v(e.append)&&"FormData"===e[s]&&e[l])},toJSONObject:e=>{const t=new Array(10),n=(e,r)=>{if(A(e)){if(t.indexOf(e)>=0)return;if(m(e))return e;if(!("toJSON"in e)){t[r]=e;const o=p(e)?[]:{};return N(e,(e,t)=>{const a=n(e,r+1);!h(a)&&(o[t]=a)}),t[r]=void 0,o}}return e};return n(e,0)},isAsyncFn:U,isThenable:e=>e&&(A(e)||v(e))&&v(e.then)&&v(e.catch),setImmediate:W,asap:H,isIterable:e=>null!=e&&v(e[l])};function $(e,t,n,r,o){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),o&&(this.response=o,this.status=o.status?o.status:null)}V.inherits($,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:V.toJSONObject(this.config),code:this.code,status:this.status}}});const q=$.prototype,K={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach(e=>{K[e]={value:e}}),Object.defineProperties($,K),Object.defineProperty(q,"isAxiosError",{value:!0}),$.from=(e,t,n,r,o,a)=>{const i=Object.create(q);V.toFlatObject(e,i,function(e){return e!==Error.prototype},e=>"isAxiosError"!==e);const l=e&&e.message?e.message:"Error",s=null==t&&e?e.code:t;return $.call(i,l,s,n,r,o),e&&null==i.cause&&Object.defineProperty(i,"cause",{value:e,configurable:!0}),i.name=e&&e.name||"Error",a&&Object.assign(i,a),i};const G=$;function Q(e){return V.isPlainObject(e)||V.isArray(e)}function Y(e){return V.endsWith(e,"[]")?e.slice(0,-2):e}function X(e,t,n){return e?e.concat(t).map(function(e,t){return e=Y(e),!n&&t?"["+e+"]":e}).join(n?".":""):t}const J=V.toFlatObject(V,{},null,function(e){return/^is[A-Z]/.test(e)});const Z=function(e,t,n){if(!V.isObject(e))throw new TypeError("target must be an object");t=t||new FormData;const r=(n=V.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,function(e,t){return!V.isUndefined(t[e])})).metaTokens,o=n.visitor||c,a=n.dots,i=n.indexes,l=(n.Blob||"undefined"!==typeof Blob&&Blob)&&V.isSpecCompliantForm(t);if(!V.isFunction(o))throw new TypeError("visitor must be a function");function s(e){if(null===e)return"";if(V.isDate(e))return e.toISOString();if(V.isBoolean(e))return e.toString();if(!l&&V.isBlob(e))throw new G("Blob is not supported. Use a Buffer instead.");return V.isArrayBuffer(e)||V.isTypedArray(e)?l&&"function"===typeof Blob?new Blob([e]):Buffer.from(e):e}function c(e,n,o){let l=e;if(e&&!o&&"object"===typeof e)if(V.endsWith(n,"{}"))n=r?n:n.slice(0,-2),e=JSON.stringify(e);else if(V.isArray(e)&&function(e){return V.isArray(e)&&!e.some(Q)}(e)||(V.isFileList(e)||V.endsWith(n,"[]"))&&(l=V.toArray(e)))return n=Y(n),l.forEach(function(e,r){!V.isUndefined(e)&&null!==e&&t.append(!0===i?X([n],r,a):null===i?n:n+"[]",s(e))}),!1;return!!Q(e)||(t.append(X(o,n,a),s(e)),!1)}const u=[],d=Object.assign(J,{defaultVisitor:c,convertValue:s,isVisitable:Q});if(!V.isObject(e))throw new TypeError("data must be an object");return function e(n,r){if(!V.isUndefined(n)){if(-1!==u.indexOf(n))throw Error("Circular reference detected in "+r.join("."));u.push(n),V.forEach(n,function(n,a){!0===(!(V.isUndefined(n)||null===n)&&o.call(t,n,V.isString(a)?a.trim():a,r,d))&&e(n,r?r.concat(a):[a])}),u.pop()}}(e),t};function ee(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,function(e){return t[e]})}function te(e,t){this._pairs=[],e&&Z(e,this,t)}const ne=te.prototype;ne.append=function(e,t){this._pairs.push([e,t])},ne.toString=function(e){const t=e?function(t){return e.call(this,t,ee)}:ee;return this._pairs.map(function(e){return t(e[0])+"="+t(e[1])},"").join("&")};const re=te;function oe(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+")}function ae(e,t,n){if(!t)return e;const r=n&&n.encode||oe;V.isFunction(n)&&(n={serialize:n});const o=n&&n.serialize;let a;if(a=o?o(t,n):V.isURLSearchParams(t)?t.toString():new re(t,n).toString(r),a){const t=e.indexOf("#");-1!==t&&(e=e.slice(0,t)),e+=(-1===e.indexOf("?")?"?":"&")+a}return e}const ie=class{constructor(){this.handlers=[]}use(e,t,n){return this.handlers.push({fulfilled:e,rejected:t,synchronous:!!n&&n.synchronous,runWhen:n?n.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){V.forEach(this.handlers,function(t){null!==t&&e(t)})}},le={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1};var se=n(9379);const ce={isBrowser:!0,classes:{URLSearchParams:"undefined"!==typeof URLSearchParams?URLSearchParams:re,FormData:"undefined"!==typeof FormData?FormData:null,Blob:"undefined"!==typeof Blob?Blob:null},protocols:["http","https","file","blob","url","data"]},ue="undefined"!==typeof window&&"undefined"!==typeof document,de="object"===typeof navigator&&navigator||void 0,fe=ue&&(!de||["ReactNative","NativeScript","NS"].indexOf(de.product)<0),pe="undefined"!==typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&"function"===typeof self.importScripts,he=ue&&window.location.href||"http://localhost",me=(0,se.A)((0,se.A)({},r),ce);const ge=function(e){function t(e,n,r,o){let a=e[o++];if("__proto__"===a)return!0;const i=Number.isFinite(+a),l=o>=e.length;if(a=!a&&V.isArray(r)?r.length:a,l)return V.hasOwnProp(r,a)?r[a]=[r[a],n]:r[a]=n,!i;r[a]&&V.isObject(r[a])||(r[a]=[]);return t(e,n,r[a],o)&&V.isArray(r[a])&&(r[a]=function(e){const t={},n=Object.keys(e);let r;const o=n.length;let a;for(r=0;r<o;r++)a=n[r],t[a]=e[a];return t}(r[a])),!i}if(V.isFormData(e)&&V.isFunction(e.entries)){const n={};return V.forEachEntry(e,(e,r)=>{t(function(e){return V.matchAll(/\w+|\[(\w*)]/g,e).map(e=>"[]"===e[0]?"":e[1]||e[0])}(e),r,n,0)}),n}return null};const ye={transitional:le,adapter:["xhr","http","fetch"],transformRequest:[function(e,t){const n=t.getContentType()||"",r=n.indexOf("application/json")>-1,o=V.isObject(e);o&&V.isHTMLForm(e)&&(e=new FormData(e));if(V.isFormData(e))return r?JSON.stringify(ge(e)):e;if(V.isArrayBuffer(e)||V.isBuffer(e)||V.isStream(e)||V.isFile(e)||V.isBlob(e)||V.isReadableStream(e))return e;if(V.isArrayBufferView(e))return e.buffer;if(V.isURLSearchParams(e))return t.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let a;if(o){if(n.indexOf("application/x-www-form-urlencoded")>-1)return function(e,t){return Z(e,new me.classes.URLSearchParams,(0,se.A)({visitor:function(e,t,n,r){return me.isNode&&V.isBuffer(e)?(this.append(t,e.toString("base64")),!1):r.defaultVisitor.apply(this,arguments)}},t))}(e,this.formSerializer).toString();if((a=V.isFileList(e))||n.indexOf("multipart/form-data")>-1){const t=this.env&&this.env.FormData;return Z(a?{"files[]":e}:e,t&&new t,this.formSerializer)}}return o||r?(t.setContentType("application/json",!1),function(e,t,n){if(V.isString(e))try{return(t||JSON.parse)(e),V.trim(e)}catch(r){if("SyntaxError"!==r.name)throw r}return(n||JSON.stringify)(e)}(e)):e}],transformResponse:[function(e){const t=this.transitional||ye.transitional,n=t&&t.forcedJSONParsing,r="json"===this.responseType;if(V.isResponse(e)||V.isReadableStream(e))return e;if(e&&V.isString(e)&&(n&&!this.responseType||r)){const n=!(t&&t.silentJSONParsing)&&r;try{return JSON.parse(e,this.parseReviver)}catch(o){if(n){if("SyntaxError"===o.name)throw G.from(o,G.ERR_BAD_RESPONSE,this,null,this.response);throw o}}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:me.classes.FormData,Blob:me.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};V.forEach(["delete","get","head","post","put","patch"],e=>{ye.headers[e]={}});const ve=ye,be=V.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),Ae=Symbol("internals");function we(e){return e&&String(e).trim().toLowerCase()}function Se(e){return!1===e||null==e?e:V.isArray(e)?e.map(Se):String(e)}function ke(e,t,n,r,o){return V.isFunction(r)?r.call(this,t,n):(o&&(t=n),V.isString(t)?V.isString(r)?-1!==t.indexOf(r):V.isRegExp(r)?r.test(t):void 0:void 0)}class xe{constructor(e){e&&this.set(e)}set(e,t,n){const r=this;function o(e,t,n){const o=we(t);if(!o)throw new Error("header name must be a non-empty string");const a=V.findKey(r,o);(!a||void 0===r[a]||!0===n||void 0===n&&!1!==r[a])&&(r[a||t]=Se(e))}const a=(e,t)=>V.forEach(e,(e,n)=>o(e,n,t));if(V.isPlainObject(e)||e instanceof this.constructor)a(e,t);else if(V.isString(e)&&(e=e.trim())&&!/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim()))a((e=>{const t={};let n,r,o;return e&&e.split("\n").forEach(function(e){o=e.indexOf(":"),n=e.substring(0,o).trim().toLowerCase(),r=e.substring(o+1).trim(),!n||t[n]&&be[n]||("set-cookie"===n?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)}),t})(e),t);else if(V.isObject(e)&&V.isIterable(e)){let n,r,o={};for(const t of e){if(!V.isArray(t))throw TypeError("Object iterator must return a key-value pair");o[r=t[0]]=(n=o[r])?V.isArray(n)?[...n,t[1]]:[n,t[1]]:t[1]}a(o,t)}else null!=e&&o(t,e,n);return this}get(e,t){if(e=we(e)){const n=V.findKey(this,e);if(n){const e=this[n];if(!t)return e;if(!0===t)return function(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}(e);if(V.isFunction(t))return t.call(this,e,n);if(V.isRegExp(t))return t.exec(e);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,t){if(e=we(e)){const n=V.findKey(this,e);return!(!n||void 0===this[n]||t&&!ke(0,this[n],n,t))}return!1}delete(e,t){const n=this;let r=!1;function o(e){if(e=we(e)){const o=V.findKey(n,e);!o||t&&!ke(0,n[o],o,t)||(delete n[o],r=!0)}}return V.isArray(e)?e.forEach(o):o(e),r}clear(e){const t=Object.keys(this);let n=t.length,r=!1;for(;n--;){const o=t[n];e&&!ke(0,this[o],o,e,!0)||(delete this[o],r=!0)}return r}normalize(e){const t=this,n={};return V.forEach(this,(r,o)=>{const a=V.findKey(n,o);if(a)return t[a]=Se(r),void delete t[o];const i=e?function(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,(e,t,n)=>t.toUpperCase()+n)}(o):String(o).trim();i!==o&&delete t[o],t[i]=Se(r),n[i]=!0}),this}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.constructor.concat(this,...t)}toJSON(e){const t=Object.create(null);return V.forEach(this,(n,r)=>{null!=n&&!1!==n&&(t[r]=e&&V.isArray(n)?n.join(", "):n)}),t}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map(e=>{let[t,n]=e;return t+": "+n}).join("\n")}getSetCookie(){return this.get("set-cookie")||[]}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e){const t=new this(e);for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return r.forEach(e=>t.set(e)),t}static accessor(e){const t=(this[Ae]=this[Ae]={accessors:{}}).accessors,n=this.prototype;function r(e){const r=we(e);t[r]||(!function(e,t){const n=V.toCamelCase(" "+t);["get","set","has"].forEach(r=>{Object.defineProperty(e,r+n,{value:function(e,n,o){return this[r].call(this,t,e,n,o)},configurable:!0})})}(n,e),t[r]=!0)}return V.isArray(e)?e.forEach(r):r(e),this}}xe.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]),V.reduceDescriptors(xe.prototype,(e,t)=>{let{value:n}=e,r=t[0].toUpperCase()+t.slice(1);return{get:()=>n,set(e){this[r]=e}}}),V.freezeMethods(xe);const Ce=xe;function Ee(e,t){const n=this||ve,r=t||n,o=Ce.from(r.headers);let a=r.data;return V.forEach(e,function(e){a=e.call(n,a,o.normalize(),t?t.status:void 0)}),o.normalize(),a}function Pe(e){return!(!e||!e.__CANCEL__)}function Te(e,t,n){G.call(this,null==e?"canceled":e,G.ERR_CANCELED,t,n),this.name="CanceledError"}V.inherits(Te,G,{__CANCEL__:!0});const Re=Te;function Oe(e,t,n){const r=n.config.validateStatus;n.status&&r&&!r(n.status)?t(new G("Request failed with status code "+n.status,[G.ERR_BAD_REQUEST,G.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n)):e(n)}const Ne=function(e,t){e=e||10;const n=new Array(e),r=new Array(e);let o,a=0,i=0;return t=void 0!==t?t:1e3,function(l){const s=Date.now(),c=r[i];o||(o=s),n[a]=l,r[a]=s;let u=i,d=0;for(;u!==a;)d+=n[u++],u%=e;if(a=(a+1)%e,a===i&&(i=(i+1)%e),s-o<t)return;const f=c&&s-c;return f?Math.round(1e3*d/f):void 0}};const Le=function(e,t){let n,r,o=0,a=1e3/t;const i=function(t){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now();o=a,n=null,r&&(clearTimeout(r),r=null),e(...t)};return[function(){const e=Date.now(),t=e-o;for(var l=arguments.length,s=new Array(l),c=0;c<l;c++)s[c]=arguments[c];t>=a?i(s,e):(n=s,r||(r=setTimeout(()=>{r=null,i(n)},a-t)))},()=>n&&i(n)]},_e=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:3,r=0;const o=Ne(50,250);return Le(n=>{const a=n.loaded,i=n.lengthComputable?n.total:void 0,l=a-r,s=o(l);r=a;e({loaded:a,total:i,progress:i?a/i:void 0,bytes:l,rate:s||void 0,estimated:s&&i&&a<=i?(i-a)/s:void 0,event:n,lengthComputable:null!=i,[t?"download":"upload"]:!0})},n)},Me=(e,t)=>{const n=null!=e;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},je=e=>function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return V.asap(()=>e(...n))},ze=me.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,me.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(me.origin),me.navigator&&/(msie|trident)/i.test(me.navigator.userAgent)):()=>!0,Fe=me.hasStandardBrowserEnv?{write(e,t,n,r,o,a){const i=[e+"="+encodeURIComponent(t)];V.isNumber(n)&&i.push("expires="+new Date(n).toGMTString()),V.isString(r)&&i.push("path="+r),V.isString(o)&&i.push("domain="+o),!0===a&&i.push("secure"),document.cookie=i.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read:()=>null,remove(){}};function Ie(e,t,n){let r=!/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t);return e&&(r||0==n)?function(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}(e,t):t}const De=e=>e instanceof Ce?(0,se.A)({},e):e;function Be(e,t){t=t||{};const n={};function r(e,t,n,r){return V.isPlainObject(e)&&V.isPlainObject(t)?V.merge.call({caseless:r},e,t):V.isPlainObject(t)?V.merge({},t):V.isArray(t)?t.slice():t}function o(e,t,n,o){return V.isUndefined(t)?V.isUndefined(e)?void 0:r(void 0,e,0,o):r(e,t,0,o)}function a(e,t){if(!V.isUndefined(t))return r(void 0,t)}function i(e,t){return V.isUndefined(t)?V.isUndefined(e)?void 0:r(void 0,e):r(void 0,t)}function l(n,o,a){return a in t?r(n,o):a in e?r(void 0,n):void 0}const s={url:a,method:a,data:a,baseURL:i,transformRequest:i,transformResponse:i,paramsSerializer:i,timeout:i,timeoutMessage:i,withCredentials:i,withXSRFToken:i,adapter:i,responseType:i,xsrfCookieName:i,xsrfHeaderName:i,onUploadProgress:i,onDownloadProgress:i,decompress:i,maxContentLength:i,maxBodyLength:i,beforeRedirect:i,transport:i,httpAgent:i,httpsAgent:i,cancelToken:i,socketPath:i,responseEncoding:i,validateStatus:l,headers:(e,t,n)=>o(De(e),De(t),0,!0)};return V.forEach(Object.keys((0,se.A)((0,se.A)({},e),t)),function(r){const a=s[r]||o,i=a(e[r],t[r],r);V.isUndefined(i)&&a!==l||(n[r]=i)}),n}const Ue=e=>{const t=Be({},e);let{data:n,withXSRFToken:r,xsrfHeaderName:o,xsrfCookieName:a,headers:i,auth:l}=t;if(t.headers=i=Ce.from(i),t.url=ae(Ie(t.baseURL,t.url,t.allowAbsoluteUrls),e.params,e.paramsSerializer),l&&i.set("Authorization","Basic "+btoa((l.username||"")+":"+(l.password?unescape(encodeURIComponent(l.password)):""))),V.isFormData(n))if(me.hasStandardBrowserEnv||me.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(V.isFunction(n.getHeaders)){const e=n.getHeaders(),t=["content-type","content-length"];Object.entries(e).forEach(e=>{let[n,r]=e;t.includes(n.toLowerCase())&&i.set(n,r)})}if(me.hasStandardBrowserEnv&&(r&&V.isFunction(r)&&(r=r(t)),r||!1!==r&&ze(t.url))){const e=o&&a&&Fe.read(a);e&&i.set(o,e)}return t},We="undefined"!==typeof XMLHttpRequest&&function(e){return new Promise(function(t,n){const r=Ue(e);let o=r.data;const a=Ce.from(r.headers).normalize();let i,l,s,c,u,{responseType:d,onUploadProgress:f,onDownloadProgress:p}=r;function h(){c&&c(),u&&u(),r.cancelToken&&r.cancelToken.unsubscribe(i),r.signal&&r.signal.removeEventListener("abort",i)}let m=new XMLHttpRequest;function g(){if(!m)return;const r=Ce.from("getAllResponseHeaders"in m&&m.getAllResponseHeaders());Oe(function(e){t(e),h()},function(e){n(e),h()},{data:d&&"text"!==d&&"json"!==d?m.response:m.responseText,status:m.status,statusText:m.statusText,headers:r,config:e,request:m}),m=null}m.open(r.method.toUpperCase(),r.url,!0),m.timeout=r.timeout,"onloadend"in m?m.onloadend=g:m.onreadystatechange=function(){m&&4===m.readyState&&(0!==m.status||m.responseURL&&0===m.responseURL.indexOf("file:"))&&setTimeout(g)},m.onabort=function(){m&&(n(new G("Request aborted",G.ECONNABORTED,e,m)),m=null)},m.onerror=function(t){const r=t&&t.message?t.message:"Network Error",o=new G(r,G.ERR_NETWORK,e,m);o.event=t||null,n(o),m=null},m.ontimeout=function(){let t=r.timeout?"timeout of "+r.timeout+"ms exceeded":"timeout exceeded";const o=r.transitional||le;r.timeoutErrorMessage&&(t=r.timeoutErrorMessage),n(new G(t,o.clarifyTimeoutError?G.ETIMEDOUT:G.ECONNABORTED,e,m)),m=null},void 0===o&&a.setContentType(null),"setRequestHeader"in m&&V.forEach(a.toJSON(),function(e,t){m.setRequestHeader(t,e)}),V.isUndefined(r.withCredentials)||(m.withCredentials=!!r.withCredentials),d&&"json"!==d&&(m.responseType=r.responseType),p&&([s,u]=_e(p,!0),m.addEventListener("progress",s)),f&&m.upload&&([l,c]=_e(f),m.upload.addEventListener("progress",l),m.upload.addEventListener("loadend",c)),(r.cancelToken||r.signal)&&(i=t=>{m&&(n(!t||t.type?new Re(null,e,m):t),m.abort(),m=null)},r.cancelToken&&r.cancelToken.subscribe(i),r.signal&&(r.signal.aborted?i():r.signal.addEventListener("abort",i)));const y=function(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}(r.url);y&&-1===me.protocols.indexOf(y)?n(new G("Unsupported protocol "+y+":",G.ERR_BAD_REQUEST,e)):m.send(o||null)})},He=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let n,r=new AbortController;const o=function(e){if(!n){n=!0,i();const t=e instanceof Error?e:this.reason;r.abort(t instanceof G?t:new Re(t instanceof Error?t.message:t))}};let a=t&&setTimeout(()=>{a=null,o(new G("timeout ".concat(t," of ms exceeded"),G.ETIMEDOUT))},t);const i=()=>{e&&(a&&clearTimeout(a),a=null,e.forEach(e=>{e.unsubscribe?e.unsubscribe(o):e.removeEventListener("abort",o)}),e=null)};e.forEach(e=>e.addEventListener("abort",o));const{signal:l}=r;return l.unsubscribe=()=>V.asap(i),l}};function Ve(e,t){this.v=e,this.k=t}function $e(e){return function(){return new qe(e.apply(this,arguments))}}function qe(e){var t,n;function r(t,n){try{var a=e[t](n),i=a.value,l=i instanceof Ve;Promise.resolve(l?i.v:i).then(function(n){if(l){var s="return"===t?"return":"next";if(!i.k||n.done)return r(s,n);n=e[s](n).value}o(a.done?"return":"normal",n)},function(e){r("throw",e)})}catch(e){o("throw",e)}}function o(e,o){switch(e){case"return":t.resolve({value:o,done:!0});break;case"throw":t.reject(o);break;default:t.resolve({value:o,done:!1})}(t=t.next)?r(t.key,t.arg):n=null}this._invoke=function(e,o){return new Promise(function(a,i){var l={key:e,arg:o,resolve:a,reject:i,next:null};n?n=n.next=l:(t=n=l,r(e,o))})},"function"!=typeof e.return&&(this.return=void 0)}function Ke(e){return new Ve(e,0)}function Ge(e){var t={},n=!1;function r(t,r){return n=!0,r=new Promise(function(n){n(e[t](r))}),{done:!1,value:new Ve(r,1)}}return t["undefined"!=typeof Symbol&&Symbol.iterator||"@@iterator"]=function(){return this},t.next=function(e){return n?(n=!1,e):r("next",e)},"function"==typeof e.throw&&(t.throw=function(e){if(n)throw n=!1,e;return r("throw",e)}),"function"==typeof e.return&&(t.return=function(e){return n?(n=!1,e):r("return",e)}),t}function Qe(e){var t,n,r,o=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);o--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new Ye(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function Ye(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then(function(e){return{value:e,done:t}})}return Ye=function(e){this.s=e,this.n=e.next},Ye.prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new Ye(e)}qe.prototype["function"==typeof Symbol&&Symbol.asyncIterator||"@@asyncIterator"]=function(){return this},qe.prototype.next=function(e){return this._invoke("next",e)},qe.prototype.throw=function(e){return this._invoke("throw",e)},qe.prototype.return=function(e){return this._invoke("return",e)};const Xe=function*(e,t){let n=e.byteLength;if(!t||n<t)return void(yield e);let r,o=0;for(;o<n;)r=o+t,yield e.slice(o,r),o=r},Je=function(){var e=$e(function*(e,t){var n,r=!1,o=!1;try{for(var a,i=Qe(Ze(e));r=!(a=yield Ke(i.next())).done;r=!1){const e=a.value;yield*Ge(Qe(Xe(e,t)))}}catch(l){o=!0,n=l}finally{try{r&&null!=i.return&&(yield Ke(i.return()))}finally{if(o)throw n}}});return function(t,n){return e.apply(this,arguments)}}(),Ze=function(){var e=$e(function*(e){if(e[Symbol.asyncIterator])return void(yield*Ge(Qe(e)));const t=e.getReader();try{for(;;){const{done:e,value:n}=yield Ke(t.read());if(e)break;yield n}}finally{yield Ke(t.cancel())}});return function(t){return e.apply(this,arguments)}}(),et=(e,t,n,r)=>{const o=Je(e,t);let a,i=0,l=e=>{a||(a=!0,r&&r(e))};return new ReadableStream({async pull(e){try{const{done:t,value:r}=await o.next();if(t)return l(),void e.close();let a=r.byteLength;if(n){let e=i+=a;n(e)}e.enqueue(new Uint8Array(r))}catch(t){throw l(t),t}},cancel:e=>(l(e),o.return())},{highWaterMark:2})},{isFunction:tt}=V,nt=(e=>{let{Request:t,Response:n}=e;return{Request:t,Response:n}})(V.global),{ReadableStream:rt,TextEncoder:ot}=V.global,at=function(e){try{for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return!!e(...n)}catch(o){return!1}},it=e=>{e=V.merge.call({skipUndefined:!0},nt,e);const{fetch:t,Request:n,Response:r}=e,o=t?tt(t):"function"===typeof fetch,a=tt(n),i=tt(r);if(!o)return!1;const l=o&&tt(rt),s=o&&("function"===typeof ot?(c=new ot,e=>c.encode(e)):async e=>new Uint8Array(await new n(e).arrayBuffer()));var c;const u=a&&l&&at(()=>{let e=!1;const t=new n(me.origin,{body:new rt,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t}),d=i&&l&&at(()=>V.isReadableStream(new r("").body)),f={stream:d&&(e=>e.body)};o&&["text","arrayBuffer","blob","formData","stream"].forEach(e=>{!f[e]&&(f[e]=(t,n)=>{let r=t&&t[e];if(r)return r.call(t);throw new G("Response type '".concat(e,"' is not supported"),G.ERR_NOT_SUPPORT,n)})});const p=async(e,t)=>{const r=V.toFiniteNumber(e.getContentLength());return null==r?(async e=>{if(null==e)return 0;if(V.isBlob(e))return e.size;if(V.isSpecCompliantForm(e)){const t=new n(me.origin,{method:"POST",body:e});return(await t.arrayBuffer()).byteLength}return V.isArrayBufferView(e)||V.isArrayBuffer(e)?e.byteLength:(V.isURLSearchParams(e)&&(e+=""),V.isString(e)?(await s(e)).byteLength:void 0)})(t):r};return async e=>{let{url:o,method:i,data:l,signal:s,cancelToken:c,timeout:h,onDownloadProgress:m,onUploadProgress:g,responseType:y,headers:v,withCredentials:b="same-origin",fetchOptions:A}=Ue(e),w=t||fetch;y=y?(y+"").toLowerCase():"text";let S=He([s,c&&c.toAbortSignal()],h),k=null;const x=S&&S.unsubscribe&&(()=>{S.unsubscribe()});let C;try{if(g&&u&&"get"!==i&&"head"!==i&&0!==(C=await p(v,l))){let e,t=new n(o,{method:"POST",body:l,duplex:"half"});if(V.isFormData(l)&&(e=t.headers.get("content-type"))&&v.setContentType(e),t.body){const[e,n]=Me(C,_e(je(g)));l=et(t.body,65536,e,n)}}V.isString(b)||(b=b?"include":"omit");const t=a&&"credentials"in n.prototype,s=(0,se.A)((0,se.A)({},A),{},{signal:S,method:i.toUpperCase(),headers:v.normalize().toJSON(),body:l,duplex:"half",credentials:t?b:void 0});k=a&&new n(o,s);let c=await(a?w(k,A):w(o,s));const h=d&&("stream"===y||"response"===y);if(d&&(m||h&&x)){const e={};["status","statusText","headers"].forEach(t=>{e[t]=c[t]});const t=V.toFiniteNumber(c.headers.get("content-length")),[n,o]=m&&Me(t,_e(je(m),!0))||[];c=new r(et(c.body,65536,n,()=>{o&&o(),x&&x()}),e)}y=y||"text";let E=await f[V.findKey(f,y)||"text"](c,e);return!h&&x&&x(),await new Promise((t,n)=>{Oe(t,n,{data:E,headers:Ce.from(c.headers),status:c.status,statusText:c.statusText,config:e,request:k})})}catch(E){if(x&&x(),E&&"TypeError"===E.name&&/Load failed|fetch/i.test(E.message))throw Object.assign(new G("Network Error",G.ERR_NETWORK,e,k),{cause:E.cause||E});throw G.from(E,E&&E.code,e,k)}}},lt=new Map,st=e=>{let t=e?e.env:{};const{fetch:n,Request:r,Response:o}=t,a=[r,o,n];let i,l,s=a.length,c=lt;for(;s--;)i=a[s],l=c.get(i),void 0===l&&c.set(i,l=s?new Map:it(t)),c=l;return l},ct=(st(),{http:null,xhr:We,fetch:{get:st}});V.forEach(ct,(e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch(n){}Object.defineProperty(e,"adapterName",{value:t})}});const ut=e=>"- ".concat(e),dt=e=>V.isFunction(e)||null===e||!1===e,ft=(e,t)=>{e=V.isArray(e)?e:[e];const{length:n}=e;let r,o;const a={};for(let i=0;i<n;i++){let n;if(r=e[i],o=r,!dt(r)&&(o=ct[(n=String(r)).toLowerCase()],void 0===o))throw new G("Unknown adapter '".concat(n,"'"));if(o&&(V.isFunction(o)||(o=o.get(t))))break;a[n||"#"+i]=o}if(!o){const e=Object.entries(a).map(e=>{let[t,n]=e;return"adapter ".concat(t," ")+(!1===n?"is not supported by the environment":"is not available in the build")});let t=n?e.length>1?"since :\n"+e.map(ut).join("\n"):" "+ut(e[0]):"as no adapter specified";throw new G("There is no suitable adapter to dispatch the request "+t,"ERR_NOT_SUPPORT")}return o};function pt(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Re(null,e)}function ht(e){pt(e),e.headers=Ce.from(e.headers),e.data=Ee.call(e,e.transformRequest),-1!==["post","put","patch"].indexOf(e.method)&&e.headers.setContentType("application/x-www-form-urlencoded",!1);return ft(e.adapter||ve.adapter,e)(e).then(function(t){return pt(e),t.data=Ee.call(e,e.transformResponse,t),t.headers=Ce.from(t.headers),t},function(t){return Pe(t)||(pt(e),t&&t.response&&(t.response.data=Ee.call(e,e.transformResponse,t.response),t.response.headers=Ce.from(t.response.headers))),Promise.reject(t)})}const mt="1.12.2",gt={};["object","boolean","number","function","string","symbol"].forEach((e,t)=>{gt[e]=function(n){return typeof n===e||"a"+(t<1?"n ":" ")+e}});const yt={};gt.transitional=function(e,t,n){function r(e,t){return"[Axios v"+mt+"] Transitional option '"+e+"'"+t+(n?". "+n:"")}return(n,o,a)=>{if(!1===e)throw new G(r(o," has been removed"+(t?" in "+t:"")),G.ERR_DEPRECATED);return t&&!yt[o]&&(yt[o]=!0,console.warn(r(o," has been deprecated since v"+t+" and will be removed in the near future"))),!e||e(n,o,a)}},gt.spelling=function(e){return(t,n)=>(console.warn("".concat(n," is likely a misspelling of ").concat(e)),!0)};const vt={assertOptions:function(e,t,n){if("object"!==typeof e)throw new G("options must be an object",G.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let o=r.length;for(;o-- >0;){const a=r[o],i=t[a];if(i){const t=e[a],n=void 0===t||i(t,a,e);if(!0!==n)throw new G("option "+a+" must be "+n,G.ERR_BAD_OPTION_VALUE);continue}if(!0!==n)throw new G("Unknown option "+a,G.ERR_BAD_OPTION)}},validators:gt},bt=vt.validators;class At{constructor(e){this.defaults=e||{},this.interceptors={request:new ie,response:new ie}}async request(e,t){try{return await this._request(e,t)}catch(n){if(n instanceof Error){let e={};Error.captureStackTrace?Error.captureStackTrace(e):e=new Error;const t=e.stack?e.stack.replace(/^.+\n/,""):"";try{n.stack?t&&!String(n.stack).endsWith(t.replace(/^.+\n.+\n/,""))&&(n.stack+="\n"+t):n.stack=t}catch(r){}}throw n}}_request(e,t){"string"===typeof e?(t=t||{}).url=e:t=e||{},t=Be(this.defaults,t);const{transitional:n,paramsSerializer:r,headers:o}=t;void 0!==n&&vt.assertOptions(n,{silentJSONParsing:bt.transitional(bt.boolean),forcedJSONParsing:bt.transitional(bt.boolean),clarifyTimeoutError:bt.transitional(bt.boolean)},!1),null!=r&&(V.isFunction(r)?t.paramsSerializer={serialize:r}:vt.assertOptions(r,{encode:bt.function,serialize:bt.function},!0)),void 0!==t.allowAbsoluteUrls||(void 0!==this.defaults.allowAbsoluteUrls?t.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:t.allowAbsoluteUrls=!0),vt.assertOptions(t,{baseUrl:bt.spelling("baseURL"),withXsrfToken:bt.spelling("withXSRFToken")},!0),t.method=(t.method||this.defaults.method||"get").toLowerCase();let a=o&&V.merge(o.common,o[t.method]);o&&V.forEach(["delete","get","head","post","put","patch","common"],e=>{delete o[e]}),t.headers=Ce.concat(a,o);const i=[];let l=!0;this.interceptors.request.forEach(function(e){"function"===typeof e.runWhen&&!1===e.runWhen(t)||(l=l&&e.synchronous,i.unshift(e.fulfilled,e.rejected))});const s=[];let c;this.interceptors.response.forEach(function(e){s.push(e.fulfilled,e.rejected)});let u,d=0;if(!l){const e=[ht.bind(this),void 0];for(e.unshift(...i),e.push(...s),u=e.length,c=Promise.resolve(t);d<u;)c=c.then(e[d++],e[d++]);return c}u=i.length;let f=t;for(;d<u;){const e=i[d++],t=i[d++];try{f=e(f)}catch(p){t.call(this,p);break}}try{c=ht.call(this,f)}catch(p){return Promise.reject(p)}for(d=0,u=s.length;d<u;)c=c.then(s[d++],s[d++]);return c}getUri(e){return ae(Ie((e=Be(this.defaults,e)).baseURL,e.url,e.allowAbsoluteUrls),e.params,e.paramsSerializer)}}V.forEach(["delete","get","head","options"],function(e){At.prototype[e]=function(t,n){return this.request(Be(n||{},{method:e,url:t,data:(n||{}).data}))}}),V.forEach(["post","put","patch"],function(e){function t(t){return function(n,r,o){return this.request(Be(o||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:r}))}}At.prototype[e]=t(),At.prototype[e+"Form"]=t(!0)});const wt=At;class St{constructor(e){if("function"!==typeof e)throw new TypeError("executor must be a function.");let t;this.promise=new Promise(function(e){t=e});const n=this;this.promise.then(e=>{if(!n._listeners)return;let t=n._listeners.length;for(;t-- >0;)n._listeners[t](e);n._listeners=null}),this.promise.then=e=>{let t;const r=new Promise(e=>{n.subscribe(e),t=e}).then(e);return r.cancel=function(){n.unsubscribe(t)},r},e(function(e,r,o){n.reason||(n.reason=new Re(e,r,o),t(n.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){this.reason?e(this.reason):this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const t=this._listeners.indexOf(e);-1!==t&&this._listeners.splice(t,1)}toAbortSignal(){const e=new AbortController,t=t=>{e.abort(t)};return this.subscribe(t),e.signal.unsubscribe=()=>this.unsubscribe(t),e.signal}static source(){let e;return{token:new St(function(t){e=t}),cancel:e}}}const kt=St;const xt={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(xt).forEach(e=>{let[t,n]=e;xt[n]=t});const Ct=xt;const Et=function e(t){const n=new wt(t),r=o(wt.prototype.request,n);return V.extend(r,wt.prototype,n,{allOwnKeys:!0}),V.extend(r,n,null,{allOwnKeys:!0}),r.create=function(n){return e(Be(t,n))},r}(ve);Et.Axios=wt,Et.CanceledError=Re,Et.CancelToken=kt,Et.isCancel=Pe,Et.VERSION=mt,Et.toFormData=Z,Et.AxiosError=G,Et.Cancel=Et.CanceledError,Et.all=function(e){return Promise.all(e)},Et.spread=function(e){return function(t){return e.apply(null,t)}},Et.isAxiosError=function(e){return V.isObject(e)&&!0===e.isAxiosError},Et.mergeConfig=Be,Et.AxiosHeaders=Ce,Et.formToJSON=e=>ge(V.isHTMLForm(e)?new FormData(e):e),Et.getAdapter=ft,Et.HttpStatusCode=Ct,Et.default=Et;const Pt=Et},9801:(e,t,n)=>{n.d(t,{A:()=>g});var r=n(9379),o=n(45),a=n(5043),i=n(8387),l=n(1807),s=n(8128),c=n(1612),u=n(8301),d=n(6057),f=n(9066),p=n(579);const h=["className"],m=(0,s.Ay)("div",{name:"MuiListItemIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"flex-start"===n.alignItems&&t.alignItemsFlexStart]}})((0,c.A)(e=>{let{theme:t}=e;return{minWidth:56,color:(t.vars||t).palette.action.active,flexShrink:0,display:"inline-flex",variants:[{props:{alignItems:"flex-start"},style:{marginTop:8}}]}})),g=a.forwardRef(function(e,t){const n=(0,u.b)({props:e,name:"MuiListItemIcon"}),{className:s}=n,c=(0,o.A)(n,h),g=a.useContext(f.A),y=(0,r.A)((0,r.A)({},n),{},{alignItems:g.alignItems}),v=(e=>{const{alignItems:t,classes:n}=e,r={root:["root","flex-start"===t&&"alignItemsFlexStart"]};return(0,l.A)(r,d.f,n)})(y);return(0,p.jsx)(m,(0,r.A)({className:(0,i.A)(v.root,s),ownerState:y,ref:t},c))})},9826:(e,t,n)=>{n.d(t,{X4:()=>f,e$:()=>h,eM:()=>d,YL:()=>c,a:()=>g,Cg:()=>p,Me:()=>l,Nd:()=>m,Y9:()=>v,j4:()=>y});var r=n(2065);const o=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Number.MIN_SAFE_INTEGER,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:Number.MAX_SAFE_INTEGER;return Math.max(t,Math.min(e,n))};function a(e){return o(e,arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,arguments.length>2&&void 0!==arguments[2]?arguments[2]:1)}function i(e){if(e.type)return e;if("#"===e.charAt(0))return i(function(e){e=e.slice(1);const t=new RegExp(".{1,".concat(e.length>=6?2:1,"}"),"g");let n=e.match(t);return n&&1===n[0].length&&(n=n.map(e=>e+e)),n?"rgb".concat(4===n.length?"a":"","(").concat(n.map((e,t)=>t<3?parseInt(e,16):Math.round(parseInt(e,16)/255*1e3)/1e3).join(", "),")"):""}(e));const t=e.indexOf("("),n=e.substring(0,t);if(!["rgb","rgba","hsl","hsla","color"].includes(n))throw new Error((0,r.A)(9,e));let o,a=e.substring(t+1,e.length-1);if("color"===n){if(a=a.split(" "),o=a.shift(),4===a.length&&"/"===a[3].charAt(0)&&(a[3]=a[3].slice(1)),!["srgb","display-p3","a98-rgb","prophoto-rgb","rec-2020"].includes(o))throw new Error((0,r.A)(10,o))}else a=a.split(",");return a=a.map(e=>parseFloat(e)),{type:n,values:a,colorSpace:o}}const l=(e,t)=>{try{return(e=>{const t=i(e);return t.values.slice(0,3).map((e,n)=>t.type.includes("hsl")&&0!==n?"".concat(e,"%"):e).join(" ")})(e)}catch(n){return e}};function s(e){const{type:t,colorSpace:n}=e;let{values:r}=e;return t.includes("rgb")?r=r.map((e,t)=>t<3?parseInt(e,10):e):t.includes("hsl")&&(r[1]="".concat(r[1],"%"),r[2]="".concat(r[2],"%")),r=t.includes("color")?"".concat(n," ").concat(r.join(" ")):"".concat(r.join(", ")),"".concat(t,"(").concat(r,")")}function c(e){e=i(e);const{values:t}=e,n=t[0],r=t[1]/100,o=t[2]/100,a=r*Math.min(o,1-o),l=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:(e+n/30)%12;return o-a*Math.max(Math.min(t-3,9-t,1),-1)};let c="rgb";const u=[Math.round(255*l(0)),Math.round(255*l(8)),Math.round(255*l(4))];return"hsla"===e.type&&(c+="a",u.push(t[3])),s({type:c,values:u})}function u(e){let t="hsl"===(e=i(e)).type||"hsla"===e.type?i(c(e)).values:e.values;return t=t.map(t=>("color"!==e.type&&(t/=255),t<=.03928?t/12.92:((t+.055)/1.055)**2.4)),Number((.2126*t[0]+.7152*t[1]+.0722*t[2]).toFixed(3))}function d(e,t){const n=u(e),r=u(t);return(Math.max(n,r)+.05)/(Math.min(n,r)+.05)}function f(e,t){return e=i(e),t=a(t),"rgb"!==e.type&&"hsl"!==e.type||(e.type+="a"),"color"===e.type?e.values[3]="/".concat(t):e.values[3]=t,s(e)}function p(e,t,n){try{return f(e,t)}catch(r){return e}}function h(e,t){if(e=i(e),t=a(t),e.type.includes("hsl"))e.values[2]*=1-t;else if(e.type.includes("rgb")||e.type.includes("color"))for(let n=0;n<3;n+=1)e.values[n]*=1-t;return s(e)}function m(e,t,n){try{return h(e,t)}catch(r){return e}}function g(e,t){if(e=i(e),t=a(t),e.type.includes("hsl"))e.values[2]+=(100-e.values[2])*t;else if(e.type.includes("rgb"))for(let n=0;n<3;n+=1)e.values[n]+=(255-e.values[n])*t;else if(e.type.includes("color"))for(let n=0;n<3;n+=1)e.values[n]+=(1-e.values[n])*t;return s(e)}function y(e,t,n){try{return g(e,t)}catch(r){return e}}function v(e,t,n){try{return function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.15;return u(e)>.5?h(e,t):g(e,t)}(e,t)}catch(r){return e}}},9857:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(6061);function o(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"Mui";const o={};return t.forEach(t=>{o[t]=(0,r.Ay)(e,t,n)}),o}},9905:(e,t,n)=>{n.d(t,{A:()=>f});var r=n(9379),o=n(45),a=n(1767),i=n(8211),l=n(1033),s=n(6155);const c=["className","elementType","ownerState","externalForwardedProps","internalForwardedProps","shouldForwardComponentProp"],u=["component","slots","slotProps"],d=["component"];function f(e,t){const{className:n,elementType:f,ownerState:p,externalForwardedProps:h,internalForwardedProps:m,shouldForwardComponentProp:g=!1}=t,y=(0,o.A)(t,c),{component:v,slots:b={[e]:void 0},slotProps:A={[e]:void 0}}=h,w=(0,o.A)(h,u),S=b[e]||f,k=(0,l.A)(A[e],p),x=(0,s.A)((0,r.A)((0,r.A)({className:n},y),{},{externalForwardedProps:"root"===e?w:void 0,externalSlotProps:k})),{props:{component:C},internalRef:E}=x,P=(0,o.A)(x.props,d),T=(0,a.A)(E,null===k||void 0===k?void 0:k.ref,t.ref),R="root"===e?C||v:C;return[S,(0,i.A)(S,(0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)((0,r.A)({},"root"===e&&!v&&!b[e]&&m),"root"!==e&&!b[e]&&m),P),R&&!g&&{as:R}),R&&g&&{component:R}),{},{ref:T}),p)]}},9927:(e,t,n)=>{n.d(t,{A:()=>o});var r=n(1834);function o(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:8,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:(0,r.LX)({spacing:e});if(e.mui)return e;const n=function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return(0===n.length?[1]:n).map(e=>{const n=t(e);return"number"===typeof n?"".concat(n,"px"):n}).join(" ")};return n.mui=!0,n}},9992:(e,t,n)=>{n.d(t,{A:()=>A});var r=n(9379),o=n(5043),a=n(45),i=n(8387),l=n(1807),s=n(7194),c=n(8128),u=n(1612),d=n(8301),f=n(9857),p=n(6061);function h(e){return(0,p.Ay)("MuiSvgIcon",e)}(0,f.A)("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);var m=n(579);const g=["children","className","color","component","fontSize","htmlColor","inheritViewBox","titleAccess","viewBox"],y=(0,c.Ay)("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"inherit"!==n.color&&t["color".concat((0,s.A)(n.color))],t["fontSize".concat((0,s.A)(n.fontSize))]]}})((0,u.A)(e=>{var t,n,r,o,a,i,l,s,c,u,d,f,p,h,m;let{theme:g}=e;return{userSelect:"none",width:"1em",height:"1em",display:"inline-block",flexShrink:0,transition:null===(t=g.transitions)||void 0===t||null===(n=t.create)||void 0===n?void 0:n.call(t,"fill",{duration:null===(r=(null!==(o=g.vars)&&void 0!==o?o:g).transitions)||void 0===r||null===(r=r.duration)||void 0===r?void 0:r.shorter}),variants:[{props:e=>!e.hasSvgAsChild,style:{fill:"currentColor"}},{props:{fontSize:"inherit"},style:{fontSize:"inherit"}},{props:{fontSize:"small"},style:{fontSize:(null===(a=g.typography)||void 0===a||null===(i=a.pxToRem)||void 0===i?void 0:i.call(a,20))||"1.25rem"}},{props:{fontSize:"medium"},style:{fontSize:(null===(l=g.typography)||void 0===l||null===(s=l.pxToRem)||void 0===s?void 0:s.call(l,24))||"1.5rem"}},{props:{fontSize:"large"},style:{fontSize:(null===(c=g.typography)||void 0===c||null===(u=c.pxToRem)||void 0===u?void 0:u.call(c,35))||"2.1875rem"}},...Object.entries((null!==(d=g.vars)&&void 0!==d?d:g).palette).filter(e=>{let[,t]=e;return t&&t.main}).map(e=>{var t,n;let[r]=e;return{props:{color:r},style:{color:null===(t=(null!==(n=g.vars)&&void 0!==n?n:g).palette)||void 0===t||null===(t=t[r])||void 0===t?void 0:t.main}}}),{props:{color:"action"},style:{color:null===(f=(null!==(p=g.vars)&&void 0!==p?p:g).palette)||void 0===f||null===(f=f.action)||void 0===f?void 0:f.active}},{props:{color:"disabled"},style:{color:null===(h=(null!==(m=g.vars)&&void 0!==m?m:g).palette)||void 0===h||null===(h=h.action)||void 0===h?void 0:h.disabled}},{props:{color:"inherit"},style:{color:void 0}}]}})),v=o.forwardRef(function(e,t){const n=(0,d.b)({props:e,name:"MuiSvgIcon"}),{children:c,className:u,color:f="inherit",component:p="svg",fontSize:v="medium",htmlColor:b,inheritViewBox:A=!1,titleAccess:w,viewBox:S="0 0 24 24"}=n,k=(0,a.A)(n,g),x=o.isValidElement(c)&&"svg"===c.type,C=(0,r.A)((0,r.A)({},n),{},{color:f,component:p,fontSize:v,instanceFontSize:e.fontSize,inheritViewBox:A,viewBox:S,hasSvgAsChild:x}),E={};A||(E.viewBox=S);const P=(e=>{const{color:t,fontSize:n,classes:r}=e,o={root:["root","inherit"!==t&&"color".concat((0,s.A)(t)),"fontSize".concat((0,s.A)(n))]};return(0,l.A)(o,h,r)})(C);return(0,m.jsxs)(y,(0,r.A)((0,r.A)((0,r.A)((0,r.A)({as:p,className:(0,i.A)(P.root,u),focusable:"false",color:b,"aria-hidden":!w||void 0,role:w?"img":void 0,ref:t},E),k),x&&c.props),{},{ownerState:C,children:[x?c.props.children:c,w?(0,m.jsx)("title",{children:w}):null]}))});v.muiName="SvgIcon";const b=v;function A(e,t){function n(t,n){return(0,m.jsx)(b,(0,r.A)((0,r.A)({"data-testid":void 0,ref:n},t),{},{children:e}))}return n.muiName=b.muiName,o.memo(o.forwardRef(n))}},9998:(e,t,n)=>{n.d(t,{Ay:()=>g});var r=n(8587),o=n(5540),a=n(5043),i=n(7950);const l=!1;var s=n(8726),c="unmounted",u="exited",d="entering",f="entered",p="exiting",h=function(e){function t(t,n){var r;r=e.call(this,t,n)||this;var o,a=n&&!n.isMounting?t.enter:t.appear;return r.appearStatus=null,t.in?a?(o=u,r.appearStatus=d):o=f:o=t.unmountOnExit||t.mountOnEnter?c:u,r.state={status:o},r.nextCallback=null,r}(0,o.A)(t,e),t.getDerivedStateFromProps=function(e,t){return e.in&&t.status===c?{status:u}:null};var n=t.prototype;return n.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},n.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?n!==d&&n!==f&&(t=d):n!==d&&n!==f||(t=p)}this.updateStatus(!1,t)},n.componentWillUnmount=function(){this.cancelNextCallback()},n.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!==typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},n.updateStatus=function(e,t){if(void 0===e&&(e=!1),null!==t)if(this.cancelNextCallback(),t===d){if(this.props.unmountOnExit||this.props.mountOnEnter){var n=this.props.nodeRef?this.props.nodeRef.current:i.findDOMNode(this);n&&function(e){e.scrollTop}(n)}this.performEnter(e)}else this.performExit();else this.props.unmountOnExit&&this.state.status===u&&this.setState({status:c})},n.performEnter=function(e){var t=this,n=this.props.enter,r=this.context?this.context.isMounting:e,o=this.props.nodeRef?[r]:[i.findDOMNode(this),r],a=o[0],s=o[1],c=this.getTimeouts(),u=r?c.appear:c.enter;!e&&!n||l?this.safeSetState({status:f},function(){t.props.onEntered(a)}):(this.props.onEnter(a,s),this.safeSetState({status:d},function(){t.props.onEntering(a,s),t.onTransitionEnd(u,function(){t.safeSetState({status:f},function(){t.props.onEntered(a,s)})})}))},n.performExit=function(){var e=this,t=this.props.exit,n=this.getTimeouts(),r=this.props.nodeRef?void 0:i.findDOMNode(this);t&&!l?(this.props.onExit(r),this.safeSetState({status:p},function(){e.props.onExiting(r),e.onTransitionEnd(n.exit,function(){e.safeSetState({status:u},function(){e.props.onExited(r)})})})):this.safeSetState({status:u},function(){e.props.onExited(r)})},n.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},n.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},n.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},n.onTransitionEnd=function(e,t){this.setNextCallback(t);var n=this.props.nodeRef?this.props.nodeRef.current:i.findDOMNode(this),r=null==e&&!this.props.addEndListener;if(n&&!r){if(this.props.addEndListener){var o=this.props.nodeRef?[this.nextCallback]:[n,this.nextCallback],a=o[0],l=o[1];this.props.addEndListener(a,l)}null!=e&&setTimeout(this.nextCallback,e)}else setTimeout(this.nextCallback,0)},n.render=function(){var e=this.state.status;if(e===c)return null;var t=this.props,n=t.children,o=(t.in,t.mountOnEnter,t.unmountOnExit,t.appear,t.enter,t.exit,t.timeout,t.addEndListener,t.onEnter,t.onEntering,t.onEntered,t.onExit,t.onExiting,t.onExited,t.nodeRef,(0,r.A)(t,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]));return a.createElement(s.A.Provider,{value:null},"function"===typeof n?n(e,o):a.cloneElement(a.Children.only(n),o))},t}(a.Component);function m(){}h.contextType=s.A,h.propTypes={},h.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:m,onEntering:m,onEntered:m,onExit:m,onExiting:m,onExited:m},h.UNMOUNTED=c,h.EXITED=u,h.ENTERING=d,h.ENTERED=f,h.EXITING=p;const g=h}},t={};function n(r){var o=t[r];if(void 0!==o)return o.exports;var a=t[r]={exports:{}};return e[r](a,a.exports,n),a.exports}n.m=e,n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},(()=>{var e,t=Object.getPrototypeOf?e=>Object.getPrototypeOf(e):e=>e.__proto__;n.t=function(r,o){if(1&o&&(r=this(r)),8&o)return r;if("object"===typeof r&&r){if(4&o&&r.__esModule)return r;if(16&o&&"function"===typeof r.then)return r}var a=Object.create(null);n.r(a);var i={};e=e||[null,t({}),t([]),t(t)];for(var l=2&o&&r;("object"==typeof l||"function"==typeof l)&&!~e.indexOf(l);l=t(l))Object.getOwnPropertyNames(l).forEach(e=>i[e]=()=>r[e]);return i.default=()=>r,n.d(a,i),a}})(),n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.f={},n.e=e=>Promise.all(Object.keys(n.f).reduce((t,r)=>(n.f[r](e,t),t),[])),n.u=e=>"static/js/"+e+"."+{30:"6881fd9f",118:"4a4b5da8",145:"c09f590c",167:"81cf3a27",295:"288cf2d0",361:"6f176300",453:"54292a4b",465:"38cd14e5",556:"d63353ee",615:"0147b820",684:"0cc9096f",759:"f769f098",852:"3d6e82f7",940:"3c72a459",972:"0f58f367"}[e]+".chunk.js",n.miniCssF=e=>{},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),(()=>{var e={},t="frontend:";n.l=(r,o,a,i)=>{if(e[r])e[r].push(o);else{var l,s;if(void 0!==a)for(var c=document.getElementsByTagName("script"),u=0;u<c.length;u++){var d=c[u];if(d.getAttribute("src")==r||d.getAttribute("data-webpack")==t+a){l=d;break}}l||(s=!0,(l=document.createElement("script")).charset="utf-8",l.timeout=120,n.nc&&l.setAttribute("nonce",n.nc),l.setAttribute("data-webpack",t+a),l.src=r),e[r]=[o];var f=(t,n)=>{l.onerror=l.onload=null,clearTimeout(p);var o=e[r];if(delete e[r],l.parentNode&&l.parentNode.removeChild(l),o&&o.forEach(e=>e(n)),t)return t(n)},p=setTimeout(f.bind(null,void 0,{type:"timeout",target:l}),12e4);l.onerror=f.bind(null,l.onerror),l.onload=f.bind(null,l.onload),s&&document.head.appendChild(l)}}})(),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.p="/",(()=>{var e={792:0};n.f.j=(t,r)=>{var o=n.o(e,t)?e[t]:void 0;if(0!==o)if(o)r.push(o[2]);else{var a=new Promise((n,r)=>o=e[t]=[n,r]);r.push(o[2]=a);var i=n.p+n.u(t),l=new Error;n.l(i,r=>{if(n.o(e,t)&&(0!==(o=e[t])&&(e[t]=void 0),o)){var a=r&&("load"===r.type?"missing":r.type),i=r&&r.target&&r.target.src;l.message="Loading chunk "+t+" failed.\n("+a+": "+i+")",l.name="ChunkLoadError",l.type=a,l.request=i,o[1](l)}},"chunk-"+t,t)}};var t=(t,r)=>{var o,a,i=r[0],l=r[1],s=r[2],c=0;if(i.some(t=>0!==e[t])){for(o in l)n.o(l,o)&&(n.m[o]=l[o]);if(s)s(n)}for(t&&t(r);c<i.length;c++)a=i[c],n.o(e,a)&&e[a]&&e[a][0](),e[a]=0},r=self.webpackChunkfrontend=self.webpackChunkfrontend||[];r.forEach(t.bind(null,0)),r.push=t.bind(null,r.push.bind(r))})();var r=n(5043),o=n(4391),a=n(5352),i=n(9722),l=n(7990);const s=(0,l.A)({palette:{primary:{main:"#7E57C2"},secondary:{main:"#6C757D"},neutral:{dark:"#1E293B",main:"#64748B",light:"#F1F5F9"},background:{default:"#F4F6F8",paper:"#FFFFFF"},success:{main:"#28A745"},error:{main:"#DC3545"}},typography:{fontFamily:'"Public Sans", -apple-system, BlinkMacSystemFont, "Segoe UI", "Roboto", "Helvetica", "Arial", sans-serif',h2:{fontSize:"1.75rem",fontWeight:700,marginBottom:"1rem"},h3:{fontSize:"1.25rem",fontWeight:700}},components:{MuiCard:{styleOverrides:{root:{boxShadow:"0px 0px 15px 0px rgba(0,0,0,0.05)",borderRadius:12}}},MuiButton:{styleOverrides:{root:{textTransform:"none",borderRadius:8,fontWeight:600}}},MuiAppBar:{styleOverrides:{root:{backgroundColor:"#FFFFFF",color:"#000000",boxShadow:"none",borderBottom:"1px solid #E0E0E0"}}},MuiDrawer:{styleOverrides:{paper:{borderRight:"none"}}}}});var c=n(3969),u=n(9826),d=n(3209),f=n(9379),p=n(45);const h=r.createContext(null);function m(){return r.useContext(h)}const g="function"===typeof Symbol&&Symbol.for?Symbol.for("mui.nested"):"__THEME_NESTED__";var y=n(579);const v=function(e){const{children:t,theme:n}=e,o=m(),a=r.useMemo(()=>{const e=null===o?(0,f.A)({},n):function(e,t){if("function"===typeof t)return t(e);return(0,f.A)((0,f.A)({},e),t)}(o,n);return null!=e&&(e[g]=null!==o),e},[n,o]);return(0,y.jsx)(h.Provider,{value:a,children:t})};var b=n(9369),A=n(5651),w=n(2432),S=n(6009),k=n(6509),x=n(713),C=n(99);const E={};function P(e,t,n){let o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];return r.useMemo(()=>{const r=e&&t[e]||t;if("function"===typeof n){const a=n(r),i=e?(0,f.A)((0,f.A)({},t),{},{[e]:a}):a;return o?()=>i:i}return e?(0,f.A)((0,f.A)({},t),{},{[e]:n}):(0,f.A)((0,f.A)({},t),n)},[e,t,n,o])}const T=function(e){const{children:t,theme:n,themeId:r}=e,o=(0,A.A)(E),a=m()||E,i=P(r,o,n),l=P(r,a,n,!0),s="rtl"===(r?i[r]:i).direction,c=function(e){const t=(0,A.A)(),n=(0,x.A)()||"",{modularCssLayers:r}=e;let o="mui.global, mui.components, mui.theme, mui.custom, mui.sx";return o=r&&null===t?"string"===typeof r?r.replace(/mui(?!\.)/g,o):"@layer ".concat(o,";"):"",(0,k.A)(()=>{const e=document.querySelector("head");if(!e)return;const t=e.firstChild;if(o){var r;if(t&&null!==(r=t.hasAttribute)&&void 0!==r&&r.call(t,"data-mui-layer-order")&&t.getAttribute("data-mui-layer-order")===n)return;const a=document.createElement("style");a.setAttribute("data-mui-layer-order",n),a.textContent=o,e.prepend(a)}else{var a;null===(a=e.querySelector('style[data-mui-layer-order="'.concat(n,'"]')))||void 0===a||a.remove()}},[o,n]),o?(0,y.jsx)(C.A,{styles:o}):null}(i);return(0,y.jsx)(v,{theme:l,children:(0,y.jsx)(b.T.Provider,{value:i,children:(0,y.jsx)(w.A,{value:s,children:(0,y.jsxs)(S.A,{value:r?i[r].components:i.components,children:[c,t]})})})})};var R=n(416);const O=["theme"];function N(e){let{theme:t}=e,n=(0,p.A)(e,O);const r=R.A in t?t[R.A]:void 0;return(0,y.jsx)(T,(0,f.A)((0,f.A)({},n),{},{themeId:r?R.A:void 0,theme:r||t}))}var L=n(8623),_=n(6204);const M="mode",j="color-scheme",z="data-color-scheme";function F(){}const I=e=>{let{key:t,storageWindow:n}=e;return n||"undefined"===typeof window||(n=window),{get(e){if("undefined"===typeof window)return;if(!n)return e;let r;try{r=n.localStorage.getItem(t)}catch(o){}return r||e},set:e=>{if(n)try{n.localStorage.setItem(t,e)}catch(r){}},subscribe:e=>{if(!n)return F;const r=n=>{const r=n.newValue;n.key===t&&e(r)};return n.addEventListener("storage",r),()=>{n.removeEventListener("storage",r)}}}};function D(){}function B(e){if("undefined"!==typeof window&&"function"===typeof window.matchMedia&&"system"===e){return window.matchMedia("(prefers-color-scheme: dark)").matches?"dark":"light"}}function U(e,t){return"light"===e.mode||"system"===e.mode&&"light"===e.systemMode?t("light"):"dark"===e.mode||"system"===e.mode&&"dark"===e.systemMode?t("dark"):void 0}function W(e){const{defaultMode:t="light",defaultLightColorScheme:n,defaultDarkColorScheme:o,supportedColorSchemes:a=[],modeStorageKey:i=M,colorSchemeStorageKey:l=j,storageWindow:s=("undefined"===typeof window?void 0:window),storageManager:c=I,noSsr:u=!1}=e,d=a.join(","),p=a.length>1,h=r.useMemo(()=>null===c||void 0===c?void 0:c({key:i,storageWindow:s}),[c,i,s]),m=r.useMemo(()=>null===c||void 0===c?void 0:c({key:"".concat(l,"-light"),storageWindow:s}),[c,l,s]),g=r.useMemo(()=>null===c||void 0===c?void 0:c({key:"".concat(l,"-dark"),storageWindow:s}),[c,l,s]),[y,v]=r.useState(()=>{const e=(null===h||void 0===h?void 0:h.get(t))||t,r=(null===m||void 0===m?void 0:m.get(n))||n,a=(null===g||void 0===g?void 0:g.get(o))||o;return{mode:e,systemMode:B(e),lightColorScheme:r,darkColorScheme:a}}),[b,A]=r.useState(u||!p);r.useEffect(()=>{A(!0)},[]);const w=function(e){return U(e,t=>"light"===t?e.lightColorScheme:"dark"===t?e.darkColorScheme:void 0)}(y),S=r.useCallback(e=>{v(n=>{if(e===n.mode)return n;const r=null!==e&&void 0!==e?e:t;return null===h||void 0===h||h.set(r),(0,f.A)((0,f.A)({},n),{},{mode:r,systemMode:B(r)})})},[h,t]),k=r.useCallback(e=>{e?"string"===typeof e?e&&!d.includes(e)?console.error("`".concat(e,"` does not exist in `theme.colorSchemes`.")):v(t=>{const n=(0,f.A)({},t);return U(t,t=>{"light"===t&&(null===m||void 0===m||m.set(e),n.lightColorScheme=e),"dark"===t&&(null===g||void 0===g||g.set(e),n.darkColorScheme=e)}),n}):v(t=>{const r=(0,f.A)({},t),a=null===e.light?n:e.light,i=null===e.dark?o:e.dark;return a&&(d.includes(a)?(r.lightColorScheme=a,null===m||void 0===m||m.set(a)):console.error("`".concat(a,"` does not exist in `theme.colorSchemes`."))),i&&(d.includes(i)?(r.darkColorScheme=i,null===g||void 0===g||g.set(i)):console.error("`".concat(i,"` does not exist in `theme.colorSchemes`."))),r}):v(e=>(null===m||void 0===m||m.set(n),null===g||void 0===g||g.set(o),(0,f.A)((0,f.A)({},e),{},{lightColorScheme:n,darkColorScheme:o})))},[d,m,g,n,o]),x=r.useCallback(e=>{"system"===y.mode&&v(t=>{const n=null!==e&&void 0!==e&&e.matches?"dark":"light";return t.systemMode===n?t:(0,f.A)((0,f.A)({},t),{},{systemMode:n})})},[y.mode]),C=r.useRef(x);return C.current=x,r.useEffect(()=>{if("function"!==typeof window.matchMedia||!p)return;const e=function(){return C.current(...arguments)},t=window.matchMedia("(prefers-color-scheme: dark)");return t.addListener(e),e(t),()=>{t.removeListener(e)}},[p]),r.useEffect(()=>{if(p){const e=(null===h||void 0===h?void 0:h.subscribe(e=>{e&&!["light","dark","system"].includes(e)||S(e||t)}))||D,n=(null===m||void 0===m?void 0:m.subscribe(e=>{e&&!d.match(e)||k({light:e})}))||D,r=(null===g||void 0===g?void 0:g.subscribe(e=>{e&&!d.match(e)||k({dark:e})}))||D;return()=>{e(),n(),r()}}},[k,S,d,t,s,p,h,m,g]),(0,f.A)((0,f.A)({},y),{},{mode:b?y.mode:void 0,systemMode:b?y.systemMode:void 0,colorScheme:b?w:void 0,setMode:S,setColorScheme:k})}var H=n(6530);const V={attribute:"data-mui-color-scheme",colorSchemeStorageKey:"mui-color-scheme",defaultLightColorScheme:"light",defaultDarkColorScheme:"dark",modeStorageKey:"mui-mode"};const{CssVarsProvider:$,useColorScheme:q,getInitColorSchemeScript:K}=function(e){const{themeId:t,theme:n={},modeStorageKey:o=M,colorSchemeStorageKey:a=j,disableTransitionOnChange:i=!1,defaultColorScheme:l,resolveTheme:s}=e,c={allColorSchemes:[],colorScheme:void 0,darkColorScheme:void 0,lightColorScheme:void 0,mode:void 0,setColorScheme:()=>{},setMode:()=>{},systemMode:void 0},u=r.createContext(void 0),d={},p={},h="string"===typeof l?l:l.light,g="string"===typeof l?l:l.dark;return{CssVarsProvider:function(e){var c,h,g;const{children:v,theme:b,modeStorageKey:A=o,colorSchemeStorageKey:w=a,disableTransitionOnChange:S=i,storageManager:x,storageWindow:C=("undefined"===typeof window?void 0:window),documentNode:E=("undefined"===typeof document?void 0:document),colorSchemeNode:P=("undefined"===typeof document?void 0:document.documentElement),disableNestedContext:R=!1,disableStyleSheetGeneration:O=!1,defaultMode:N="system",forceThemeRerender:L=!1,noSsr:M}=e,j=r.useRef(!1),z=m(),F=r.useContext(u),I=!!F&&!R,D=r.useMemo(()=>b||("function"===typeof n?n():n),[b]),B=D[t],U=B||D,{colorSchemes:H=d,components:V=p,cssVarPrefix:$}=U,q=Object.keys(H).filter(e=>!!H[e]).join(","),K=r.useMemo(()=>q.split(","),[q]),G="string"===typeof l?l:l.light,Q="string"===typeof l?l:l.dark,Y=H[G]&&H[Q]?N:(null===(c=H[U.defaultColorScheme])||void 0===c||null===(c=c.palette)||void 0===c?void 0:c.mode)||(null===(h=U.palette)||void 0===h?void 0:h.mode),{mode:X,setMode:J,systemMode:Z,lightColorScheme:ee,darkColorScheme:te,colorScheme:ne,setColorScheme:re}=W({supportedColorSchemes:K,defaultLightColorScheme:G,defaultDarkColorScheme:Q,modeStorageKey:A,colorSchemeStorageKey:w,defaultMode:Y,storageManager:x,storageWindow:C,noSsr:M});let oe=X,ae=ne;I&&(oe=F.mode,ae=F.colorScheme);let ie=ae||U.defaultColorScheme;U.vars&&!L&&(ie=U.defaultColorScheme);const le=r.useMemo(()=>{var e;const t=(null===(e=U.generateThemeVars)||void 0===e?void 0:e.call(U))||U.vars,n=(0,f.A)((0,f.A)({},U),{},{components:V,colorSchemes:H,cssVarPrefix:$,vars:t});if("function"===typeof n.generateSpacing&&(n.spacing=n.generateSpacing()),ie){const e=H[ie];e&&"object"===typeof e&&Object.keys(e).forEach(t=>{e[t]&&"object"===typeof e[t]?n[t]=(0,f.A)((0,f.A)({},n[t]),e[t]):n[t]=e[t]})}return s?s(n):n},[U,ie,V,H,$]),se=U.colorSchemeSelector;(0,k.A)(()=>{if(ae&&P&&se&&"media"!==se){const e=se;let t=se;if("class"===e&&(t=".%s"),"data"===e&&(t="[data-%s]"),null!==e&&void 0!==e&&e.startsWith("data-")&&!e.includes("%s")&&(t="[".concat(e,'="%s"]')),t.startsWith("."))P.classList.remove(...K.map(e=>t.substring(1).replace("%s",e))),P.classList.add(t.substring(1).replace("%s",ae));else{const e=t.replace("%s",ae).match(/\[([^\]]+)\]/);if(e){const[t,n]=e[1].split("=");n||K.forEach(e=>{P.removeAttribute(t.replace(ae,e))}),P.setAttribute(t,n?n.replace(/"|'/g,""):"")}else P.setAttribute(t,ae)}}},[ae,se,P,K]),r.useEffect(()=>{let e;if(S&&j.current&&E){const t=E.createElement("style");t.appendChild(E.createTextNode("*{-webkit-transition:none!important;-moz-transition:none!important;-o-transition:none!important;-ms-transition:none!important;transition:none!important}")),E.head.appendChild(t),window.getComputedStyle(E.body),e=setTimeout(()=>{E.head.removeChild(t)},1)}return()=>{clearTimeout(e)}},[ae,S,E]),r.useEffect(()=>(j.current=!0,()=>{j.current=!1}),[]);const ce=r.useMemo(()=>({allColorSchemes:K,colorScheme:ae,darkColorScheme:te,lightColorScheme:ee,mode:oe,setColorScheme:re,setMode:J,systemMode:Z}),[K,ae,te,ee,oe,re,J,Z,le.colorSchemeSelector]);let ue=!0;(O||!1===U.cssVariables||I&&(null===z||void 0===z?void 0:z.cssVarPrefix)===$)&&(ue=!1);const de=(0,y.jsxs)(r.Fragment,{children:[(0,y.jsx)(T,{themeId:B?t:void 0,theme:le,children:v}),ue&&(0,y.jsx)(_.A,{styles:(null===(g=le.generateStyleSheets)||void 0===g?void 0:g.call(le))||[]})]});return I?de:(0,y.jsx)(u.Provider,{value:ce,children:de})},useColorScheme:()=>r.useContext(u)||c,getInitColorSchemeScript:e=>function(e){const{defaultMode:t="system",defaultLightColorScheme:n="light",defaultDarkColorScheme:r="dark",modeStorageKey:o=M,colorSchemeStorageKey:a=j,attribute:i=z,colorSchemeNode:l="document.documentElement",nonce:s}=e||{};let c="",u=i;if("class"===i&&(u=".%s"),"data"===i&&(u="[data-%s]"),u.startsWith(".")){const e=u.substring(1);c+="".concat(l,".classList.remove('").concat(e,"'.replace('%s', light), '").concat(e,"'.replace('%s', dark));\n      ").concat(l,".classList.add('").concat(e,"'.replace('%s', colorScheme));")}const d=u.match(/\[([^[\]]+)\]/);if(d){const[e,t]=d[1].split("=");t||(c+="".concat(l,".removeAttribute('").concat(e,"'.replace('%s', light));\n      ").concat(l,".removeAttribute('").concat(e,"'.replace('%s', dark));")),c+="\n      ".concat(l,".setAttribute('").concat(e,"'.replace('%s', colorScheme), ").concat(t?"".concat(t,".replace('%s', colorScheme)"):'""',");")}else c+="".concat(l,".setAttribute('").concat(u,"', colorScheme);");return(0,y.jsx)("script",{suppressHydrationWarning:!0,nonce:"undefined"===typeof window?s:"",dangerouslySetInnerHTML:{__html:"(function() {\ntry {\n  let colorScheme = '';\n  const mode = localStorage.getItem('".concat(o,"') || '").concat(t,"';\n  const dark = localStorage.getItem('").concat(a,"-dark') || '").concat(r,"';\n  const light = localStorage.getItem('").concat(a,"-light') || '").concat(n,"';\n  if (mode === 'system') {\n    // handle system mode\n    const mql = window.matchMedia('(prefers-color-scheme: dark)');\n    if (mql.matches) {\n      colorScheme = dark\n    } else {\n      colorScheme = light\n    }\n  }\n  if (mode === 'light') {\n    colorScheme = light;\n  }\n  if (mode === 'dark') {\n    colorScheme = dark;\n  }\n  if (colorScheme) {\n    ").concat(c,"\n  }\n} catch(e){}})();")}},"mui-color-scheme-init")}((0,f.A)({colorSchemeStorageKey:a,defaultLightColorScheme:h,defaultDarkColorScheme:g,modeStorageKey:o},e))}}({themeId:R.A,theme:()=>(0,l.A)({cssVariables:!0}),colorSchemeStorageKey:V.colorSchemeStorageKey,modeStorageKey:V.modeStorageKey,defaultColorScheme:{light:V.defaultLightColorScheme,dark:V.defaultDarkColorScheme},resolveTheme:e=>{const t=(0,f.A)((0,f.A)({},e),{},{typography:(0,H.A)(e.palette,e.typography)});return t.unstable_sx=function(e){return(0,L.A)({sx:e,theme:this})},t}});const G=$,Q=["theme"];function Y(e){let{theme:t}=e,n=(0,p.A)(e,Q);const o=r.useMemo(()=>{if("function"===typeof t)return t;const e=R.A in t?t[R.A]:t;return"colorSchemes"in e?null:"vars"in e?t:(0,f.A)((0,f.A)({},t),{},{vars:null})},[t]);return o?(0,y.jsx)(N,(0,f.A)({theme:o},n)):(0,y.jsx)(G,(0,f.A)({theme:t},n))}var X=n(8130),J=n(8301);const Z="function"===typeof(0,X.Dp)({}),ee=(e,t)=>(0,f.A)({WebkitFontSmoothing:"antialiased",MozOsxFontSmoothing:"grayscale",boxSizing:"border-box",WebkitTextSizeAdjust:"100%"},t&&!e.vars&&{colorScheme:e.palette.mode}),te=e=>(0,f.A)((0,f.A)({color:(e.vars||e).palette.text.primary},e.typography.body1),{},{backgroundColor:(e.vars||e).palette.background.default,"@media print":{backgroundColor:(e.vars||e).palette.common.white}}),ne=function(e){var t;let n=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const r={};n&&e.colorSchemes&&"function"===typeof e.getColorSchemeSelector&&Object.entries(e.colorSchemes).forEach(t=>{let[n,o]=t;const a=e.getColorSchemeSelector(n);var i,l;a.startsWith("@")?r[a]={":root":{colorScheme:null===(i=o.palette)||void 0===i?void 0:i.mode}}:r[a.replace(/\s*&/,"")]={colorScheme:null===(l=o.palette)||void 0===l?void 0:l.mode}});let o=(0,f.A)({html:ee(e,n),"*, *::before, *::after":{boxSizing:"inherit"},"strong, b":{fontWeight:e.typography.fontWeightBold},body:(0,f.A)((0,f.A)({margin:0},te(e)),{},{"&::backdrop":{backgroundColor:(e.vars||e).palette.background.default}})},r);const a=null===(t=e.components)||void 0===t||null===(t=t.MuiCssBaseline)||void 0===t?void 0:t.styleOverrides;return a&&(o=[o,a]),o},re="mui-ecs",oe=(0,X.Dp)(Z?e=>{let{theme:t,enableColorScheme:n}=e;return ne(t,n)}:e=>{let{theme:t}=e;return(e=>{const t=ne(e,!1),n=Array.isArray(t)?t[0]:t;return!e.vars&&n&&(n.html[":root:has(".concat(re,")")]={colorScheme:e.palette.mode}),e.colorSchemes&&Object.entries(e.colorSchemes).forEach(t=>{let[r,o]=t;const a=e.getColorSchemeSelector(r);var i,l;a.startsWith("@")?n[a]={[":root:not(:has(.".concat(re,"))")]:{colorScheme:null===(i=o.palette)||void 0===i?void 0:i.mode}}:n[a.replace(/\s*&/,"")]={["&:not(:has(.".concat(re,"))")]:{colorScheme:null===(l=o.palette)||void 0===l?void 0:l.mode}}}),t})(t)});const ae=function(e){const t=(0,J.b)({props:e,name:"MuiCssBaseline"}),{children:n,enableColorScheme:o=!1}=t;return(0,y.jsxs)(r.Fragment,{children:[Z&&(0,y.jsx)(oe,{enableColorScheme:o}),!Z&&!o&&(0,y.jsx)("span",{className:re,style:{display:"none"}}),n]})};var ie=n(8387),le=n(1807),se=n(8128),ce=n(1612),ue=n(7194),de=n(4412),fe=n(4799),pe=n(9857),he=n(6061);function me(e){return(0,he.Ay)("MuiAppBar",e)}(0,pe.A)("MuiAppBar",["root","positionFixed","positionAbsolute","positionSticky","positionStatic","positionRelative","colorDefault","colorPrimary","colorSecondary","colorInherit","colorTransparent","colorError","colorInfo","colorSuccess","colorWarning"]);const ge=["className","color","enableColorOnDark","position"],ye=(e,t)=>e?"".concat(null===e||void 0===e?void 0:e.replace(")",""),", ").concat(t,")"):t,ve=(0,se.Ay)(fe.A,{name:"MuiAppBar",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t["position".concat((0,ue.A)(n.position))],t["color".concat((0,ue.A)(n.color))]]}})((0,ce.A)(e=>{let{theme:t}=e;return{display:"flex",flexDirection:"column",width:"100%",boxSizing:"border-box",flexShrink:0,variants:[{props:{position:"fixed"},style:{position:"fixed",zIndex:(t.vars||t).zIndex.appBar,top:0,left:"auto",right:0,"@media print":{position:"absolute"}}},{props:{position:"absolute"},style:{position:"absolute",zIndex:(t.vars||t).zIndex.appBar,top:0,left:"auto",right:0}},{props:{position:"sticky"},style:{position:"sticky",zIndex:(t.vars||t).zIndex.appBar,top:0,left:"auto",right:0}},{props:{position:"static"},style:{position:"static"}},{props:{position:"relative"},style:{position:"relative"}},{props:{color:"inherit"},style:{"--AppBar-color":"inherit"}},{props:{color:"default"},style:(0,f.A)({"--AppBar-background":t.vars?t.vars.palette.AppBar.defaultBg:t.palette.grey[100],"--AppBar-color":t.vars?t.vars.palette.text.primary:t.palette.getContrastText(t.palette.grey[100])},t.applyStyles("dark",{"--AppBar-background":t.vars?t.vars.palette.AppBar.defaultBg:t.palette.grey[900],"--AppBar-color":t.vars?t.vars.palette.text.primary:t.palette.getContrastText(t.palette.grey[900])}))},...Object.entries(t.palette).filter((0,de.A)(["contrastText"])).map(e=>{var n,r;let[o]=e;return{props:{color:o},style:{"--AppBar-background":(null!==(n=t.vars)&&void 0!==n?n:t).palette[o].main,"--AppBar-color":(null!==(r=t.vars)&&void 0!==r?r:t).palette[o].contrastText}}}),{props:e=>!0===e.enableColorOnDark&&!["inherit","transparent"].includes(e.color),style:{backgroundColor:"var(--AppBar-background)",color:"var(--AppBar-color)"}},{props:e=>!1===e.enableColorOnDark&&!["inherit","transparent"].includes(e.color),style:(0,f.A)({backgroundColor:"var(--AppBar-background)",color:"var(--AppBar-color)"},t.applyStyles("dark",{backgroundColor:t.vars?ye(t.vars.palette.AppBar.darkBg,"var(--AppBar-background)"):null,color:t.vars?ye(t.vars.palette.AppBar.darkColor,"var(--AppBar-color)"):null}))},{props:{color:"transparent"},style:(0,f.A)({"--AppBar-background":"transparent","--AppBar-color":"inherit",backgroundColor:"var(--AppBar-background)",color:"var(--AppBar-color)"},t.applyStyles("dark",{backgroundImage:"none"}))}]}})),be=r.forwardRef(function(e,t){const n=(0,J.b)({props:e,name:"MuiAppBar"}),{className:r,color:o="primary",enableColorOnDark:a=!1,position:i="fixed"}=n,l=(0,p.A)(n,ge),s=(0,f.A)((0,f.A)({},n),{},{color:o,position:i,enableColorOnDark:a}),c=(e=>{const{color:t,position:n,classes:r}=e,o={root:["root","color".concat((0,ue.A)(t)),"position".concat((0,ue.A)(n))]};return(0,le.A)(o,me,r)})(s);return(0,y.jsx)(ve,(0,f.A)({square:!0,component:"header",ownerState:s,elevation:4,className:(0,ie.A)(c.root,r,"fixed"===i&&"mui-fixed"),ref:t},l))});var Ae=n(3182),we=n(5895),Se=n(8549),ke=n(9998),xe=n(2475),Ce=n(6967),Ee=n(8348),Pe=n(267),Te=n(6906),Re=n(1917);const Oe=["addEndListener","appear","children","container","direction","easing","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"],Ne=["ownerState"];function Le(e,t,n){var r;const o=function(e,t,n){const r=t.getBoundingClientRect(),o=n&&n.getBoundingClientRect(),a=(0,Re.A)(t);let i;if(t.fakeTransform)i=t.fakeTransform;else{const e=a.getComputedStyle(t);i=e.getPropertyValue("-webkit-transform")||e.getPropertyValue("transform")}let l=0,s=0;if(i&&"none"!==i&&"string"===typeof i){const e=i.split("(")[1].split(")")[0].split(",");l=parseInt(e[4],10),s=parseInt(e[5],10)}return"left"===e?"translateX(".concat(o?o.right+l-r.left:a.innerWidth+l-r.left,"px)"):"right"===e?"translateX(-".concat(o?r.right-o.left-l:r.left+r.width-l,"px)"):"up"===e?"translateY(".concat(o?o.bottom+s-r.top:a.innerHeight+s-r.top,"px)"):"translateY(-".concat(o?r.top-o.top+r.height-s:r.top+r.height-s,"px)")}(e,t,"function"===typeof(r=n)?r():r);o&&(t.style.webkitTransform=o,t.style.transform=o)}const _e=r.forwardRef(function(e,t){const n=(0,Pe.A)(),o={enter:n.transitions.easing.easeOut,exit:n.transitions.easing.sharp},a={enter:n.transitions.duration.enteringScreen,exit:n.transitions.duration.leavingScreen},{addEndListener:i,appear:l=!0,children:s,container:c,direction:u="down",easing:d=o,in:h,onEnter:m,onEntered:g,onEntering:v,onExit:b,onExited:A,onExiting:w,style:S,timeout:k=a,TransitionComponent:x=ke.Ay}=e,C=(0,p.A)(e,Oe),E=r.useRef(null),P=(0,Ee.A)((0,xe.A)(s),E,t),T=e=>t=>{e&&(void 0===t?e(E.current):e(E.current,t))},R=T((e,t)=>{Le(u,e,c),(0,Te.q)(e),m&&m(e,t)}),O=T((e,t)=>{const r=(0,Te.c)({timeout:k,style:S,easing:d},{mode:"enter"});e.style.webkitTransition=n.transitions.create("-webkit-transform",(0,f.A)({},r)),e.style.transition=n.transitions.create("transform",(0,f.A)({},r)),e.style.webkitTransform="none",e.style.transform="none",v&&v(e,t)}),N=T(g),L=T(w),_=T(e=>{const t=(0,Te.c)({timeout:k,style:S,easing:d},{mode:"exit"});e.style.webkitTransition=n.transitions.create("-webkit-transform",t),e.style.transition=n.transitions.create("transform",t),Le(u,e,c),b&&b(e)}),M=T(e=>{e.style.webkitTransition="",e.style.transition="",A&&A(e)}),j=r.useCallback(()=>{E.current&&Le(u,E.current,c)},[u,c]);return r.useEffect(()=>{if(h||"down"===u||"right"===u)return;const e=(0,Ce.A)(()=>{E.current&&Le(u,E.current,c)}),t=(0,Re.A)(E.current);return t.addEventListener("resize",e),()=>{e.clear(),t.removeEventListener("resize",e)}},[u,h,c]),r.useEffect(()=>{h||j()},[h,j]),(0,y.jsx)(x,(0,f.A)((0,f.A)({nodeRef:E,onEnter:R,onEntered:N,onEntering:O,onExit:_,onExited:M,onExiting:L,addEndListener:e=>{i&&i(E.current,e)},appear:l,in:h,timeout:k},C),{},{children:(e,t)=>{let{ownerState:n}=t,o=(0,p.A)(t,Ne);return r.cloneElement(s,(0,f.A)({ref:P,style:(0,f.A)((0,f.A)({visibility:"exited"!==e||h?void 0:"hidden"},S),s.props.style)},o))}}))}),Me=_e;var je=n(2466);function ze(e){return(0,he.Ay)("MuiDrawer",e)}(0,pe.A)("MuiDrawer",["root","docked","paper","anchorLeft","anchorRight","anchorTop","anchorBottom","paperAnchorLeft","paperAnchorRight","paperAnchorTop","paperAnchorBottom","paperAnchorDockedLeft","paperAnchorDockedRight","paperAnchorDockedTop","paperAnchorDockedBottom","modal"]);var Fe=n(9905),Ie=n(122);const De=["BackdropProps"],Be=["anchor","BackdropProps","children","className","elevation","hideBackdrop","ModalProps","onClose","open","PaperProps","SlideProps","TransitionComponent","transitionDuration","variant","slots","slotProps"],Ue=(e,t)=>{const{ownerState:n}=e;return[t.root,("permanent"===n.variant||"persistent"===n.variant)&&t.docked,t.modal]},We=(0,se.Ay)(Se.A,{name:"MuiDrawer",slot:"Root",overridesResolver:Ue})((0,ce.A)(e=>{let{theme:t}=e;return{zIndex:(t.vars||t).zIndex.drawer}})),He=(0,se.Ay)("div",{shouldForwardProp:je.A,name:"MuiDrawer",slot:"Docked",skipVariantsResolver:!1,overridesResolver:Ue})({flex:"0 0 auto"}),Ve=(0,se.Ay)(fe.A,{name:"MuiDrawer",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t["paperAnchor".concat((0,ue.A)(n.anchor))],"temporary"!==n.variant&&t["paperAnchorDocked".concat((0,ue.A)(n.anchor))]]}})((0,ce.A)(e=>{let{theme:t}=e;return{overflowY:"auto",display:"flex",flexDirection:"column",height:"100%",flex:"1 0 auto",zIndex:(t.vars||t).zIndex.drawer,WebkitOverflowScrolling:"touch",position:"fixed",top:0,outline:0,variants:[{props:{anchor:"left"},style:{left:0}},{props:{anchor:"top"},style:{top:0,left:0,right:0,height:"auto",maxHeight:"100%"}},{props:{anchor:"right"},style:{right:0}},{props:{anchor:"bottom"},style:{top:"auto",left:0,bottom:0,right:0,height:"auto",maxHeight:"100%"}},{props:e=>{let{ownerState:t}=e;return"left"===t.anchor&&"temporary"!==t.variant},style:{borderRight:"1px solid ".concat((t.vars||t).palette.divider)}},{props:e=>{let{ownerState:t}=e;return"top"===t.anchor&&"temporary"!==t.variant},style:{borderBottom:"1px solid ".concat((t.vars||t).palette.divider)}},{props:e=>{let{ownerState:t}=e;return"right"===t.anchor&&"temporary"!==t.variant},style:{borderLeft:"1px solid ".concat((t.vars||t).palette.divider)}},{props:e=>{let{ownerState:t}=e;return"bottom"===t.anchor&&"temporary"!==t.variant},style:{borderTop:"1px solid ".concat((t.vars||t).palette.divider)}}]}})),$e={left:"right",right:"left",top:"down",bottom:"up"};const qe=r.forwardRef(function(e,t){const n=(0,J.b)({props:e,name:"MuiDrawer"}),o=(0,Pe.A)(),a=(0,w.I)(),i={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{anchor:l="left",BackdropProps:s,children:c,className:u,elevation:d=16,hideBackdrop:h=!1,ModalProps:{BackdropProps:m}={},onClose:g,open:v=!1,PaperProps:b={},SlideProps:A,TransitionComponent:S,transitionDuration:k=i,variant:x="temporary",slots:C={},slotProps:E={}}=n,P=(0,p.A)(n.ModalProps,De),T=(0,p.A)(n,Be),R=r.useRef(!1);r.useEffect(()=>{R.current=!0},[]);const O=function(e,t){let{direction:n}=e;return"rtl"===n&&function(e){return["left","right"].includes(e)}(t)?$e[t]:t}({direction:a?"rtl":"ltr"},l),N=l,L=(0,f.A)((0,f.A)({},n),{},{anchor:N,elevation:d,open:v,variant:x},T),_=(e=>{const{classes:t,anchor:n,variant:r}=e,o={root:["root","anchor".concat((0,ue.A)(n))],docked:[("permanent"===r||"persistent"===r)&&"docked"],modal:["modal"],paper:["paper","paperAnchor".concat((0,ue.A)(n)),"temporary"!==r&&"paperAnchorDocked".concat((0,ue.A)(n))]};return(0,le.A)(o,ze,t)})(L),M={slots:(0,f.A)({transition:S},C),slotProps:(0,f.A)((0,f.A)({paper:b,transition:A},E),{},{backdrop:(0,Ie.A)(E.backdrop||(0,f.A)((0,f.A)({},s),m),{transitionDuration:k})})},[j,z]=(0,Fe.A)("root",{ref:t,elementType:We,className:(0,ie.A)(_.root,_.modal,u),shouldForwardComponentProp:!0,ownerState:L,externalForwardedProps:(0,f.A)((0,f.A)((0,f.A)({},M),T),P),additionalProps:{open:v,onClose:g,hideBackdrop:h,slots:{backdrop:M.slots.backdrop},slotProps:{backdrop:M.slotProps.backdrop}}}),[F,I]=(0,Fe.A)("paper",{elementType:Ve,shouldForwardComponentProp:!0,className:(0,ie.A)(_.paper,b.className),ownerState:L,externalForwardedProps:M,additionalProps:(0,f.A)({elevation:"temporary"===x?d:0,square:!0},"temporary"===x&&{role:"dialog","aria-modal":"true"})}),[D,B]=(0,Fe.A)("docked",{elementType:He,ref:t,className:(0,ie.A)(_.root,_.docked,u),ownerState:L,externalForwardedProps:M,additionalProps:T}),[U,W]=(0,Fe.A)("transition",{elementType:Me,ownerState:L,externalForwardedProps:M,additionalProps:{in:v,direction:$e[O],timeout:k,appear:R.current}}),H=(0,y.jsx)(F,(0,f.A)((0,f.A)({},I),{},{children:c}));if("permanent"===x)return(0,y.jsx)(D,(0,f.A)((0,f.A)({},B),{},{children:H}));const V=(0,y.jsx)(U,(0,f.A)((0,f.A)({},W),{},{children:H}));return"persistent"===x?(0,y.jsx)(D,(0,f.A)((0,f.A)({},B),{},{children:V})):(0,y.jsx)(j,(0,f.A)((0,f.A)({},z),{},{children:V}))}),Ke=qe;var Ge=n(5315),Qe=n(2394),Ye=n(8403),Xe=n(9801),Je=n(6185),Ze=n(172),et=n(9992);const tt=(0,et.A)((0,y.jsx)("path",{d:"M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14"}),"Search"),nt=(0,et.A)((0,y.jsx)("path",{d:"M3 13h8V3H3zm0 8h8v-6H3zm10 0h8V11h-8zm0-18v6h8V3z"}),"Dashboard"),rt=(0,et.A)((0,y.jsx)("path",{d:"M11 9h2V6h3V4h-3V1h-2v3H8v2h3zm-4 9c-1.1 0-1.99.9-1.99 2S5.9 22 7 22s2-.9 2-2-.9-2-2-2m10 0c-1.1 0-1.99.9-1.99 2s.89 2 1.99 2 2-.9 2-2-.9-2-2-2m-9.83-3.25.03-.12.9-1.63h7.45c.75 0 1.41-.41 1.75-1.03l3.86-7.01L19.42 4h-.01l-1.1 2-2.76 5H8.53l-.13-.27L6.16 6l-.95-2-.94-2H1v2h2l3.6 7.59-1.35 2.45c-.16.28-.25.61-.25.96 0 1.1.9 2 2 2h12v-2H7.42c-.13 0-.25-.11-.25-.25"}),"AddShoppingCart"),ot=(0,et.A)((0,y.jsx)("path",{d:"M16 11c1.66 0 2.99-1.34 2.99-3S17.66 5 16 5s-3 1.34-3 3 1.34 3 3 3m-8 0c1.66 0 2.99-1.34 2.99-3S9.66 5 8 5 5 6.34 5 8s1.34 3 3 3m0 2c-2.33 0-7 1.17-7 3.5V19h14v-2.5c0-2.33-4.67-3.5-7-3.5m8 0c-.29 0-.62.02-.97.05 1.16.84 1.97 1.97 1.97 3.45V19h6v-2.5c0-2.33-4.67-3.5-7-3.5"}),"People"),at=(0,et.A)((0,y.jsx)("path",{d:"M20 2H4c-1 0-2 .9-2 2v3.01c0 .72.43 1.34 1 1.69V20c0 1.1 1.1 2 2 2h14c.9 0 2-.9 2-2V8.7c.57-.35 1-.97 1-1.69V4c0-1.1-1-2-2-2m-5 12H9v-2h6zm5-7H4V4l16-.02z"}),"Inventory"),it=(0,et.A)((0,y.jsx)("path",{d:"M20 8h-3V4H3c-1.1 0-2 .9-2 2v11h2c0 1.66 1.34 3 3 3s3-1.34 3-3h6c0 1.66 1.34 3 3 3s3-1.34 3-3h2v-5zM6 18.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5m13.5-9 1.96 2.5H17V9.5zm-1.5 9c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5"}),"LocalShipping"),lt=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(759),n.e(684)]).then(n.bind(n,1684))),st=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(615),n.e(940),n.e(759),n.e(361),n.e(167),n.e(295)]).then(n.bind(n,295))),ct=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(615),n.e(940),n.e(465),n.e(556)]).then(n.bind(n,7556))),ut=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(615),n.e(940),n.e(465),n.e(145)]).then(n.bind(n,5145))),dt=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(615),n.e(759),n.e(361),n.e(972)]).then(n.bind(n,1972))),ft=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(615),n.e(940),n.e(852)]).then(n.bind(n,2852))),pt=(0,r.lazy)(()=>Promise.all([n.e(30),n.e(118)]).then(n.bind(n,3118))),ht=[{text:"Dashboard",path:"/",icon:(0,y.jsx)(nt,{})},{text:"Add Sale",path:"/sales",icon:(0,y.jsx)(rt,{})},{text:"Customers",path:"/customers",icon:(0,y.jsx)(ot,{})},{text:"Purchases",path:"/purchases",icon:(0,y.jsx)(it,{})},{text:"Products",path:"/products",icon:(0,y.jsx)(at,{})}],mt=e=>{let{searchTerm:t,onSearchChange:n}=e;const r=(0,a.Zp)();return(0,y.jsxs)(c.A,{sx:{position:"relative",borderRadius:1,backgroundColor:(0,u.X4)(s.palette.common.black,.05),"&:hover":{backgroundColor:(0,u.X4)(s.palette.common.black,.1)},marginLeft:0,width:"100%",[s.breakpoints.up("sm")]:{marginLeft:s.spacing(1),width:"auto"}},children:[(0,y.jsx)(c.A,{sx:{padding:s.spacing(0,2),height:"100%",position:"absolute",pointerEvents:"none",display:"flex",alignItems:"center",justifyContent:"center"},children:(0,y.jsx)(tt,{})}),(0,y.jsx)(d.Ay,{placeholder:"Search\u2026",value:t,onChange:e=>{const t=e.target.value;n(t),r(t?"/search":"/")},sx:{color:"inherit","& .MuiInputBase-input":{padding:s.spacing(1,1,1,0),paddingLeft:"calc(1em + ".concat(s.spacing(4),")"),transition:s.transitions.create("width"),width:"100%",[s.breakpoints.up("sm")]:{width:"20ch","&:focus":{width:"30ch"}}}}})]})};const gt=function(){const[e,t]=(0,r.useState)(""),[n,o]=(0,r.useState)([]),[l,u]=(0,r.useState)([]);(0,r.useEffect)(()=>{i.A.get("http://localhost:8000/api/products/all/").then(e=>o(e.data||[])),i.A.get("http://localhost:8000/api/customers/all/").then(e=>u(e.data||[]))},[]);const d=n.filter(t=>t.name.toLowerCase().includes(e.toLowerCase())),f=l.filter(t=>t.name.toLowerCase().includes(e.toLowerCase()));return(0,y.jsx)(Y,{theme:s,children:(0,y.jsx)(a.Kd,{children:(0,y.jsxs)(c.A,{sx:{display:"flex"},children:[(0,y.jsx)(ae,{}),(0,y.jsx)(be,{position:"fixed",sx:{zIndex:e=>e.zIndex.drawer+1},children:(0,y.jsxs)(Ae.A,{children:[(0,y.jsx)(we.A,{variant:"h6",noWrap:!0,component:"div",sx:{flexGrow:1,display:{xs:"none",sm:"block"}},children:"GrocerTrack"}),(0,y.jsx)(mt,{searchTerm:e,onSearchChange:t})]})}),(0,y.jsxs)(Ke,{variant:"permanent",sx:{width:240,flexShrink:0,"& .MuiDrawer-paper":{width:240,boxSizing:"border-box",backgroundColor:"neutral.dark",color:"neutral.main"}},children:[(0,y.jsx)(Ae.A,{}),(0,y.jsx)(c.A,{sx:{overflow:"auto"},children:(0,y.jsx)(Ge.A,{children:ht.map(e=>(0,y.jsx)(Qe.Ay,{disablePadding:!0,children:(0,y.jsxs)(Ye.A,{component:a.k2,to:e.path,sx:{"&.active":{backgroundColor:"rgba(255, 255, 255, 0.08)","& .MuiListItemIcon-root, & .MuiListItemText-primary":{color:"white"}}},children:[(0,y.jsx)(Xe.A,{sx:{color:"inherit"},children:e.icon}),(0,y.jsx)(Je.A,{primary:e.text})]})},e.text))})})]}),(0,y.jsxs)(c.A,{component:"main",sx:{flexGrow:1,p:3,bgcolor:"background.default"},children:[(0,y.jsx)(Ae.A,{}),(0,y.jsx)(r.Suspense,{fallback:(0,y.jsx)(c.A,{sx:{display:"flex",justifyContent:"center",mt:5},children:(0,y.jsx)(Ze.A,{})}),children:(0,y.jsxs)(a.BV,{children:[(0,y.jsx)(a.qh,{path:"/sales",element:(0,y.jsx)(dt,{})}),(0,y.jsx)(a.qh,{path:"/customers",element:(0,y.jsx)(ct,{})}),(0,y.jsx)(a.qh,{path:"/customer/:customerId",element:(0,y.jsx)(ut,{})}),(0,y.jsx)(a.qh,{path:"/purchases",element:(0,y.jsx)(ft,{})}),(0,y.jsx)(a.qh,{path:"/products",element:(0,y.jsx)(st,{})}),(0,y.jsx)(a.qh,{path:"/search",element:(0,y.jsx)(pt,{filteredProducts:d,filteredCustomers:f})}),(0,y.jsx)(a.qh,{path:"/",element:(0,y.jsx)(lt,{})})]})})]})]})})})},yt=e=>{e&&e instanceof Function&&n.e(453).then(n.bind(n,6453)).then(t=>{let{getCLS:n,getFID:r,getFCP:o,getLCP:a,getTTFB:i}=t;n(e),r(e),o(e),a(e),i(e)})};o.createRoot(document.getElementById("root")).render((0,y.jsx)(r.StrictMode,{children:(0,y.jsx)(gt,{})})),yt()})();
-//# sourceMappingURL=main.afe94323.js.map
\ No newline at end of file
@@ -1,6 +1,7 @@
 import React, { useState, useEffect, Suspense, lazy } from 'react';
 import { BrowserRouter as Router, Routes, Route, NavLink, useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { API_BASE } from './api';
 import theme from './theme';
 import { ToastContainer } from 'react-toastify';
 import 'react-toastify/dist/ReactToastify.css';
@@ -104,11 +105,11 @@ function App() {
     const [allCustomers, setAllCustomers] = useState([]);
 
     useEffect(() => {
-        axios.get('http://localhost:8000/api/products/all/')
+        axios.get(`${API_BASE}products/all/`)
             .then(res => setAllProducts(res.data || []))
             .catch(() => {});
 
-        axios.get('http://localhost:8000/api/customers/all/')
+        axios.get(`${API_BASE}customers/all/`)
             .then(res => setAllCustomers(res.data || []))
             .catch(() => {});
     }, []);
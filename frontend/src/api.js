@@ -0,0 +1,4 @@
+// Base URL of the Django API. The production build is served by Django
+// itself, so a relative path works; set REACT_APP_API_BASE to point a
+// build at another host.
+export const API_BASE = process.env.REACT_APP_API_BASE || "/api/";
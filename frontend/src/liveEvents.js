@@ -0,0 +1,25 @@
+import { useEffect, useRef } from "react";
+import { API_BASE } from "./api";
+
+const EVENT_TYPES = ["stock", "balance", "sale", "payment"];
+
+// Subscribes to the backend's change events (GET /api/events/, which is
+// only served when Django runs under ASGI). `handlers` maps an event type
+// to a callback that receives the parsed event, e.g.
+// { stock: ({ variant, stock }) => ... }.
+export function useLiveEvents(handlers) {
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    if (typeof EventSource === "undefined") return undefined;
+    const source = new EventSource(`${API_BASE}events/`);
+    EVENT_TYPES.forEach((type) =>
+      source.addEventListener(type, (e) => {
+        const handler = handlersRef.current[type];
+        if (handler) handler(JSON.parse(e.data));
+      })
+    );
+    return () => source.close();
+  }, []);
+}
@@ -29,7 +29,7 @@ import DeleteIcon from '@mui/icons-material/Delete';
 import PrintIcon from '@mui/icons-material/Print';
 import FileDownloadIcon from '@mui/icons-material/FileDownload';
 
-const API = "http://localhost:8000/api/";
+import { API_BASE as API } from '../api';
 
 function AddSalePage() {
   const [customers, setCustomers] = useState([]);
@@ -42,15 +42,25 @@ function AddSalePage() {
 
   const [cart, setCart] = useState([]);
 
-  // Load data
+  // Load data (one round trip via the batch endpoint)
   useEffect(() => {
-    axios.get(`${API}customers/all/`)
-      .then(res => setCustomers(res.data || []))
-      .catch(() => toast.error("Failed to load customers"));
-
-    axios.get(`${API}variants/`)
-      .then(res => setVariants(res.data || []))
-      .catch(() => toast.error("Failed to load product variants"));
+    axios.post(`${API}batch/`, {
+      parallel: true,
+      requests: [
+        { method: "GET", path: "customers/all/" },
+        { method: "GET", path: "variants/" },
+      ],
+    })
+      .then(res => {
+        const [customersRes, variantsRes] = res.data.responses;
+
+        if (customersRes.status === 200) setCustomers(customersRes.body || []);
+        else toast.error("Failed to load customers");
+
+        if (variantsRes.status === 200) setVariants(variantsRes.body || []);
+        else toast.error("Failed to load product variants");
+      })
+      .catch(() => toast.error("Failed to load customers and products"));
   }, []);
 
   // Load price automatically when variant selected
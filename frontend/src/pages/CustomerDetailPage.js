@@ -41,7 +41,7 @@ import FileDownloadIcon from "@mui/icons-material/FileDownload";
 import PrintIcon from "@mui/icons-material/Print";
 import CloseIcon from "@mui/icons-material/Close";
 
-const API_BASE = "http://localhost:8000/api/";
+import { API_BASE } from "../api";
 
 export default function CustomerDetailPage() {
   const { customerId } = useParams();
@@ -32,7 +32,8 @@ import ArrowDropDownIcon from "@mui/icons-material/ArrowDropDown";
 
 import { Link } from "react-router-dom";
 
-const API_BASE = "http://localhost:8000/api/";
+import { API_BASE } from "../api";
+import { useLiveEvents } from "../liveEvents";
 
 export default function CustomerPage() {
   // Add Customer fields
@@ -95,6 +96,14 @@ export default function CustomerPage() {
     fetchCustomers({ pageToFetch: 1 });
   }, []);
 
+  // Balances changed by sales and payments at other tills
+  useLiveEvents({
+    balance: ({ customer, balance }) =>
+      setCustomers((prev) =>
+        prev.map((c) => (c.id === customer ? { ...c, balance } : c))
+      ),
+  });
+
   // Debounced Search
   useEffect(() => {
     if (searchTimeoutRef.current) clearTimeout(searchTimeoutRef.current);
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
+import { API_BASE } from '../api';
 import { 
     Box, Grid, Card, CardContent, Typography, List, ListItem, 
     ListItemText, CircularProgress, Chip 
@@ -28,7 +29,7 @@ function DashboardPage() {
     const [error, setError] = useState(null);
 
     useEffect(() => {
-        axios.get("http://localhost:8000/api/dashboard/")
+        axios.get(`${API_BASE}dashboard/`)
             .then(res => {
                 setStats(res.data);
                 setLoading(false);
@@ -1,5 +1,7 @@
 import React, { useState, useEffect, useMemo } from "react";
 import axios from "axios";
+import { API_BASE } from "../api";
+import { useLiveEvents } from "../liveEvents";
 import { toast } from "react-toastify";
 
 import {
@@ -69,7 +71,7 @@ export default function ProductPage() {
 
   const fetchProducts = () => {
     axios
-      .get("http://localhost:8000/api/products/")
+      .get(`${API_BASE}products/`)
       .then((res) => setProducts(res.data))
       .catch(() => toast.error("Failed to load products."));
   };
@@ -78,6 +80,19 @@ export default function ProductPage() {
     fetchProducts();
   }, []);
 
+  // Stock changes made at other tills
+  useLiveEvents({
+    stock: ({ variant, stock }) =>
+      setProducts((prev) =>
+        prev.map((product) => ({
+          ...product,
+          variants: product.variants.map((v) =>
+            v.id === variant ? { ...v, current_stock: Number(stock) } : v
+          ),
+        }))
+      ),
+  });
+
   const rows = useMemo(
     () =>
       products.flatMap((product) =>
@@ -110,8 +125,8 @@ export default function ProductPage() {
 
     const url =
       type === "product"
-        ? `http://localhost:8000/api/products/${id}/`
-        : `http://localhost:8000/api/variants/${id}/`;
+        ? `${API_BASE}products/${id}/`
+        : `${API_BASE}variants/${id}/`;
 
     axios
       .delete(url)
@@ -144,7 +159,7 @@ export default function ProductPage() {
 
     const productPromise = existingProduct
       ? Promise.resolve({ data: existingProduct })
-      : axios.post("http://localhost:8000/api/products/", {
+      : axios.post(`${API_BASE}products/`, {
           name: newProductData.productName,
         });
 
@@ -160,7 +175,7 @@ export default function ProductPage() {
           current_stock: newProductData.current_stock,
         };
 
-        return axios.post("http://localhost:8000/api/variants/", variantPayload);
+        return axios.post(`${API_BASE}variants/`, variantPayload);
       })
       .then(() => {
         toast.success(`Product "${newProductData.productName}" added`);
@@ -182,7 +197,7 @@ export default function ProductPage() {
     e.preventDefault();
     axios
       .put(
-        `http://localhost:8000/api/variants/${editingVariant.id}/`,
+        `${API_BASE}variants/${editingVariant.id}/`,
         editVariantData
       )
       .then(() => {
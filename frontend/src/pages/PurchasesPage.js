@@ -24,7 +24,7 @@ import SearchIcon from "@mui/icons-material/Search";
 import axios from "axios";
 import { toast } from "react-toastify";
 
-const API_BASE = "http://localhost:8000/api/";
+import { API_BASE } from "../api";
 
 export default function PurchasesPage() {
   const [suppliers, setSuppliers] = useState([]);
@@ -46,9 +46,23 @@ export default function PurchasesPage() {
   // Load suppliers, variants & history
   // -------------------------------
   useEffect(() => {
-    axios.get(`${API_BASE}suppliers/`).then((res) => setSuppliers(res.data || []));
-    axios.get(`${API_BASE}variants/`).then((res) => setVariants(res.data || []));
-    loadHistory();
+    axios
+      .post(`${API_BASE}batch/`, {
+        parallel: true,
+        requests: [
+          { method: "GET", path: "suppliers/" },
+          { method: "GET", path: "variants/" },
+          { method: "GET", path: "purchases/" },
+        ],
+      })
+      .then((res) => {
+        const [suppliersRes, variantsRes, historyRes] = res.data.responses;
+        if (suppliersRes.status === 200) setSuppliers(suppliersRes.body || []);
+        if (variantsRes.status === 200) setVariants(variantsRes.body || []);
+        if (historyRes.status === 200) setHistory(historyRes.body || []);
+        else toast.error("Failed to load purchase history");
+      })
+      .catch(() => toast.error("Failed to load purchase history"));
   }, []);
 
   const loadHistory = () => {